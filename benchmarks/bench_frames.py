@@ -0,0 +1,145 @@
+"""Headless frame benchmarks: layout and paint of synthetic widget trees.
+
+Every benchmark renders through ``App._render_raster_frame`` onto a pooled
+raster surface, the same path the pyglet raster backend and snapshots use,
+so no window or GPU is needed.
+"""
+
+from harness import FRAME_THRESHOLD, benchmark
+
+WIDTH = 800
+HEIGHT = 600
+
+
+def _mounted_app(root, width=WIDTH, height=HEIGHT, theme=None):
+    from nuiitivet.material.theme.material_theme import MaterialTheme
+    from nuiitivet.runtime.app import App
+
+    if theme is None:
+        theme = MaterialTheme.light("#6750A4")
+    app = App(content=root, width=width, height=height, theme=theme)
+    app.root.mount(app)
+    app._render_raster_frame()
+    return app
+
+
+def _full_frame(app):
+    def op():
+        app.root.mark_needs_layout()
+        app._render_raster_frame()
+
+    return op
+
+
+def _repaint_frame(app):
+    def op():
+        app.invalidate()
+        app._render_raster_frame()
+
+    return op
+
+
+def _column_10k():
+    from nuiitivet.layout.column import Column
+    from nuiitivet.material.text import Text
+
+    return Column([Text(f"Row {i}") for i in range(10_000)])
+
+
+def _nested_grid():
+    from nuiitivet.layout.grid import Grid, GridItem
+    from nuiitivet.material.text import Text
+
+    def cell(r, c):
+        inner = [GridItem(Text(f"{r}.{c}.{i}"), row=i // 4, column=i % 4) for i in range(16)]
+        return GridItem(Grid(inner, rows=["auto"] * 4, columns=["25%"] * 4), row=r, column=c)
+
+    return Grid([cell(r, c) for r in range(10) for c in range(10)], rows=["auto"] * 10, columns=["10%"] * 10)
+
+
+@benchmark("frame.column_10k.layout_paint", group="frame", repeat=5, threshold=FRAME_THRESHOLD)
+def column_10k_layout_paint():
+    return _full_frame(_mounted_app(_column_10k()))
+
+
+@benchmark("frame.column_10k.repaint", group="frame", repeat=5, threshold=FRAME_THRESHOLD)
+def column_10k_repaint():
+    return _repaint_frame(_mounted_app(_column_10k()))
+
+
+@benchmark("frame.nested_grid.layout_paint", group="frame", repeat=5, threshold=FRAME_THRESHOLD)
+def nested_grid_layout_paint():
+    return _full_frame(_mounted_app(_nested_grid()))
+
+
+@benchmark("frame.for_each_5k.build", group="frame", repeat=3, threshold=FRAME_THRESHOLD)
+def for_each_5k_build():
+    from nuiitivet.layout.column import Column
+    from nuiitivet.material.text import Text
+
+    items = list(range(5_000))
+
+    def op():
+        _mounted_app(Column.builder(items, lambda item, _index: Text(f"Item {item}")))
+
+    return op
+
+
+@benchmark("frame.for_each_5k.append", group="frame", repeat=3, threshold=FRAME_THRESHOLD)
+def for_each_5k_append():
+    from nuiitivet.layout.column import Column
+    from nuiitivet.material.text import Text
+    from nuiitivet.observable import Observable
+
+    items = Observable(list(range(5_000)))
+    app = _mounted_app(
+        Column.builder(items, lambda item, _index: Text(f"Item {item}"), height=HEIGHT),
+    )
+
+    def op():
+        current = items.value
+        items.value = current + [len(current)]
+        app._render_raster_frame()
+
+    return op
+
+
+@benchmark("frame.for_each_5k.list_append", group="frame", repeat=5, threshold=FRAME_THRESHOLD)
+def for_each_5k_list_append():
+    """Same as ``for_each_5k.append`` but the items are an ObservableList."""
+    from nuiitivet.layout.column import Column
+    from nuiitivet.material.text import Text
+    from nuiitivet.observable import ObservableList
+
+    items = ObservableList(range(5_000))
+    app = _mounted_app(
+        Column.builder(items, lambda item, _index: Text(f"Item {item}"), height=HEIGHT),
+    )
+
+    def op():
+        items.append(len(items))
+        app._render_raster_frame()
+
+    return op
+
+
+@benchmark("theme.switch", group="theme", number=4, repeat=5, threshold=FRAME_THRESHOLD)
+def theme_switch():
+    from nuiitivet.layout.column import Column
+    from nuiitivet.layout.row import Row
+    from nuiitivet.material.buttons import Button
+    from nuiitivet.material.text import Text
+    from nuiitivet.material.theme.material_theme import MaterialTheme
+    from nuiitivet.theme.manager import manager
+
+    themes = [MaterialTheme.light("#6750A4"), MaterialTheme.dark("#6750A4")]
+    rows = [Row([Text(f"Row {i}"), Button(f"Action {i}")], gap=8) for i in range(200)]
+    app = _mounted_app(Column(rows), theme=themes[0])
+    state = {"index": 0}
+
+    def op():
+        state["index"] ^= 1
+        manager.set_theme(themes[state["index"]])
+        app._render_raster_frame()
+
+    return op
@@ -0,0 +1,70 @@
+"""Observable propagation benchmarks: fan-out and diamond dependency graphs.
+
+Computeds only hold weak references to each other, so every timed operation
+keeps its graph alive through a default argument.
+"""
+
+from harness import benchmark
+
+
+@benchmark("observable.fan_out_1k", group="observable", number=20, threshold=0.5)
+def fan_out_1k():
+    """One source feeding 1000 subscribed computeds."""
+    from nuiitivet.observable import Observable
+
+    source = Observable(0)
+    sinks = [source.map(lambda v, i=i: v + i) for i in range(1000)]
+    seen = []
+    for sink in sinks:
+        sink.subscribe(seen.append)
+
+    def op(graph=sinks):
+        seen.clear()
+        source.value = source.value + 1
+        assert len(seen) == len(graph)
+
+    return op
+
+
+@benchmark("observable.diamond_chain_200", group="observable", number=20, threshold=0.5)
+def diamond_chain_200():
+    """200 stacked diamonds: each level splits into two computeds and joins."""
+    from nuiitivet.observable import Observable
+
+    source = Observable(0)
+    nodes = []
+    head = source
+    for _ in range(200):
+        left = head.map(lambda v: v % 1000 + 1)
+        right = head.map(lambda v: v % 1000 * 2)
+        head = Observable.compute(lambda left=left, right=right: left.value + right.value)
+        nodes.extend((left, right, head))
+    seen = []
+    head.subscribe(seen.append)
+
+    def op(graph=nodes):
+        seen.clear()
+        source.value = source.value + 1
+        assert len(seen) == 1
+
+    return op
+
+
+@benchmark("observable.batch_1k_sources", group="observable", number=20, threshold=0.5)
+def batch_1k_sources():
+    """1000 sources updated in one batch, all feeding a single computed."""
+    from nuiitivet.observable import Observable, batch
+
+    sources = [Observable(0) for _ in range(1000)]
+    total = Observable.compute(lambda: sum(source.value for source in sources))
+    seen = []
+    total.subscribe(seen.append)
+
+    def op(graph=total):
+        seen.clear()
+        with batch():
+            for source in sources:
+                source.value = source.value + 1
+        assert len(seen) == 1
+
+    return op
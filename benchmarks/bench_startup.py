@@ -0,0 +1,42 @@
+"""Startup benchmarks: cold import time measured in a fresh interpreter.
+
+Reuses the ``-X importtime`` parsing of
+``scripts/investigation/bench_import_time.py``; each sample is the total
+import time reported by one subprocess.
+"""
+
+import importlib.util
+import os
+
+from harness import benchmark
+
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def _import_time_module():
+    path = os.path.join(_ROOT, "scripts", "investigation", "bench_import_time.py")
+    spec = importlib.util.spec_from_file_location("bench_import_time", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _import_benchmark(statement):
+    module = _import_time_module()
+    src = os.path.join(_ROOT, "src")
+
+    def op():
+        total_us, _self_times = module._run_once(statement, src)
+        return total_us / 1e6
+
+    return op
+
+
+@benchmark("startup.import_nuiitivet", group="startup", repeat=5, threshold=0.5)
+def import_nuiitivet():
+    return _import_benchmark("import nuiitivet")
+
+
+@benchmark("startup.import_material", group="startup", repeat=5, threshold=0.5)
+def import_material():
+    return _import_benchmark("from nuiitivet.material import Button, Text")
@@ -0,0 +1,207 @@
+"""Registry, timing loop and baseline comparison for the benchmark suite.
+
+Benchmarks are setup functions registered with :func:`benchmark`. A setup
+builds whatever state it needs and returns the operation to time; the
+harness calls that operation ``number`` times per sample and reports
+per-call milliseconds. An operation that returns a number is self-timed:
+the value is taken as the sample duration in seconds (used by benchmarks
+that time a subprocess, such as import time).
+
+Results are plain JSON so they can be stored as a baseline and compared on
+a later run. Comparisons use the median sample, which a single stalled or
+lucky sample cannot move, and scale the baseline by a pure-Python
+calibration loop so a baseline recorded on one machine stays meaningful on
+another.
+"""
+
+import gc
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+RESULTS_VERSION = 1
+
+DEFAULT_THRESHOLD = 0.3
+
+# Frame and theme benchmarks allocate heavily and run for tens of
+# milliseconds, so their medians drift more between runs on one machine.
+FRAME_THRESHOLD = 1.0
+
+# Differences below this are timer noise, whatever the ratio says.
+MIN_REGRESSION_MS = 0.05
+
+
+@dataclass
+class Benchmark:
+    name: str
+    group: str
+    setup: Callable[[], Callable[[], Any]]
+    number: int
+    repeat: int
+    threshold: float
+
+
+_BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name, *, group, number=1, repeat=7, threshold=DEFAULT_THRESHOLD):
+    """Register ``setup`` as a benchmark; it returns the operation to time."""
+
+    def register(setup):
+        if name in _BENCHMARKS:
+            raise ValueError(f"duplicate benchmark {name!r}")
+        _BENCHMARKS[name] = Benchmark(name, group, setup, max(1, number), max(1, repeat), threshold)
+        return setup
+
+    return register
+
+
+def benchmarks(selected: Optional[List[str]] = None) -> List[Benchmark]:
+    """Return registered benchmarks whose name or group contains a pattern."""
+    found = list(_BENCHMARKS.values())
+    if selected:
+        found = [b for b in found if any(pattern in b.name or pattern == b.group for pattern in selected)]
+    return found
+
+
+def calibrate(rounds: int = 7) -> float:
+    """Return the median time in ms of a fixed pure-Python workload."""
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        total = 0
+        items: Dict[int, int] = {}
+        for i in range(200_000):
+            items[i & 1023] = total
+            total += i % 7
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(samples)
+
+
+def run_benchmark(bench: Benchmark, repeat: Optional[int] = None, phases: bool = False) -> Dict[str, Any]:
+    """Time ``bench`` and return its result entry (times are ms per call).
+
+    With ``phases`` the operation runs ``number`` more times under the frame
+    profiler afterwards, and the mean time per frame phase is added as
+    ``phases_ms``. Profiled calls are not part of the timing samples.
+    """
+    op = bench.setup()
+    # One warm-up call fills caches (fonts, text layout, bytecode).
+    op()
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat or bench.repeat):
+            start = time.perf_counter()
+            measured = 0.0
+            self_timed = False
+            for _ in range(bench.number):
+                value = op()
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    measured += float(value)
+                    self_timed = True
+            elapsed = measured if self_timed else time.perf_counter() - start
+            samples.append(elapsed * 1000.0 / bench.number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    result = {
+        "group": bench.group,
+        "median_ms": round(statistics.median(samples), 4),
+        "min_ms": round(min(samples), 4),
+        "max_ms": round(max(samples), 4),
+        "stdev_ms": round(statistics.stdev(samples), 4) if len(samples) > 1 else 0.0,
+        "number": bench.number,
+        "repeat": len(samples),
+    }
+    if phases:
+        frame_phases = _profile_phases(op, bench.number)
+        if frame_phases:
+            result["phases_ms"] = frame_phases
+    return result
+
+
+def _profile_phases(op: Callable[[], Any], number: int) -> Dict[str, float]:
+    from nuiitivet.runtime.profiler import get_frame_profiler
+
+    profiler = get_frame_profiler()
+    profiler.reset()
+    profiler.enable()
+    try:
+        for _ in range(number):
+            op()
+        frames = profiler.frames()
+    finally:
+        profiler.disable()
+        profiler.reset()
+    totals: Dict[str, float] = {}
+    for frame in frames:
+        for name, seconds in frame.phases.items():
+            totals[name] = totals.get(name, 0.0) + seconds
+    count = max(1, len(frames))
+    return {name: round(seconds * 1000.0 / count, 4) for name, seconds in sorted(totals.items())}
+
+
+def results_document(results: Dict[str, Dict[str, Any]], calibration_ms: float) -> Dict[str, Any]:
+    return {
+        "version": RESULTS_VERSION,
+        "python": platform.python_version(),
+        "platform": sys.platform,
+        "machine": platform.machine(),
+        "calibration_ms": round(calibration_ms, 4),
+        "results": results,
+    }
+
+
+def compare(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    *,
+    threshold: Optional[float] = None,
+    normalize: bool = True,
+) -> List[Dict[str, Any]]:
+    """Compare two results documents.
+
+    Returns one row per benchmark in ``current`` with ``status`` set to
+    ``"regression"``, ``"improvement"``, ``"ok"`` or ``"new"``. A benchmark
+    regresses when its median sample exceeds the (calibration-scaled)
+    baseline by more than its threshold and by at least ``MIN_REGRESSION_MS``.
+    """
+    scale = 1.0
+    base_cal = baseline.get("calibration_ms") or 0.0
+    cur_cal = current.get("calibration_ms") or 0.0
+    if normalize and base_cal > 0 and cur_cal > 0:
+        scale = cur_cal / base_cal
+
+    rows = []
+    base_results = baseline.get("results", {})
+    for name, result in current.get("results", {}).items():
+        bench = _BENCHMARKS.get(name)
+        limit = threshold if threshold is not None else (bench.threshold if bench else DEFAULT_THRESHOLD)
+        current_ms = _typical_ms(result)
+        row = {"name": name, "current_ms": current_ms, "baseline_ms": None, "ratio": None, "status": "new"}
+        base = base_results.get(name)
+        if base is not None:
+            expected = _typical_ms(base) * scale
+            ratio = current_ms / expected if expected > 0 else 1.0
+            row["baseline_ms"] = round(expected, 4)
+            row["ratio"] = round(ratio, 3)
+            delta = current_ms - expected
+            if ratio > 1.0 + limit and delta >= MIN_REGRESSION_MS:
+                row["status"] = "regression"
+            elif ratio < 1.0 / (1.0 + limit) and -delta >= MIN_REGRESSION_MS:
+                row["status"] = "improvement"
+            else:
+                row["status"] = "ok"
+        rows.append(row)
+    return rows
+
+
+def _typical_ms(result: Dict[str, Any]) -> float:
+    # Results recorded before medians were compared only carry min_ms.
+    return result.get("median_ms", result["min_ms"])
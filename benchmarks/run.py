@@ -0,0 +1,131 @@
+"""Run the headless benchmark suite and compare against a stored baseline.
+
+Benchmarks cover frame layout/paint of synthetic widget trees, observable
+propagation, theme switching and cold import time. None of them need a
+window or a GPU. Results are written as JSON and compared with
+``baseline.json`` next to this script; a benchmark that is slower than its
+baseline by more than its threshold is reported as a regression and makes
+the run exit with status 1.
+
+The stored baseline is scaled by a calibration loop, but timings still
+depend on the machine. For a precise check of a branch, record a baseline on
+``main`` first (``--update-baseline --baseline /tmp/main.json``) and compare
+the branch against it.
+
+Usage:
+    python benchmarks/run.py                      # run all, compare with baseline
+    python benchmarks/run.py -k frame -k theme    # run a subset (name substring or group)
+    python benchmarks/run.py --output results.json --phases
+    python benchmarks/run.py --update-baseline    # record a new baseline
+"""
+
+import argparse
+import json
+import os
+import sys
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_BASELINE = os.path.join(_HERE, "baseline.json")
+
+_SUITES = ("bench_frames", "bench_observables", "bench_startup")
+
+
+def _ensure_paths():
+    src = os.path.abspath(os.path.join(_HERE, "..", "src"))
+    for path in (src, _HERE):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+
+def _load_suites():
+    import importlib
+
+    for name in _SUITES:
+        importlib.import_module(name)
+
+
+def _print_comparison(rows):
+    for row in rows:
+        if row["baseline_ms"] is None:
+            detail = "(no baseline)"
+        else:
+            detail = f"baseline {row['baseline_ms']:10.3f} ms  x{row['ratio']:.2f}"
+        flag = "" if row["status"] in ("ok", "new") else f"  {row['status'].upper()}"
+        print(f"{row['name']:<36} {row['current_ms']:10.3f} ms  {detail}{flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", "--select", action="append", help="Only run benchmarks matching this name or group")
+    parser.add_argument("--repeat", type=int, default=None, help="Override the number of samples per benchmark")
+    parser.add_argument("--output", help="Write the results JSON to this path")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="Write the results to the baseline path")
+    parser.add_argument("--threshold", type=float, default=None, help="Allowed slowdown ratio for every benchmark")
+    parser.add_argument(
+        "--no-normalize",
+        action="store_true",
+        help="Compare raw times instead of scaling the baseline by the calibration loop",
+    )
+    parser.add_argument("--phases", action="store_true", help="Record per-phase frame times with the frame profiler")
+    args = parser.parse_args()
+
+    _ensure_paths()
+    _load_suites()
+    import harness
+
+    selected = harness.benchmarks(args.select)
+    if not selected:
+        print("no benchmarks selected", file=sys.stderr)
+        return 2
+
+    calibration_ms = harness.calibrate()
+    results = {}
+    for bench in selected:
+        result = harness.run_benchmark(bench, repeat=args.repeat, phases=args.phases)
+        results[bench.name] = result
+        print(f"{bench.name:<36} {result['median_ms']:10.3f} ms  (min {result['min_ms']:.3f}, n={result['repeat']})")
+        for phase, ms in result.get("phases_ms", {}).items():
+            print(f"    {phase:<32} {ms:10.3f} ms")
+    # Calibrating on both sides of the run catches a machine that was busy
+    # (or throttled) at one end of it.
+    calibration_ms = min(calibration_ms, harness.calibrate())
+    document = harness.results_document(results, calibration_ms)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    if args.update_baseline:
+        baseline = {}
+        if args.select and os.path.exists(args.baseline):
+            # Partial runs update only the selected entries.
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                baseline = json.load(f).get("results", {})
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(harness.results_document(baseline, calibration_ms), f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    print()
+    rows = harness.compare(document, baseline, threshold=args.threshold, normalize=not args.no_normalize)
+    _print_comparison(rows)
+    regressions = [row["name"] for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""Measure cold import time of nuiitivet entry points with ``-X importtime``.
+
+Each statement runs several times in a fresh interpreter. The script parses
+the ``-X importtime`` report on stderr and prints the median total import
+time per statement, plus the modules with the most self time. With
+``--check`` it exits non-zero when a statement exceeds its budget, which
+makes it usable as a regression gate.
+
+Usage:
+    python scripts/investigation/bench_import_time.py [--runs N] [--top N] [--check]
+    python scripts/investigation/bench_import_time.py --src /path/to/other/checkout/src
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+# Statement -> budget in milliseconds for --check. The budgets leave
+# headroom over a typical developer machine and fail when a change makes a
+# package import pull in the whole library again.
+_TARGETS = {
+    "import nuiitivet": 60.0,
+    "import nuiitivet.material": 60.0,
+    "from nuiitivet import Observable": 80.0,
+    "from nuiitivet.material import AlertDialog": 400.0,
+}
+
+
+def _default_src():
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+    return os.path.join(root, "src")
+
+
+def _parse_importtime(stderr):
+    """Return ``(total_us, {module: self_us})`` from an importtime report."""
+    total = 0
+    self_times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            _, rest = line.split(":", 1)
+            self_us, cumulative_us, name = rest.split("|", 2)
+        except ValueError:
+            continue
+        # Only top-level entries are not already counted in a parent.
+        if not name[1:].startswith(" "):
+            total += int(cumulative_us)
+        module = name.strip()
+        self_times[module] = self_times.get(module, 0) + int(self_us)
+    return total, self_times
+
+
+def _run_once(statement, src):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = src + (os.pathsep + env["PYTHONPATH"] if env.get("PYTHONPATH") else "")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{statement!r} failed:\n{proc.stderr}")
+    return _parse_importtime(proc.stderr)
+
+
+def measure(statement, src, runs):
+    """Return ``(median_ms, self_times_of_median_run)`` for ``statement``."""
+    # The first run warms the bytecode cache and is discarded.
+    _run_once(statement, src)
+    results = sorted((_run_once(statement, src) for _ in range(runs)), key=lambda r: r[0])
+    total, self_times = results[len(results) // 2]
+    return total / 1000.0, self_times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--top", type=int, default=0, help="Show the N modules with the most self time")
+    parser.add_argument("--src", default=_default_src(), help="Source directory to put on PYTHONPATH")
+    parser.add_argument("--check", action="store_true", help="Exit 1 when a statement exceeds its budget")
+    args = parser.parse_args()
+
+    over_budget = []
+    for statement, budget_ms in _TARGETS.items():
+        median_ms, self_times = measure(statement, args.src, max(1, args.runs))
+        flag = ""
+        if median_ms > budget_ms:
+            over_budget.append(statement)
+            flag = f"  OVER BUDGET ({budget_ms:.0f} ms)"
+        print(f"{statement:<45} {median_ms:8.1f} ms{flag}")
+        if args.top > 0:
+            heaviest = sorted(self_times.items(), key=lambda item: item[1], reverse=True)[: args.top]
+            for module, self_us in heaviest:
+                print(f"    {self_us / 1000.0:7.1f} ms  {module}")
+
+    if args.check and over_budget:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
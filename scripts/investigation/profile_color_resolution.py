@@ -0,0 +1,110 @@
+"""Profile theme color resolution during headless paints.
+
+Paints a grid of Text and LinearProgressIndicator widgets for a number of
+frames under cProfile, once with the color memo disabled and once with it
+enabled, and prints how much of the paint time is spent resolving colors.
+
+Usage:
+    python scripts/investigation/profile_color_resolution.py [--frames N] [--widgets N]
+"""
+
+import argparse
+import cProfile
+import os
+import pstats
+import sys
+import time
+
+
+def _ensure_src_on_path():
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+    src = os.path.join(root, "src")
+    if src not in sys.path:
+        sys.path.insert(0, src)
+
+
+class _NoStore(dict):
+    """Memo stand-in that never keeps an entry (the pre-memo behavior)."""
+
+    def __setitem__(self, key, value):
+        pass
+
+
+def _build(widgets):
+    from nuiitivet.material.progress_indicators import LinearProgressIndicator
+    from nuiitivet.material.text import Text
+
+    items = []
+    for i in range(widgets):
+        items.append(Text(f"Row {i}"))
+        items.append(LinearProgressIndicator(value=(i % 10) / 10.0, width=120))
+    return items
+
+
+def _paint_frames(canvas, items, frames):
+    for _ in range(frames):
+        for i, w in enumerate(items):
+            w.paint(canvas, 0, (i * 20) % 400, 160, 16)
+
+
+def _run(label, items, canvas, frames):
+    from nuiitivet.theme import resolver
+
+    resolver.clear_color_memo()
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    profiler.enable()
+    _paint_frames(canvas, items, frames)
+    profiler.disable()
+    elapsed = time.perf_counter() - start
+
+    stats = pstats.Stats(profiler)
+    resolve_total = 0.0
+    uncached_calls = 0
+    for (filename, _line, name), (_cc, nc, _tt, ct, _callers) in stats.stats.items():
+        if not filename.endswith(os.path.join("theme", "resolver.py")):
+            continue
+        if name == "resolve_color_to_rgba":
+            resolve_total = ct
+        elif name == "_resolve_uncached":
+            uncached_calls = nc
+
+    share = (resolve_total / elapsed * 100.0) if elapsed > 0 else 0.0
+    print(
+        f"{label:>10}: {elapsed * 1000:8.1f} ms total, "
+        f"{resolve_total * 1000:7.1f} ms resolving colors ({share:4.1f}%), "
+        f"{uncached_calls} uncached resolutions"
+    )
+
+
+def main():
+    _ensure_src_on_path()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--widgets", type=int, default=200)
+    args = parser.parse_args()
+
+    from nuiitivet.material.theme.material_theme import MaterialTheme
+    from nuiitivet.rendering.skia import make_raster_surface
+    from nuiitivet.theme import manager, resolver
+
+    light, _dark = MaterialTheme.from_seed_pair("#6750A4")
+    manager.set_theme(light)
+
+    surface = make_raster_surface(400, 400)
+    canvas = surface.getCanvas()
+    items = _build(args.widgets)
+    # Warm font, shaping and paint caches so only color resolution differs.
+    _paint_frames(canvas, items, 1)
+
+    memo = resolver._memo
+    resolver._memo = _NoStore()
+    try:
+        _run("no memo", items, canvas, args.frames)
+    finally:
+        resolver._memo = memo
+    _run("memo", items, canvas, args.frames)
+
+
+if __name__ == "__main__":
+    main()
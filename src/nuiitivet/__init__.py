@@ -1,31 +1,41 @@
 """nuiitivet package.
 
 Core functionality and configuration primitives are exposed here.
+
+Exports are resolved lazily on first attribute access (PEP 562), so
+``import nuiitivet`` stays cheap and only the modules a program actually
+uses get imported.
 """
 
-# Layouts
-from nuiitivet.layout.column import Column
-from nuiitivet.layout.row import Row
-from nuiitivet.layout.stack import Stack
-from nuiitivet.layout.container import Container
-from nuiitivet.layout.flow import Flow
-from nuiitivet.layout.uniform_flow import UniformFlow
-from nuiitivet.layout.grid import Grid, GridItem
-from nuiitivet.layout.spacer import Spacer
-from nuiitivet.layout.cross_aligned import CrossAligned
-from nuiitivet.layout.deck import Deck
-
-# Primitives / Widgets
-from nuiitivet.rendering.sizing import Sizing
-from nuiitivet.widgeting.widget import Widget, ComposableWidget
-from nuiitivet.navigation import Navigator, PageRoute
-
-# State Management
-from nuiitivet.observable import Observable, batch
-
-# Configuration
-from nuiitivet.rendering.skia.font import set_default_font_family
-from nuiitivet.runtime.title_bar import DefaultTitleBar, CustomTitleBar
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Layouts
+    from nuiitivet.layout.column import Column
+    from nuiitivet.layout.row import Row
+    from nuiitivet.layout.stack import Stack
+    from nuiitivet.layout.container import Container
+    from nuiitivet.layout.flow import Flow
+    from nuiitivet.layout.uniform_flow import UniformFlow
+    from nuiitivet.layout.grid import Grid, GridItem
+    from nuiitivet.layout.spacer import Spacer
+    from nuiitivet.layout.cross_aligned import CrossAligned
+    from nuiitivet.layout.deck import Deck
+
+    # Primitives / Widgets
+    from nuiitivet.rendering.sizing import Sizing
+    from nuiitivet.widgeting.widget import Widget, ComposableWidget
+    from nuiitivet.navigation import Navigator, PageRoute
+
+    # State Management
+    from nuiitivet.observable import Observable, batch
+
+    # Configuration
+    from nuiitivet.rendering.skia.font import set_default_font_family
+    from nuiitivet.runtime.title_bar import DefaultTitleBar, CustomTitleBar
 
 __all__: list[str] = [
     "Column",
@@ -50,3 +60,44 @@ __all__: list[str] = [
     "batch",
     "set_default_font_family",
 ]
+
+
+_EXPORTS: dict[str, tuple[str, str]] = {
+    "Column": ("layout.column", "Column"),
+    "Row": ("layout.row", "Row"),
+    "Stack": ("layout.stack", "Stack"),
+    "Container": ("layout.container", "Container"),
+    "Flow": ("layout.flow", "Flow"),
+    "UniformFlow": ("layout.uniform_flow", "UniformFlow"),
+    "Grid": ("layout.grid", "Grid"),
+    "GridItem": ("layout.grid", "GridItem"),
+    "Spacer": ("layout.spacer", "Spacer"),
+    "CrossAligned": ("layout.cross_aligned", "CrossAligned"),
+    "Deck": ("layout.deck", "Deck"),
+    "Sizing": ("rendering.sizing", "Sizing"),
+    "Widget": ("widgeting.widget", "Widget"),
+    "ComposableWidget": ("widgeting.widget", "ComposableWidget"),
+    "Navigator": ("navigation", "Navigator"),
+    "PageRoute": ("navigation", "PageRoute"),
+    "Observable": ("observable", "Observable"),
+    "batch": ("observable", "batch"),
+    "set_default_font_family": ("rendering.skia.font", "set_default_font_family"),
+    "DefaultTitleBar": ("runtime.title_bar", "DefaultTitleBar"),
+    "CustomTitleBar": ("runtime.title_bar", "CustomTitleBar"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    spec = _EXPORTS.get(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr_name = spec
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    value = getattr(module, attr_name)
+    # Cache so later lookups skip __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals().keys()) + list(_EXPORTS.keys()))
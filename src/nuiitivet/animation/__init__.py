@@ -7,9 +7,12 @@ from .animatable import Animatable
 from .converter import VectorConverter, FloatConverter, RgbaTupleConverter
 from .motion import Motion, LinearMotion, BezierMotion, SpringMotion
 from .interpolate import Rect, lerp, lerp_int, lerp_rect
+from .scheduler import AnimationScheduler, get_animation_scheduler
 
 __all__ = [
     "Animatable",
+    "AnimationScheduler",
+    "get_animation_scheduler",
     "VectorConverter",
     "FloatConverter",
     "RgbaTupleConverter",
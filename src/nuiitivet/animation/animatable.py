@@ -5,10 +5,10 @@ from __future__ import annotations
 from typing import Callable, Generic, Optional, TypeVar, Any, cast
 
 from nuiitivet.observable.value import _ObservableValue
-from nuiitivet.observable import runtime
 
 from .converter import FloatConverter, VectorConverter
 from .motion import Motion, MotionState
+from .scheduler import get_animation_scheduler
 
 T = TypeVar("T")
 V = TypeVar("V")
@@ -55,7 +55,7 @@ class Animatable(Generic[T]):
         self._target = initial_value
         self._motion = motion
         self._state: Optional[MotionState] = None
-        self._ticker: Optional[Callable[[float], None]] = None
+        self._ticker: Optional[Callable[[float], bool]] = None
 
         if self._motion is not None:
             initial_vector = self._converter.to_vector(initial_value)
@@ -113,19 +113,20 @@ class Animatable(Generic[T]):
         if self._ticker is not None:
             return
         ticker = self._tick
-        runtime.clock.schedule_interval(ticker, 1 / 60.0)
         self._ticker = ticker
+        get_animation_scheduler().add(ticker)
 
     def _stop_ticking(self) -> None:
         if self._ticker is None:
             return
-        runtime.clock.unschedule(self._ticker)
+        ticker = self._ticker
         self._ticker = None
+        get_animation_scheduler().remove(ticker)
 
-    def _tick(self, dt: float) -> None:
+    def _tick(self, dt: float) -> bool:
         if self._motion is None or self._state is None:
             self._stop_ticking()
-            return
+            return True
 
         done = self._motion.step(self._state, dt)
         self._value.value = self._converter.from_vector(self._state.value)
@@ -135,6 +136,7 @@ class Animatable(Generic[T]):
             self._state.value = self._state.target.copy()
             self._state.done = True
             self._stop_ticking()
+        return done
 
 
 __all__ = ["Animatable"]
@@ -0,0 +1,201 @@
+"""Frame-synchronized scheduler shared by all running animations."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from nuiitivet.common.logging_once import exception_once
+from nuiitivet.observable import runtime
+
+
+logger = logging.getLogger(__name__)
+
+# Step callbacks receive the frame delta and return True once finished.
+StepCallback = Callable[[float], bool]
+FrameCallback = Callable[[float], None]
+
+
+class AnimationScheduler:
+    """Step every active animation once per frame.
+
+    Animations register a step callback instead of their own clock interval.
+    When a backend attaches a frame source (see ``attach_frame_source``) the
+    event loop drives the scheduler through ``frame()`` on each draw and frames
+    are only requested while an animation is running. Without a frame source
+    the scheduler falls back to a single ``runtime.clock`` interval that lives
+    only while something is registered.
+
+    Frame callbacks are passive observers: they run on every frame but never
+    keep frames coming on their own. Work that must run while the UI is idle
+    (polling overlay handles, hover tracking) belongs on a ``runtime.clock``
+    interval instead.
+    """
+
+    def __init__(self, interval: float = 1 / 60.0) -> None:
+        self._interval = float(interval)
+        self._lock = threading.Lock()
+        # Step -> registration serial, so a tick only drops the registration
+        # it actually stepped and not one re-added while the tick ran.
+        self._steps: Dict[StepCallback, int] = {}
+        self._serial = 0
+        self._frame_callbacks: Dict[FrameCallback, None] = {}
+        self._request_frame: Optional[Callable[[], None]] = None
+        self._last_frame: Optional[float] = None
+        # Clock currently carrying the fallback interval, if any.
+        self._clock: Optional[Any] = None
+        self._clock_tick = self._on_clock_tick
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @property
+    def is_active(self) -> bool:
+        """Whether any animation is registered."""
+        return bool(self._steps)
+
+    def add(self, step: StepCallback) -> None:
+        """Register ``step`` to run once per frame until it returns True."""
+        with self._lock:
+            self._serial += 1
+            self._steps[step] = self._serial
+        self._wake()
+
+    def remove(self, step: StepCallback) -> None:
+        with self._lock:
+            self._steps.pop(step, None)
+        self._sleep_if_idle()
+
+    def clear(self) -> None:
+        """Drop every registered animation and frame callback."""
+        with self._lock:
+            self._steps.clear()
+            self._frame_callbacks.clear()
+        self._sleep_if_idle()
+
+    def add_frame_callback(self, callback: FrameCallback) -> None:
+        """Register ``callback`` to run on every frame without requesting frames."""
+        with self._lock:
+            self._frame_callbacks[callback] = None
+        if self._request_frame is None:
+            self._ensure_clock()
+
+    def remove_frame_callback(self, callback: FrameCallback) -> None:
+        with self._lock:
+            self._frame_callbacks.pop(callback, None)
+        self._sleep_if_idle()
+
+    def attach_frame_source(self, request_frame: Callable[[], None]) -> None:
+        """Let an event loop drive the scheduler.
+
+        ``request_frame`` is called whenever an animation starts; the loop
+        must then call ``frame()`` once per drawn frame.
+        """
+        self._request_frame = request_frame
+        self._last_frame = None
+        self._release_clock()
+        if self._steps:
+            request_frame()
+
+    def detach_frame_source(self) -> None:
+        self._request_frame = None
+        self._last_frame = None
+        if self._steps or self._frame_callbacks:
+            self._ensure_clock()
+
+    def frame(self, now: Optional[float] = None) -> bool:
+        """Advance by the time elapsed since the previous frame.
+
+        Returns whether animations are still running, i.e. whether the caller
+        should schedule another frame.
+        """
+        if now is None:
+            now = time.perf_counter()
+        last = self._last_frame
+        dt = self._interval if last is None else max(0.0, now - last)
+        self.tick(dt)
+        self._last_frame = now if self._steps else None
+        return bool(self._steps)
+
+    def tick(self, dt: float) -> None:
+        """Step all registered animations and frame callbacks once."""
+        with self._lock:
+            steps = list(self._steps.items())
+            callbacks = list(self._frame_callbacks)
+
+        finished = []
+        for step, serial in steps:
+            try:
+                if step(dt):
+                    finished.append((step, serial))
+            except Exception:
+                exception_once(logger, "animation_scheduler_step_exc", "Animation step raised")
+                finished.append((step, serial))
+
+        for callback in callbacks:
+            try:
+                callback(dt)
+            except Exception:
+                exception_once(logger, "animation_scheduler_frame_callback_exc", "Frame callback raised")
+
+        if finished:
+            with self._lock:
+                for step, serial in finished:
+                    # Restarted during this tick (e.g. from another
+                    # animation's subscriber): keep the new registration.
+                    if self._steps.get(step) == serial:
+                        del self._steps[step]
+        self._sleep_if_idle()
+
+    def _on_clock_tick(self, dt: float) -> None:
+        self.tick(dt)
+
+    def _wake(self) -> None:
+        request_frame = self._request_frame
+        if request_frame is None:
+            self._ensure_clock()
+            return
+        try:
+            request_frame()
+        except Exception:
+            exception_once(logger, "animation_scheduler_request_frame_exc", "Frame request raised")
+
+    def _sleep_if_idle(self) -> None:
+        if not self._steps:
+            self._last_frame = None
+            if not self._frame_callbacks:
+                self._release_clock()
+
+    def _ensure_clock(self) -> None:
+        clock = runtime.clock
+        if self._clock is clock:
+            return
+        # The runtime clock may have been replaced since the interval was
+        # installed; move it so the active clock keeps driving animations.
+        self._release_clock()
+        clock.schedule_interval(self._clock_tick, self._interval)
+        self._clock = clock
+
+    def _release_clock(self) -> None:
+        clock = self._clock
+        if clock is None:
+            return
+        self._clock = None
+        try:
+            clock.unschedule(self._clock_tick)
+        except Exception:
+            exception_once(logger, "animation_scheduler_unschedule_exc", "Clock unschedule raised")
+
+
+_scheduler = AnimationScheduler()
+
+
+def get_animation_scheduler() -> AnimationScheduler:
+    """Return the process-wide animation scheduler."""
+    return _scheduler
+
+
+__all__ = ["AnimationScheduler", "get_animation_scheduler"]
@@ -5,9 +5,10 @@ from __future__ import annotations
 import logging
 import os
 import sys
+import threading
 import time
 from pathlib import Path
-from typing import Callable, Optional, TYPE_CHECKING
+from typing import Any, Callable, Optional, Set, TYPE_CHECKING
 
 import pyglet
 
@@ -17,9 +18,39 @@ logger = logging.getLogger(__name__)
 
 
 if TYPE_CHECKING:
+    import asyncio
+
     from pyglet.window import Window
 
 
+# Longest wait in run_async() on platforms without a pollable windowing
+# connection (macOS, Windows), where window events cannot wake asyncio.
+_ASYNC_POLL_INTERVAL = 0.016
+
+
+class _WakingClock:
+    """Runtime clock that wakes the event loop whenever work is scheduled.
+
+    Delegates to the loop's pyglet clock. Without the wakeup, a callback
+    scheduled while ``run_async()`` waits for input (e.g. an Observable
+    update dispatched from a worker thread) would sit until the next event.
+    """
+
+    def __init__(self, event_loop: "ResponsiveEventLoop") -> None:
+        self._event_loop = event_loop
+
+    def schedule_once(self, fn: Callable[[float], None], delay: float) -> None:
+        self._event_loop.clock.schedule_once(fn, delay)
+        self._event_loop.wake()
+
+    def schedule_interval(self, fn: Callable[[float], None], interval: float) -> None:
+        self._event_loop.clock.schedule_interval(fn, interval)
+        self._event_loop.wake()
+
+    def unschedule(self, fn: Callable[[float], None]) -> None:
+        self._event_loop.clock.unschedule(fn)
+
+
 class ResponsiveEventLoop(pyglet.app.EventLoop):
     """Event loop that dispatches queued events immediately and manages draw cadence."""
 
@@ -56,6 +87,43 @@ class ResponsiveEventLoop(pyglet.app.EventLoop):
         self._freeze_backstop_last_reset: float = 0.0
         self._freeze_backstop_min_interval: float = 0.2
 
+        self._animation_scheduler: Optional[Any] = None
+        self._animation_interval: float = 1.0 / 60.0
+        self._animation_pending: bool = False
+
+        # Set while run_async() is running; see wake().
+        self._async_loop: Optional["asyncio.AbstractEventLoop"] = None
+        self._async_thread_id: Optional[int] = None
+        self._wakeup: Optional["asyncio.Event"] = None
+        self._watch_fds = True
+        self.runtime_clock = _WakingClock(self)
+
+    def set_animation_scheduler(self, scheduler: Optional[Any]) -> None:
+        """Drive ``scheduler`` from this loop, stepping it once before each draw.
+
+        While animations are running the loop draws at the scheduler's
+        interval regardless of the configured draw cadence; once they finish
+        it stops waking up for them.
+        """
+
+        previous = self._animation_scheduler
+        if previous is not None and previous is not scheduler:
+            previous.detach_frame_source()
+        self._animation_scheduler = scheduler
+        self._animation_pending = False
+        if scheduler is not None:
+            self._animation_interval = float(scheduler.interval)
+            scheduler.attach_frame_source(self._request_animation_frame)
+
+    def _request_animation_frame(self) -> None:
+        self._animation_pending = True
+        self.wake()
+
+    def _next_animation_deadline(self) -> Optional[float]:
+        if not self._animation_pending:
+            return None
+        return self._last_draw_ts + self._animation_interval
+
     def set_freeze_backstop_reset(self, reset_fn: Callable[[], None], *, min_interval_seconds: float = 0.2) -> None:
         """Install a callable that rearms a backstop traceback timer.
 
@@ -208,12 +276,33 @@ class ResponsiveEventLoop(pyglet.app.EventLoop):
             now = time.perf_counter()
             self._next_draw_deadline = now
             self._draw_pending = True
+        self.wake()
 
     def request_draw(self, immediate: bool = False) -> None:
         """Request the next loop iteration to trigger a draw."""
         self._draw_pending = True
         if immediate and self._draw_interval is not None:
             self._next_draw_deadline = time.perf_counter()
+        self.wake()
+
+    def exit(self) -> None:
+        super().exit()
+        self.wake()
+
+    def wake(self) -> None:
+        """Wake ``run_async()`` if it is waiting. Safe to call from any thread."""
+        loop = self._async_loop
+        wakeup = self._wakeup
+        if loop is None or wakeup is None:
+            return
+        if threading.get_ident() == self._async_thread_id:
+            wakeup.set()
+            return
+        try:
+            loop.call_soon_threadsafe(wakeup.set)
+        except RuntimeError:
+            # The asyncio loop has already been closed.
+            pass
 
     def run(self) -> None:
         """Run the event loop.
@@ -329,7 +418,15 @@ class ResponsiveEventLoop(pyglet.app.EventLoop):
                 platform_loop.stop()
 
     async def run_async(self) -> None:
-        """Run the event loop asynchronously."""
+        """Run the event loop asynchronously.
+
+        Between frames the loop awaits a wakeup instead of polling. Window
+        events wake it through the platform's connection descriptors
+        (registered with ``add_reader``); draw requests, scheduled clock
+        callbacks and ``exit()`` wake it through :meth:`wake`. Platforms
+        without such descriptors fall back to polling every
+        ``_ASYNC_POLL_INTERVAL`` seconds.
+        """
         import asyncio
         from pyglet.window import Window
 
@@ -349,11 +446,24 @@ class ResponsiveEventLoop(pyglet.app.EventLoop):
         self.dispatch_event("on_enter")
         self.is_running = True
 
+        loop = asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+        self._async_loop = loop
+        self._async_thread_id = threading.get_ident()
+        self._wakeup = wakeup
+        self._watch_fds = True
+        readers: Set[int] = set()
+
         try:
             while not self.has_exit:
+                # Wakeups arriving while this iteration runs keep the event
+                # set, so the wait below returns immediately.
+                wakeup.clear()
                 self._beat()
+                self._tick_count += 1
                 dt = self.clock.tick(poll=False)
                 self._drain_events(platform_loop)
+                self._last_events_ts = time.perf_counter()
 
                 if not pyglet.app.windows:
                     self.exit()
@@ -363,34 +473,94 @@ class ResponsiveEventLoop(pyglet.app.EventLoop):
                 if self._should_draw(now):
                     self._perform_draw(dt, now)
 
+                readers = self._watch_platform_fds(loop, platform_loop, readers)
                 timeout = self._compute_sleep_timeout(now)
-                if timeout is None:
-                    # No timeout: wait indefinitely for an event
-                    # But we must yield to asyncio loop
-                    await asyncio.sleep(0.001)
-                    platform_loop.step(0.0)
-                elif timeout <= 0.0:
-                    # Immediate timeout
+                if timeout is not None and timeout <= 0.0:
+                    await asyncio.sleep(0)
+                    continue
+                if not readers:
+                    timeout = _ASYNC_POLL_INTERVAL if timeout is None else min(timeout, _ASYNC_POLL_INTERVAL)
+                elif self._platform_events_pending(platform_loop):
+                    # Events already read into the client-side queue never
+                    # make the descriptor readable again.
                     await asyncio.sleep(0)
                     continue
-                else:
-                    # Wait for timeout or event
-                    # We use a small slice to allow asyncio tasks to run
-                    # TODO: This is a busy loop if timeout is large.
-                    # Ideally we should wait on a file descriptor or similar.
-                    # For now, we cap the sleep to a small value to keep UI responsive
-                    # and allow other tasks to run.
-                    sleep_time = min(timeout, 0.016)  # Max 16ms sleep
-                    await asyncio.sleep(sleep_time)
-                    platform_loop.step(0.0)
+
+                self._planned_wait_seconds = timeout
+                await self._wait_for_wakeup(loop, wakeup, timeout)
+                self._planned_wait_seconds = None
 
         finally:
+            for fd in readers:
+                try:
+                    loop.remove_reader(fd)
+                except Exception:
+                    exception_once(logger, "pyglet_event_loop_remove_reader_exc", "remove_reader failed")
+            self._async_loop = None
+            self._async_thread_id = None
+            self._wakeup = None
             self.is_running = False
             try:
                 self.dispatch_event("on_exit")
             finally:
                 platform_loop.stop()
 
+    @staticmethod
+    async def _wait_for_wakeup(
+        loop: "asyncio.AbstractEventLoop", wakeup: "asyncio.Event", timeout: Optional[float]
+    ) -> None:
+        handle = loop.call_later(timeout, wakeup.set) if timeout is not None else None
+        try:
+            await wakeup.wait()
+        finally:
+            if handle is not None:
+                handle.cancel()
+
+    def _watch_platform_fds(
+        self, loop: "asyncio.AbstractEventLoop", platform_loop: Any, current: Set[int]
+    ) -> Set[int]:
+        """Keep ``add_reader`` registrations in sync with the platform's select devices.
+
+        On Linux these are the X display connections plus pyglet's
+        notification pipe (written by ``post_event`` and ``exit``). Other
+        platforms have none, and an empty set selects the polling fallback.
+        """
+        devices = getattr(platform_loop, "select_devices", None) if self._watch_fds else None
+        fds: Set[int] = set()
+        for device in list(devices or ()):
+            try:
+                fds.add(int(device.fileno()))
+            except Exception:
+                continue
+        if fds == current:
+            return current
+        try:
+            for fd in current - fds:
+                loop.remove_reader(fd)
+            for fd in fds - current:
+                loop.add_reader(fd, self.wake)
+        except Exception:
+            # e.g. the Windows proactor loop does not support add_reader.
+            exception_once(logger, "pyglet_event_loop_add_reader_exc", "add_reader failed; polling instead")
+            self._watch_fds = False
+            for fd in fds | current:
+                try:
+                    loop.remove_reader(fd)
+                except Exception:
+                    pass
+            return set()
+        return fds
+
+    @staticmethod
+    def _platform_events_pending(platform_loop: Any) -> bool:
+        for device in list(getattr(platform_loop, "select_devices", None) or ()):
+            try:
+                if device.poll():
+                    return True
+            except Exception:
+                continue
+        return False
+
     def _normalise_interval(self, draw_fps: Optional[float]) -> Optional[float]:
         if draw_fps is None:
             return None
@@ -417,9 +587,12 @@ class ResponsiveEventLoop(pyglet.app.EventLoop):
         max_spins = 500
         spins = 0
         while not self.has_exit:
-            timed_out = platform_loop.step(0.0)
+            result = platform_loop.step(0.0)
             platform_loop.dispatch_posted_events()
             self._dispatch_window_events()
+            # pyglet's Cocoa loop returns True on timeout, while the Xlib and
+            # Win32 loops return True when events were handled.
+            timed_out = bool(result) if sys.platform == "darwin" else not result
             if timed_out:
                 break
             spins += 1
@@ -427,6 +600,10 @@ class ResponsiveEventLoop(pyglet.app.EventLoop):
                 break
 
     def _should_draw(self, now: float) -> bool:
+        animation_deadline = self._next_animation_deadline()
+        if animation_deadline is not None and now >= animation_deadline:
+            return True
+
         # If no draw cadence is configured, draw only when explicitly requested.
         if self._draw_interval is None or self._next_draw_deadline is None:
             return bool(self._draw_pending)
@@ -436,6 +613,16 @@ class ResponsiveEventLoop(pyglet.app.EventLoop):
         return bool(self._draw_pending) or now >= self._next_draw_deadline
 
     def _perform_draw(self, dt: float, now: float) -> None:
+        # Step animations first so the invalidations they cause are folded
+        # into this draw instead of requesting another one. Every draw steps
+        # the scheduler so frame callbacks see frames drawn for other reasons.
+        scheduler = self._animation_scheduler
+        if scheduler is not None:
+            self._animation_pending = False
+            try:
+                self._animation_pending = bool(scheduler.frame(now))
+            except Exception:
+                exception_once(logger, "pyglet_event_loop_animation_frame_exc", "Animation scheduler frame raised")
         self._draw_pending = False
         self._last_draw_ts = float(now)
         try:
@@ -447,6 +634,16 @@ class ResponsiveEventLoop(pyglet.app.EventLoop):
                 self._next_draw_deadline = now + self._draw_interval
 
     def _compute_sleep_timeout(self, now: float) -> Optional[float]:
+        timeout = self._compute_draw_timeout(now)
+        animation_deadline = self._next_animation_deadline()
+        if animation_deadline is None:
+            return timeout
+        animation_timeout = max(0.0, animation_deadline - now)
+        if timeout is None:
+            return animation_timeout
+        return min(timeout, animation_timeout)
+
+    def _compute_draw_timeout(self, now: float) -> Optional[float]:
         clock_timeout = self.clock.get_sleep_time(True)
         if clock_timeout is not None and clock_timeout < 0:
             clock_timeout = 0.0
@@ -6,6 +6,7 @@ import logging
 from typing import Any
 
 from nuiitivet.common.logging_once import debug_once, exception_once
+from nuiitivet.runtime.profiler import get_frame_profiler
 
 
 logger = logging.getLogger(__name__)
@@ -54,8 +55,7 @@ def draw_gpu_frame(app: Any, gr_context: Any, GL: Any, skia: Any) -> bool:
         return False
 
     canvas = surf.getCanvas()
-    if getattr(app, "_scale", 1.0) != 1.0:
-        canvas.scale(getattr(app, "_scale", 1.0), getattr(app, "_scale", 1.0))
+    scale = getattr(app, "_scale", 1.0)
 
     bg_color = getattr(skia, "ColorWHITE", 0)
     clear_fn = getattr(app, "_background_clear_color", None)
@@ -75,26 +75,42 @@ def draw_gpu_frame(app: Any, gr_context: Any, GL: Any, skia: Any) -> bool:
         except Exception:
             exception_once(logger, "gpu_frame_clear_color_convert_exc", "Failed to convert clear color")
             bg_color = getattr(skia, "ColorWHITE", 0)
-    canvas.clear(bg_color)
-
-    if app.root:
-        content_height = max(0, app.height)
-
-        layout_fn = getattr(app.root, "layout", None)
-        clear_needs_layout_fn = getattr(app.root, "clear_needs_layout", None)
-        if callable(layout_fn):
-            needs_layout = getattr(app.root, "needs_layout", True)
-            last_size = getattr(app, "_last_layout_size", None)
-            current_size = (app.width, content_height)
-            if needs_layout or last_size != current_size:
-                layout_fn(app.width, content_height)
-                app._last_layout_size = current_size
-                if callable(clear_needs_layout_fn):
-                    clear_needs_layout_fn()
-        app.root.paint(canvas, 0, 0, app.width, content_height)
+
+    # The window framebuffer is swapped every frame, so partial repaints go to
+    # a retained offscreen layer which is then blitted in full.
+    profiler = get_frame_profiler()
+    layer = _retained_layer(app, gr_context, skia, phys_w, phys_h)
+    if layer is not None:
+        layer_canvas = layer.getCanvas()
+        layer_canvas.save()
+        try:
+            if scale != 1.0:
+                layer_canvas.scale(scale, scale)
+            with profiler.span("layout"):
+                _layout_root(app)
+            if app.root:
+                with profiler.span("paint"):
+                    app._paint_damage(layer_canvas, 0, 0, app.width, max(0, app.height), bg_color)
+        finally:
+            layer_canvas.restore()
+        canvas.clear(bg_color)
+        layer.draw(canvas, 0, 0)
+    else:
+        if scale != 1.0:
+            canvas.scale(scale, scale)
+        canvas.clear(bg_color)
+        if app.root:
+            with profiler.span("layout"):
+                _layout_root(app)
+            with profiler.span("paint"):
+                app.root.paint(canvas, 0, 0, app.width, max(0, app.height))
+        damage = getattr(app, "_damage", None)
+        if damage is not None:
+            damage.clear()
 
     try:
-        gr_context.flush()
+        with profiler.span("gpu_flush"):
+            gr_context.flush()
     except Exception:
         try:
             gr_context.submit()
@@ -103,3 +119,62 @@ def draw_gpu_frame(app: Any, gr_context: Any, GL: Any, skia: Any) -> bool:
 
     app._dirty = False
     return True
+
+
+def _layout_root(app: Any) -> None:
+    root = app.root
+    if not root:
+        return
+    content_height = max(0, app.height)
+    layout_fn = getattr(root, "layout", None)
+    clear_needs_layout_fn = getattr(root, "clear_needs_layout", None)
+    if not callable(layout_fn):
+        return
+    needs_layout = getattr(root, "needs_layout", True)
+    last_size = getattr(app, "_last_layout_size", None)
+    current_size = (app.width, content_height)
+    if needs_layout or last_size != current_size:
+        damage = getattr(app, "_damage", None)
+        if damage is not None:
+            damage.mark_full()
+        boundaries = getattr(app, "_relayout_boundaries", None)
+        if boundaries is not None:
+            boundaries.clear()
+        layout_fn(app.width, content_height)
+        app._last_layout_size = current_size
+        if callable(clear_needs_layout_fn):
+            clear_needs_layout_fn()
+        return
+    flush_boundaries = getattr(app, "_flush_relayout_boundaries", None)
+    if callable(flush_boundaries):
+        flush_boundaries()
+
+
+def _retained_layer(app: Any, gr_context: Any, skia: Any, phys_w: int, phys_h: int) -> Any:
+    """Return the app's offscreen GPU layer, (re)creating it when the size changes.
+
+    Returns None when the app cannot paint partial damage or the context
+    cannot allocate render targets; callers then paint straight to the
+    framebuffer.
+    """
+    damage = getattr(app, "_damage", None)
+    if damage is None or not callable(getattr(app, "_paint_damage", None)):
+        return None
+    key = (phys_w, phys_h, id(gr_context))
+    layer = getattr(app, "_gpu_layer", None)
+    if layer is not None and getattr(app, "_gpu_layer_key", None) == key:
+        return layer
+    try:
+        info = skia.ImageInfo.MakeN32Premul(phys_w, phys_h)
+        layer = skia.Surface.MakeRenderTarget(gr_context, skia.Budgeted.kYes, info)
+    except Exception:
+        debug_once(logger, "gpu_frame_layer_alloc_exc", "Failed to allocate retained GPU layer")
+        layer = None
+    if not layer:
+        app._gpu_layer = None
+        app._gpu_layer_key = None
+        return None
+    app._gpu_layer = layer
+    app._gpu_layer_key = key
+    damage.mark_full()
+    return layer
@@ -11,7 +11,7 @@ import math
 import os
 import sys
 import time
-from typing import Any, Optional
+from typing import Any, Optional, cast
 
 import ctypes
 import pyglet
@@ -34,7 +34,9 @@ from nuiitivet.input.codes import (
 
 from .gpu_frame import draw_gpu_frame
 
+from nuiitivet.animation.scheduler import get_animation_scheduler
 from nuiitivet.observable.runtime import set_clock
+from nuiitivet.runtime.profiler import PROFILE_TRACE_ENV, get_frame_profiler
 from nuiitivet.common.logging_once import debug_once, exception_once
 
 logger = logging.getLogger(__name__)
@@ -906,16 +908,38 @@ def run_app(app: Any, draw_fps: Optional[float] = None) -> None:
     event_loop = ResponsiveEventLoop(window, app._render_frame, effective_draw_fps)
     setattr(app, "_event_loop", event_loop)
 
+    animation_scheduler = get_animation_scheduler()
+    try:
+        event_loop.set_animation_scheduler(animation_scheduler)
+    except Exception:
+        exception_once(logger, "pyglet_set_animation_scheduler_exc", "set_animation_scheduler raised")
+
     # IMPORTANT: align observable runtime clock with the actual event-loop clock
-    # that is ticked in ResponsiveEventLoop.run()/run_async().
+    # that is ticked in ResponsiveEventLoop.run()/run_async(). The wrapper also
+    # wakes run_async() when callbacks are scheduled while it waits.
     try:
-        set_clock(event_loop.clock)
+        set_clock(event_loop.runtime_clock)
     except Exception:
-        exception_once(logger, "pyglet_set_event_loop_clock_exc", "set_clock(event_loop.clock) failed")
+        exception_once(logger, "pyglet_set_event_loop_clock_exc", "set_clock(event_loop.runtime_clock) failed")
+
+    trace_path = os.environ.get(PROFILE_TRACE_ENV)
+    if trace_path:
+        get_frame_profiler().enable()
 
     try:
         event_loop.run()
     finally:
+        if trace_path:
+            profiler = get_frame_profiler()
+            try:
+                profiler.write_chrome_trace(trace_path)
+            except Exception:
+                exception_once(logger, "pyglet_write_profile_trace_exc", "Failed to write frame profile trace")
+            profiler.disable()
+        try:
+            event_loop.set_animation_scheduler(None)
+        except Exception:
+            exception_once(logger, "pyglet_clear_animation_scheduler_exc", "set_animation_scheduler(None) raised")
         try:
             setattr(app, "_event_loop", None)
             setattr(app, "_window", None)
@@ -933,11 +957,59 @@ def run_app(app: Any, draw_fps: Optional[float] = None) -> None:
             exception_once(logger, "pyglet_restore_event_loop_exc", "Failed to restore pyglet.app.event_loop")
 
 
+def _read_rgba(app: Any, skia: Any, surface: Any, x: int, y: int, w: int, h: int) -> bytearray:
+    """Read a device-pixel region of ``surface`` as tightly packed RGBA rows."""
+    full = x == 0 and y == 0 and w == int(surface.width()) and h == int(surface.height())
+    pixels = getattr(app, "_raster_pixels", None) if full else None
+    if pixels is None or len(pixels) != w * h * 4:
+        pixels = bytearray(w * h * 4)
+        if full:
+            setattr(app, "_raster_pixels", pixels)
+    info = skia.ImageInfo.Make(w, h, skia.kRGBA_8888_ColorType, skia.kPremul_AlphaType)
+    if not surface.readPixels(info, pixels, w * 4, x, y):
+        raise RuntimeError("surface.readPixels() failed")
+    return pixels
+
+
+def _upload_raster_frame(app: Any, skia: Any, surface: Any, damaged: Any) -> Any:
+    """Copy changed pixels of the retained raster surface into a persistent texture.
+
+    The texture is recreated only when the physical size changes. Otherwise
+    just the damaged device rects are uploaded with sub-image updates.
+    """
+    width = int(surface.width())
+    height = int(surface.height())
+    texture = getattr(app, "_raster_texture", None)
+    if texture is None or (int(texture.width), int(texture.height)) != (width, height):
+        texture = pyglet.image.Texture.create(width, height)
+        setattr(app, "_raster_texture", texture)
+        damaged = None
+    elif getattr(app, "_last_image", None) is None:
+        # The window asked for a fresh frame (show/activate); resend everything.
+        damaged = None
+
+    rects = ((0, 0, width, height),) if damaged is None else damaged
+    for rx, ry, rw, rh in rects:
+        pixels = _read_rgba(app, skia, surface, rx, ry, rw, rh)
+        # Skia rows run top-to-bottom; textures are addressed from the bottom.
+        # ImageData only needs a buffer; passing the reused bytearray avoids a
+        # per-frame copy that bytes() would make.
+        region = pyglet.image.ImageData(rw, rh, "RGBA", cast(bytes, pixels), pitch=-rw * 4)
+        texture.blit_into(region, rx, height - ry - rh, 0)
+    return texture
+
+
 def _draw_raster_frame(app: Any, skia: Any) -> bool:
     try:
         img: Any
+        render_frame = getattr(app, "_render_raster_frame", None)
         render_snapshot = getattr(app, "_render_snapshot", None)
-        if callable(render_snapshot):
+        if callable(render_frame) and skia is not None:
+            scale = max(1.0, float(getattr(app, "_scale", 1.0)))
+            surface, damaged = render_frame(scale=scale)
+            with get_frame_profiler().span("upload"):
+                img = _upload_raster_frame(app, skia, surface, damaged)
+        elif callable(render_snapshot):
             scale = max(1.0, float(getattr(app, "_scale", 1.0)))
             snapshot = render_snapshot(scale=scale)
 
@@ -4,9 +4,10 @@ from typing import List, Tuple, Optional, Union, Sequence
 
 from ..widgeting.widget import Widget
 from ..rendering.sizing import SizingLike
+from ..rendering.skia import local_clip_bounds
 from .gap import normalize_gap
 from .metrics import compute_aligned_offsets, align_offset
-from .layout_utils import expand_layout_children
+from .layout_utils import expand_layout_children, is_clipped_out
 from .for_each import ForEach, ItemsLike, BuilderFn
 from .measure import preferred_size as measure_preferred_size
 from nuiitivet.observable.protocols import ReadOnlyObservableProtocol
@@ -223,6 +224,7 @@ class Column(Widget):
         if any(c.layout_rect is None for c in children):
             self.layout(width, height)
 
+        clip = local_clip_bounds(canvas)
         for child in children:
             rect = child.layout_rect
             if rect is None:
@@ -234,6 +236,8 @@ class Column(Widget):
 
             child.set_last_rect(abs_x, abs_y, w, h)
 
+            if is_clipped_out(child, clip, abs_x, abs_y, w, h):
+                continue
             child.paint(canvas, abs_x, abs_y, w, h)
 
     @staticmethod
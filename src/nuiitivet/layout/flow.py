@@ -6,8 +6,9 @@ from typing import List, Optional, Sequence, Tuple, Union
 
 from ..widgeting.widget import Widget
 from ..rendering.sizing import SizingLike
+from ..rendering.skia import local_clip_bounds
 from .gap import normalize_gap
-from .layout_utils import expand_layout_children
+from .layout_utils import expand_layout_children, is_clipped_out
 from .metrics import align_offset
 from .for_each import ForEach, ItemsLike, BuilderFn
 from .measure import preferred_size as measure_preferred_size
@@ -180,6 +181,7 @@ class Flow(Widget):
         if any(c.layout_rect is None for c in children):
             self.layout(width, height)
 
+        clip = local_clip_bounds(canvas)
         for child in children:
             rect = child.layout_rect
             if rect is None:
@@ -191,6 +193,8 @@ class Flow(Widget):
 
             child.set_last_rect(abs_x, abs_y, w, h)
 
+            if is_clipped_out(child, clip, abs_x, abs_y, w, h):
+                continue
             child.paint(canvas, abs_x, abs_y, w, h)
 
     def _layout_flow(self, children: List[Widget], x: int, y: int, w: int, h: int) -> None:
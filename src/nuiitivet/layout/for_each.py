@@ -6,6 +6,10 @@ the parent layout to rebuild entirely. The widget can be embedded inside
 Row/Column/Flow (or any other layout) and can also materialize
 convenience wrappers via ``row()``, ``column()`` and ``flow()`` helper
 methods.
+
+When the items are an :class:`~nuiitivet.observable.ObservableList`,
+ForEach applies its structural changes (insert/remove/replace/move) to the
+affected entries instead of re-enumerating the whole collection.
 """
 
 from __future__ import annotations
@@ -15,7 +19,7 @@ from dataclasses import dataclass
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union, cast
 
 from ..widgeting.widget import ComposableWidget, Widget
-from nuiitivet.observable import ObservableProtocol
+from nuiitivet.observable import ListChange, ObservableList, ObservableProtocol
 from nuiitivet.common.logging_once import exception_once
 from .spacer import Spacer
 
@@ -293,6 +297,179 @@ class ForEach(ComposableWidget):
                 self.invalidate()
                 break
 
+    def _handle_items_change(self, change: ListChange) -> None:
+        """Apply one structural change of an ObservableList source.
+
+        Without a key function entries are identified by position, as in a
+        full resync: the tail grows or shrinks and only positions whose value
+        changed are rebuilt. Keyed entries follow their item, so inserts,
+        removals and moves leave the other entries' widgets untouched.
+        Anything that cannot be applied incrementally falls back to the full
+        resync of ``_handle_items_changed``.
+        """
+        if change.kind == "reset" or not self._ordered_entries:
+            self._handle_items_changed()
+            return
+        items = self._resolve_items_object()
+        try:
+            if len(self._provider_children) != len(self._ordered_entries):
+                applied = False
+            elif self.key_fn is None:
+                applied = self._apply_positional_change(change, items)
+            else:
+                applied = self._apply_keyed_change(change, items)
+        except Exception:
+            exception_once(logger, "for_each_apply_items_change_exc", "Failed to apply ForEach items change")
+            applied = False
+        if not applied:
+            self._handle_items_changed()
+            return
+        self.invalidate()
+
+    def _apply_positional_change(self, change: ListChange, items: Any) -> bool:
+        count = len(items)
+        index = change.start
+        if change.kind == "insert":
+            before, stop = count - len(change.items), count
+        elif change.kind == "remove":
+            before, stop = count + len(change.old_items), count
+        elif change.kind == "replace":
+            before, stop = count, index + len(change.items)
+        elif change.kind == "move":
+            before, stop = count, max(index, change.new_index) + 1
+            index = min(index, change.new_index)
+        else:
+            return False
+        entries = self._ordered_entries
+        if len(entries) != before:
+            return False
+
+        if count > before:
+            infos = [_TokenInfo(self._key_label(items[i], i), i, items[i]) for i in range(before, count)]
+            self._splice_entries(before, 0, self._create_entries(infos))
+        elif count < before:
+            removed = entries[count:]
+            self._splice_entries(count, len(removed), [])
+            self._release_entries(removed)
+
+        for entry in entries[index : min(stop, before, count)]:
+            value = items[entry.index]
+            if not self._values_equal(entry.value, value):
+                entry.value = value
+                if not entry.scope_id:
+                    return False
+                self.invalidate_scope_id(entry.scope_id)
+        return True
+
+    def _apply_keyed_change(self, change: ListChange, items: Any) -> bool:
+        entries = self._ordered_entries
+        index = change.start
+        if change.kind == "insert":
+            if len(entries) != len(items) - len(change.items):
+                return False
+            infos: List[_TokenInfo] = []
+            for offset, value in enumerate(change.items):
+                token = self._key_label(value, index + offset)
+                # Duplicate keys get positional suffixes; leave those to a resync.
+                if token in self._entries_by_token or any(info.token == token for info in infos):
+                    return False
+                infos.append(_TokenInfo(token, index + offset, value))
+            self._splice_entries(index, 0, self._create_entries(infos))
+            reindex_from = index + len(infos)
+            reindex_to = len(entries)
+        elif change.kind == "remove":
+            count = len(change.old_items)
+            if len(entries) != len(items) + count:
+                return False
+            removed = entries[index : index + count]
+            if any(self._has_duplicate_key(entry) for entry in removed):
+                return False
+            self._splice_entries(index, count, [])
+            self._release_entries(removed)
+            reindex_from, reindex_to = index, len(entries)
+        elif change.kind == "replace":
+            if len(entries) != len(items):
+                return False
+            for offset, value in enumerate(change.items):
+                entry = entries[index + offset]
+                token = self._key_label(value, index + offset)
+                if token == entry.token:
+                    if not self._values_equal(entry.value, value):
+                        entry.value = value
+                        if not entry.scope_id:
+                            return False
+                        self.invalidate_scope_id(entry.scope_id)
+                    continue
+                if token in self._entries_by_token or self._has_duplicate_key(entry):
+                    return False
+                self._splice_entries(index + offset, 1, [])
+                self._release_entries([entry])
+                self._splice_entries(
+                    index + offset, 0, self._create_entries([_TokenInfo(token, index + offset, value)])
+                )
+            return True
+        elif change.kind == "move":
+            if len(entries) != len(items) or self._has_duplicate_key(entries[index]):
+                return False
+            new_index = change.new_index
+            entry = entries.pop(index)
+            entries.insert(new_index, entry)
+            fragment = self._provider_children.pop(index)
+            self._provider_children.insert(new_index, fragment)
+            self.move_child(fragment, new_index)
+            reindex_from, reindex_to = min(index, new_index), max(index, new_index) + 1
+        else:
+            return False
+        # Keyed widgets are recycled, so only the bookkeeping index moves. A
+        # key that depends on the index moves with it; leave that to a resync.
+        for i in range(reindex_from, reindex_to):
+            entry = entries[i]
+            entry.index = i
+            if self._key_label(entry.value, i) != entry.token.split("#", 1)[0]:
+                return False
+        return True
+
+    def _has_duplicate_key(self, entry: _ForEachEntry) -> bool:
+        return "#" in entry.token or f"{entry.token}#1" in self._entries_by_token
+
+    def _create_entries(self, infos: List[_TokenInfo]) -> List[_ForEachEntry]:
+        entries = [
+            _ForEachEntry(token=info.token, scope_name=f"item:{info.token}", index=info.index, value=info.value)
+            for info in infos
+        ]
+        managed_ctx = self._build_ctx is None
+        if managed_ctx:
+            self.create_build_context()
+        try:
+            for entry in entries:
+                self._entries_by_token[entry.token] = entry
+                self._ensure_fragment(entry)
+        finally:
+            if managed_ctx:
+                # Unlike a full build, other entries' scopes stay alive.
+                self._active_scope_ids.clear()
+                self._build_ctx = None
+        return entries
+
+    def _splice_entries(self, index: int, count: int, new_entries: List[_ForEachEntry]) -> None:
+        """Replace ``count`` entries at ``index``; the fragments follow."""
+        fragments = [entry.fragment for entry in new_entries if entry.fragment is not None]
+        self._ordered_entries[index : index + count] = new_entries
+        self._provider_children[index : index + count] = fragments
+        for offset, fragment in enumerate(fragments):
+            self.insert_child(index + offset, fragment)
+
+    def _release_entries(self, entries: List[_ForEachEntry]) -> None:
+        root = self._scope_root
+        for entry in entries:
+            self._entries_by_token.pop(entry.token, None)
+            scope_id = entry.scope_id
+            self._dispose_entry(entry)
+            if scope_id:
+                self._discard_scope(scope_id)
+            if root is not None:
+                root.children.pop(entry.scope_name, None)
+
     @staticmethod
     def _values_equal(left: Any, right: Any) -> bool:
         if left is right:
@@ -309,7 +486,10 @@ class ForEach(ComposableWidget):
         observable = self._observable_items()
         if observable is not None and hasattr(observable, "subscribe"):
             try:
-                disp = observable.subscribe(self._handle_items_changed)
+                if isinstance(observable, ObservableList):
+                    disp = observable.subscribe_changes(self._handle_items_change)
+                else:
+                    disp = observable.subscribe(self._handle_items_changed)
                 # Normalize subscribe return: Disposable with dispose() or a callable
                 if hasattr(disp, "dispose"):
 
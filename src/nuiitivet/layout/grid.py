@@ -8,9 +8,10 @@ from nuiitivet.common.logging_once import exception_once
 
 from ..widgeting.widget import Widget
 from ..rendering.sizing import Sizing, SizingLike, parse_sizing
+from ..rendering.skia import local_clip_bounds
 from .container import Container
 from .gap import normalize_gap
-from .layout_utils import expand_layout_children
+from .layout_utils import expand_layout_children, is_clipped_out
 
 
 logger = logging.getLogger(__name__)
@@ -293,6 +294,7 @@ class Grid(Widget):
         if any(c.layout_rect is None for c in children):
             self.layout(width, height)
 
+        clip = local_clip_bounds(canvas)
         for child in children:
             rect = child.layout_rect
             if rect is None:
@@ -304,6 +306,8 @@ class Grid(Widget):
 
             child.set_last_rect(abs_x, abs_y, w, h)
 
+            if is_clipped_out(child, clip, abs_x, abs_y, w, h):
+                continue
             child.paint(canvas, abs_x, abs_y, w, h)
 
     # --- helpers -------------------------------------------------
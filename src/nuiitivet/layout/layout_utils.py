@@ -4,7 +4,7 @@ Moved out from `utils.py` to separate layout concerns.
 """
 
 import logging
-from typing import List, Sequence, TYPE_CHECKING
+from typing import List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 from nuiitivet.common.logging_once import exception_once
 
@@ -46,3 +46,35 @@ def expand_layout_children(children: Sequence["Widget"]) -> List["Widget"]:
                 continue
         materialized.append(child)
     return materialized
+
+
+def is_clipped_out(
+    child: "Widget",
+    clip: Optional[Tuple[float, float, float, float]],
+    x: int,
+    y: int,
+    width: int,
+    height: int,
+) -> bool:
+    """Return True when ``child`` painted at (x, y, width, height) cannot touch ``clip``.
+
+    ``clip`` is (left, top, right, bottom) in the same coordinate space as the
+    paint rect, typically from ``local_clip_bounds(canvas)``. The child's
+    ``paint_outsets()`` are included so shadows and focus rings are not culled.
+    A None clip means the visible area is unknown and nothing is culled.
+    """
+
+    if clip is None:
+        return False
+    try:
+        left, top, right, bottom = child.paint_outsets()
+    except Exception:
+        exception_once(_logger, "layout_utils_paint_outsets_exc", "paint_outsets failed during culling")
+        return False
+    clip_l, clip_t, clip_r, clip_b = clip
+    return (
+        x + width + max(0, right) <= clip_l
+        or x - max(0, left) >= clip_r
+        or y + height + max(0, bottom) <= clip_t
+        or y - max(0, top) >= clip_b
+    )
@@ -0,0 +1,646 @@
+"""LazyColumn / LazyRow: virtualized scrolling lists.
+
+Only the items intersecting the viewport (plus an overscan margin) are built,
+measured and laid out. Items that have never been measured contribute an
+estimated extent to the total content size so the scrollbar and
+``ScrollController`` metrics stay meaningful for very long lists.
+
+Item widgets are materialized through the same scoped fragments as
+:class:`~nuiitivet.layout.for_each.ForEach`; fragments are recycled by key
+while their item stays inside the window.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union, cast
+
+from nuiitivet.common.logging_once import exception_once
+from nuiitivet.observable import ListChange
+from nuiitivet.rendering.sizing import SizingLike
+from nuiitivet.scrolling import ScrollController, ScrollDirection, ScrollPhysics
+from nuiitivet.widgets.scrollbar import ScrollbarBehavior
+
+from ..widgeting.widget import Widget
+from .for_each import BuilderFn, ForEach, ItemsLike, _ForEachEntry
+from .measure import preferred_size as measure_preferred_size
+from .scroller import Scroller
+
+logger = logging.getLogger(__name__)
+
+
+_DEFAULT_ESTIMATED_EXTENT = 48.0
+
+
+class _ExtentIndex:
+    """Fenwick tree over measured item extents.
+
+    Unmeasured items are counted separately so their estimated extent can be
+    applied at query time; prefix offsets and offset-to-index lookups stay
+    logarithmic for any list length.
+    """
+
+    def __init__(self) -> None:
+        self._size = 0
+        self._capacity = 0
+        self._extents: Dict[int, float] = {}
+        self._sums: List[float] = [0.0]
+        self._counts: List[int] = [0]
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def get(self, index: int) -> Optional[float]:
+        return self._extents.get(index)
+
+    def average(self) -> Optional[float]:
+        if not self._extents:
+            return None
+        total, count = self._prefix(self._size)
+        return total / count if count else None
+
+    def resize(self, size: int) -> None:
+        size = max(0, int(size))
+        if size < self._size:
+            self._extents = {i: e for i, e in self._extents.items() if i < size}
+            self._size = size
+            self._rebuild(self._capacity)
+            return
+        self._size = size
+        if size > self._capacity:
+            self._rebuild(max(size, self._capacity * 2, 16))
+
+    def clear(self) -> None:
+        self._extents.clear()
+        self._rebuild(self._capacity)
+
+    def set(self, index: int, extent: float) -> None:
+        if index < 0 or index >= self._size:
+            return
+        extent = float(extent)
+        old = self._extents.get(index)
+        if old == extent:
+            return
+        if old is None:
+            self._add(index, extent, 1)
+        else:
+            self._add(index, extent - old, 0)
+        self._extents[index] = extent
+
+    def offset_of(self, index: int, estimate: float, gap: float) -> float:
+        """Return the leading edge of ``index`` (or the end, for ``size``)."""
+
+        index = max(0, min(int(index), self._size))
+        total, count = self._prefix(index)
+        return total + estimate * (index - count) + gap * index
+
+    def total(self, estimate: float, gap: float) -> float:
+        if self._size == 0:
+            return 0.0
+        return self.offset_of(self._size, estimate, gap) - gap
+
+    def index_at(self, position: float, estimate: float, gap: float) -> int:
+        """Return the last index whose leading edge is at or before ``position``."""
+
+        lo, hi = 0, self._size - 1
+        if hi < 0:
+            return 0
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self.offset_of(mid, estimate, gap) <= position:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
+    def _rebuild(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._sums = [0.0] * (capacity + 1)
+        self._counts = [0] * (capacity + 1)
+        for index, extent in self._extents.items():
+            self._add(index, extent, 1)
+
+    def _add(self, index: int, delta: float, count: int) -> None:
+        j = index + 1
+        while j <= self._capacity:
+            self._sums[j] += delta
+            self._counts[j] += count
+            j += j & -j
+
+    def _prefix(self, index: int) -> Tuple[float, int]:
+        total = 0.0
+        count = 0
+        j = min(index, self._capacity)
+        while j > 0:
+            total += self._sums[j]
+            count += self._counts[j]
+            j -= j & -j
+        return total, count
+
+
+class _LazyListBody(ForEach):
+    """Scroll content that materializes only the visible window of items.
+
+    Must be hosted by a :class:`ScrollViewport` (as done by :class:`LazyColumn`
+    and :class:`LazyRow`), which supplies the scroll offset and viewport size.
+    """
+
+    def __init__(
+        self,
+        items: ItemsLike,
+        builder: BuilderFn,
+        *,
+        key: Optional[Callable[[Any, int], Any]] = None,
+        direction: ScrollDirection = ScrollDirection.VERTICAL,
+        gap: int = 0,
+        overscan: int = 2,
+        estimated_item_extent: Optional[float] = None,
+    ) -> None:
+        super().__init__(items, builder, key=key)
+        self.direction = direction
+        self._gap = max(0, int(gap))
+        self._overscan = max(0, int(overscan))
+        self._estimated_extent = float(estimated_item_extent) if estimated_item_extent is not None else None
+        self._extents = _ExtentIndex()
+        self._measured_cross: Optional[int] = None
+        self._max_cross = 0
+        self._window: List[_ForEachEntry] = []
+        self._window_range: Tuple[int, int] = (0, 0)
+        self._items_list: Optional[Sequence[Any]] = None
+        self._syncing = False
+        self._offset_unsub: Optional[Any] = None
+
+    # ---- Item source --------------------------------------------------
+    def _sequence(self) -> Sequence[Any]:
+        if self._items_list is not None:
+            return self._items_list
+        items_obj = self._resolve_items_object()
+        if hasattr(items_obj, "value"):
+            try:
+                items_obj = getattr(items_obj, "value")
+            except Exception:
+                exception_once(logger, "lazy_list_items_value_exc", "error accessing .value on items")
+                items_obj = None
+        if items_obj is None:
+            seq: Sequence[Any] = []
+        elif hasattr(items_obj, "__len__") and hasattr(items_obj, "__getitem__"):
+            # Indexed without copying; large sources are the point of a lazy list.
+            seq = cast(Sequence[Any], items_obj)
+        else:
+            # Plain iterables cannot be indexed; copy them once.
+            try:
+                seq = list(items_obj)
+            except Exception:
+                exception_once(logger, "lazy_list_items_list_exc", "error converting items to list")
+                seq = []
+        self._items_list = seq
+        return seq
+
+    @property
+    def item_count(self) -> int:
+        try:
+            return len(self._sequence())
+        except Exception:
+            exception_once(logger, "lazy_list_item_count_exc", "len(items) raised")
+            return 0
+
+    def _item_at(self, index: int) -> Any:
+        try:
+            return self._sequence()[index]
+        except Exception:
+            exception_once(logger, "lazy_list_item_at_exc", "items[index] raised")
+            return None
+
+    def _estimate(self) -> float:
+        if self._estimated_extent is not None:
+            return self._estimated_extent
+        average = self._extents.average()
+        return average if average is not None else _DEFAULT_ESTIMATED_EXTENT
+
+    # ---- Scroll state -------------------------------------------------
+    def _viewport(self) -> Any:
+        return getattr(self, "_parent", None)
+
+    def _controller(self) -> Optional[ScrollController]:
+        return getattr(self._viewport(), "controller", None)
+
+    def _scroll_window(self) -> Tuple[float, float]:
+        """Return (offset, extent) of the visible span along the main axis."""
+
+        controller = self._controller()
+        if controller is None:
+            return (0.0, 0.0)
+        offset = float(controller.get_offset(self.direction))
+        size = getattr(self._viewport(), "viewport_size", None)
+        if size is not None:
+            extent = float(size[1] if self.direction is ScrollDirection.VERTICAL else size[0])
+        else:
+            extent = float(controller.axis_viewport_size(self.direction))
+        return (max(0.0, offset), max(0.0, extent))
+
+    def _window_covers(self, offset: float, extent: float) -> bool:
+        start, end = self._window_range
+        if end <= start:
+            return False
+        estimate = self._estimate()
+        if start > 0 and self._extents.offset_of(start, estimate, self._gap) > offset:
+            return False
+        if end < self._extents.size and self._extents.offset_of(end, estimate, self._gap) < offset + extent:
+            return False
+        return True
+
+    def _on_scroll(self, _value: Any = None) -> None:
+        offset, extent = self._scroll_window()
+        if not self._window_covers(offset, extent):
+            self.mark_needs_layout()
+
+    # ---- Windowing ----------------------------------------------------
+    def _measure_entry(self, entry: _ForEachEntry, cross: Optional[int]) -> None:
+        fragment = entry.fragment
+        if fragment is None:
+            return
+        if self.direction is ScrollDirection.VERTICAL:
+            w, h = measure_preferred_size(fragment, max_width=cross)
+            main, other = h, w
+        else:
+            w, h = measure_preferred_size(fragment, max_height=cross)
+            main, other = w, h
+        self._extents.set(entry.index, max(0, int(main)))
+        self._max_cross = max(self._max_cross, int(other))
+
+    def _sync_window(self, cross: Optional[int]) -> None:
+        """Materialize and measure the items around the current scroll window."""
+
+        count = self.item_count
+        self._extents.resize(count)
+        if cross != self._measured_cross:
+            # Extents measured against another cross size are stale.
+            self._extents.clear()
+            self._measured_cross = cross
+            self._max_cross = 0
+
+        offset, extent = self._scroll_window()
+        estimate = self._estimate()
+        first = self._extents.index_at(offset, estimate, self._gap)
+        start = max(0, first - self._overscan)
+
+        managed_ctx = False
+        if self._build_ctx is None:
+            self.create_build_context()
+            managed_ctx = True
+        self._syncing = True
+        try:
+            seen: Dict[str, int] = {}
+            window: List[_ForEachEntry] = []
+            index = start
+            trailing = 0
+            while index < count and trailing <= self._overscan:
+                entry = self._materialize(index, seen)
+                if entry is not None:
+                    self._measure_entry(entry, cross)
+                    window.append(entry)
+                if self._extents.offset_of(index + 1, estimate, self._gap) >= offset + extent:
+                    trailing += 1
+                index += 1
+            self._commit_window(window)
+            self._window_range = (start, index)
+        finally:
+            self._syncing = False
+            if managed_ctx:
+                try:
+                    self._prune_unused_scopes()
+                finally:
+                    self._active_scope_ids.clear()
+                    self._build_ctx = None
+
+    def _materialize(self, index: int, seen: Dict[str, int]) -> Optional[_ForEachEntry]:
+        value = self._item_at(index)
+        label = self._key_label(value, index)
+        counter = seen.get(label, 0)
+        seen[label] = counter + 1
+        token = label if counter == 0 else f"{label}#{counter}"
+        entry = self._entries_by_token.get(token)
+        if entry is None:
+            entry = _ForEachEntry(token=token, scope_name=f"item:{token}", index=index, value=value)
+            self._entries_by_token[token] = entry
+        elif entry.fragment is not None and entry.index == index and self._values_equal(entry.value, value):
+            # Recycle: keep the fragment and its scope alive without rebuilding.
+            if entry.scope_id:
+                self._active_scope_ids.add(entry.scope_id)
+            return entry
+        entry.index = index
+        entry.value = value
+        self._ensure_fragment(entry)
+        return entry
+
+    def _commit_window(self, window: List[_ForEachEntry]) -> None:
+        keep = {entry.token for entry in window}
+        for token in [token for token in self._entries_by_token if token not in keep]:
+            self._dispose_entry(self._entries_by_token.pop(token))
+        fragments = [entry.fragment for entry in window if entry.fragment is not None]
+        present = {id(child) for child in self.children_snapshot()}
+        for fragment in fragments:
+            if id(fragment) not in present:
+                self.add_child(fragment)
+        self._window = window
+        self._ordered_entries = list(window)
+        self._provider_children = fragments
+
+    def mark_needs_layout(self) -> None:
+        # Adding/removing window fragments is part of our own layout pass.
+        if getattr(self, "_syncing", False):
+            return
+        super().mark_needs_layout()
+
+    # ---- ForEach overrides --------------------------------------------
+    def build(self) -> Widget:
+        # Items are materialized during measure/layout; keep the current
+        # window's scopes alive across re-evaluation.
+        for entry in self._window:
+            if entry.scope_id:
+                self._active_scope_ids.add(entry.scope_id)
+        return self
+
+    def provide_layout_children(self) -> List[Widget]:
+        # Lazy lists lay out their own children and are never flattened into
+        # a parent layout.
+        return []
+
+    def _handle_items_changed(self, _value: Any = None) -> None:
+        previous = self._extents.size
+        self._items_list = None
+        if self.item_count < previous:
+            # Measurements are per index; only appends keep them valid.
+            self._extents.clear()
+        for entry in self._window:
+            if entry.scope_id and entry.index < self.item_count:
+                value = self._item_at(entry.index)
+                if not self._values_equal(entry.value, value):
+                    entry.value = value
+                    self.invalidate_scope_id(entry.scope_id)
+        self.mark_needs_layout()
+
+    def _handle_items_change(self, change: ListChange) -> None:
+        # The window is rebuilt on layout anyway; the change only tells which
+        # measurements survive. Replaces and appends keep every index in place.
+        shifts = change.kind in ("remove", "move", "reset") or (
+            change.kind == "insert" and change.start < self._extents.size
+        )
+        if shifts:
+            self._extents.clear()
+        self._handle_items_changed()
+
+    def on_mount(self) -> None:
+        super().on_mount()
+        controller = self._controller()
+        if controller is None:
+            return
+        try:
+            self._offset_unsub = controller.axis_state(self.direction).offset.subscribe(self._on_scroll)
+        except Exception:
+            exception_once(logger, "lazy_list_offset_subscribe_exc", "Failed to subscribe to scroll offset")
+            self._offset_unsub = None
+
+    def on_unmount(self) -> None:
+        unsub = self._offset_unsub
+        self._offset_unsub = None
+        dispose = getattr(unsub, "dispose", None)
+        if callable(dispose):
+            try:
+                dispose()
+            except Exception:
+                exception_once(logger, "lazy_list_offset_dispose_exc", "Failed to dispose scroll subscription")
+        self._window = []
+        self._window_range = (0, 0)
+        self._items_list = None
+        super().on_unmount()
+
+    # ---- Layout / paint -----------------------------------------------
+    def preferred_size(self, max_width: Optional[int] = None, max_height: Optional[int] = None) -> Tuple[int, int]:
+        vertical = self.direction is ScrollDirection.VERTICAL
+        cross = max_width if vertical else max_height
+        self._sync_window(cross)
+        main = int(round(self._extents.total(self._estimate(), self._gap)))
+        cross_size = int(cross) if cross is not None else self._max_cross
+        return (cross_size, main) if vertical else (main, cross_size)
+
+    def layout(self, width: int, height: int) -> None:
+        self.clear_needs_layout()
+        current = self.layout_rect
+        x = int(current[0]) if current is not None else 0
+        y = int(current[1]) if current is not None else 0
+        self.set_layout_rect(x, y, width, height)
+
+        vertical = self.direction is ScrollDirection.VERTICAL
+        cross = int(width) if vertical else int(height)
+        self._sync_window(cross)
+        estimate = self._estimate()
+        for entry in self._window:
+            fragment = entry.fragment
+            if fragment is None:
+                continue
+            main = int(self._extents.get(entry.index) or 0)
+            pos = int(round(self._extents.offset_of(entry.index, estimate, self._gap)))
+            try:
+                if vertical:
+                    fragment.layout(cross, main)
+                    fragment.set_layout_rect(0, pos, cross, main)
+                else:
+                    fragment.layout(main, cross)
+                    fragment.set_layout_rect(pos, 0, main, cross)
+            except Exception:
+                exception_once(logger, "lazy_list_item_layout_exc", "Lazy list item layout raised")
+
+    def paint(self, canvas, x: int, y: int, width: int, height: int) -> None:
+        self.set_last_rect(x, y, width, height)
+        for entry in self._window:
+            fragment = entry.fragment
+            rect = fragment.layout_rect if fragment is not None else None
+            if fragment is None or rect is None:
+                continue
+            rx, ry, rw, rh = rect
+            try:
+                fragment.set_last_rect(x + rx, y + ry, rw, rh)
+                fragment.paint(canvas, x + rx, y + ry, rw, rh)
+            except Exception:
+                exception_once(logger, "lazy_list_item_paint_exc", "Lazy list item paint raised")
+
+
+class _LazyList(Scroller):
+    def __init__(
+        self,
+        items: ItemsLike,
+        builder: BuilderFn,
+        *,
+        direction: ScrollDirection,
+        key: Optional[Callable[[Any, int], Any]] = None,
+        gap: int = 0,
+        overscan: int = 2,
+        estimated_item_extent: Optional[float] = None,
+        scroll_controller: Optional[ScrollController] = None,
+        physics: ScrollPhysics | str = ScrollPhysics.CLAMP,
+        scrollbar: Optional[ScrollbarBehavior] = None,
+        scrollbar_enabled: bool = True,
+        scroll_multiplier: float = 20.0,
+        padding: Union[int, Tuple[int, int], Tuple[int, int, int, int]] = 0,
+        width: SizingLike = None,
+        height: SizingLike = None,
+    ) -> None:
+        self._body = _LazyListBody(
+            items,
+            builder,
+            key=key,
+            direction=direction,
+            gap=gap,
+            overscan=overscan,
+            estimated_item_extent=estimated_item_extent,
+        )
+        super().__init__(
+            self._body,
+            scroll_controller=scroll_controller,
+            direction=direction,
+            physics=physics,
+            scrollbar=scrollbar,
+            scrollbar_enabled=scrollbar_enabled,
+            scroll_multiplier=scroll_multiplier,
+            padding=padding,
+            width=width,
+            height=height,
+        )
+
+    @property
+    def item_count(self) -> int:
+        return self._body.item_count
+
+
+class LazyColumn(_LazyList):
+    """Vertically scrolling list that only builds the visible items.
+
+    Items are stretched to the list's width and stacked with ``gap`` pixels
+    between them. ``items`` should support ``len()`` and indexing (a list or
+    an Observable holding one); other iterables are copied into a list.
+    """
+
+    def __init__(
+        self,
+        items: ItemsLike,
+        builder: BuilderFn,
+        *,
+        key: Optional[Callable[[Any, int], Any]] = None,
+        gap: int = 0,
+        overscan: int = 2,
+        estimated_item_extent: Optional[float] = None,
+        scroll_controller: Optional[ScrollController] = None,
+        physics: ScrollPhysics | str = ScrollPhysics.CLAMP,
+        scrollbar: Optional[ScrollbarBehavior] = None,
+        scrollbar_enabled: bool = True,
+        scroll_multiplier: float = 20.0,
+        padding: Union[int, Tuple[int, int], Tuple[int, int, int, int]] = 0,
+        width: SizingLike = None,
+        height: SizingLike = None,
+    ) -> None:
+        """Initialize the LazyColumn.
+
+        Args:
+            items: Sized, indexable item source or an Observable of one.
+            builder: A function that takes (item, index) and returns a Widget.
+            key: Optional ``(item, index) -> Any`` identity used to recycle
+                item widgets across scrolls and data changes.
+            gap: Space between items in pixels.
+            overscan: Number of extra items built beyond each viewport edge.
+            estimated_item_extent: Height assumed for items not yet measured.
+                Defaults to the running average of measured items.
+            scroll_controller: External ScrollController (created if omitted).
+            physics: Scroll physics.
+            scrollbar: Scrollbar behavior configuration.
+            scrollbar_enabled: Whether to show a scrollbar.
+            scroll_multiplier: Pixels scrolled per mouse wheel step.
+            padding: Padding inside the viewport.
+            width: Width sizing.
+            height: Height sizing (stretches by default).
+        """
+        super().__init__(
+            items,
+            builder,
+            direction=ScrollDirection.VERTICAL,
+            key=key,
+            gap=gap,
+            overscan=overscan,
+            estimated_item_extent=estimated_item_extent,
+            scroll_controller=scroll_controller,
+            physics=physics,
+            scrollbar=scrollbar,
+            scrollbar_enabled=scrollbar_enabled,
+            scroll_multiplier=scroll_multiplier,
+            padding=padding,
+            width=width,
+            height=height,
+        )
+
+
+class LazyRow(_LazyList):
+    """Horizontally scrolling list that only builds the visible items.
+
+    Items are stretched to the list's height; see :class:`LazyColumn` for
+    the item source requirements.
+    """
+
+    def __init__(
+        self,
+        items: ItemsLike,
+        builder: BuilderFn,
+        *,
+        key: Optional[Callable[[Any, int], Any]] = None,
+        gap: int = 0,
+        overscan: int = 2,
+        estimated_item_extent: Optional[float] = None,
+        scroll_controller: Optional[ScrollController] = None,
+        physics: ScrollPhysics | str = ScrollPhysics.CLAMP,
+        scrollbar: Optional[ScrollbarBehavior] = None,
+        scrollbar_enabled: bool = True,
+        scroll_multiplier: float = 20.0,
+        padding: Union[int, Tuple[int, int], Tuple[int, int, int, int]] = 0,
+        width: SizingLike = None,
+        height: SizingLike = None,
+    ) -> None:
+        """Initialize the LazyRow.
+
+        Args:
+            items: Sized, indexable item source or an Observable of one.
+            builder: A function that takes (item, index) and returns a Widget.
+            key: Optional ``(item, index) -> Any`` identity used to recycle
+                item widgets across scrolls and data changes.
+            gap: Space between items in pixels.
+            overscan: Number of extra items built beyond each viewport edge.
+            estimated_item_extent: Width assumed for items not yet measured.
+                Defaults to the running average of measured items.
+            scroll_controller: External ScrollController (created if omitted).
+            physics: Scroll physics.
+            scrollbar: Scrollbar behavior configuration.
+            scrollbar_enabled: Whether to show a scrollbar.
+            scroll_multiplier: Pixels scrolled per mouse wheel step.
+            padding: Padding inside the viewport.
+            width: Width sizing (stretches by default).
+            height: Height sizing.
+        """
+        super().__init__(
+            items,
+            builder,
+            direction=ScrollDirection.HORIZONTAL,
+            key=key,
+            gap=gap,
+            overscan=overscan,
+            estimated_item_extent=estimated_item_extent,
+            scroll_controller=scroll_controller,
+            physics=physics,
+            scrollbar=scrollbar,
+            scrollbar_enabled=scrollbar_enabled,
+            scroll_multiplier=scroll_multiplier,
+            padding=padding,
+            width=width,
+            height=height,
+        )
+
+
+__all__ = ["LazyColumn", "LazyRow"]
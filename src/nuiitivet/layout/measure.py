@@ -1,6 +1,51 @@
 from __future__ import annotations
 
-from typing import Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
+
+from nuiitivet.theme import manager as theme_manager
+
+# Entries kept per widget before the cache is reset. Widgets are usually
+# measured under one or two constraint pairs per layout pass.
+_INTRINSIC_CACHE_LIMIT = 8
+
+# Bumped to invalidate every widget's cache at once. Theme changes alter
+# font metrics and paddings without marking widgets dirty.
+_CACHE_EPOCH = 0
+
+_CACHE_PROFILE_ENABLED = False
+_CACHE_STAT_KEYS = ("intrinsic_hits", "intrinsic_misses")
+_CACHE_STATS: Dict[str, int] = {key: 0 for key in _CACHE_STAT_KEYS}
+
+
+def enable_measure_cache_profiling(enabled: bool) -> None:
+    """Toggle hit/miss tracking for the intrinsic-size cache."""
+
+    global _CACHE_PROFILE_ENABLED
+    _CACHE_PROFILE_ENABLED = bool(enabled)
+
+
+def reset_measure_cache_stats() -> None:
+    for key in _CACHE_STATS:
+        _CACHE_STATS[key] = 0
+
+
+def get_measure_cache_stats() -> Dict[str, int]:
+    return dict(_CACHE_STATS)
+
+
+def clear_measure_caches() -> None:
+    """Invalidate all memoized preferred sizes."""
+
+    global _CACHE_EPOCH
+    _CACHE_EPOCH += 1
+
+
+theme_manager.subscribe(lambda _theme: clear_measure_caches())
+
+
+def _record_cache_event(event: str) -> None:
+    if _CACHE_PROFILE_ENABLED and event in _CACHE_STATS:
+        _CACHE_STATS[event] += 1
 
 
 def preferred_size(
@@ -12,6 +57,10 @@ def preferred_size(
 ) -> Tuple[int, int]:
     """Return widget's preferred size, optionally within constraints.
 
+    Results are memoized per widget, keyed by the constraints and the
+    widget's layout cache token. The cache is dropped whenever the widget
+    (or any descendant) is marked as needing layout.
+
     This function tolerates legacy implementations that still define
     preferred_size(self) with no constraint parameters.
     """
@@ -20,8 +69,20 @@ def preferred_size(
     if fn is None:
         return default
 
+    cache: Optional[Dict[Any, Tuple[int, int]]] = getattr(widget, "_intrinsic_size_cache", None)
+    if not isinstance(cache, dict):
+        cache = None
+    key = None
+    if cache is not None:
+        key = (max_width, max_height, getattr(widget, "layout_cache_token", None), _CACHE_EPOCH)
+        cached = cache.get(key)
+        if cached is not None:
+            _record_cache_event("intrinsic_hits")
+            return cached
+        _record_cache_event("intrinsic_misses")
+
     try:
-        return fn(max_width=max_width, max_height=max_height)
+        size = fn(max_width=max_width, max_height=max_height)
     except TypeError as e:
         msg = str(e)
         if "unexpected keyword argument" in msg:
@@ -32,3 +93,9 @@ def preferred_size(
         return default
     except Exception:
         return default
+
+    if cache is not None and key is not None:
+        if len(cache) >= _INTRINSIC_CACHE_LIMIT:
+            cache.clear()
+        cache[key] = size
+    return size
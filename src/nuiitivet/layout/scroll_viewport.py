@@ -54,10 +54,23 @@ class ScrollViewport(Widget):
     def content(self) -> Widget:
         return self._content
 
+    @property
+    def controller(self) -> ScrollController:
+        return self._controller
+
     @property
     def viewport_rect(self) -> Optional[Tuple[int, int, int, int]]:
         return self._viewport_rect
 
+    @property
+    def viewport_size(self) -> Optional[Tuple[int, int]]:
+        """Inner (width, height) from the current layout pass, if any.
+
+        Set before the content is measured so content widgets can size
+        themselves against the visible area.
+        """
+        return getattr(self, "_vp_size", None)
+
     def preferred_size(self, max_width: Optional[int] = None, max_height: Optional[int] = None) -> Tuple[int, int]:
         inner_max_w: Optional[int] = None
         inner_max_h: Optional[int] = None
@@ -6,8 +6,9 @@ from typing import Optional, Sequence, Tuple, Union
 
 from ..widgeting.widget import Widget
 from ..rendering.sizing import SizingLike
+from ..rendering.skia import local_clip_bounds
 from .alignment import AlignmentLike, normalize_alignment
-from .layout_utils import expand_layout_children
+from .layout_utils import expand_layout_children, is_clipped_out
 from .for_each import ForEach, ItemsLike, BuilderFn
 from .measure import preferred_size as measure_preferred_size
 
@@ -164,10 +165,14 @@ class Stack(Widget):
 
     def paint(self, canvas, x: int, y: int, width: int, height: int) -> None:
         children = expand_layout_children(self.children_snapshot())
+        clip = local_clip_bounds(canvas)
         for child in children:
             rect = child.layout_rect
             if rect is None:
                 continue
 
             rx, ry, rw, rh = rect
+            child.set_last_rect(x + rx, y + ry, rw, rh)
+            if is_clipped_out(child, clip, x + rx, y + ry, rw, rh):
+                continue
             child.paint(canvas, x + rx, y + ry, rw, rh)
@@ -229,7 +229,10 @@ def __getattr__(name: str) -> Any:
         raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
     module_name, attr_name = spec
     module = importlib.import_module(f"{__name__}.{module_name}")
-    return getattr(module, attr_name)
+    value = getattr(module, attr_name)
+    # Cache so later lookups skip __getattr__.
+    globals()[name] = value
+    return value
 
 
 def __dir__() -> list[str]:
@@ -1179,6 +1179,11 @@ class Fab(MaterialButtonBase):
             self._press_scale_y_anim.target = target[1]
         return float(self._press_scale_x_anim.value), float(self._press_scale_y_anim.value)
 
+    def paint_transforms_children(self) -> bool:
+        sx = float(self._press_scale_x_anim.value)
+        sy = float(self._press_scale_y_anim.value)
+        return abs(sx - 1.0) >= 1e-6 or abs(sy - 1.0) >= 1e-6
+
     def paint(self, canvas, x: int, y: int, width: int, height: int):
         self._sync_state_tokens()
         sx, sy = self._expressive_press_scale()
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
 import logging
 import os
 
@@ -15,6 +15,7 @@ from nuiitivet.rendering.skia import (
     make_text_blob,
     typeface_from_bytes,
     typeface_from_file,
+    get_glyph_atlas,
 )
 from nuiitivet.rendering.sizing import SizingLike, parse_sizing
 from nuiitivet.material.symbols import Symbol, Symbols
@@ -28,6 +29,17 @@ DEFAULT_ICON_PX = 24
 
 logger = logging.getLogger(__name__)
 
+# (id(typeface), name, codepoint, font candidates) -> (typeface, (typeface, text))
+_GLYPH_CHOICES: Dict[Tuple[Any, ...], Tuple[Optional[object], Tuple[Optional[object], str]]] = {}
+
+
+def _blob_has_height(blob: Any) -> bool:
+    try:
+        return blob is not None and blob.bounds().height() > 0.5
+    except Exception:
+        exception_once(logger, "icon_blob_bounds_exc", "Failed to read text blob bounds")
+        return False
+
 
 def _pixel_size_from_sizing(size: SizingLike) -> int:
     """Resolve the pixel size used for painting an icon."""
@@ -130,6 +142,7 @@ class Icon(IconBase):
 
         self._symbol = None
         self._symbol_codepoint = None
+        self._glyph_choice: Optional[Tuple[Optional[object], str]] = None
 
         if isinstance(value, Symbol):
             self._symbol = value
@@ -468,25 +481,57 @@ class Icon(IconBase):
             logger.exception("Icon get_typeface raised", exc_info=exc)
             return None
 
-    def paint(self, canvas, x: int, y: int, width: int, height: int):
-        """Paint icon with padding support (M3準拠)."""
-        # Apply padding to get content area (M3: space between UI elements)
-        cx, cy, cw, ch = self.content_rect(x, y, width, height)
+    def _load_legacy_typeface(self) -> Optional[object]:
+        """Load the first packaged fallback font file that exists."""
+        fallback_names = getattr(self, "_font_file_candidates", ("MaterialIcons-Regular.ttf",))
+        for fallback_name in fallback_names:
+            legacy_fp = self._first_available_font_file(fallback_name)
+            if not legacy_fp or not os.path.isfile(legacy_fp):
+                continue
+            try:
+                legacy_tf = typeface_from_file(legacy_fp)
+            except Exception:
+                exception_once(
+                    logger,
+                    "icon_typeface_from_file_exc",
+                    "typeface_from_file failed (file=%s)",
+                    os.path.basename(legacy_fp),
+                )
+                legacy_tf = None
+            if legacy_tf is not None:
+                return legacy_tf
+        return None
 
-        # Determine size to draw (contain behavior).
-        # Use the smaller dimension of the content area to maintain aspect ratio.
-        draw_size = min(cw, ch)
-        if draw_size <= 0:
-            return
+    def _resolve_glyph(self, draw_size: int) -> Optional[Tuple[Optional[object], str]]:
+        """Return the ``(typeface, text)`` that renders this icon.
+
+        Choosing between the ligature and the codepoint needs shaping, so the
+        choice is made once per typeface and name and shared by all icons.
+        """
+        choice = self._glyph_choice
+        if choice is not None:
+            return choice
 
-        # Use cached typeface if available, otherwise load and cache it
         tf = self._cached_typeface
         if tf is None:
             tf = self._load_typeface()
             self._cached_typeface = tf
-        # Prefer the resolved typeface. If none was found, try to load a
-        # packaged legacy MaterialIcons font before falling back to a
-        # Font constructed without an explicit typeface.
+
+        key = (id(tf), self.name, self._symbol_codepoint, self._font_file_candidates)
+        cached = _GLYPH_CHOICES.get(key)
+        if cached is not None and cached[0] is tf:
+            choice = cached[1]
+        else:
+            choice = self._choose_glyph(tf, draw_size)
+            if choice is None:
+                return None
+            # Keep the typeface alive with the entry so its id stays unique.
+            _GLYPH_CHOICES[key] = (tf, choice)
+        self._glyph_choice = choice
+        return choice
+
+    def _choose_glyph(self, tf: Optional[object], draw_size: int) -> Optional[Tuple[Optional[object], str]]:
+        font_tf = tf
         font = None
         if tf is not None:
             try:
@@ -495,112 +540,64 @@ class Icon(IconBase):
                 exception_once(logger, "icon_make_font_exc", "make_font failed for resolved typeface")
                 font = None
 
+        # If no typeface was resolved, try a packaged legacy MaterialIcons
+        # font before falling back to the default typeface.
         if font is None:
+            font_tf = self._load_legacy_typeface()
             try:
-                legacy_tf = None
-                fallback_names = getattr(self, "_font_file_candidates", ("MaterialIcons-Regular.ttf",))
-                for fallback_name in fallback_names:
-                    legacy_fp = self._first_available_font_file(fallback_name)
-                    if legacy_fp and os.path.isfile(legacy_fp):
-                        try:
-                            legacy_tf = typeface_from_file(legacy_fp)
-                        except Exception:
-                            exception_once(
-                                logger,
-                                "icon_typeface_from_file_primary_exc",
-                                "typeface_from_file failed (file=%s)",
-                                os.path.basename(legacy_fp),
-                            )
-                            legacy_tf = None
-                    if legacy_tf is not None:
-                        break
-                if legacy_tf is not None:
-                    font = make_font(legacy_tf, draw_size)
-                else:
-                    font = make_font(None, draw_size)
+                font = make_font(font_tf, draw_size)
             except Exception:
-                try:
-                    font = make_font(None, draw_size)
-                except Exception:
-                    exception_once(logger, "icon_make_font_fallback_exc", "make_font(None) failed")
-                    return
-
-        # Use ligature name as text; Material fonts may convert to glyphs.
-        try:
-            blob = make_text_blob(self.name, font)
-        except Exception:
-            exception_once(logger, "icon_make_text_blob_exc", "make_text_blob failed for icon ligature")
-            blob = None
+                exception_once(logger, "icon_make_font_fallback_exc", "make_font fallback failed")
+                return None
+            if font is None:
+                return None
 
         # If we have a mapping for this name, prefer rendering the mapped
-        # PUA codepoint with the packaged legacy MaterialIcons font when
-        # possible. This is a pragmatic default that makes common icons
-        # reliably visible across different Material font variants.
+        # PUA codepoint, with the packaged legacy font when the current one
+        # lacks it. Otherwise the ligature name is shaped by the font.
         cp = self._symbol_codepoint
         if cp:
             try:
-                # Try current typeface first
-                try:
-                    cp_blob = make_text_blob(cp, font)
-                except Exception:
-                    exception_once(logger, "icon_make_text_blob_codepoint_exc", "make_text_blob failed for codepoint")
-                    cp_blob = None
-
-                def blob_has_height(b):
-                    try:
-                        return b is not None and b.bounds().height() > 0.5
-                    except Exception:
-                        exception_once(logger, "icon_blob_bounds_exc", "Failed to read text blob bounds")
-                        return False
-
-                if blob_has_height(cp_blob):
-                    blob = cp_blob
-                else:
-                    # Try packaged legacy font
-                    try:
-                        fallback_names = getattr(self, "_font_file_candidates", ("MaterialIcons-Regular.ttf",))
-                        legacy_tf = None
-                        for fallback_name in fallback_names:
-                            legacy_fp = self._first_available_font_file(fallback_name)
-                            if legacy_fp and os.path.isfile(legacy_fp):
-                                try:
-                                    legacy_tf = typeface_from_file(legacy_fp)
-                                except Exception:
-                                    exception_once(
-                                        logger,
-                                        "icon_typeface_from_file_exc",
-                                        "typeface_from_file failed",
-                                    )
-                                    legacy_tf = None
-                            if legacy_tf is not None:
-                                break
-                        if legacy_tf is not None:
-                            legacy_font = make_font(legacy_tf, draw_size)
-                            try:
-                                legacy_blob = make_text_blob(cp, legacy_font)
-                                if blob_has_height(legacy_blob):
-                                    blob = legacy_blob
-                            except Exception:
-                                exception_once(
-                                    logger,
-                                    "icon_make_text_blob_legacy_exc",
-                                    "make_text_blob failed for legacy font",
-                                )
-                    except Exception:
-                        exception_once(
-                            logger,
-                            "icon_legacy_font_fallback_exc",
-                            "Icon legacy font fallback failed",
-                        )
+                if _blob_has_height(make_text_blob(cp, font)):
+                    return (font_tf, cp)
+                legacy_tf = self._load_legacy_typeface()
+                if legacy_tf is not None:
+                    legacy_font = make_font(legacy_tf, draw_size)
+                    if _blob_has_height(make_text_blob(cp, legacy_font)):
+                        return (legacy_tf, cp)
             except Exception:
-                # if still no blob, leave as-is (no-op)
-                exception_once(logger, "icon_paint_codepoint_exc", "Icon paint failed")
-        if blob is None:
+                exception_once(logger, "icon_paint_codepoint_exc", "Icon codepoint resolution failed")
+        return (font_tf, self.name)
+
+    def paint(self, canvas, x: int, y: int, width: int, height: int):
+        """Paint icon with padding support (M3準拠)."""
+        # Apply padding to get content area (M3: space between UI elements)
+        cx, cy, cw, ch = self.content_rect(x, y, width, height)
+
+        # Determine size to draw (contain behavior).
+        # Use the smaller dimension of the content area to maintain aspect ratio.
+        draw_size = min(cw, ch)
+        if draw_size <= 0:
+            return
+
+        choice = self._resolve_glyph(draw_size)
+        if choice is None:
             return
+        typeface, text = choice
 
-        # Use IconBase to draw the blob
         from nuiitivet.theme.manager import manager
 
         color = self.style.color
         resolved_color = resolve_color_to_rgba(color, theme=manager.current)
+
+        # Rasterized once per (typeface, text, size, scale) and blitted after.
+        atlas = get_glyph_atlas()
+        if atlas is not None and atlas.draw(canvas, typeface, text, draw_size, resolved_color, cx, cy, cw, ch):
+            return
+
+        try:
+            blob = make_text_blob(text, make_font(typeface, draw_size))
+        except Exception:
+            exception_once(logger, "icon_make_text_blob_exc", "make_text_blob failed for icon glyph")
+            return
         self.draw_blob(canvas, blob, resolved_color, x, y, width, height)
@@ -9,7 +9,7 @@ from nuiitivet.animation import Animatable, LinearMotion
 from nuiitivet.observable import ObservableProtocol, runtime
 from nuiitivet.rendering.padding import parse_padding
 from nuiitivet.rendering.sizing import SizingLike
-from nuiitivet.rendering.skia import draw_round_rect, make_paint, make_rect
+from nuiitivet.rendering.skia import draw_round_rect, make_rect, shared_paint
 from nuiitivet.theme.manager import manager as theme_manager
 from nuiitivet.theme.resolver import resolve_color_to_rgba
 from nuiitivet.widgeting.widget import Widget
@@ -547,8 +547,8 @@ class LinearProgressIndicator(_DeterminateProgressBase):
             return
 
         active_rgba, track_rgba, stop_rgba = self._resolve_colors()
-        active_paint = make_paint(color=active_rgba, style="fill", aa=True)
-        track_paint = make_paint(color=track_rgba, style="fill", aa=True)
+        active_paint = shared_paint(color=active_rgba, style="fill", aa=True)
+        track_paint = shared_paint(color=track_rgba, style="fill", aa=True)
 
         progress_x = float(content_x) + (float(content_w) * self.value)
         gap = 0.0
@@ -583,7 +583,7 @@ class LinearProgressIndicator(_DeterminateProgressBase):
         )
         stop_y = track_y + (thickness / 2.0)
 
-        stop_paint = make_paint(color=stop_rgba, style="fill", aa=True)
+        stop_paint = shared_paint(color=stop_rgba, style="fill", aa=True)
         if stop_paint is None:
             return
 
@@ -686,7 +686,7 @@ class IndeterminateLinearProgressIndicator(_IndeterminateProgressBase):
 
         active_rgba, track_rgba = self._resolve_colors()
 
-        track_paint = make_paint(color=track_rgba, style="fill", aa=True)
+        track_paint = shared_paint(color=track_rgba, style="fill", aa=True)
         if track_paint is not None:
             draw_round_rect(canvas, rect_track, radius, track_paint)
 
@@ -699,7 +699,7 @@ class IndeterminateLinearProgressIndicator(_IndeterminateProgressBase):
         time_ms = phase * _LINEAR_ANIMATION_DURATION_MS
         first_head, first_tail, second_head, second_tail = _linear_indeterminate_segment_fractions(time_ms)
 
-        active_paint = make_paint(color=active_rgba, style="fill", aa=True)
+        active_paint = shared_paint(color=active_rgba, style="fill", aa=True)
         if active_paint is None:
             return
 
@@ -797,8 +797,10 @@ class CircularProgressIndicator(_DeterminateProgressBase):
         track_active_space = max(0.0, float(style.track_active_space))
 
         active_rgba, track_rgba = self._resolve_colors()
-        active_paint = make_paint(color=active_rgba, style="stroke", stroke_width=stroke_w, aa=True, stroke_cap="round")
-        track_paint = make_paint(color=track_rgba, style="stroke", stroke_width=stroke_w, aa=True, stroke_cap="round")
+        active_paint = shared_paint(
+            color=active_rgba, style="stroke", stroke_width=stroke_w, aa=True, stroke_cap="round"
+        )
+        track_paint = shared_paint(color=track_rgba, style="stroke", stroke_width=stroke_w, aa=True, stroke_cap="round")
         if active_paint is None and track_paint is None:
             return
 
@@ -927,8 +929,10 @@ class IndeterminateCircularProgressIndicator(_IndeterminateProgressBase):
 
         active_rgba, track_rgba = self._resolve_colors()
 
-        active_paint = make_paint(color=active_rgba, style="stroke", stroke_width=stroke_w, aa=True, stroke_cap="round")
-        track_paint = make_paint(color=track_rgba, style="stroke", stroke_width=stroke_w, aa=True, stroke_cap="round")
+        active_paint = shared_paint(
+            color=active_rgba, style="stroke", stroke_width=stroke_w, aa=True, stroke_cap="round"
+        )
+        track_paint = shared_paint(color=track_rgba, style="stroke", stroke_width=stroke_w, aa=True, stroke_cap="round")
         if active_paint is None and track_paint is None:
             return
 
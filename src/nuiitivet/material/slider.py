@@ -319,7 +319,7 @@ class _SliderBase(InteractiveWidget):
         try:
             from nuiitivet.material.theme.color_role import ColorRole
             from nuiitivet.material.theme.theme_data import MaterialThemeData
-            from nuiitivet.rendering.skia import draw_oval, draw_round_rect, make_paint, make_rect, skcolor
+            from nuiitivet.rendering.skia import draw_oval, draw_round_rect, make_rect, shared_paint, skcolor
             from nuiitivet.theme import manager as theme_manager
 
             self.set_last_rect(x, y, width, height)
@@ -425,11 +425,11 @@ class _SliderBase(InteractiveWidget):
                 is_active = a_s_ax - 1e-6 <= mid <= a_e_ax + 1e-6
                 if is_active:
                     seg_alpha = style.disabled_active_track_alpha if self.disabled else 1.0
-                    seg_paint = make_paint(color=skcolor(active_track_hex, seg_alpha), style="fill", aa=True)
+                    seg_paint = shared_paint(color=skcolor(active_track_hex, seg_alpha), style="fill", aa=True)
                     seg_radius = active_radius
                 else:
                     seg_alpha = style.disabled_inactive_track_alpha if self.disabled else 1.0
-                    seg_paint = make_paint(color=skcolor(inactive_track_hex, seg_alpha), style="fill", aa=True)
+                    seg_paint = shared_paint(color=skcolor(inactive_track_hex, seg_alpha), style="fill", aa=True)
                     seg_radius = inactive_radius
 
                 # Per-corner radii: only apply radius on edges at track ends.
@@ -491,7 +491,7 @@ class _SliderBase(InteractiveWidget):
                     continue
                 color = active_stop_hex if active_start <= stop_ratio <= active_end else inactive_stop_hex
                 stop_alpha = style.disabled_inactive_track_alpha if self.disabled else 1.0
-                stop_paint = make_paint(color=skcolor(color, stop_alpha), style="fill", aa=True)
+                stop_paint = shared_paint(color=skcolor(color, stop_alpha), style="fill", aa=True)
                 if stop_paint is not None:
                     draw_oval(canvas, stop_rect, stop_paint)
 
@@ -511,7 +511,7 @@ class _SliderBase(InteractiveWidget):
                     layer_rect = make_rect(cx - handle_w / 2.0, cy - handle_h / 2.0, handle_w, handle_h)
                     if layer_rect is not None:
                         layer_color = roles.get(ColorRole.PRIMARY, "#000000")
-                        layer_paint = make_paint(color=skcolor(layer_color, layer_alpha), style="fill", aa=True)
+                        layer_paint = shared_paint(color=skcolor(layer_color, layer_alpha), style="fill", aa=True)
                         if layer_paint is not None:
                             draw_round_rect(canvas, layer_rect, min(handle_w, handle_h) / 2.0, layer_paint)
 
@@ -520,7 +520,7 @@ class _SliderBase(InteractiveWidget):
                     if handle_rect is None:
                         continue
                     handle_alpha = style.disabled_handle_alpha if self.disabled else 1.0
-                    handle_paint = make_paint(color=skcolor(handle_hex, handle_alpha), style="fill", aa=True)
+                    handle_paint = shared_paint(color=skcolor(handle_hex, handle_alpha), style="fill", aa=True)
                     if handle_paint is not None:
                         draw_round_rect(canvas, handle_rect, min(handle_w, handle_h) / 2.0, handle_paint)
 
@@ -535,7 +535,7 @@ class _SliderBase(InteractiveWidget):
                     focus_rect = make_rect(cx - f_w / 2.0, cy - f_h / 2.0, f_w, f_h)
                     if focus_rect is not None:
                         focus_color = roles.get(ColorRole.PRIMARY, "#000000")
-                        focus_paint = make_paint(
+                        focus_paint = shared_paint(
                             color=skcolor(focus_color, style.focus_alpha),
                             style="stroke",
                             stroke_width=focus_stroke,
@@ -560,10 +560,10 @@ class _SliderBase(InteractiveWidget):
             draw_round_rect,
             get_typeface,
             make_font,
-            make_paint,
             make_rect,
             make_text_blob,
             measure_text_ink_bounds,
+            shared_paint,
             skcolor,
         )
         from nuiitivet.theme import manager as theme_manager
@@ -591,7 +591,7 @@ class _SliderBase(InteractiveWidget):
         if bubble_rect is None:
             return
 
-        bubble_paint = make_paint(color=skcolor(bg_hex, 1.0), style="fill", aa=True)
+        bubble_paint = shared_paint(color=skcolor(bg_hex, 1.0), style="fill", aa=True)
         if bubble_paint is None:
             return
 
@@ -618,7 +618,7 @@ class _SliderBase(InteractiveWidget):
         tx = bx + (bubble_w - ink_w) / 2.0 - float(ink_left)
         ty = by + (bubble_h - ink_h) / 2.0 - float(ink_top)
 
-        text_paint = make_paint(color=skcolor(text_hex, 1.0), style="fill", aa=True)
+        text_paint = shared_paint(color=skcolor(text_hex, 1.0), style="fill", aa=True)
         if text_paint is None:
             return
 
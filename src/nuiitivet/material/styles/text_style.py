@@ -23,6 +23,7 @@ class TextStyle:
     - Default color: ON_SURFACE
     - Default alignment: left
     - Default overflow: visible
+    - Default max_lines: 1 (single line)
     """
 
     # Typography
@@ -35,6 +36,8 @@ class TextStyle:
     # Layout
     text_alignment: Literal["start", "center", "end"] = "start"
     overflow: Literal["visible", "clip", "ellipsis"] = "visible"
+    # 1 keeps a single line; greater values or None wrap to the width.
+    max_lines: int | None = 1
 
     def copy_with(self, **changes) -> "TextStyle":
         """Create a new style instance with specified fields changed.
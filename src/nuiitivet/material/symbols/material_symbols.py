@@ -1,13 +1,29 @@
+"""Material Symbols constants backed by a lazily loaded codepoint table.
+
+``Symbols.home`` style access resolves through the metaclass: the first
+lookup loads the bundled ``.codepoints`` table into a sorted name tuple and
+a packed codepoint array, and each :class:`Symbol` is created on demand and
+cached on the class. The per-symbol annotations for type checkers and
+editors live in the generated ``material_symbols.pyi`` stub.
+"""
 
 from __future__ import annotations
 
+import keyword
+import os
+import threading
+from array import array
+from bisect import bisect_left
 from dataclasses import dataclass
-from typing import ClassVar, Dict
+from typing import Dict, List, Optional, Tuple
+
+CODEPOINTS_FILE = "MaterialSymbolsOutlined[FILL,GRAD,opsz,wght].codepoints"
 
 
 @dataclass(frozen=True)
 class Symbol:
     """Material symbol descriptor."""
+
     name: str
     codepoint: str
 
@@ -18,4142 +34,96 @@ class Symbol:
         return self.codepoint
 
 
-class Symbols:
-    """Material Symbols constants (auto-generated)."""
-    _10k: Symbol = Symbol(name="10k", codepoint="\uE951")
-    _10mp: Symbol = Symbol(name="10mp", codepoint="\uE952")
-    _11mp: Symbol = Symbol(name="11mp", codepoint="\uE953")
-    _123: Symbol = Symbol(name="123", codepoint="\uEB8D")
-    _12mp: Symbol = Symbol(name="12mp", codepoint="\uE954")
-    _13mp: Symbol = Symbol(name="13mp", codepoint="\uE955")
-    _14mp: Symbol = Symbol(name="14mp", codepoint="\uE956")
-    _15mp: Symbol = Symbol(name="15mp", codepoint="\uE957")
-    _16mp: Symbol = Symbol(name="16mp", codepoint="\uE958")
-    _17mp: Symbol = Symbol(name="17mp", codepoint="\uE959")
-    _18_up_rating: Symbol = Symbol(name="18_up_rating", codepoint="\uF8FD")
-    _18mp: Symbol = Symbol(name="18mp", codepoint="\uE95A")
-    _19mp: Symbol = Symbol(name="19mp", codepoint="\uE95B")
-    _1k: Symbol = Symbol(name="1k", codepoint="\uE95C")
-    _1k_plus: Symbol = Symbol(name="1k_plus", codepoint="\uE95D")
-    _1x_mobiledata: Symbol = Symbol(name="1x_mobiledata", codepoint="\uEFCD")
-    _1x_mobiledata_badge: Symbol = Symbol(name="1x_mobiledata_badge", codepoint="\uF7F1")
-    _20mp: Symbol = Symbol(name="20mp", codepoint="\uE95E")
-    _21mp: Symbol = Symbol(name="21mp", codepoint="\uE95F")
-    _22mp: Symbol = Symbol(name="22mp", codepoint="\uE960")
-    _23mp: Symbol = Symbol(name="23mp", codepoint="\uE961")
-    _24fps_select: Symbol = Symbol(name="24fps_select", codepoint="\uF3F2")
-    _24mp: Symbol = Symbol(name="24mp", codepoint="\uE962")
-    _2d: Symbol = Symbol(name="2d", codepoint="\uEF37")
-    _2k: Symbol = Symbol(name="2k", codepoint="\uE963")
-    _2k_plus: Symbol = Symbol(name="2k_plus", codepoint="\uE964")
-    _2mp: Symbol = Symbol(name="2mp", codepoint="\uE965")
-    _30fps: Symbol = Symbol(name="30fps", codepoint="\uEFCE")
-    _30fps_select: Symbol = Symbol(name="30fps_select", codepoint="\uEFCF")
-    _360: Symbol = Symbol(name="360", codepoint="\uE577")
-    _3d: Symbol = Symbol(name="3d", codepoint="\uED38")
-    _3d_rotation: Symbol = Symbol(name="3d_rotation", codepoint="\uE84D")
-    _3g_mobiledata: Symbol = Symbol(name="3g_mobiledata", codepoint="\uEFD0")
-    _3g_mobiledata_badge: Symbol = Symbol(name="3g_mobiledata_badge", codepoint="\uF7F0")
-    _3k: Symbol = Symbol(name="3k", codepoint="\uE966")
-    _3k_plus: Symbol = Symbol(name="3k_plus", codepoint="\uE967")
-    _3mp: Symbol = Symbol(name="3mp", codepoint="\uE968")
-    _3p: Symbol = Symbol(name="3p", codepoint="\uEFD1")
-    _4g_mobiledata: Symbol = Symbol(name="4g_mobiledata", codepoint="\uEFD2")
-    _4g_mobiledata_badge: Symbol = Symbol(name="4g_mobiledata_badge", codepoint="\uF7EF")
-    _4g_plus_mobiledata: Symbol = Symbol(name="4g_plus_mobiledata", codepoint="\uEFD3")
-    _4k: Symbol = Symbol(name="4k", codepoint="\uE072")
-    _4k_plus: Symbol = Symbol(name="4k_plus", codepoint="\uE969")
-    _4mp: Symbol = Symbol(name="4mp", codepoint="\uE96A")
-    _50mp: Symbol = Symbol(name="50mp", codepoint="\uF6F3")
-    _5g: Symbol = Symbol(name="5g", codepoint="\uEF38")
-    _5g_mobiledata_badge: Symbol = Symbol(name="5g_mobiledata_badge", codepoint="\uF7EE")
-    _5k: Symbol = Symbol(name="5k", codepoint="\uE96B")
-    _5k_plus: Symbol = Symbol(name="5k_plus", codepoint="\uE96C")
-    _5mp: Symbol = Symbol(name="5mp", codepoint="\uE96D")
-    _60fps: Symbol = Symbol(name="60fps", codepoint="\uEFD4")
-    _60fps_select: Symbol = Symbol(name="60fps_select", codepoint="\uEFD5")
-    _6_ft_apart: Symbol = Symbol(name="6_ft_apart", codepoint="\uF21E")
-    _6k: Symbol = Symbol(name="6k", codepoint="\uE96E")
-    _6k_plus: Symbol = Symbol(name="6k_plus", codepoint="\uE96F")
-    _6mp: Symbol = Symbol(name="6mp", codepoint="\uE970")
-    _7k: Symbol = Symbol(name="7k", codepoint="\uE971")
-    _7k_plus: Symbol = Symbol(name="7k_plus", codepoint="\uE972")
-    _7mp: Symbol = Symbol(name="7mp", codepoint="\uE973")
-    _8k: Symbol = Symbol(name="8k", codepoint="\uE974")
-    _8k_plus: Symbol = Symbol(name="8k_plus", codepoint="\uE975")
-    _8mp: Symbol = Symbol(name="8mp", codepoint="\uE976")
-    _9k: Symbol = Symbol(name="9k", codepoint="\uE977")
-    _9k_plus: Symbol = Symbol(name="9k_plus", codepoint="\uE978")
-    _9mp: Symbol = Symbol(name="9mp", codepoint="\uE979")
-    abc: Symbol = Symbol(name="abc", codepoint="\uEB94")
-    ac_unit: Symbol = Symbol(name="ac_unit", codepoint="\uEB3B")
-    access_alarm: Symbol = Symbol(name="access_alarm", codepoint="\uE855")
-    access_alarms: Symbol = Symbol(name="access_alarms", codepoint="\uE855")
-    access_time: Symbol = Symbol(name="access_time", codepoint="\uEFD6")
-    access_time_filled: Symbol = Symbol(name="access_time_filled", codepoint="\uEFD6")
-    accessibility: Symbol = Symbol(name="accessibility", codepoint="\uE84E")
-    accessibility_new: Symbol = Symbol(name="accessibility_new", codepoint="\uE92C")
-    accessible: Symbol = Symbol(name="accessible", codepoint="\uE914")
-    accessible_forward: Symbol = Symbol(name="accessible_forward", codepoint="\uE934")
-    accessible_menu: Symbol = Symbol(name="accessible_menu", codepoint="\uF34E")
-    account_balance: Symbol = Symbol(name="account_balance", codepoint="\uE84F")
-    account_balance_wallet: Symbol = Symbol(name="account_balance_wallet", codepoint="\uE850")
-    account_box: Symbol = Symbol(name="account_box", codepoint="\uE851")
-    account_child: Symbol = Symbol(name="account_child", codepoint="\uE852")
-    account_child_invert: Symbol = Symbol(name="account_child_invert", codepoint="\uE659")
-    account_circle: Symbol = Symbol(name="account_circle", codepoint="\uF20B")
-    account_circle_filled: Symbol = Symbol(name="account_circle_filled", codepoint="\uF20B")
-    account_circle_off: Symbol = Symbol(name="account_circle_off", codepoint="\uF7B3")
-    account_tree: Symbol = Symbol(name="account_tree", codepoint="\uE97A")
-    action_key: Symbol = Symbol(name="action_key", codepoint="\uF502")
-    activity_zone: Symbol = Symbol(name="activity_zone", codepoint="\uE1E6")
-    acupuncture: Symbol = Symbol(name="acupuncture", codepoint="\uF2C4")
-    acute: Symbol = Symbol(name="acute", codepoint="\uE4CB")
-    ad: Symbol = Symbol(name="ad", codepoint="\uE65A")
-    ad_group: Symbol = Symbol(name="ad_group", codepoint="\uE65B")
-    ad_group_off: Symbol = Symbol(name="ad_group_off", codepoint="\uEAE5")
-    ad_off: Symbol = Symbol(name="ad_off", codepoint="\uF7B2")
-    ad_units: Symbol = Symbol(name="ad_units", codepoint="\uF2EB")
-    adaptive_audio_mic: Symbol = Symbol(name="adaptive_audio_mic", codepoint="\uF4CC")
-    adaptive_audio_mic_off: Symbol = Symbol(name="adaptive_audio_mic_off", codepoint="\uF4CB")
-    adb: Symbol = Symbol(name="adb", codepoint="\uE60E")
-    add: Symbol = Symbol(name="add", codepoint="\uE145")
-    add_2: Symbol = Symbol(name="add_2", codepoint="\uF3DD")
-    add_a_photo: Symbol = Symbol(name="add_a_photo", codepoint="\uE439")
-    add_ad: Symbol = Symbol(name="add_ad", codepoint="\uE72A")
-    add_alarm: Symbol = Symbol(name="add_alarm", codepoint="\uE856")
-    add_alert: Symbol = Symbol(name="add_alert", codepoint="\uE003")
-    add_box: Symbol = Symbol(name="add_box", codepoint="\uE146")
-    add_business: Symbol = Symbol(name="add_business", codepoint="\uE729")
-    add_call: Symbol = Symbol(name="add_call", codepoint="\uF0B7")
-    add_card: Symbol = Symbol(name="add_card", codepoint="\uEB86")
-    add_chart: Symbol = Symbol(name="add_chart", codepoint="\uEF3C")
-    add_circle: Symbol = Symbol(name="add_circle", codepoint="\uE3BA")
-    add_circle_outline: Symbol = Symbol(name="add_circle_outline", codepoint="\uE3BA")
-    add_column_left: Symbol = Symbol(name="add_column_left", codepoint="\uF425")
-    add_column_right: Symbol = Symbol(name="add_column_right", codepoint="\uF424")
-    add_comment: Symbol = Symbol(name="add_comment", codepoint="\uE266")
-    add_diamond: Symbol = Symbol(name="add_diamond", codepoint="\uF49C")
-    add_home: Symbol = Symbol(name="add_home", codepoint="\uF8EB")
-    add_home_work: Symbol = Symbol(name="add_home_work", codepoint="\uF8ED")
-    add_ic_call: Symbol = Symbol(name="add_ic_call", codepoint="\uF0B7")
-    add_link: Symbol = Symbol(name="add_link", codepoint="\uE178")
-    add_location: Symbol = Symbol(name="add_location", codepoint="\uE567")
-    add_location_alt: Symbol = Symbol(name="add_location_alt", codepoint="\uEF3A")
-    add_moderator: Symbol = Symbol(name="add_moderator", codepoint="\uE97D")
-    add_notes: Symbol = Symbol(name="add_notes", codepoint="\uE091")
-    add_photo_alternate: Symbol = Symbol(name="add_photo_alternate", codepoint="\uE43E")
-    add_reaction: Symbol = Symbol(name="add_reaction", codepoint="\uE1D3")
-    add_road: Symbol = Symbol(name="add_road", codepoint="\uEF3B")
-    add_row_above: Symbol = Symbol(name="add_row_above", codepoint="\uF423")
-    add_row_below: Symbol = Symbol(name="add_row_below", codepoint="\uF422")
-    add_shopping_cart: Symbol = Symbol(name="add_shopping_cart", codepoint="\uE854")
-    add_task: Symbol = Symbol(name="add_task", codepoint="\uF23A")
-    add_to_drive: Symbol = Symbol(name="add_to_drive", codepoint="\uE65C")
-    add_to_home_screen: Symbol = Symbol(name="add_to_home_screen", codepoint="\uF2B9")
-    add_to_photos: Symbol = Symbol(name="add_to_photos", codepoint="\uE39D")
-    add_to_queue: Symbol = Symbol(name="add_to_queue", codepoint="\uE05C")
-    add_triangle: Symbol = Symbol(name="add_triangle", codepoint="\uF48E")
-    addchart: Symbol = Symbol(name="addchart", codepoint="\uEF3C")
-    adf_scanner: Symbol = Symbol(name="adf_scanner", codepoint="\uEADA")
-    adjust: Symbol = Symbol(name="adjust", codepoint="\uE39E")
-    admin_meds: Symbol = Symbol(name="admin_meds", codepoint="\uE48D")
-    admin_panel_settings: Symbol = Symbol(name="admin_panel_settings", codepoint="\uEF3D")
-    ads_click: Symbol = Symbol(name="ads_click", codepoint="\uE762")
-    agender: Symbol = Symbol(name="agender", codepoint="\uF888")
-    agriculture: Symbol = Symbol(name="agriculture", codepoint="\uEA79")
-    air: Symbol = Symbol(name="air", codepoint="\uEFD8")
-    air_freshener: Symbol = Symbol(name="air_freshener", codepoint="\uE2CA")
-    air_purifier: Symbol = Symbol(name="air_purifier", codepoint="\uE97E")
-    air_purifier_gen: Symbol = Symbol(name="air_purifier_gen", codepoint="\uE829")
-    airline_seat_flat: Symbol = Symbol(name="airline_seat_flat", codepoint="\uE630")
-    airline_seat_flat_angled: Symbol = Symbol(name="airline_seat_flat_angled", codepoint="\uE631")
-    airline_seat_individual_suite: Symbol = Symbol(name="airline_seat_individual_suite", codepoint="\uE632")
-    airline_seat_legroom_extra: Symbol = Symbol(name="airline_seat_legroom_extra", codepoint="\uE633")
-    airline_seat_legroom_normal: Symbol = Symbol(name="airline_seat_legroom_normal", codepoint="\uE634")
-    airline_seat_legroom_reduced: Symbol = Symbol(name="airline_seat_legroom_reduced", codepoint="\uE635")
-    airline_seat_recline_extra: Symbol = Symbol(name="airline_seat_recline_extra", codepoint="\uE636")
-    airline_seat_recline_normal: Symbol = Symbol(name="airline_seat_recline_normal", codepoint="\uE637")
-    airline_stops: Symbol = Symbol(name="airline_stops", codepoint="\uE7D0")
-    airlines: Symbol = Symbol(name="airlines", codepoint="\uE7CA")
-    airplane_ticket: Symbol = Symbol(name="airplane_ticket", codepoint="\uEFD9")
-    airplanemode_active: Symbol = Symbol(name="airplanemode_active", codepoint="\uE53D")
-    airplanemode_inactive: Symbol = Symbol(name="airplanemode_inactive", codepoint="\uE194")
-    airplay: Symbol = Symbol(name="airplay", codepoint="\uE055")
-    airport_shuttle: Symbol = Symbol(name="airport_shuttle", codepoint="\uEB3C")
-    airware: Symbol = Symbol(name="airware", codepoint="\uF154")
-    airwave: Symbol = Symbol(name="airwave", codepoint="\uF154")
-    alarm: Symbol = Symbol(name="alarm", codepoint="\uE855")
-    alarm_add: Symbol = Symbol(name="alarm_add", codepoint="\uE856")
-    alarm_off: Symbol = Symbol(name="alarm_off", codepoint="\uE857")
-    alarm_on: Symbol = Symbol(name="alarm_on", codepoint="\uE858")
-    alarm_pause: Symbol = Symbol(name="alarm_pause", codepoint="\uF35B")
-    alarm_smart_wake: Symbol = Symbol(name="alarm_smart_wake", codepoint="\uF6B0")
-    album: Symbol = Symbol(name="album", codepoint="\uE019")
-    align_center: Symbol = Symbol(name="align_center", codepoint="\uE356")
-    align_end: Symbol = Symbol(name="align_end", codepoint="\uF797")
-    align_flex_center: Symbol = Symbol(name="align_flex_center", codepoint="\uF796")
-    align_flex_end: Symbol = Symbol(name="align_flex_end", codepoint="\uF795")
-    align_flex_start: Symbol = Symbol(name="align_flex_start", codepoint="\uF794")
-    align_horizontal_center: Symbol = Symbol(name="align_horizontal_center", codepoint="\uE00F")
-    align_horizontal_left: Symbol = Symbol(name="align_horizontal_left", codepoint="\uE00D")
-    align_horizontal_right: Symbol = Symbol(name="align_horizontal_right", codepoint="\uE010")
-    align_items_stretch: Symbol = Symbol(name="align_items_stretch", codepoint="\uF793")
-    align_justify_center: Symbol = Symbol(name="align_justify_center", codepoint="\uF792")
-    align_justify_flex_end: Symbol = Symbol(name="align_justify_flex_end", codepoint="\uF791")
-    align_justify_flex_start: Symbol = Symbol(name="align_justify_flex_start", codepoint="\uF790")
-    align_justify_space_around: Symbol = Symbol(name="align_justify_space_around", codepoint="\uF78F")
-    align_justify_space_between: Symbol = Symbol(name="align_justify_space_between", codepoint="\uF78E")
-    align_justify_space_even: Symbol = Symbol(name="align_justify_space_even", codepoint="\uF78D")
-    align_justify_stretch: Symbol = Symbol(name="align_justify_stretch", codepoint="\uF78C")
-    align_self_stretch: Symbol = Symbol(name="align_self_stretch", codepoint="\uF78B")
-    align_space_around: Symbol = Symbol(name="align_space_around", codepoint="\uF78A")
-    align_space_between: Symbol = Symbol(name="align_space_between", codepoint="\uF789")
-    align_space_even: Symbol = Symbol(name="align_space_even", codepoint="\uF788")
-    align_start: Symbol = Symbol(name="align_start", codepoint="\uF787")
-    align_stretch: Symbol = Symbol(name="align_stretch", codepoint="\uF786")
-    align_vertical_bottom: Symbol = Symbol(name="align_vertical_bottom", codepoint="\uE015")
-    align_vertical_center: Symbol = Symbol(name="align_vertical_center", codepoint="\uE011")
-    align_vertical_top: Symbol = Symbol(name="align_vertical_top", codepoint="\uE00C")
-    all_inbox: Symbol = Symbol(name="all_inbox", codepoint="\uE97F")
-    all_inclusive: Symbol = Symbol(name="all_inclusive", codepoint="\uEB3D")
-    all_match: Symbol = Symbol(name="all_match", codepoint="\uE093")
-    all_out: Symbol = Symbol(name="all_out", codepoint="\uE90B")
-    allergies: Symbol = Symbol(name="allergies", codepoint="\uE094")
-    allergy: Symbol = Symbol(name="allergy", codepoint="\uE64E")
-    alt_route: Symbol = Symbol(name="alt_route", codepoint="\uF184")
-    alternate_email: Symbol = Symbol(name="alternate_email", codepoint="\uE0E6")
-    altitude: Symbol = Symbol(name="altitude", codepoint="\uF873")
-    ambient_screen: Symbol = Symbol(name="ambient_screen", codepoint="\uF6C4")
-    ambulance: Symbol = Symbol(name="ambulance", codepoint="\uF803")
-    amend: Symbol = Symbol(name="amend", codepoint="\uF802")
-    amp_stories: Symbol = Symbol(name="amp_stories", codepoint="\uEA13")
-    analytics: Symbol = Symbol(name="analytics", codepoint="\uEF3E")
-    anchor: Symbol = Symbol(name="anchor", codepoint="\uF1CD")
-    android: Symbol = Symbol(name="android", codepoint="\uE859")
-    android_cell_4_bar: Symbol = Symbol(name="android_cell_4_bar", codepoint="\uEF06")
-    android_cell_4_bar_alert: Symbol = Symbol(name="android_cell_4_bar_alert", codepoint="\uEF09")
-    android_cell_4_bar_off: Symbol = Symbol(name="android_cell_4_bar_off", codepoint="\uEF08")
-    android_cell_4_bar_plus: Symbol = Symbol(name="android_cell_4_bar_plus", codepoint="\uEF07")
-    android_cell_5_bar: Symbol = Symbol(name="android_cell_5_bar", codepoint="\uEF02")
-    android_cell_5_bar_alert: Symbol = Symbol(name="android_cell_5_bar_alert", codepoint="\uEF05")
-    android_cell_5_bar_off: Symbol = Symbol(name="android_cell_5_bar_off", codepoint="\uEF04")
-    android_cell_5_bar_plus: Symbol = Symbol(name="android_cell_5_bar_plus", codepoint="\uEF03")
-    android_cell_dual_4_bar: Symbol = Symbol(name="android_cell_dual_4_bar", codepoint="\uEF0D")
-    android_cell_dual_4_bar_alert: Symbol = Symbol(name="android_cell_dual_4_bar_alert", codepoint="\uEF0F")
-    android_cell_dual_4_bar_plus: Symbol = Symbol(name="android_cell_dual_4_bar_plus", codepoint="\uEF0E")
-    android_cell_dual_5_bar: Symbol = Symbol(name="android_cell_dual_5_bar", codepoint="\uEF0A")
-    android_cell_dual_5_bar_alert: Symbol = Symbol(name="android_cell_dual_5_bar_alert", codepoint="\uEF0C")
-    android_cell_dual_5_bar_plus: Symbol = Symbol(name="android_cell_dual_5_bar_plus", codepoint="\uEF0B")
-    android_wifi_3_bar: Symbol = Symbol(name="android_wifi_3_bar", codepoint="\uEF16")
-    android_wifi_3_bar_alert: Symbol = Symbol(name="android_wifi_3_bar_alert", codepoint="\uEF1B")
-    android_wifi_3_bar_lock: Symbol = Symbol(name="android_wifi_3_bar_lock", codepoint="\uEF1A")
-    android_wifi_3_bar_off: Symbol = Symbol(name="android_wifi_3_bar_off", codepoint="\uEF19")
-    android_wifi_3_bar_plus: Symbol = Symbol(name="android_wifi_3_bar_plus", codepoint="\uEF18")
-    android_wifi_3_bar_question: Symbol = Symbol(name="android_wifi_3_bar_question", codepoint="\uEF17")
-    android_wifi_4_bar: Symbol = Symbol(name="android_wifi_4_bar", codepoint="\uEF10")
-    android_wifi_4_bar_alert: Symbol = Symbol(name="android_wifi_4_bar_alert", codepoint="\uEF15")
-    android_wifi_4_bar_lock: Symbol = Symbol(name="android_wifi_4_bar_lock", codepoint="\uEF14")
-    android_wifi_4_bar_off: Symbol = Symbol(name="android_wifi_4_bar_off", codepoint="\uEF13")
-    android_wifi_4_bar_plus: Symbol = Symbol(name="android_wifi_4_bar_plus", codepoint="\uEF12")
-    android_wifi_4_bar_question: Symbol = Symbol(name="android_wifi_4_bar_question", codepoint="\uEF11")
-    animated_images: Symbol = Symbol(name="animated_images", codepoint="\uF49A")
-    animation: Symbol = Symbol(name="animation", codepoint="\uE71C")
-    announcement: Symbol = Symbol(name="announcement", codepoint="\uE87F")
-    aod: Symbol = Symbol(name="aod", codepoint="\uF2E6")
-    aod_tablet: Symbol = Symbol(name="aod_tablet", codepoint="\uF89F")
-    aod_watch: Symbol = Symbol(name="aod_watch", codepoint="\uF6AC")
-    apartment: Symbol = Symbol(name="apartment", codepoint="\uEA40")
-    api: Symbol = Symbol(name="api", codepoint="\uF1B7")
-    apk_document: Symbol = Symbol(name="apk_document", codepoint="\uF88E")
-    apk_install: Symbol = Symbol(name="apk_install", codepoint="\uF88F")
-    app_badging: Symbol = Symbol(name="app_badging", codepoint="\uF72F")
-    app_blocking: Symbol = Symbol(name="app_blocking", codepoint="\uF2E5")
-    app_promo: Symbol = Symbol(name="app_promo", codepoint="\uF2CD")
-    app_registration: Symbol = Symbol(name="app_registration", codepoint="\uEF40")
-    app_settings_alt: Symbol = Symbol(name="app_settings_alt", codepoint="\uF2D9")
-    app_shortcut: Symbol = Symbol(name="app_shortcut", codepoint="\uF2DF")
-    apparel: Symbol = Symbol(name="apparel", codepoint="\uEF7B")
-    approval: Symbol = Symbol(name="approval", codepoint="\uE982")
-    approval_delegation: Symbol = Symbol(name="approval_delegation", codepoint="\uF84A")
-    approval_delegation_off: Symbol = Symbol(name="approval_delegation_off", codepoint="\uF2C5")
-    apps: Symbol = Symbol(name="apps", codepoint="\uE5C3")
-    apps_outage: Symbol = Symbol(name="apps_outage", codepoint="\uE7CC")
-    aq: Symbol = Symbol(name="aq", codepoint="\uF55A")
-    aq_indoor: Symbol = Symbol(name="aq_indoor", codepoint="\uF55B")
-    ar_on_you: Symbol = Symbol(name="ar_on_you", codepoint="\uEF7C")
-    ar_stickers: Symbol = Symbol(name="ar_stickers", codepoint="\uE983")
-    architecture: Symbol = Symbol(name="architecture", codepoint="\uEA3B")
-    archive: Symbol = Symbol(name="archive", codepoint="\uE149")
-    area_chart: Symbol = Symbol(name="area_chart", codepoint="\uE770")
-    arming_countdown: Symbol = Symbol(name="arming_countdown", codepoint="\uE78A")
-    arrow_and_edge: Symbol = Symbol(name="arrow_and_edge", codepoint="\uF5D7")
-    arrow_back: Symbol = Symbol(name="arrow_back", codepoint="\uE5C4")
-    arrow_back_2: Symbol = Symbol(name="arrow_back_2", codepoint="\uF43A")
-    arrow_back_ios: Symbol = Symbol(name="arrow_back_ios", codepoint="\uE5E0")
-    arrow_back_ios_new: Symbol = Symbol(name="arrow_back_ios_new", codepoint="\uE2EA")
-    arrow_circle_down: Symbol = Symbol(name="arrow_circle_down", codepoint="\uF181")
-    arrow_circle_left: Symbol = Symbol(name="arrow_circle_left", codepoint="\uEAA7")
-    arrow_circle_right: Symbol = Symbol(name="arrow_circle_right", codepoint="\uEAAA")
-    arrow_circle_up: Symbol = Symbol(name="arrow_circle_up", codepoint="\uF182")
-    arrow_cool_down: Symbol = Symbol(name="arrow_cool_down", codepoint="\uF4B6")
-    arrow_downward: Symbol = Symbol(name="arrow_downward", codepoint="\uE5DB")
-    arrow_downward_alt: Symbol = Symbol(name="arrow_downward_alt", codepoint="\uE984")
-    arrow_drop_down: Symbol = Symbol(name="arrow_drop_down", codepoint="\uE5C5")
-    arrow_drop_down_circle: Symbol = Symbol(name="arrow_drop_down_circle", codepoint="\uE5C6")
-    arrow_drop_up: Symbol = Symbol(name="arrow_drop_up", codepoint="\uE5C7")
-    arrow_forward: Symbol = Symbol(name="arrow_forward", codepoint="\uE5C8")
-    arrow_forward_ios: Symbol = Symbol(name="arrow_forward_ios", codepoint="\uE5E1")
-    arrow_insert: Symbol = Symbol(name="arrow_insert", codepoint="\uF837")
-    arrow_left: Symbol = Symbol(name="arrow_left", codepoint="\uE5DE")
-    arrow_left_alt: Symbol = Symbol(name="arrow_left_alt", codepoint="\uEF7D")
-    arrow_menu_close: Symbol = Symbol(name="arrow_menu_close", codepoint="\uF3D3")
-    arrow_menu_open: Symbol = Symbol(name="arrow_menu_open", codepoint="\uF3D2")
-    arrow_or_edge: Symbol = Symbol(name="arrow_or_edge", codepoint="\uF5D6")
-    arrow_outward: Symbol = Symbol(name="arrow_outward", codepoint="\uF8CE")
-    arrow_range: Symbol = Symbol(name="arrow_range", codepoint="\uF69B")
-    arrow_right: Symbol = Symbol(name="arrow_right", codepoint="\uE5DF")
-    arrow_right_alt: Symbol = Symbol(name="arrow_right_alt", codepoint="\uE941")
-    arrow_selector_tool: Symbol = Symbol(name="arrow_selector_tool", codepoint="\uF82F")
-    arrow_shape_up: Symbol = Symbol(name="arrow_shape_up", codepoint="\uEEF6")
-    arrow_shape_up_stack: Symbol = Symbol(name="arrow_shape_up_stack", codepoint="\uEEF7")
-    arrow_shape_up_stack_2: Symbol = Symbol(name="arrow_shape_up_stack_2", codepoint="\uEEF8")
-    arrow_split: Symbol = Symbol(name="arrow_split", codepoint="\uEA04")
-    arrow_top_left: Symbol = Symbol(name="arrow_top_left", codepoint="\uF72E")
-    arrow_top_right: Symbol = Symbol(name="arrow_top_right", codepoint="\uF72D")
-    arrow_upload_progress: Symbol = Symbol(name="arrow_upload_progress", codepoint="\uF3F4")
-    arrow_upload_ready: Symbol = Symbol(name="arrow_upload_ready", codepoint="\uF3F5")
-    arrow_upward: Symbol = Symbol(name="arrow_upward", codepoint="\uE5D8")
-    arrow_upward_alt: Symbol = Symbol(name="arrow_upward_alt", codepoint="\uE986")
-    arrow_warm_up: Symbol = Symbol(name="arrow_warm_up", codepoint="\uF4B5")
-    arrows_input: Symbol = Symbol(name="arrows_input", codepoint="\uF394")
-    arrows_more_down: Symbol = Symbol(name="arrows_more_down", codepoint="\uF8AB")
-    arrows_more_up: Symbol = Symbol(name="arrows_more_up", codepoint="\uF8AC")
-    arrows_output: Symbol = Symbol(name="arrows_output", codepoint="\uF393")
-    arrows_outward: Symbol = Symbol(name="arrows_outward", codepoint="\uF72C")
-    art_track: Symbol = Symbol(name="art_track", codepoint="\uE060")
-    article: Symbol = Symbol(name="article", codepoint="\uEF42")
-    article_person: Symbol = Symbol(name="article_person", codepoint="\uF368")
-    article_shortcut: Symbol = Symbol(name="article_shortcut", codepoint="\uF587")
-    artist: Symbol = Symbol(name="artist", codepoint="\uE01A")
-    aspect_ratio: Symbol = Symbol(name="aspect_ratio", codepoint="\uE85B")
-    assessment: Symbol = Symbol(name="assessment", codepoint="\uF0CC")
-    assignment: Symbol = Symbol(name="assignment", codepoint="\uE85D")
-    assignment_add: Symbol = Symbol(name="assignment_add", codepoint="\uF848")
-    assignment_globe: Symbol = Symbol(name="assignment_globe", codepoint="\uEEEC")
-    assignment_ind: Symbol = Symbol(name="assignment_ind", codepoint="\uE85E")
-    assignment_late: Symbol = Symbol(name="assignment_late", codepoint="\uE85F")
-    assignment_return: Symbol = Symbol(name="assignment_return", codepoint="\uE860")
-    assignment_returned: Symbol = Symbol(name="assignment_returned", codepoint="\uE861")
-    assignment_turned_in: Symbol = Symbol(name="assignment_turned_in", codepoint="\uE862")
-    assist_walker: Symbol = Symbol(name="assist_walker", codepoint="\uF8D5")
-    assistant: Symbol = Symbol(name="assistant", codepoint="\uE39F")
-    assistant_device: Symbol = Symbol(name="assistant_device", codepoint="\uE987")
-    assistant_direction: Symbol = Symbol(name="assistant_direction", codepoint="\uE988")
-    assistant_navigation: Symbol = Symbol(name="assistant_navigation", codepoint="\uE989")
-    assistant_on_hub: Symbol = Symbol(name="assistant_on_hub", codepoint="\uF6C1")
-    assistant_photo: Symbol = Symbol(name="assistant_photo", codepoint="\uF0C6")
-    assured_workload: Symbol = Symbol(name="assured_workload", codepoint="\uEB6F")
-    asterisk: Symbol = Symbol(name="asterisk", codepoint="\uF525")
-    astrophotography_auto: Symbol = Symbol(name="astrophotography_auto", codepoint="\uF1D9")
-    astrophotography_off: Symbol = Symbol(name="astrophotography_off", codepoint="\uF1DA")
-    atm: Symbol = Symbol(name="atm", codepoint="\uE573")
-    atr: Symbol = Symbol(name="atr", codepoint="\uEBC7")
-    attach_email: Symbol = Symbol(name="attach_email", codepoint="\uEA5E")
-    attach_file: Symbol = Symbol(name="attach_file", codepoint="\uE226")
-    attach_file_add: Symbol = Symbol(name="attach_file_add", codepoint="\uF841")
-    attach_file_off: Symbol = Symbol(name="attach_file_off", codepoint="\uF4D9")
-    attach_money: Symbol = Symbol(name="attach_money", codepoint="\uE227")
-    attachment: Symbol = Symbol(name="attachment", codepoint="\uE2BC")
-    attractions: Symbol = Symbol(name="attractions", codepoint="\uEA52")
-    attribution: Symbol = Symbol(name="attribution", codepoint="\uEFDB")
-    audio_description: Symbol = Symbol(name="audio_description", codepoint="\uF58C")
-    audio_file: Symbol = Symbol(name="audio_file", codepoint="\uEB82")
-    audio_video_receiver: Symbol = Symbol(name="audio_video_receiver", codepoint="\uF5D3")
-    audiotrack: Symbol = Symbol(name="audiotrack", codepoint="\uE405")
-    auto_activity_zone: Symbol = Symbol(name="auto_activity_zone", codepoint="\uF8AD")
-    auto_awesome: Symbol = Symbol(name="auto_awesome", codepoint="\uE65F")
-    auto_awesome_mosaic: Symbol = Symbol(name="auto_awesome_mosaic", codepoint="\uE660")
-    auto_awesome_motion: Symbol = Symbol(name="auto_awesome_motion", codepoint="\uE661")
-    auto_delete: Symbol = Symbol(name="auto_delete", codepoint="\uEA4C")
-    auto_detect_voice: Symbol = Symbol(name="auto_detect_voice", codepoint="\uF83E")
-    auto_draw_solid: Symbol = Symbol(name="auto_draw_solid", codepoint="\uE98A")
-    auto_fix: Symbol = Symbol(name="auto_fix", codepoint="\uE663")
-    auto_fix_high: Symbol = Symbol(name="auto_fix_high", codepoint="\uE663")
-    auto_fix_normal: Symbol = Symbol(name="auto_fix_normal", codepoint="\uE664")
-    auto_fix_off: Symbol = Symbol(name="auto_fix_off", codepoint="\uE665")
-    auto_graph: Symbol = Symbol(name="auto_graph", codepoint="\uE4FB")
-    auto_label: Symbol = Symbol(name="auto_label", codepoint="\uF6BE")
-    auto_meeting_room: Symbol = Symbol(name="auto_meeting_room", codepoint="\uF6BF")
-    auto_mode: Symbol = Symbol(name="auto_mode", codepoint="\uEC20")
-    auto_read_pause: Symbol = Symbol(name="auto_read_pause", codepoint="\uF219")
-    auto_read_play: Symbol = Symbol(name="auto_read_play", codepoint="\uF216")
-    auto_schedule: Symbol = Symbol(name="auto_schedule", codepoint="\uE214")
-    auto_stories: Symbol = Symbol(name="auto_stories", codepoint="\uE666")
-    auto_stories_off: Symbol = Symbol(name="auto_stories_off", codepoint="\uF267")
-    auto_timer: Symbol = Symbol(name="auto_timer", codepoint="\uEF7F")
-    auto_towing: Symbol = Symbol(name="auto_towing", codepoint="\uE71E")
-    auto_transmission: Symbol = Symbol(name="auto_transmission", codepoint="\uF53F")
-    auto_videocam: Symbol = Symbol(name="auto_videocam", codepoint="\uF6C0")
-    autofps_select: Symbol = Symbol(name="autofps_select", codepoint="\uEFDC")
-    automation: Symbol = Symbol(name="automation", codepoint="\uF421")
-    autopause: Symbol = Symbol(name="autopause", codepoint="\uF6B6")
-    autopay: Symbol = Symbol(name="autopay", codepoint="\uF84B")
-    autoplay: Symbol = Symbol(name="autoplay", codepoint="\uF6B5")
-    autorenew: Symbol = Symbol(name="autorenew", codepoint="\uE863")
-    autostop: Symbol = Symbol(name="autostop", codepoint="\uF682")
-    av1: Symbol = Symbol(name="av1", codepoint="\uF4B0")
-    av_timer: Symbol = Symbol(name="av_timer", codepoint="\uE01B")
-    avc: Symbol = Symbol(name="avc", codepoint="\uF4AF")
-    avg_pace: Symbol = Symbol(name="avg_pace", codepoint="\uF6BB")
-    avg_time: Symbol = Symbol(name="avg_time", codepoint="\uF813")
-    award_meal: Symbol = Symbol(name="award_meal", codepoint="\uF241")
-    award_star: Symbol = Symbol(name="award_star", codepoint="\uF612")
-    azm: Symbol = Symbol(name="azm", codepoint="\uF6EC")
-    baby_changing_station: Symbol = Symbol(name="baby_changing_station", codepoint="\uF19B")
-    back_hand: Symbol = Symbol(name="back_hand", codepoint="\uE764")
-    back_to_tab: Symbol = Symbol(name="back_to_tab", codepoint="\uF72B")
-    background_dot_large: Symbol = Symbol(name="background_dot_large", codepoint="\uF79E")
-    background_dot_small: Symbol = Symbol(name="background_dot_small", codepoint="\uF514")
-    background_grid_small: Symbol = Symbol(name="background_grid_small", codepoint="\uF79D")
-    background_replace: Symbol = Symbol(name="background_replace", codepoint="\uF20A")
-    backlight_high: Symbol = Symbol(name="backlight_high", codepoint="\uF7ED")
-    backlight_high_off: Symbol = Symbol(name="backlight_high_off", codepoint="\uF4EF")
-    backlight_low: Symbol = Symbol(name="backlight_low", codepoint="\uF7EC")
-    backpack: Symbol = Symbol(name="backpack", codepoint="\uF19C")
-    backspace: Symbol = Symbol(name="backspace", codepoint="\uE14A")
-    backup: Symbol = Symbol(name="backup", codepoint="\uE864")
-    backup_table: Symbol = Symbol(name="backup_table", codepoint="\uEF43")
-    badge: Symbol = Symbol(name="badge", codepoint="\uEA67")
-    badge_critical_battery: Symbol = Symbol(name="badge_critical_battery", codepoint="\uF156")
-    badminton: Symbol = Symbol(name="badminton", codepoint="\uF2A8")
-    bakery_dining: Symbol = Symbol(name="bakery_dining", codepoint="\uEA53")
-    balance: Symbol = Symbol(name="balance", codepoint="\uEAF6")
-    balcony: Symbol = Symbol(name="balcony", codepoint="\uE58F")
-    ballot: Symbol = Symbol(name="ballot", codepoint="\uE172")
-    bar_chart: Symbol = Symbol(name="bar_chart", codepoint="\uE26B")
-    bar_chart_4_bars: Symbol = Symbol(name="bar_chart_4_bars", codepoint="\uF681")
-    bar_chart_off: Symbol = Symbol(name="bar_chart_off", codepoint="\uF411")
-    barcode: Symbol = Symbol(name="barcode", codepoint="\uE70B")
-    barcode_reader: Symbol = Symbol(name="barcode_reader", codepoint="\uF85C")
-    barcode_scanner: Symbol = Symbol(name="barcode_scanner", codepoint="\uE70C")
-    barefoot: Symbol = Symbol(name="barefoot", codepoint="\uF871")
-    batch_prediction: Symbol = Symbol(name="batch_prediction", codepoint="\uF0F5")
-    bath_bedrock: Symbol = Symbol(name="bath_bedrock", codepoint="\uF286")
-    bath_outdoor: Symbol = Symbol(name="bath_outdoor", codepoint="\uF6FB")
-    bath_private: Symbol = Symbol(name="bath_private", codepoint="\uF6FA")
-    bath_public_large: Symbol = Symbol(name="bath_public_large", codepoint="\uF6F9")
-    bath_soak: Symbol = Symbol(name="bath_soak", codepoint="\uF2A0")
-    bathroom: Symbol = Symbol(name="bathroom", codepoint="\uEFDD")
-    bathtub: Symbol = Symbol(name="bathtub", codepoint="\uEA41")
-    battery_0_bar: Symbol = Symbol(name="battery_0_bar", codepoint="\uEBDC")
-    battery_1_bar: Symbol = Symbol(name="battery_1_bar", codepoint="\uF09C")
-    battery_20: Symbol = Symbol(name="battery_20", codepoint="\uF09C")
-    battery_2_bar: Symbol = Symbol(name="battery_2_bar", codepoint="\uF09D")
-    battery_30: Symbol = Symbol(name="battery_30", codepoint="\uF09D")
-    battery_3_bar: Symbol = Symbol(name="battery_3_bar", codepoint="\uF09E")
-    battery_4_bar: Symbol = Symbol(name="battery_4_bar", codepoint="\uF09F")
-    battery_50: Symbol = Symbol(name="battery_50", codepoint="\uF09E")
-    battery_5_bar: Symbol = Symbol(name="battery_5_bar", codepoint="\uF0A0")
-    battery_60: Symbol = Symbol(name="battery_60", codepoint="\uF09F")
-    battery_6_bar: Symbol = Symbol(name="battery_6_bar", codepoint="\uF0A1")
-    battery_80: Symbol = Symbol(name="battery_80", codepoint="\uF0A0")
-    battery_90: Symbol = Symbol(name="battery_90", codepoint="\uF0A1")
-    battery_alert: Symbol = Symbol(name="battery_alert", codepoint="\uE19C")
-    battery_android_0: Symbol = Symbol(name="battery_android_0", codepoint="\uF30D")
-    battery_android_1: Symbol = Symbol(name="battery_android_1", codepoint="\uF30C")
-    battery_android_2: Symbol = Symbol(name="battery_android_2", codepoint="\uF30B")
-    battery_android_3: Symbol = Symbol(name="battery_android_3", codepoint="\uF30A")
-    battery_android_4: Symbol = Symbol(name="battery_android_4", codepoint="\uF309")
-    battery_android_5: Symbol = Symbol(name="battery_android_5", codepoint="\uF308")
-    battery_android_6: Symbol = Symbol(name="battery_android_6", codepoint="\uF307")
-    battery_android_alert: Symbol = Symbol(name="battery_android_alert", codepoint="\uF306")
-    battery_android_bolt: Symbol = Symbol(name="battery_android_bolt", codepoint="\uF305")
-    battery_android_frame_1: Symbol = Symbol(name="battery_android_frame_1", codepoint="\uF257")
-    battery_android_frame_2: Symbol = Symbol(name="battery_android_frame_2", codepoint="\uF256")
-    battery_android_frame_3: Symbol = Symbol(name="battery_android_frame_3", codepoint="\uF255")
-    battery_android_frame_4: Symbol = Symbol(name="battery_android_frame_4", codepoint="\uF254")
-    battery_android_frame_5: Symbol = Symbol(name="battery_android_frame_5", codepoint="\uF253")
-    battery_android_frame_6: Symbol = Symbol(name="battery_android_frame_6", codepoint="\uF252")
-    battery_android_frame_alert: Symbol = Symbol(name="battery_android_frame_alert", codepoint="\uF251")
-    battery_android_frame_bolt: Symbol = Symbol(name="battery_android_frame_bolt", codepoint="\uF250")
-    battery_android_frame_full: Symbol = Symbol(name="battery_android_frame_full", codepoint="\uF24F")
-    battery_android_frame_plus: Symbol = Symbol(name="battery_android_frame_plus", codepoint="\uF24E")
-    battery_android_frame_question: Symbol = Symbol(name="battery_android_frame_question", codepoint="\uF24D")
-    battery_android_frame_share: Symbol = Symbol(name="battery_android_frame_share", codepoint="\uF24C")
-    battery_android_frame_shield: Symbol = Symbol(name="battery_android_frame_shield", codepoint="\uF24B")
-    battery_android_full: Symbol = Symbol(name="battery_android_full", codepoint="\uF304")
-    battery_android_plus: Symbol = Symbol(name="battery_android_plus", codepoint="\uF303")
-    battery_android_question: Symbol = Symbol(name="battery_android_question", codepoint="\uF302")
-    battery_android_share: Symbol = Symbol(name="battery_android_share", codepoint="\uF301")
-    battery_android_shield: Symbol = Symbol(name="battery_android_shield", codepoint="\uF300")
-    battery_change: Symbol = Symbol(name="battery_change", codepoint="\uF7EB")
-    battery_charging_20: Symbol = Symbol(name="battery_charging_20", codepoint="\uF0A2")
-    battery_charging_30: Symbol = Symbol(name="battery_charging_30", codepoint="\uF0A3")
-    battery_charging_50: Symbol = Symbol(name="battery_charging_50", codepoint="\uF0A4")
-    battery_charging_60: Symbol = Symbol(name="battery_charging_60", codepoint="\uF0A5")
-    battery_charging_80: Symbol = Symbol(name="battery_charging_80", codepoint="\uF0A6")
-    battery_charging_90: Symbol = Symbol(name="battery_charging_90", codepoint="\uF0A7")
-    battery_charging_full: Symbol = Symbol(name="battery_charging_full", codepoint="\uE1A3")
-    battery_error: Symbol = Symbol(name="battery_error", codepoint="\uF7EA")
-    battery_full: Symbol = Symbol(name="battery_full", codepoint="\uE1A5")
-    battery_full_alt: Symbol = Symbol(name="battery_full_alt", codepoint="\uF13B")
-    battery_horiz_000: Symbol = Symbol(name="battery_horiz_000", codepoint="\uF8AE")
-    battery_horiz_050: Symbol = Symbol(name="battery_horiz_050", codepoint="\uF8AF")
-    battery_horiz_075: Symbol = Symbol(name="battery_horiz_075", codepoint="\uF8B0")
-    battery_low: Symbol = Symbol(name="battery_low", codepoint="\uF155")
-    battery_plus: Symbol = Symbol(name="battery_plus", codepoint="\uF7E9")
-    battery_profile: Symbol = Symbol(name="battery_profile", codepoint="\uE206")
-    battery_saver: Symbol = Symbol(name="battery_saver", codepoint="\uEFDE")
-    battery_share: Symbol = Symbol(name="battery_share", codepoint="\uF67E")
-    battery_status_good: Symbol = Symbol(name="battery_status_good", codepoint="\uF67D")
-    battery_std: Symbol = Symbol(name="battery_std", codepoint="\uE1A5")
-    battery_unknown: Symbol = Symbol(name="battery_unknown", codepoint="\uE1A6")
-    battery_vert_005: Symbol = Symbol(name="battery_vert_005", codepoint="\uF8B1")
-    battery_vert_020: Symbol = Symbol(name="battery_vert_020", codepoint="\uF8B2")
-    battery_vert_050: Symbol = Symbol(name="battery_vert_050", codepoint="\uF8B3")
-    battery_very_low: Symbol = Symbol(name="battery_very_low", codepoint="\uF156")
-    beach_access: Symbol = Symbol(name="beach_access", codepoint="\uEB3E")
-    bed: Symbol = Symbol(name="bed", codepoint="\uEFDF")
-    bedroom_baby: Symbol = Symbol(name="bedroom_baby", codepoint="\uEFE0")
-    bedroom_child: Symbol = Symbol(name="bedroom_child", codepoint="\uEFE1")
-    bedroom_parent: Symbol = Symbol(name="bedroom_parent", codepoint="\uEFE2")
-    bedtime: Symbol = Symbol(name="bedtime", codepoint="\uF159")
-    bedtime_off: Symbol = Symbol(name="bedtime_off", codepoint="\uEB76")
-    beenhere: Symbol = Symbol(name="beenhere", codepoint="\uE52D")
-    beer_meal: Symbol = Symbol(name="beer_meal", codepoint="\uF285")
-    bento: Symbol = Symbol(name="bento", codepoint="\uF1F4")
-    bia: Symbol = Symbol(name="bia", codepoint="\uF6EB")
-    bid_landscape: Symbol = Symbol(name="bid_landscape", codepoint="\uE678")
-    bid_landscape_disabled: Symbol = Symbol(name="bid_landscape_disabled", codepoint="\uEF81")
-    bigtop_updates: Symbol = Symbol(name="bigtop_updates", codepoint="\uE669")
-    bike_dock: Symbol = Symbol(name="bike_dock", codepoint="\uF47B")
-    bike_lane: Symbol = Symbol(name="bike_lane", codepoint="\uF47A")
-    bike_scooter: Symbol = Symbol(name="bike_scooter", codepoint="\uEF45")
-    biotech: Symbol = Symbol(name="biotech", codepoint="\uEA3A")
-    blanket: Symbol = Symbol(name="blanket", codepoint="\uE828")
-    blender: Symbol = Symbol(name="blender", codepoint="\uEFE3")
-    blind: Symbol = Symbol(name="blind", codepoint="\uF8D6")
-    blinds: Symbol = Symbol(name="blinds", codepoint="\uE286")
-    blinds_closed: Symbol = Symbol(name="blinds_closed", codepoint="\uEC1F")
-    block: Symbol = Symbol(name="block", codepoint="\uF08C")
-    blood_pressure: Symbol = Symbol(name="blood_pressure", codepoint="\uE097")
-    bloodtype: Symbol = Symbol(name="bloodtype", codepoint="\uEFE4")
-    bluetooth: Symbol = Symbol(name="bluetooth", codepoint="\uE1A7")
-    bluetooth_audio: Symbol = Symbol(name="bluetooth_audio", codepoint="\uE60F")
-    bluetooth_connected: Symbol = Symbol(name="bluetooth_connected", codepoint="\uE1A8")
-    bluetooth_disabled: Symbol = Symbol(name="bluetooth_disabled", codepoint="\uE1A9")
-    bluetooth_drive: Symbol = Symbol(name="bluetooth_drive", codepoint="\uEFE5")
-    bluetooth_searching: Symbol = Symbol(name="bluetooth_searching", codepoint="\uE60F")
-    blur_circular: Symbol = Symbol(name="blur_circular", codepoint="\uE3A2")
-    blur_linear: Symbol = Symbol(name="blur_linear", codepoint="\uE3A3")
-    blur_medium: Symbol = Symbol(name="blur_medium", codepoint="\uE84C")
-    blur_off: Symbol = Symbol(name="blur_off", codepoint="\uE3A4")
-    blur_on: Symbol = Symbol(name="blur_on", codepoint="\uE3A5")
-    blur_short: Symbol = Symbol(name="blur_short", codepoint="\uE8CF")
-    boat_bus: Symbol = Symbol(name="boat_bus", codepoint="\uF36D")
-    boat_railway: Symbol = Symbol(name="boat_railway", codepoint="\uF36C")
-    body_fat: Symbol = Symbol(name="body_fat", codepoint="\uE098")
-    body_system: Symbol = Symbol(name="body_system", codepoint="\uE099")
-    bolt: Symbol = Symbol(name="bolt", codepoint="\uEA0B")
-    bomb: Symbol = Symbol(name="bomb", codepoint="\uF568")
-    book: Symbol = Symbol(name="book", codepoint="\uE86E")
-    book_2: Symbol = Symbol(name="book_2", codepoint="\uF53E")
-    book_3: Symbol = Symbol(name="book_3", codepoint="\uF53D")
-    book_4: Symbol = Symbol(name="book_4", codepoint="\uF53C")
-    book_5: Symbol = Symbol(name="book_5", codepoint="\uF53B")
-    book_6: Symbol = Symbol(name="book_6", codepoint="\uF3DF")
-    book_online: Symbol = Symbol(name="book_online", codepoint="\uF2E4")
-    book_ribbon: Symbol = Symbol(name="book_ribbon", codepoint="\uF3E7")
-    bookmark: Symbol = Symbol(name="bookmark", codepoint="\uE8E7")
-    bookmark_add: Symbol = Symbol(name="bookmark_add", codepoint="\uE598")
-    bookmark_added: Symbol = Symbol(name="bookmark_added", codepoint="\uE599")
-    bookmark_bag: Symbol = Symbol(name="bookmark_bag", codepoint="\uF410")
-    bookmark_border: Symbol = Symbol(name="bookmark_border", codepoint="\uE8E7")
-    bookmark_check: Symbol = Symbol(name="bookmark_check", codepoint="\uF457")
-    bookmark_flag: Symbol = Symbol(name="bookmark_flag", codepoint="\uF456")
-    bookmark_heart: Symbol = Symbol(name="bookmark_heart", codepoint="\uF455")
-    bookmark_manager: Symbol = Symbol(name="bookmark_manager", codepoint="\uF7B1")
-    bookmark_remove: Symbol = Symbol(name="bookmark_remove", codepoint="\uE59A")
-    bookmark_star: Symbol = Symbol(name="bookmark_star", codepoint="\uF454")
-    bookmarks: Symbol = Symbol(name="bookmarks", codepoint="\uE98B")
-    books_movies_and_music: Symbol = Symbol(name="books_movies_and_music", codepoint="\uEF82")
-    border_all: Symbol = Symbol(name="border_all", codepoint="\uE228")
-    border_bottom: Symbol = Symbol(name="border_bottom", codepoint="\uE229")
-    border_clear: Symbol = Symbol(name="border_clear", codepoint="\uE22A")
-    border_color: Symbol = Symbol(name="border_color", codepoint="\uE22B")
-    border_horizontal: Symbol = Symbol(name="border_horizontal", codepoint="\uE22C")
-    border_inner: Symbol = Symbol(name="border_inner", codepoint="\uE22D")
-    border_left: Symbol = Symbol(name="border_left", codepoint="\uE22E")
-    border_outer: Symbol = Symbol(name="border_outer", codepoint="\uE22F")
-    border_right: Symbol = Symbol(name="border_right", codepoint="\uE230")
-    border_style: Symbol = Symbol(name="border_style", codepoint="\uE231")
-    border_top: Symbol = Symbol(name="border_top", codepoint="\uE232")
-    border_vertical: Symbol = Symbol(name="border_vertical", codepoint="\uE233")
-    borg: Symbol = Symbol(name="borg", codepoint="\uF40D")
-    bottom_app_bar: Symbol = Symbol(name="bottom_app_bar", codepoint="\uE730")
-    bottom_drawer: Symbol = Symbol(name="bottom_drawer", codepoint="\uE72D")
-    bottom_navigation: Symbol = Symbol(name="bottom_navigation", codepoint="\uE98C")
-    bottom_panel_close: Symbol = Symbol(name="bottom_panel_close", codepoint="\uF72A")
-    bottom_panel_open: Symbol = Symbol(name="bottom_panel_open", codepoint="\uF729")
-    bottom_right_click: Symbol = Symbol(name="bottom_right_click", codepoint="\uF684")
-    bottom_sheets: Symbol = Symbol(name="bottom_sheets", codepoint="\uE98D")
-    box: Symbol = Symbol(name="box", codepoint="\uF5A4")
-    box_add: Symbol = Symbol(name="box_add", codepoint="\uF5A5")
-    box_edit: Symbol = Symbol(name="box_edit", codepoint="\uF5A6")
-    boy: Symbol = Symbol(name="boy", codepoint="\uEB67")
-    brand_awareness: Symbol = Symbol(name="brand_awareness", codepoint="\uE98E")
-    brand_family: Symbol = Symbol(name="brand_family", codepoint="\uF4F1")
-    branding_watermark: Symbol = Symbol(name="branding_watermark", codepoint="\uE06B")
-    breakfast_dining: Symbol = Symbol(name="breakfast_dining", codepoint="\uEA54")
-    breaking_news: Symbol = Symbol(name="breaking_news", codepoint="\uEA08")
-    breaking_news_alt_1: Symbol = Symbol(name="breaking_news_alt_1", codepoint="\uF0BA")
-    breastfeeding: Symbol = Symbol(name="breastfeeding", codepoint="\uF856")
-    brick: Symbol = Symbol(name="brick", codepoint="\uF388")
-    briefcase_meal: Symbol = Symbol(name="briefcase_meal", codepoint="\uF246")
-    brightness_1: Symbol = Symbol(name="brightness_1", codepoint="\uE3FA")
-    brightness_2: Symbol = Symbol(name="brightness_2", codepoint="\uF036")
-    brightness_3: Symbol = Symbol(name="brightness_3", codepoint="\uE3A8")
-    brightness_4: Symbol = Symbol(name="brightness_4", codepoint="\uE3A9")
-    brightness_5: Symbol = Symbol(name="brightness_5", codepoint="\uE3AA")
-    brightness_6: Symbol = Symbol(name="brightness_6", codepoint="\uE3AB")
-    brightness_7: Symbol = Symbol(name="brightness_7", codepoint="\uE3AC")
-    brightness_alert: Symbol = Symbol(name="brightness_alert", codepoint="\uF5CF")
-    brightness_auto: Symbol = Symbol(name="brightness_auto", codepoint="\uE1AB")
-    brightness_empty: Symbol = Symbol(name="brightness_empty", codepoint="\uF7E8")
-    brightness_high: Symbol = Symbol(name="brightness_high", codepoint="\uE1AC")
-    brightness_low: Symbol = Symbol(name="brightness_low", codepoint="\uE1AD")
-    brightness_medium: Symbol = Symbol(name="brightness_medium", codepoint="\uE1AE")
-    bring_your_own_ip: Symbol = Symbol(name="bring_your_own_ip", codepoint="\uE016")
-    broadcast_on_home: Symbol = Symbol(name="broadcast_on_home", codepoint="\uF8F8")
-    broadcast_on_personal: Symbol = Symbol(name="broadcast_on_personal", codepoint="\uF8F9")
-    broken_image: Symbol = Symbol(name="broken_image", codepoint="\uE3AD")
-    browse: Symbol = Symbol(name="browse", codepoint="\uEB13")
-    browse_activity: Symbol = Symbol(name="browse_activity", codepoint="\uF8A5")
-    browse_gallery: Symbol = Symbol(name="browse_gallery", codepoint="\uEBD1")
-    browser_not_supported: Symbol = Symbol(name="browser_not_supported", codepoint="\uEF47")
-    browser_updated: Symbol = Symbol(name="browser_updated", codepoint="\uE7CF")
-    brunch_dining: Symbol = Symbol(name="brunch_dining", codepoint="\uEA73")
-    brush: Symbol = Symbol(name="brush", codepoint="\uE3AE")
-    bubble: Symbol = Symbol(name="bubble", codepoint="\uEF83")
-    bubble_chart: Symbol = Symbol(name="bubble_chart", codepoint="\uE6DD")
-    bubbles: Symbol = Symbol(name="bubbles", codepoint="\uF64E")
-    bucket_check: Symbol = Symbol(name="bucket_check", codepoint="\uEF2A")
-    bug_report: Symbol = Symbol(name="bug_report", codepoint="\uE868")
-    build: Symbol = Symbol(name="build", codepoint="\uF8CD")
-    build_circle: Symbol = Symbol(name="build_circle", codepoint="\uEF48")
-    bungalow: Symbol = Symbol(name="bungalow", codepoint="\uE591")
-    burst_mode: Symbol = Symbol(name="burst_mode", codepoint="\uE43C")
-    bus_alert: Symbol = Symbol(name="bus_alert", codepoint="\uE98F")
-    bus_railway: Symbol = Symbol(name="bus_railway", codepoint="\uF36B")
-    business: Symbol = Symbol(name="business", codepoint="\uE7EE")
-    business_center: Symbol = Symbol(name="business_center", codepoint="\uEB3F")
-    business_chip: Symbol = Symbol(name="business_chip", codepoint="\uF84C")
-    business_messages: Symbol = Symbol(name="business_messages", codepoint="\uEF84")
-    buttons_alt: Symbol = Symbol(name="buttons_alt", codepoint="\uE72F")
-    cabin: Symbol = Symbol(name="cabin", codepoint="\uE589")
-    cable: Symbol = Symbol(name="cable", codepoint="\uEFE6")
-    cable_car: Symbol = Symbol(name="cable_car", codepoint="\uF479")
-    cached: Symbol = Symbol(name="cached", codepoint="\uE86A")
-    cadence: Symbol = Symbol(name="cadence", codepoint="\uF4B4")
-    cake: Symbol = Symbol(name="cake", codepoint="\uE7E9")
-    cake_add: Symbol = Symbol(name="cake_add", codepoint="\uF85B")
-    calculate: Symbol = Symbol(name="calculate", codepoint="\uEA5F")
-    calendar_add_on: Symbol = Symbol(name="calendar_add_on", codepoint="\uEF85")
-    calendar_apps_script: Symbol = Symbol(name="calendar_apps_script", codepoint="\uF0BB")
-    calendar_check: Symbol = Symbol(name="calendar_check", codepoint="\uF243")
-    calendar_clock: Symbol = Symbol(name="calendar_clock", codepoint="\uF540")
-    calendar_lock: Symbol = Symbol(name="calendar_lock", codepoint="\uF242")
-    calendar_meal: Symbol = Symbol(name="calendar_meal", codepoint="\uF296")
-    calendar_meal_2: Symbol = Symbol(name="calendar_meal_2", codepoint="\uF240")
-    calendar_month: Symbol = Symbol(name="calendar_month", codepoint="\uEBCC")
-    calendar_today: Symbol = Symbol(name="calendar_today", codepoint="\uE935")
-    calendar_view_day: Symbol = Symbol(name="calendar_view_day", codepoint="\uE936")
-    calendar_view_month: Symbol = Symbol(name="calendar_view_month", codepoint="\uEFE7")
-    calendar_view_week: Symbol = Symbol(name="calendar_view_week", codepoint="\uEFE8")
-    call: Symbol = Symbol(name="call", codepoint="\uF0D4")
-    call_end: Symbol = Symbol(name="call_end", codepoint="\uF0BC")
-    call_end_alt: Symbol = Symbol(name="call_end_alt", codepoint="\uF0BC")
-    call_log: Symbol = Symbol(name="call_log", codepoint="\uE08E")
-    call_made: Symbol = Symbol(name="call_made", codepoint="\uE0B2")
-    call_merge: Symbol = Symbol(name="call_merge", codepoint="\uE0B3")
-    call_missed: Symbol = Symbol(name="call_missed", codepoint="\uE0B4")
-    call_missed_outgoing: Symbol = Symbol(name="call_missed_outgoing", codepoint="\uE0E4")
-    call_quality: Symbol = Symbol(name="call_quality", codepoint="\uF652")
-    call_received: Symbol = Symbol(name="call_received", codepoint="\uE0B5")
-    call_split: Symbol = Symbol(name="call_split", codepoint="\uE0B6")
-    call_to_action: Symbol = Symbol(name="call_to_action", codepoint="\uE06C")
-    camera: Symbol = Symbol(name="camera", codepoint="\uE3AF")
-    camera_alt: Symbol = Symbol(name="camera_alt", codepoint="\uE412")
-    camera_enhance: Symbol = Symbol(name="camera_enhance", codepoint="\uE8FC")
-    camera_front: Symbol = Symbol(name="camera_front", codepoint="\uF2C9")
-    camera_indoor: Symbol = Symbol(name="camera_indoor", codepoint="\uEFE9")
-    camera_outdoor: Symbol = Symbol(name="camera_outdoor", codepoint="\uEFEA")
-    camera_rear: Symbol = Symbol(name="camera_rear", codepoint="\uF2C8")
-    camera_roll: Symbol = Symbol(name="camera_roll", codepoint="\uE3B3")
-    camera_video: Symbol = Symbol(name="camera_video", codepoint="\uF7A6")
-    cameraswitch: Symbol = Symbol(name="cameraswitch", codepoint="\uEFEB")
-    campaign: Symbol = Symbol(name="campaign", codepoint="\uEF49")
-    camping: Symbol = Symbol(name="camping", codepoint="\uF8A2")
-    cancel: Symbol = Symbol(name="cancel", codepoint="\uE888")
-    cancel_presentation: Symbol = Symbol(name="cancel_presentation", codepoint="\uE0E9")
-    cancel_schedule_send: Symbol = Symbol(name="cancel_schedule_send", codepoint="\uEA39")
-    candle: Symbol = Symbol(name="candle", codepoint="\uF588")
-    candlestick_chart: Symbol = Symbol(name="candlestick_chart", codepoint="\uEAD4")
-    cannabis: Symbol = Symbol(name="cannabis", codepoint="\uF2F3")
-    captive_portal: Symbol = Symbol(name="captive_portal", codepoint="\uF728")
-    capture: Symbol = Symbol(name="capture", codepoint="\uF727")
-    car_crash: Symbol = Symbol(name="car_crash", codepoint="\uEBF2")
-    car_defrost_left: Symbol = Symbol(name="car_defrost_left", codepoint="\uF344")
-    car_defrost_low_left: Symbol = Symbol(name="car_defrost_low_left", codepoint="\uF343")
-    car_defrost_low_right: Symbol = Symbol(name="car_defrost_low_right", codepoint="\uF342")
-    car_defrost_mid_left: Symbol = Symbol(name="car_defrost_mid_left", codepoint="\uF278")
-    car_defrost_mid_low_left: Symbol = Symbol(name="car_defrost_mid_low_left", codepoint="\uF341")
-    car_defrost_mid_low_right: Symbol = Symbol(name="car_defrost_mid_low_right", codepoint="\uF277")
-    car_defrost_mid_right: Symbol = Symbol(name="car_defrost_mid_right", codepoint="\uF340")
-    car_defrost_right: Symbol = Symbol(name="car_defrost_right", codepoint="\uF33F")
-    car_fan_low_left: Symbol = Symbol(name="car_fan_low_left", codepoint="\uF33E")
-    car_fan_low_mid_left: Symbol = Symbol(name="car_fan_low_mid_left", codepoint="\uF33D")
-    car_fan_low_right: Symbol = Symbol(name="car_fan_low_right", codepoint="\uF33C")
-    car_fan_mid_left: Symbol = Symbol(name="car_fan_mid_left", codepoint="\uF33B")
-    car_fan_mid_low_right: Symbol = Symbol(name="car_fan_mid_low_right", codepoint="\uF33A")
-    car_fan_mid_right: Symbol = Symbol(name="car_fan_mid_right", codepoint="\uF339")
-    car_fan_recirculate: Symbol = Symbol(name="car_fan_recirculate", codepoint="\uF338")
-    car_gear: Symbol = Symbol(name="car_gear", codepoint="\uF337")
-    car_lock: Symbol = Symbol(name="car_lock", codepoint="\uF336")
-    car_mirror_heat: Symbol = Symbol(name="car_mirror_heat", codepoint="\uF335")
-    car_rental: Symbol = Symbol(name="car_rental", codepoint="\uEA55")
-    car_repair: Symbol = Symbol(name="car_repair", codepoint="\uEA56")
-    car_tag: Symbol = Symbol(name="car_tag", codepoint="\uF4E3")
-    card_giftcard: Symbol = Symbol(name="card_giftcard", codepoint="\uE8F6")
-    card_membership: Symbol = Symbol(name="card_membership", codepoint="\uE8F7")
-    card_travel: Symbol = Symbol(name="card_travel", codepoint="\uE8F8")
-    cardio_load: Symbol = Symbol(name="cardio_load", codepoint="\uF4B9")
-    cardiology: Symbol = Symbol(name="cardiology", codepoint="\uE09C")
-    cards: Symbol = Symbol(name="cards", codepoint="\uE991")
-    cards_star: Symbol = Symbol(name="cards_star", codepoint="\uF375")
-    carpenter: Symbol = Symbol(name="carpenter", codepoint="\uF1F8")
-    carry_on_bag: Symbol = Symbol(name="carry_on_bag", codepoint="\uEB08")
-    carry_on_bag_checked: Symbol = Symbol(name="carry_on_bag_checked", codepoint="\uEB0B")
-    carry_on_bag_inactive: Symbol = Symbol(name="carry_on_bag_inactive", codepoint="\uEB0A")
-    carry_on_bag_question: Symbol = Symbol(name="carry_on_bag_question", codepoint="\uEB09")
-    cases: Symbol = Symbol(name="cases", codepoint="\uE992")
-    casino: Symbol = Symbol(name="casino", codepoint="\uEB40")
-    cast: Symbol = Symbol(name="cast", codepoint="\uE307")
-    cast_connected: Symbol = Symbol(name="cast_connected", codepoint="\uE308")
-    cast_for_education: Symbol = Symbol(name="cast_for_education", codepoint="\uEFEC")
-    cast_pause: Symbol = Symbol(name="cast_pause", codepoint="\uF5F0")
-    cast_warning: Symbol = Symbol(name="cast_warning", codepoint="\uF5EF")
-    castle: Symbol = Symbol(name="castle", codepoint="\uEAB1")
-    category: Symbol = Symbol(name="category", codepoint="\uE574")
-    category_search: Symbol = Symbol(name="category_search", codepoint="\uF437")
-    celebration: Symbol = Symbol(name="celebration", codepoint="\uEA65")
-    cell_merge: Symbol = Symbol(name="cell_merge", codepoint="\uF82E")
-    cell_tower: Symbol = Symbol(name="cell_tower", codepoint="\uEBBA")
-    cell_wifi: Symbol = Symbol(name="cell_wifi", codepoint="\uE0EC")
-    center_focus_strong: Symbol = Symbol(name="center_focus_strong", codepoint="\uE3B4")
-    center_focus_weak: Symbol = Symbol(name="center_focus_weak", codepoint="\uE3B5")
-    chair: Symbol = Symbol(name="chair", codepoint="\uEFED")
-    chair_alt: Symbol = Symbol(name="chair_alt", codepoint="\uEFEE")
-    chair_counter: Symbol = Symbol(name="chair_counter", codepoint="\uF29F")
-    chair_fireplace: Symbol = Symbol(name="chair_fireplace", codepoint="\uF29E")
-    chair_umbrella: Symbol = Symbol(name="chair_umbrella", codepoint="\uF29D")
-    chalet: Symbol = Symbol(name="chalet", codepoint="\uE585")
-    change_circle: Symbol = Symbol(name="change_circle", codepoint="\uE2E7")
-    change_history: Symbol = Symbol(name="change_history", codepoint="\uE86B")
-    charger: Symbol = Symbol(name="charger", codepoint="\uE2AE")
-    charging_station: Symbol = Symbol(name="charging_station", codepoint="\uF2E3")
-    chart_data: Symbol = Symbol(name="chart_data", codepoint="\uE473")
-    chat: Symbol = Symbol(name="chat", codepoint="\uE0C9")
-    chat_add_on: Symbol = Symbol(name="chat_add_on", codepoint="\uF0F3")
-    chat_apps_script: Symbol = Symbol(name="chat_apps_script", codepoint="\uF0BD")
-    chat_bubble: Symbol = Symbol(name="chat_bubble", codepoint="\uE0CB")
-    chat_bubble_outline: Symbol = Symbol(name="chat_bubble_outline", codepoint="\uE0CB")
-    chat_dashed: Symbol = Symbol(name="chat_dashed", codepoint="\uEEED")
-    chat_error: Symbol = Symbol(name="chat_error", codepoint="\uF7AC")
-    chat_info: Symbol = Symbol(name="chat_info", codepoint="\uF52B")
-    chat_paste_go: Symbol = Symbol(name="chat_paste_go", codepoint="\uF6BD")
-    chat_paste_go_2: Symbol = Symbol(name="chat_paste_go_2", codepoint="\uF3CB")
-    check: Symbol = Symbol(name="check", codepoint="\uE5CA")
-    check_box: Symbol = Symbol(name="check_box", codepoint="\uE834")
-    check_box_outline_blank: Symbol = Symbol(name="check_box_outline_blank", codepoint="\uE835")
-    check_circle: Symbol = Symbol(name="check_circle", codepoint="\uF0BE")
-    check_circle_filled: Symbol = Symbol(name="check_circle_filled", codepoint="\uF0BE")
-    check_circle_outline: Symbol = Symbol(name="check_circle_outline", codepoint="\uF0BE")
-    check_circle_unread: Symbol = Symbol(name="check_circle_unread", codepoint="\uF27E")
-    check_in_out: Symbol = Symbol(name="check_in_out", codepoint="\uF6F6")
-    check_indeterminate_small: Symbol = Symbol(name="check_indeterminate_small", codepoint="\uF88A")
-    check_small: Symbol = Symbol(name="check_small", codepoint="\uF88B")
-    checkbook: Symbol = Symbol(name="checkbook", codepoint="\uE70D")
-    checked_bag: Symbol = Symbol(name="checked_bag", codepoint="\uEB0C")
-    checked_bag_question: Symbol = Symbol(name="checked_bag_question", codepoint="\uEB0D")
-    checklist: Symbol = Symbol(name="checklist", codepoint="\uE6B1")
-    checklist_rtl: Symbol = Symbol(name="checklist_rtl", codepoint="\uE6B3")
-    checkroom: Symbol = Symbol(name="checkroom", codepoint="\uF19E")
-    cheer: Symbol = Symbol(name="cheer", codepoint="\uF6A8")
-    chef_hat: Symbol = Symbol(name="chef_hat", codepoint="\uF357")
-    chess: Symbol = Symbol(name="chess", codepoint="\uF5E7")
-    chess_bishop: Symbol = Symbol(name="chess_bishop", codepoint="\uF261")
-    chess_bishop_2: Symbol = Symbol(name="chess_bishop_2", codepoint="\uF262")
-    chess_king: Symbol = Symbol(name="chess_king", codepoint="\uF25F")
-    chess_king_2: Symbol = Symbol(name="chess_king_2", codepoint="\uF260")
-    chess_knight: Symbol = Symbol(name="chess_knight", codepoint="\uF25E")
-    chess_pawn: Symbol = Symbol(name="chess_pawn", codepoint="\uF3B6")
-    chess_pawn_2: Symbol = Symbol(name="chess_pawn_2", codepoint="\uF25D")
-    chess_queen: Symbol = Symbol(name="chess_queen", codepoint="\uF25C")
-    chess_rook: Symbol = Symbol(name="chess_rook", codepoint="\uF25B")
-    chevron_backward: Symbol = Symbol(name="chevron_backward", codepoint="\uF46B")
-    chevron_forward: Symbol = Symbol(name="chevron_forward", codepoint="\uF46A")
-    chevron_left: Symbol = Symbol(name="chevron_left", codepoint="\uE5CB")
-    chevron_right: Symbol = Symbol(name="chevron_right", codepoint="\uE5CC")
-    child_care: Symbol = Symbol(name="child_care", codepoint="\uEB41")
-    child_friendly: Symbol = Symbol(name="child_friendly", codepoint="\uEB42")
-    child_hat: Symbol = Symbol(name="child_hat", codepoint="\uEF30")
-    chip_extraction: Symbol = Symbol(name="chip_extraction", codepoint="\uF821")
-    chips: Symbol = Symbol(name="chips", codepoint="\uE993")
-    chrome_reader_mode: Symbol = Symbol(name="chrome_reader_mode", codepoint="\uE86D")
-    chromecast_2: Symbol = Symbol(name="chromecast_2", codepoint="\uF17B")
-    chromecast_device: Symbol = Symbol(name="chromecast_device", codepoint="\uE83C")
-    chronic: Symbol = Symbol(name="chronic", codepoint="\uEBB2")
-    church: Symbol = Symbol(name="church", codepoint="\uEAAE")
-    cinematic_blur: Symbol = Symbol(name="cinematic_blur", codepoint="\uF853")
-    circle: Symbol = Symbol(name="circle", codepoint="\uEF4A")
-    circle_notifications: Symbol = Symbol(name="circle_notifications", codepoint="\uE994")
-    circles: Symbol = Symbol(name="circles", codepoint="\uE7EA")
-    circles_ext: Symbol = Symbol(name="circles_ext", codepoint="\uE7EC")
-    clarify: Symbol = Symbol(name="clarify", codepoint="\uF0BF")
-    class_: Symbol = Symbol(name="class", codepoint="\uE86E")
-    clean_hands: Symbol = Symbol(name="clean_hands", codepoint="\uF21F")
-    cleaning: Symbol = Symbol(name="cleaning", codepoint="\uE995")
-    cleaning_bucket: Symbol = Symbol(name="cleaning_bucket", codepoint="\uF8B4")
-    cleaning_services: Symbol = Symbol(name="cleaning_services", codepoint="\uF0FF")
-    clear: Symbol = Symbol(name="clear", codepoint="\uE5CD")
-    clear_all: Symbol = Symbol(name="clear_all", codepoint="\uE0B8")
-    clear_day: Symbol = Symbol(name="clear_day", codepoint="\uF157")
-    clear_night: Symbol = Symbol(name="clear_night", codepoint="\uF159")
-    climate_mini_split: Symbol = Symbol(name="climate_mini_split", codepoint="\uF8B5")
-    clinical_notes: Symbol = Symbol(name="clinical_notes", codepoint="\uE09E")
-    clock_arrow_down: Symbol = Symbol(name="clock_arrow_down", codepoint="\uF382")
-    clock_arrow_up: Symbol = Symbol(name="clock_arrow_up", codepoint="\uF381")
-    clock_loader_10: Symbol = Symbol(name="clock_loader_10", codepoint="\uF726")
-    clock_loader_20: Symbol = Symbol(name="clock_loader_20", codepoint="\uF725")
-    clock_loader_40: Symbol = Symbol(name="clock_loader_40", codepoint="\uF724")
-    clock_loader_60: Symbol = Symbol(name="clock_loader_60", codepoint="\uF723")
-    clock_loader_80: Symbol = Symbol(name="clock_loader_80", codepoint="\uF722")
-    clock_loader_90: Symbol = Symbol(name="clock_loader_90", codepoint="\uF721")
-    close: Symbol = Symbol(name="close", codepoint="\uE5CD")
-    close_fullscreen: Symbol = Symbol(name="close_fullscreen", codepoint="\uF1CF")
-    close_small: Symbol = Symbol(name="close_small", codepoint="\uF508")
-    closed_caption: Symbol = Symbol(name="closed_caption", codepoint="\uE996")
-    closed_caption_add: Symbol = Symbol(name="closed_caption_add", codepoint="\uF4AE")
-    closed_caption_disabled: Symbol = Symbol(name="closed_caption_disabled", codepoint="\uF1DC")
-    closed_caption_off: Symbol = Symbol(name="closed_caption_off", codepoint="\uE996")
-    cloud: Symbol = Symbol(name="cloud", codepoint="\uF15C")
-    cloud_alert: Symbol = Symbol(name="cloud_alert", codepoint="\uF3CC")
-    cloud_circle: Symbol = Symbol(name="cloud_circle", codepoint="\uE2BE")
-    cloud_done: Symbol = Symbol(name="cloud_done", codepoint="\uE2BF")
-    cloud_download: Symbol = Symbol(name="cloud_download", codepoint="\uE2C0")
-    cloud_lock: Symbol = Symbol(name="cloud_lock", codepoint="\uF386")
-    cloud_off: Symbol = Symbol(name="cloud_off", codepoint="\uE2C1")
-    cloud_queue: Symbol = Symbol(name="cloud_queue", codepoint="\uF15C")
-    cloud_sync: Symbol = Symbol(name="cloud_sync", codepoint="\uEB5A")
-    cloud_upload: Symbol = Symbol(name="cloud_upload", codepoint="\uE2C3")
-    cloudy: Symbol = Symbol(name="cloudy", codepoint="\uF15C")
-    cloudy_filled: Symbol = Symbol(name="cloudy_filled", codepoint="\uF15C")
-    cloudy_snowing: Symbol = Symbol(name="cloudy_snowing", codepoint="\uE810")
-    co2: Symbol = Symbol(name="co2", codepoint="\uE7B0")
-    co_present: Symbol = Symbol(name="co_present", codepoint="\uEAF0")
-    code: Symbol = Symbol(name="code", codepoint="\uE86F")
-    code_blocks: Symbol = Symbol(name="code_blocks", codepoint="\uF84D")
-    code_off: Symbol = Symbol(name="code_off", codepoint="\uE4F3")
-    coffee: Symbol = Symbol(name="coffee", codepoint="\uEFEF")
-    coffee_maker: Symbol = Symbol(name="coffee_maker", codepoint="\uEFF0")
-    cognition: Symbol = Symbol(name="cognition", codepoint="\uE09F")
-    cognition_2: Symbol = Symbol(name="cognition_2", codepoint="\uF3B5")
-    collapse_all: Symbol = Symbol(name="collapse_all", codepoint="\uE944")
-    collapse_content: Symbol = Symbol(name="collapse_content", codepoint="\uF507")
-    collections: Symbol = Symbol(name="collections", codepoint="\uE3D3")
-    collections_bookmark: Symbol = Symbol(name="collections_bookmark", codepoint="\uE431")
-    color_lens: Symbol = Symbol(name="color_lens", codepoint="\uE40A")
-    colorize: Symbol = Symbol(name="colorize", codepoint="\uE3B8")
-    colors: Symbol = Symbol(name="colors", codepoint="\uE997")
-    combine_columns: Symbol = Symbol(name="combine_columns", codepoint="\uF420")
-    comedy_mask: Symbol = Symbol(name="comedy_mask", codepoint="\uF4D6")
-    comic_bubble: Symbol = Symbol(name="comic_bubble", codepoint="\uF5DD")
-    comment: Symbol = Symbol(name="comment", codepoint="\uE24C")
-    comment_bank: Symbol = Symbol(name="comment_bank", codepoint="\uEA4E")
-    comments_disabled: Symbol = Symbol(name="comments_disabled", codepoint="\uE7A2")
-    commit: Symbol = Symbol(name="commit", codepoint="\uEAF5")
-    communication: Symbol = Symbol(name="communication", codepoint="\uE27C")
-    communities: Symbol = Symbol(name="communities", codepoint="\uEB16")
-    communities_filled: Symbol = Symbol(name="communities_filled", codepoint="\uEB16")
-    commute: Symbol = Symbol(name="commute", codepoint="\uE940")
-    compare: Symbol = Symbol(name="compare", codepoint="\uE3B9")
-    compare_arrows: Symbol = Symbol(name="compare_arrows", codepoint="\uE915")
-    compass_calibration: Symbol = Symbol(name="compass_calibration", codepoint="\uE57C")
-    component_exchange: Symbol = Symbol(name="component_exchange", codepoint="\uF1E7")
-    compost: Symbol = Symbol(name="compost", codepoint="\uE761")
-    compress: Symbol = Symbol(name="compress", codepoint="\uE94D")
-    computer: Symbol = Symbol(name="computer", codepoint="\uE31E")
-    computer_arrow_up: Symbol = Symbol(name="computer_arrow_up", codepoint="\uF2F7")
-    computer_cancel: Symbol = Symbol(name="computer_cancel", codepoint="\uF2F6")
-    concierge: Symbol = Symbol(name="concierge", codepoint="\uF561")
-    conditions: Symbol = Symbol(name="conditions", codepoint="\uE0A0")
-    confirmation_number: Symbol = Symbol(name="confirmation_number", codepoint="\uE638")
-    congenital: Symbol = Symbol(name="congenital", codepoint="\uE0A1")
-    connect_without_contact: Symbol = Symbol(name="connect_without_contact", codepoint="\uF223")
-    connected_tv: Symbol = Symbol(name="connected_tv", codepoint="\uE998")
-    connecting_airports: Symbol = Symbol(name="connecting_airports", codepoint="\uE7C9")
-    construction: Symbol = Symbol(name="construction", codepoint="\uEA3C")
-    contact_emergency: Symbol = Symbol(name="contact_emergency", codepoint="\uF8D1")
-    contact_mail: Symbol = Symbol(name="contact_mail", codepoint="\uE0D0")
-    contact_page: Symbol = Symbol(name="contact_page", codepoint="\uF22E")
-    contact_phone: Symbol = Symbol(name="contact_phone", codepoint="\uF0C0")
-    contact_phone_filled: Symbol = Symbol(name="contact_phone_filled", codepoint="\uF0C0")
-    contact_support: Symbol = Symbol(name="contact_support", codepoint="\uE94C")
-    contactless: Symbol = Symbol(name="contactless", codepoint="\uEA71")
-    contactless_off: Symbol = Symbol(name="contactless_off", codepoint="\uF858")
-    contacts: Symbol = Symbol(name="contacts", codepoint="\uE0BA")
-    contacts_product: Symbol = Symbol(name="contacts_product", codepoint="\uE999")
-    content_copy: Symbol = Symbol(name="content_copy", codepoint="\uE14D")
-    content_cut: Symbol = Symbol(name="content_cut", codepoint="\uE14E")
-    content_paste: Symbol = Symbol(name="content_paste", codepoint="\uE14F")
-    content_paste_go: Symbol = Symbol(name="content_paste_go", codepoint="\uEA8E")
-    content_paste_off: Symbol = Symbol(name="content_paste_off", codepoint="\uE4F8")
-    content_paste_search: Symbol = Symbol(name="content_paste_search", codepoint="\uEA9B")
-    contextual_token: Symbol = Symbol(name="contextual_token", codepoint="\uF486")
-    contextual_token_add: Symbol = Symbol(name="contextual_token_add", codepoint="\uF485")
-    contract: Symbol = Symbol(name="contract", codepoint="\uF5A0")
-    contract_delete: Symbol = Symbol(name="contract_delete", codepoint="\uF5A2")
-    contract_edit: Symbol = Symbol(name="contract_edit", codepoint="\uF5A1")
-    contrast: Symbol = Symbol(name="contrast", codepoint="\uEB37")
-    contrast_circle: Symbol = Symbol(name="contrast_circle", codepoint="\uF49F")
-    contrast_rtl_off: Symbol = Symbol(name="contrast_rtl_off", codepoint="\uEC72")
-    contrast_square: Symbol = Symbol(name="contrast_square", codepoint="\uF4A0")
-    control_camera: Symbol = Symbol(name="control_camera", codepoint="\uE074")
-    control_point: Symbol = Symbol(name="control_point", codepoint="\uE3BA")
-    control_point_duplicate: Symbol = Symbol(name="control_point_duplicate", codepoint="\uE3BB")
-    controller_gen: Symbol = Symbol(name="controller_gen", codepoint="\uE83D")
-    conversation: Symbol = Symbol(name="conversation", codepoint="\uEF2F")
-    conversion_path: Symbol = Symbol(name="conversion_path", codepoint="\uF0C1")
-    conversion_path_off: Symbol = Symbol(name="conversion_path_off", codepoint="\uF7B4")
-    convert_to_text: Symbol = Symbol(name="convert_to_text", codepoint="\uF41F")
-    conveyor_belt: Symbol = Symbol(name="conveyor_belt", codepoint="\uF867")
-    cookie: Symbol = Symbol(name="cookie", codepoint="\uEAAC")
-    cookie_off: Symbol = Symbol(name="cookie_off", codepoint="\uF79A")
-    cooking: Symbol = Symbol(name="cooking", codepoint="\uE2B6")
-    cool_to_dry: Symbol = Symbol(name="cool_to_dry", codepoint="\uE276")
-    copy_all: Symbol = Symbol(name="copy_all", codepoint="\uE2EC")
-    copyright: Symbol = Symbol(name="copyright", codepoint="\uE90C")
-    coronavirus: Symbol = Symbol(name="coronavirus", codepoint="\uF221")
-    corporate_fare: Symbol = Symbol(name="corporate_fare", codepoint="\uF1D0")
-    cottage: Symbol = Symbol(name="cottage", codepoint="\uE587")
-    counter_0: Symbol = Symbol(name="counter_0", codepoint="\uF785")
-    counter_1: Symbol = Symbol(name="counter_1", codepoint="\uF784")
-    counter_2: Symbol = Symbol(name="counter_2", codepoint="\uF783")
-    counter_3: Symbol = Symbol(name="counter_3", codepoint="\uF782")
-    counter_4: Symbol = Symbol(name="counter_4", codepoint="\uF781")
-    counter_5: Symbol = Symbol(name="counter_5", codepoint="\uF780")
-    counter_6: Symbol = Symbol(name="counter_6", codepoint="\uF77F")
-    counter_7: Symbol = Symbol(name="counter_7", codepoint="\uF77E")
-    counter_8: Symbol = Symbol(name="counter_8", codepoint="\uF77D")
-    counter_9: Symbol = Symbol(name="counter_9", codepoint="\uF77C")
-    countertops: Symbol = Symbol(name="countertops", codepoint="\uF1F7")
-    create: Symbol = Symbol(name="create", codepoint="\uF097")
-    create_new_folder: Symbol = Symbol(name="create_new_folder", codepoint="\uE2CC")
-    credit_card: Symbol = Symbol(name="credit_card", codepoint="\uE8A1")
-    credit_card_clock: Symbol = Symbol(name="credit_card_clock", codepoint="\uF438")
-    credit_card_gear: Symbol = Symbol(name="credit_card_gear", codepoint="\uF52D")
-    credit_card_heart: Symbol = Symbol(name="credit_card_heart", codepoint="\uF52C")
-    credit_card_off: Symbol = Symbol(name="credit_card_off", codepoint="\uE4F4")
-    credit_score: Symbol = Symbol(name="credit_score", codepoint="\uEFF1")
-    crib: Symbol = Symbol(name="crib", codepoint="\uE588")
-    crisis_alert: Symbol = Symbol(name="crisis_alert", codepoint="\uEBE9")
-    crop: Symbol = Symbol(name="crop", codepoint="\uE3BE")
-    crop_16_9: Symbol = Symbol(name="crop_16_9", codepoint="\uE3BC")
-    crop_3_2: Symbol = Symbol(name="crop_3_2", codepoint="\uE3BD")
-    crop_5_4: Symbol = Symbol(name="crop_5_4", codepoint="\uE3BF")
-    crop_7_5: Symbol = Symbol(name="crop_7_5", codepoint="\uE3C0")
-    crop_9_16: Symbol = Symbol(name="crop_9_16", codepoint="\uF549")
-    crop_din: Symbol = Symbol(name="crop_din", codepoint="\uE3C6")
-    crop_free: Symbol = Symbol(name="crop_free", codepoint="\uE3C2")
-    crop_landscape: Symbol = Symbol(name="crop_landscape", codepoint="\uE3C3")
-    crop_original: Symbol = Symbol(name="crop_original", codepoint="\uE3F4")
-    crop_portrait: Symbol = Symbol(name="crop_portrait", codepoint="\uE3C5")
-    crop_rotate: Symbol = Symbol(name="crop_rotate", codepoint="\uE437")
-    crop_square: Symbol = Symbol(name="crop_square", codepoint="\uE3C6")
-    crossword: Symbol = Symbol(name="crossword", codepoint="\uF5E5")
-    crowdsource: Symbol = Symbol(name="crowdsource", codepoint="\uEB18")
-    crown: Symbol = Symbol(name="crown", codepoint="\uECB3")
-    cruelty_free: Symbol = Symbol(name="cruelty_free", codepoint="\uE799")
-    css: Symbol = Symbol(name="css", codepoint="\uEB93")
-    csv: Symbol = Symbol(name="csv", codepoint="\uE6CF")
-    currency_bitcoin: Symbol = Symbol(name="currency_bitcoin", codepoint="\uEBC5")
-    currency_exchange: Symbol = Symbol(name="currency_exchange", codepoint="\uEB70")
-    currency_franc: Symbol = Symbol(name="currency_franc", codepoint="\uEAFA")
-    currency_lira: Symbol = Symbol(name="currency_lira", codepoint="\uEAEF")
-    currency_pound: Symbol = Symbol(name="currency_pound", codepoint="\uEAF1")
-    currency_ruble: Symbol = Symbol(name="currency_ruble", codepoint="\uEAEC")
-    currency_rupee: Symbol = Symbol(name="currency_rupee", codepoint="\uEAF7")
-    currency_rupee_circle: Symbol = Symbol(name="currency_rupee_circle", codepoint="\uF460")
-    currency_yen: Symbol = Symbol(name="currency_yen", codepoint="\uEAFB")
-    currency_yuan: Symbol = Symbol(name="currency_yuan", codepoint="\uEAF9")
-    curtains: Symbol = Symbol(name="curtains", codepoint="\uEC1E")
-    curtains_closed: Symbol = Symbol(name="curtains_closed", codepoint="\uEC1D")
-    custom_typography: Symbol = Symbol(name="custom_typography", codepoint="\uE732")
-    cut: Symbol = Symbol(name="cut", codepoint="\uF08B")
-    cycle: Symbol = Symbol(name="cycle", codepoint="\uF854")
-    cyclone: Symbol = Symbol(name="cyclone", codepoint="\uEBD5")
-    dangerous: Symbol = Symbol(name="dangerous", codepoint="\uE99A")
-    dark_mode: Symbol = Symbol(name="dark_mode", codepoint="\uE51C")
-    dashboard: Symbol = Symbol(name="dashboard", codepoint="\uE871")
-    dashboard_2: Symbol = Symbol(name="dashboard_2", codepoint="\uF3EA")
-    dashboard_customize: Symbol = Symbol(name="dashboard_customize", codepoint="\uE99B")
-    data_alert: Symbol = Symbol(name="data_alert", codepoint="\uF7F6")
-    data_array: Symbol = Symbol(name="data_array", codepoint="\uEAD1")
-    data_check: Symbol = Symbol(name="data_check", codepoint="\uF7F2")
-    data_exploration: Symbol = Symbol(name="data_exploration", codepoint="\uE76F")
-    data_info_alert: Symbol = Symbol(name="data_info_alert", codepoint="\uF7F5")
-    data_loss_prevention: Symbol = Symbol(name="data_loss_prevention", codepoint="\uE2DC")
-    data_object: Symbol = Symbol(name="data_object", codepoint="\uEAD3")
-    data_saver_off: Symbol = Symbol(name="data_saver_off", codepoint="\uEFF2")
-    data_saver_on: Symbol = Symbol(name="data_saver_on", codepoint="\uEFF3")
-    data_table: Symbol = Symbol(name="data_table", codepoint="\uE99C")
-    data_thresholding: Symbol = Symbol(name="data_thresholding", codepoint="\uEB9F")
-    data_usage: Symbol = Symbol(name="data_usage", codepoint="\uEFF2")
-    database: Symbol = Symbol(name="database", codepoint="\uF20E")
-    database_off: Symbol = Symbol(name="database_off", codepoint="\uF414")
-    database_search: Symbol = Symbol(name="database_search", codepoint="\uF38E")
-    database_upload: Symbol = Symbol(name="database_upload", codepoint="\uF3DC")
-    dataset: Symbol = Symbol(name="dataset", codepoint="\uF8EE")
-    dataset_linked: Symbol = Symbol(name="dataset_linked", codepoint="\uF8EF")
-    date_range: Symbol = Symbol(name="date_range", codepoint="\uE916")
-    deblur: Symbol = Symbol(name="deblur", codepoint="\uEB77")
-    deceased: Symbol = Symbol(name="deceased", codepoint="\uE0A5")
-    decimal_decrease: Symbol = Symbol(name="decimal_decrease", codepoint="\uF82D")
-    decimal_increase: Symbol = Symbol(name="decimal_increase", codepoint="\uF82C")
-    deck: Symbol = Symbol(name="deck", codepoint="\uEA42")
-    dehaze: Symbol = Symbol(name="dehaze", codepoint="\uE3C7")
-    delete: Symbol = Symbol(name="delete", codepoint="\uE92E")
-    delete_forever: Symbol = Symbol(name="delete_forever", codepoint="\uE92B")
-    delete_history: Symbol = Symbol(name="delete_history", codepoint="\uF518")
-    delete_outline: Symbol = Symbol(name="delete_outline", codepoint="\uE92E")
-    delete_sweep: Symbol = Symbol(name="delete_sweep", codepoint="\uE16C")
-    delivery_dining: Symbol = Symbol(name="delivery_dining", codepoint="\uEB28")
-    delivery_truck_bolt: Symbol = Symbol(name="delivery_truck_bolt", codepoint="\uF3A2")
-    delivery_truck_speed: Symbol = Symbol(name="delivery_truck_speed", codepoint="\uF3A1")
-    demography: Symbol = Symbol(name="demography", codepoint="\uE489")
-    density_large: Symbol = Symbol(name="density_large", codepoint="\uEBA9")
-    density_medium: Symbol = Symbol(name="density_medium", codepoint="\uEB9E")
-    density_small: Symbol = Symbol(name="density_small", codepoint="\uEBA8")
-    dentistry: Symbol = Symbol(name="dentistry", codepoint="\uE0A6")
-    departure_board: Symbol = Symbol(name="departure_board", codepoint="\uE576")
-    deployed_code: Symbol = Symbol(name="deployed_code", codepoint="\uF720")
-    deployed_code_account: Symbol = Symbol(name="deployed_code_account", codepoint="\uF51B")
-    deployed_code_alert: Symbol = Symbol(name="deployed_code_alert", codepoint="\uF5F2")
-    deployed_code_history: Symbol = Symbol(name="deployed_code_history", codepoint="\uF5F3")
-    deployed_code_update: Symbol = Symbol(name="deployed_code_update", codepoint="\uF5F4")
-    dermatology: Symbol = Symbol(name="dermatology", codepoint="\uE0A7")
-    description: Symbol = Symbol(name="description", codepoint="\uE873")
-    deselect: Symbol = Symbol(name="deselect", codepoint="\uEBB6")
-    design_services: Symbol = Symbol(name="design_services", codepoint="\uF10A")
-    desk: Symbol = Symbol(name="desk", codepoint="\uF8F4")
-    deskphone: Symbol = Symbol(name="deskphone", codepoint="\uF7FA")
-    desktop_access_disabled: Symbol = Symbol(name="desktop_access_disabled", codepoint="\uE99D")
-    desktop_cloud: Symbol = Symbol(name="desktop_cloud", codepoint="\uF3DB")
-    desktop_cloud_stack: Symbol = Symbol(name="desktop_cloud_stack", codepoint="\uF3BE")
-    desktop_landscape: Symbol = Symbol(name="desktop_landscape", codepoint="\uF45E")
-    desktop_landscape_add: Symbol = Symbol(name="desktop_landscape_add", codepoint="\uF439")
-    desktop_mac: Symbol = Symbol(name="desktop_mac", codepoint="\uE30B")
-    desktop_portrait: Symbol = Symbol(name="desktop_portrait", codepoint="\uF45D")
-    desktop_windows: Symbol = Symbol(name="desktop_windows", codepoint="\uE30C")
-    destruction: Symbol = Symbol(name="destruction", codepoint="\uF585")
-    details: Symbol = Symbol(name="details", codepoint="\uE3C8")
-    detection_and_zone: Symbol = Symbol(name="detection_and_zone", codepoint="\uE29F")
-    detector: Symbol = Symbol(name="detector", codepoint="\uE282")
-    detector_alarm: Symbol = Symbol(name="detector_alarm", codepoint="\uE1F7")
-    detector_battery: Symbol = Symbol(name="detector_battery", codepoint="\uE204")
-    detector_co: Symbol = Symbol(name="detector_co", codepoint="\uE2AF")
-    detector_offline: Symbol = Symbol(name="detector_offline", codepoint="\uE223")
-    detector_smoke: Symbol = Symbol(name="detector_smoke", codepoint="\uE285")
-    detector_status: Symbol = Symbol(name="detector_status", codepoint="\uE1E8")
-    developer_board: Symbol = Symbol(name="developer_board", codepoint="\uE30D")
-    developer_board_off: Symbol = Symbol(name="developer_board_off", codepoint="\uE4FF")
-    developer_guide: Symbol = Symbol(name="developer_guide", codepoint="\uE99E")
-    developer_mode: Symbol = Symbol(name="developer_mode", codepoint="\uF2E2")
-    developer_mode_tv: Symbol = Symbol(name="developer_mode_tv", codepoint="\uE874")
-    device_band: Symbol = Symbol(name="device_band", codepoint="\uF2F5")
-    device_hub: Symbol = Symbol(name="device_hub", codepoint="\uE335")
-    device_reset: Symbol = Symbol(name="device_reset", codepoint="\uE8B3")
-    device_thermostat: Symbol = Symbol(name="device_thermostat", codepoint="\uE1FF")
-    device_unknown: Symbol = Symbol(name="device_unknown", codepoint="\uF2E1")
-    devices: Symbol = Symbol(name="devices", codepoint="\uE326")
-    devices_fold: Symbol = Symbol(name="devices_fold", codepoint="\uEBDE")
-    devices_fold_2: Symbol = Symbol(name="devices_fold_2", codepoint="\uF406")
-    devices_off: Symbol = Symbol(name="devices_off", codepoint="\uF7A5")
-    devices_other: Symbol = Symbol(name="devices_other", codepoint="\uE337")
-    devices_wearables: Symbol = Symbol(name="devices_wearables", codepoint="\uF6AB")
-    dew_point: Symbol = Symbol(name="dew_point", codepoint="\uF879")
-    diagnosis: Symbol = Symbol(name="diagnosis", codepoint="\uE0A8")
-    diagonal_line: Symbol = Symbol(name="diagonal_line", codepoint="\uF41E")
-    dialer_sip: Symbol = Symbol(name="dialer_sip", codepoint="\uE0BB")
-    dialogs: Symbol = Symbol(name="dialogs", codepoint="\uE99F")
-    dialpad: Symbol = Symbol(name="dialpad", codepoint="\uE0BC")
-    diamond: Symbol = Symbol(name="diamond", codepoint="\uEAD5")
-    diamond_shine: Symbol = Symbol(name="diamond_shine", codepoint="\uF2B2")
-    dictionary: Symbol = Symbol(name="dictionary", codepoint="\uF539")
-    difference: Symbol = Symbol(name="difference", codepoint="\uEB7D")
-    digital_out_of_home: Symbol = Symbol(name="digital_out_of_home", codepoint="\uF1DE")
-    digital_wellbeing: Symbol = Symbol(name="digital_wellbeing", codepoint="\uEF86")
-    dine_heart: Symbol = Symbol(name="dine_heart", codepoint="\uF29C")
-    dine_in: Symbol = Symbol(name="dine_in", codepoint="\uF295")
-    dine_lamp: Symbol = Symbol(name="dine_lamp", codepoint="\uF29B")
-    dining: Symbol = Symbol(name="dining", codepoint="\uEFF4")
-    dinner_dining: Symbol = Symbol(name="dinner_dining", codepoint="\uEA57")
-    directions: Symbol = Symbol(name="directions", codepoint="\uE52E")
-    directions_alt: Symbol = Symbol(name="directions_alt", codepoint="\uF880")
-    directions_alt_off: Symbol = Symbol(name="directions_alt_off", codepoint="\uF881")
-    directions_bike: Symbol = Symbol(name="directions_bike", codepoint="\uE52F")
-    directions_boat: Symbol = Symbol(name="directions_boat", codepoint="\uEFF5")
-    directions_boat_filled: Symbol = Symbol(name="directions_boat_filled", codepoint="\uEFF5")
-    directions_bus: Symbol = Symbol(name="directions_bus", codepoint="\uEFF6")
-    directions_bus_filled: Symbol = Symbol(name="directions_bus_filled", codepoint="\uEFF6")
-    directions_car: Symbol = Symbol(name="directions_car", codepoint="\uEFF7")
-    directions_car_filled: Symbol = Symbol(name="directions_car_filled", codepoint="\uEFF7")
-    directions_off: Symbol = Symbol(name="directions_off", codepoint="\uF10F")
-    directions_railway: Symbol = Symbol(name="directions_railway", codepoint="\uEFF8")
-    directions_railway_2: Symbol = Symbol(name="directions_railway_2", codepoint="\uF462")
-    directions_railway_filled: Symbol = Symbol(name="directions_railway_filled", codepoint="\uEFF8")
-    directions_run: Symbol = Symbol(name="directions_run", codepoint="\uE566")
-    directions_subway: Symbol = Symbol(name="directions_subway", codepoint="\uEFFA")
-    directions_subway_filled: Symbol = Symbol(name="directions_subway_filled", codepoint="\uEFFA")
-    directions_transit: Symbol = Symbol(name="directions_transit", codepoint="\uEFFA")
-    directions_transit_filled: Symbol = Symbol(name="directions_transit_filled", codepoint="\uEFFA")
-    directions_walk: Symbol = Symbol(name="directions_walk", codepoint="\uE536")
-    directory_sync: Symbol = Symbol(name="directory_sync", codepoint="\uE394")
-    dirty_lens: Symbol = Symbol(name="dirty_lens", codepoint="\uEF4B")
-    disabled_by_default: Symbol = Symbol(name="disabled_by_default", codepoint="\uF230")
-    disabled_visible: Symbol = Symbol(name="disabled_visible", codepoint="\uE76E")
-    disc_full: Symbol = Symbol(name="disc_full", codepoint="\uE610")
-    discover_tune: Symbol = Symbol(name="discover_tune", codepoint="\uE018")
-    dishwasher: Symbol = Symbol(name="dishwasher", codepoint="\uE9A0")
-    dishwasher_gen: Symbol = Symbol(name="dishwasher_gen", codepoint="\uE832")
-    display_external_input: Symbol = Symbol(name="display_external_input", codepoint="\uF7E7")
-    display_settings: Symbol = Symbol(name="display_settings", codepoint="\uEB97")
-    distance: Symbol = Symbol(name="distance", codepoint="\uF6EA")
-    diversity_1: Symbol = Symbol(name="diversity_1", codepoint="\uF8D7")
-    diversity_2: Symbol = Symbol(name="diversity_2", codepoint="\uF8D8")
-    diversity_3: Symbol = Symbol(name="diversity_3", codepoint="\uF8D9")
-    diversity_4: Symbol = Symbol(name="diversity_4", codepoint="\uF857")
-    dns: Symbol = Symbol(name="dns", codepoint="\uE875")
-    do_disturb: Symbol = Symbol(name="do_disturb", codepoint="\uF08C")
-    do_disturb_alt: Symbol = Symbol(name="do_disturb_alt", codepoint="\uF08D")
-    do_disturb_off: Symbol = Symbol(name="do_disturb_off", codepoint="\uF08E")
-    do_disturb_on: Symbol = Symbol(name="do_disturb_on", codepoint="\uF08F")
-    do_not_disturb: Symbol = Symbol(name="do_not_disturb", codepoint="\uF08D")
-    do_not_disturb_alt: Symbol = Symbol(name="do_not_disturb_alt", codepoint="\uF08C")
-    do_not_disturb_off: Symbol = Symbol(name="do_not_disturb_off", codepoint="\uF08E")
-    do_not_disturb_on: Symbol = Symbol(name="do_not_disturb_on", codepoint="\uF08F")
-    do_not_disturb_on_total_silence: Symbol = Symbol(name="do_not_disturb_on_total_silence", codepoint="\uEFFB")
-    do_not_step: Symbol = Symbol(name="do_not_step", codepoint="\uF19F")
-    do_not_touch: Symbol = Symbol(name="do_not_touch", codepoint="\uF1B0")
-    dock: Symbol = Symbol(name="dock", codepoint="\uF2E0")
-    dock_to_bottom: Symbol = Symbol(name="dock_to_bottom", codepoint="\uF7E6")
-    dock_to_left: Symbol = Symbol(name="dock_to_left", codepoint="\uF7E5")
-    dock_to_right: Symbol = Symbol(name="dock_to_right", codepoint="\uF7E4")
-    docs: Symbol = Symbol(name="docs", codepoint="\uEA7D")
-    docs_add_on: Symbol = Symbol(name="docs_add_on", codepoint="\uF0C2")
-    docs_apps_script: Symbol = Symbol(name="docs_apps_script", codepoint="\uF0C3")
-    document_scanner: Symbol = Symbol(name="document_scanner", codepoint="\uE5FA")
-    document_search: Symbol = Symbol(name="document_search", codepoint="\uF385")
-    domain: Symbol = Symbol(name="domain", codepoint="\uE7EE")
-    domain_add: Symbol = Symbol(name="domain_add", codepoint="\uEB62")
-    domain_disabled: Symbol = Symbol(name="domain_disabled", codepoint="\uE0EF")
-    domain_verification: Symbol = Symbol(name="domain_verification", codepoint="\uEF4C")
-    domain_verification_off: Symbol = Symbol(name="domain_verification_off", codepoint="\uF7B0")
-    domino_mask: Symbol = Symbol(name="domino_mask", codepoint="\uF5E4")
-    done: Symbol = Symbol(name="done", codepoint="\uE876")
-    done_all: Symbol = Symbol(name="done_all", codepoint="\uE877")
-    done_outline: Symbol = Symbol(name="done_outline", codepoint="\uE92F")
-    donut_large: Symbol = Symbol(name="donut_large", codepoint="\uE917")
-    donut_small: Symbol = Symbol(name="donut_small", codepoint="\uE918")
-    door_back: Symbol = Symbol(name="door_back", codepoint="\uEFFC")
-    door_front: Symbol = Symbol(name="door_front", codepoint="\uEFFD")
-    door_open: Symbol = Symbol(name="door_open", codepoint="\uE77C")
-    door_sensor: Symbol = Symbol(name="door_sensor", codepoint="\uE28A")
-    door_sliding: Symbol = Symbol(name="door_sliding", codepoint="\uEFFE")
-    doorbell: Symbol = Symbol(name="doorbell", codepoint="\uEFFF")
-    doorbell_3p: Symbol = Symbol(name="doorbell_3p", codepoint="\uE1E7")
-    doorbell_chime: Symbol = Symbol(name="doorbell_chime", codepoint="\uE1F3")
-    double_arrow: Symbol = Symbol(name="double_arrow", codepoint="\uEA50")
-    downhill_skiing: Symbol = Symbol(name="downhill_skiing", codepoint="\uE509")
-    download: Symbol = Symbol(name="download", codepoint="\uF090")
-    download_2: Symbol = Symbol(name="download_2", codepoint="\uF523")
-    download_done: Symbol = Symbol(name="download_done", codepoint="\uF091")
-    download_for_offline: Symbol = Symbol(name="download_for_offline", codepoint="\uF000")
-    downloading: Symbol = Symbol(name="downloading", codepoint="\uF001")
-    draft: Symbol = Symbol(name="draft", codepoint="\uE66D")
-    draft_orders: Symbol = Symbol(name="draft_orders", codepoint="\uE7B3")
-    drafts: Symbol = Symbol(name="drafts", codepoint="\uE151")
-    drag_click: Symbol = Symbol(name="drag_click", codepoint="\uF71F")
-    drag_handle: Symbol = Symbol(name="drag_handle", codepoint="\uE25D")
-    drag_indicator: Symbol = Symbol(name="drag_indicator", codepoint="\uE945")
-    drag_pan: Symbol = Symbol(name="drag_pan", codepoint="\uF71E")
-    draw: Symbol = Symbol(name="draw", codepoint="\uE746")
-    draw_abstract: Symbol = Symbol(name="draw_abstract", codepoint="\uF7F8")
-    draw_collage: Symbol = Symbol(name="draw_collage", codepoint="\uF7F7")
-    drawing_recognition: Symbol = Symbol(name="drawing_recognition", codepoint="\uEB00")
-    dresser: Symbol = Symbol(name="dresser", codepoint="\uE210")
-    drive_eta: Symbol = Symbol(name="drive_eta", codepoint="\uEFF7")
-    drive_export: Symbol = Symbol(name="drive_export", codepoint="\uF41D")
-    drive_file_move: Symbol = Symbol(name="drive_file_move", codepoint="\uE9A1")
-    drive_file_move_outline: Symbol = Symbol(name="drive_file_move_outline", codepoint="\uE9A1")
-    drive_file_move_rtl: Symbol = Symbol(name="drive_file_move_rtl", codepoint="\uE9A1")
-    drive_file_rename_outline: Symbol = Symbol(name="drive_file_rename_outline", codepoint="\uE9A2")
-    drive_folder_upload: Symbol = Symbol(name="drive_folder_upload", codepoint="\uE9A3")
-    drive_fusiontable: Symbol = Symbol(name="drive_fusiontable", codepoint="\uE678")
-    drone: Symbol = Symbol(name="drone", codepoint="\uF25A")
-    drone_2: Symbol = Symbol(name="drone_2", codepoint="\uF259")
-    dropdown: Symbol = Symbol(name="dropdown", codepoint="\uE9A4")
-    dropper_eye: Symbol = Symbol(name="dropper_eye", codepoint="\uF351")
-    dry: Symbol = Symbol(name="dry", codepoint="\uF1B3")
-    dry_cleaning: Symbol = Symbol(name="dry_cleaning", codepoint="\uEA58")
-    dual_screen: Symbol = Symbol(name="dual_screen", codepoint="\uF6CF")
-    duo: Symbol = Symbol(name="duo", codepoint="\uE9A5")
-    dvr: Symbol = Symbol(name="dvr", codepoint="\uE1B2")
-    dynamic_feed: Symbol = Symbol(name="dynamic_feed", codepoint="\uEA14")
-    dynamic_form: Symbol = Symbol(name="dynamic_form", codepoint="\uF1BF")
-    e911_avatar: Symbol = Symbol(name="e911_avatar", codepoint="\uF11A")
-    e911_emergency: Symbol = Symbol(name="e911_emergency", codepoint="\uF119")
-    e_mobiledata: Symbol = Symbol(name="e_mobiledata", codepoint="\uF002")
-    e_mobiledata_badge: Symbol = Symbol(name="e_mobiledata_badge", codepoint="\uF7E3")
-    ear_sound: Symbol = Symbol(name="ear_sound", codepoint="\uF356")
-    earbud_case: Symbol = Symbol(name="earbud_case", codepoint="\uF327")
-    earbud_left: Symbol = Symbol(name="earbud_left", codepoint="\uF326")
-    earbud_right: Symbol = Symbol(name="earbud_right", codepoint="\uF325")
-    earbuds: Symbol = Symbol(name="earbuds", codepoint="\uF003")
-    earbuds_2: Symbol = Symbol(name="earbuds_2", codepoint="\uF324")
-    earbuds_battery: Symbol = Symbol(name="earbuds_battery", codepoint="\uF004")
-    early_on: Symbol = Symbol(name="early_on", codepoint="\uE2BA")
-    earthquake: Symbol = Symbol(name="earthquake", codepoint="\uF64F")
-    east: Symbol = Symbol(name="east", codepoint="\uF1DF")
-    ecg: Symbol = Symbol(name="ecg", codepoint="\uF80F")
-    ecg_heart: Symbol = Symbol(name="ecg_heart", codepoint="\uF6E9")
-    eco: Symbol = Symbol(name="eco", codepoint="\uEA35")
-    eda: Symbol = Symbol(name="eda", codepoint="\uF6E8")
-    edgesensor_high: Symbol = Symbol(name="edgesensor_high", codepoint="\uF2EF")
-    edgesensor_low: Symbol = Symbol(name="edgesensor_low", codepoint="\uF2EE")
-    edit: Symbol = Symbol(name="edit", codepoint="\uF097")
-    edit_arrow_down: Symbol = Symbol(name="edit_arrow_down", codepoint="\uF380")
-    edit_arrow_up: Symbol = Symbol(name="edit_arrow_up", codepoint="\uF37F")
-    edit_attributes: Symbol = Symbol(name="edit_attributes", codepoint="\uE578")
-    edit_audio: Symbol = Symbol(name="edit_audio", codepoint="\uF42D")
-    edit_calendar: Symbol = Symbol(name="edit_calendar", codepoint="\uE742")
-    edit_document: Symbol = Symbol(name="edit_document", codepoint="\uF88C")
-    edit_location: Symbol = Symbol(name="edit_location", codepoint="\uE568")
-    edit_location_alt: Symbol = Symbol(name="edit_location_alt", codepoint="\uE1C5")
-    edit_note: Symbol = Symbol(name="edit_note", codepoint="\uE745")
-    edit_notifications: Symbol = Symbol(name="edit_notifications", codepoint="\uE525")
-    edit_off: Symbol = Symbol(name="edit_off", codepoint="\uE950")
-    edit_road: Symbol = Symbol(name="edit_road", codepoint="\uEF4D")
-    edit_square: Symbol = Symbol(name="edit_square", codepoint="\uF88D")
-    editor_choice: Symbol = Symbol(name="editor_choice", codepoint="\uF528")
-    egg: Symbol = Symbol(name="egg", codepoint="\uEACC")
-    egg_alt: Symbol = Symbol(name="egg_alt", codepoint="\uEAC8")
-    eject: Symbol = Symbol(name="eject", codepoint="\uE8FB")
-    elderly: Symbol = Symbol(name="elderly", codepoint="\uF21A")
-    elderly_woman: Symbol = Symbol(name="elderly_woman", codepoint="\uEB69")
-    electric_bike: Symbol = Symbol(name="electric_bike", codepoint="\uEB1B")
-    electric_bolt: Symbol = Symbol(name="electric_bolt", codepoint="\uEC1C")
-    electric_car: Symbol = Symbol(name="electric_car", codepoint="\uEB1C")
-    electric_meter: Symbol = Symbol(name="electric_meter", codepoint="\uEC1B")
-    electric_moped: Symbol = Symbol(name="electric_moped", codepoint="\uEB1D")
-    electric_rickshaw: Symbol = Symbol(name="electric_rickshaw", codepoint="\uEB1E")
-    electric_scooter: Symbol = Symbol(name="electric_scooter", codepoint="\uEB1F")
-    electrical_services: Symbol = Symbol(name="electrical_services", codepoint="\uF102")
-    elevation: Symbol = Symbol(name="elevation", codepoint="\uF6E7")
-    elevator: Symbol = Symbol(name="elevator", codepoint="\uF1A0")
-    email: Symbol = Symbol(name="email", codepoint="\uE159")
-    emergency: Symbol = Symbol(name="emergency", codepoint="\uE1EB")
-    emergency_heat: Symbol = Symbol(name="emergency_heat", codepoint="\uF15D")
-    emergency_heat_2: Symbol = Symbol(name="emergency_heat_2", codepoint="\uF4E5")
-    emergency_home: Symbol = Symbol(name="emergency_home", codepoint="\uE82A")
-    emergency_recording: Symbol = Symbol(name="emergency_recording", codepoint="\uEBF4")
-    emergency_share: Symbol = Symbol(name="emergency_share", codepoint="\uEBF6")
-    emergency_share_off: Symbol = Symbol(name="emergency_share_off", codepoint="\uF59E")
-    emoji_emotions: Symbol = Symbol(name="emoji_emotions", codepoint="\uEA22")
-    emoji_events: Symbol = Symbol(name="emoji_events", codepoint="\uEA23")
-    emoji_flags: Symbol = Symbol(name="emoji_flags", codepoint="\uF0C6")
-    emoji_food_beverage: Symbol = Symbol(name="emoji_food_beverage", codepoint="\uEA1B")
-    emoji_language: Symbol = Symbol(name="emoji_language", codepoint="\uF4CD")
-    emoji_nature: Symbol = Symbol(name="emoji_nature", codepoint="\uEA1C")
-    emoji_objects: Symbol = Symbol(name="emoji_objects", codepoint="\uEA24")
-    emoji_people: Symbol = Symbol(name="emoji_people", codepoint="\uEA1D")
-    emoji_symbols: Symbol = Symbol(name="emoji_symbols", codepoint="\uEA1E")
-    emoji_transportation: Symbol = Symbol(name="emoji_transportation", codepoint="\uEA1F")
-    emoticon: Symbol = Symbol(name="emoticon", codepoint="\uE5F3")
-    empty_dashboard: Symbol = Symbol(name="empty_dashboard", codepoint="\uF844")
-    enable: Symbol = Symbol(name="enable", codepoint="\uF188")
-    encrypted: Symbol = Symbol(name="encrypted", codepoint="\uE593")
-    encrypted_add: Symbol = Symbol(name="encrypted_add", codepoint="\uF429")
-    encrypted_add_circle: Symbol = Symbol(name="encrypted_add_circle", codepoint="\uF42A")
-    encrypted_minus_circle: Symbol = Symbol(name="encrypted_minus_circle", codepoint="\uF428")
-    encrypted_off: Symbol = Symbol(name="encrypted_off", codepoint="\uF427")
-    endocrinology: Symbol = Symbol(name="endocrinology", codepoint="\uE0A9")
-    energy: Symbol = Symbol(name="energy", codepoint="\uE9A6")
-    energy_program_saving: Symbol = Symbol(name="energy_program_saving", codepoint="\uF15F")
-    energy_program_time_used: Symbol = Symbol(name="energy_program_time_used", codepoint="\uF161")
-    energy_savings_leaf: Symbol = Symbol(name="energy_savings_leaf", codepoint="\uEC1A")
-    engineering: Symbol = Symbol(name="engineering", codepoint="\uEA3D")
-    enhanced_encryption: Symbol = Symbol(name="enhanced_encryption", codepoint="\uE63F")
-    ent: Symbol = Symbol(name="ent", codepoint="\uE0AA")
-    enterprise: Symbol = Symbol(name="enterprise", codepoint="\uE70E")
-    enterprise_off: Symbol = Symbol(name="enterprise_off", codepoint="\uEB4D")
-    equal: Symbol = Symbol(name="equal", codepoint="\uF77B")
-    equalizer: Symbol = Symbol(name="equalizer", codepoint="\uE01D")
-    eraser_size_1: Symbol = Symbol(name="eraser_size_1", codepoint="\uF3FC")
-    eraser_size_2: Symbol = Symbol(name="eraser_size_2", codepoint="\uF3FB")
-    eraser_size_3: Symbol = Symbol(name="eraser_size_3", codepoint="\uF3FA")
-    eraser_size_4: Symbol = Symbol(name="eraser_size_4", codepoint="\uF3F9")
-    eraser_size_5: Symbol = Symbol(name="eraser_size_5", codepoint="\uF3F8")
-    error: Symbol = Symbol(name="error", codepoint="\uF8B6")
-    error_circle_rounded: Symbol = Symbol(name="error_circle_rounded", codepoint="\uF8B6")
-    error_med: Symbol = Symbol(name="error_med", codepoint="\uE49B")
-    error_outline: Symbol = Symbol(name="error_outline", codepoint="\uF8B6")
-    escalator: Symbol = Symbol(name="escalator", codepoint="\uF1A1")
-    escalator_warning: Symbol = Symbol(name="escalator_warning", codepoint="\uF1AC")
-    euro: Symbol = Symbol(name="euro", codepoint="\uEA15")
-    euro_symbol: Symbol = Symbol(name="euro_symbol", codepoint="\uE926")
-    ev_charger: Symbol = Symbol(name="ev_charger", codepoint="\uE56D")
-    ev_mobiledata_badge: Symbol = Symbol(name="ev_mobiledata_badge", codepoint="\uF7E2")
-    ev_shadow: Symbol = Symbol(name="ev_shadow", codepoint="\uEF8F")
-    ev_shadow_add: Symbol = Symbol(name="ev_shadow_add", codepoint="\uF580")
-    ev_shadow_minus: Symbol = Symbol(name="ev_shadow_minus", codepoint="\uF57F")
-    ev_station: Symbol = Symbol(name="ev_station", codepoint="\uE56D")
-    event: Symbol = Symbol(name="event", codepoint="\uE878")
-    event_available: Symbol = Symbol(name="event_available", codepoint="\uE614")
-    event_busy: Symbol = Symbol(name="event_busy", codepoint="\uE615")
-    event_list: Symbol = Symbol(name="event_list", codepoint="\uF683")
-    event_note: Symbol = Symbol(name="event_note", codepoint="\uE616")
-    event_repeat: Symbol = Symbol(name="event_repeat", codepoint="\uEB7B")
-    event_seat: Symbol = Symbol(name="event_seat", codepoint="\uE903")
-    event_upcoming: Symbol = Symbol(name="event_upcoming", codepoint="\uF238")
-    exclamation: Symbol = Symbol(name="exclamation", codepoint="\uF22F")
-    exercise: Symbol = Symbol(name="exercise", codepoint="\uF6E6")
-    exit_to_app: Symbol = Symbol(name="exit_to_app", codepoint="\uE879")
-    expand: Symbol = Symbol(name="expand", codepoint="\uE94F")
-    expand_all: Symbol = Symbol(name="expand_all", codepoint="\uE946")
-    expand_circle_down: Symbol = Symbol(name="expand_circle_down", codepoint="\uE7CD")
-    expand_circle_right: Symbol = Symbol(name="expand_circle_right", codepoint="\uF591")
-    expand_circle_up: Symbol = Symbol(name="expand_circle_up", codepoint="\uF5D2")
-    expand_content: Symbol = Symbol(name="expand_content", codepoint="\uF830")
-    expand_less: Symbol = Symbol(name="expand_less", codepoint="\uE5CE")
-    expand_more: Symbol = Symbol(name="expand_more", codepoint="\uE5CF")
-    expansion_panels: Symbol = Symbol(name="expansion_panels", codepoint="\uEF90")
-    expension_panels: Symbol = Symbol(name="expension_panels", codepoint="\uEF90")
-    experiment: Symbol = Symbol(name="experiment", codepoint="\uE686")
-    explicit: Symbol = Symbol(name="explicit", codepoint="\uE01E")
-    explore: Symbol = Symbol(name="explore", codepoint="\uE87A")
-    explore_nearby: Symbol = Symbol(name="explore_nearby", codepoint="\uE538")
-    explore_off: Symbol = Symbol(name="explore_off", codepoint="\uE9A8")
-    explosion: Symbol = Symbol(name="explosion", codepoint="\uF685")
-    export_notes: Symbol = Symbol(name="export_notes", codepoint="\uE0AC")
-    exposure: Symbol = Symbol(name="exposure", codepoint="\uE3F6")
-    exposure_neg_1: Symbol = Symbol(name="exposure_neg_1", codepoint="\uE3CB")
-    exposure_neg_2: Symbol = Symbol(name="exposure_neg_2", codepoint="\uE3CC")
-    exposure_plus_1: Symbol = Symbol(name="exposure_plus_1", codepoint="\uE800")
-    exposure_plus_2: Symbol = Symbol(name="exposure_plus_2", codepoint="\uE3CE")
-    exposure_zero: Symbol = Symbol(name="exposure_zero", codepoint="\uE3CF")
-    extension: Symbol = Symbol(name="extension", codepoint="\uE87B")
-    extension_off: Symbol = Symbol(name="extension_off", codepoint="\uE4F5")
-    eye_tracking: Symbol = Symbol(name="eye_tracking", codepoint="\uF4C9")
-    eyeglasses: Symbol = Symbol(name="eyeglasses", codepoint="\uF6EE")
-    eyeglasses_2: Symbol = Symbol(name="eyeglasses_2", codepoint="\uF2C7")
-    eyeglasses_2_sound: Symbol = Symbol(name="eyeglasses_2_sound", codepoint="\uF265")
-    face: Symbol = Symbol(name="face", codepoint="\uF008")
-    face_2: Symbol = Symbol(name="face_2", codepoint="\uF8DA")
-    face_3: Symbol = Symbol(name="face_3", codepoint="\uF8DB")
-    face_4: Symbol = Symbol(name="face_4", codepoint="\uF8DC")
-    face_5: Symbol = Symbol(name="face_5", codepoint="\uF8DD")
-    face_6: Symbol = Symbol(name="face_6", codepoint="\uF8DE")
-    face_down: Symbol = Symbol(name="face_down", codepoint="\uF402")
-    face_left: Symbol = Symbol(name="face_left", codepoint="\uF401")
-    face_nod: Symbol = Symbol(name="face_nod", codepoint="\uF400")
-    face_retouching_natural: Symbol = Symbol(name="face_retouching_natural", codepoint="\uEF4E")
-    face_retouching_off: Symbol = Symbol(name="face_retouching_off", codepoint="\uF007")
-    face_right: Symbol = Symbol(name="face_right", codepoint="\uF3FF")
-    face_shake: Symbol = Symbol(name="face_shake", codepoint="\uF3FE")
-    face_unlock: Symbol = Symbol(name="face_unlock", codepoint="\uF008")
-    face_up: Symbol = Symbol(name="face_up", codepoint="\uF3FD")
-    fact_check: Symbol = Symbol(name="fact_check", codepoint="\uF0C5")
-    factory: Symbol = Symbol(name="factory", codepoint="\uEBBC")
-    falling: Symbol = Symbol(name="falling", codepoint="\uF60D")
-    familiar_face_and_zone: Symbol = Symbol(name="familiar_face_and_zone", codepoint="\uE21C")
-    family_group: Symbol = Symbol(name="family_group", codepoint="\uEEF2")
-    family_history: Symbol = Symbol(name="family_history", codepoint="\uE0AD")
-    family_home: Symbol = Symbol(name="family_home", codepoint="\uEB26")
-    family_link: Symbol = Symbol(name="family_link", codepoint="\uEB19")
-    family_restroom: Symbol = Symbol(name="family_restroom", codepoint="\uF1A2")
-    family_star: Symbol = Symbol(name="family_star", codepoint="\uF527")
-    fan_focus: Symbol = Symbol(name="fan_focus", codepoint="\uF334")
-    fan_indirect: Symbol = Symbol(name="fan_indirect", codepoint="\uF333")
-    farsight_digital: Symbol = Symbol(name="farsight_digital", codepoint="\uF559")
-    fast_forward: Symbol = Symbol(name="fast_forward", codepoint="\uE01F")
-    fast_rewind: Symbol = Symbol(name="fast_rewind", codepoint="\uE020")
-    fastfood: Symbol = Symbol(name="fastfood", codepoint="\uE57A")
-    faucet: Symbol = Symbol(name="faucet", codepoint="\uE278")
-    favorite: Symbol = Symbol(name="favorite", codepoint="\uE87E")
-    favorite_border: Symbol = Symbol(name="favorite_border", codepoint="\uE87E")
-    fax: Symbol = Symbol(name="fax", codepoint="\uEAD8")
-    feature_search: Symbol = Symbol(name="feature_search", codepoint="\uE9A9")
-    featured_play_list: Symbol = Symbol(name="featured_play_list", codepoint="\uE06D")
-    featured_seasonal_and_gifts: Symbol = Symbol(name="featured_seasonal_and_gifts", codepoint="\uEF91")
-    featured_video: Symbol = Symbol(name="featured_video", codepoint="\uE06E")
-    feed: Symbol = Symbol(name="feed", codepoint="\uF009")
-    feedback: Symbol = Symbol(name="feedback", codepoint="\uE87F")
-    female: Symbol = Symbol(name="female", codepoint="\uE590")
-    femur: Symbol = Symbol(name="femur", codepoint="\uF891")
-    femur_alt: Symbol = Symbol(name="femur_alt", codepoint="\uF892")
-    fence: Symbol = Symbol(name="fence", codepoint="\uF1F6")
-    fertile: Symbol = Symbol(name="fertile", codepoint="\uF6E5")
-    festival: Symbol = Symbol(name="festival", codepoint="\uEA68")
-    fiber_dvr: Symbol = Symbol(name="fiber_dvr", codepoint="\uE05D")
-    fiber_manual_record: Symbol = Symbol(name="fiber_manual_record", codepoint="\uE061")
-    fiber_new: Symbol = Symbol(name="fiber_new", codepoint="\uE05E")
-    fiber_pin: Symbol = Symbol(name="fiber_pin", codepoint="\uE06A")
-    fiber_smart_record: Symbol = Symbol(name="fiber_smart_record", codepoint="\uE062")
-    file_copy: Symbol = Symbol(name="file_copy", codepoint="\uE173")
-    file_copy_off: Symbol = Symbol(name="file_copy_off", codepoint="\uF4D8")
-    file_download: Symbol = Symbol(name="file_download", codepoint="\uF090")
-    file_download_done: Symbol = Symbol(name="file_download_done", codepoint="\uF091")
-    file_download_off: Symbol = Symbol(name="file_download_off", codepoint="\uE4FE")
-    file_export: Symbol = Symbol(name="file_export", codepoint="\uF3B2")
-    file_json: Symbol = Symbol(name="file_json", codepoint="\uF3BB")
-    file_map: Symbol = Symbol(name="file_map", codepoint="\uE2C5")
-    file_map_stack: Symbol = Symbol(name="file_map_stack", codepoint="\uF3E2")
-    file_open: Symbol = Symbol(name="file_open", codepoint="\uEAF3")
-    file_png: Symbol = Symbol(name="file_png", codepoint="\uF3BC")
-    file_present: Symbol = Symbol(name="file_present", codepoint="\uEA0E")
-    file_save: Symbol = Symbol(name="file_save", codepoint="\uF17F")
-    file_save_off: Symbol = Symbol(name="file_save_off", codepoint="\uE505")
-    file_upload: Symbol = Symbol(name="file_upload", codepoint="\uF09B")
-    file_upload_off: Symbol = Symbol(name="file_upload_off", codepoint="\uF886")
-    files: Symbol = Symbol(name="files", codepoint="\uEA85")
-    filter: Symbol = Symbol(name="filter", codepoint="\uE3D3")
-    filter_1: Symbol = Symbol(name="filter_1", codepoint="\uE3D0")
-    filter_2: Symbol = Symbol(name="filter_2", codepoint="\uE3D1")
-    filter_3: Symbol = Symbol(name="filter_3", codepoint="\uE3D2")
-    filter_4: Symbol = Symbol(name="filter_4", codepoint="\uE3D4")
-    filter_5: Symbol = Symbol(name="filter_5", codepoint="\uE3D5")
-    filter_6: Symbol = Symbol(name="filter_6", codepoint="\uE3D6")
-    filter_7: Symbol = Symbol(name="filter_7", codepoint="\uE3D7")
-    filter_8: Symbol = Symbol(name="filter_8", codepoint="\uE3D8")
-    filter_9: Symbol = Symbol(name="filter_9", codepoint="\uE3D9")
-    filter_9_plus: Symbol = Symbol(name="filter_9_plus", codepoint="\uE3DA")
-    filter_alt: Symbol = Symbol(name="filter_alt", codepoint="\uEF4F")
-    filter_alt_off: Symbol = Symbol(name="filter_alt_off", codepoint="\uEB32")
-    filter_arrow_right: Symbol = Symbol(name="filter_arrow_right", codepoint="\uF3D1")
-    filter_b_and_w: Symbol = Symbol(name="filter_b_and_w", codepoint="\uE3DB")
-    filter_center_focus: Symbol = Symbol(name="filter_center_focus", codepoint="\uE3DC")
-    filter_drama: Symbol = Symbol(name="filter_drama", codepoint="\uE3DD")
-    filter_frames: Symbol = Symbol(name="filter_frames", codepoint="\uE3DE")
-    filter_hdr: Symbol = Symbol(name="filter_hdr", codepoint="\uE3DF")
-    filter_list: Symbol = Symbol(name="filter_list", codepoint="\uE152")
-    filter_list_alt: Symbol = Symbol(name="filter_list_alt", codepoint="\uE94E")
-    filter_list_off: Symbol = Symbol(name="filter_list_off", codepoint="\uEB57")
-    filter_none: Symbol = Symbol(name="filter_none", codepoint="\uE3E0")
-    filter_retrolux: Symbol = Symbol(name="filter_retrolux", codepoint="\uE3E1")
-    filter_tilt_shift: Symbol = Symbol(name="filter_tilt_shift", codepoint="\uE3E2")
-    filter_vintage: Symbol = Symbol(name="filter_vintage", codepoint="\uE3E3")
-    finance: Symbol = Symbol(name="finance", codepoint="\uE6BF")
-    finance_chip: Symbol = Symbol(name="finance_chip", codepoint="\uF84E")
-    finance_mode: Symbol = Symbol(name="finance_mode", codepoint="\uEF92")
-    find_in_page: Symbol = Symbol(name="find_in_page", codepoint="\uE880")
-    find_replace: Symbol = Symbol(name="find_replace", codepoint="\uE881")
-    fingerprint: Symbol = Symbol(name="fingerprint", codepoint="\uE90D")
-    fingerprint_off: Symbol = Symbol(name="fingerprint_off", codepoint="\uF49D")
-    fire_extinguisher: Symbol = Symbol(name="fire_extinguisher", codepoint="\uF1D8")
-    fire_hydrant: Symbol = Symbol(name="fire_hydrant", codepoint="\uF1A3")
-    fire_truck: Symbol = Symbol(name="fire_truck", codepoint="\uF8F2")
-    fireplace: Symbol = Symbol(name="fireplace", codepoint="\uEA43")
-    first_page: Symbol = Symbol(name="first_page", codepoint="\uE5DC")
-    fit_page: Symbol = Symbol(name="fit_page", codepoint="\uF77A")
-    fit_page_height: Symbol = Symbol(name="fit_page_height", codepoint="\uF397")
-    fit_page_width: Symbol = Symbol(name="fit_page_width", codepoint="\uF396")
-    fit_screen: Symbol = Symbol(name="fit_screen", codepoint="\uEA10")
-    fit_width: Symbol = Symbol(name="fit_width", codepoint="\uF779")
-    fitness_center: Symbol = Symbol(name="fitness_center", codepoint="\uEB43")
-    fitness_tracker: Symbol = Symbol(name="fitness_tracker", codepoint="\uF463")
-    fitness_trackers: Symbol = Symbol(name="fitness_trackers", codepoint="\uEEF1")
-    flag: Symbol = Symbol(name="flag", codepoint="\uF0C6")
-    flag_2: Symbol = Symbol(name="flag_2", codepoint="\uF40F")
-    flag_check: Symbol = Symbol(name="flag_check", codepoint="\uF3D8")
-    flag_circle: Symbol = Symbol(name="flag_circle", codepoint="\uEAF8")
-    flag_filled: Symbol = Symbol(name="flag_filled", codepoint="\uF0C6")
-    flaky: Symbol = Symbol(name="flaky", codepoint="\uEF50")
-    flare: Symbol = Symbol(name="flare", codepoint="\uE3E4")
-    flash_auto: Symbol = Symbol(name="flash_auto", codepoint="\uE3E5")
-    flash_off: Symbol = Symbol(name="flash_off", codepoint="\uE3E6")
-    flash_on: Symbol = Symbol(name="flash_on", codepoint="\uE3E7")
-    flashlight_off: Symbol = Symbol(name="flashlight_off", codepoint="\uF00A")
-    flashlight_on: Symbol = Symbol(name="flashlight_on", codepoint="\uF00B")
-    flatware: Symbol = Symbol(name="flatware", codepoint="\uF00C")
-    flex_direction: Symbol = Symbol(name="flex_direction", codepoint="\uF778")
-    flex_no_wrap: Symbol = Symbol(name="flex_no_wrap", codepoint="\uF777")
-    flex_wrap: Symbol = Symbol(name="flex_wrap", codepoint="\uF776")
-    flight: Symbol = Symbol(name="flight", codepoint="\uE539")
-    flight_class: Symbol = Symbol(name="flight_class", codepoint="\uE7CB")
-    flight_land: Symbol = Symbol(name="flight_land", codepoint="\uE904")
-    flight_takeoff: Symbol = Symbol(name="flight_takeoff", codepoint="\uE905")
-    flights_and_hotels: Symbol = Symbol(name="flights_and_hotels", codepoint="\uE9AB")
-    flightsmode: Symbol = Symbol(name="flightsmode", codepoint="\uEF93")
-    flip: Symbol = Symbol(name="flip", codepoint="\uE3E8")
-    flip_camera_android: Symbol = Symbol(name="flip_camera_android", codepoint="\uEA37")
-    flip_camera_ios: Symbol = Symbol(name="flip_camera_ios", codepoint="\uEA38")
-    flip_to_back: Symbol = Symbol(name="flip_to_back", codepoint="\uE882")
-    flip_to_front: Symbol = Symbol(name="flip_to_front", codepoint="\uE883")
-    float_landscape_2: Symbol = Symbol(name="float_landscape_2", codepoint="\uF45C")
-    float_portrait_2: Symbol = Symbol(name="float_portrait_2", codepoint="\uF45B")
-    flood: Symbol = Symbol(name="flood", codepoint="\uEBE6")
-    floor: Symbol = Symbol(name="floor", codepoint="\uF6E4")
-    floor_lamp: Symbol = Symbol(name="floor_lamp", codepoint="\uE21E")
-    flourescent: Symbol = Symbol(name="flourescent", codepoint="\uF07D")
-    flowchart: Symbol = Symbol(name="flowchart", codepoint="\uF38D")
-    flowsheet: Symbol = Symbol(name="flowsheet", codepoint="\uE0AE")
-    fluid: Symbol = Symbol(name="fluid", codepoint="\uE483")
-    fluid_balance: Symbol = Symbol(name="fluid_balance", codepoint="\uF80D")
-    fluid_med: Symbol = Symbol(name="fluid_med", codepoint="\uF80C")
-    fluorescent: Symbol = Symbol(name="fluorescent", codepoint="\uF07D")
-    flutter: Symbol = Symbol(name="flutter", codepoint="\uF1DD")
-    flutter_dash: Symbol = Symbol(name="flutter_dash", codepoint="\uE00B")
-    flyover: Symbol = Symbol(name="flyover", codepoint="\uF478")
-    fmd_bad: Symbol = Symbol(name="fmd_bad", codepoint="\uF00E")
-    fmd_good: Symbol = Symbol(name="fmd_good", codepoint="\uF1DB")
-    foggy: Symbol = Symbol(name="foggy", codepoint="\uE818")
-    folded_hands: Symbol = Symbol(name="folded_hands", codepoint="\uF5ED")
-    folder: Symbol = Symbol(name="folder", codepoint="\uE2C7")
-    folder_check: Symbol = Symbol(name="folder_check", codepoint="\uF3D7")
-    folder_check_2: Symbol = Symbol(name="folder_check_2", codepoint="\uF3D6")
-    folder_code: Symbol = Symbol(name="folder_code", codepoint="\uF3C8")
-    folder_copy: Symbol = Symbol(name="folder_copy", codepoint="\uEBBD")
-    folder_data: Symbol = Symbol(name="folder_data", codepoint="\uF586")
-    folder_delete: Symbol = Symbol(name="folder_delete", codepoint="\uEB34")
-    folder_eye: Symbol = Symbol(name="folder_eye", codepoint="\uF3D5")
-    folder_info: Symbol = Symbol(name="folder_info", codepoint="\uF395")
-    folder_limited: Symbol = Symbol(name="folder_limited", codepoint="\uF4E4")
-    folder_managed: Symbol = Symbol(name="folder_managed", codepoint="\uF775")
-    folder_match: Symbol = Symbol(name="folder_match", codepoint="\uF3D4")
-    folder_off: Symbol = Symbol(name="folder_off", codepoint="\uEB83")
-    folder_open: Symbol = Symbol(name="folder_open", codepoint="\uE2C8")
-    folder_shared: Symbol = Symbol(name="folder_shared", codepoint="\uE2C9")
-    folder_special: Symbol = Symbol(name="folder_special", codepoint="\uE617")
-    folder_supervised: Symbol = Symbol(name="folder_supervised", codepoint="\uF774")
-    folder_zip: Symbol = Symbol(name="folder_zip", codepoint="\uEB2C")
-    follow_the_signs: Symbol = Symbol(name="follow_the_signs", codepoint="\uF222")
-    font_download: Symbol = Symbol(name="font_download", codepoint="\uE167")
-    font_download_off: Symbol = Symbol(name="font_download_off", codepoint="\uE4F9")
-    food_bank: Symbol = Symbol(name="food_bank", codepoint="\uF1F2")
-    foot_bones: Symbol = Symbol(name="foot_bones", codepoint="\uF893")
-    footprint: Symbol = Symbol(name="footprint", codepoint="\uF87D")
-    for_you: Symbol = Symbol(name="for_you", codepoint="\uE9AC")
-    forest: Symbol = Symbol(name="forest", codepoint="\uEA99")
-    fork_left: Symbol = Symbol(name="fork_left", codepoint="\uEBA0")
-    fork_right: Symbol = Symbol(name="fork_right", codepoint="\uEBAC")
-    fork_spoon: Symbol = Symbol(name="fork_spoon", codepoint="\uF3E4")
-    forklift: Symbol = Symbol(name="forklift", codepoint="\uF868")
-    format_align_center: Symbol = Symbol(name="format_align_center", codepoint="\uE234")
-    format_align_justify: Symbol = Symbol(name="format_align_justify", codepoint="\uE235")
-    format_align_left: Symbol = Symbol(name="format_align_left", codepoint="\uE236")
-    format_align_right: Symbol = Symbol(name="format_align_right", codepoint="\uE237")
-    format_bold: Symbol = Symbol(name="format_bold", codepoint="\uE238")
-    format_clear: Symbol = Symbol(name="format_clear", codepoint="\uE239")
-    format_color_fill: Symbol = Symbol(name="format_color_fill", codepoint="\uE23A")
-    format_color_reset: Symbol = Symbol(name="format_color_reset", codepoint="\uE23B")
-    format_color_text: Symbol = Symbol(name="format_color_text", codepoint="\uE23C")
-    format_h1: Symbol = Symbol(name="format_h1", codepoint="\uF85D")
-    format_h2: Symbol = Symbol(name="format_h2", codepoint="\uF85E")
-    format_h3: Symbol = Symbol(name="format_h3", codepoint="\uF85F")
-    format_h4: Symbol = Symbol(name="format_h4", codepoint="\uF860")
-    format_h5: Symbol = Symbol(name="format_h5", codepoint="\uF861")
-    format_h6: Symbol = Symbol(name="format_h6", codepoint="\uF862")
-    format_image_left: Symbol = Symbol(name="format_image_left", codepoint="\uF863")
-    format_image_right: Symbol = Symbol(name="format_image_right", codepoint="\uF864")
-    format_indent_decrease: Symbol = Symbol(name="format_indent_decrease", codepoint="\uE23D")
-    format_indent_increase: Symbol = Symbol(name="format_indent_increase", codepoint="\uE23E")
-    format_ink_highlighter: Symbol = Symbol(name="format_ink_highlighter", codepoint="\uF82B")
-    format_italic: Symbol = Symbol(name="format_italic", codepoint="\uE23F")
-    format_letter_spacing: Symbol = Symbol(name="format_letter_spacing", codepoint="\uF773")
-    format_letter_spacing_2: Symbol = Symbol(name="format_letter_spacing_2", codepoint="\uF618")
-    format_letter_spacing_standard: Symbol = Symbol(name="format_letter_spacing_standard", codepoint="\uF617")
-    format_letter_spacing_wide: Symbol = Symbol(name="format_letter_spacing_wide", codepoint="\uF616")
-    format_letter_spacing_wider: Symbol = Symbol(name="format_letter_spacing_wider", codepoint="\uF615")
-    format_line_spacing: Symbol = Symbol(name="format_line_spacing", codepoint="\uE240")
-    format_list_bulleted: Symbol = Symbol(name="format_list_bulleted", codepoint="\uE241")
-    format_list_bulleted_add: Symbol = Symbol(name="format_list_bulleted_add", codepoint="\uF849")
-    format_list_numbered: Symbol = Symbol(name="format_list_numbered", codepoint="\uE242")
-    format_list_numbered_rtl: Symbol = Symbol(name="format_list_numbered_rtl", codepoint="\uE267")
-    format_overline: Symbol = Symbol(name="format_overline", codepoint="\uEB65")
-    format_paint: Symbol = Symbol(name="format_paint", codepoint="\uE243")
-    format_paragraph: Symbol = Symbol(name="format_paragraph", codepoint="\uF865")
-    format_quote: Symbol = Symbol(name="format_quote", codepoint="\uE244")
-    format_quote_off: Symbol = Symbol(name="format_quote_off", codepoint="\uF413")
-    format_shapes: Symbol = Symbol(name="format_shapes", codepoint="\uE25E")
-    format_size: Symbol = Symbol(name="format_size", codepoint="\uE245")
-    format_strikethrough: Symbol = Symbol(name="format_strikethrough", codepoint="\uE246")
-    format_text_clip: Symbol = Symbol(name="format_text_clip", codepoint="\uF82A")
-    format_text_overflow: Symbol = Symbol(name="format_text_overflow", codepoint="\uF829")
-    format_text_wrap: Symbol = Symbol(name="format_text_wrap", codepoint="\uF828")
-    format_textdirection_l_to_r: Symbol = Symbol(name="format_textdirection_l_to_r", codepoint="\uE247")
-    format_textdirection_r_to_l: Symbol = Symbol(name="format_textdirection_r_to_l", codepoint="\uE248")
-    format_textdirection_vertical: Symbol = Symbol(name="format_textdirection_vertical", codepoint="\uF4B8")
-    format_underlined: Symbol = Symbol(name="format_underlined", codepoint="\uE249")
-    format_underlined_squiggle: Symbol = Symbol(name="format_underlined_squiggle", codepoint="\uF885")
-    forms_add_on: Symbol = Symbol(name="forms_add_on", codepoint="\uF0C7")
-    forms_apps_script: Symbol = Symbol(name="forms_apps_script", codepoint="\uF0C8")
-    fort: Symbol = Symbol(name="fort", codepoint="\uEAAD")
-    forum: Symbol = Symbol(name="forum", codepoint="\uE8AF")
-    forward: Symbol = Symbol(name="forward", codepoint="\uF57A")
-    forward_10: Symbol = Symbol(name="forward_10", codepoint="\uE056")
-    forward_30: Symbol = Symbol(name="forward_30", codepoint="\uE057")
-    forward_5: Symbol = Symbol(name="forward_5", codepoint="\uE058")
-    forward_circle: Symbol = Symbol(name="forward_circle", codepoint="\uF6F5")
-    forward_media: Symbol = Symbol(name="forward_media", codepoint="\uF6F4")
-    forward_to_inbox: Symbol = Symbol(name="forward_to_inbox", codepoint="\uF187")
-    foundation: Symbol = Symbol(name="foundation", codepoint="\uF200")
-    fragrance: Symbol = Symbol(name="fragrance", codepoint="\uF345")
-    frame_bug: Symbol = Symbol(name="frame_bug", codepoint="\uEEEF")
-    frame_exclamation: Symbol = Symbol(name="frame_exclamation", codepoint="\uEEEE")
-    frame_inspect: Symbol = Symbol(name="frame_inspect", codepoint="\uF772")
-    frame_person: Symbol = Symbol(name="frame_person", codepoint="\uF8A6")
-    frame_person_mic: Symbol = Symbol(name="frame_person_mic", codepoint="\uF4D5")
-    frame_person_off: Symbol = Symbol(name="frame_person_off", codepoint="\uF7D1")
-    frame_reload: Symbol = Symbol(name="frame_reload", codepoint="\uF771")
-    frame_source: Symbol = Symbol(name="frame_source", codepoint="\uF770")
-    free_breakfast: Symbol = Symbol(name="free_breakfast", codepoint="\uEB44")
-    free_cancellation: Symbol = Symbol(name="free_cancellation", codepoint="\uE748")
-    front_hand: Symbol = Symbol(name="front_hand", codepoint="\uE769")
-    front_loader: Symbol = Symbol(name="front_loader", codepoint="\uF869")
-    full_coverage: Symbol = Symbol(name="full_coverage", codepoint="\uEB12")
-    full_hd: Symbol = Symbol(name="full_hd", codepoint="\uF58B")
-    full_stacked_bar_chart: Symbol = Symbol(name="full_stacked_bar_chart", codepoint="\uF212")
-    fullscreen: Symbol = Symbol(name="fullscreen", codepoint="\uE5D0")
-    fullscreen_exit: Symbol = Symbol(name="fullscreen_exit", codepoint="\uE5D1")
-    fullscreen_portrait: Symbol = Symbol(name="fullscreen_portrait", codepoint="\uF45A")
-    function: Symbol = Symbol(name="function", codepoint="\uF866")
-    functions: Symbol = Symbol(name="functions", codepoint="\uE24A")
-    funicular: Symbol = Symbol(name="funicular", codepoint="\uF477")
-    g_mobiledata: Symbol = Symbol(name="g_mobiledata", codepoint="\uF010")
-    g_mobiledata_badge: Symbol = Symbol(name="g_mobiledata_badge", codepoint="\uF7E1")
-    g_translate: Symbol = Symbol(name="g_translate", codepoint="\uE927")
-    gallery_thumbnail: Symbol = Symbol(name="gallery_thumbnail", codepoint="\uF86F")
-    gamepad: Symbol = Symbol(name="gamepad", codepoint="\uE30F")
-    games: Symbol = Symbol(name="games", codepoint="\uE30F")
-    garage: Symbol = Symbol(name="garage", codepoint="\uF011")
-    garage_check: Symbol = Symbol(name="garage_check", codepoint="\uF28D")
-    garage_door: Symbol = Symbol(name="garage_door", codepoint="\uE714")
-    garage_home: Symbol = Symbol(name="garage_home", codepoint="\uE82D")
-    garage_money: Symbol = Symbol(name="garage_money", codepoint="\uF28C")
-    garden_cart: Symbol = Symbol(name="garden_cart", codepoint="\uF8A9")
-    gas_meter: Symbol = Symbol(name="gas_meter", codepoint="\uEC19")
-    gastroenterology: Symbol = Symbol(name="gastroenterology", codepoint="\uE0F1")
-    gate: Symbol = Symbol(name="gate", codepoint="\uE277")
-    gavel: Symbol = Symbol(name="gavel", codepoint="\uE90E")
-    general_device: Symbol = Symbol(name="general_device", codepoint="\uE6DE")
-    generating_tokens: Symbol = Symbol(name="generating_tokens", codepoint="\uE749")
-    genetics: Symbol = Symbol(name="genetics", codepoint="\uE0F3")
-    genres: Symbol = Symbol(name="genres", codepoint="\uE6EE")
-    gesture: Symbol = Symbol(name="gesture", codepoint="\uE155")
-    gesture_select: Symbol = Symbol(name="gesture_select", codepoint="\uF657")
-    get_app: Symbol = Symbol(name="get_app", codepoint="\uF090")
-    gif: Symbol = Symbol(name="gif", codepoint="\uE908")
-    gif_2: Symbol = Symbol(name="gif_2", codepoint="\uF40E")
-    gif_box: Symbol = Symbol(name="gif_box", codepoint="\uE7A3")
-    girl: Symbol = Symbol(name="girl", codepoint="\uEB68")
-    gite: Symbol = Symbol(name="gite", codepoint="\uE58B")
-    glass_cup: Symbol = Symbol(name="glass_cup", codepoint="\uF6E3")
-    globe: Symbol = Symbol(name="globe", codepoint="\uE64C")
-    globe_asia: Symbol = Symbol(name="globe_asia", codepoint="\uF799")
-    globe_book: Symbol = Symbol(name="globe_book", codepoint="\uF3C9")
-    globe_location_pin: Symbol = Symbol(name="globe_location_pin", codepoint="\uF35D")
-    globe_uk: Symbol = Symbol(name="globe_uk", codepoint="\uF798")
-    glucose: Symbol = Symbol(name="glucose", codepoint="\uE4A0")
-    glyphs: Symbol = Symbol(name="glyphs", codepoint="\uF8A3")
-    go_to_line: Symbol = Symbol(name="go_to_line", codepoint="\uF71D")
-    golf_course: Symbol = Symbol(name="golf_course", codepoint="\uEB45")
-    gondola_lift: Symbol = Symbol(name="gondola_lift", codepoint="\uF476")
-    google_home_devices: Symbol = Symbol(name="google_home_devices", codepoint="\uE715")
-    google_plus_reshare: Symbol = Symbol(name="google_plus_reshare", codepoint="\uF57A")
-    google_tv_remote: Symbol = Symbol(name="google_tv_remote", codepoint="\uF5DB")
-    google_wifi: Symbol = Symbol(name="google_wifi", codepoint="\uF579")
-    gpp_bad: Symbol = Symbol(name="gpp_bad", codepoint="\uF012")
-    gpp_good: Symbol = Symbol(name="gpp_good", codepoint="\uF013")
-    gpp_maybe: Symbol = Symbol(name="gpp_maybe", codepoint="\uF014")
-    gps_fixed: Symbol = Symbol(name="gps_fixed", codepoint="\uE55C")
-    gps_not_fixed: Symbol = Symbol(name="gps_not_fixed", codepoint="\uE1B7")
-    gps_off: Symbol = Symbol(name="gps_off", codepoint="\uE1B6")
-    grade: Symbol = Symbol(name="grade", codepoint="\uF09A")
-    gradient: Symbol = Symbol(name="gradient", codepoint="\uE3E9")
-    grading: Symbol = Symbol(name="grading", codepoint="\uEA4F")
-    grain: Symbol = Symbol(name="grain", codepoint="\uE3EA")
-    graph_1: Symbol = Symbol(name="graph_1", codepoint="\uF3A0")
-    graph_2: Symbol = Symbol(name="graph_2", codepoint="\uF39F")
-    graph_3: Symbol = Symbol(name="graph_3", codepoint="\uF39E")
-    graph_4: Symbol = Symbol(name="graph_4", codepoint="\uF39D")
-    graph_5: Symbol = Symbol(name="graph_5", codepoint="\uF39C")
-    graph_6: Symbol = Symbol(name="graph_6", codepoint="\uF39B")
-    graph_7: Symbol = Symbol(name="graph_7", codepoint="\uF346")
-    graphic_eq: Symbol = Symbol(name="graphic_eq", codepoint="\uE1B8")
-    grass: Symbol = Symbol(name="grass", codepoint="\uF205")
-    grid_3x3: Symbol = Symbol(name="grid_3x3", codepoint="\uF015")
-    grid_3x3_off: Symbol = Symbol(name="grid_3x3_off", codepoint="\uF67C")
-    grid_4x4: Symbol = Symbol(name="grid_4x4", codepoint="\uF016")
-    grid_goldenratio: Symbol = Symbol(name="grid_goldenratio", codepoint="\uF017")
-    grid_guides: Symbol = Symbol(name="grid_guides", codepoint="\uF76F")
-    grid_off: Symbol = Symbol(name="grid_off", codepoint="\uE3EB")
-    grid_on: Symbol = Symbol(name="grid_on", codepoint="\uE3EC")
-    grid_view: Symbol = Symbol(name="grid_view", codepoint="\uE9B0")
-    grocery: Symbol = Symbol(name="grocery", codepoint="\uEF97")
-    group: Symbol = Symbol(name="group", codepoint="\uEA21")
-    group_add: Symbol = Symbol(name="group_add", codepoint="\uE7F0")
-    group_off: Symbol = Symbol(name="group_off", codepoint="\uE747")
-    group_remove: Symbol = Symbol(name="group_remove", codepoint="\uE7AD")
-    group_search: Symbol = Symbol(name="group_search", codepoint="\uF3CE")
-    group_work: Symbol = Symbol(name="group_work", codepoint="\uE886")
-    grouped_bar_chart: Symbol = Symbol(name="grouped_bar_chart", codepoint="\uF211")
-    groups: Symbol = Symbol(name="groups", codepoint="\uF233")
-    groups_2: Symbol = Symbol(name="groups_2", codepoint="\uF8DF")
-    groups_3: Symbol = Symbol(name="groups_3", codepoint="\uF8E0")
-    guardian: Symbol = Symbol(name="guardian", codepoint="\uF4C1")
-    gynecology: Symbol = Symbol(name="gynecology", codepoint="\uE0F4")
-    h_mobiledata: Symbol = Symbol(name="h_mobiledata", codepoint="\uF018")
-    h_mobiledata_badge: Symbol = Symbol(name="h_mobiledata_badge", codepoint="\uF7E0")
-    h_plus_mobiledata: Symbol = Symbol(name="h_plus_mobiledata", codepoint="\uF019")
-    h_plus_mobiledata_badge: Symbol = Symbol(name="h_plus_mobiledata_badge", codepoint="\uF7DF")
-    hail: Symbol = Symbol(name="hail", codepoint="\uE9B1")
-    hallway: Symbol = Symbol(name="hallway", codepoint="\uE6F8")
-    hanami_dango: Symbol = Symbol(name="hanami_dango", codepoint="\uF23F")
-    hand_bones: Symbol = Symbol(name="hand_bones", codepoint="\uF894")
-    hand_gesture: Symbol = Symbol(name="hand_gesture", codepoint="\uEF9C")
-    hand_gesture_off: Symbol = Symbol(name="hand_gesture_off", codepoint="\uF3F3")
-    hand_meal: Symbol = Symbol(name="hand_meal", codepoint="\uF294")
-    hand_package: Symbol = Symbol(name="hand_package", codepoint="\uF293")
-    handheld_controller: Symbol = Symbol(name="handheld_controller", codepoint="\uF4C6")
-    handshake: Symbol = Symbol(name="handshake", codepoint="\uEBCB")
-    handwriting_recognition: Symbol = Symbol(name="handwriting_recognition", codepoint="\uEB02")
-    handyman: Symbol = Symbol(name="handyman", codepoint="\uF10B")
-    hangout_video: Symbol = Symbol(name="hangout_video", codepoint="\uE0C1")
-    hangout_video_off: Symbol = Symbol(name="hangout_video_off", codepoint="\uE0C2")
-    hard_disk: Symbol = Symbol(name="hard_disk", codepoint="\uF3DA")
-    hard_drive: Symbol = Symbol(name="hard_drive", codepoint="\uF80E")
-    hard_drive_2: Symbol = Symbol(name="hard_drive_2", codepoint="\uF7A4")
-    hardware: Symbol = Symbol(name="hardware", codepoint="\uEA59")
-    hd: Symbol = Symbol(name="hd", codepoint="\uE052")
-    hdr_auto: Symbol = Symbol(name="hdr_auto", codepoint="\uF01A")
-    hdr_auto_select: Symbol = Symbol(name="hdr_auto_select", codepoint="\uF01B")
-    hdr_enhanced_select: Symbol = Symbol(name="hdr_enhanced_select", codepoint="\uEF51")
-    hdr_off: Symbol = Symbol(name="hdr_off", codepoint="\uE3ED")
-    hdr_off_select: Symbol = Symbol(name="hdr_off_select", codepoint="\uF01C")
-    hdr_on: Symbol = Symbol(name="hdr_on", codepoint="\uE3EE")
-    hdr_on_select: Symbol = Symbol(name="hdr_on_select", codepoint="\uF01D")
-    hdr_plus: Symbol = Symbol(name="hdr_plus", codepoint="\uF01E")
-    hdr_plus_off: Symbol = Symbol(name="hdr_plus_off", codepoint="\uE3EF")
-    hdr_strong: Symbol = Symbol(name="hdr_strong", codepoint="\uE3F1")
-    hdr_weak: Symbol = Symbol(name="hdr_weak", codepoint="\uE3F2")
-    head_mounted_device: Symbol = Symbol(name="head_mounted_device", codepoint="\uF4C5")
-    headphones: Symbol = Symbol(name="headphones", codepoint="\uF01F")
-    headphones_battery: Symbol = Symbol(name="headphones_battery", codepoint="\uF020")
-    headset: Symbol = Symbol(name="headset", codepoint="\uF01F")
-    headset_mic: Symbol = Symbol(name="headset_mic", codepoint="\uE311")
-    headset_off: Symbol = Symbol(name="headset_off", codepoint="\uE33A")
-    healing: Symbol = Symbol(name="healing", codepoint="\uE3F3")
-    health_and_beauty: Symbol = Symbol(name="health_and_beauty", codepoint="\uEF9D")
-    health_and_safety: Symbol = Symbol(name="health_and_safety", codepoint="\uE1D5")
-    health_cross: Symbol = Symbol(name="health_cross", codepoint="\uF2C3")
-    health_metrics: Symbol = Symbol(name="health_metrics", codepoint="\uF6E2")
-    heap_snapshot_large: Symbol = Symbol(name="heap_snapshot_large", codepoint="\uF76E")
-    heap_snapshot_multiple: Symbol = Symbol(name="heap_snapshot_multiple", codepoint="\uF76D")
-    heap_snapshot_thumbnail: Symbol = Symbol(name="heap_snapshot_thumbnail", codepoint="\uF76C")
-    hearing: Symbol = Symbol(name="hearing", codepoint="\uE023")
-    hearing_aid: Symbol = Symbol(name="hearing_aid", codepoint="\uF464")
-    hearing_aid_disabled: Symbol = Symbol(name="hearing_aid_disabled", codepoint="\uF3B0")
-    hearing_aid_disabled_left: Symbol = Symbol(name="hearing_aid_disabled_left", codepoint="\uF2EC")
-    hearing_aid_left: Symbol = Symbol(name="hearing_aid_left", codepoint="\uF2ED")
-    hearing_disabled: Symbol = Symbol(name="hearing_disabled", codepoint="\uF104")
-    heart_broken: Symbol = Symbol(name="heart_broken", codepoint="\uEAC2")
-    heart_check: Symbol = Symbol(name="heart_check", codepoint="\uF60A")
-    heart_minus: Symbol = Symbol(name="heart_minus", codepoint="\uF883")
-    heart_plus: Symbol = Symbol(name="heart_plus", codepoint="\uF884")
-    heart_smile: Symbol = Symbol(name="heart_smile", codepoint="\uF292")
-    heat: Symbol = Symbol(name="heat", codepoint="\uF537")
-    heat_pump: Symbol = Symbol(name="heat_pump", codepoint="\uEC18")
-    heat_pump_balance: Symbol = Symbol(name="heat_pump_balance", codepoint="\uE27E")
-    height: Symbol = Symbol(name="height", codepoint="\uEA16")
-    helicopter: Symbol = Symbol(name="helicopter", codepoint="\uF60C")
-    help: Symbol = Symbol(name="help", codepoint="\uE8FD")
-    help_center: Symbol = Symbol(name="help_center", codepoint="\uF1C0")
-    help_clinic: Symbol = Symbol(name="help_clinic", codepoint="\uF810")
-    help_outline: Symbol = Symbol(name="help_outline", codepoint="\uE8FD")
-    hematology: Symbol = Symbol(name="hematology", codepoint="\uE0F6")
-    hevc: Symbol = Symbol(name="hevc", codepoint="\uF021")
-    hexagon: Symbol = Symbol(name="hexagon", codepoint="\uEB39")
-    hide: Symbol = Symbol(name="hide", codepoint="\uEF9E")
-    hide_image: Symbol = Symbol(name="hide_image", codepoint="\uF022")
-    hide_source: Symbol = Symbol(name="hide_source", codepoint="\uF023")
-    high_chair: Symbol = Symbol(name="high_chair", codepoint="\uF29A")
-    high_density: Symbol = Symbol(name="high_density", codepoint="\uF79C")
-    high_quality: Symbol = Symbol(name="high_quality", codepoint="\uE024")
-    high_res: Symbol = Symbol(name="high_res", codepoint="\uF54B")
-    highlight: Symbol = Symbol(name="highlight", codepoint="\uE25F")
-    highlight_alt: Symbol = Symbol(name="highlight_alt", codepoint="\uEF52")
-    highlight_keyboard_focus: Symbol = Symbol(name="highlight_keyboard_focus", codepoint="\uF510")
-    highlight_mouse_cursor: Symbol = Symbol(name="highlight_mouse_cursor", codepoint="\uF511")
-    highlight_off: Symbol = Symbol(name="highlight_off", codepoint="\uE888")
-    highlight_text_cursor: Symbol = Symbol(name="highlight_text_cursor", codepoint="\uF512")
-    highlighter_size_1: Symbol = Symbol(name="highlighter_size_1", codepoint="\uF76B")
-    highlighter_size_2: Symbol = Symbol(name="highlighter_size_2", codepoint="\uF76A")
-    highlighter_size_3: Symbol = Symbol(name="highlighter_size_3", codepoint="\uF769")
-    highlighter_size_4: Symbol = Symbol(name="highlighter_size_4", codepoint="\uF768")
-    highlighter_size_5: Symbol = Symbol(name="highlighter_size_5", codepoint="\uF767")
-    hiking: Symbol = Symbol(name="hiking", codepoint="\uE50A")
-    history: Symbol = Symbol(name="history", codepoint="\uE8B3")
-    history_2: Symbol = Symbol(name="history_2", codepoint="\uF3E6")
-    history_edu: Symbol = Symbol(name="history_edu", codepoint="\uEA3E")
-    history_off: Symbol = Symbol(name="history_off", codepoint="\uF4DA")
-    history_toggle_off: Symbol = Symbol(name="history_toggle_off", codepoint="\uF17D")
-    hive: Symbol = Symbol(name="hive", codepoint="\uEAA6")
-    hls: Symbol = Symbol(name="hls", codepoint="\uEB8A")
-    hls_off: Symbol = Symbol(name="hls_off", codepoint="\uEB8C")
-    holiday_village: Symbol = Symbol(name="holiday_village", codepoint="\uE58A")
-    home: Symbol = Symbol(name="home", codepoint="\uE9B2")
-    home_and_garden: Symbol = Symbol(name="home_and_garden", codepoint="\uEF9F")
-    home_app_logo: Symbol = Symbol(name="home_app_logo", codepoint="\uE295")
-    home_filled: Symbol = Symbol(name="home_filled", codepoint="\uE9B2")
-    home_health: Symbol = Symbol(name="home_health", codepoint="\uE4B9")
-    home_improvement_and_tools: Symbol = Symbol(name="home_improvement_and_tools", codepoint="\uEFA0")
-    home_iot_device: Symbol = Symbol(name="home_iot_device", codepoint="\uE283")
-    home_max: Symbol = Symbol(name="home_max", codepoint="\uF024")
-    home_max_dots: Symbol = Symbol(name="home_max_dots", codepoint="\uE849")
-    home_mini: Symbol = Symbol(name="home_mini", codepoint="\uF025")
-    home_pin: Symbol = Symbol(name="home_pin", codepoint="\uF14D")
-    home_repair_service: Symbol = Symbol(name="home_repair_service", codepoint="\uF100")
-    home_speaker: Symbol = Symbol(name="home_speaker", codepoint="\uF11C")
-    home_storage: Symbol = Symbol(name="home_storage", codepoint="\uF86C")
-    home_work: Symbol = Symbol(name="home_work", codepoint="\uF030")
-    horizontal_distribute: Symbol = Symbol(name="horizontal_distribute", codepoint="\uE014")
-    horizontal_rule: Symbol = Symbol(name="horizontal_rule", codepoint="\uF108")
-    horizontal_split: Symbol = Symbol(name="horizontal_split", codepoint="\uE947")
-    host: Symbol = Symbol(name="host", codepoint="\uF3D9")
-    hot_tub: Symbol = Symbol(name="hot_tub", codepoint="\uEB46")
-    hotel: Symbol = Symbol(name="hotel", codepoint="\uE549")
-    hotel_class: Symbol = Symbol(name="hotel_class", codepoint="\uE743")
-    hourglass: Symbol = Symbol(name="hourglass", codepoint="\uEBFF")
-    hourglass_arrow_down: Symbol = Symbol(name="hourglass_arrow_down", codepoint="\uF37E")
-    hourglass_arrow_up: Symbol = Symbol(name="hourglass_arrow_up", codepoint="\uF37D")
-    hourglass_bottom: Symbol = Symbol(name="hourglass_bottom", codepoint="\uEA5C")
-    hourglass_disabled: Symbol = Symbol(name="hourglass_disabled", codepoint="\uEF53")
-    hourglass_empty: Symbol = Symbol(name="hourglass_empty", codepoint="\uE88B")
-    hourglass_full: Symbol = Symbol(name="hourglass_full", codepoint="\uE88C")
-    hourglass_pause: Symbol = Symbol(name="hourglass_pause", codepoint="\uF38C")
-    hourglass_top: Symbol = Symbol(name="hourglass_top", codepoint="\uEA5B")
-    house: Symbol = Symbol(name="house", codepoint="\uEA44")
-    house_siding: Symbol = Symbol(name="house_siding", codepoint="\uF202")
-    house_with_shield: Symbol = Symbol(name="house_with_shield", codepoint="\uE786")
-    houseboat: Symbol = Symbol(name="houseboat", codepoint="\uE584")
-    household_supplies: Symbol = Symbol(name="household_supplies", codepoint="\uEFA1")
-    hov: Symbol = Symbol(name="hov", codepoint="\uF475")
-    how_to_reg: Symbol = Symbol(name="how_to_reg", codepoint="\uE174")
-    how_to_vote: Symbol = Symbol(name="how_to_vote", codepoint="\uE175")
-    hr_resting: Symbol = Symbol(name="hr_resting", codepoint="\uF6BA")
-    html: Symbol = Symbol(name="html", codepoint="\uEB7E")
-    http: Symbol = Symbol(name="http", codepoint="\uE902")
-    https: Symbol = Symbol(name="https", codepoint="\uE899")
-    hub: Symbol = Symbol(name="hub", codepoint="\uE9F4")
-    humerus: Symbol = Symbol(name="humerus", codepoint="\uF895")
-    humerus_alt: Symbol = Symbol(name="humerus_alt", codepoint="\uF896")
-    humidity_high: Symbol = Symbol(name="humidity_high", codepoint="\uF163")
-    humidity_indoor: Symbol = Symbol(name="humidity_indoor", codepoint="\uF558")
-    humidity_low: Symbol = Symbol(name="humidity_low", codepoint="\uF164")
-    humidity_mid: Symbol = Symbol(name="humidity_mid", codepoint="\uF165")
-    humidity_percentage: Symbol = Symbol(name="humidity_percentage", codepoint="\uF87E")
-    hvac: Symbol = Symbol(name="hvac", codepoint="\uF10E")
-    hvac_max_defrost: Symbol = Symbol(name="hvac_max_defrost", codepoint="\uF332")
-    ice_skating: Symbol = Symbol(name="ice_skating", codepoint="\uE50B")
-    icecream: Symbol = Symbol(name="icecream", codepoint="\uEA69")
-    id_card: Symbol = Symbol(name="id_card", codepoint="\uF4CA")
-    identity_aware_proxy: Symbol = Symbol(name="identity_aware_proxy", codepoint="\uE2DD")
-    identity_platform: Symbol = Symbol(name="identity_platform", codepoint="\uEBB7")
-    ifl: Symbol = Symbol(name="ifl", codepoint="\uE025")
-    iframe: Symbol = Symbol(name="iframe", codepoint="\uF71B")
-    iframe_off: Symbol = Symbol(name="iframe_off", codepoint="\uF71C")
-    image: Symbol = Symbol(name="image", codepoint="\uE3F4")
-    image_arrow_up: Symbol = Symbol(name="image_arrow_up", codepoint="\uF317")
-    image_aspect_ratio: Symbol = Symbol(name="image_aspect_ratio", codepoint="\uE3F5")
-    image_inset: Symbol = Symbol(name="image_inset", codepoint="\uF247")
-    image_not_supported: Symbol = Symbol(name="image_not_supported", codepoint="\uF116")
-    image_search: Symbol = Symbol(name="image_search", codepoint="\uE43F")
-    imagesearch_roller: Symbol = Symbol(name="imagesearch_roller", codepoint="\uE9B4")
-    imagesmode: Symbol = Symbol(name="imagesmode", codepoint="\uEFA2")
-    immunology: Symbol = Symbol(name="immunology", codepoint="\uE0FB")
-    import_contacts: Symbol = Symbol(name="import_contacts", codepoint="\uE0E0")
-    import_export: Symbol = Symbol(name="import_export", codepoint="\uE8D5")
-    important_devices: Symbol = Symbol(name="important_devices", codepoint="\uE912")
-    in_home_mode: Symbol = Symbol(name="in_home_mode", codepoint="\uE833")
-    inactive_order: Symbol = Symbol(name="inactive_order", codepoint="\uE0FC")
-    inbox: Symbol = Symbol(name="inbox", codepoint="\uE156")
-    inbox_customize: Symbol = Symbol(name="inbox_customize", codepoint="\uF859")
-    inbox_text: Symbol = Symbol(name="inbox_text", codepoint="\uF399")
-    inbox_text_asterisk: Symbol = Symbol(name="inbox_text_asterisk", codepoint="\uF360")
-    inbox_text_person: Symbol = Symbol(name="inbox_text_person", codepoint="\uF35E")
-    inbox_text_share: Symbol = Symbol(name="inbox_text_share", codepoint="\uF35C")
-    incomplete_circle: Symbol = Symbol(name="incomplete_circle", codepoint="\uE79B")
-    indeterminate_check_box: Symbol = Symbol(name="indeterminate_check_box", codepoint="\uE909")
-    indeterminate_question_box: Symbol = Symbol(name="indeterminate_question_box", codepoint="\uF56D")
-    info: Symbol = Symbol(name="info", codepoint="\uE88E")
-    info_i: Symbol = Symbol(name="info_i", codepoint="\uF59B")
-    infrared: Symbol = Symbol(name="infrared", codepoint="\uF87C")
-    ink_eraser: Symbol = Symbol(name="ink_eraser", codepoint="\uE6D0")
-    ink_eraser_off: Symbol = Symbol(name="ink_eraser_off", codepoint="\uE7E3")
-    ink_highlighter: Symbol = Symbol(name="ink_highlighter", codepoint="\uE6D1")
-    ink_highlighter_move: Symbol = Symbol(name="ink_highlighter_move", codepoint="\uF524")
-    ink_marker: Symbol = Symbol(name="ink_marker", codepoint="\uE6D2")
-    ink_pen: Symbol = Symbol(name="ink_pen", codepoint="\uE6D3")
-    ink_selection: Symbol = Symbol(name="ink_selection", codepoint="\uEF52")
-    inpatient: Symbol = Symbol(name="inpatient", codepoint="\uE0FE")
-    input: Symbol = Symbol(name="input", codepoint="\uE890")
-    input_circle: Symbol = Symbol(name="input_circle", codepoint="\uF71A")
-    insert_chart: Symbol = Symbol(name="insert_chart", codepoint="\uF0CC")
-    insert_chart_filled: Symbol = Symbol(name="insert_chart_filled", codepoint="\uF0CC")
-    insert_chart_outlined: Symbol = Symbol(name="insert_chart_outlined", codepoint="\uF0CC")
-    insert_comment: Symbol = Symbol(name="insert_comment", codepoint="\uE24C")
-    insert_drive_file: Symbol = Symbol(name="insert_drive_file", codepoint="\uE66D")
-    insert_emoticon: Symbol = Symbol(name="insert_emoticon", codepoint="\uEA22")
-    insert_invitation: Symbol = Symbol(name="insert_invitation", codepoint="\uE878")
-    insert_link: Symbol = Symbol(name="insert_link", codepoint="\uE250")
-    insert_page_break: Symbol = Symbol(name="insert_page_break", codepoint="\uEACA")
-    insert_photo: Symbol = Symbol(name="insert_photo", codepoint="\uE3F4")
-    insert_text: Symbol = Symbol(name="insert_text", codepoint="\uF827")
-    insights: Symbol = Symbol(name="insights", codepoint="\uF092")
-    install_desktop: Symbol = Symbol(name="install_desktop", codepoint="\uEB71")
-    install_mobile: Symbol = Symbol(name="install_mobile", codepoint="\uF2CD")
-    instant_mix: Symbol = Symbol(name="instant_mix", codepoint="\uE026")
-    integration_instructions: Symbol = Symbol(name="integration_instructions", codepoint="\uEF54")
-    interactive_space: Symbol = Symbol(name="interactive_space", codepoint="\uF7FF")
-    interests: Symbol = Symbol(name="interests", codepoint="\uE7C8")
-    interpreter_mode: Symbol = Symbol(name="interpreter_mode", codepoint="\uE83B")
-    inventory: Symbol = Symbol(name="inventory", codepoint="\uE179")
-    inventory_2: Symbol = Symbol(name="inventory_2", codepoint="\uE1A1")
-    invert_colors: Symbol = Symbol(name="invert_colors", codepoint="\uE891")
-    invert_colors_off: Symbol = Symbol(name="invert_colors_off", codepoint="\uE0C4")
-    ios: Symbol = Symbol(name="ios", codepoint="\uE027")
-    ios_share: Symbol = Symbol(name="ios_share", codepoint="\uE6B8")
-    iron: Symbol = Symbol(name="iron", codepoint="\uE583")
-    iso: Symbol = Symbol(name="iso", codepoint="\uE3F6")
-    jamboard_kiosk: Symbol = Symbol(name="jamboard_kiosk", codepoint="\uE9B5")
-    japanese_curry: Symbol = Symbol(name="japanese_curry", codepoint="\uF284")
-    japanese_flag: Symbol = Symbol(name="japanese_flag", codepoint="\uF283")
-    javascript: Symbol = Symbol(name="javascript", codepoint="\uEB7C")
-    join: Symbol = Symbol(name="join", codepoint="\uF84F")
-    join_full: Symbol = Symbol(name="join_full", codepoint="\uF84F")
-    join_inner: Symbol = Symbol(name="join_inner", codepoint="\uEAF4")
-    join_left: Symbol = Symbol(name="join_left", codepoint="\uEAF2")
-    join_right: Symbol = Symbol(name="join_right", codepoint="\uEAEA")
-    joystick: Symbol = Symbol(name="joystick", codepoint="\uF5EE")
-    jump_to_element: Symbol = Symbol(name="jump_to_element", codepoint="\uF719")
-    kanji_alcohol: Symbol = Symbol(name="kanji_alcohol", codepoint="\uF23E")
-    kayaking: Symbol = Symbol(name="kayaking", codepoint="\uE50C")
-    kebab_dining: Symbol = Symbol(name="kebab_dining", codepoint="\uE842")
-    keep: Symbol = Symbol(name="keep", codepoint="\uF026")
-    keep_off: Symbol = Symbol(name="keep_off", codepoint="\uE6F9")
-    keep_pin: Symbol = Symbol(name="keep_pin", codepoint="\uF026")
-    keep_public: Symbol = Symbol(name="keep_public", codepoint="\uF56F")
-    kettle: Symbol = Symbol(name="kettle", codepoint="\uE2B9")
-    key: Symbol = Symbol(name="key", codepoint="\uE73C")
-    key_off: Symbol = Symbol(name="key_off", codepoint="\uEB84")
-    key_vertical: Symbol = Symbol(name="key_vertical", codepoint="\uF51A")
-    key_visualizer: Symbol = Symbol(name="key_visualizer", codepoint="\uF199")
-    keyboard: Symbol = Symbol(name="keyboard", codepoint="\uE312")
-    keyboard_alt: Symbol = Symbol(name="keyboard_alt", codepoint="\uF028")
-    keyboard_arrow_down: Symbol = Symbol(name="keyboard_arrow_down", codepoint="\uE313")
-    keyboard_arrow_left: Symbol = Symbol(name="keyboard_arrow_left", codepoint="\uE314")
-    keyboard_arrow_right: Symbol = Symbol(name="keyboard_arrow_right", codepoint="\uE315")
-    keyboard_arrow_up: Symbol = Symbol(name="keyboard_arrow_up", codepoint="\uE316")
-    keyboard_backspace: Symbol = Symbol(name="keyboard_backspace", codepoint="\uE317")
-    keyboard_capslock: Symbol = Symbol(name="keyboard_capslock", codepoint="\uE318")
-    keyboard_capslock_badge: Symbol = Symbol(name="keyboard_capslock_badge", codepoint="\uF7DE")
-    keyboard_command_key: Symbol = Symbol(name="keyboard_command_key", codepoint="\uEAE7")
-    keyboard_control_key: Symbol = Symbol(name="keyboard_control_key", codepoint="\uEAE6")
-    keyboard_double_arrow_down: Symbol = Symbol(name="keyboard_double_arrow_down", codepoint="\uEAD0")
-    keyboard_double_arrow_left: Symbol = Symbol(name="keyboard_double_arrow_left", codepoint="\uEAC3")
-    keyboard_double_arrow_right: Symbol = Symbol(name="keyboard_double_arrow_right", codepoint="\uEAC9")
-    keyboard_double_arrow_up: Symbol = Symbol(name="keyboard_double_arrow_up", codepoint="\uEACF")
-    keyboard_external_input: Symbol = Symbol(name="keyboard_external_input", codepoint="\uF7DD")
-    keyboard_full: Symbol = Symbol(name="keyboard_full", codepoint="\uF7DC")
-    keyboard_hide: Symbol = Symbol(name="keyboard_hide", codepoint="\uE31A")
-    keyboard_keys: Symbol = Symbol(name="keyboard_keys", codepoint="\uF67B")
-    keyboard_lock: Symbol = Symbol(name="keyboard_lock", codepoint="\uF492")
-    keyboard_lock_off: Symbol = Symbol(name="keyboard_lock_off", codepoint="\uF491")
-    keyboard_off: Symbol = Symbol(name="keyboard_off", codepoint="\uF67A")
-    keyboard_onscreen: Symbol = Symbol(name="keyboard_onscreen", codepoint="\uF7DB")
-    keyboard_option_key: Symbol = Symbol(name="keyboard_option_key", codepoint="\uEAE8")
-    keyboard_previous_language: Symbol = Symbol(name="keyboard_previous_language", codepoint="\uF7DA")
-    keyboard_return: Symbol = Symbol(name="keyboard_return", codepoint="\uE31B")
-    keyboard_tab: Symbol = Symbol(name="keyboard_tab", codepoint="\uE31C")
-    keyboard_tab_rtl: Symbol = Symbol(name="keyboard_tab_rtl", codepoint="\uEC73")
-    keyboard_voice: Symbol = Symbol(name="keyboard_voice", codepoint="\uE31D")
-    kid_star: Symbol = Symbol(name="kid_star", codepoint="\uF526")
-    king_bed: Symbol = Symbol(name="king_bed", codepoint="\uEA45")
-    kitchen: Symbol = Symbol(name="kitchen", codepoint="\uEB47")
-    kitesurfing: Symbol = Symbol(name="kitesurfing", codepoint="\uE50D")
-    lab_panel: Symbol = Symbol(name="lab_panel", codepoint="\uE103")
-    lab_profile: Symbol = Symbol(name="lab_profile", codepoint="\uE104")
-    lab_research: Symbol = Symbol(name="lab_research", codepoint="\uF80B")
-    label: Symbol = Symbol(name="label", codepoint="\uE893")
-    label_important: Symbol = Symbol(name="label_important", codepoint="\uE948")
-    label_important_outline: Symbol = Symbol(name="label_important_outline", codepoint="\uE948")
-    label_off: Symbol = Symbol(name="label_off", codepoint="\uE9B6")
-    label_outline: Symbol = Symbol(name="label_outline", codepoint="\uE893")
-    labs: Symbol = Symbol(name="labs", codepoint="\uE105")
-    lan: Symbol = Symbol(name="lan", codepoint="\uEB2F")
-    landscape: Symbol = Symbol(name="landscape", codepoint="\uE564")
-    landscape_2: Symbol = Symbol(name="landscape_2", codepoint="\uF4C4")
-    landscape_2_edit: Symbol = Symbol(name="landscape_2_edit", codepoint="\uF310")
-    landscape_2_off: Symbol = Symbol(name="landscape_2_off", codepoint="\uF4C3")
-    landslide: Symbol = Symbol(name="landslide", codepoint="\uEBD7")
-    language: Symbol = Symbol(name="language", codepoint="\uE894")
-    language_chinese_array: Symbol = Symbol(name="language_chinese_array", codepoint="\uF766")
-    language_chinese_cangjie: Symbol = Symbol(name="language_chinese_cangjie", codepoint="\uF765")
-    language_chinese_dayi: Symbol = Symbol(name="language_chinese_dayi", codepoint="\uF764")
-    language_chinese_pinyin: Symbol = Symbol(name="language_chinese_pinyin", codepoint="\uF763")
-    language_chinese_quick: Symbol = Symbol(name="language_chinese_quick", codepoint="\uF762")
-    language_chinese_wubi: Symbol = Symbol(name="language_chinese_wubi", codepoint="\uF761")
-    language_french: Symbol = Symbol(name="language_french", codepoint="\uF760")
-    language_gb_english: Symbol = Symbol(name="language_gb_english", codepoint="\uF75F")
-    language_international: Symbol = Symbol(name="language_international", codepoint="\uF75E")
-    language_japanese_kana: Symbol = Symbol(name="language_japanese_kana", codepoint="\uF513")
-    language_korean_latin: Symbol = Symbol(name="language_korean_latin", codepoint="\uF75D")
-    language_pinyin: Symbol = Symbol(name="language_pinyin", codepoint="\uF75C")
-    language_spanish: Symbol = Symbol(name="language_spanish", codepoint="\uF5E9")
-    language_us: Symbol = Symbol(name="language_us", codepoint="\uF759")
-    language_us_colemak: Symbol = Symbol(name="language_us_colemak", codepoint="\uF75B")
-    language_us_dvorak: Symbol = Symbol(name="language_us_dvorak", codepoint="\uF75A")
-    laps: Symbol = Symbol(name="laps", codepoint="\uF6B9")
-    laptop: Symbol = Symbol(name="laptop", codepoint="\uE31E")
-    laptop_car: Symbol = Symbol(name="laptop_car", codepoint="\uF3CD")
-    laptop_chromebook: Symbol = Symbol(name="laptop_chromebook", codepoint="\uE31F")
-    laptop_mac: Symbol = Symbol(name="laptop_mac", codepoint="\uE320")
-    laptop_windows: Symbol = Symbol(name="laptop_windows", codepoint="\uE321")
-    lasso_select: Symbol = Symbol(name="lasso_select", codepoint="\uEB03")
-    last_page: Symbol = Symbol(name="last_page", codepoint="\uE5DD")
-    launch: Symbol = Symbol(name="launch", codepoint="\uE89E")
-    laundry: Symbol = Symbol(name="laundry", codepoint="\uE2A8")
-    layers: Symbol = Symbol(name="layers", codepoint="\uE53B")
-    layers_clear: Symbol = Symbol(name="layers_clear", codepoint="\uE53C")
-    lda: Symbol = Symbol(name="lda", codepoint="\uE106")
-    leaderboard: Symbol = Symbol(name="leaderboard", codepoint="\uF20C")
-    leak_add: Symbol = Symbol(name="leak_add", codepoint="\uE3F8")
-    leak_remove: Symbol = Symbol(name="leak_remove", codepoint="\uE3F9")
-    left_click: Symbol = Symbol(name="left_click", codepoint="\uF718")
-    left_panel_close: Symbol = Symbol(name="left_panel_close", codepoint="\uF717")
-    left_panel_open: Symbol = Symbol(name="left_panel_open", codepoint="\uF716")
-    legend_toggle: Symbol = Symbol(name="legend_toggle", codepoint="\uF11B")
-    lens: Symbol = Symbol(name="lens", codepoint="\uE3FA")
-    lens_blur: Symbol = Symbol(name="lens_blur", codepoint="\uF029")
-    letter_switch: Symbol = Symbol(name="letter_switch", codepoint="\uF758")
-    library_add: Symbol = Symbol(name="library_add", codepoint="\uE03C")
-    library_add_check: Symbol = Symbol(name="library_add_check", codepoint="\uE9B7")
-    library_books: Symbol = Symbol(name="library_books", codepoint="\uE02F")
-    library_music: Symbol = Symbol(name="library_music", codepoint="\uE030")
-    license: Symbol = Symbol(name="license", codepoint="\uEB04")
-    lift_to_talk: Symbol = Symbol(name="lift_to_talk", codepoint="\uEFA3")
-    light: Symbol = Symbol(name="light", codepoint="\uF02A")
-    light_group: Symbol = Symbol(name="light_group", codepoint="\uE28B")
-    light_mode: Symbol = Symbol(name="light_mode", codepoint="\uE518")
-    light_off: Symbol = Symbol(name="light_off", codepoint="\uE9B8")
-    lightbulb: Symbol = Symbol(name="lightbulb", codepoint="\uE90F")
-    lightbulb_2: Symbol = Symbol(name="lightbulb_2", codepoint="\uF3E3")
-    lightbulb_circle: Symbol = Symbol(name="lightbulb_circle", codepoint="\uEBFE")
-    lightbulb_outline: Symbol = Symbol(name="lightbulb_outline", codepoint="\uE90F")
-    lightning_stand: Symbol = Symbol(name="lightning_stand", codepoint="\uEFA4")
-    line_axis: Symbol = Symbol(name="line_axis", codepoint="\uEA9A")
-    line_curve: Symbol = Symbol(name="line_curve", codepoint="\uF757")
-    line_end: Symbol = Symbol(name="line_end", codepoint="\uF826")
-    line_end_arrow: Symbol = Symbol(name="line_end_arrow", codepoint="\uF81D")
-    line_end_arrow_notch: Symbol = Symbol(name="line_end_arrow_notch", codepoint="\uF81C")
-    line_end_circle: Symbol = Symbol(name="line_end_circle", codepoint="\uF81B")
-    line_end_diamond: Symbol = Symbol(name="line_end_diamond", codepoint="\uF81A")
-    line_end_square: Symbol = Symbol(name="line_end_square", codepoint="\uF819")
-    line_start: Symbol = Symbol(name="line_start", codepoint="\uF825")
-    line_start_arrow: Symbol = Symbol(name="line_start_arrow", codepoint="\uF818")
-    line_start_arrow_notch: Symbol = Symbol(name="line_start_arrow_notch", codepoint="\uF817")
-    line_start_circle: Symbol = Symbol(name="line_start_circle", codepoint="\uF816")
-    line_start_diamond: Symbol = Symbol(name="line_start_diamond", codepoint="\uF815")
-    line_start_square: Symbol = Symbol(name="line_start_square", codepoint="\uF814")
-    line_style: Symbol = Symbol(name="line_style", codepoint="\uE919")
-    line_weight: Symbol = Symbol(name="line_weight", codepoint="\uE91A")
-    linear_scale: Symbol = Symbol(name="linear_scale", codepoint="\uE260")
-    link: Symbol = Symbol(name="link", codepoint="\uE250")
-    link_off: Symbol = Symbol(name="link_off", codepoint="\uE16F")
-    linked_camera: Symbol = Symbol(name="linked_camera", codepoint="\uE438")
-    linked_services: Symbol = Symbol(name="linked_services", codepoint="\uF535")
-    liquor: Symbol = Symbol(name="liquor", codepoint="\uEA60")
-    list: Symbol = Symbol(name="list", codepoint="\uE896")
-    list_alt: Symbol = Symbol(name="list_alt", codepoint="\uE0EE")
-    list_alt_add: Symbol = Symbol(name="list_alt_add", codepoint="\uF756")
-    list_alt_check: Symbol = Symbol(name="list_alt_check", codepoint="\uF3DE")
-    lists: Symbol = Symbol(name="lists", codepoint="\uE9B9")
-    live_help: Symbol = Symbol(name="live_help", codepoint="\uE0C6")
-    live_tv: Symbol = Symbol(name="live_tv", codepoint="\uE63A")
-    living: Symbol = Symbol(name="living", codepoint="\uF02B")
-    local_activity: Symbol = Symbol(name="local_activity", codepoint="\uE553")
-    local_airport: Symbol = Symbol(name="local_airport", codepoint="\uE53D")
-    local_atm: Symbol = Symbol(name="local_atm", codepoint="\uE53E")
-    local_bar: Symbol = Symbol(name="local_bar", codepoint="\uE540")
-    local_cafe: Symbol = Symbol(name="local_cafe", codepoint="\uEB44")
-    local_car_wash: Symbol = Symbol(name="local_car_wash", codepoint="\uE542")
-    local_convenience_store: Symbol = Symbol(name="local_convenience_store", codepoint="\uE543")
-    local_dining: Symbol = Symbol(name="local_dining", codepoint="\uE561")
-    local_drink: Symbol = Symbol(name="local_drink", codepoint="\uE544")
-    local_fire_department: Symbol = Symbol(name="local_fire_department", codepoint="\uEF55")
-    local_florist: Symbol = Symbol(name="local_florist", codepoint="\uE545")
-    local_gas_station: Symbol = Symbol(name="local_gas_station", codepoint="\uE546")
-    local_grocery_store: Symbol = Symbol(name="local_grocery_store", codepoint="\uE8CC")
-    local_hospital: Symbol = Symbol(name="local_hospital", codepoint="\uE548")
-    local_hotel: Symbol = Symbol(name="local_hotel", codepoint="\uE549")
-    local_laundry_service: Symbol = Symbol(name="local_laundry_service", codepoint="\uE54A")
-    local_library: Symbol = Symbol(name="local_library", codepoint="\uE54B")
-    local_mall: Symbol = Symbol(name="local_mall", codepoint="\uE54C")
-    local_movies: Symbol = Symbol(name="local_movies", codepoint="\uE8DA")
-    local_offer: Symbol = Symbol(name="local_offer", codepoint="\uF05B")
-    local_parking: Symbol = Symbol(name="local_parking", codepoint="\uE54F")
-    local_pharmacy: Symbol = Symbol(name="local_pharmacy", codepoint="\uE550")
-    local_phone: Symbol = Symbol(name="local_phone", codepoint="\uF0D4")
-    local_pizza: Symbol = Symbol(name="local_pizza", codepoint="\uE552")
-    local_play: Symbol = Symbol(name="local_play", codepoint="\uE553")
-    local_police: Symbol = Symbol(name="local_police", codepoint="\uEF56")
-    local_post_office: Symbol = Symbol(name="local_post_office", codepoint="\uE554")
-    local_printshop: Symbol = Symbol(name="local_printshop", codepoint="\uE8AD")
-    local_see: Symbol = Symbol(name="local_see", codepoint="\uE557")
-    local_shipping: Symbol = Symbol(name="local_shipping", codepoint="\uE558")
-    local_taxi: Symbol = Symbol(name="local_taxi", codepoint="\uE559")
-    location_automation: Symbol = Symbol(name="location_automation", codepoint="\uF14F")
-    location_away: Symbol = Symbol(name="location_away", codepoint="\uF150")
-    location_chip: Symbol = Symbol(name="location_chip", codepoint="\uF850")
-    location_city: Symbol = Symbol(name="location_city", codepoint="\uE7F1")
-    location_disabled: Symbol = Symbol(name="location_disabled", codepoint="\uE1B6")
-    location_home: Symbol = Symbol(name="location_home", codepoint="\uF152")
-    location_off: Symbol = Symbol(name="location_off", codepoint="\uE0C7")
-    location_on: Symbol = Symbol(name="location_on", codepoint="\uF1DB")
-    location_pin: Symbol = Symbol(name="location_pin", codepoint="\uF1DB")
-    location_searching: Symbol = Symbol(name="location_searching", codepoint="\uE1B7")
-    locator_tag: Symbol = Symbol(name="locator_tag", codepoint="\uF8C1")
-    lock: Symbol = Symbol(name="lock", codepoint="\uE899")
-    lock_clock: Symbol = Symbol(name="lock_clock", codepoint="\uEF57")
-    lock_open: Symbol = Symbol(name="lock_open", codepoint="\uE898")
-    lock_open_circle: Symbol = Symbol(name="lock_open_circle", codepoint="\uF361")
-    lock_open_right: Symbol = Symbol(name="lock_open_right", codepoint="\uF656")
-    lock_outline: Symbol = Symbol(name="lock_outline", codepoint="\uE899")
-    lock_person: Symbol = Symbol(name="lock_person", codepoint="\uF8F3")
-    lock_reset: Symbol = Symbol(name="lock_reset", codepoint="\uEADE")
-    login: Symbol = Symbol(name="login", codepoint="\uEA77")
-    logo_dev: Symbol = Symbol(name="logo_dev", codepoint="\uEAD6")
-    logout: Symbol = Symbol(name="logout", codepoint="\uE9BA")
-    looks: Symbol = Symbol(name="looks", codepoint="\uE3FC")
-    looks_3: Symbol = Symbol(name="looks_3", codepoint="\uE3FB")
-    looks_4: Symbol = Symbol(name="looks_4", codepoint="\uE3FD")
-    looks_5: Symbol = Symbol(name="looks_5", codepoint="\uE3FE")
-    looks_6: Symbol = Symbol(name="looks_6", codepoint="\uE3FF")
-    looks_one: Symbol = Symbol(name="looks_one", codepoint="\uE400")
-    looks_two: Symbol = Symbol(name="looks_two", codepoint="\uE401")
-    loop: Symbol = Symbol(name="loop", codepoint="\uE863")
-    loupe: Symbol = Symbol(name="loupe", codepoint="\uE402")
-    low_density: Symbol = Symbol(name="low_density", codepoint="\uF79B")
-    low_priority: Symbol = Symbol(name="low_priority", codepoint="\uE16D")
-    lowercase: Symbol = Symbol(name="lowercase", codepoint="\uF48A")
-    loyalty: Symbol = Symbol(name="loyalty", codepoint="\uE89A")
-    lte_mobiledata: Symbol = Symbol(name="lte_mobiledata", codepoint="\uF02C")
-    lte_mobiledata_badge: Symbol = Symbol(name="lte_mobiledata_badge", codepoint="\uF7D9")
-    lte_plus_mobiledata: Symbol = Symbol(name="lte_plus_mobiledata", codepoint="\uF02D")
-    lte_plus_mobiledata_badge: Symbol = Symbol(name="lte_plus_mobiledata_badge", codepoint="\uF7D8")
-    luggage: Symbol = Symbol(name="luggage", codepoint="\uF235")
-    lunch_dining: Symbol = Symbol(name="lunch_dining", codepoint="\uEA61")
-    lyrics: Symbol = Symbol(name="lyrics", codepoint="\uEC0B")
-    macro_auto: Symbol = Symbol(name="macro_auto", codepoint="\uF6F2")
-    macro_off: Symbol = Symbol(name="macro_off", codepoint="\uF8D2")
-    magic_button: Symbol = Symbol(name="magic_button", codepoint="\uF136")
-    magic_exchange: Symbol = Symbol(name="magic_exchange", codepoint="\uF7F4")
-    magic_tether: Symbol = Symbol(name="magic_tether", codepoint="\uF7D7")
-    magnification_large: Symbol = Symbol(name="magnification_large", codepoint="\uF83D")
-    magnification_small: Symbol = Symbol(name="magnification_small", codepoint="\uF83C")
-    magnify_docked: Symbol = Symbol(name="magnify_docked", codepoint="\uF7D6")
-    magnify_fullscreen: Symbol = Symbol(name="magnify_fullscreen", codepoint="\uF7D5")
-    mail: Symbol = Symbol(name="mail", codepoint="\uE159")
-    mail_asterisk: Symbol = Symbol(name="mail_asterisk", codepoint="\uEEF4")
-    mail_lock: Symbol = Symbol(name="mail_lock", codepoint="\uEC0A")
-    mail_off: Symbol = Symbol(name="mail_off", codepoint="\uF48B")
-    mail_outline: Symbol = Symbol(name="mail_outline", codepoint="\uE159")
-    mail_shield: Symbol = Symbol(name="mail_shield", codepoint="\uF249")
-    male: Symbol = Symbol(name="male", codepoint="\uE58E")
-    man: Symbol = Symbol(name="man", codepoint="\uE4EB")
-    man_2: Symbol = Symbol(name="man_2", codepoint="\uF8E1")
-    man_3: Symbol = Symbol(name="man_3", codepoint="\uF8E2")
-    man_4: Symbol = Symbol(name="man_4", codepoint="\uF8E3")
-    manage_accounts: Symbol = Symbol(name="manage_accounts", codepoint="\uF02E")
-    manage_history: Symbol = Symbol(name="manage_history", codepoint="\uEBE7")
-    manage_search: Symbol = Symbol(name="manage_search", codepoint="\uF02F")
-    manga: Symbol = Symbol(name="manga", codepoint="\uF5E3")
-    manufacturing: Symbol = Symbol(name="manufacturing", codepoint="\uE726")
-    map: Symbol = Symbol(name="map", codepoint="\uE55B")
-    map_pin_heart: Symbol = Symbol(name="map_pin_heart", codepoint="\uF298")
-    map_pin_review: Symbol = Symbol(name="map_pin_review", codepoint="\uF297")
-    map_search: Symbol = Symbol(name="map_search", codepoint="\uF3CA")
-    maps_home_work: Symbol = Symbol(name="maps_home_work", codepoint="\uF030")
-    maps_ugc: Symbol = Symbol(name="maps_ugc", codepoint="\uEF58")
-    margin: Symbol = Symbol(name="margin", codepoint="\uE9BB")
-    mark_as_unread: Symbol = Symbol(name="mark_as_unread", codepoint="\uE9BC")
-    mark_chat_read: Symbol = Symbol(name="mark_chat_read", codepoint="\uF18B")
-    mark_chat_unread: Symbol = Symbol(name="mark_chat_unread", codepoint="\uF189")
-    mark_email_read: Symbol = Symbol(name="mark_email_read", codepoint="\uF18C")
-    mark_email_unread: Symbol = Symbol(name="mark_email_unread", codepoint="\uF18A")
-    mark_unread_chat_alt: Symbol = Symbol(name="mark_unread_chat_alt", codepoint="\uEB9D")
-    markdown: Symbol = Symbol(name="markdown", codepoint="\uF552")
-    markdown_copy: Symbol = Symbol(name="markdown_copy", codepoint="\uF553")
-    markdown_paste: Symbol = Symbol(name="markdown_paste", codepoint="\uF554")
-    markunread: Symbol = Symbol(name="markunread", codepoint="\uE159")
-    markunread_mailbox: Symbol = Symbol(name="markunread_mailbox", codepoint="\uE89B")
-    masked_transitions: Symbol = Symbol(name="masked_transitions", codepoint="\uE72E")
-    masked_transitions_add: Symbol = Symbol(name="masked_transitions_add", codepoint="\uF42B")
-    masks: Symbol = Symbol(name="masks", codepoint="\uF218")
-    massage: Symbol = Symbol(name="massage", codepoint="\uF2C2")
-    match_case: Symbol = Symbol(name="match_case", codepoint="\uF6F1")
-    match_case_off: Symbol = Symbol(name="match_case_off", codepoint="\uF36F")
-    match_word: Symbol = Symbol(name="match_word", codepoint="\uF6F0")
-    matter: Symbol = Symbol(name="matter", codepoint="\uE907")
-    maximize: Symbol = Symbol(name="maximize", codepoint="\uE930")
-    meal_dinner: Symbol = Symbol(name="meal_dinner", codepoint="\uF23D")
-    meal_lunch: Symbol = Symbol(name="meal_lunch", codepoint="\uF23C")
-    measuring_tape: Symbol = Symbol(name="measuring_tape", codepoint="\uF6AF")
-    media_bluetooth_off: Symbol = Symbol(name="media_bluetooth_off", codepoint="\uF031")
-    media_bluetooth_on: Symbol = Symbol(name="media_bluetooth_on", codepoint="\uF032")
-    media_link: Symbol = Symbol(name="media_link", codepoint="\uF83F")
-    media_output: Symbol = Symbol(name="media_output", codepoint="\uF4F2")
-    media_output_off: Symbol = Symbol(name="media_output_off", codepoint="\uF4F3")
-    mediation: Symbol = Symbol(name="mediation", codepoint="\uEFA7")
-    medical_information: Symbol = Symbol(name="medical_information", codepoint="\uEBED")
-    medical_mask: Symbol = Symbol(name="medical_mask", codepoint="\uF80A")
-    medical_services: Symbol = Symbol(name="medical_services", codepoint="\uF109")
-    medication: Symbol = Symbol(name="medication", codepoint="\uF033")
-    medication_liquid: Symbol = Symbol(name="medication_liquid", codepoint="\uEA87")
-    meeting_room: Symbol = Symbol(name="meeting_room", codepoint="\uEB4F")
-    memory: Symbol = Symbol(name="memory", codepoint="\uE322")
-    memory_alt: Symbol = Symbol(name="memory_alt", codepoint="\uF7A3")
-    menstrual_health: Symbol = Symbol(name="menstrual_health", codepoint="\uF6E1")
-    menu: Symbol = Symbol(name="menu", codepoint="\uE5D2")
-    menu_book: Symbol = Symbol(name="menu_book", codepoint="\uEA19")
-    menu_book_2: Symbol = Symbol(name="menu_book_2", codepoint="\uF291")
-    menu_open: Symbol = Symbol(name="menu_open", codepoint="\uE9BD")
-    merge: Symbol = Symbol(name="merge", codepoint="\uEB98")
-    merge_type: Symbol = Symbol(name="merge_type", codepoint="\uE252")
-    message: Symbol = Symbol(name="message", codepoint="\uE0C9")
-    metabolism: Symbol = Symbol(name="metabolism", codepoint="\uE10B")
-    metro: Symbol = Symbol(name="metro", codepoint="\uF474")
-    mfg_nest_yale_lock: Symbol = Symbol(name="mfg_nest_yale_lock", codepoint="\uF11D")
-    mic: Symbol = Symbol(name="mic", codepoint="\uE31D")
-    mic_alert: Symbol = Symbol(name="mic_alert", codepoint="\uF392")
-    mic_double: Symbol = Symbol(name="mic_double", codepoint="\uF5D1")
-    mic_external_off: Symbol = Symbol(name="mic_external_off", codepoint="\uEF59")
-    mic_external_on: Symbol = Symbol(name="mic_external_on", codepoint="\uEF5A")
-    mic_none: Symbol = Symbol(name="mic_none", codepoint="\uE31D")
-    mic_off: Symbol = Symbol(name="mic_off", codepoint="\uE02B")
-    microbiology: Symbol = Symbol(name="microbiology", codepoint="\uE10C")
-    microwave: Symbol = Symbol(name="microwave", codepoint="\uF204")
-    microwave_gen: Symbol = Symbol(name="microwave_gen", codepoint="\uE847")
-    military_tech: Symbol = Symbol(name="military_tech", codepoint="\uEA3F")
-    mimo: Symbol = Symbol(name="mimo", codepoint="\uE9BE")
-    mimo_disconnect: Symbol = Symbol(name="mimo_disconnect", codepoint="\uE9BF")
-    mindfulness: Symbol = Symbol(name="mindfulness", codepoint="\uF6E0")
-    minimize: Symbol = Symbol(name="minimize", codepoint="\uE931")
-    minor_crash: Symbol = Symbol(name="minor_crash", codepoint="\uEBF1")
-    mintmark: Symbol = Symbol(name="mintmark", codepoint="\uEFA9")
-    missed_video_call: Symbol = Symbol(name="missed_video_call", codepoint="\uF0CE")
-    missed_video_call_filled: Symbol = Symbol(name="missed_video_call_filled", codepoint="\uF0CE")
-    missing_controller: Symbol = Symbol(name="missing_controller", codepoint="\uE701")
-    mist: Symbol = Symbol(name="mist", codepoint="\uE188")
-    mitre: Symbol = Symbol(name="mitre", codepoint="\uF547")
-    mixture_med: Symbol = Symbol(name="mixture_med", codepoint="\uE4C8")
-    mms: Symbol = Symbol(name="mms", codepoint="\uE618")
-    mobile: Symbol = Symbol(name="mobile", codepoint="\uE7BA")
-    mobile_2: Symbol = Symbol(name="mobile_2", codepoint="\uF2DB")
-    mobile_3: Symbol = Symbol(name="mobile_3", codepoint="\uF2DA")
-    mobile_alert: Symbol = Symbol(name="mobile_alert", codepoint="\uF2D3")
-    mobile_arrow_down: Symbol = Symbol(name="mobile_arrow_down", codepoint="\uF2CD")
-    mobile_arrow_right: Symbol = Symbol(name="mobile_arrow_right", codepoint="\uF2D2")
-    mobile_arrow_up_right: Symbol = Symbol(name="mobile_arrow_up_right", codepoint="\uF2B9")
-    mobile_block: Symbol = Symbol(name="mobile_block", codepoint="\uF2E5")
-    mobile_camera: Symbol = Symbol(name="mobile_camera", codepoint="\uF44E")
-    mobile_camera_front: Symbol = Symbol(name="mobile_camera_front", codepoint="\uF2C9")
-    mobile_camera_rear: Symbol = Symbol(name="mobile_camera_rear", codepoint="\uF2C8")
-    mobile_cancel: Symbol = Symbol(name="mobile_cancel", codepoint="\uF2EA")
-    mobile_cast: Symbol = Symbol(name="mobile_cast", codepoint="\uF2CC")
-    mobile_charge: Symbol = Symbol(name="mobile_charge", codepoint="\uF2E3")
-    mobile_chat: Symbol = Symbol(name="mobile_chat", codepoint="\uF79F")
-    mobile_check: Symbol = Symbol(name="mobile_check", codepoint="\uF073")
-    mobile_code: Symbol = Symbol(name="mobile_code", codepoint="\uF2E2")
-    mobile_dots: Symbol = Symbol(name="mobile_dots", codepoint="\uF2D0")
-    mobile_friendly: Symbol = Symbol(name="mobile_friendly", codepoint="\uF073")
-    mobile_gear: Symbol = Symbol(name="mobile_gear", codepoint="\uF2D9")
-    mobile_hand: Symbol = Symbol(name="mobile_hand", codepoint="\uF323")
-    mobile_hand_left: Symbol = Symbol(name="mobile_hand_left", codepoint="\uF313")
-    mobile_hand_left_off: Symbol = Symbol(name="mobile_hand_left_off", codepoint="\uF312")
-    mobile_hand_off: Symbol = Symbol(name="mobile_hand_off", codepoint="\uF314")
-    mobile_info: Symbol = Symbol(name="mobile_info", codepoint="\uF2DC")
-    mobile_landscape: Symbol = Symbol(name="mobile_landscape", codepoint="\uED3E")
-    mobile_layout: Symbol = Symbol(name="mobile_layout", codepoint="\uF2BF")
-    mobile_lock_landscape: Symbol = Symbol(name="mobile_lock_landscape", codepoint="\uF2D8")
-    mobile_lock_portrait: Symbol = Symbol(name="mobile_lock_portrait", codepoint="\uF2BE")
-    mobile_loupe: Symbol = Symbol(name="mobile_loupe", codepoint="\uF322")
-    mobile_menu: Symbol = Symbol(name="mobile_menu", codepoint="\uF2D1")
-    mobile_off: Symbol = Symbol(name="mobile_off", codepoint="\uE201")
-    mobile_question: Symbol = Symbol(name="mobile_question", codepoint="\uF2E1")
-    mobile_rotate: Symbol = Symbol(name="mobile_rotate", codepoint="\uF2D5")
-    mobile_rotate_lock: Symbol = Symbol(name="mobile_rotate_lock", codepoint="\uF2D6")
-    mobile_screen_share: Symbol = Symbol(name="mobile_screen_share", codepoint="\uF2DF")
-    mobile_screensaver: Symbol = Symbol(name="mobile_screensaver", codepoint="\uF321")
-    mobile_sensor_hi: Symbol = Symbol(name="mobile_sensor_hi", codepoint="\uF2EF")
-    mobile_sensor_lo: Symbol = Symbol(name="mobile_sensor_lo", codepoint="\uF2EE")
-    mobile_share: Symbol = Symbol(name="mobile_share", codepoint="\uF2DF")
-    mobile_share_stack: Symbol = Symbol(name="mobile_share_stack", codepoint="\uF2DE")
-    mobile_sound: Symbol = Symbol(name="mobile_sound", codepoint="\uF2E8")
-    mobile_sound_2: Symbol = Symbol(name="mobile_sound_2", codepoint="\uF318")
-    mobile_sound_off: Symbol = Symbol(name="mobile_sound_off", codepoint="\uF7AA")
-    mobile_speaker: Symbol = Symbol(name="mobile_speaker", codepoint="\uF320")
-    mobile_text: Symbol = Symbol(name="mobile_text", codepoint="\uF2EB")
-    mobile_text_2: Symbol = Symbol(name="mobile_text_2", codepoint="\uF2E6")
-    mobile_theft: Symbol = Symbol(name="mobile_theft", codepoint="\uF2A9")
-    mobile_ticket: Symbol = Symbol(name="mobile_ticket", codepoint="\uF2E4")
-    mobile_vibrate: Symbol = Symbol(name="mobile_vibrate", codepoint="\uF2CB")
-    mobile_wrench: Symbol = Symbol(name="mobile_wrench", codepoint="\uF2B0")
-    mobiledata_off: Symbol = Symbol(name="mobiledata_off", codepoint="\uF034")
-    mode: Symbol = Symbol(name="mode", codepoint="\uF097")
-    mode_comment: Symbol = Symbol(name="mode_comment", codepoint="\uE253")
-    mode_cool: Symbol = Symbol(name="mode_cool", codepoint="\uF166")
-    mode_cool_off: Symbol = Symbol(name="mode_cool_off", codepoint="\uF167")
-    mode_dual: Symbol = Symbol(name="mode_dual", codepoint="\uF557")
-    mode_edit: Symbol = Symbol(name="mode_edit", codepoint="\uF097")
-    mode_edit_outline: Symbol = Symbol(name="mode_edit_outline", codepoint="\uF097")
-    mode_fan: Symbol = Symbol(name="mode_fan", codepoint="\uF168")
-    mode_fan_off: Symbol = Symbol(name="mode_fan_off", codepoint="\uEC17")
-    mode_heat: Symbol = Symbol(name="mode_heat", codepoint="\uF16A")
-    mode_heat_cool: Symbol = Symbol(name="mode_heat_cool", codepoint="\uF16B")
-    mode_heat_off: Symbol = Symbol(name="mode_heat_off", codepoint="\uF16D")
-    mode_night: Symbol = Symbol(name="mode_night", codepoint="\uF036")
-    mode_of_travel: Symbol = Symbol(name="mode_of_travel", codepoint="\uE7CE")
-    mode_off_on: Symbol = Symbol(name="mode_off_on", codepoint="\uF16F")
-    mode_standby: Symbol = Symbol(name="mode_standby", codepoint="\uF037")
-    model_training: Symbol = Symbol(name="model_training", codepoint="\uF0CF")
-    modeling: Symbol = Symbol(name="modeling", codepoint="\uF3AA")
-    monetization_on: Symbol = Symbol(name="monetization_on", codepoint="\uE263")
-    money: Symbol = Symbol(name="money", codepoint="\uE57D")
-    money_bag: Symbol = Symbol(name="money_bag", codepoint="\uF3EE")
-    money_off: Symbol = Symbol(name="money_off", codepoint="\uF038")
-    money_off_csred: Symbol = Symbol(name="money_off_csred", codepoint="\uF038")
-    money_range: Symbol = Symbol(name="money_range", codepoint="\uF245")
-    monitor: Symbol = Symbol(name="monitor", codepoint="\uEF5B")
-    monitor_heart: Symbol = Symbol(name="monitor_heart", codepoint="\uEAA2")
-    monitor_weight: Symbol = Symbol(name="monitor_weight", codepoint="\uF039")
-    monitor_weight_gain: Symbol = Symbol(name="monitor_weight_gain", codepoint="\uF6DF")
-    monitor_weight_loss: Symbol = Symbol(name="monitor_weight_loss", codepoint="\uF6DE")
-    monitoring: Symbol = Symbol(name="monitoring", codepoint="\uF190")
-    monochrome_photos: Symbol = Symbol(name="monochrome_photos", codepoint="\uE403")
-    monorail: Symbol = Symbol(name="monorail", codepoint="\uF473")
-    mood: Symbol = Symbol(name="mood", codepoint="\uEA22")
-    mood_bad: Symbol = Symbol(name="mood_bad", codepoint="\uE7F3")
-    moon_stars: Symbol = Symbol(name="moon_stars", codepoint="\uF34F")
-    mop: Symbol = Symbol(name="mop", codepoint="\uE28D")
-    moped: Symbol = Symbol(name="moped", codepoint="\uEB28")
-    moped_package: Symbol = Symbol(name="moped_package", codepoint="\uF28B")
-    more: Symbol = Symbol(name="more", codepoint="\uE619")
-    more_down: Symbol = Symbol(name="more_down", codepoint="\uF196")
-    more_horiz: Symbol = Symbol(name="more_horiz", codepoint="\uE5D3")
-    more_time: Symbol = Symbol(name="more_time", codepoint="\uEA5D")
-    more_up: Symbol = Symbol(name="more_up", codepoint="\uF197")
-    more_vert: Symbol = Symbol(name="more_vert", codepoint="\uE5D4")
-    mosque: Symbol = Symbol(name="mosque", codepoint="\uEAB2")
-    motion_blur: Symbol = Symbol(name="motion_blur", codepoint="\uF0D0")
-    motion_mode: Symbol = Symbol(name="motion_mode", codepoint="\uF842")
-    motion_photos_auto: Symbol = Symbol(name="motion_photos_auto", codepoint="\uF03A")
-    motion_photos_off: Symbol = Symbol(name="motion_photos_off", codepoint="\uE9C0")
-    motion_photos_on: Symbol = Symbol(name="motion_photos_on", codepoint="\uE9C1")
-    motion_photos_pause: Symbol = Symbol(name="motion_photos_pause", codepoint="\uF227")
-    motion_photos_paused: Symbol = Symbol(name="motion_photos_paused", codepoint="\uF227")
-    motion_play: Symbol = Symbol(name="motion_play", codepoint="\uF40B")
-    motion_sensor_active: Symbol = Symbol(name="motion_sensor_active", codepoint="\uE792")
-    motion_sensor_alert: Symbol = Symbol(name="motion_sensor_alert", codepoint="\uE784")
-    motion_sensor_idle: Symbol = Symbol(name="motion_sensor_idle", codepoint="\uE783")
-    motion_sensor_urgent: Symbol = Symbol(name="motion_sensor_urgent", codepoint="\uE78E")
-    motorcycle: Symbol = Symbol(name="motorcycle", codepoint="\uE91B")
-    mountain_flag: Symbol = Symbol(name="mountain_flag", codepoint="\uF5E2")
-    mountain_steam: Symbol = Symbol(name="mountain_steam", codepoint="\uF282")
-    mouse: Symbol = Symbol(name="mouse", codepoint="\uE323")
-    mouse_lock: Symbol = Symbol(name="mouse_lock", codepoint="\uF490")
-    mouse_lock_off: Symbol = Symbol(name="mouse_lock_off", codepoint="\uF48F")
-    move: Symbol = Symbol(name="move", codepoint="\uE740")
-    move_down: Symbol = Symbol(name="move_down", codepoint="\uEB61")
-    move_group: Symbol = Symbol(name="move_group", codepoint="\uF715")
-    move_item: Symbol = Symbol(name="move_item", codepoint="\uF1FF")
-    move_location: Symbol = Symbol(name="move_location", codepoint="\uE741")
-    move_selection_down: Symbol = Symbol(name="move_selection_down", codepoint="\uF714")
-    move_selection_left: Symbol = Symbol(name="move_selection_left", codepoint="\uF713")
-    move_selection_right: Symbol = Symbol(name="move_selection_right", codepoint="\uF712")
-    move_selection_up: Symbol = Symbol(name="move_selection_up", codepoint="\uF711")
-    move_to_inbox: Symbol = Symbol(name="move_to_inbox", codepoint="\uE168")
-    move_up: Symbol = Symbol(name="move_up", codepoint="\uEB64")
-    moved_location: Symbol = Symbol(name="moved_location", codepoint="\uE594")
-    movie: Symbol = Symbol(name="movie", codepoint="\uE404")
-    movie_creation: Symbol = Symbol(name="movie_creation", codepoint="\uE404")
-    movie_edit: Symbol = Symbol(name="movie_edit", codepoint="\uF840")
-    movie_filter: Symbol = Symbol(name="movie_filter", codepoint="\uE43A")
-    movie_info: Symbol = Symbol(name="movie_info", codepoint="\uE02D")
-    movie_off: Symbol = Symbol(name="movie_off", codepoint="\uF499")
-    movie_speaker: Symbol = Symbol(name="movie_speaker", codepoint="\uF2A3")
-    moving: Symbol = Symbol(name="moving", codepoint="\uE501")
-    moving_beds: Symbol = Symbol(name="moving_beds", codepoint="\uE73D")
-    moving_ministry: Symbol = Symbol(name="moving_ministry", codepoint="\uE73E")
-    mp: Symbol = Symbol(name="mp", codepoint="\uE9C3")
-    multicooker: Symbol = Symbol(name="multicooker", codepoint="\uE293")
-    multiline_chart: Symbol = Symbol(name="multiline_chart", codepoint="\uE6DF")
-    multimodal_hand_eye: Symbol = Symbol(name="multimodal_hand_eye", codepoint="\uF41B")
-    multiple_airports: Symbol = Symbol(name="multiple_airports", codepoint="\uEFAB")
-    multiple_stop: Symbol = Symbol(name="multiple_stop", codepoint="\uF1B9")
-    museum: Symbol = Symbol(name="museum", codepoint="\uEA36")
-    music_cast: Symbol = Symbol(name="music_cast", codepoint="\uEB1A")
-    music_history: Symbol = Symbol(name="music_history", codepoint="\uF2C1")
-    music_note: Symbol = Symbol(name="music_note", codepoint="\uE405")
-    music_note_add: Symbol = Symbol(name="music_note_add", codepoint="\uF391")
-    music_off: Symbol = Symbol(name="music_off", codepoint="\uE440")
-    music_video: Symbol = Symbol(name="music_video", codepoint="\uE063")
-    my_location: Symbol = Symbol(name="my_location", codepoint="\uE55C")
-    mystery: Symbol = Symbol(name="mystery", codepoint="\uF5E1")
-    nat: Symbol = Symbol(name="nat", codepoint="\uEF5C")
-    nature: Symbol = Symbol(name="nature", codepoint="\uE406")
-    nature_people: Symbol = Symbol(name="nature_people", codepoint="\uE407")
-    navigate_before: Symbol = Symbol(name="navigate_before", codepoint="\uE5CB")
-    navigate_next: Symbol = Symbol(name="navigate_next", codepoint="\uE5CC")
-    navigation: Symbol = Symbol(name="navigation", codepoint="\uE55D")
-    near_me: Symbol = Symbol(name="near_me", codepoint="\uE569")
-    near_me_disabled: Symbol = Symbol(name="near_me_disabled", codepoint="\uF1EF")
-    nearby: Symbol = Symbol(name="nearby", codepoint="\uE6B7")
-    nearby_error: Symbol = Symbol(name="nearby_error", codepoint="\uF03B")
-    nearby_off: Symbol = Symbol(name="nearby_off", codepoint="\uF03C")
-    nephrology: Symbol = Symbol(name="nephrology", codepoint="\uE10D")
-    nest_audio: Symbol = Symbol(name="nest_audio", codepoint="\uEBBF")
-    nest_cam_floodlight: Symbol = Symbol(name="nest_cam_floodlight", codepoint="\uF8B7")
-    nest_cam_indoor: Symbol = Symbol(name="nest_cam_indoor", codepoint="\uF11E")
-    nest_cam_iq: Symbol = Symbol(name="nest_cam_iq", codepoint="\uF11F")
-    nest_cam_iq_outdoor: Symbol = Symbol(name="nest_cam_iq_outdoor", codepoint="\uF120")
-    nest_cam_magnet_mount: Symbol = Symbol(name="nest_cam_magnet_mount", codepoint="\uF8B8")
-    nest_cam_outdoor: Symbol = Symbol(name="nest_cam_outdoor", codepoint="\uF121")
-    nest_cam_stand: Symbol = Symbol(name="nest_cam_stand", codepoint="\uF8B9")
-    nest_cam_wall_mount: Symbol = Symbol(name="nest_cam_wall_mount", codepoint="\uF8BA")
-    nest_cam_wired_stand: Symbol = Symbol(name="nest_cam_wired_stand", codepoint="\uEC16")
-    nest_clock_farsight_analog: Symbol = Symbol(name="nest_clock_farsight_analog", codepoint="\uF8BB")
-    nest_clock_farsight_digital: Symbol = Symbol(name="nest_clock_farsight_digital", codepoint="\uF8BC")
-    nest_connect: Symbol = Symbol(name="nest_connect", codepoint="\uF122")
-    nest_detect: Symbol = Symbol(name="nest_detect", codepoint="\uF123")
-    nest_display: Symbol = Symbol(name="nest_display", codepoint="\uF124")
-    nest_display_max: Symbol = Symbol(name="nest_display_max", codepoint="\uF125")
-    nest_doorbell_visitor: Symbol = Symbol(name="nest_doorbell_visitor", codepoint="\uF8BD")
-    nest_eco_leaf: Symbol = Symbol(name="nest_eco_leaf", codepoint="\uF8BE")
-    nest_farsight_cool: Symbol = Symbol(name="nest_farsight_cool", codepoint="\uF27D")
-    nest_farsight_dual: Symbol = Symbol(name="nest_farsight_dual", codepoint="\uF27C")
-    nest_farsight_eco: Symbol = Symbol(name="nest_farsight_eco", codepoint="\uF27B")
-    nest_farsight_heat: Symbol = Symbol(name="nest_farsight_heat", codepoint="\uF27A")
-    nest_farsight_seasonal: Symbol = Symbol(name="nest_farsight_seasonal", codepoint="\uF279")
-    nest_farsight_weather: Symbol = Symbol(name="nest_farsight_weather", codepoint="\uF8BF")
-    nest_found_savings: Symbol = Symbol(name="nest_found_savings", codepoint="\uF8C0")
-    nest_gale_wifi: Symbol = Symbol(name="nest_gale_wifi", codepoint="\uF579")
-    nest_heat_link_e: Symbol = Symbol(name="nest_heat_link_e", codepoint="\uF126")
-    nest_heat_link_gen_3: Symbol = Symbol(name="nest_heat_link_gen_3", codepoint="\uF127")
-    nest_hello_doorbell: Symbol = Symbol(name="nest_hello_doorbell", codepoint="\uE82C")
-    nest_locator_tag: Symbol = Symbol(name="nest_locator_tag", codepoint="\uF8C1")
-    nest_mini: Symbol = Symbol(name="nest_mini", codepoint="\uE789")
-    nest_multi_room: Symbol = Symbol(name="nest_multi_room", codepoint="\uF8C2")
-    nest_protect: Symbol = Symbol(name="nest_protect", codepoint="\uE68E")
-    nest_remote: Symbol = Symbol(name="nest_remote", codepoint="\uF5DB")
-    nest_remote_comfort_sensor: Symbol = Symbol(name="nest_remote_comfort_sensor", codepoint="\uF12A")
-    nest_secure_alarm: Symbol = Symbol(name="nest_secure_alarm", codepoint="\uF12B")
-    nest_sunblock: Symbol = Symbol(name="nest_sunblock", codepoint="\uF8C3")
-    nest_tag: Symbol = Symbol(name="nest_tag", codepoint="\uF8C1")
-    nest_thermostat: Symbol = Symbol(name="nest_thermostat", codepoint="\uE68F")
-    nest_thermostat_e_eu: Symbol = Symbol(name="nest_thermostat_e_eu", codepoint="\uF12D")
-    nest_thermostat_gen_3: Symbol = Symbol(name="nest_thermostat_gen_3", codepoint="\uF12E")
-    nest_thermostat_sensor: Symbol = Symbol(name="nest_thermostat_sensor", codepoint="\uF12F")
-    nest_thermostat_sensor_eu: Symbol = Symbol(name="nest_thermostat_sensor_eu", codepoint="\uF130")
-    nest_thermostat_zirconium_eu: Symbol = Symbol(name="nest_thermostat_zirconium_eu", codepoint="\uF131")
-    nest_true_radiant: Symbol = Symbol(name="nest_true_radiant", codepoint="\uF8C4")
-    nest_wake_on_approach: Symbol = Symbol(name="nest_wake_on_approach", codepoint="\uF8C5")
-    nest_wake_on_press: Symbol = Symbol(name="nest_wake_on_press", codepoint="\uF8C6")
-    nest_wifi_gale: Symbol = Symbol(name="nest_wifi_gale", codepoint="\uF132")
-    nest_wifi_mistral: Symbol = Symbol(name="nest_wifi_mistral", codepoint="\uF133")
-    nest_wifi_point: Symbol = Symbol(name="nest_wifi_point", codepoint="\uF134")
-    nest_wifi_point_vento: Symbol = Symbol(name="nest_wifi_point_vento", codepoint="\uF134")
-    nest_wifi_pro: Symbol = Symbol(name="nest_wifi_pro", codepoint="\uF56B")
-    nest_wifi_pro_2: Symbol = Symbol(name="nest_wifi_pro_2", codepoint="\uF56A")
-    nest_wifi_router: Symbol = Symbol(name="nest_wifi_router", codepoint="\uF133")
-    network_cell: Symbol = Symbol(name="network_cell", codepoint="\uE1B9")
-    network_check: Symbol = Symbol(name="network_check", codepoint="\uE640")
-    network_intel_node: Symbol = Symbol(name="network_intel_node", codepoint="\uF371")
-    network_intelligence: Symbol = Symbol(name="network_intelligence", codepoint="\uEFAC")
-    network_intelligence_history: Symbol = Symbol(name="network_intelligence_history", codepoint="\uF5F6")
-    network_intelligence_update: Symbol = Symbol(name="network_intelligence_update", codepoint="\uF5F5")
-    network_locked: Symbol = Symbol(name="network_locked", codepoint="\uE61A")
-    network_manage: Symbol = Symbol(name="network_manage", codepoint="\uF7AB")
-    network_node: Symbol = Symbol(name="network_node", codepoint="\uF56E")
-    network_ping: Symbol = Symbol(name="network_ping", codepoint="\uEBCA")
-    network_wifi: Symbol = Symbol(name="network_wifi", codepoint="\uE1BA")
-    network_wifi_1_bar: Symbol = Symbol(name="network_wifi_1_bar", codepoint="\uEBE4")
-    network_wifi_1_bar_locked: Symbol = Symbol(name="network_wifi_1_bar_locked", codepoint="\uF58F")
-    network_wifi_2_bar: Symbol = Symbol(name="network_wifi_2_bar", codepoint="\uEBD6")
-    network_wifi_2_bar_locked: Symbol = Symbol(name="network_wifi_2_bar_locked", codepoint="\uF58E")
-    network_wifi_3_bar: Symbol = Symbol(name="network_wifi_3_bar", codepoint="\uEBE1")
-    network_wifi_3_bar_locked: Symbol = Symbol(name="network_wifi_3_bar_locked", codepoint="\uF58D")
-    network_wifi_locked: Symbol = Symbol(name="network_wifi_locked", codepoint="\uF532")
-    neurology: Symbol = Symbol(name="neurology", codepoint="\uE10E")
-    new_label: Symbol = Symbol(name="new_label", codepoint="\uE609")
-    new_releases: Symbol = Symbol(name="new_releases", codepoint="\uEF76")
-    new_window: Symbol = Symbol(name="new_window", codepoint="\uF710")
-    news: Symbol = Symbol(name="news", codepoint="\uE032")
-    newsmode: Symbol = Symbol(name="newsmode", codepoint="\uEFAD")
-    newspaper: Symbol = Symbol(name="newspaper", codepoint="\uEB81")
-    newsstand: Symbol = Symbol(name="newsstand", codepoint="\uE9C4")
-    next_plan: Symbol = Symbol(name="next_plan", codepoint="\uEF5D")
-    next_week: Symbol = Symbol(name="next_week", codepoint="\uE16A")
-    nfc: Symbol = Symbol(name="nfc", codepoint="\uE1BB")
-    nfc_off: Symbol = Symbol(name="nfc_off", codepoint="\uF369")
-    night_shelter: Symbol = Symbol(name="night_shelter", codepoint="\uF1F1")
-    night_sight_auto: Symbol = Symbol(name="night_sight_auto", codepoint="\uF1D7")
-    night_sight_auto_off: Symbol = Symbol(name="night_sight_auto_off", codepoint="\uF1F9")
-    night_sight_max: Symbol = Symbol(name="night_sight_max", codepoint="\uF6C3")
-    nightlife: Symbol = Symbol(name="nightlife", codepoint="\uEA62")
-    nightlight: Symbol = Symbol(name="nightlight", codepoint="\uF03D")
-    nightlight_round: Symbol = Symbol(name="nightlight_round", codepoint="\uF03D")
-    nights_stay: Symbol = Symbol(name="nights_stay", codepoint="\uF174")
-    no_accounts: Symbol = Symbol(name="no_accounts", codepoint="\uF03E")
-    no_adult_content: Symbol = Symbol(name="no_adult_content", codepoint="\uF8FE")
-    no_backpack: Symbol = Symbol(name="no_backpack", codepoint="\uF237")
-    no_crash: Symbol = Symbol(name="no_crash", codepoint="\uEBF0")
-    no_drinks: Symbol = Symbol(name="no_drinks", codepoint="\uF1A5")
-    no_encryption: Symbol = Symbol(name="no_encryption", codepoint="\uF03F")
-    no_encryption_gmailerrorred: Symbol = Symbol(name="no_encryption_gmailerrorred", codepoint="\uF03F")
-    no_flash: Symbol = Symbol(name="no_flash", codepoint="\uF1A6")
-    no_food: Symbol = Symbol(name="no_food", codepoint="\uF1A7")
-    no_luggage: Symbol = Symbol(name="no_luggage", codepoint="\uF23B")
-    no_meals: Symbol = Symbol(name="no_meals", codepoint="\uF1D6")
-    no_meeting_room: Symbol = Symbol(name="no_meeting_room", codepoint="\uEB4E")
-    no_photography: Symbol = Symbol(name="no_photography", codepoint="\uF1A8")
-    no_sim: Symbol = Symbol(name="no_sim", codepoint="\uE1CE")
-    no_sound: Symbol = Symbol(name="no_sound", codepoint="\uE710")
-    no_stroller: Symbol = Symbol(name="no_stroller", codepoint="\uF1AF")
-    no_transfer: Symbol = Symbol(name="no_transfer", codepoint="\uF1D5")
-    noise_aware: Symbol = Symbol(name="noise_aware", codepoint="\uEBEC")
-    noise_control_off: Symbol = Symbol(name="noise_control_off", codepoint="\uEBF3")
-    noise_control_on: Symbol = Symbol(name="noise_control_on", codepoint="\uF8A8")
-    nordic_walking: Symbol = Symbol(name="nordic_walking", codepoint="\uE50E")
-    north: Symbol = Symbol(name="north", codepoint="\uF1E0")
-    north_east: Symbol = Symbol(name="north_east", codepoint="\uF1E1")
-    north_west: Symbol = Symbol(name="north_west", codepoint="\uF1E2")
-    not_accessible: Symbol = Symbol(name="not_accessible", codepoint="\uF0FE")
-    not_accessible_forward: Symbol = Symbol(name="not_accessible_forward", codepoint="\uF54A")
-    not_interested: Symbol = Symbol(name="not_interested", codepoint="\uF08C")
-    not_listed_location: Symbol = Symbol(name="not_listed_location", codepoint="\uE575")
-    not_started: Symbol = Symbol(name="not_started", codepoint="\uF0D1")
-    note: Symbol = Symbol(name="note", codepoint="\uE66D")
-    note_add: Symbol = Symbol(name="note_add", codepoint="\uE89C")
-    note_alt: Symbol = Symbol(name="note_alt", codepoint="\uF040")
-    note_stack: Symbol = Symbol(name="note_stack", codepoint="\uF562")
-    note_stack_add: Symbol = Symbol(name="note_stack_add", codepoint="\uF563")
-    notes: Symbol = Symbol(name="notes", codepoint="\uE26C")
-    notification_add: Symbol = Symbol(name="notification_add", codepoint="\uE399")
-    notification_important: Symbol = Symbol(name="notification_important", codepoint="\uE004")
-    notification_multiple: Symbol = Symbol(name="notification_multiple", codepoint="\uE6C2")
-    notification_settings: Symbol = Symbol(name="notification_settings", codepoint="\uF367")
-    notification_sound: Symbol = Symbol(name="notification_sound", codepoint="\uF353")
-    notifications: Symbol = Symbol(name="notifications", codepoint="\uE7F5")
-    notifications_active: Symbol = Symbol(name="notifications_active", codepoint="\uE7F7")
-    notifications_none: Symbol = Symbol(name="notifications_none", codepoint="\uE7F5")
-    notifications_off: Symbol = Symbol(name="notifications_off", codepoint="\uE7F6")
-    notifications_paused: Symbol = Symbol(name="notifications_paused", codepoint="\uE7F8")
-    notifications_unread: Symbol = Symbol(name="notifications_unread", codepoint="\uF4FE")
-    numbers: Symbol = Symbol(name="numbers", codepoint="\uEAC7")
-    nutrition: Symbol = Symbol(name="nutrition", codepoint="\uE110")
-    ods: Symbol = Symbol(name="ods", codepoint="\uE6E8")
-    odt: Symbol = Symbol(name="odt", codepoint="\uE6E9")
-    offline_bolt: Symbol = Symbol(name="offline_bolt", codepoint="\uE932")
-    offline_pin: Symbol = Symbol(name="offline_pin", codepoint="\uE90A")
-    offline_pin_off: Symbol = Symbol(name="offline_pin_off", codepoint="\uF4D0")
-    offline_share: Symbol = Symbol(name="offline_share", codepoint="\uF2DE")
-    oil_barrel: Symbol = Symbol(name="oil_barrel", codepoint="\uEC15")
-    okonomiyaki: Symbol = Symbol(name="okonomiyaki", codepoint="\uF281")
-    on_device_training: Symbol = Symbol(name="on_device_training", codepoint="\uEBFD")
-    on_hub_device: Symbol = Symbol(name="on_hub_device", codepoint="\uE6C3")
-    oncology: Symbol = Symbol(name="oncology", codepoint="\uE114")
-    ondemand_video: Symbol = Symbol(name="ondemand_video", codepoint="\uE63A")
-    online_prediction: Symbol = Symbol(name="online_prediction", codepoint="\uF0EB")
-    onsen: Symbol = Symbol(name="onsen", codepoint="\uF6F8")
-    opacity: Symbol = Symbol(name="opacity", codepoint="\uE91C")
-    open_in_browser: Symbol = Symbol(name="open_in_browser", codepoint="\uE89D")
-    open_in_full: Symbol = Symbol(name="open_in_full", codepoint="\uF1CE")
-    open_in_new: Symbol = Symbol(name="open_in_new", codepoint="\uE89E")
-    open_in_new_down: Symbol = Symbol(name="open_in_new_down", codepoint="\uF70F")
-    open_in_new_off: Symbol = Symbol(name="open_in_new_off", codepoint="\uE4F6")
-    open_in_phone: Symbol = Symbol(name="open_in_phone", codepoint="\uF2D2")
-    open_jam: Symbol = Symbol(name="open_jam", codepoint="\uEFAE")
-    open_run: Symbol = Symbol(name="open_run", codepoint="\uF4B7")
-    open_with: Symbol = Symbol(name="open_with", codepoint="\uE89F")
-    ophthalmology: Symbol = Symbol(name="ophthalmology", codepoint="\uE115")
-    oral_disease: Symbol = Symbol(name="oral_disease", codepoint="\uE116")
-    orbit: Symbol = Symbol(name="orbit", codepoint="\uF426")
-    order_approve: Symbol = Symbol(name="order_approve", codepoint="\uF812")
-    order_play: Symbol = Symbol(name="order_play", codepoint="\uF811")
-    orders: Symbol = Symbol(name="orders", codepoint="\uEB14")
-    orthopedics: Symbol = Symbol(name="orthopedics", codepoint="\uF897")
-    other_admission: Symbol = Symbol(name="other_admission", codepoint="\uE47B")
-    other_houses: Symbol = Symbol(name="other_houses", codepoint="\uE58C")
-    outbound: Symbol = Symbol(name="outbound", codepoint="\uE1CA")
-    outbox: Symbol = Symbol(name="outbox", codepoint="\uEF5F")
-    outbox_alt: Symbol = Symbol(name="outbox_alt", codepoint="\uEB17")
-    outdoor_garden: Symbol = Symbol(name="outdoor_garden", codepoint="\uE205")
-    outdoor_grill: Symbol = Symbol(name="outdoor_grill", codepoint="\uEA47")
-    outgoing_mail: Symbol = Symbol(name="outgoing_mail", codepoint="\uF0D2")
-    outlet: Symbol = Symbol(name="outlet", codepoint="\uF1D4")
-    outlined_flag: Symbol = Symbol(name="outlined_flag", codepoint="\uF0C6")
-    outpatient: Symbol = Symbol(name="outpatient", codepoint="\uE118")
-    outpatient_med: Symbol = Symbol(name="outpatient_med", codepoint="\uE119")
-    output: Symbol = Symbol(name="output", codepoint="\uEBBE")
-    output_circle: Symbol = Symbol(name="output_circle", codepoint="\uF70E")
-    oven: Symbol = Symbol(name="oven", codepoint="\uE9C7")
-    oven_gen: Symbol = Symbol(name="oven_gen", codepoint="\uE843")
-    overview: Symbol = Symbol(name="overview", codepoint="\uE4A7")
-    overview_key: Symbol = Symbol(name="overview_key", codepoint="\uF7D4")
-    owl: Symbol = Symbol(name="owl", codepoint="\uF3B4")
-    oxygen_saturation: Symbol = Symbol(name="oxygen_saturation", codepoint="\uE4DE")
-    p2p: Symbol = Symbol(name="p2p", codepoint="\uF52A")
-    pace: Symbol = Symbol(name="pace", codepoint="\uF6B8")
-    pacemaker: Symbol = Symbol(name="pacemaker", codepoint="\uE656")
-    package: Symbol = Symbol(name="package", codepoint="\uE48F")
-    package_2: Symbol = Symbol(name="package_2", codepoint="\uF569")
-    padding: Symbol = Symbol(name="padding", codepoint="\uE9C8")
-    padel: Symbol = Symbol(name="padel", codepoint="\uF2A7")
-    page_control: Symbol = Symbol(name="page_control", codepoint="\uE731")
-    page_footer: Symbol = Symbol(name="page_footer", codepoint="\uF383")
-    page_header: Symbol = Symbol(name="page_header", codepoint="\uF384")
-    page_info: Symbol = Symbol(name="page_info", codepoint="\uF614")
-    page_menu_ios: Symbol = Symbol(name="page_menu_ios", codepoint="\uEEFB")
-    pageless: Symbol = Symbol(name="pageless", codepoint="\uF509")
-    pages: Symbol = Symbol(name="pages", codepoint="\uE7F9")
-    pageview: Symbol = Symbol(name="pageview", codepoint="\uE8A0")
-    paid: Symbol = Symbol(name="paid", codepoint="\uF041")
-    palette: Symbol = Symbol(name="palette", codepoint="\uE40A")
-    pallet: Symbol = Symbol(name="pallet", codepoint="\uF86A")
-    pan_tool: Symbol = Symbol(name="pan_tool", codepoint="\uE925")
-    pan_tool_alt: Symbol = Symbol(name="pan_tool_alt", codepoint="\uEBB9")
-    pan_zoom: Symbol = Symbol(name="pan_zoom", codepoint="\uF655")
-    panorama: Symbol = Symbol(name="panorama", codepoint="\uE40B")
-    panorama_fish_eye: Symbol = Symbol(name="panorama_fish_eye", codepoint="\uE40C")
-    panorama_horizontal: Symbol = Symbol(name="panorama_horizontal", codepoint="\uE40D")
-    panorama_photosphere: Symbol = Symbol(name="panorama_photosphere", codepoint="\uE9C9")
-    panorama_vertical: Symbol = Symbol(name="panorama_vertical", codepoint="\uE40E")
-    panorama_wide_angle: Symbol = Symbol(name="panorama_wide_angle", codepoint="\uE40F")
-    paragliding: Symbol = Symbol(name="paragliding", codepoint="\uE50F")
-    parent_child_dining: Symbol = Symbol(name="parent_child_dining", codepoint="\uF22D")
-    park: Symbol = Symbol(name="park", codepoint="\uEA63")
-    parking_meter: Symbol = Symbol(name="parking_meter", codepoint="\uF28A")
-    parking_sign: Symbol = Symbol(name="parking_sign", codepoint="\uF289")
-    parking_valet: Symbol = Symbol(name="parking_valet", codepoint="\uF288")
-    partly_cloudy_day: Symbol = Symbol(name="partly_cloudy_day", codepoint="\uF172")
-    partly_cloudy_night: Symbol = Symbol(name="partly_cloudy_night", codepoint="\uF174")
-    partner_exchange: Symbol = Symbol(name="partner_exchange", codepoint="\uF7F9")
-    partner_heart: Symbol = Symbol(name="partner_heart", codepoint="\uEF2E")
-    partner_reports: Symbol = Symbol(name="partner_reports", codepoint="\uEFAF")
-    party_mode: Symbol = Symbol(name="party_mode", codepoint="\uE7FA")
-    passkey: Symbol = Symbol(name="passkey", codepoint="\uF87F")
-    password: Symbol = Symbol(name="password", codepoint="\uF042")
-    password_2: Symbol = Symbol(name="password_2", codepoint="\uF4A9")
-    password_2_off: Symbol = Symbol(name="password_2_off", codepoint="\uF4A8")
-    patient_list: Symbol = Symbol(name="patient_list", codepoint="\uE653")
-    pattern: Symbol = Symbol(name="pattern", codepoint="\uF043")
-    pause: Symbol = Symbol(name="pause", codepoint="\uE034")
-    pause_circle: Symbol = Symbol(name="pause_circle", codepoint="\uE1A2")
-    pause_circle_filled: Symbol = Symbol(name="pause_circle_filled", codepoint="\uE1A2")
-    pause_circle_outline: Symbol = Symbol(name="pause_circle_outline", codepoint="\uE1A2")
-    pause_presentation: Symbol = Symbol(name="pause_presentation", codepoint="\uE0EA")
-    payment: Symbol = Symbol(name="payment", codepoint="\uE8A1")
-    payment_arrow_down: Symbol = Symbol(name="payment_arrow_down", codepoint="\uF2C0")
-    payment_card: Symbol = Symbol(name="payment_card", codepoint="\uF2A1")
-    payments: Symbol = Symbol(name="payments", codepoint="\uEF63")
-    pedal_bike: Symbol = Symbol(name="pedal_bike", codepoint="\uEB29")
-    pediatrics: Symbol = Symbol(name="pediatrics", codepoint="\uE11D")
-    pen_size_1: Symbol = Symbol(name="pen_size_1", codepoint="\uF755")
-    pen_size_2: Symbol = Symbol(name="pen_size_2", codepoint="\uF754")
-    pen_size_3: Symbol = Symbol(name="pen_size_3", codepoint="\uF753")
-    pen_size_4: Symbol = Symbol(name="pen_size_4", codepoint="\uF752")
-    pen_size_5: Symbol = Symbol(name="pen_size_5", codepoint="\uF751")
-    pending: Symbol = Symbol(name="pending", codepoint="\uEF64")
-    pending_actions: Symbol = Symbol(name="pending_actions", codepoint="\uF1BB")
-    pentagon: Symbol = Symbol(name="pentagon", codepoint="\uEB50")
-    people: Symbol = Symbol(name="people", codepoint="\uEA21")
-    people_alt: Symbol = Symbol(name="people_alt", codepoint="\uEA21")
-    people_outline: Symbol = Symbol(name="people_outline", codepoint="\uEA21")
-    percent: Symbol = Symbol(name="percent", codepoint="\uEB58")
-    percent_discount: Symbol = Symbol(name="percent_discount", codepoint="\uF244")
-    performance_max: Symbol = Symbol(name="performance_max", codepoint="\uE51A")
-    pergola: Symbol = Symbol(name="pergola", codepoint="\uE203")
-    perm_camera_mic: Symbol = Symbol(name="perm_camera_mic", codepoint="\uE8A2")
-    perm_contact_calendar: Symbol = Symbol(name="perm_contact_calendar", codepoint="\uE8A3")
-    perm_data_setting: Symbol = Symbol(name="perm_data_setting", codepoint="\uE8A4")
-    perm_device_information: Symbol = Symbol(name="perm_device_information", codepoint="\uF2DC")
-    perm_identity: Symbol = Symbol(name="perm_identity", codepoint="\uF0D3")
-    perm_media: Symbol = Symbol(name="perm_media", codepoint="\uE8A7")
-    perm_phone_msg: Symbol = Symbol(name="perm_phone_msg", codepoint="\uE8A8")
-    perm_scan_wifi: Symbol = Symbol(name="perm_scan_wifi", codepoint="\uE8A9")
-    person: Symbol = Symbol(name="person", codepoint="\uF0D3")
-    person_2: Symbol = Symbol(name="person_2", codepoint="\uF8E4")
-    person_3: Symbol = Symbol(name="person_3", codepoint="\uF8E5")
-    person_4: Symbol = Symbol(name="person_4", codepoint="\uF8E6")
-    person_add: Symbol = Symbol(name="person_add", codepoint="\uEA4D")
-    person_add_alt: Symbol = Symbol(name="person_add_alt", codepoint="\uEA4D")
-    person_add_disabled: Symbol = Symbol(name="person_add_disabled", codepoint="\uE9CB")
-    person_alert: Symbol = Symbol(name="person_alert", codepoint="\uF567")
-    person_apron: Symbol = Symbol(name="person_apron", codepoint="\uF5A3")
-    person_book: Symbol = Symbol(name="person_book", codepoint="\uF5E8")
-    person_cancel: Symbol = Symbol(name="person_cancel", codepoint="\uF566")
-    person_celebrate: Symbol = Symbol(name="person_celebrate", codepoint="\uF7FE")
-    person_check: Symbol = Symbol(name="person_check", codepoint="\uF565")
-    person_edit: Symbol = Symbol(name="person_edit", codepoint="\uF4FA")
-    person_filled: Symbol = Symbol(name="person_filled", codepoint="\uF0D3")
-    person_heart: Symbol = Symbol(name="person_heart", codepoint="\uF290")
-    person_off: Symbol = Symbol(name="person_off", codepoint="\uE510")
-    person_outline: Symbol = Symbol(name="person_outline", codepoint="\uF0D3")
-    person_pin: Symbol = Symbol(name="person_pin", codepoint="\uE55A")
-    person_pin_circle: Symbol = Symbol(name="person_pin_circle", codepoint="\uE56A")
-    person_play: Symbol = Symbol(name="person_play", codepoint="\uF7FD")
-    person_raised_hand: Symbol = Symbol(name="person_raised_hand", codepoint="\uF59A")
-    person_remove: Symbol = Symbol(name="person_remove", codepoint="\uEF66")
-    person_search: Symbol = Symbol(name="person_search", codepoint="\uF106")
-    person_shield: Symbol = Symbol(name="person_shield", codepoint="\uE384")
-    personal_bag: Symbol = Symbol(name="personal_bag", codepoint="\uEB0E")
-    personal_bag_off: Symbol = Symbol(name="personal_bag_off", codepoint="\uEB0F")
-    personal_bag_question: Symbol = Symbol(name="personal_bag_question", codepoint="\uEB10")
-    personal_injury: Symbol = Symbol(name="personal_injury", codepoint="\uE6DA")
-    personal_places: Symbol = Symbol(name="personal_places", codepoint="\uE703")
-    personal_video: Symbol = Symbol(name="personal_video", codepoint="\uE63B")
-    pest_control: Symbol = Symbol(name="pest_control", codepoint="\uF0FA")
-    pest_control_rodent: Symbol = Symbol(name="pest_control_rodent", codepoint="\uF0FD")
-    pet_supplies: Symbol = Symbol(name="pet_supplies", codepoint="\uEFB1")
-    pets: Symbol = Symbol(name="pets", codepoint="\uE91D")
-    phishing: Symbol = Symbol(name="phishing", codepoint="\uEAD7")
-    phone: Symbol = Symbol(name="phone", codepoint="\uF0D4")
-    phone_alt: Symbol = Symbol(name="phone_alt", codepoint="\uF0D4")
-    phone_android: Symbol = Symbol(name="phone_android", codepoint="\uF2DB")
-    phone_bluetooth_speaker: Symbol = Symbol(name="phone_bluetooth_speaker", codepoint="\uE61B")
-    phone_callback: Symbol = Symbol(name="phone_callback", codepoint="\uE649")
-    phone_disabled: Symbol = Symbol(name="phone_disabled", codepoint="\uE9CC")
-    phone_enabled: Symbol = Symbol(name="phone_enabled", codepoint="\uE9CD")
-    phone_forwarded: Symbol = Symbol(name="phone_forwarded", codepoint="\uE61C")
-    phone_in_talk: Symbol = Symbol(name="phone_in_talk", codepoint="\uE61D")
-    phone_iphone: Symbol = Symbol(name="phone_iphone", codepoint="\uF2DA")
-    phone_locked: Symbol = Symbol(name="phone_locked", codepoint="\uE61E")
-    phone_missed: Symbol = Symbol(name="phone_missed", codepoint="\uE61F")
-    phone_paused: Symbol = Symbol(name="phone_paused", codepoint="\uE620")
-    phonelink: Symbol = Symbol(name="phonelink", codepoint="\uE326")
-    phonelink_erase: Symbol = Symbol(name="phonelink_erase", codepoint="\uF2EA")
-    phonelink_lock: Symbol = Symbol(name="phonelink_lock", codepoint="\uF2BE")
-    phonelink_off: Symbol = Symbol(name="phonelink_off", codepoint="\uF7A5")
-    phonelink_ring: Symbol = Symbol(name="phonelink_ring", codepoint="\uF2E8")
-    phonelink_ring_off: Symbol = Symbol(name="phonelink_ring_off", codepoint="\uF7AA")
-    phonelink_setup: Symbol = Symbol(name="phonelink_setup", codepoint="\uF2D9")
-    photo: Symbol = Symbol(name="photo", codepoint="\uE432")
-    photo_album: Symbol = Symbol(name="photo_album", codepoint="\uE411")
-    photo_auto_merge: Symbol = Symbol(name="photo_auto_merge", codepoint="\uF530")
-    photo_camera: Symbol = Symbol(name="photo_camera", codepoint="\uE412")
-    photo_camera_back: Symbol = Symbol(name="photo_camera_back", codepoint="\uEF68")
-    photo_camera_front: Symbol = Symbol(name="photo_camera_front", codepoint="\uEF69")
-    photo_filter: Symbol = Symbol(name="photo_filter", codepoint="\uE43B")
-    photo_frame: Symbol = Symbol(name="photo_frame", codepoint="\uF0D9")
-    photo_library: Symbol = Symbol(name="photo_library", codepoint="\uE413")
-    photo_prints: Symbol = Symbol(name="photo_prints", codepoint="\uEFB2")
-    photo_size_select_actual: Symbol = Symbol(name="photo_size_select_actual", codepoint="\uE432")
-    photo_size_select_large: Symbol = Symbol(name="photo_size_select_large", codepoint="\uE433")
-    photo_size_select_small: Symbol = Symbol(name="photo_size_select_small", codepoint="\uE434")
-    php: Symbol = Symbol(name="php", codepoint="\uEB8F")
-    physical_therapy: Symbol = Symbol(name="physical_therapy", codepoint="\uE11E")
-    piano: Symbol = Symbol(name="piano", codepoint="\uE521")
-    piano_off: Symbol = Symbol(name="piano_off", codepoint="\uE520")
-    pickleball: Symbol = Symbol(name="pickleball", codepoint="\uF2A6")
-    picture_as_pdf: Symbol = Symbol(name="picture_as_pdf", codepoint="\uE415")
-    picture_in_picture: Symbol = Symbol(name="picture_in_picture", codepoint="\uE8AA")
-    picture_in_picture_alt: Symbol = Symbol(name="picture_in_picture_alt", codepoint="\uE911")
-    picture_in_picture_center: Symbol = Symbol(name="picture_in_picture_center", codepoint="\uF550")
-    picture_in_picture_large: Symbol = Symbol(name="picture_in_picture_large", codepoint="\uF54F")
-    picture_in_picture_medium: Symbol = Symbol(name="picture_in_picture_medium", codepoint="\uF54E")
-    picture_in_picture_mobile: Symbol = Symbol(name="picture_in_picture_mobile", codepoint="\uF517")
-    picture_in_picture_off: Symbol = Symbol(name="picture_in_picture_off", codepoint="\uF52F")
-    picture_in_picture_small: Symbol = Symbol(name="picture_in_picture_small", codepoint="\uF54D")
-    pie_chart: Symbol = Symbol(name="pie_chart", codepoint="\uF0DA")
-    pie_chart_filled: Symbol = Symbol(name="pie_chart_filled", codepoint="\uF0DA")
-    pie_chart_outline: Symbol = Symbol(name="pie_chart_outline", codepoint="\uF0DA")
-    pie_chart_outlined: Symbol = Symbol(name="pie_chart_outlined", codepoint="\uF0DA")
-    pill: Symbol = Symbol(name="pill", codepoint="\uE11F")
-    pill_off: Symbol = Symbol(name="pill_off", codepoint="\uF809")
-    pin: Symbol = Symbol(name="pin", codepoint="\uF045")
-    pin_drop: Symbol = Symbol(name="pin_drop", codepoint="\uE55E")
-    pin_end: Symbol = Symbol(name="pin_end", codepoint="\uE767")
-    pin_invoke: Symbol = Symbol(name="pin_invoke", codepoint="\uE763")
-    pinboard: Symbol = Symbol(name="pinboard", codepoint="\uF3AB")
-    pinboard_unread: Symbol = Symbol(name="pinboard_unread", codepoint="\uF3AC")
-    pinch: Symbol = Symbol(name="pinch", codepoint="\uEB38")
-    pinch_zoom_in: Symbol = Symbol(name="pinch_zoom_in", codepoint="\uF1FA")
-    pinch_zoom_out: Symbol = Symbol(name="pinch_zoom_out", codepoint="\uF1FB")
-    pip: Symbol = Symbol(name="pip", codepoint="\uF64D")
-    pip_exit: Symbol = Symbol(name="pip_exit", codepoint="\uF70D")
-    pivot_table_chart: Symbol = Symbol(name="pivot_table_chart", codepoint="\uE9CE")
-    place: Symbol = Symbol(name="place", codepoint="\uF1DB")
-    place_item: Symbol = Symbol(name="place_item", codepoint="\uF1F0")
-    plagiarism: Symbol = Symbol(name="plagiarism", codepoint="\uEA5A")
-    plane_contrails: Symbol = Symbol(name="plane_contrails", codepoint="\uF2AC")
-    planet: Symbol = Symbol(name="planet", codepoint="\uF387")
-    planner_banner_ad_pt: Symbol = Symbol(name="planner_banner_ad_pt", codepoint="\uE692")
-    planner_review: Symbol = Symbol(name="planner_review", codepoint="\uE694")
-    play_arrow: Symbol = Symbol(name="play_arrow", codepoint="\uE037")
-    play_circle: Symbol = Symbol(name="play_circle", codepoint="\uE1C4")
-    play_disabled: Symbol = Symbol(name="play_disabled", codepoint="\uEF6A")
-    play_for_work: Symbol = Symbol(name="play_for_work", codepoint="\uE906")
-    play_lesson: Symbol = Symbol(name="play_lesson", codepoint="\uF047")
-    play_music: Symbol = Symbol(name="play_music", codepoint="\uE6EE")
-    play_pause: Symbol = Symbol(name="play_pause", codepoint="\uF137")
-    play_shapes: Symbol = Symbol(name="play_shapes", codepoint="\uF7FC")
-    playground: Symbol = Symbol(name="playground", codepoint="\uF28E")
-    playground_2: Symbol = Symbol(name="playground_2", codepoint="\uF28F")
-    playing_cards: Symbol = Symbol(name="playing_cards", codepoint="\uF5DC")
-    playlist_add: Symbol = Symbol(name="playlist_add", codepoint="\uE03B")
-    playlist_add_check: Symbol = Symbol(name="playlist_add_check", codepoint="\uE065")
-    playlist_add_check_circle: Symbol = Symbol(name="playlist_add_check_circle", codepoint="\uE7E6")
-    playlist_add_circle: Symbol = Symbol(name="playlist_add_circle", codepoint="\uE7E5")
-    playlist_play: Symbol = Symbol(name="playlist_play", codepoint="\uE05F")
-    playlist_remove: Symbol = Symbol(name="playlist_remove", codepoint="\uEB80")
-    plug_connect: Symbol = Symbol(name="plug_connect", codepoint="\uF35A")
-    plumbing: Symbol = Symbol(name="plumbing", codepoint="\uF107")
-    plus_one: Symbol = Symbol(name="plus_one", codepoint="\uE800")
-    podcasts: Symbol = Symbol(name="podcasts", codepoint="\uF048")
-    podiatry: Symbol = Symbol(name="podiatry", codepoint="\uE120")
-    podium: Symbol = Symbol(name="podium", codepoint="\uF7FB")
-    point_of_sale: Symbol = Symbol(name="point_of_sale", codepoint="\uF17E")
-    point_scan: Symbol = Symbol(name="point_scan", codepoint="\uF70C")
-    poker_chip: Symbol = Symbol(name="poker_chip", codepoint="\uF49B")
-    policy: Symbol = Symbol(name="policy", codepoint="\uEA17")
-    policy_alert: Symbol = Symbol(name="policy_alert", codepoint="\uF407")
-    poll: Symbol = Symbol(name="poll", codepoint="\uF0CC")
-    polyline: Symbol = Symbol(name="polyline", codepoint="\uEBBB")
-    polymer: Symbol = Symbol(name="polymer", codepoint="\uE8AB")
-    pool: Symbol = Symbol(name="pool", codepoint="\uEB48")
-    portable_wifi_off: Symbol = Symbol(name="portable_wifi_off", codepoint="\uF087")
-    portrait: Symbol = Symbol(name="portrait", codepoint="\uE851")
-    position_bottom_left: Symbol = Symbol(name="position_bottom_left", codepoint="\uF70B")
-    position_bottom_right: Symbol = Symbol(name="position_bottom_right", codepoint="\uF70A")
-    position_top_right: Symbol = Symbol(name="position_top_right", codepoint="\uF709")
-    post: Symbol = Symbol(name="post", codepoint="\uE705")
-    post_add: Symbol = Symbol(name="post_add", codepoint="\uEA20")
-    potted_plant: Symbol = Symbol(name="potted_plant", codepoint="\uF8AA")
-    power: Symbol = Symbol(name="power", codepoint="\uE63C")
-    power_input: Symbol = Symbol(name="power_input", codepoint="\uE336")
-    power_off: Symbol = Symbol(name="power_off", codepoint="\uE646")
-    power_rounded: Symbol = Symbol(name="power_rounded", codepoint="\uF8C7")
-    power_settings_circle: Symbol = Symbol(name="power_settings_circle", codepoint="\uF418")
-    power_settings_new: Symbol = Symbol(name="power_settings_new", codepoint="\uF8C7")
-    prayer_times: Symbol = Symbol(name="prayer_times", codepoint="\uF838")
-    precision_manufacturing: Symbol = Symbol(name="precision_manufacturing", codepoint="\uF049")
-    pregnancy: Symbol = Symbol(name="pregnancy", codepoint="\uF5F1")
-    pregnant_woman: Symbol = Symbol(name="pregnant_woman", codepoint="\uF5F1")
-    preliminary: Symbol = Symbol(name="preliminary", codepoint="\uE7D8")
-    prescriptions: Symbol = Symbol(name="prescriptions", codepoint="\uE121")
-    present_to_all: Symbol = Symbol(name="present_to_all", codepoint="\uE0DF")
-    preview: Symbol = Symbol(name="preview", codepoint="\uF1C5")
-    preview_off: Symbol = Symbol(name="preview_off", codepoint="\uF7AF")
-    price_change: Symbol = Symbol(name="price_change", codepoint="\uF04A")
-    price_check: Symbol = Symbol(name="price_check", codepoint="\uF04B")
-    print: Symbol = Symbol(name="print", codepoint="\uE8AD")
-    print_add: Symbol = Symbol(name="print_add", codepoint="\uF7A2")
-    print_connect: Symbol = Symbol(name="print_connect", codepoint="\uF7A1")
-    print_disabled: Symbol = Symbol(name="print_disabled", codepoint="\uE9CF")
-    print_error: Symbol = Symbol(name="print_error", codepoint="\uF7A0")
-    print_lock: Symbol = Symbol(name="print_lock", codepoint="\uF651")
-    priority: Symbol = Symbol(name="priority", codepoint="\uE19F")
-    priority_high: Symbol = Symbol(name="priority_high", codepoint="\uE645")
-    privacy: Symbol = Symbol(name="privacy", codepoint="\uF148")
-    privacy_tip: Symbol = Symbol(name="privacy_tip", codepoint="\uF0DC")
-    private_connectivity: Symbol = Symbol(name="private_connectivity", codepoint="\uE744")
-    problem: Symbol = Symbol(name="problem", codepoint="\uE122")
-    procedure: Symbol = Symbol(name="procedure", codepoint="\uE651")
-    process_chart: Symbol = Symbol(name="process_chart", codepoint="\uF855")
-    production_quantity_limits: Symbol = Symbol(name="production_quantity_limits", codepoint="\uE1D1")
-    productivity: Symbol = Symbol(name="productivity", codepoint="\uE296")
-    progress_activity: Symbol = Symbol(name="progress_activity", codepoint="\uE9D0")
-    prompt_suggestion: Symbol = Symbol(name="prompt_suggestion", codepoint="\uF4F6")
-    propane: Symbol = Symbol(name="propane", codepoint="\uEC14")
-    propane_tank: Symbol = Symbol(name="propane_tank", codepoint="\uEC13")
-    psychiatry: Symbol = Symbol(name="psychiatry", codepoint="\uE123")
-    psychology: Symbol = Symbol(name="psychology", codepoint="\uEA4A")
-    psychology_alt: Symbol = Symbol(name="psychology_alt", codepoint="\uF8EA")
-    public: Symbol = Symbol(name="public", codepoint="\uE80B")
-    public_off: Symbol = Symbol(name="public_off", codepoint="\uF1CA")
-    publish: Symbol = Symbol(name="publish", codepoint="\uE255")
-    published_with_changes: Symbol = Symbol(name="published_with_changes", codepoint="\uF232")
-    pulmonology: Symbol = Symbol(name="pulmonology", codepoint="\uE124")
-    pulse_alert: Symbol = Symbol(name="pulse_alert", codepoint="\uF501")
-    punch_clock: Symbol = Symbol(name="punch_clock", codepoint="\uEAA8")
-    push_pin: Symbol = Symbol(name="push_pin", codepoint="\uF10D")
-    qr_code: Symbol = Symbol(name="qr_code", codepoint="\uEF6B")
-    qr_code_2: Symbol = Symbol(name="qr_code_2", codepoint="\uE00A")
-    qr_code_2_add: Symbol = Symbol(name="qr_code_2_add", codepoint="\uF658")
-    qr_code_scanner: Symbol = Symbol(name="qr_code_scanner", codepoint="\uF206")
-    query_builder: Symbol = Symbol(name="query_builder", codepoint="\uEFD6")
-    query_stats: Symbol = Symbol(name="query_stats", codepoint="\uE4FC")
-    question_answer: Symbol = Symbol(name="question_answer", codepoint="\uE8AF")
-    question_exchange: Symbol = Symbol(name="question_exchange", codepoint="\uF7F3")
-    question_mark: Symbol = Symbol(name="question_mark", codepoint="\uEB8B")
-    queue: Symbol = Symbol(name="queue", codepoint="\uE03C")
-    queue_music: Symbol = Symbol(name="queue_music", codepoint="\uE03D")
-    queue_play_next: Symbol = Symbol(name="queue_play_next", codepoint="\uE066")
-    quick_phrases: Symbol = Symbol(name="quick_phrases", codepoint="\uE7D1")
-    quick_reference: Symbol = Symbol(name="quick_reference", codepoint="\uE46E")
-    quick_reference_all: Symbol = Symbol(name="quick_reference_all", codepoint="\uF801")
-    quick_reorder: Symbol = Symbol(name="quick_reorder", codepoint="\uEB15")
-    quickreply: Symbol = Symbol(name="quickreply", codepoint="\uEF6C")
-    quiet_time: Symbol = Symbol(name="quiet_time", codepoint="\uF159")
-    quiet_time_active: Symbol = Symbol(name="quiet_time_active", codepoint="\uEB76")
-    quiz: Symbol = Symbol(name="quiz", codepoint="\uF04C")
-    r_mobiledata: Symbol = Symbol(name="r_mobiledata", codepoint="\uF04D")
-    radar: Symbol = Symbol(name="radar", codepoint="\uF04E")
-    radio: Symbol = Symbol(name="radio", codepoint="\uE03E")
-    radio_button_checked: Symbol = Symbol(name="radio_button_checked", codepoint="\uE837")
-    radio_button_partial: Symbol = Symbol(name="radio_button_partial", codepoint="\uF560")
-    radio_button_unchecked: Symbol = Symbol(name="radio_button_unchecked", codepoint="\uE836")
-    radiology: Symbol = Symbol(name="radiology", codepoint="\uE125")
-    railway_alert: Symbol = Symbol(name="railway_alert", codepoint="\uE9D1")
-    railway_alert_2: Symbol = Symbol(name="railway_alert_2", codepoint="\uF461")
-    rainy: Symbol = Symbol(name="rainy", codepoint="\uF176")
-    rainy_heavy: Symbol = Symbol(name="rainy_heavy", codepoint="\uF61F")
-    rainy_light: Symbol = Symbol(name="rainy_light", codepoint="\uF61E")
-    rainy_snow: Symbol = Symbol(name="rainy_snow", codepoint="\uF61D")
-    ramen_dining: Symbol = Symbol(name="ramen_dining", codepoint="\uEA64")
-    ramp_left: Symbol = Symbol(name="ramp_left", codepoint="\uEB9C")
-    ramp_right: Symbol = Symbol(name="ramp_right", codepoint="\uEB96")
-    range_hood: Symbol = Symbol(name="range_hood", codepoint="\uE1EA")
-    rate_review: Symbol = Symbol(name="rate_review", codepoint="\uE560")
-    rate_review_rtl: Symbol = Symbol(name="rate_review_rtl", codepoint="\uE706")
-    raven: Symbol = Symbol(name="raven", codepoint="\uF555")
-    raw_off: Symbol = Symbol(name="raw_off", codepoint="\uF04F")
-    raw_on: Symbol = Symbol(name="raw_on", codepoint="\uF050")
-    read_more: Symbol = Symbol(name="read_more", codepoint="\uEF6D")
-    readiness_score: Symbol = Symbol(name="readiness_score", codepoint="\uF6DD")
-    real_estate_agent: Symbol = Symbol(name="real_estate_agent", codepoint="\uE73A")
-    rear_camera: Symbol = Symbol(name="rear_camera", codepoint="\uF6C2")
-    rebase: Symbol = Symbol(name="rebase", codepoint="\uF845")
-    rebase_edit: Symbol = Symbol(name="rebase_edit", codepoint="\uF846")
-    receipt: Symbol = Symbol(name="receipt", codepoint="\uE8B0")
-    receipt_long: Symbol = Symbol(name="receipt_long", codepoint="\uEF6E")
-    receipt_long_off: Symbol = Symbol(name="receipt_long_off", codepoint="\uF40A")
-    recent_actors: Symbol = Symbol(name="recent_actors", codepoint="\uE03F")
-    recent_patient: Symbol = Symbol(name="recent_patient", codepoint="\uF808")
-    recenter: Symbol = Symbol(name="recenter", codepoint="\uF4C0")
-    recommend: Symbol = Symbol(name="recommend", codepoint="\uE9D2")
-    record_voice_over: Symbol = Symbol(name="record_voice_over", codepoint="\uE91F")
-    rectangle: Symbol = Symbol(name="rectangle", codepoint="\uEB54")
-    recycling: Symbol = Symbol(name="recycling", codepoint="\uE760")
-    redeem: Symbol = Symbol(name="redeem", codepoint="\uE8F6")
-    redo: Symbol = Symbol(name="redo", codepoint="\uE15A")
-    reduce_capacity: Symbol = Symbol(name="reduce_capacity", codepoint="\uF21C")
-    refresh: Symbol = Symbol(name="refresh", codepoint="\uE5D5")
-    regular_expression: Symbol = Symbol(name="regular_expression", codepoint="\uF750")
-    relax: Symbol = Symbol(name="relax", codepoint="\uF6DC")
-    release_alert: Symbol = Symbol(name="release_alert", codepoint="\uF654")
-    remember_me: Symbol = Symbol(name="remember_me", codepoint="\uF051")
-    reminder: Symbol = Symbol(name="reminder", codepoint="\uE6C6")
-    reminders_alt: Symbol = Symbol(name="reminders_alt", codepoint="\uE6C6")
-    remote_gen: Symbol = Symbol(name="remote_gen", codepoint="\uE83E")
-    remove: Symbol = Symbol(name="remove", codepoint="\uE15B")
-    remove_circle: Symbol = Symbol(name="remove_circle", codepoint="\uF08F")
-    remove_circle_outline: Symbol = Symbol(name="remove_circle_outline", codepoint="\uF08F")
-    remove_done: Symbol = Symbol(name="remove_done", codepoint="\uE9D3")
-    remove_from_queue: Symbol = Symbol(name="remove_from_queue", codepoint="\uE067")
-    remove_moderator: Symbol = Symbol(name="remove_moderator", codepoint="\uE9D4")
-    remove_red_eye: Symbol = Symbol(name="remove_red_eye", codepoint="\uE8F4")
-    remove_road: Symbol = Symbol(name="remove_road", codepoint="\uEBFC")
-    remove_selection: Symbol = Symbol(name="remove_selection", codepoint="\uE9D5")
-    remove_shopping_cart: Symbol = Symbol(name="remove_shopping_cart", codepoint="\uE928")
-    reopen_window: Symbol = Symbol(name="reopen_window", codepoint="\uF708")
-    reorder: Symbol = Symbol(name="reorder", codepoint="\uE8FE")
-    repartition: Symbol = Symbol(name="repartition", codepoint="\uF8E8")
-    repeat: Symbol = Symbol(name="repeat", codepoint="\uE040")
-    repeat_on: Symbol = Symbol(name="repeat_on", codepoint="\uE9D6")
-    repeat_one: Symbol = Symbol(name="repeat_one", codepoint="\uE041")
-    repeat_one_on: Symbol = Symbol(name="repeat_one_on", codepoint="\uE9D7")
-    replace_audio: Symbol = Symbol(name="replace_audio", codepoint="\uF451")
-    replace_image: Symbol = Symbol(name="replace_image", codepoint="\uF450")
-    replace_video: Symbol = Symbol(name="replace_video", codepoint="\uF44F")
-    replay: Symbol = Symbol(name="replay", codepoint="\uE042")
-    replay_10: Symbol = Symbol(name="replay_10", codepoint="\uE059")
-    replay_30: Symbol = Symbol(name="replay_30", codepoint="\uE05A")
-    replay_5: Symbol = Symbol(name="replay_5", codepoint="\uE05B")
-    replay_circle_filled: Symbol = Symbol(name="replay_circle_filled", codepoint="\uE9D8")
-    reply: Symbol = Symbol(name="reply", codepoint="\uE15E")
-    reply_all: Symbol = Symbol(name="reply_all", codepoint="\uE15F")
-    report: Symbol = Symbol(name="report", codepoint="\uF052")
-    report_gmailerrorred: Symbol = Symbol(name="report_gmailerrorred", codepoint="\uF052")
-    report_off: Symbol = Symbol(name="report_off", codepoint="\uE170")
-    report_problem: Symbol = Symbol(name="report_problem", codepoint="\uF083")
-    request_page: Symbol = Symbol(name="request_page", codepoint="\uF22C")
-    request_quote: Symbol = Symbol(name="request_quote", codepoint="\uF1B6")
-    reset_brightness: Symbol = Symbol(name="reset_brightness", codepoint="\uF482")
-    reset_exposure: Symbol = Symbol(name="reset_exposure", codepoint="\uF266")
-    reset_focus: Symbol = Symbol(name="reset_focus", codepoint="\uF481")
-    reset_image: Symbol = Symbol(name="reset_image", codepoint="\uF824")
-    reset_iso: Symbol = Symbol(name="reset_iso", codepoint="\uF480")
-    reset_settings: Symbol = Symbol(name="reset_settings", codepoint="\uF47F")
-    reset_shadow: Symbol = Symbol(name="reset_shadow", codepoint="\uF47E")
-    reset_shutter_speed: Symbol = Symbol(name="reset_shutter_speed", codepoint="\uF47D")
-    reset_tv: Symbol = Symbol(name="reset_tv", codepoint="\uE9D9")
-    reset_white_balance: Symbol = Symbol(name="reset_white_balance", codepoint="\uF47C")
-    reset_wrench: Symbol = Symbol(name="reset_wrench", codepoint="\uF56C")
-    resize: Symbol = Symbol(name="resize", codepoint="\uF707")
-    respiratory_rate: Symbol = Symbol(name="respiratory_rate", codepoint="\uE127")
-    responsive_layout: Symbol = Symbol(name="responsive_layout", codepoint="\uE9DA")
-    rest_area: Symbol = Symbol(name="rest_area", codepoint="\uF22A")
-    restart_alt: Symbol = Symbol(name="restart_alt", codepoint="\uF053")
-    restaurant: Symbol = Symbol(name="restaurant", codepoint="\uE56C")
-    restaurant_menu: Symbol = Symbol(name="restaurant_menu", codepoint="\uE561")
-    restore: Symbol = Symbol(name="restore", codepoint="\uE8B3")
-    restore_from_trash: Symbol = Symbol(name="restore_from_trash", codepoint="\uE938")
-    restore_page: Symbol = Symbol(name="restore_page", codepoint="\uE929")
-    resume: Symbol = Symbol(name="resume", codepoint="\uF7D0")
-    reviews: Symbol = Symbol(name="reviews", codepoint="\uF07C")
-    rewarded_ads: Symbol = Symbol(name="rewarded_ads", codepoint="\uEFB6")
-    rheumatology: Symbol = Symbol(name="rheumatology", codepoint="\uE128")
-    rib_cage: Symbol = Symbol(name="rib_cage", codepoint="\uF898")
-    rice_bowl: Symbol = Symbol(name="rice_bowl", codepoint="\uF1F5")
-    right_click: Symbol = Symbol(name="right_click", codepoint="\uF706")
-    right_panel_close: Symbol = Symbol(name="right_panel_close", codepoint="\uF705")
-    right_panel_open: Symbol = Symbol(name="right_panel_open", codepoint="\uF704")
-    ring_volume: Symbol = Symbol(name="ring_volume", codepoint="\uF0DD")
-    ring_volume_filled: Symbol = Symbol(name="ring_volume_filled", codepoint="\uF0DD")
-    ripples: Symbol = Symbol(name="ripples", codepoint="\uE9DB")
-    road: Symbol = Symbol(name="road", codepoint="\uF472")
-    robot: Symbol = Symbol(name="robot", codepoint="\uF882")
-    robot_2: Symbol = Symbol(name="robot_2", codepoint="\uF5D0")
-    rocket: Symbol = Symbol(name="rocket", codepoint="\uEBA5")
-    rocket_launch: Symbol = Symbol(name="rocket_launch", codepoint="\uEB9B")
-    roller_shades: Symbol = Symbol(name="roller_shades", codepoint="\uEC12")
-    roller_shades_closed: Symbol = Symbol(name="roller_shades_closed", codepoint="\uEC11")
-    roller_skating: Symbol = Symbol(name="roller_skating", codepoint="\uEBCD")
-    roofing: Symbol = Symbol(name="roofing", codepoint="\uF201")
-    room: Symbol = Symbol(name="room", codepoint="\uF1DB")
-    room_preferences: Symbol = Symbol(name="room_preferences", codepoint="\uF1B8")
-    room_service: Symbol = Symbol(name="room_service", codepoint="\uEB49")
-    rotate_90_degrees_ccw: Symbol = Symbol(name="rotate_90_degrees_ccw", codepoint="\uE418")
-    rotate_90_degrees_cw: Symbol = Symbol(name="rotate_90_degrees_cw", codepoint="\uEAAB")
-    rotate_auto: Symbol = Symbol(name="rotate_auto", codepoint="\uF417")
-    rotate_left: Symbol = Symbol(name="rotate_left", codepoint="\uE419")
-    rotate_right: Symbol = Symbol(name="rotate_right", codepoint="\uE41A")
-    roundabout_left: Symbol = Symbol(name="roundabout_left", codepoint="\uEB99")
-    roundabout_right: Symbol = Symbol(name="roundabout_right", codepoint="\uEBA3")
-    rounded_corner: Symbol = Symbol(name="rounded_corner", codepoint="\uE920")
-    route: Symbol = Symbol(name="route", codepoint="\uEACD")
-    router: Symbol = Symbol(name="router", codepoint="\uE328")
-    router_off: Symbol = Symbol(name="router_off", codepoint="\uF2F4")
-    routine: Symbol = Symbol(name="routine", codepoint="\uE20C")
-    rowing: Symbol = Symbol(name="rowing", codepoint="\uE921")
-    rss_feed: Symbol = Symbol(name="rss_feed", codepoint="\uE0E5")
-    rsvp: Symbol = Symbol(name="rsvp", codepoint="\uF055")
-    rtt: Symbol = Symbol(name="rtt", codepoint="\uE9AD")
-    rubric: Symbol = Symbol(name="rubric", codepoint="\uEB27")
-    rule: Symbol = Symbol(name="rule", codepoint="\uF1C2")
-    rule_folder: Symbol = Symbol(name="rule_folder", codepoint="\uF1C9")
-    rule_settings: Symbol = Symbol(name="rule_settings", codepoint="\uF64C")
-    run_circle: Symbol = Symbol(name="run_circle", codepoint="\uEF6F")
-    running_with_errors: Symbol = Symbol(name="running_with_errors", codepoint="\uE51D")
-    rv_hookup: Symbol = Symbol(name="rv_hookup", codepoint="\uE642")
-    safety_check: Symbol = Symbol(name="safety_check", codepoint="\uEBEF")
-    safety_check_off: Symbol = Symbol(name="safety_check_off", codepoint="\uF59D")
-    safety_divider: Symbol = Symbol(name="safety_divider", codepoint="\uE1CC")
-    sailing: Symbol = Symbol(name="sailing", codepoint="\uE502")
-    salinity: Symbol = Symbol(name="salinity", codepoint="\uF876")
-    sanitizer: Symbol = Symbol(name="sanitizer", codepoint="\uF21D")
-    satellite: Symbol = Symbol(name="satellite", codepoint="\uE562")
-    satellite_alt: Symbol = Symbol(name="satellite_alt", codepoint="\uEB3A")
-    sauna: Symbol = Symbol(name="sauna", codepoint="\uF6F7")
-    save: Symbol = Symbol(name="save", codepoint="\uE161")
-    save_alt: Symbol = Symbol(name="save_alt", codepoint="\uF090")
-    save_as: Symbol = Symbol(name="save_as", codepoint="\uEB60")
-    save_clock: Symbol = Symbol(name="save_clock", codepoint="\uF398")
-    saved_search: Symbol = Symbol(name="saved_search", codepoint="\uEA11")
-    savings: Symbol = Symbol(name="savings", codepoint="\uE2EB")
-    scale: Symbol = Symbol(name="scale", codepoint="\uEB5F")
-    scan: Symbol = Symbol(name="scan", codepoint="\uF74E")
-    scan_delete: Symbol = Symbol(name="scan_delete", codepoint="\uF74F")
-    scanner: Symbol = Symbol(name="scanner", codepoint="\uE329")
-    scatter_plot: Symbol = Symbol(name="scatter_plot", codepoint="\uE268")
-    scene: Symbol = Symbol(name="scene", codepoint="\uE2A7")
-    schedule: Symbol = Symbol(name="schedule", codepoint="\uEFD6")
-    schedule_send: Symbol = Symbol(name="schedule_send", codepoint="\uEA0A")
-    schema: Symbol = Symbol(name="schema", codepoint="\uE4FD")
-    school: Symbol = Symbol(name="school", codepoint="\uE80C")
-    science: Symbol = Symbol(name="science", codepoint="\uEA4B")
-    science_off: Symbol = Symbol(name="science_off", codepoint="\uF542")
-    scooter: Symbol = Symbol(name="scooter", codepoint="\uF471")
-    score: Symbol = Symbol(name="score", codepoint="\uE269")
-    scoreboard: Symbol = Symbol(name="scoreboard", codepoint="\uEBD0")
-    screen_lock_landscape: Symbol = Symbol(name="screen_lock_landscape", codepoint="\uF2D8")
-    screen_lock_portrait: Symbol = Symbol(name="screen_lock_portrait", codepoint="\uF2BE")
-    screen_lock_rotation: Symbol = Symbol(name="screen_lock_rotation", codepoint="\uF2D6")
-    screen_record: Symbol = Symbol(name="screen_record", codepoint="\uF679")
-    screen_rotation: Symbol = Symbol(name="screen_rotation", codepoint="\uF2D5")
-    screen_rotation_alt: Symbol = Symbol(name="screen_rotation_alt", codepoint="\uEBEE")
-    screen_rotation_up: Symbol = Symbol(name="screen_rotation_up", codepoint="\uF678")
-    screen_search_desktop: Symbol = Symbol(name="screen_search_desktop", codepoint="\uEF70")
-    screen_share: Symbol = Symbol(name="screen_share", codepoint="\uE0E2")
-    screenshot: Symbol = Symbol(name="screenshot", codepoint="\uF056")
-    screenshot_frame: Symbol = Symbol(name="screenshot_frame", codepoint="\uF677")
-    screenshot_frame_2: Symbol = Symbol(name="screenshot_frame_2", codepoint="\uF374")
-    screenshot_keyboard: Symbol = Symbol(name="screenshot_keyboard", codepoint="\uF7D3")
-    screenshot_monitor: Symbol = Symbol(name="screenshot_monitor", codepoint="\uEC08")
-    screenshot_region: Symbol = Symbol(name="screenshot_region", codepoint="\uF7D2")
-    screenshot_tablet: Symbol = Symbol(name="screenshot_tablet", codepoint="\uF697")
-    script: Symbol = Symbol(name="script", codepoint="\uF45F")
-    scrollable_header: Symbol = Symbol(name="scrollable_header", codepoint="\uE9DC")
-    scuba_diving: Symbol = Symbol(name="scuba_diving", codepoint="\uEBCE")
-    sd: Symbol = Symbol(name="sd", codepoint="\uE9DD")
-    sd_card: Symbol = Symbol(name="sd_card", codepoint="\uE623")
-    sd_card_alert: Symbol = Symbol(name="sd_card_alert", codepoint="\uF057")
-    sd_storage: Symbol = Symbol(name="sd_storage", codepoint="\uE623")
-    sdk: Symbol = Symbol(name="sdk", codepoint="\uE720")
-    search: Symbol = Symbol(name="search", codepoint="\uE8B6")
-    search_activity: Symbol = Symbol(name="search_activity", codepoint="\uF3E5")
-    search_check: Symbol = Symbol(name="search_check", codepoint="\uF800")
-    search_check_2: Symbol = Symbol(name="search_check_2", codepoint="\uF469")
-    search_gear: Symbol = Symbol(name="search_gear", codepoint="\uEEFA")
-    search_hands_free: Symbol = Symbol(name="search_hands_free", codepoint="\uE696")
-    search_insights: Symbol = Symbol(name="search_insights", codepoint="\uF4BC")
-    search_off: Symbol = Symbol(name="search_off", codepoint="\uEA76")
-    seat_cool_left: Symbol = Symbol(name="seat_cool_left", codepoint="\uF331")
-    seat_cool_right: Symbol = Symbol(name="seat_cool_right", codepoint="\uF330")
-    seat_heat_left: Symbol = Symbol(name="seat_heat_left", codepoint="\uF32F")
-    seat_heat_right: Symbol = Symbol(name="seat_heat_right", codepoint="\uF32E")
-    seat_vent_left: Symbol = Symbol(name="seat_vent_left", codepoint="\uF32D")
-    seat_vent_right: Symbol = Symbol(name="seat_vent_right", codepoint="\uF32C")
-    security: Symbol = Symbol(name="security", codepoint="\uE32A")
-    security_key: Symbol = Symbol(name="security_key", codepoint="\uF503")
-    security_update: Symbol = Symbol(name="security_update", codepoint="\uF2CD")
-    security_update_good: Symbol = Symbol(name="security_update_good", codepoint="\uF073")
-    security_update_warning: Symbol = Symbol(name="security_update_warning", codepoint="\uF2D3")
-    segment: Symbol = Symbol(name="segment", codepoint="\uE94B")
-    select: Symbol = Symbol(name="select", codepoint="\uF74D")
-    select_all: Symbol = Symbol(name="select_all", codepoint="\uE162")
-    select_check_box: Symbol = Symbol(name="select_check_box", codepoint="\uF1FE")
-    select_to_speak: Symbol = Symbol(name="select_to_speak", codepoint="\uF7CF")
-    select_window: Symbol = Symbol(name="select_window", codepoint="\uE6FA")
-    select_window_2: Symbol = Symbol(name="select_window_2", codepoint="\uF4C8")
-    select_window_off: Symbol = Symbol(name="select_window_off", codepoint="\uE506")
-    self_care: Symbol = Symbol(name="self_care", codepoint="\uF86D")
-    self_improvement: Symbol = Symbol(name="self_improvement", codepoint="\uEA78")
-    sell: Symbol = Symbol(name="sell", codepoint="\uF05B")
-    send: Symbol = Symbol(name="send", codepoint="\uE163")
-    send_and_archive: Symbol = Symbol(name="send_and_archive", codepoint="\uEA0C")
-    send_money: Symbol = Symbol(name="send_money", codepoint="\uE8B7")
-    send_time_extension: Symbol = Symbol(name="send_time_extension", codepoint="\uEADB")
-    send_to_mobile: Symbol = Symbol(name="send_to_mobile", codepoint="\uF2D2")
-    sensor_door: Symbol = Symbol(name="sensor_door", codepoint="\uF1B5")
-    sensor_occupied: Symbol = Symbol(name="sensor_occupied", codepoint="\uEC10")
-    sensor_window: Symbol = Symbol(name="sensor_window", codepoint="\uF1B4")
-    sensors: Symbol = Symbol(name="sensors", codepoint="\uE51E")
-    sensors_krx: Symbol = Symbol(name="sensors_krx", codepoint="\uF556")
-    sensors_krx_off: Symbol = Symbol(name="sensors_krx_off", codepoint="\uF515")
-    sensors_off: Symbol = Symbol(name="sensors_off", codepoint="\uE51F")
-    sentiment_calm: Symbol = Symbol(name="sentiment_calm", codepoint="\uF6A7")
-    sentiment_content: Symbol = Symbol(name="sentiment_content", codepoint="\uF6A6")
-    sentiment_dissatisfied: Symbol = Symbol(name="sentiment_dissatisfied", codepoint="\uE811")
-    sentiment_excited: Symbol = Symbol(name="sentiment_excited", codepoint="\uF6A5")
-    sentiment_extremely_dissatisfied: Symbol = Symbol(name="sentiment_extremely_dissatisfied", codepoint="\uF194")
-    sentiment_frustrated: Symbol = Symbol(name="sentiment_frustrated", codepoint="\uF6A4")
-    sentiment_neutral: Symbol = Symbol(name="sentiment_neutral", codepoint="\uE812")
-    sentiment_sad: Symbol = Symbol(name="sentiment_sad", codepoint="\uF6A3")
-    sentiment_satisfied: Symbol = Symbol(name="sentiment_satisfied", codepoint="\uE813")
-    sentiment_satisfied_alt: Symbol = Symbol(name="sentiment_satisfied_alt", codepoint="\uE813")
-    sentiment_stressed: Symbol = Symbol(name="sentiment_stressed", codepoint="\uF6A2")
-    sentiment_very_dissatisfied: Symbol = Symbol(name="sentiment_very_dissatisfied", codepoint="\uE814")
-    sentiment_very_satisfied: Symbol = Symbol(name="sentiment_very_satisfied", codepoint="\uE815")
-    sentiment_worried: Symbol = Symbol(name="sentiment_worried", codepoint="\uF6A1")
-    serif: Symbol = Symbol(name="serif", codepoint="\uF4AC")
-    server_person: Symbol = Symbol(name="server_person", codepoint="\uF3BD")
-    service_toolbox: Symbol = Symbol(name="service_toolbox", codepoint="\uE717")
-    set_meal: Symbol = Symbol(name="set_meal", codepoint="\uF1EA")
-    settings: Symbol = Symbol(name="settings", codepoint="\uE8B8")
-    settings_accessibility: Symbol = Symbol(name="settings_accessibility", codepoint="\uF05D")
-    settings_account_box: Symbol = Symbol(name="settings_account_box", codepoint="\uF835")
-    settings_alert: Symbol = Symbol(name="settings_alert", codepoint="\uF143")
-    settings_applications: Symbol = Symbol(name="settings_applications", codepoint="\uE8B9")
-    settings_b_roll: Symbol = Symbol(name="settings_b_roll", codepoint="\uF625")
-    settings_backup_restore: Symbol = Symbol(name="settings_backup_restore", codepoint="\uE8BA")
-    settings_bluetooth: Symbol = Symbol(name="settings_bluetooth", codepoint="\uE8BB")
-    settings_brightness: Symbol = Symbol(name="settings_brightness", codepoint="\uE8BD")
-    settings_cell: Symbol = Symbol(name="settings_cell", codepoint="\uF2D1")
-    settings_cinematic_blur: Symbol = Symbol(name="settings_cinematic_blur", codepoint="\uF624")
-    settings_ethernet: Symbol = Symbol(name="settings_ethernet", codepoint="\uE8BE")
-    settings_heart: Symbol = Symbol(name="settings_heart", codepoint="\uF522")
-    settings_input_antenna: Symbol = Symbol(name="settings_input_antenna", codepoint="\uE8BF")
-    settings_input_component: Symbol = Symbol(name="settings_input_component", codepoint="\uE8C1")
-    settings_input_composite: Symbol = Symbol(name="settings_input_composite", codepoint="\uE8C1")
-    settings_input_hdmi: Symbol = Symbol(name="settings_input_hdmi", codepoint="\uE8C2")
-    settings_input_svideo: Symbol = Symbol(name="settings_input_svideo", codepoint="\uE8C3")
-    settings_motion_mode: Symbol = Symbol(name="settings_motion_mode", codepoint="\uF833")
-    settings_night_sight: Symbol = Symbol(name="settings_night_sight", codepoint="\uF832")
-    settings_overscan: Symbol = Symbol(name="settings_overscan", codepoint="\uE8C4")
-    settings_panorama: Symbol = Symbol(name="settings_panorama", codepoint="\uF831")
-    settings_phone: Symbol = Symbol(name="settings_phone", codepoint="\uE8C5")
-    settings_photo_camera: Symbol = Symbol(name="settings_photo_camera", codepoint="\uF834")
-    settings_power: Symbol = Symbol(name="settings_power", codepoint="\uE8C6")
-    settings_remote: Symbol = Symbol(name="settings_remote", codepoint="\uE8C7")
-    settings_seating: Symbol = Symbol(name="settings_seating", codepoint="\uEF2D")
-    settings_slow_motion: Symbol = Symbol(name="settings_slow_motion", codepoint="\uF623")
-    settings_suggest: Symbol = Symbol(name="settings_suggest", codepoint="\uF05E")
-    settings_system_daydream: Symbol = Symbol(name="settings_system_daydream", codepoint="\uE1C3")
-    settings_timelapse: Symbol = Symbol(name="settings_timelapse", codepoint="\uF622")
-    settings_video_camera: Symbol = Symbol(name="settings_video_camera", codepoint="\uF621")
-    settings_voice: Symbol = Symbol(name="settings_voice", codepoint="\uE8C8")
-    settop_component: Symbol = Symbol(name="settop_component", codepoint="\uE2AC")
-    severe_cold: Symbol = Symbol(name="severe_cold", codepoint="\uEBD3")
-    shadow: Symbol = Symbol(name="shadow", codepoint="\uE9DF")
-    shadow_add: Symbol = Symbol(name="shadow_add", codepoint="\uF584")
-    shadow_minus: Symbol = Symbol(name="shadow_minus", codepoint="\uF583")
-    shape_line: Symbol = Symbol(name="shape_line", codepoint="\uF8D3")
-    shape_recognition: Symbol = Symbol(name="shape_recognition", codepoint="\uEB01")
-    shapes: Symbol = Symbol(name="shapes", codepoint="\uE602")
-    share: Symbol = Symbol(name="share", codepoint="\uE80D")
-    share_eta: Symbol = Symbol(name="share_eta", codepoint="\uE5F7")
-    share_location: Symbol = Symbol(name="share_location", codepoint="\uF05F")
-    share_off: Symbol = Symbol(name="share_off", codepoint="\uF6CB")
-    share_reviews: Symbol = Symbol(name="share_reviews", codepoint="\uF8A4")
-    share_windows: Symbol = Symbol(name="share_windows", codepoint="\uF613")
-    shaved_ice: Symbol = Symbol(name="shaved_ice", codepoint="\uF225")
-    sheets_rtl: Symbol = Symbol(name="sheets_rtl", codepoint="\uF823")
-    shelf_auto_hide: Symbol = Symbol(name="shelf_auto_hide", codepoint="\uF703")
-    shelf_position: Symbol = Symbol(name="shelf_position", codepoint="\uF702")
-    shelves: Symbol = Symbol(name="shelves", codepoint="\uF86E")
-    shield: Symbol = Symbol(name="shield", codepoint="\uE9E0")
-    shield_lock: Symbol = Symbol(name="shield_lock", codepoint="\uF686")
-    shield_locked: Symbol = Symbol(name="shield_locked", codepoint="\uF592")
-    shield_moon: Symbol = Symbol(name="shield_moon", codepoint="\uEAA9")
-    shield_person: Symbol = Symbol(name="shield_person", codepoint="\uF650")
-    shield_question: Symbol = Symbol(name="shield_question", codepoint="\uF529")
-    shield_toggle: Symbol = Symbol(name="shield_toggle", codepoint="\uF2AD")
-    shield_watch: Symbol = Symbol(name="shield_watch", codepoint="\uF30F")
-    shield_with_heart: Symbol = Symbol(name="shield_with_heart", codepoint="\uE78F")
-    shield_with_house: Symbol = Symbol(name="shield_with_house", codepoint="\uE78D")
-    shift: Symbol = Symbol(name="shift", codepoint="\uE5F2")
-    shift_lock: Symbol = Symbol(name="shift_lock", codepoint="\uF7AE")
-    shift_lock_off: Symbol = Symbol(name="shift_lock_off", codepoint="\uF483")
-    shop: Symbol = Symbol(name="shop", codepoint="\uE8C9")
-    shop_2: Symbol = Symbol(name="shop_2", codepoint="\uE8CA")
-    shop_two: Symbol = Symbol(name="shop_two", codepoint="\uE8CA")
-    shopping_bag: Symbol = Symbol(name="shopping_bag", codepoint="\uF1CC")
-    shopping_bag_speed: Symbol = Symbol(name="shopping_bag_speed", codepoint="\uF39A")
-    shopping_basket: Symbol = Symbol(name="shopping_basket", codepoint="\uE8CB")
-    shopping_cart: Symbol = Symbol(name="shopping_cart", codepoint="\uE8CC")
-    shopping_cart_checkout: Symbol = Symbol(name="shopping_cart_checkout", codepoint="\uEB88")
-    shopping_cart_off: Symbol = Symbol(name="shopping_cart_off", codepoint="\uF4F7")
-    shoppingmode: Symbol = Symbol(name="shoppingmode", codepoint="\uEFB7")
-    short_stay: Symbol = Symbol(name="short_stay", codepoint="\uE4D0")
-    short_text: Symbol = Symbol(name="short_text", codepoint="\uE261")
-    shortcut: Symbol = Symbol(name="shortcut", codepoint="\uF57A")
-    show_chart: Symbol = Symbol(name="show_chart", codepoint="\uE6E1")
-    shower: Symbol = Symbol(name="shower", codepoint="\uF061")
-    shuffle: Symbol = Symbol(name="shuffle", codepoint="\uE043")
-    shuffle_on: Symbol = Symbol(name="shuffle_on", codepoint="\uE9E1")
-    shutter_speed: Symbol = Symbol(name="shutter_speed", codepoint="\uE43D")
-    shutter_speed_add: Symbol = Symbol(name="shutter_speed_add", codepoint="\uF57E")
-    shutter_speed_minus: Symbol = Symbol(name="shutter_speed_minus", codepoint="\uF57D")
-    sick: Symbol = Symbol(name="sick", codepoint="\uF220")
-    side_navigation: Symbol = Symbol(name="side_navigation", codepoint="\uE9E2")
-    sign_language: Symbol = Symbol(name="sign_language", codepoint="\uEBE5")
-    sign_language_2: Symbol = Symbol(name="sign_language_2", codepoint="\uF258")
-    signal_cellular_0_bar: Symbol = Symbol(name="signal_cellular_0_bar", codepoint="\uF0A8")
-    signal_cellular_1_bar: Symbol = Symbol(name="signal_cellular_1_bar", codepoint="\uF0A9")
-    signal_cellular_2_bar: Symbol = Symbol(name="signal_cellular_2_bar", codepoint="\uF0AA")
-    signal_cellular_3_bar: Symbol = Symbol(name="signal_cellular_3_bar", codepoint="\uF0AB")
-    signal_cellular_4_bar: Symbol = Symbol(name="signal_cellular_4_bar", codepoint="\uE1C8")
-    signal_cellular_add: Symbol = Symbol(name="signal_cellular_add", codepoint="\uF7A9")
-    signal_cellular_alt: Symbol = Symbol(name="signal_cellular_alt", codepoint="\uE202")
-    signal_cellular_alt_1_bar: Symbol = Symbol(name="signal_cellular_alt_1_bar", codepoint="\uEBDF")
-    signal_cellular_alt_2_bar: Symbol = Symbol(name="signal_cellular_alt_2_bar", codepoint="\uEBE3")
-    signal_cellular_connected_no_internet_0_bar: Symbol = Symbol(
-        name="signal_cellular_connected_no_internet_0_bar",
-        codepoint="\uF0AC",
-    )
-    signal_cellular_connected_no_internet_4_bar: Symbol = Symbol(
-        name="signal_cellular_connected_no_internet_4_bar",
-        codepoint="\uE1CD",
-    )
-    signal_cellular_no_sim: Symbol = Symbol(name="signal_cellular_no_sim", codepoint="\uE1CE")
-    signal_cellular_nodata: Symbol = Symbol(name="signal_cellular_nodata", codepoint="\uF062")
-    signal_cellular_null: Symbol = Symbol(name="signal_cellular_null", codepoint="\uE1CF")
-    signal_cellular_off: Symbol = Symbol(name="signal_cellular_off", codepoint="\uE1D0")
-    signal_cellular_pause: Symbol = Symbol(name="signal_cellular_pause", codepoint="\uF5A7")
-    signal_disconnected: Symbol = Symbol(name="signal_disconnected", codepoint="\uF239")
-    signal_wifi_0_bar: Symbol = Symbol(name="signal_wifi_0_bar", codepoint="\uF0B0")
-    signal_wifi_4_bar: Symbol = Symbol(name="signal_wifi_4_bar", codepoint="\uF065")
-    signal_wifi_4_bar_lock: Symbol = Symbol(name="signal_wifi_4_bar_lock", codepoint="\uE1E1")
-    signal_wifi_bad: Symbol = Symbol(name="signal_wifi_bad", codepoint="\uF064")
-    signal_wifi_connected_no_internet_4: Symbol = Symbol(
-        name="signal_wifi_connected_no_internet_4",
-        codepoint="\uF064",
-    )
-    signal_wifi_off: Symbol = Symbol(name="signal_wifi_off", codepoint="\uE1DA")
-    signal_wifi_statusbar_4_bar: Symbol = Symbol(name="signal_wifi_statusbar_4_bar", codepoint="\uF065")
-    signal_wifi_statusbar_not_connected: Symbol = Symbol(
-        name="signal_wifi_statusbar_not_connected",
-        codepoint="\uF0EF",
-    )
-    signal_wifi_statusbar_null: Symbol = Symbol(name="signal_wifi_statusbar_null", codepoint="\uF067")
-    signature: Symbol = Symbol(name="signature", codepoint="\uF74C")
-    signpost: Symbol = Symbol(name="signpost", codepoint="\uEB91")
-    sim_card: Symbol = Symbol(name="sim_card", codepoint="\uE32B")
-    sim_card_alert: Symbol = Symbol(name="sim_card_alert", codepoint="\uF057")
-    sim_card_download: Symbol = Symbol(name="sim_card_download", codepoint="\uF068")
-    simulation: Symbol = Symbol(name="simulation", codepoint="\uF3E1")
-    single_bed: Symbol = Symbol(name="single_bed", codepoint="\uEA48")
-    sip: Symbol = Symbol(name="sip", codepoint="\uF069")
-    siren: Symbol = Symbol(name="siren", codepoint="\uF3A7")
-    siren_check: Symbol = Symbol(name="siren_check", codepoint="\uF3A6")
-    siren_open: Symbol = Symbol(name="siren_open", codepoint="\uF3A5")
-    siren_question: Symbol = Symbol(name="siren_question", codepoint="\uF3A4")
-    skateboarding: Symbol = Symbol(name="skateboarding", codepoint="\uE511")
-    skeleton: Symbol = Symbol(name="skeleton", codepoint="\uF899")
-    skillet: Symbol = Symbol(name="skillet", codepoint="\uF543")
-    skillet_cooktop: Symbol = Symbol(name="skillet_cooktop", codepoint="\uF544")
-    skip_next: Symbol = Symbol(name="skip_next", codepoint="\uE044")
-    skip_previous: Symbol = Symbol(name="skip_previous", codepoint="\uE045")
-    skull: Symbol = Symbol(name="skull", codepoint="\uF89A")
-    skull_list: Symbol = Symbol(name="skull_list", codepoint="\uF370")
-    slab_serif: Symbol = Symbol(name="slab_serif", codepoint="\uF4AB")
-    sledding: Symbol = Symbol(name="sledding", codepoint="\uE512")
-    sleep: Symbol = Symbol(name="sleep", codepoint="\uE213")
-    sleep_score: Symbol = Symbol(name="sleep_score", codepoint="\uF6B7")
-    slide_library: Symbol = Symbol(name="slide_library", codepoint="\uF822")
-    sliders: Symbol = Symbol(name="sliders", codepoint="\uE9E3")
-    slideshow: Symbol = Symbol(name="slideshow", codepoint="\uE41B")
-    slow_motion_video: Symbol = Symbol(name="slow_motion_video", codepoint="\uE068")
-    smart_button: Symbol = Symbol(name="smart_button", codepoint="\uF1C1")
-    smart_card_reader: Symbol = Symbol(name="smart_card_reader", codepoint="\uF4A5")
-    smart_card_reader_off: Symbol = Symbol(name="smart_card_reader_off", codepoint="\uF4A6")
-    smart_display: Symbol = Symbol(name="smart_display", codepoint="\uF06A")
-    smart_outlet: Symbol = Symbol(name="smart_outlet", codepoint="\uE844")
-    smart_screen: Symbol = Symbol(name="smart_screen", codepoint="\uF2D0")
-    smart_toy: Symbol = Symbol(name="smart_toy", codepoint="\uF06C")
-    smartphone: Symbol = Symbol(name="smartphone", codepoint="\uE7BA")
-    smartphone_camera: Symbol = Symbol(name="smartphone_camera", codepoint="\uF44E")
-    smb_share: Symbol = Symbol(name="smb_share", codepoint="\uF74B")
-    smoke_free: Symbol = Symbol(name="smoke_free", codepoint="\uEB4A")
-    smoking_rooms: Symbol = Symbol(name="smoking_rooms", codepoint="\uEB4B")
-    sms: Symbol = Symbol(name="sms", codepoint="\uE625")
-    sms_failed: Symbol = Symbol(name="sms_failed", codepoint="\uE87F")
-    snippet_folder: Symbol = Symbol(name="snippet_folder", codepoint="\uF1C7")
-    snooze: Symbol = Symbol(name="snooze", codepoint="\uE046")
-    snowboarding: Symbol = Symbol(name="snowboarding", codepoint="\uE513")
-    snowing: Symbol = Symbol(name="snowing", codepoint="\uE80F")
-    snowing_heavy: Symbol = Symbol(name="snowing_heavy", codepoint="\uF61C")
-    snowmobile: Symbol = Symbol(name="snowmobile", codepoint="\uE503")
-    snowshoeing: Symbol = Symbol(name="snowshoeing", codepoint="\uE514")
-    soap: Symbol = Symbol(name="soap", codepoint="\uF1B2")
-    soba: Symbol = Symbol(name="soba", codepoint="\uEF36")
-    social_distance: Symbol = Symbol(name="social_distance", codepoint="\uE1CB")
-    social_leaderboard: Symbol = Symbol(name="social_leaderboard", codepoint="\uF6A0")
-    solar_power: Symbol = Symbol(name="solar_power", codepoint="\uEC0F")
-    solo_dining: Symbol = Symbol(name="solo_dining", codepoint="\uEF35")
-    sort: Symbol = Symbol(name="sort", codepoint="\uE164")
-    sort_by_alpha: Symbol = Symbol(name="sort_by_alpha", codepoint="\uE053")
-    sos: Symbol = Symbol(name="sos", codepoint="\uEBF7")
-    sound_detection_dog_barking: Symbol = Symbol(name="sound_detection_dog_barking", codepoint="\uF149")
-    sound_detection_glass_break: Symbol = Symbol(name="sound_detection_glass_break", codepoint="\uF14A")
-    sound_detection_loud_sound: Symbol = Symbol(name="sound_detection_loud_sound", codepoint="\uF14B")
-    sound_sampler: Symbol = Symbol(name="sound_sampler", codepoint="\uF6B4")
-    soup_kitchen: Symbol = Symbol(name="soup_kitchen", codepoint="\uE7D3")
-    source: Symbol = Symbol(name="source", codepoint="\uF1C8")
-    source_environment: Symbol = Symbol(name="source_environment", codepoint="\uE527")
-    source_notes: Symbol = Symbol(name="source_notes", codepoint="\uE12D")
-    south: Symbol = Symbol(name="south", codepoint="\uF1E3")
-    south_america: Symbol = Symbol(name="south_america", codepoint="\uE7E4")
-    south_east: Symbol = Symbol(name="south_east", codepoint="\uF1E4")
-    south_west: Symbol = Symbol(name="south_west", codepoint="\uF1E5")
-    spa: Symbol = Symbol(name="spa", codepoint="\uEB4C")
-    space_bar: Symbol = Symbol(name="space_bar", codepoint="\uE256")
-    space_dashboard: Symbol = Symbol(name="space_dashboard", codepoint="\uE66B")
-    spatial_audio: Symbol = Symbol(name="spatial_audio", codepoint="\uEBEB")
-    spatial_audio_off: Symbol = Symbol(name="spatial_audio_off", codepoint="\uEBE8")
-    spatial_speaker: Symbol = Symbol(name="spatial_speaker", codepoint="\uF4CF")
-    spatial_tracking: Symbol = Symbol(name="spatial_tracking", codepoint="\uEBEA")
-    speaker: Symbol = Symbol(name="speaker", codepoint="\uE32D")
-    speaker_group: Symbol = Symbol(name="speaker_group", codepoint="\uE32E")
-    speaker_notes: Symbol = Symbol(name="speaker_notes", codepoint="\uE8CD")
-    speaker_notes_off: Symbol = Symbol(name="speaker_notes_off", codepoint="\uE92A")
-    speaker_phone: Symbol = Symbol(name="speaker_phone", codepoint="\uE0D2")
-    special_character: Symbol = Symbol(name="special_character", codepoint="\uF74A")
-    specific_gravity: Symbol = Symbol(name="specific_gravity", codepoint="\uF872")
-    speech_to_text: Symbol = Symbol(name="speech_to_text", codepoint="\uF8A7")
-    speed: Symbol = Symbol(name="speed", codepoint="\uE9E4")
-    speed_0_25: Symbol = Symbol(name="speed_0_25", codepoint="\uF4D4")
-    speed_0_2x: Symbol = Symbol(name="speed_0_2x", codepoint="\uF498")
-    speed_0_5: Symbol = Symbol(name="speed_0_5", codepoint="\uF4E2")
-    speed_0_5x: Symbol = Symbol(name="speed_0_5x", codepoint="\uF497")
-    speed_0_75: Symbol = Symbol(name="speed_0_75", codepoint="\uF4D3")
-    speed_0_7x: Symbol = Symbol(name="speed_0_7x", codepoint="\uF496")
-    speed_1_2: Symbol = Symbol(name="speed_1_2", codepoint="\uF4E1")
-    speed_1_25: Symbol = Symbol(name="speed_1_25", codepoint="\uF4D2")
-    speed_1_2x: Symbol = Symbol(name="speed_1_2x", codepoint="\uF495")
-    speed_1_5: Symbol = Symbol(name="speed_1_5", codepoint="\uF4E0")
-    speed_1_5x: Symbol = Symbol(name="speed_1_5x", codepoint="\uF494")
-    speed_1_75: Symbol = Symbol(name="speed_1_75", codepoint="\uF4D1")
-    speed_1_7x: Symbol = Symbol(name="speed_1_7x", codepoint="\uF493")
-    speed_2x: Symbol = Symbol(name="speed_2x", codepoint="\uF4EB")
-    speed_camera: Symbol = Symbol(name="speed_camera", codepoint="\uF470")
-    spellcheck: Symbol = Symbol(name="spellcheck", codepoint="\uE8CE")
-    split_scene: Symbol = Symbol(name="split_scene", codepoint="\uF3BF")
-    split_scene_down: Symbol = Symbol(name="split_scene_down", codepoint="\uF2FF")
-    split_scene_left: Symbol = Symbol(name="split_scene_left", codepoint="\uF2FE")
-    split_scene_right: Symbol = Symbol(name="split_scene_right", codepoint="\uF2FD")
-    split_scene_up: Symbol = Symbol(name="split_scene_up", codepoint="\uF2FC")
-    splitscreen: Symbol = Symbol(name="splitscreen", codepoint="\uF06D")
-    splitscreen_add: Symbol = Symbol(name="splitscreen_add", codepoint="\uF4FD")
-    splitscreen_bottom: Symbol = Symbol(name="splitscreen_bottom", codepoint="\uF676")
-    splitscreen_landscape: Symbol = Symbol(name="splitscreen_landscape", codepoint="\uF459")
-    splitscreen_left: Symbol = Symbol(name="splitscreen_left", codepoint="\uF675")
-    splitscreen_portrait: Symbol = Symbol(name="splitscreen_portrait", codepoint="\uF458")
-    splitscreen_right: Symbol = Symbol(name="splitscreen_right", codepoint="\uF674")
-    splitscreen_top: Symbol = Symbol(name="splitscreen_top", codepoint="\uF673")
-    splitscreen_vertical_add: Symbol = Symbol(name="splitscreen_vertical_add", codepoint="\uF4FC")
-    spo2: Symbol = Symbol(name="spo2", codepoint="\uF6DB")
-    spoke: Symbol = Symbol(name="spoke", codepoint="\uE9A7")
-    sports: Symbol = Symbol(name="sports", codepoint="\uEA30")
-    sports_and_outdoors: Symbol = Symbol(name="sports_and_outdoors", codepoint="\uEFB8")
-    sports_bar: Symbol = Symbol(name="sports_bar", codepoint="\uF1F3")
-    sports_baseball: Symbol = Symbol(name="sports_baseball", codepoint="\uEA51")
-    sports_basketball: Symbol = Symbol(name="sports_basketball", codepoint="\uEA26")
-    sports_cricket: Symbol = Symbol(name="sports_cricket", codepoint="\uEA27")
-    sports_esports: Symbol = Symbol(name="sports_esports", codepoint="\uEA28")
-    sports_football: Symbol = Symbol(name="sports_football", codepoint="\uEA29")
-    sports_golf: Symbol = Symbol(name="sports_golf", codepoint="\uEA2A")
-    sports_gymnastics: Symbol = Symbol(name="sports_gymnastics", codepoint="\uEBC4")
-    sports_handball: Symbol = Symbol(name="sports_handball", codepoint="\uEA33")
-    sports_hockey: Symbol = Symbol(name="sports_hockey", codepoint="\uEA2B")
-    sports_kabaddi: Symbol = Symbol(name="sports_kabaddi", codepoint="\uEA34")
-    sports_martial_arts: Symbol = Symbol(name="sports_martial_arts", codepoint="\uEAE9")
-    sports_mma: Symbol = Symbol(name="sports_mma", codepoint="\uEA2C")
-    sports_motorsports: Symbol = Symbol(name="sports_motorsports", codepoint="\uEA2D")
-    sports_rugby: Symbol = Symbol(name="sports_rugby", codepoint="\uEA2E")
-    sports_score: Symbol = Symbol(name="sports_score", codepoint="\uF06E")
-    sports_soccer: Symbol = Symbol(name="sports_soccer", codepoint="\uEA2F")
-    sports_tennis: Symbol = Symbol(name="sports_tennis", codepoint="\uEA32")
-    sports_volleyball: Symbol = Symbol(name="sports_volleyball", codepoint="\uEA31")
-    sprinkler: Symbol = Symbol(name="sprinkler", codepoint="\uE29A")
-    sprint: Symbol = Symbol(name="sprint", codepoint="\uF81F")
-    square: Symbol = Symbol(name="square", codepoint="\uEB36")
-    square_dot: Symbol = Symbol(name="square_dot", codepoint="\uF3B3")
-    square_foot: Symbol = Symbol(name="square_foot", codepoint="\uEA49")
-    ssid_chart: Symbol = Symbol(name="ssid_chart", codepoint="\uEB66")
-    stack: Symbol = Symbol(name="stack", codepoint="\uF609")
-    stack_group: Symbol = Symbol(name="stack_group", codepoint="\uF359")
-    stack_hexagon: Symbol = Symbol(name="stack_hexagon", codepoint="\uF41C")
-    stack_off: Symbol = Symbol(name="stack_off", codepoint="\uF608")
-    stack_star: Symbol = Symbol(name="stack_star", codepoint="\uF607")
-    stacked_bar_chart: Symbol = Symbol(name="stacked_bar_chart", codepoint="\uE9E6")
-    stacked_email: Symbol = Symbol(name="stacked_email", codepoint="\uE6C7")
-    stacked_inbox: Symbol = Symbol(name="stacked_inbox", codepoint="\uE6C9")
-    stacked_line_chart: Symbol = Symbol(name="stacked_line_chart", codepoint="\uF22B")
-    stacks: Symbol = Symbol(name="stacks", codepoint="\uF500")
-    stadia_controller: Symbol = Symbol(name="stadia_controller", codepoint="\uF135")
-    stadium: Symbol = Symbol(name="stadium", codepoint="\uEB90")
-    stairs: Symbol = Symbol(name="stairs", codepoint="\uF1A9")
-    stairs_2: Symbol = Symbol(name="stairs_2", codepoint="\uF46C")
-    star: Symbol = Symbol(name="star", codepoint="\uF09A")
-    star_border: Symbol = Symbol(name="star_border", codepoint="\uF09A")
-    star_border_purple500: Symbol = Symbol(name="star_border_purple500", codepoint="\uF09A")
-    star_half: Symbol = Symbol(name="star_half", codepoint="\uE839")
-    star_outline: Symbol = Symbol(name="star_outline", codepoint="\uF09A")
-    star_purple500: Symbol = Symbol(name="star_purple500", codepoint="\uF09A")
-    star_rate: Symbol = Symbol(name="star_rate", codepoint="\uF0EC")
-    star_rate_half: Symbol = Symbol(name="star_rate_half", codepoint="\uEC45")
-    star_shine: Symbol = Symbol(name="star_shine", codepoint="\uF31D")
-    stars: Symbol = Symbol(name="stars", codepoint="\uE8D0")
-    stars_2: Symbol = Symbol(name="stars_2", codepoint="\uF31C")
-    start: Symbol = Symbol(name="start", codepoint="\uE089")
-    stat_0: Symbol = Symbol(name="stat_0", codepoint="\uE697")
-    stat_1: Symbol = Symbol(name="stat_1", codepoint="\uE698")
-    stat_2: Symbol = Symbol(name="stat_2", codepoint="\uE699")
-    stat_3: Symbol = Symbol(name="stat_3", codepoint="\uE69A")
-    stat_minus_1: Symbol = Symbol(name="stat_minus_1", codepoint="\uE69B")
-    stat_minus_2: Symbol = Symbol(name="stat_minus_2", codepoint="\uE69C")
-    stat_minus_3: Symbol = Symbol(name="stat_minus_3", codepoint="\uE69D")
-    stay_current_landscape: Symbol = Symbol(name="stay_current_landscape", codepoint="\uED3E")
-    stay_current_portrait: Symbol = Symbol(name="stay_current_portrait", codepoint="\uE7BA")
-    stay_primary_landscape: Symbol = Symbol(name="stay_primary_landscape", codepoint="\uED3E")
-    stay_primary_portrait: Symbol = Symbol(name="stay_primary_portrait", codepoint="\uF2D3")
-    steering_wheel_heat: Symbol = Symbol(name="steering_wheel_heat", codepoint="\uF32B")
-    step: Symbol = Symbol(name="step", codepoint="\uF6FE")
-    step_into: Symbol = Symbol(name="step_into", codepoint="\uF701")
-    step_out: Symbol = Symbol(name="step_out", codepoint="\uF700")
-    step_over: Symbol = Symbol(name="step_over", codepoint="\uF6FF")
-    steppers: Symbol = Symbol(name="steppers", codepoint="\uE9E7")
-    steps: Symbol = Symbol(name="steps", codepoint="\uF6DA")
-    stethoscope: Symbol = Symbol(name="stethoscope", codepoint="\uF805")
-    stethoscope_arrow: Symbol = Symbol(name="stethoscope_arrow", codepoint="\uF807")
-    stethoscope_check: Symbol = Symbol(name="stethoscope_check", codepoint="\uF806")
-    sticky_note: Symbol = Symbol(name="sticky_note", codepoint="\uE9E8")
-    sticky_note_2: Symbol = Symbol(name="sticky_note_2", codepoint="\uF1FC")
-    stock_media: Symbol = Symbol(name="stock_media", codepoint="\uF570")
-    stockpot: Symbol = Symbol(name="stockpot", codepoint="\uF545")
-    stop: Symbol = Symbol(name="stop", codepoint="\uE047")
-    stop_circle: Symbol = Symbol(name="stop_circle", codepoint="\uEF71")
-    stop_screen_share: Symbol = Symbol(name="stop_screen_share", codepoint="\uE0E3")
-    storage: Symbol = Symbol(name="storage", codepoint="\uE1DB")
-    store: Symbol = Symbol(name="store", codepoint="\uE8D1")
-    store_mall_directory: Symbol = Symbol(name="store_mall_directory", codepoint="\uE8D1")
-    storefront: Symbol = Symbol(name="storefront", codepoint="\uEA12")
-    storm: Symbol = Symbol(name="storm", codepoint="\uF070")
-    straight: Symbol = Symbol(name="straight", codepoint="\uEB95")
-    straighten: Symbol = Symbol(name="straighten", codepoint="\uE41C")
-    strategy: Symbol = Symbol(name="strategy", codepoint="\uF5DF")
-    stream: Symbol = Symbol(name="stream", codepoint="\uE9E9")
-    stream_apps: Symbol = Symbol(name="stream_apps", codepoint="\uF79F")
-    streetview: Symbol = Symbol(name="streetview", codepoint="\uE56E")
-    stress_management: Symbol = Symbol(name="stress_management", codepoint="\uF6D9")
-    strikethrough_s: Symbol = Symbol(name="strikethrough_s", codepoint="\uE257")
-    stroke_full: Symbol = Symbol(name="stroke_full", codepoint="\uF749")
-    stroke_partial: Symbol = Symbol(name="stroke_partial", codepoint="\uF748")
-    stroller: Symbol = Symbol(name="stroller", codepoint="\uF1AE")
-    style: Symbol = Symbol(name="style", codepoint="\uE41D")
-    styler: Symbol = Symbol(name="styler", codepoint="\uE273")
-    stylus: Symbol = Symbol(name="stylus", codepoint="\uF604")
-    stylus_brush: Symbol = Symbol(name="stylus_brush", codepoint="\uF366")
-    stylus_fountain_pen: Symbol = Symbol(name="stylus_fountain_pen", codepoint="\uF365")
-    stylus_highlighter: Symbol = Symbol(name="stylus_highlighter", codepoint="\uF364")
-    stylus_laser_pointer: Symbol = Symbol(name="stylus_laser_pointer", codepoint="\uF747")
-    stylus_note: Symbol = Symbol(name="stylus_note", codepoint="\uF603")
-    stylus_pen: Symbol = Symbol(name="stylus_pen", codepoint="\uF363")
-    stylus_pencil: Symbol = Symbol(name="stylus_pencil", codepoint="\uF362")
-    subdirectory_arrow_left: Symbol = Symbol(name="subdirectory_arrow_left", codepoint="\uE5D9")
-    subdirectory_arrow_right: Symbol = Symbol(name="subdirectory_arrow_right", codepoint="\uE5DA")
-    subheader: Symbol = Symbol(name="subheader", codepoint="\uE9EA")
-    subject: Symbol = Symbol(name="subject", codepoint="\uE8D2")
-    subscript: Symbol = Symbol(name="subscript", codepoint="\uF111")
-    subscriptions: Symbol = Symbol(name="subscriptions", codepoint="\uE064")
-    subtitles: Symbol = Symbol(name="subtitles", codepoint="\uE048")
-    subtitles_gear: Symbol = Symbol(name="subtitles_gear", codepoint="\uF355")
-    subtitles_off: Symbol = Symbol(name="subtitles_off", codepoint="\uEF72")
-    subway: Symbol = Symbol(name="subway", codepoint="\uE56F")
-    subway_walk: Symbol = Symbol(name="subway_walk", codepoint="\uF287")
-    summarize: Symbol = Symbol(name="summarize", codepoint="\uF071")
-    sunny: Symbol = Symbol(name="sunny", codepoint="\uE81A")
-    sunny_snowing: Symbol = Symbol(name="sunny_snowing", codepoint="\uE819")
-    superscript: Symbol = Symbol(name="superscript", codepoint="\uF112")
-    supervised_user_circle: Symbol = Symbol(name="supervised_user_circle", codepoint="\uE939")
-    supervised_user_circle_off: Symbol = Symbol(name="supervised_user_circle_off", codepoint="\uF60E")
-    supervisor_account: Symbol = Symbol(name="supervisor_account", codepoint="\uE8D3")
-    support: Symbol = Symbol(name="support", codepoint="\uEF73")
-    support_agent: Symbol = Symbol(name="support_agent", codepoint="\uF0E2")
-    surfing: Symbol = Symbol(name="surfing", codepoint="\uE515")
-    surgical: Symbol = Symbol(name="surgical", codepoint="\uE131")
-    surround_sound: Symbol = Symbol(name="surround_sound", codepoint="\uE049")
-    swap_calls: Symbol = Symbol(name="swap_calls", codepoint="\uE0D7")
-    swap_driving_apps: Symbol = Symbol(name="swap_driving_apps", codepoint="\uE69E")
-    swap_driving_apps_wheel: Symbol = Symbol(name="swap_driving_apps_wheel", codepoint="\uE69F")
-    swap_horiz: Symbol = Symbol(name="swap_horiz", codepoint="\uE8D4")
-    swap_horizontal_circle: Symbol = Symbol(name="swap_horizontal_circle", codepoint="\uE933")
-    swap_vert: Symbol = Symbol(name="swap_vert", codepoint="\uE8D5")
-    swap_vertical_circle: Symbol = Symbol(name="swap_vertical_circle", codepoint="\uE8D6")
-    sweep: Symbol = Symbol(name="sweep", codepoint="\uE6AC")
-    swipe: Symbol = Symbol(name="swipe", codepoint="\uE9EC")
-    swipe_down: Symbol = Symbol(name="swipe_down", codepoint="\uEB53")
-    swipe_down_alt: Symbol = Symbol(name="swipe_down_alt", codepoint="\uEB30")
-    swipe_left: Symbol = Symbol(name="swipe_left", codepoint="\uEB59")
-    swipe_left_alt: Symbol = Symbol(name="swipe_left_alt", codepoint="\uEB33")
-    swipe_right: Symbol = Symbol(name="swipe_right", codepoint="\uEB52")
-    swipe_right_alt: Symbol = Symbol(name="swipe_right_alt", codepoint="\uEB56")
-    swipe_up: Symbol = Symbol(name="swipe_up", codepoint="\uEB2E")
-    swipe_up_alt: Symbol = Symbol(name="swipe_up_alt", codepoint="\uEB35")
-    swipe_vertical: Symbol = Symbol(name="swipe_vertical", codepoint="\uEB51")
-    switch: Symbol = Symbol(name="switch", codepoint="\uE1F4")
-    switch_access: Symbol = Symbol(name="switch_access", codepoint="\uF6FD")
-    switch_access_2: Symbol = Symbol(name="switch_access_2", codepoint="\uF506")
-    switch_access_3: Symbol = Symbol(name="switch_access_3", codepoint="\uF34D")
-    switch_access_shortcut: Symbol = Symbol(name="switch_access_shortcut", codepoint="\uE7E1")
-    switch_access_shortcut_add: Symbol = Symbol(name="switch_access_shortcut_add", codepoint="\uE7E2")
-    switch_account: Symbol = Symbol(name="switch_account", codepoint="\uE9ED")
-    switch_camera: Symbol = Symbol(name="switch_camera", codepoint="\uE41E")
-    switch_left: Symbol = Symbol(name="switch_left", codepoint="\uF1D1")
-    switch_right: Symbol = Symbol(name="switch_right", codepoint="\uF1D2")
-    switch_video: Symbol = Symbol(name="switch_video", codepoint="\uE41F")
-    switches: Symbol = Symbol(name="switches", codepoint="\uE733")
-    sword_rose: Symbol = Symbol(name="sword_rose", codepoint="\uF5DE")
-    swords: Symbol = Symbol(name="swords", codepoint="\uF889")
-    symptoms: Symbol = Symbol(name="symptoms", codepoint="\uE132")
-    synagogue: Symbol = Symbol(name="synagogue", codepoint="\uEAB0")
-    sync: Symbol = Symbol(name="sync", codepoint="\uE627")
-    sync_alt: Symbol = Symbol(name="sync_alt", codepoint="\uEA18")
-    sync_arrow_down: Symbol = Symbol(name="sync_arrow_down", codepoint="\uF37C")
-    sync_arrow_up: Symbol = Symbol(name="sync_arrow_up", codepoint="\uF37B")
-    sync_desktop: Symbol = Symbol(name="sync_desktop", codepoint="\uF41A")
-    sync_disabled: Symbol = Symbol(name="sync_disabled", codepoint="\uE628")
-    sync_lock: Symbol = Symbol(name="sync_lock", codepoint="\uEAEE")
-    sync_problem: Symbol = Symbol(name="sync_problem", codepoint="\uE629")
-    sync_saved_locally: Symbol = Symbol(name="sync_saved_locally", codepoint="\uF820")
-    sync_saved_locally_off: Symbol = Symbol(name="sync_saved_locally_off", codepoint="\uF264")
-    syringe: Symbol = Symbol(name="syringe", codepoint="\uE133")
-    system_security_update: Symbol = Symbol(name="system_security_update", codepoint="\uF2CD")
-    system_security_update_good: Symbol = Symbol(name="system_security_update_good", codepoint="\uF073")
-    system_security_update_warning: Symbol = Symbol(name="system_security_update_warning", codepoint="\uF2D3")
-    system_update: Symbol = Symbol(name="system_update", codepoint="\uF2CD")
-    system_update_alt: Symbol = Symbol(name="system_update_alt", codepoint="\uE8D7")
-    tab: Symbol = Symbol(name="tab", codepoint="\uE8D8")
-    tab_close: Symbol = Symbol(name="tab_close", codepoint="\uF745")
-    tab_close_inactive: Symbol = Symbol(name="tab_close_inactive", codepoint="\uF3D0")
-    tab_close_right: Symbol = Symbol(name="tab_close_right", codepoint="\uF746")
-    tab_duplicate: Symbol = Symbol(name="tab_duplicate", codepoint="\uF744")
-    tab_group: Symbol = Symbol(name="tab_group", codepoint="\uF743")
-    tab_inactive: Symbol = Symbol(name="tab_inactive", codepoint="\uF43B")
-    tab_move: Symbol = Symbol(name="tab_move", codepoint="\uF742")
-    tab_new_right: Symbol = Symbol(name="tab_new_right", codepoint="\uF741")
-    tab_recent: Symbol = Symbol(name="tab_recent", codepoint="\uF740")
-    tab_search: Symbol = Symbol(name="tab_search", codepoint="\uF2F2")
-    tab_unselected: Symbol = Symbol(name="tab_unselected", codepoint="\uE8D9")
-    table: Symbol = Symbol(name="table", codepoint="\uF191")
-    table_bar: Symbol = Symbol(name="table_bar", codepoint="\uEAD2")
-    table_chart: Symbol = Symbol(name="table_chart", codepoint="\uE265")
-    table_chart_view: Symbol = Symbol(name="table_chart_view", codepoint="\uF6EF")
-    table_convert: Symbol = Symbol(name="table_convert", codepoint="\uF3C7")
-    table_edit: Symbol = Symbol(name="table_edit", codepoint="\uF3C6")
-    table_eye: Symbol = Symbol(name="table_eye", codepoint="\uF466")
-    table_lamp: Symbol = Symbol(name="table_lamp", codepoint="\uE1F2")
-    table_large: Symbol = Symbol(name="table_large", codepoint="\uF299")
-    table_restaurant: Symbol = Symbol(name="table_restaurant", codepoint="\uEAC6")
-    table_rows: Symbol = Symbol(name="table_rows", codepoint="\uF101")
-    table_rows_narrow: Symbol = Symbol(name="table_rows_narrow", codepoint="\uF73F")
-    table_sign: Symbol = Symbol(name="table_sign", codepoint="\uEF2C")
-    table_view: Symbol = Symbol(name="table_view", codepoint="\uF1BE")
-    tablet: Symbol = Symbol(name="tablet", codepoint="\uE32F")
-    tablet_android: Symbol = Symbol(name="tablet_android", codepoint="\uE330")
-    tablet_camera: Symbol = Symbol(name="tablet_camera", codepoint="\uF44D")
-    tablet_mac: Symbol = Symbol(name="tablet_mac", codepoint="\uE331")
-    tabs: Symbol = Symbol(name="tabs", codepoint="\uE9EE")
-    tactic: Symbol = Symbol(name="tactic", codepoint="\uF564")
-    tag: Symbol = Symbol(name="tag", codepoint="\uE9EF")
-    tag_faces: Symbol = Symbol(name="tag_faces", codepoint="\uEA22")
-    takeout_dining: Symbol = Symbol(name="takeout_dining", codepoint="\uEA74")
-    takeout_dining_2: Symbol = Symbol(name="takeout_dining_2", codepoint="\uEF34")
-    tamper_detection_off: Symbol = Symbol(name="tamper_detection_off", codepoint="\uE82E")
-    tamper_detection_on: Symbol = Symbol(name="tamper_detection_on", codepoint="\uF8C8")
-    tap_and_play: Symbol = Symbol(name="tap_and_play", codepoint="\uF2CC")
-    tapas: Symbol = Symbol(name="tapas", codepoint="\uF1E9")
-    target: Symbol = Symbol(name="target", codepoint="\uE719")
-    task: Symbol = Symbol(name="task", codepoint="\uF075")
-    task_alt: Symbol = Symbol(name="task_alt", codepoint="\uE2E6")
-    tatami_seat: Symbol = Symbol(name="tatami_seat", codepoint="\uEF33")
-    taunt: Symbol = Symbol(name="taunt", codepoint="\uF69F")
-    taxi_alert: Symbol = Symbol(name="taxi_alert", codepoint="\uEF74")
-    team_dashboard: Symbol = Symbol(name="team_dashboard", codepoint="\uE013")
-    temp_preferences_custom: Symbol = Symbol(name="temp_preferences_custom", codepoint="\uF8C9")
-    temp_preferences_eco: Symbol = Symbol(name="temp_preferences_eco", codepoint="\uF8CA")
-    temple_buddhist: Symbol = Symbol(name="temple_buddhist", codepoint="\uEAB3")
-    temple_hindu: Symbol = Symbol(name="temple_hindu", codepoint="\uEAAF")
-    tenancy: Symbol = Symbol(name="tenancy", codepoint="\uF0E3")
-    terminal: Symbol = Symbol(name="terminal", codepoint="\uEB8E")
-    terrain: Symbol = Symbol(name="terrain", codepoint="\uE564")
-    text_ad: Symbol = Symbol(name="text_ad", codepoint="\uE728")
-    text_compare: Symbol = Symbol(name="text_compare", codepoint="\uF3C5")
-    text_decrease: Symbol = Symbol(name="text_decrease", codepoint="\uEADD")
-    text_fields: Symbol = Symbol(name="text_fields", codepoint="\uE262")
-    text_fields_alt: Symbol = Symbol(name="text_fields_alt", codepoint="\uE9F1")
-    text_format: Symbol = Symbol(name="text_format", codepoint="\uE165")
-    text_increase: Symbol = Symbol(name="text_increase", codepoint="\uEAE2")
-    text_rotate_up: Symbol = Symbol(name="text_rotate_up", codepoint="\uE93A")
-    text_rotate_vertical: Symbol = Symbol(name="text_rotate_vertical", codepoint="\uE93B")
-    text_rotation_angledown: Symbol = Symbol(name="text_rotation_angledown", codepoint="\uE93C")
-    text_rotation_angleup: Symbol = Symbol(name="text_rotation_angleup", codepoint="\uE93D")
-    text_rotation_down: Symbol = Symbol(name="text_rotation_down", codepoint="\uE93E")
-    text_rotation_none: Symbol = Symbol(name="text_rotation_none", codepoint="\uE93F")
-    text_select_end: Symbol = Symbol(name="text_select_end", codepoint="\uF73E")
-    text_select_jump_to_beginning: Symbol = Symbol(name="text_select_jump_to_beginning", codepoint="\uF73D")
-    text_select_jump_to_end: Symbol = Symbol(name="text_select_jump_to_end", codepoint="\uF73C")
-    text_select_move_back_character: Symbol = Symbol(name="text_select_move_back_character", codepoint="\uF73B")
-    text_select_move_back_word: Symbol = Symbol(name="text_select_move_back_word", codepoint="\uF73A")
-    text_select_move_down: Symbol = Symbol(name="text_select_move_down", codepoint="\uF739")
-    text_select_move_forward_character: Symbol = Symbol(name="text_select_move_forward_character", codepoint="\uF738")
-    text_select_move_forward_word: Symbol = Symbol(name="text_select_move_forward_word", codepoint="\uF737")
-    text_select_move_up: Symbol = Symbol(name="text_select_move_up", codepoint="\uF736")
-    text_select_start: Symbol = Symbol(name="text_select_start", codepoint="\uF735")
-    text_snippet: Symbol = Symbol(name="text_snippet", codepoint="\uF1C6")
-    text_to_speech: Symbol = Symbol(name="text_to_speech", codepoint="\uF1BC")
-    text_up: Symbol = Symbol(name="text_up", codepoint="\uF49E")
-    textsms: Symbol = Symbol(name="textsms", codepoint="\uE625")
-    texture: Symbol = Symbol(name="texture", codepoint="\uE421")
-    texture_add: Symbol = Symbol(name="texture_add", codepoint="\uF57C")
-    texture_minus: Symbol = Symbol(name="texture_minus", codepoint="\uF57B")
-    theater_comedy: Symbol = Symbol(name="theater_comedy", codepoint="\uEA66")
-    theaters: Symbol = Symbol(name="theaters", codepoint="\uE8DA")
-    thermometer: Symbol = Symbol(name="thermometer", codepoint="\uE846")
-    thermometer_add: Symbol = Symbol(name="thermometer_add", codepoint="\uF582")
-    thermometer_gain: Symbol = Symbol(name="thermometer_gain", codepoint="\uF6D8")
-    thermometer_loss: Symbol = Symbol(name="thermometer_loss", codepoint="\uF6D7")
-    thermometer_minus: Symbol = Symbol(name="thermometer_minus", codepoint="\uF581")
-    thermostat: Symbol = Symbol(name="thermostat", codepoint="\uF076")
-    thermostat_arrow_down: Symbol = Symbol(name="thermostat_arrow_down", codepoint="\uF37A")
-    thermostat_arrow_up: Symbol = Symbol(name="thermostat_arrow_up", codepoint="\uF379")
-    thermostat_auto: Symbol = Symbol(name="thermostat_auto", codepoint="\uF077")
-    thermostat_carbon: Symbol = Symbol(name="thermostat_carbon", codepoint="\uF178")
-    things_to_do: Symbol = Symbol(name="things_to_do", codepoint="\uEB2A")
-    thread_unread: Symbol = Symbol(name="thread_unread", codepoint="\uF4F9")
-    threat_intelligence: Symbol = Symbol(name="threat_intelligence", codepoint="\uEAED")
-    thumb_down: Symbol = Symbol(name="thumb_down", codepoint="\uF578")
-    thumb_down_alt: Symbol = Symbol(name="thumb_down_alt", codepoint="\uF578")
-    thumb_down_filled: Symbol = Symbol(name="thumb_down_filled", codepoint="\uF578")
-    thumb_down_off: Symbol = Symbol(name="thumb_down_off", codepoint="\uF578")
-    thumb_down_off_alt: Symbol = Symbol(name="thumb_down_off_alt", codepoint="\uF578")
-    thumb_up: Symbol = Symbol(name="thumb_up", codepoint="\uF577")
-    thumb_up_alt: Symbol = Symbol(name="thumb_up_alt", codepoint="\uF577")
-    thumb_up_filled: Symbol = Symbol(name="thumb_up_filled", codepoint="\uF577")
-    thumb_up_off: Symbol = Symbol(name="thumb_up_off", codepoint="\uF577")
-    thumb_up_off_alt: Symbol = Symbol(name="thumb_up_off_alt", codepoint="\uF577")
-    thumbnail_bar: Symbol = Symbol(name="thumbnail_bar", codepoint="\uF734")
-    thumbs_up_double: Symbol = Symbol(name="thumbs_up_double", codepoint="\uEEFC")
-    thumbs_up_down: Symbol = Symbol(name="thumbs_up_down", codepoint="\uE8DD")
-    thunderstorm: Symbol = Symbol(name="thunderstorm", codepoint="\uEBDB")
-    tibia: Symbol = Symbol(name="tibia", codepoint="\uF89B")
-    tibia_alt: Symbol = Symbol(name="tibia_alt", codepoint="\uF89C")
-    tile_large: Symbol = Symbol(name="tile_large", codepoint="\uF3C3")
-    tile_medium: Symbol = Symbol(name="tile_medium", codepoint="\uF3C2")
-    tile_small: Symbol = Symbol(name="tile_small", codepoint="\uF3C1")
-    time_auto: Symbol = Symbol(name="time_auto", codepoint="\uF0E4")
-    time_to_leave: Symbol = Symbol(name="time_to_leave", codepoint="\uEFF7")
-    timelapse: Symbol = Symbol(name="timelapse", codepoint="\uE422")
-    timeline: Symbol = Symbol(name="timeline", codepoint="\uE922")
-    timer: Symbol = Symbol(name="timer", codepoint="\uE425")
-    timer_1: Symbol = Symbol(name="timer_1", codepoint="\uF2AF")
-    timer_10: Symbol = Symbol(name="timer_10", codepoint="\uE423")
-    timer_10_alt_1: Symbol = Symbol(name="timer_10_alt_1", codepoint="\uEFBF")
-    timer_10_select: Symbol = Symbol(name="timer_10_select", codepoint="\uF07A")
-    timer_2: Symbol = Symbol(name="timer_2", codepoint="\uF2AE")
-    timer_3: Symbol = Symbol(name="timer_3", codepoint="\uE424")
-    timer_3_alt_1: Symbol = Symbol(name="timer_3_alt_1", codepoint="\uEFC0")
-    timer_3_select: Symbol = Symbol(name="timer_3_select", codepoint="\uF07B")
-    timer_5: Symbol = Symbol(name="timer_5", codepoint="\uF4B1")
-    timer_5_shutter: Symbol = Symbol(name="timer_5_shutter", codepoint="\uF4B2")
-    timer_arrow_down: Symbol = Symbol(name="timer_arrow_down", codepoint="\uF378")
-    timer_arrow_up: Symbol = Symbol(name="timer_arrow_up", codepoint="\uF377")
-    timer_off: Symbol = Symbol(name="timer_off", codepoint="\uE426")
-    timer_pause: Symbol = Symbol(name="timer_pause", codepoint="\uF4BB")
-    timer_play: Symbol = Symbol(name="timer_play", codepoint="\uF4BA")
-    tips_and_updates: Symbol = Symbol(name="tips_and_updates", codepoint="\uE79A")
-    tire_repair: Symbol = Symbol(name="tire_repair", codepoint="\uEBC8")
-    title: Symbol = Symbol(name="title", codepoint="\uE264")
-    titlecase: Symbol = Symbol(name="titlecase", codepoint="\uF489")
-    toast: Symbol = Symbol(name="toast", codepoint="\uEFC1")
-    toc: Symbol = Symbol(name="toc", codepoint="\uE8DE")
-    today: Symbol = Symbol(name="today", codepoint="\uE8DF")
-    toggle_off: Symbol = Symbol(name="toggle_off", codepoint="\uE9F5")
-    toggle_on: Symbol = Symbol(name="toggle_on", codepoint="\uE9F6")
-    token: Symbol = Symbol(name="token", codepoint="\uEA25")
-    toll: Symbol = Symbol(name="toll", codepoint="\uE8E0")
-    tonality: Symbol = Symbol(name="tonality", codepoint="\uE427")
-    tonality_2: Symbol = Symbol(name="tonality_2", codepoint="\uF2B4")
-    toolbar: Symbol = Symbol(name="toolbar", codepoint="\uE9F7")
-    tools_flat_head: Symbol = Symbol(name="tools_flat_head", codepoint="\uF8CB")
-    tools_installation_kit: Symbol = Symbol(name="tools_installation_kit", codepoint="\uE2AB")
-    tools_ladder: Symbol = Symbol(name="tools_ladder", codepoint="\uE2CB")
-    tools_level: Symbol = Symbol(name="tools_level", codepoint="\uE77B")
-    tools_phillips: Symbol = Symbol(name="tools_phillips", codepoint="\uF8CC")
-    tools_pliers_wire_stripper: Symbol = Symbol(name="tools_pliers_wire_stripper", codepoint="\uE2AA")
-    tools_power_drill: Symbol = Symbol(name="tools_power_drill", codepoint="\uE1E9")
-    tools_wrench: Symbol = Symbol(name="tools_wrench", codepoint="\uF8CD")
-    tooltip: Symbol = Symbol(name="tooltip", codepoint="\uE9F8")
-    tooltip_2: Symbol = Symbol(name="tooltip_2", codepoint="\uF3ED")
-    top_panel_close: Symbol = Symbol(name="top_panel_close", codepoint="\uF733")
-    top_panel_open: Symbol = Symbol(name="top_panel_open", codepoint="\uF732")
-    topic: Symbol = Symbol(name="topic", codepoint="\uF1C8")
-    tornado: Symbol = Symbol(name="tornado", codepoint="\uE199")
-    total_dissolved_solids: Symbol = Symbol(name="total_dissolved_solids", codepoint="\uF877")
-    touch_app: Symbol = Symbol(name="touch_app", codepoint="\uE913")
-    touch_double: Symbol = Symbol(name="touch_double", codepoint="\uF38B")
-    touch_long: Symbol = Symbol(name="touch_long", codepoint="\uF38A")
-    touch_triple: Symbol = Symbol(name="touch_triple", codepoint="\uF389")
-    touchpad_mouse: Symbol = Symbol(name="touchpad_mouse", codepoint="\uF687")
-    touchpad_mouse_off: Symbol = Symbol(name="touchpad_mouse_off", codepoint="\uF4E6")
-    tour: Symbol = Symbol(name="tour", codepoint="\uEF75")
-    toys: Symbol = Symbol(name="toys", codepoint="\uE332")
-    toys_and_games: Symbol = Symbol(name="toys_and_games", codepoint="\uEFC2")
-    toys_fan: Symbol = Symbol(name="toys_fan", codepoint="\uF887")
-    track_changes: Symbol = Symbol(name="track_changes", codepoint="\uE8E1")
-    trackpad_input: Symbol = Symbol(name="trackpad_input", codepoint="\uF4C7")
-    trackpad_input_2: Symbol = Symbol(name="trackpad_input_2", codepoint="\uF409")
-    trackpad_input_3: Symbol = Symbol(name="trackpad_input_3", codepoint="\uF408")
-    traffic: Symbol = Symbol(name="traffic", codepoint="\uE565")
-    traffic_jam: Symbol = Symbol(name="traffic_jam", codepoint="\uF46F")
-    trail_length: Symbol = Symbol(name="trail_length", codepoint="\uEB5E")
-    trail_length_medium: Symbol = Symbol(name="trail_length_medium", codepoint="\uEB63")
-    trail_length_short: Symbol = Symbol(name="trail_length_short", codepoint="\uEB6D")
-    train: Symbol = Symbol(name="train", codepoint="\uE570")
-    tram: Symbol = Symbol(name="tram", codepoint="\uE571")
-    transcribe: Symbol = Symbol(name="transcribe", codepoint="\uF8EC")
-    transfer_within_a_station: Symbol = Symbol(name="transfer_within_a_station", codepoint="\uE572")
-    transform: Symbol = Symbol(name="transform", codepoint="\uE428")
-    transgender: Symbol = Symbol(name="transgender", codepoint="\uE58D")
-    transit_enterexit: Symbol = Symbol(name="transit_enterexit", codepoint="\uE579")
-    transit_ticket: Symbol = Symbol(name="transit_ticket", codepoint="\uF3F1")
-    transition_chop: Symbol = Symbol(name="transition_chop", codepoint="\uF50E")
-    transition_dissolve: Symbol = Symbol(name="transition_dissolve", codepoint="\uF50D")
-    transition_fade: Symbol = Symbol(name="transition_fade", codepoint="\uF50C")
-    transition_push: Symbol = Symbol(name="transition_push", codepoint="\uF50B")
-    transition_slide: Symbol = Symbol(name="transition_slide", codepoint="\uF50A")
-    translate: Symbol = Symbol(name="translate", codepoint="\uE8E2")
-    translate_indic: Symbol = Symbol(name="translate_indic", codepoint="\uF263")
-    transportation: Symbol = Symbol(name="transportation", codepoint="\uE21D")
-    travel: Symbol = Symbol(name="travel", codepoint="\uEF93")
-    travel_explore: Symbol = Symbol(name="travel_explore", codepoint="\uE2DB")
-    travel_luggage_and_bags: Symbol = Symbol(name="travel_luggage_and_bags", codepoint="\uEFC3")
-    trending_down: Symbol = Symbol(name="trending_down", codepoint="\uE8E3")
-    trending_flat: Symbol = Symbol(name="trending_flat", codepoint="\uE8E4")
-    trending_up: Symbol = Symbol(name="trending_up", codepoint="\uE8E5")
-    trip: Symbol = Symbol(name="trip", codepoint="\uE6FB")
-    trip_origin: Symbol = Symbol(name="trip_origin", codepoint="\uE57B")
-    trolley: Symbol = Symbol(name="trolley", codepoint="\uF86B")
-    trolley_cable_car: Symbol = Symbol(name="trolley_cable_car", codepoint="\uF46E")
-    trophy: Symbol = Symbol(name="trophy", codepoint="\uEA23")
-    troubleshoot: Symbol = Symbol(name="troubleshoot", codepoint="\uE1D2")
-    try_: Symbol = Symbol(name="try", codepoint="\uF07C")
-    tsunami: Symbol = Symbol(name="tsunami", codepoint="\uEBD8")
-    tsv: Symbol = Symbol(name="tsv", codepoint="\uE6D6")
-    tty: Symbol = Symbol(name="tty", codepoint="\uF1AA")
-    tune: Symbol = Symbol(name="tune", codepoint="\uE429")
-    tungsten: Symbol = Symbol(name="tungsten", codepoint="\uF07D")
-    turn_left: Symbol = Symbol(name="turn_left", codepoint="\uEBA6")
-    turn_right: Symbol = Symbol(name="turn_right", codepoint="\uEBAB")
-    turn_sharp_left: Symbol = Symbol(name="turn_sharp_left", codepoint="\uEBA7")
-    turn_sharp_right: Symbol = Symbol(name="turn_sharp_right", codepoint="\uEBAA")
-    turn_slight_left: Symbol = Symbol(name="turn_slight_left", codepoint="\uEBA4")
-    turn_slight_right: Symbol = Symbol(name="turn_slight_right", codepoint="\uEB9A")
-    turned_in: Symbol = Symbol(name="turned_in", codepoint="\uE8E7")
-    turned_in_not: Symbol = Symbol(name="turned_in_not", codepoint="\uE8E7")
-    tv: Symbol = Symbol(name="tv", codepoint="\uE63B")
-    tv_displays: Symbol = Symbol(name="tv_displays", codepoint="\uF3EC")
-    tv_gen: Symbol = Symbol(name="tv_gen", codepoint="\uE830")
-    tv_guide: Symbol = Symbol(name="tv_guide", codepoint="\uE1DC")
-    tv_next: Symbol = Symbol(name="tv_next", codepoint="\uF3EB")
-    tv_off: Symbol = Symbol(name="tv_off", codepoint="\uE647")
-    tv_options_edit_channels: Symbol = Symbol(name="tv_options_edit_channels", codepoint="\uE1DD")
-    tv_options_input_settings: Symbol = Symbol(name="tv_options_input_settings", codepoint="\uE1DE")
-    tv_remote: Symbol = Symbol(name="tv_remote", codepoint="\uF5D9")
-    tv_signin: Symbol = Symbol(name="tv_signin", codepoint="\uE71B")
-    tv_with_assistant: Symbol = Symbol(name="tv_with_assistant", codepoint="\uE785")
-    two_pager: Symbol = Symbol(name="two_pager", codepoint="\uF51F")
-    two_pager_store: Symbol = Symbol(name="two_pager_store", codepoint="\uF3C4")
-    two_wheeler: Symbol = Symbol(name="two_wheeler", codepoint="\uE9F9")
-    type_specimen: Symbol = Symbol(name="type_specimen", codepoint="\uF8F0")
-    u_turn_left: Symbol = Symbol(name="u_turn_left", codepoint="\uEBA1")
-    u_turn_right: Symbol = Symbol(name="u_turn_right", codepoint="\uEBA2")
-    udon: Symbol = Symbol(name="udon", codepoint="\uEF32")
-    ulna_radius: Symbol = Symbol(name="ulna_radius", codepoint="\uF89D")
-    ulna_radius_alt: Symbol = Symbol(name="ulna_radius_alt", codepoint="\uF89E")
-    umbrella: Symbol = Symbol(name="umbrella", codepoint="\uF1AD")
-    unarchive: Symbol = Symbol(name="unarchive", codepoint="\uE169")
-    undo: Symbol = Symbol(name="undo", codepoint="\uE166")
-    unfold_less: Symbol = Symbol(name="unfold_less", codepoint="\uE5D6")
-    unfold_less_double: Symbol = Symbol(name="unfold_less_double", codepoint="\uF8CF")
-    unfold_more: Symbol = Symbol(name="unfold_more", codepoint="\uE5D7")
-    unfold_more_double: Symbol = Symbol(name="unfold_more_double", codepoint="\uF8D0")
-    ungroup: Symbol = Symbol(name="ungroup", codepoint="\uF731")
-    universal_currency: Symbol = Symbol(name="universal_currency", codepoint="\uE9FA")
-    universal_currency_alt: Symbol = Symbol(name="universal_currency_alt", codepoint="\uE734")
-    universal_local: Symbol = Symbol(name="universal_local", codepoint="\uE9FB")
-    unknown_2: Symbol = Symbol(name="unknown_2", codepoint="\uF49F")
-    unknown_5: Symbol = Symbol(name="unknown_5", codepoint="\uE6A5")
-    unknown_7: Symbol = Symbol(name="unknown_7", codepoint="\uF49E")
-    unknown_document: Symbol = Symbol(name="unknown_document", codepoint="\uF804")
-    unknown_med: Symbol = Symbol(name="unknown_med", codepoint="\uEABD")
-    unlicense: Symbol = Symbol(name="unlicense", codepoint="\uEB05")
-    unpaved_road: Symbol = Symbol(name="unpaved_road", codepoint="\uF46D")
-    unpin: Symbol = Symbol(name="unpin", codepoint="\uE6F9")
-    unpublished: Symbol = Symbol(name="unpublished", codepoint="\uF236")
-    unsubscribe: Symbol = Symbol(name="unsubscribe", codepoint="\uE0EB")
-    upcoming: Symbol = Symbol(name="upcoming", codepoint="\uF07E")
-    update: Symbol = Symbol(name="update", codepoint="\uE923")
-    update_disabled: Symbol = Symbol(name="update_disabled", codepoint="\uE075")
-    upgrade: Symbol = Symbol(name="upgrade", codepoint="\uF0FB")
-    upi_pay: Symbol = Symbol(name="upi_pay", codepoint="\uF3CF")
-    upload: Symbol = Symbol(name="upload", codepoint="\uF09B")
-    upload_2: Symbol = Symbol(name="upload_2", codepoint="\uF521")
-    upload_file: Symbol = Symbol(name="upload_file", codepoint="\uE9FC")
-    uppercase: Symbol = Symbol(name="uppercase", codepoint="\uF488")
-    urology: Symbol = Symbol(name="urology", codepoint="\uE137")
-    usb: Symbol = Symbol(name="usb", codepoint="\uE1E0")
-    usb_off: Symbol = Symbol(name="usb_off", codepoint="\uE4FA")
-    user_attributes: Symbol = Symbol(name="user_attributes", codepoint="\uE708")
-    vaccines: Symbol = Symbol(name="vaccines", codepoint="\uE138")
-    vacuum: Symbol = Symbol(name="vacuum", codepoint="\uEFC5")
-    valve: Symbol = Symbol(name="valve", codepoint="\uE224")
-    vape_free: Symbol = Symbol(name="vape_free", codepoint="\uEBC6")
-    vaping_rooms: Symbol = Symbol(name="vaping_rooms", codepoint="\uEBCF")
-    variable_add: Symbol = Symbol(name="variable_add", codepoint="\uF51E")
-    variable_insert: Symbol = Symbol(name="variable_insert", codepoint="\uF51D")
-    variable_remove: Symbol = Symbol(name="variable_remove", codepoint="\uF51C")
-    variables: Symbol = Symbol(name="variables", codepoint="\uF851")
-    ventilator: Symbol = Symbol(name="ventilator", codepoint="\uE139")
-    verified: Symbol = Symbol(name="verified", codepoint="\uEF76")
-    verified_off: Symbol = Symbol(name="verified_off", codepoint="\uF30E")
-    verified_user: Symbol = Symbol(name="verified_user", codepoint="\uF013")
-    vertical_align_bottom: Symbol = Symbol(name="vertical_align_bottom", codepoint="\uE258")
-    vertical_align_center: Symbol = Symbol(name="vertical_align_center", codepoint="\uE259")
-    vertical_align_top: Symbol = Symbol(name="vertical_align_top", codepoint="\uE25A")
-    vertical_distribute: Symbol = Symbol(name="vertical_distribute", codepoint="\uE076")
-    vertical_shades: Symbol = Symbol(name="vertical_shades", codepoint="\uEC0E")
-    vertical_shades_closed: Symbol = Symbol(name="vertical_shades_closed", codepoint="\uEC0D")
-    vertical_split: Symbol = Symbol(name="vertical_split", codepoint="\uE949")
-    vibration: Symbol = Symbol(name="vibration", codepoint="\uF2CB")
-    video_call: Symbol = Symbol(name="video_call", codepoint="\uE070")
-    video_camera_back: Symbol = Symbol(name="video_camera_back", codepoint="\uF07F")
-    video_camera_back_add: Symbol = Symbol(name="video_camera_back_add", codepoint="\uF40C")
-    video_camera_front: Symbol = Symbol(name="video_camera_front", codepoint="\uF080")
-    video_camera_front_off: Symbol = Symbol(name="video_camera_front_off", codepoint="\uF83B")
-    video_chat: Symbol = Symbol(name="video_chat", codepoint="\uF8A0")
-    video_file: Symbol = Symbol(name="video_file", codepoint="\uEB87")
-    video_label: Symbol = Symbol(name="video_label", codepoint="\uE071")
-    video_library: Symbol = Symbol(name="video_library", codepoint="\uE04A")
-    video_search: Symbol = Symbol(name="video_search", codepoint="\uEFC6")
-    video_settings: Symbol = Symbol(name="video_settings", codepoint="\uEA75")
-    video_stable: Symbol = Symbol(name="video_stable", codepoint="\uF081")
-    videocam: Symbol = Symbol(name="videocam", codepoint="\uE04B")
-    videocam_alert: Symbol = Symbol(name="videocam_alert", codepoint="\uF390")
-    videocam_off: Symbol = Symbol(name="videocam_off", codepoint="\uE04C")
-    videogame_asset: Symbol = Symbol(name="videogame_asset", codepoint="\uE338")
-    videogame_asset_off: Symbol = Symbol(name="videogame_asset_off", codepoint="\uE500")
-    view_agenda: Symbol = Symbol(name="view_agenda", codepoint="\uE8E9")
-    view_apps: Symbol = Symbol(name="view_apps", codepoint="\uF376")
-    view_array: Symbol = Symbol(name="view_array", codepoint="\uE8EA")
-    view_carousel: Symbol = Symbol(name="view_carousel", codepoint="\uE8EB")
-    view_column: Symbol = Symbol(name="view_column", codepoint="\uE8EC")
-    view_column_2: Symbol = Symbol(name="view_column_2", codepoint="\uF847")
-    view_comfy: Symbol = Symbol(name="view_comfy", codepoint="\uE42A")
-    view_comfy_alt: Symbol = Symbol(name="view_comfy_alt", codepoint="\uEB73")
-    view_compact: Symbol = Symbol(name="view_compact", codepoint="\uE42B")
-    view_compact_alt: Symbol = Symbol(name="view_compact_alt", codepoint="\uEB74")
-    view_cozy: Symbol = Symbol(name="view_cozy", codepoint="\uEB75")
-    view_day: Symbol = Symbol(name="view_day", codepoint="\uE8ED")
-    view_headline: Symbol = Symbol(name="view_headline", codepoint="\uE8EE")
-    view_in_ar: Symbol = Symbol(name="view_in_ar", codepoint="\uEFC9")
-    view_in_ar_new: Symbol = Symbol(name="view_in_ar_new", codepoint="\uEFC9")
-    view_in_ar_off: Symbol = Symbol(name="view_in_ar_off", codepoint="\uF61B")
-    view_kanban: Symbol = Symbol(name="view_kanban", codepoint="\uEB7F")
-    view_list: Symbol = Symbol(name="view_list", codepoint="\uE8EF")
-    view_module: Symbol = Symbol(name="view_module", codepoint="\uE8F0")
-    view_object_track: Symbol = Symbol(name="view_object_track", codepoint="\uF432")
-    view_quilt: Symbol = Symbol(name="view_quilt", codepoint="\uE8F1")
-    view_real_size: Symbol = Symbol(name="view_real_size", codepoint="\uF4C2")
-    view_sidebar: Symbol = Symbol(name="view_sidebar", codepoint="\uF114")
-    view_stream: Symbol = Symbol(name="view_stream", codepoint="\uE8F2")
-    view_timeline: Symbol = Symbol(name="view_timeline", codepoint="\uEB85")
-    view_week: Symbol = Symbol(name="view_week", codepoint="\uE8F3")
-    vignette: Symbol = Symbol(name="vignette", codepoint="\uE435")
-    vignette_2: Symbol = Symbol(name="vignette_2", codepoint="\uF2B3")
-    villa: Symbol = Symbol(name="villa", codepoint="\uE586")
-    visibility: Symbol = Symbol(name="visibility", codepoint="\uE8F4")
-    visibility_lock: Symbol = Symbol(name="visibility_lock", codepoint="\uF653")
-    visibility_off: Symbol = Symbol(name="visibility_off", codepoint="\uE8F5")
-    vital_signs: Symbol = Symbol(name="vital_signs", codepoint="\uE650")
-    vitals: Symbol = Symbol(name="vitals", codepoint="\uE13B")
-    vo2_max: Symbol = Symbol(name="vo2_max", codepoint="\uF4AA")
-    voice_chat: Symbol = Symbol(name="voice_chat", codepoint="\uE62E")
-    voice_over_off: Symbol = Symbol(name="voice_over_off", codepoint="\uE94A")
-    voice_selection: Symbol = Symbol(name="voice_selection", codepoint="\uF58A")
-    voice_selection_off: Symbol = Symbol(name="voice_selection_off", codepoint="\uF42C")
-    voicemail: Symbol = Symbol(name="voicemail", codepoint="\uE0D9")
-    voicemail_2: Symbol = Symbol(name="voicemail_2", codepoint="\uF352")
-    volcano: Symbol = Symbol(name="volcano", codepoint="\uEBDA")
-    volume_down: Symbol = Symbol(name="volume_down", codepoint="\uE04D")
-    volume_down_alt: Symbol = Symbol(name="volume_down_alt", codepoint="\uE79C")
-    volume_mute: Symbol = Symbol(name="volume_mute", codepoint="\uE04E")
-    volume_off: Symbol = Symbol(name="volume_off", codepoint="\uE04F")
-    volume_up: Symbol = Symbol(name="volume_up", codepoint="\uE050")
-    volunteer_activism: Symbol = Symbol(name="volunteer_activism", codepoint="\uEA70")
-    voting_chip: Symbol = Symbol(name="voting_chip", codepoint="\uF852")
-    vpn_key: Symbol = Symbol(name="vpn_key", codepoint="\uE0DA")
-    vpn_key_alert: Symbol = Symbol(name="vpn_key_alert", codepoint="\uF6CC")
-    vpn_key_off: Symbol = Symbol(name="vpn_key_off", codepoint="\uEB7A")
-    vpn_lock: Symbol = Symbol(name="vpn_lock", codepoint="\uE62F")
-    vpn_lock_2: Symbol = Symbol(name="vpn_lock_2", codepoint="\uF350")
-    vr180_create2d: Symbol = Symbol(name="vr180_create2d", codepoint="\uEFCA")
-    vr180_create2d_off: Symbol = Symbol(name="vr180_create2d_off", codepoint="\uF571")
-    vrpano: Symbol = Symbol(name="vrpano", codepoint="\uF082")
-    wall_art: Symbol = Symbol(name="wall_art", codepoint="\uEFCB")
-    wall_lamp: Symbol = Symbol(name="wall_lamp", codepoint="\uE2B4")
-    wallet: Symbol = Symbol(name="wallet", codepoint="\uF8FF")
-    wallpaper: Symbol = Symbol(name="wallpaper", codepoint="\uE1BC")
-    wallpaper_slideshow: Symbol = Symbol(name="wallpaper_slideshow", codepoint="\uF672")
-    wand_shine: Symbol = Symbol(name="wand_shine", codepoint="\uF31F")
-    wand_stars: Symbol = Symbol(name="wand_stars", codepoint="\uF31E")
-    ward: Symbol = Symbol(name="ward", codepoint="\uE13C")
-    warehouse: Symbol = Symbol(name="warehouse", codepoint="\uEBB8")
-    warning: Symbol = Symbol(name="warning", codepoint="\uF083")
-    warning_amber: Symbol = Symbol(name="warning_amber", codepoint="\uF083")
-    warning_off: Symbol = Symbol(name="warning_off", codepoint="\uF7AD")
-    wash: Symbol = Symbol(name="wash", codepoint="\uF1B1")
-    washoku: Symbol = Symbol(name="washoku", codepoint="\uF280")
-    watch: Symbol = Symbol(name="watch", codepoint="\uE334")
-    watch_arrow: Symbol = Symbol(name="watch_arrow", codepoint="\uF2CA")
-    watch_button_press: Symbol = Symbol(name="watch_button_press", codepoint="\uF6AA")
-    watch_check: Symbol = Symbol(name="watch_check", codepoint="\uF468")
-    watch_later: Symbol = Symbol(name="watch_later", codepoint="\uEFD6")
-    watch_off: Symbol = Symbol(name="watch_off", codepoint="\uEAE3")
-    watch_screentime: Symbol = Symbol(name="watch_screentime", codepoint="\uF6AE")
-    watch_vibration: Symbol = Symbol(name="watch_vibration", codepoint="\uF467")
-    watch_wake: Symbol = Symbol(name="watch_wake", codepoint="\uF6A9")
-    water: Symbol = Symbol(name="water", codepoint="\uF084")
-    water_bottle: Symbol = Symbol(name="water_bottle", codepoint="\uF69D")
-    water_bottle_large: Symbol = Symbol(name="water_bottle_large", codepoint="\uF69E")
-    water_damage: Symbol = Symbol(name="water_damage", codepoint="\uF203")
-    water_do: Symbol = Symbol(name="water_do", codepoint="\uF870")
-    water_drop: Symbol = Symbol(name="water_drop", codepoint="\uE798")
-    water_ec: Symbol = Symbol(name="water_ec", codepoint="\uF875")
-    water_full: Symbol = Symbol(name="water_full", codepoint="\uF6D6")
-    water_heater: Symbol = Symbol(name="water_heater", codepoint="\uE284")
-    water_lock: Symbol = Symbol(name="water_lock", codepoint="\uF6AD")
-    water_loss: Symbol = Symbol(name="water_loss", codepoint="\uF6D5")
-    water_lux: Symbol = Symbol(name="water_lux", codepoint="\uF874")
-    water_medium: Symbol = Symbol(name="water_medium", codepoint="\uF6D4")
-    water_orp: Symbol = Symbol(name="water_orp", codepoint="\uF878")
-    water_ph: Symbol = Symbol(name="water_ph", codepoint="\uF87A")
-    water_pump: Symbol = Symbol(name="water_pump", codepoint="\uF5D8")
-    water_voc: Symbol = Symbol(name="water_voc", codepoint="\uF87B")
-    waterfall_chart: Symbol = Symbol(name="waterfall_chart", codepoint="\uEA00")
-    waves: Symbol = Symbol(name="waves", codepoint="\uE176")
-    waving_hand: Symbol = Symbol(name="waving_hand", codepoint="\uE766")
-    wb_auto: Symbol = Symbol(name="wb_auto", codepoint="\uE42C")
-    wb_cloudy: Symbol = Symbol(name="wb_cloudy", codepoint="\uF15C")
-    wb_incandescent: Symbol = Symbol(name="wb_incandescent", codepoint="\uE42E")
-    wb_iridescent: Symbol = Symbol(name="wb_iridescent", codepoint="\uF07D")
-    wb_shade: Symbol = Symbol(name="wb_shade", codepoint="\uEA01")
-    wb_sunny: Symbol = Symbol(name="wb_sunny", codepoint="\uE430")
-    wb_twilight: Symbol = Symbol(name="wb_twilight", codepoint="\uE1C6")
-    wc: Symbol = Symbol(name="wc", codepoint="\uE63D")
-    weather_hail: Symbol = Symbol(name="weather_hail", codepoint="\uF67F")
-    weather_mix: Symbol = Symbol(name="weather_mix", codepoint="\uF60B")
-    weather_snowy: Symbol = Symbol(name="weather_snowy", codepoint="\uE2CD")
-    web: Symbol = Symbol(name="web", codepoint="\uE051")
-    web_asset: Symbol = Symbol(name="web_asset", codepoint="\uE069")
-    web_asset_off: Symbol = Symbol(name="web_asset_off", codepoint="\uEF47")
-    web_stories: Symbol = Symbol(name="web_stories", codepoint="\uE595")
-    web_traffic: Symbol = Symbol(name="web_traffic", codepoint="\uEA03")
-    webhook: Symbol = Symbol(name="webhook", codepoint="\uEB92")
-    weekend: Symbol = Symbol(name="weekend", codepoint="\uE16B")
-    weight: Symbol = Symbol(name="weight", codepoint="\uE13D")
-    west: Symbol = Symbol(name="west", codepoint="\uF1E6")
-    whatshot: Symbol = Symbol(name="whatshot", codepoint="\uE80E")
-    wheelchair_pickup: Symbol = Symbol(name="wheelchair_pickup", codepoint="\uF1AB")
-    where_to_vote: Symbol = Symbol(name="where_to_vote", codepoint="\uE177")
-    widget_medium: Symbol = Symbol(name="widget_medium", codepoint="\uF3BA")
-    widget_small: Symbol = Symbol(name="widget_small", codepoint="\uF3B9")
-    widget_width: Symbol = Symbol(name="widget_width", codepoint="\uF3B8")
-    widgets: Symbol = Symbol(name="widgets", codepoint="\uE1BD")
-    width: Symbol = Symbol(name="width", codepoint="\uF730")
-    width_full: Symbol = Symbol(name="width_full", codepoint="\uF8F5")
-    width_normal: Symbol = Symbol(name="width_normal", codepoint="\uF8F6")
-    width_wide: Symbol = Symbol(name="width_wide", codepoint="\uF8F7")
-    wifi: Symbol = Symbol(name="wifi", codepoint="\uE63E")
-    wifi_1_bar: Symbol = Symbol(name="wifi_1_bar", codepoint="\uE4CA")
-    wifi_2_bar: Symbol = Symbol(name="wifi_2_bar", codepoint="\uE4D9")
-    wifi_add: Symbol = Symbol(name="wifi_add", codepoint="\uF7A8")
-    wifi_calling: Symbol = Symbol(name="wifi_calling", codepoint="\uEF77")
-    wifi_calling_1: Symbol = Symbol(name="wifi_calling_1", codepoint="\uF0E7")
-    wifi_calling_2: Symbol = Symbol(name="wifi_calling_2", codepoint="\uF0F6")
-    wifi_calling_3: Symbol = Symbol(name="wifi_calling_3", codepoint="\uF0E7")
-    wifi_calling_bar_1: Symbol = Symbol(name="wifi_calling_bar_1", codepoint="\uF44C")
-    wifi_calling_bar_2: Symbol = Symbol(name="wifi_calling_bar_2", codepoint="\uF44B")
-    wifi_calling_bar_3: Symbol = Symbol(name="wifi_calling_bar_3", codepoint="\uF44A")
-    wifi_channel: Symbol = Symbol(name="wifi_channel", codepoint="\uEB6A")
-    wifi_find: Symbol = Symbol(name="wifi_find", codepoint="\uEB31")
-    wifi_home: Symbol = Symbol(name="wifi_home", codepoint="\uF671")
-    wifi_lock: Symbol = Symbol(name="wifi_lock", codepoint="\uE1E1")
-    wifi_notification: Symbol = Symbol(name="wifi_notification", codepoint="\uF670")
-    wifi_off: Symbol = Symbol(name="wifi_off", codepoint="\uE648")
-    wifi_password: Symbol = Symbol(name="wifi_password", codepoint="\uEB6B")
-    wifi_protected_setup: Symbol = Symbol(name="wifi_protected_setup", codepoint="\uF0FC")
-    wifi_proxy: Symbol = Symbol(name="wifi_proxy", codepoint="\uF7A7")
-    wifi_tethering: Symbol = Symbol(name="wifi_tethering", codepoint="\uE1E2")
-    wifi_tethering_error: Symbol = Symbol(name="wifi_tethering_error", codepoint="\uEAD9")
-    wifi_tethering_off: Symbol = Symbol(name="wifi_tethering_off", codepoint="\uF087")
-    wind_power: Symbol = Symbol(name="wind_power", codepoint="\uEC0C")
-    window: Symbol = Symbol(name="window", codepoint="\uF088")
-    window_closed: Symbol = Symbol(name="window_closed", codepoint="\uE77E")
-    window_open: Symbol = Symbol(name="window_open", codepoint="\uE78C")
-    window_sensor: Symbol = Symbol(name="window_sensor", codepoint="\uE2BB")
-    windshield_defrost_auto: Symbol = Symbol(name="windshield_defrost_auto", codepoint="\uF248")
-    windshield_defrost_front: Symbol = Symbol(name="windshield_defrost_front", codepoint="\uF32A")
-    windshield_defrost_rear: Symbol = Symbol(name="windshield_defrost_rear", codepoint="\uF329")
-    windshield_heat_front: Symbol = Symbol(name="windshield_heat_front", codepoint="\uF328")
-    wine_bar: Symbol = Symbol(name="wine_bar", codepoint="\uF1E8")
-    woman: Symbol = Symbol(name="woman", codepoint="\uE13E")
-    woman_2: Symbol = Symbol(name="woman_2", codepoint="\uF8E7")
-    work: Symbol = Symbol(name="work", codepoint="\uE943")
-    work_alert: Symbol = Symbol(name="work_alert", codepoint="\uF5F7")
-    work_history: Symbol = Symbol(name="work_history", codepoint="\uEC09")
-    work_off: Symbol = Symbol(name="work_off", codepoint="\uE942")
-    work_outline: Symbol = Symbol(name="work_outline", codepoint="\uE943")
-    work_update: Symbol = Symbol(name="work_update", codepoint="\uF5F8")
-    workflow: Symbol = Symbol(name="workflow", codepoint="\uEA04")
-    workspace_premium: Symbol = Symbol(name="workspace_premium", codepoint="\uE7AF")
-    workspaces: Symbol = Symbol(name="workspaces", codepoint="\uEA0F")
-    workspaces_outline: Symbol = Symbol(name="workspaces_outline", codepoint="\uEA0F")
-    wounds_injuries: Symbol = Symbol(name="wounds_injuries", codepoint="\uE13F")
-    wrap_text: Symbol = Symbol(name="wrap_text", codepoint="\uE25B")
-    wrist: Symbol = Symbol(name="wrist", codepoint="\uF69C")
-    wrong_location: Symbol = Symbol(name="wrong_location", codepoint="\uEF78")
-    wysiwyg: Symbol = Symbol(name="wysiwyg", codepoint="\uF1C3")
-    yakitori: Symbol = Symbol(name="yakitori", codepoint="\uEF31")
-    yard: Symbol = Symbol(name="yard", codepoint="\uF089")
-    yoshoku: Symbol = Symbol(name="yoshoku", codepoint="\uF27F")
-    your_trips: Symbol = Symbol(name="your_trips", codepoint="\uEB2B")
-    youtube_activity: Symbol = Symbol(name="youtube_activity", codepoint="\uF85A")
-    youtube_searched_for: Symbol = Symbol(name="youtube_searched_for", codepoint="\uE8FA")
-    zone_person_alert: Symbol = Symbol(name="zone_person_alert", codepoint="\uE781")
-    zone_person_idle: Symbol = Symbol(name="zone_person_idle", codepoint="\uE77A")
-    zone_person_urgent: Symbol = Symbol(name="zone_person_urgent", codepoint="\uE788")
-    zoom_in: Symbol = Symbol(name="zoom_in", codepoint="\uE8FF")
-    zoom_in_map: Symbol = Symbol(name="zoom_in_map", codepoint="\uEB2D")
-    zoom_out: Symbol = Symbol(name="zoom_out", codepoint="\uE900")
-    zoom_out_map: Symbol = Symbol(name="zoom_out_map", codepoint="\uE56B")
+_lock = threading.Lock()
+_table: Optional[Tuple[Tuple[str, ...], "array[int]"]] = None
+_symbols: Dict[str, Symbol] = {}
 
-    _NAME_TO_SYMBOL: ClassVar[Dict[str, Symbol] | None] = None
 
-    @classmethod
-    def _index(cls) -> Dict[str, Symbol]:
-        mapping = cls._NAME_TO_SYMBOL
-        if mapping is None:
-            mapping = {
-                value.name: value
-                for value in cls.__dict__.values()
-                if isinstance(value, Symbol)
-            }
-            cls._NAME_TO_SYMBOL = mapping
-        return mapping
+def _load_table() -> Tuple[Tuple[str, ...], "array[int]"]:
+    global _table
+    table = _table
+    if table is not None:
+        return table
+    with _lock:
+        if _table is None:
+            path = os.path.join(os.path.dirname(__file__), CODEPOINTS_FILE)
+            with open(path, "r", encoding="utf-8") as f:
+                # One "name hexcodepoint" pair per line.
+                tokens = f.read().split()
+            names = tuple(tokens[0::2])
+            codepoints = array("I", [int(cp, 16) for cp in tokens[1::2]])
+            if any(a > b for a, b in zip(names, names[1:])):
+                order = sorted(range(len(names)), key=names.__getitem__)
+                names = tuple(names[i] for i in order)
+                codepoints = array("I", [codepoints[i] for i in order])
+            _table = (names, codepoints)
+        return _table
+
+
+def _codepoint(name: str) -> Optional[int]:
+    names, codepoints = _load_table()
+    idx = bisect_left(names, name)
+    if idx < len(names) and names[idx] == name:
+        return codepoints[idx]
+    return None
+
+
+def _symbol(name: str) -> Optional[Symbol]:
+    symbol = _symbols.get(name)
+    if symbol is not None:
+        return symbol
+    cp = _codepoint(name)
+    if cp is None:
+        return None
+    # setdefault keeps one instance per name if two threads race here.
+    return _symbols.setdefault(name, Symbol(name=name, codepoint=chr(cp)))
+
+
+def _identifier_for(name: str) -> str:
+    # Mirrors sanitize_identifier in scripts/vendor/material/generate_icon_map.py.
+    ident = name
+    if ident[:1].isdigit():
+        ident = f"_{ident}"
+    if keyword.iskeyword(ident):
+        ident = f"{ident}_"
+    return ident
+
+
+def _name_for(ident: str) -> Optional[str]:
+    name = ident
+    if name.endswith("_") and keyword.iskeyword(name[:-1]):
+        name = name[:-1]
+    if name.startswith("_") and name[1:2].isdigit():
+        name = name[1:]
+    if not name or name.startswith("_") or _identifier_for(name) != ident:
+        return None
+    return name
+
+
+class _SymbolsMeta(type):
+    def __getattr__(cls, attr: str) -> Symbol:
+        if not attr.startswith("__"):
+            name = _name_for(attr)
+            symbol = _symbol(name) if name is not None else None
+            if symbol is not None:
+                # Later accesses become plain class attribute lookups.
+                type.__setattr__(cls, attr, symbol)
+                return symbol
+        raise AttributeError(f"type object {cls.__name__!r} has no attribute {attr!r}")
+
+    def __dir__(cls) -> List[str]:
+        names, _ = _load_table()
+        return sorted(set(super().__dir__()) | {_identifier_for(name) for name in names})
+
+
+class Symbols(metaclass=_SymbolsMeta):
+    """Material Symbols constants, materialized on first access."""
 
     @classmethod
     def from_name(cls, name: str | None) -> Symbol | None:
         if not name:
             return None
-        return cls._index().get(name)
+        return _symbol(name)
 
     @classmethod
     def glyph_for(cls, name: str | None) -> str | None:
@@ -0,0 +1,4120 @@
+
+from dataclasses import dataclass
+from typing import ClassVar
+
+@dataclass(frozen=True)
+class Symbol:
+    name: str
+    codepoint: str
+    def ligature(self) -> str: ...
+    def glyph(self) -> str: ...
+
+class Symbols:
+    _10k: ClassVar[Symbol]
+    _10mp: ClassVar[Symbol]
+    _11mp: ClassVar[Symbol]
+    _123: ClassVar[Symbol]
+    _12mp: ClassVar[Symbol]
+    _13mp: ClassVar[Symbol]
+    _14mp: ClassVar[Symbol]
+    _15mp: ClassVar[Symbol]
+    _16mp: ClassVar[Symbol]
+    _17mp: ClassVar[Symbol]
+    _18_up_rating: ClassVar[Symbol]
+    _18mp: ClassVar[Symbol]
+    _19mp: ClassVar[Symbol]
+    _1k: ClassVar[Symbol]
+    _1k_plus: ClassVar[Symbol]
+    _1x_mobiledata: ClassVar[Symbol]
+    _1x_mobiledata_badge: ClassVar[Symbol]
+    _20mp: ClassVar[Symbol]
+    _21mp: ClassVar[Symbol]
+    _22mp: ClassVar[Symbol]
+    _23mp: ClassVar[Symbol]
+    _24fps_select: ClassVar[Symbol]
+    _24mp: ClassVar[Symbol]
+    _2d: ClassVar[Symbol]
+    _2k: ClassVar[Symbol]
+    _2k_plus: ClassVar[Symbol]
+    _2mp: ClassVar[Symbol]
+    _30fps: ClassVar[Symbol]
+    _30fps_select: ClassVar[Symbol]
+    _360: ClassVar[Symbol]
+    _3d: ClassVar[Symbol]
+    _3d_rotation: ClassVar[Symbol]
+    _3g_mobiledata: ClassVar[Symbol]
+    _3g_mobiledata_badge: ClassVar[Symbol]
+    _3k: ClassVar[Symbol]
+    _3k_plus: ClassVar[Symbol]
+    _3mp: ClassVar[Symbol]
+    _3p: ClassVar[Symbol]
+    _4g_mobiledata: ClassVar[Symbol]
+    _4g_mobiledata_badge: ClassVar[Symbol]
+    _4g_plus_mobiledata: ClassVar[Symbol]
+    _4k: ClassVar[Symbol]
+    _4k_plus: ClassVar[Symbol]
+    _4mp: ClassVar[Symbol]
+    _50mp: ClassVar[Symbol]
+    _5g: ClassVar[Symbol]
+    _5g_mobiledata_badge: ClassVar[Symbol]
+    _5k: ClassVar[Symbol]
+    _5k_plus: ClassVar[Symbol]
+    _5mp: ClassVar[Symbol]
+    _60fps: ClassVar[Symbol]
+    _60fps_select: ClassVar[Symbol]
+    _6_ft_apart: ClassVar[Symbol]
+    _6k: ClassVar[Symbol]
+    _6k_plus: ClassVar[Symbol]
+    _6mp: ClassVar[Symbol]
+    _7k: ClassVar[Symbol]
+    _7k_plus: ClassVar[Symbol]
+    _7mp: ClassVar[Symbol]
+    _8k: ClassVar[Symbol]
+    _8k_plus: ClassVar[Symbol]
+    _8mp: ClassVar[Symbol]
+    _9k: ClassVar[Symbol]
+    _9k_plus: ClassVar[Symbol]
+    _9mp: ClassVar[Symbol]
+    abc: ClassVar[Symbol]
+    ac_unit: ClassVar[Symbol]
+    access_alarm: ClassVar[Symbol]
+    access_alarms: ClassVar[Symbol]
+    access_time: ClassVar[Symbol]
+    access_time_filled: ClassVar[Symbol]
+    accessibility: ClassVar[Symbol]
+    accessibility_new: ClassVar[Symbol]
+    accessible: ClassVar[Symbol]
+    accessible_forward: ClassVar[Symbol]
+    accessible_menu: ClassVar[Symbol]
+    account_balance: ClassVar[Symbol]
+    account_balance_wallet: ClassVar[Symbol]
+    account_box: ClassVar[Symbol]
+    account_child: ClassVar[Symbol]
+    account_child_invert: ClassVar[Symbol]
+    account_circle: ClassVar[Symbol]
+    account_circle_filled: ClassVar[Symbol]
+    account_circle_off: ClassVar[Symbol]
+    account_tree: ClassVar[Symbol]
+    action_key: ClassVar[Symbol]
+    activity_zone: ClassVar[Symbol]
+    acupuncture: ClassVar[Symbol]
+    acute: ClassVar[Symbol]
+    ad: ClassVar[Symbol]
+    ad_group: ClassVar[Symbol]
+    ad_group_off: ClassVar[Symbol]
+    ad_off: ClassVar[Symbol]
+    ad_units: ClassVar[Symbol]
+    adaptive_audio_mic: ClassVar[Symbol]
+    adaptive_audio_mic_off: ClassVar[Symbol]
+    adb: ClassVar[Symbol]
+    add: ClassVar[Symbol]
+    add_2: ClassVar[Symbol]
+    add_a_photo: ClassVar[Symbol]
+    add_ad: ClassVar[Symbol]
+    add_alarm: ClassVar[Symbol]
+    add_alert: ClassVar[Symbol]
+    add_box: ClassVar[Symbol]
+    add_business: ClassVar[Symbol]
+    add_call: ClassVar[Symbol]
+    add_card: ClassVar[Symbol]
+    add_chart: ClassVar[Symbol]
+    add_circle: ClassVar[Symbol]
+    add_circle_outline: ClassVar[Symbol]
+    add_column_left: ClassVar[Symbol]
+    add_column_right: ClassVar[Symbol]
+    add_comment: ClassVar[Symbol]
+    add_diamond: ClassVar[Symbol]
+    add_home: ClassVar[Symbol]
+    add_home_work: ClassVar[Symbol]
+    add_ic_call: ClassVar[Symbol]
+    add_link: ClassVar[Symbol]
+    add_location: ClassVar[Symbol]
+    add_location_alt: ClassVar[Symbol]
+    add_moderator: ClassVar[Symbol]
+    add_notes: ClassVar[Symbol]
+    add_photo_alternate: ClassVar[Symbol]
+    add_reaction: ClassVar[Symbol]
+    add_road: ClassVar[Symbol]
+    add_row_above: ClassVar[Symbol]
+    add_row_below: ClassVar[Symbol]
+    add_shopping_cart: ClassVar[Symbol]
+    add_task: ClassVar[Symbol]
+    add_to_drive: ClassVar[Symbol]
+    add_to_home_screen: ClassVar[Symbol]
+    add_to_photos: ClassVar[Symbol]
+    add_to_queue: ClassVar[Symbol]
+    add_triangle: ClassVar[Symbol]
+    addchart: ClassVar[Symbol]
+    adf_scanner: ClassVar[Symbol]
+    adjust: ClassVar[Symbol]
+    admin_meds: ClassVar[Symbol]
+    admin_panel_settings: ClassVar[Symbol]
+    ads_click: ClassVar[Symbol]
+    agender: ClassVar[Symbol]
+    agriculture: ClassVar[Symbol]
+    air: ClassVar[Symbol]
+    air_freshener: ClassVar[Symbol]
+    air_purifier: ClassVar[Symbol]
+    air_purifier_gen: ClassVar[Symbol]
+    airline_seat_flat: ClassVar[Symbol]
+    airline_seat_flat_angled: ClassVar[Symbol]
+    airline_seat_individual_suite: ClassVar[Symbol]
+    airline_seat_legroom_extra: ClassVar[Symbol]
+    airline_seat_legroom_normal: ClassVar[Symbol]
+    airline_seat_legroom_reduced: ClassVar[Symbol]
+    airline_seat_recline_extra: ClassVar[Symbol]
+    airline_seat_recline_normal: ClassVar[Symbol]
+    airline_stops: ClassVar[Symbol]
+    airlines: ClassVar[Symbol]
+    airplane_ticket: ClassVar[Symbol]
+    airplanemode_active: ClassVar[Symbol]
+    airplanemode_inactive: ClassVar[Symbol]
+    airplay: ClassVar[Symbol]
+    airport_shuttle: ClassVar[Symbol]
+    airware: ClassVar[Symbol]
+    airwave: ClassVar[Symbol]
+    alarm: ClassVar[Symbol]
+    alarm_add: ClassVar[Symbol]
+    alarm_off: ClassVar[Symbol]
+    alarm_on: ClassVar[Symbol]
+    alarm_pause: ClassVar[Symbol]
+    alarm_smart_wake: ClassVar[Symbol]
+    album: ClassVar[Symbol]
+    align_center: ClassVar[Symbol]
+    align_end: ClassVar[Symbol]
+    align_flex_center: ClassVar[Symbol]
+    align_flex_end: ClassVar[Symbol]
+    align_flex_start: ClassVar[Symbol]
+    align_horizontal_center: ClassVar[Symbol]
+    align_horizontal_left: ClassVar[Symbol]
+    align_horizontal_right: ClassVar[Symbol]
+    align_items_stretch: ClassVar[Symbol]
+    align_justify_center: ClassVar[Symbol]
+    align_justify_flex_end: ClassVar[Symbol]
+    align_justify_flex_start: ClassVar[Symbol]
+    align_justify_space_around: ClassVar[Symbol]
+    align_justify_space_between: ClassVar[Symbol]
+    align_justify_space_even: ClassVar[Symbol]
+    align_justify_stretch: ClassVar[Symbol]
+    align_self_stretch: ClassVar[Symbol]
+    align_space_around: ClassVar[Symbol]
+    align_space_between: ClassVar[Symbol]
+    align_space_even: ClassVar[Symbol]
+    align_start: ClassVar[Symbol]
+    align_stretch: ClassVar[Symbol]
+    align_vertical_bottom: ClassVar[Symbol]
+    align_vertical_center: ClassVar[Symbol]
+    align_vertical_top: ClassVar[Symbol]
+    all_inbox: ClassVar[Symbol]
+    all_inclusive: ClassVar[Symbol]
+    all_match: ClassVar[Symbol]
+    all_out: ClassVar[Symbol]
+    allergies: ClassVar[Symbol]
+    allergy: ClassVar[Symbol]
+    alt_route: ClassVar[Symbol]
+    alternate_email: ClassVar[Symbol]
+    altitude: ClassVar[Symbol]
+    ambient_screen: ClassVar[Symbol]
+    ambulance: ClassVar[Symbol]
+    amend: ClassVar[Symbol]
+    amp_stories: ClassVar[Symbol]
+    analytics: ClassVar[Symbol]
+    anchor: ClassVar[Symbol]
+    android: ClassVar[Symbol]
+    android_cell_4_bar: ClassVar[Symbol]
+    android_cell_4_bar_alert: ClassVar[Symbol]
+    android_cell_4_bar_off: ClassVar[Symbol]
+    android_cell_4_bar_plus: ClassVar[Symbol]
+    android_cell_5_bar: ClassVar[Symbol]
+    android_cell_5_bar_alert: ClassVar[Symbol]
+    android_cell_5_bar_off: ClassVar[Symbol]
+    android_cell_5_bar_plus: ClassVar[Symbol]
+    android_cell_dual_4_bar: ClassVar[Symbol]
+    android_cell_dual_4_bar_alert: ClassVar[Symbol]
+    android_cell_dual_4_bar_plus: ClassVar[Symbol]
+    android_cell_dual_5_bar: ClassVar[Symbol]
+    android_cell_dual_5_bar_alert: ClassVar[Symbol]
+    android_cell_dual_5_bar_plus: ClassVar[Symbol]
+    android_wifi_3_bar: ClassVar[Symbol]
+    android_wifi_3_bar_alert: ClassVar[Symbol]
+    android_wifi_3_bar_lock: ClassVar[Symbol]
+    android_wifi_3_bar_off: ClassVar[Symbol]
+    android_wifi_3_bar_plus: ClassVar[Symbol]
+    android_wifi_3_bar_question: ClassVar[Symbol]
+    android_wifi_4_bar: ClassVar[Symbol]
+    android_wifi_4_bar_alert: ClassVar[Symbol]
+    android_wifi_4_bar_lock: ClassVar[Symbol]
+    android_wifi_4_bar_off: ClassVar[Symbol]
+    android_wifi_4_bar_plus: ClassVar[Symbol]
+    android_wifi_4_bar_question: ClassVar[Symbol]
+    animated_images: ClassVar[Symbol]
+    animation: ClassVar[Symbol]
+    announcement: ClassVar[Symbol]
+    aod: ClassVar[Symbol]
+    aod_tablet: ClassVar[Symbol]
+    aod_watch: ClassVar[Symbol]
+    apartment: ClassVar[Symbol]
+    api: ClassVar[Symbol]
+    apk_document: ClassVar[Symbol]
+    apk_install: ClassVar[Symbol]
+    app_badging: ClassVar[Symbol]
+    app_blocking: ClassVar[Symbol]
+    app_promo: ClassVar[Symbol]
+    app_registration: ClassVar[Symbol]
+    app_settings_alt: ClassVar[Symbol]
+    app_shortcut: ClassVar[Symbol]
+    apparel: ClassVar[Symbol]
+    approval: ClassVar[Symbol]
+    approval_delegation: ClassVar[Symbol]
+    approval_delegation_off: ClassVar[Symbol]
+    apps: ClassVar[Symbol]
+    apps_outage: ClassVar[Symbol]
+    aq: ClassVar[Symbol]
+    aq_indoor: ClassVar[Symbol]
+    ar_on_you: ClassVar[Symbol]
+    ar_stickers: ClassVar[Symbol]
+    architecture: ClassVar[Symbol]
+    archive: ClassVar[Symbol]
+    area_chart: ClassVar[Symbol]
+    arming_countdown: ClassVar[Symbol]
+    arrow_and_edge: ClassVar[Symbol]
+    arrow_back: ClassVar[Symbol]
+    arrow_back_2: ClassVar[Symbol]
+    arrow_back_ios: ClassVar[Symbol]
+    arrow_back_ios_new: ClassVar[Symbol]
+    arrow_circle_down: ClassVar[Symbol]
+    arrow_circle_left: ClassVar[Symbol]
+    arrow_circle_right: ClassVar[Symbol]
+    arrow_circle_up: ClassVar[Symbol]
+    arrow_cool_down: ClassVar[Symbol]
+    arrow_downward: ClassVar[Symbol]
+    arrow_downward_alt: ClassVar[Symbol]
+    arrow_drop_down: ClassVar[Symbol]
+    arrow_drop_down_circle: ClassVar[Symbol]
+    arrow_drop_up: ClassVar[Symbol]
+    arrow_forward: ClassVar[Symbol]
+    arrow_forward_ios: ClassVar[Symbol]
+    arrow_insert: ClassVar[Symbol]
+    arrow_left: ClassVar[Symbol]
+    arrow_left_alt: ClassVar[Symbol]
+    arrow_menu_close: ClassVar[Symbol]
+    arrow_menu_open: ClassVar[Symbol]
+    arrow_or_edge: ClassVar[Symbol]
+    arrow_outward: ClassVar[Symbol]
+    arrow_range: ClassVar[Symbol]
+    arrow_right: ClassVar[Symbol]
+    arrow_right_alt: ClassVar[Symbol]
+    arrow_selector_tool: ClassVar[Symbol]
+    arrow_shape_up: ClassVar[Symbol]
+    arrow_shape_up_stack: ClassVar[Symbol]
+    arrow_shape_up_stack_2: ClassVar[Symbol]
+    arrow_split: ClassVar[Symbol]
+    arrow_top_left: ClassVar[Symbol]
+    arrow_top_right: ClassVar[Symbol]
+    arrow_upload_progress: ClassVar[Symbol]
+    arrow_upload_ready: ClassVar[Symbol]
+    arrow_upward: ClassVar[Symbol]
+    arrow_upward_alt: ClassVar[Symbol]
+    arrow_warm_up: ClassVar[Symbol]
+    arrows_input: ClassVar[Symbol]
+    arrows_more_down: ClassVar[Symbol]
+    arrows_more_up: ClassVar[Symbol]
+    arrows_output: ClassVar[Symbol]
+    arrows_outward: ClassVar[Symbol]
+    art_track: ClassVar[Symbol]
+    article: ClassVar[Symbol]
+    article_person: ClassVar[Symbol]
+    article_shortcut: ClassVar[Symbol]
+    artist: ClassVar[Symbol]
+    aspect_ratio: ClassVar[Symbol]
+    assessment: ClassVar[Symbol]
+    assignment: ClassVar[Symbol]
+    assignment_add: ClassVar[Symbol]
+    assignment_globe: ClassVar[Symbol]
+    assignment_ind: ClassVar[Symbol]
+    assignment_late: ClassVar[Symbol]
+    assignment_return: ClassVar[Symbol]
+    assignment_returned: ClassVar[Symbol]
+    assignment_turned_in: ClassVar[Symbol]
+    assist_walker: ClassVar[Symbol]
+    assistant: ClassVar[Symbol]
+    assistant_device: ClassVar[Symbol]
+    assistant_direction: ClassVar[Symbol]
+    assistant_navigation: ClassVar[Symbol]
+    assistant_on_hub: ClassVar[Symbol]
+    assistant_photo: ClassVar[Symbol]
+    assured_workload: ClassVar[Symbol]
+    asterisk: ClassVar[Symbol]
+    astrophotography_auto: ClassVar[Symbol]
+    astrophotography_off: ClassVar[Symbol]
+    atm: ClassVar[Symbol]
+    atr: ClassVar[Symbol]
+    attach_email: ClassVar[Symbol]
+    attach_file: ClassVar[Symbol]
+    attach_file_add: ClassVar[Symbol]
+    attach_file_off: ClassVar[Symbol]
+    attach_money: ClassVar[Symbol]
+    attachment: ClassVar[Symbol]
+    attractions: ClassVar[Symbol]
+    attribution: ClassVar[Symbol]
+    audio_description: ClassVar[Symbol]
+    audio_file: ClassVar[Symbol]
+    audio_video_receiver: ClassVar[Symbol]
+    audiotrack: ClassVar[Symbol]
+    auto_activity_zone: ClassVar[Symbol]
+    auto_awesome: ClassVar[Symbol]
+    auto_awesome_mosaic: ClassVar[Symbol]
+    auto_awesome_motion: ClassVar[Symbol]
+    auto_delete: ClassVar[Symbol]
+    auto_detect_voice: ClassVar[Symbol]
+    auto_draw_solid: ClassVar[Symbol]
+    auto_fix: ClassVar[Symbol]
+    auto_fix_high: ClassVar[Symbol]
+    auto_fix_normal: ClassVar[Symbol]
+    auto_fix_off: ClassVar[Symbol]
+    auto_graph: ClassVar[Symbol]
+    auto_label: ClassVar[Symbol]
+    auto_meeting_room: ClassVar[Symbol]
+    auto_mode: ClassVar[Symbol]
+    auto_read_pause: ClassVar[Symbol]
+    auto_read_play: ClassVar[Symbol]
+    auto_schedule: ClassVar[Symbol]
+    auto_stories: ClassVar[Symbol]
+    auto_stories_off: ClassVar[Symbol]
+    auto_timer: ClassVar[Symbol]
+    auto_towing: ClassVar[Symbol]
+    auto_transmission: ClassVar[Symbol]
+    auto_videocam: ClassVar[Symbol]
+    autofps_select: ClassVar[Symbol]
+    automation: ClassVar[Symbol]
+    autopause: ClassVar[Symbol]
+    autopay: ClassVar[Symbol]
+    autoplay: ClassVar[Symbol]
+    autorenew: ClassVar[Symbol]
+    autostop: ClassVar[Symbol]
+    av1: ClassVar[Symbol]
+    av_timer: ClassVar[Symbol]
+    avc: ClassVar[Symbol]
+    avg_pace: ClassVar[Symbol]
+    avg_time: ClassVar[Symbol]
+    award_meal: ClassVar[Symbol]
+    award_star: ClassVar[Symbol]
+    azm: ClassVar[Symbol]
+    baby_changing_station: ClassVar[Symbol]
+    back_hand: ClassVar[Symbol]
+    back_to_tab: ClassVar[Symbol]
+    background_dot_large: ClassVar[Symbol]
+    background_dot_small: ClassVar[Symbol]
+    background_grid_small: ClassVar[Symbol]
+    background_replace: ClassVar[Symbol]
+    backlight_high: ClassVar[Symbol]
+    backlight_high_off: ClassVar[Symbol]
+    backlight_low: ClassVar[Symbol]
+    backpack: ClassVar[Symbol]
+    backspace: ClassVar[Symbol]
+    backup: ClassVar[Symbol]
+    backup_table: ClassVar[Symbol]
+    badge: ClassVar[Symbol]
+    badge_critical_battery: ClassVar[Symbol]
+    badminton: ClassVar[Symbol]
+    bakery_dining: ClassVar[Symbol]
+    balance: ClassVar[Symbol]
+    balcony: ClassVar[Symbol]
+    ballot: ClassVar[Symbol]
+    bar_chart: ClassVar[Symbol]
+    bar_chart_4_bars: ClassVar[Symbol]
+    bar_chart_off: ClassVar[Symbol]
+    barcode: ClassVar[Symbol]
+    barcode_reader: ClassVar[Symbol]
+    barcode_scanner: ClassVar[Symbol]
+    barefoot: ClassVar[Symbol]
+    batch_prediction: ClassVar[Symbol]
+    bath_bedrock: ClassVar[Symbol]
+    bath_outdoor: ClassVar[Symbol]
+    bath_private: ClassVar[Symbol]
+    bath_public_large: ClassVar[Symbol]
+    bath_soak: ClassVar[Symbol]
+    bathroom: ClassVar[Symbol]
+    bathtub: ClassVar[Symbol]
+    battery_0_bar: ClassVar[Symbol]
+    battery_1_bar: ClassVar[Symbol]
+    battery_20: ClassVar[Symbol]
+    battery_2_bar: ClassVar[Symbol]
+    battery_30: ClassVar[Symbol]
+    battery_3_bar: ClassVar[Symbol]
+    battery_4_bar: ClassVar[Symbol]
+    battery_50: ClassVar[Symbol]
+    battery_5_bar: ClassVar[Symbol]
+    battery_60: ClassVar[Symbol]
+    battery_6_bar: ClassVar[Symbol]
+    battery_80: ClassVar[Symbol]
+    battery_90: ClassVar[Symbol]
+    battery_alert: ClassVar[Symbol]
+    battery_android_0: ClassVar[Symbol]
+    battery_android_1: ClassVar[Symbol]
+    battery_android_2: ClassVar[Symbol]
+    battery_android_3: ClassVar[Symbol]
+    battery_android_4: ClassVar[Symbol]
+    battery_android_5: ClassVar[Symbol]
+    battery_android_6: ClassVar[Symbol]
+    battery_android_alert: ClassVar[Symbol]
+    battery_android_bolt: ClassVar[Symbol]
+    battery_android_frame_1: ClassVar[Symbol]
+    battery_android_frame_2: ClassVar[Symbol]
+    battery_android_frame_3: ClassVar[Symbol]
+    battery_android_frame_4: ClassVar[Symbol]
+    battery_android_frame_5: ClassVar[Symbol]
+    battery_android_frame_6: ClassVar[Symbol]
+    battery_android_frame_alert: ClassVar[Symbol]
+    battery_android_frame_bolt: ClassVar[Symbol]
+    battery_android_frame_full: ClassVar[Symbol]
+    battery_android_frame_plus: ClassVar[Symbol]
+    battery_android_frame_question: ClassVar[Symbol]
+    battery_android_frame_share: ClassVar[Symbol]
+    battery_android_frame_shield: ClassVar[Symbol]
+    battery_android_full: ClassVar[Symbol]
+    battery_android_plus: ClassVar[Symbol]
+    battery_android_question: ClassVar[Symbol]
+    battery_android_share: ClassVar[Symbol]
+    battery_android_shield: ClassVar[Symbol]
+    battery_change: ClassVar[Symbol]
+    battery_charging_20: ClassVar[Symbol]
+    battery_charging_30: ClassVar[Symbol]
+    battery_charging_50: ClassVar[Symbol]
+    battery_charging_60: ClassVar[Symbol]
+    battery_charging_80: ClassVar[Symbol]
+    battery_charging_90: ClassVar[Symbol]
+    battery_charging_full: ClassVar[Symbol]
+    battery_error: ClassVar[Symbol]
+    battery_full: ClassVar[Symbol]
+    battery_full_alt: ClassVar[Symbol]
+    battery_horiz_000: ClassVar[Symbol]
+    battery_horiz_050: ClassVar[Symbol]
+    battery_horiz_075: ClassVar[Symbol]
+    battery_low: ClassVar[Symbol]
+    battery_plus: ClassVar[Symbol]
+    battery_profile: ClassVar[Symbol]
+    battery_saver: ClassVar[Symbol]
+    battery_share: ClassVar[Symbol]
+    battery_status_good: ClassVar[Symbol]
+    battery_std: ClassVar[Symbol]
+    battery_unknown: ClassVar[Symbol]
+    battery_vert_005: ClassVar[Symbol]
+    battery_vert_020: ClassVar[Symbol]
+    battery_vert_050: ClassVar[Symbol]
+    battery_very_low: ClassVar[Symbol]
+    beach_access: ClassVar[Symbol]
+    bed: ClassVar[Symbol]
+    bedroom_baby: ClassVar[Symbol]
+    bedroom_child: ClassVar[Symbol]
+    bedroom_parent: ClassVar[Symbol]
+    bedtime: ClassVar[Symbol]
+    bedtime_off: ClassVar[Symbol]
+    beenhere: ClassVar[Symbol]
+    beer_meal: ClassVar[Symbol]
+    bento: ClassVar[Symbol]
+    bia: ClassVar[Symbol]
+    bid_landscape: ClassVar[Symbol]
+    bid_landscape_disabled: ClassVar[Symbol]
+    bigtop_updates: ClassVar[Symbol]
+    bike_dock: ClassVar[Symbol]
+    bike_lane: ClassVar[Symbol]
+    bike_scooter: ClassVar[Symbol]
+    biotech: ClassVar[Symbol]
+    blanket: ClassVar[Symbol]
+    blender: ClassVar[Symbol]
+    blind: ClassVar[Symbol]
+    blinds: ClassVar[Symbol]
+    blinds_closed: ClassVar[Symbol]
+    block: ClassVar[Symbol]
+    blood_pressure: ClassVar[Symbol]
+    bloodtype: ClassVar[Symbol]
+    bluetooth: ClassVar[Symbol]
+    bluetooth_audio: ClassVar[Symbol]
+    bluetooth_connected: ClassVar[Symbol]
+    bluetooth_disabled: ClassVar[Symbol]
+    bluetooth_drive: ClassVar[Symbol]
+    bluetooth_searching: ClassVar[Symbol]
+    blur_circular: ClassVar[Symbol]
+    blur_linear: ClassVar[Symbol]
+    blur_medium: ClassVar[Symbol]
+    blur_off: ClassVar[Symbol]
+    blur_on: ClassVar[Symbol]
+    blur_short: ClassVar[Symbol]
+    boat_bus: ClassVar[Symbol]
+    boat_railway: ClassVar[Symbol]
+    body_fat: ClassVar[Symbol]
+    body_system: ClassVar[Symbol]
+    bolt: ClassVar[Symbol]
+    bomb: ClassVar[Symbol]
+    book: ClassVar[Symbol]
+    book_2: ClassVar[Symbol]
+    book_3: ClassVar[Symbol]
+    book_4: ClassVar[Symbol]
+    book_5: ClassVar[Symbol]
+    book_6: ClassVar[Symbol]
+    book_online: ClassVar[Symbol]
+    book_ribbon: ClassVar[Symbol]
+    bookmark: ClassVar[Symbol]
+    bookmark_add: ClassVar[Symbol]
+    bookmark_added: ClassVar[Symbol]
+    bookmark_bag: ClassVar[Symbol]
+    bookmark_border: ClassVar[Symbol]
+    bookmark_check: ClassVar[Symbol]
+    bookmark_flag: ClassVar[Symbol]
+    bookmark_heart: ClassVar[Symbol]
+    bookmark_manager: ClassVar[Symbol]
+    bookmark_remove: ClassVar[Symbol]
+    bookmark_star: ClassVar[Symbol]
+    bookmarks: ClassVar[Symbol]
+    books_movies_and_music: ClassVar[Symbol]
+    border_all: ClassVar[Symbol]
+    border_bottom: ClassVar[Symbol]
+    border_clear: ClassVar[Symbol]
+    border_color: ClassVar[Symbol]
+    border_horizontal: ClassVar[Symbol]
+    border_inner: ClassVar[Symbol]
+    border_left: ClassVar[Symbol]
+    border_outer: ClassVar[Symbol]
+    border_right: ClassVar[Symbol]
+    border_style: ClassVar[Symbol]
+    border_top: ClassVar[Symbol]
+    border_vertical: ClassVar[Symbol]
+    borg: ClassVar[Symbol]
+    bottom_app_bar: ClassVar[Symbol]
+    bottom_drawer: ClassVar[Symbol]
+    bottom_navigation: ClassVar[Symbol]
+    bottom_panel_close: ClassVar[Symbol]
+    bottom_panel_open: ClassVar[Symbol]
+    bottom_right_click: ClassVar[Symbol]
+    bottom_sheets: ClassVar[Symbol]
+    box: ClassVar[Symbol]
+    box_add: ClassVar[Symbol]
+    box_edit: ClassVar[Symbol]
+    boy: ClassVar[Symbol]
+    brand_awareness: ClassVar[Symbol]
+    brand_family: ClassVar[Symbol]
+    branding_watermark: ClassVar[Symbol]
+    breakfast_dining: ClassVar[Symbol]
+    breaking_news: ClassVar[Symbol]
+    breaking_news_alt_1: ClassVar[Symbol]
+    breastfeeding: ClassVar[Symbol]
+    brick: ClassVar[Symbol]
+    briefcase_meal: ClassVar[Symbol]
+    brightness_1: ClassVar[Symbol]
+    brightness_2: ClassVar[Symbol]
+    brightness_3: ClassVar[Symbol]
+    brightness_4: ClassVar[Symbol]
+    brightness_5: ClassVar[Symbol]
+    brightness_6: ClassVar[Symbol]
+    brightness_7: ClassVar[Symbol]
+    brightness_alert: ClassVar[Symbol]
+    brightness_auto: ClassVar[Symbol]
+    brightness_empty: ClassVar[Symbol]
+    brightness_high: ClassVar[Symbol]
+    brightness_low: ClassVar[Symbol]
+    brightness_medium: ClassVar[Symbol]
+    bring_your_own_ip: ClassVar[Symbol]
+    broadcast_on_home: ClassVar[Symbol]
+    broadcast_on_personal: ClassVar[Symbol]
+    broken_image: ClassVar[Symbol]
+    browse: ClassVar[Symbol]
+    browse_activity: ClassVar[Symbol]
+    browse_gallery: ClassVar[Symbol]
+    browser_not_supported: ClassVar[Symbol]
+    browser_updated: ClassVar[Symbol]
+    brunch_dining: ClassVar[Symbol]
+    brush: ClassVar[Symbol]
+    bubble: ClassVar[Symbol]
+    bubble_chart: ClassVar[Symbol]
+    bubbles: ClassVar[Symbol]
+    bucket_check: ClassVar[Symbol]
+    bug_report: ClassVar[Symbol]
+    build: ClassVar[Symbol]
+    build_circle: ClassVar[Symbol]
+    bungalow: ClassVar[Symbol]
+    burst_mode: ClassVar[Symbol]
+    bus_alert: ClassVar[Symbol]
+    bus_railway: ClassVar[Symbol]
+    business: ClassVar[Symbol]
+    business_center: ClassVar[Symbol]
+    business_chip: ClassVar[Symbol]
+    business_messages: ClassVar[Symbol]
+    buttons_alt: ClassVar[Symbol]
+    cabin: ClassVar[Symbol]
+    cable: ClassVar[Symbol]
+    cable_car: ClassVar[Symbol]
+    cached: ClassVar[Symbol]
+    cadence: ClassVar[Symbol]
+    cake: ClassVar[Symbol]
+    cake_add: ClassVar[Symbol]
+    calculate: ClassVar[Symbol]
+    calendar_add_on: ClassVar[Symbol]
+    calendar_apps_script: ClassVar[Symbol]
+    calendar_check: ClassVar[Symbol]
+    calendar_clock: ClassVar[Symbol]
+    calendar_lock: ClassVar[Symbol]
+    calendar_meal: ClassVar[Symbol]
+    calendar_meal_2: ClassVar[Symbol]
+    calendar_month: ClassVar[Symbol]
+    calendar_today: ClassVar[Symbol]
+    calendar_view_day: ClassVar[Symbol]
+    calendar_view_month: ClassVar[Symbol]
+    calendar_view_week: ClassVar[Symbol]
+    call: ClassVar[Symbol]
+    call_end: ClassVar[Symbol]
+    call_end_alt: ClassVar[Symbol]
+    call_log: ClassVar[Symbol]
+    call_made: ClassVar[Symbol]
+    call_merge: ClassVar[Symbol]
+    call_missed: ClassVar[Symbol]
+    call_missed_outgoing: ClassVar[Symbol]
+    call_quality: ClassVar[Symbol]
+    call_received: ClassVar[Symbol]
+    call_split: ClassVar[Symbol]
+    call_to_action: ClassVar[Symbol]
+    camera: ClassVar[Symbol]
+    camera_alt: ClassVar[Symbol]
+    camera_enhance: ClassVar[Symbol]
+    camera_front: ClassVar[Symbol]
+    camera_indoor: ClassVar[Symbol]
+    camera_outdoor: ClassVar[Symbol]
+    camera_rear: ClassVar[Symbol]
+    camera_roll: ClassVar[Symbol]
+    camera_video: ClassVar[Symbol]
+    cameraswitch: ClassVar[Symbol]
+    campaign: ClassVar[Symbol]
+    camping: ClassVar[Symbol]
+    cancel: ClassVar[Symbol]
+    cancel_presentation: ClassVar[Symbol]
+    cancel_schedule_send: ClassVar[Symbol]
+    candle: ClassVar[Symbol]
+    candlestick_chart: ClassVar[Symbol]
+    cannabis: ClassVar[Symbol]
+    captive_portal: ClassVar[Symbol]
+    capture: ClassVar[Symbol]
+    car_crash: ClassVar[Symbol]
+    car_defrost_left: ClassVar[Symbol]
+    car_defrost_low_left: ClassVar[Symbol]
+    car_defrost_low_right: ClassVar[Symbol]
+    car_defrost_mid_left: ClassVar[Symbol]
+    car_defrost_mid_low_left: ClassVar[Symbol]
+    car_defrost_mid_low_right: ClassVar[Symbol]
+    car_defrost_mid_right: ClassVar[Symbol]
+    car_defrost_right: ClassVar[Symbol]
+    car_fan_low_left: ClassVar[Symbol]
+    car_fan_low_mid_left: ClassVar[Symbol]
+    car_fan_low_right: ClassVar[Symbol]
+    car_fan_mid_left: ClassVar[Symbol]
+    car_fan_mid_low_right: ClassVar[Symbol]
+    car_fan_mid_right: ClassVar[Symbol]
+    car_fan_recirculate: ClassVar[Symbol]
+    car_gear: ClassVar[Symbol]
+    car_lock: ClassVar[Symbol]
+    car_mirror_heat: ClassVar[Symbol]
+    car_rental: ClassVar[Symbol]
+    car_repair: ClassVar[Symbol]
+    car_tag: ClassVar[Symbol]
+    card_giftcard: ClassVar[Symbol]
+    card_membership: ClassVar[Symbol]
+    card_travel: ClassVar[Symbol]
+    cardio_load: ClassVar[Symbol]
+    cardiology: ClassVar[Symbol]
+    cards: ClassVar[Symbol]
+    cards_star: ClassVar[Symbol]
+    carpenter: ClassVar[Symbol]
+    carry_on_bag: ClassVar[Symbol]
+    carry_on_bag_checked: ClassVar[Symbol]
+    carry_on_bag_inactive: ClassVar[Symbol]
+    carry_on_bag_question: ClassVar[Symbol]
+    cases: ClassVar[Symbol]
+    casino: ClassVar[Symbol]
+    cast: ClassVar[Symbol]
+    cast_connected: ClassVar[Symbol]
+    cast_for_education: ClassVar[Symbol]
+    cast_pause: ClassVar[Symbol]
+    cast_warning: ClassVar[Symbol]
+    castle: ClassVar[Symbol]
+    category: ClassVar[Symbol]
+    category_search: ClassVar[Symbol]
+    celebration: ClassVar[Symbol]
+    cell_merge: ClassVar[Symbol]
+    cell_tower: ClassVar[Symbol]
+    cell_wifi: ClassVar[Symbol]
+    center_focus_strong: ClassVar[Symbol]
+    center_focus_weak: ClassVar[Symbol]
+    chair: ClassVar[Symbol]
+    chair_alt: ClassVar[Symbol]
+    chair_counter: ClassVar[Symbol]
+    chair_fireplace: ClassVar[Symbol]
+    chair_umbrella: ClassVar[Symbol]
+    chalet: ClassVar[Symbol]
+    change_circle: ClassVar[Symbol]
+    change_history: ClassVar[Symbol]
+    charger: ClassVar[Symbol]
+    charging_station: ClassVar[Symbol]
+    chart_data: ClassVar[Symbol]
+    chat: ClassVar[Symbol]
+    chat_add_on: ClassVar[Symbol]
+    chat_apps_script: ClassVar[Symbol]
+    chat_bubble: ClassVar[Symbol]
+    chat_bubble_outline: ClassVar[Symbol]
+    chat_dashed: ClassVar[Symbol]
+    chat_error: ClassVar[Symbol]
+    chat_info: ClassVar[Symbol]
+    chat_paste_go: ClassVar[Symbol]
+    chat_paste_go_2: ClassVar[Symbol]
+    check: ClassVar[Symbol]
+    check_box: ClassVar[Symbol]
+    check_box_outline_blank: ClassVar[Symbol]
+    check_circle: ClassVar[Symbol]
+    check_circle_filled: ClassVar[Symbol]
+    check_circle_outline: ClassVar[Symbol]
+    check_circle_unread: ClassVar[Symbol]
+    check_in_out: ClassVar[Symbol]
+    check_indeterminate_small: ClassVar[Symbol]
+    check_small: ClassVar[Symbol]
+    checkbook: ClassVar[Symbol]
+    checked_bag: ClassVar[Symbol]
+    checked_bag_question: ClassVar[Symbol]
+    checklist: ClassVar[Symbol]
+    checklist_rtl: ClassVar[Symbol]
+    checkroom: ClassVar[Symbol]
+    cheer: ClassVar[Symbol]
+    chef_hat: ClassVar[Symbol]
+    chess: ClassVar[Symbol]
+    chess_bishop: ClassVar[Symbol]
+    chess_bishop_2: ClassVar[Symbol]
+    chess_king: ClassVar[Symbol]
+    chess_king_2: ClassVar[Symbol]
+    chess_knight: ClassVar[Symbol]
+    chess_pawn: ClassVar[Symbol]
+    chess_pawn_2: ClassVar[Symbol]
+    chess_queen: ClassVar[Symbol]
+    chess_rook: ClassVar[Symbol]
+    chevron_backward: ClassVar[Symbol]
+    chevron_forward: ClassVar[Symbol]
+    chevron_left: ClassVar[Symbol]
+    chevron_right: ClassVar[Symbol]
+    child_care: ClassVar[Symbol]
+    child_friendly: ClassVar[Symbol]
+    child_hat: ClassVar[Symbol]
+    chip_extraction: ClassVar[Symbol]
+    chips: ClassVar[Symbol]
+    chrome_reader_mode: ClassVar[Symbol]
+    chromecast_2: ClassVar[Symbol]
+    chromecast_device: ClassVar[Symbol]
+    chronic: ClassVar[Symbol]
+    church: ClassVar[Symbol]
+    cinematic_blur: ClassVar[Symbol]
+    circle: ClassVar[Symbol]
+    circle_notifications: ClassVar[Symbol]
+    circles: ClassVar[Symbol]
+    circles_ext: ClassVar[Symbol]
+    clarify: ClassVar[Symbol]
+    class_: ClassVar[Symbol]
+    clean_hands: ClassVar[Symbol]
+    cleaning: ClassVar[Symbol]
+    cleaning_bucket: ClassVar[Symbol]
+    cleaning_services: ClassVar[Symbol]
+    clear: ClassVar[Symbol]
+    clear_all: ClassVar[Symbol]
+    clear_day: ClassVar[Symbol]
+    clear_night: ClassVar[Symbol]
+    climate_mini_split: ClassVar[Symbol]
+    clinical_notes: ClassVar[Symbol]
+    clock_arrow_down: ClassVar[Symbol]
+    clock_arrow_up: ClassVar[Symbol]
+    clock_loader_10: ClassVar[Symbol]
+    clock_loader_20: ClassVar[Symbol]
+    clock_loader_40: ClassVar[Symbol]
+    clock_loader_60: ClassVar[Symbol]
+    clock_loader_80: ClassVar[Symbol]
+    clock_loader_90: ClassVar[Symbol]
+    close: ClassVar[Symbol]
+    close_fullscreen: ClassVar[Symbol]
+    close_small: ClassVar[Symbol]
+    closed_caption: ClassVar[Symbol]
+    closed_caption_add: ClassVar[Symbol]
+    closed_caption_disabled: ClassVar[Symbol]
+    closed_caption_off: ClassVar[Symbol]
+    cloud: ClassVar[Symbol]
+    cloud_alert: ClassVar[Symbol]
+    cloud_circle: ClassVar[Symbol]
+    cloud_done: ClassVar[Symbol]
+    cloud_download: ClassVar[Symbol]
+    cloud_lock: ClassVar[Symbol]
+    cloud_off: ClassVar[Symbol]
+    cloud_queue: ClassVar[Symbol]
+    cloud_sync: ClassVar[Symbol]
+    cloud_upload: ClassVar[Symbol]
+    cloudy: ClassVar[Symbol]
+    cloudy_filled: ClassVar[Symbol]
+    cloudy_snowing: ClassVar[Symbol]
+    co2: ClassVar[Symbol]
+    co_present: ClassVar[Symbol]
+    code: ClassVar[Symbol]
+    code_blocks: ClassVar[Symbol]
+    code_off: ClassVar[Symbol]
+    coffee: ClassVar[Symbol]
+    coffee_maker: ClassVar[Symbol]
+    cognition: ClassVar[Symbol]
+    cognition_2: ClassVar[Symbol]
+    collapse_all: ClassVar[Symbol]
+    collapse_content: ClassVar[Symbol]
+    collections: ClassVar[Symbol]
+    collections_bookmark: ClassVar[Symbol]
+    color_lens: ClassVar[Symbol]
+    colorize: ClassVar[Symbol]
+    colors: ClassVar[Symbol]
+    combine_columns: ClassVar[Symbol]
+    comedy_mask: ClassVar[Symbol]
+    comic_bubble: ClassVar[Symbol]
+    comment: ClassVar[Symbol]
+    comment_bank: ClassVar[Symbol]
+    comments_disabled: ClassVar[Symbol]
+    commit: ClassVar[Symbol]
+    communication: ClassVar[Symbol]
+    communities: ClassVar[Symbol]
+    communities_filled: ClassVar[Symbol]
+    commute: ClassVar[Symbol]
+    compare: ClassVar[Symbol]
+    compare_arrows: ClassVar[Symbol]
+    compass_calibration: ClassVar[Symbol]
+    component_exchange: ClassVar[Symbol]
+    compost: ClassVar[Symbol]
+    compress: ClassVar[Symbol]
+    computer: ClassVar[Symbol]
+    computer_arrow_up: ClassVar[Symbol]
+    computer_cancel: ClassVar[Symbol]
+    concierge: ClassVar[Symbol]
+    conditions: ClassVar[Symbol]
+    confirmation_number: ClassVar[Symbol]
+    congenital: ClassVar[Symbol]
+    connect_without_contact: ClassVar[Symbol]
+    connected_tv: ClassVar[Symbol]
+    connecting_airports: ClassVar[Symbol]
+    construction: ClassVar[Symbol]
+    contact_emergency: ClassVar[Symbol]
+    contact_mail: ClassVar[Symbol]
+    contact_page: ClassVar[Symbol]
+    contact_phone: ClassVar[Symbol]
+    contact_phone_filled: ClassVar[Symbol]
+    contact_support: ClassVar[Symbol]
+    contactless: ClassVar[Symbol]
+    contactless_off: ClassVar[Symbol]
+    contacts: ClassVar[Symbol]
+    contacts_product: ClassVar[Symbol]
+    content_copy: ClassVar[Symbol]
+    content_cut: ClassVar[Symbol]
+    content_paste: ClassVar[Symbol]
+    content_paste_go: ClassVar[Symbol]
+    content_paste_off: ClassVar[Symbol]
+    content_paste_search: ClassVar[Symbol]
+    contextual_token: ClassVar[Symbol]
+    contextual_token_add: ClassVar[Symbol]
+    contract: ClassVar[Symbol]
+    contract_delete: ClassVar[Symbol]
+    contract_edit: ClassVar[Symbol]
+    contrast: ClassVar[Symbol]
+    contrast_circle: ClassVar[Symbol]
+    contrast_rtl_off: ClassVar[Symbol]
+    contrast_square: ClassVar[Symbol]
+    control_camera: ClassVar[Symbol]
+    control_point: ClassVar[Symbol]
+    control_point_duplicate: ClassVar[Symbol]
+    controller_gen: ClassVar[Symbol]
+    conversation: ClassVar[Symbol]
+    conversion_path: ClassVar[Symbol]
+    conversion_path_off: ClassVar[Symbol]
+    convert_to_text: ClassVar[Symbol]
+    conveyor_belt: ClassVar[Symbol]
+    cookie: ClassVar[Symbol]
+    cookie_off: ClassVar[Symbol]
+    cooking: ClassVar[Symbol]
+    cool_to_dry: ClassVar[Symbol]
+    copy_all: ClassVar[Symbol]
+    copyright: ClassVar[Symbol]
+    coronavirus: ClassVar[Symbol]
+    corporate_fare: ClassVar[Symbol]
+    cottage: ClassVar[Symbol]
+    counter_0: ClassVar[Symbol]
+    counter_1: ClassVar[Symbol]
+    counter_2: ClassVar[Symbol]
+    counter_3: ClassVar[Symbol]
+    counter_4: ClassVar[Symbol]
+    counter_5: ClassVar[Symbol]
+    counter_6: ClassVar[Symbol]
+    counter_7: ClassVar[Symbol]
+    counter_8: ClassVar[Symbol]
+    counter_9: ClassVar[Symbol]
+    countertops: ClassVar[Symbol]
+    create: ClassVar[Symbol]
+    create_new_folder: ClassVar[Symbol]
+    credit_card: ClassVar[Symbol]
+    credit_card_clock: ClassVar[Symbol]
+    credit_card_gear: ClassVar[Symbol]
+    credit_card_heart: ClassVar[Symbol]
+    credit_card_off: ClassVar[Symbol]
+    credit_score: ClassVar[Symbol]
+    crib: ClassVar[Symbol]
+    crisis_alert: ClassVar[Symbol]
+    crop: ClassVar[Symbol]
+    crop_16_9: ClassVar[Symbol]
+    crop_3_2: ClassVar[Symbol]
+    crop_5_4: ClassVar[Symbol]
+    crop_7_5: ClassVar[Symbol]
+    crop_9_16: ClassVar[Symbol]
+    crop_din: ClassVar[Symbol]
+    crop_free: ClassVar[Symbol]
+    crop_landscape: ClassVar[Symbol]
+    crop_original: ClassVar[Symbol]
+    crop_portrait: ClassVar[Symbol]
+    crop_rotate: ClassVar[Symbol]
+    crop_square: ClassVar[Symbol]
+    crossword: ClassVar[Symbol]
+    crowdsource: ClassVar[Symbol]
+    crown: ClassVar[Symbol]
+    cruelty_free: ClassVar[Symbol]
+    css: ClassVar[Symbol]
+    csv: ClassVar[Symbol]
+    currency_bitcoin: ClassVar[Symbol]
+    currency_exchange: ClassVar[Symbol]
+    currency_franc: ClassVar[Symbol]
+    currency_lira: ClassVar[Symbol]
+    currency_pound: ClassVar[Symbol]
+    currency_ruble: ClassVar[Symbol]
+    currency_rupee: ClassVar[Symbol]
+    currency_rupee_circle: ClassVar[Symbol]
+    currency_yen: ClassVar[Symbol]
+    currency_yuan: ClassVar[Symbol]
+    curtains: ClassVar[Symbol]
+    curtains_closed: ClassVar[Symbol]
+    custom_typography: ClassVar[Symbol]
+    cut: ClassVar[Symbol]
+    cycle: ClassVar[Symbol]
+    cyclone: ClassVar[Symbol]
+    dangerous: ClassVar[Symbol]
+    dark_mode: ClassVar[Symbol]
+    dashboard: ClassVar[Symbol]
+    dashboard_2: ClassVar[Symbol]
+    dashboard_customize: ClassVar[Symbol]
+    data_alert: ClassVar[Symbol]
+    data_array: ClassVar[Symbol]
+    data_check: ClassVar[Symbol]
+    data_exploration: ClassVar[Symbol]
+    data_info_alert: ClassVar[Symbol]
+    data_loss_prevention: ClassVar[Symbol]
+    data_object: ClassVar[Symbol]
+    data_saver_off: ClassVar[Symbol]
+    data_saver_on: ClassVar[Symbol]
+    data_table: ClassVar[Symbol]
+    data_thresholding: ClassVar[Symbol]
+    data_usage: ClassVar[Symbol]
+    database: ClassVar[Symbol]
+    database_off: ClassVar[Symbol]
+    database_search: ClassVar[Symbol]
+    database_upload: ClassVar[Symbol]
+    dataset: ClassVar[Symbol]
+    dataset_linked: ClassVar[Symbol]
+    date_range: ClassVar[Symbol]
+    deblur: ClassVar[Symbol]
+    deceased: ClassVar[Symbol]
+    decimal_decrease: ClassVar[Symbol]
+    decimal_increase: ClassVar[Symbol]
+    deck: ClassVar[Symbol]
+    dehaze: ClassVar[Symbol]
+    delete: ClassVar[Symbol]
+    delete_forever: ClassVar[Symbol]
+    delete_history: ClassVar[Symbol]
+    delete_outline: ClassVar[Symbol]
+    delete_sweep: ClassVar[Symbol]
+    delivery_dining: ClassVar[Symbol]
+    delivery_truck_bolt: ClassVar[Symbol]
+    delivery_truck_speed: ClassVar[Symbol]
+    demography: ClassVar[Symbol]
+    density_large: ClassVar[Symbol]
+    density_medium: ClassVar[Symbol]
+    density_small: ClassVar[Symbol]
+    dentistry: ClassVar[Symbol]
+    departure_board: ClassVar[Symbol]
+    deployed_code: ClassVar[Symbol]
+    deployed_code_account: ClassVar[Symbol]
+    deployed_code_alert: ClassVar[Symbol]
+    deployed_code_history: ClassVar[Symbol]
+    deployed_code_update: ClassVar[Symbol]
+    dermatology: ClassVar[Symbol]
+    description: ClassVar[Symbol]
+    deselect: ClassVar[Symbol]
+    design_services: ClassVar[Symbol]
+    desk: ClassVar[Symbol]
+    deskphone: ClassVar[Symbol]
+    desktop_access_disabled: ClassVar[Symbol]
+    desktop_cloud: ClassVar[Symbol]
+    desktop_cloud_stack: ClassVar[Symbol]
+    desktop_landscape: ClassVar[Symbol]
+    desktop_landscape_add: ClassVar[Symbol]
+    desktop_mac: ClassVar[Symbol]
+    desktop_portrait: ClassVar[Symbol]
+    desktop_windows: ClassVar[Symbol]
+    destruction: ClassVar[Symbol]
+    details: ClassVar[Symbol]
+    detection_and_zone: ClassVar[Symbol]
+    detector: ClassVar[Symbol]
+    detector_alarm: ClassVar[Symbol]
+    detector_battery: ClassVar[Symbol]
+    detector_co: ClassVar[Symbol]
+    detector_offline: ClassVar[Symbol]
+    detector_smoke: ClassVar[Symbol]
+    detector_status: ClassVar[Symbol]
+    developer_board: ClassVar[Symbol]
+    developer_board_off: ClassVar[Symbol]
+    developer_guide: ClassVar[Symbol]
+    developer_mode: ClassVar[Symbol]
+    developer_mode_tv: ClassVar[Symbol]
+    device_band: ClassVar[Symbol]
+    device_hub: ClassVar[Symbol]
+    device_reset: ClassVar[Symbol]
+    device_thermostat: ClassVar[Symbol]
+    device_unknown: ClassVar[Symbol]
+    devices: ClassVar[Symbol]
+    devices_fold: ClassVar[Symbol]
+    devices_fold_2: ClassVar[Symbol]
+    devices_off: ClassVar[Symbol]
+    devices_other: ClassVar[Symbol]
+    devices_wearables: ClassVar[Symbol]
+    dew_point: ClassVar[Symbol]
+    diagnosis: ClassVar[Symbol]
+    diagonal_line: ClassVar[Symbol]
+    dialer_sip: ClassVar[Symbol]
+    dialogs: ClassVar[Symbol]
+    dialpad: ClassVar[Symbol]
+    diamond: ClassVar[Symbol]
+    diamond_shine: ClassVar[Symbol]
+    dictionary: ClassVar[Symbol]
+    difference: ClassVar[Symbol]
+    digital_out_of_home: ClassVar[Symbol]
+    digital_wellbeing: ClassVar[Symbol]
+    dine_heart: ClassVar[Symbol]
+    dine_in: ClassVar[Symbol]
+    dine_lamp: ClassVar[Symbol]
+    dining: ClassVar[Symbol]
+    dinner_dining: ClassVar[Symbol]
+    directions: ClassVar[Symbol]
+    directions_alt: ClassVar[Symbol]
+    directions_alt_off: ClassVar[Symbol]
+    directions_bike: ClassVar[Symbol]
+    directions_boat: ClassVar[Symbol]
+    directions_boat_filled: ClassVar[Symbol]
+    directions_bus: ClassVar[Symbol]
+    directions_bus_filled: ClassVar[Symbol]
+    directions_car: ClassVar[Symbol]
+    directions_car_filled: ClassVar[Symbol]
+    directions_off: ClassVar[Symbol]
+    directions_railway: ClassVar[Symbol]
+    directions_railway_2: ClassVar[Symbol]
+    directions_railway_filled: ClassVar[Symbol]
+    directions_run: ClassVar[Symbol]
+    directions_subway: ClassVar[Symbol]
+    directions_subway_filled: ClassVar[Symbol]
+    directions_transit: ClassVar[Symbol]
+    directions_transit_filled: ClassVar[Symbol]
+    directions_walk: ClassVar[Symbol]
+    directory_sync: ClassVar[Symbol]
+    dirty_lens: ClassVar[Symbol]
+    disabled_by_default: ClassVar[Symbol]
+    disabled_visible: ClassVar[Symbol]
+    disc_full: ClassVar[Symbol]
+    discover_tune: ClassVar[Symbol]
+    dishwasher: ClassVar[Symbol]
+    dishwasher_gen: ClassVar[Symbol]
+    display_external_input: ClassVar[Symbol]
+    display_settings: ClassVar[Symbol]
+    distance: ClassVar[Symbol]
+    diversity_1: ClassVar[Symbol]
+    diversity_2: ClassVar[Symbol]
+    diversity_3: ClassVar[Symbol]
+    diversity_4: ClassVar[Symbol]
+    dns: ClassVar[Symbol]
+    do_disturb: ClassVar[Symbol]
+    do_disturb_alt: ClassVar[Symbol]
+    do_disturb_off: ClassVar[Symbol]
+    do_disturb_on: ClassVar[Symbol]
+    do_not_disturb: ClassVar[Symbol]
+    do_not_disturb_alt: ClassVar[Symbol]
+    do_not_disturb_off: ClassVar[Symbol]
+    do_not_disturb_on: ClassVar[Symbol]
+    do_not_disturb_on_total_silence: ClassVar[Symbol]
+    do_not_step: ClassVar[Symbol]
+    do_not_touch: ClassVar[Symbol]
+    dock: ClassVar[Symbol]
+    dock_to_bottom: ClassVar[Symbol]
+    dock_to_left: ClassVar[Symbol]
+    dock_to_right: ClassVar[Symbol]
+    docs: ClassVar[Symbol]
+    docs_add_on: ClassVar[Symbol]
+    docs_apps_script: ClassVar[Symbol]
+    document_scanner: ClassVar[Symbol]
+    document_search: ClassVar[Symbol]
+    domain: ClassVar[Symbol]
+    domain_add: ClassVar[Symbol]
+    domain_disabled: ClassVar[Symbol]
+    domain_verification: ClassVar[Symbol]
+    domain_verification_off: ClassVar[Symbol]
+    domino_mask: ClassVar[Symbol]
+    done: ClassVar[Symbol]
+    done_all: ClassVar[Symbol]
+    done_outline: ClassVar[Symbol]
+    donut_large: ClassVar[Symbol]
+    donut_small: ClassVar[Symbol]
+    door_back: ClassVar[Symbol]
+    door_front: ClassVar[Symbol]
+    door_open: ClassVar[Symbol]
+    door_sensor: ClassVar[Symbol]
+    door_sliding: ClassVar[Symbol]
+    doorbell: ClassVar[Symbol]
+    doorbell_3p: ClassVar[Symbol]
+    doorbell_chime: ClassVar[Symbol]
+    double_arrow: ClassVar[Symbol]
+    downhill_skiing: ClassVar[Symbol]
+    download: ClassVar[Symbol]
+    download_2: ClassVar[Symbol]
+    download_done: ClassVar[Symbol]
+    download_for_offline: ClassVar[Symbol]
+    downloading: ClassVar[Symbol]
+    draft: ClassVar[Symbol]
+    draft_orders: ClassVar[Symbol]
+    drafts: ClassVar[Symbol]
+    drag_click: ClassVar[Symbol]
+    drag_handle: ClassVar[Symbol]
+    drag_indicator: ClassVar[Symbol]
+    drag_pan: ClassVar[Symbol]
+    draw: ClassVar[Symbol]
+    draw_abstract: ClassVar[Symbol]
+    draw_collage: ClassVar[Symbol]
+    drawing_recognition: ClassVar[Symbol]
+    dresser: ClassVar[Symbol]
+    drive_eta: ClassVar[Symbol]
+    drive_export: ClassVar[Symbol]
+    drive_file_move: ClassVar[Symbol]
+    drive_file_move_outline: ClassVar[Symbol]
+    drive_file_move_rtl: ClassVar[Symbol]
+    drive_file_rename_outline: ClassVar[Symbol]
+    drive_folder_upload: ClassVar[Symbol]
+    drive_fusiontable: ClassVar[Symbol]
+    drone: ClassVar[Symbol]
+    drone_2: ClassVar[Symbol]
+    dropdown: ClassVar[Symbol]
+    dropper_eye: ClassVar[Symbol]
+    dry: ClassVar[Symbol]
+    dry_cleaning: ClassVar[Symbol]
+    dual_screen: ClassVar[Symbol]
+    duo: ClassVar[Symbol]
+    dvr: ClassVar[Symbol]
+    dynamic_feed: ClassVar[Symbol]
+    dynamic_form: ClassVar[Symbol]
+    e911_avatar: ClassVar[Symbol]
+    e911_emergency: ClassVar[Symbol]
+    e_mobiledata: ClassVar[Symbol]
+    e_mobiledata_badge: ClassVar[Symbol]
+    ear_sound: ClassVar[Symbol]
+    earbud_case: ClassVar[Symbol]
+    earbud_left: ClassVar[Symbol]
+    earbud_right: ClassVar[Symbol]
+    earbuds: ClassVar[Symbol]
+    earbuds_2: ClassVar[Symbol]
+    earbuds_battery: ClassVar[Symbol]
+    early_on: ClassVar[Symbol]
+    earthquake: ClassVar[Symbol]
+    east: ClassVar[Symbol]
+    ecg: ClassVar[Symbol]
+    ecg_heart: ClassVar[Symbol]
+    eco: ClassVar[Symbol]
+    eda: ClassVar[Symbol]
+    edgesensor_high: ClassVar[Symbol]
+    edgesensor_low: ClassVar[Symbol]
+    edit: ClassVar[Symbol]
+    edit_arrow_down: ClassVar[Symbol]
+    edit_arrow_up: ClassVar[Symbol]
+    edit_attributes: ClassVar[Symbol]
+    edit_audio: ClassVar[Symbol]
+    edit_calendar: ClassVar[Symbol]
+    edit_document: ClassVar[Symbol]
+    edit_location: ClassVar[Symbol]
+    edit_location_alt: ClassVar[Symbol]
+    edit_note: ClassVar[Symbol]
+    edit_notifications: ClassVar[Symbol]
+    edit_off: ClassVar[Symbol]
+    edit_road: ClassVar[Symbol]
+    edit_square: ClassVar[Symbol]
+    editor_choice: ClassVar[Symbol]
+    egg: ClassVar[Symbol]
+    egg_alt: ClassVar[Symbol]
+    eject: ClassVar[Symbol]
+    elderly: ClassVar[Symbol]
+    elderly_woman: ClassVar[Symbol]
+    electric_bike: ClassVar[Symbol]
+    electric_bolt: ClassVar[Symbol]
+    electric_car: ClassVar[Symbol]
+    electric_meter: ClassVar[Symbol]
+    electric_moped: ClassVar[Symbol]
+    electric_rickshaw: ClassVar[Symbol]
+    electric_scooter: ClassVar[Symbol]
+    electrical_services: ClassVar[Symbol]
+    elevation: ClassVar[Symbol]
+    elevator: ClassVar[Symbol]
+    email: ClassVar[Symbol]
+    emergency: ClassVar[Symbol]
+    emergency_heat: ClassVar[Symbol]
+    emergency_heat_2: ClassVar[Symbol]
+    emergency_home: ClassVar[Symbol]
+    emergency_recording: ClassVar[Symbol]
+    emergency_share: ClassVar[Symbol]
+    emergency_share_off: ClassVar[Symbol]
+    emoji_emotions: ClassVar[Symbol]
+    emoji_events: ClassVar[Symbol]
+    emoji_flags: ClassVar[Symbol]
+    emoji_food_beverage: ClassVar[Symbol]
+    emoji_language: ClassVar[Symbol]
+    emoji_nature: ClassVar[Symbol]
+    emoji_objects: ClassVar[Symbol]
+    emoji_people: ClassVar[Symbol]
+    emoji_symbols: ClassVar[Symbol]
+    emoji_transportation: ClassVar[Symbol]
+    emoticon: ClassVar[Symbol]
+    empty_dashboard: ClassVar[Symbol]
+    enable: ClassVar[Symbol]
+    encrypted: ClassVar[Symbol]
+    encrypted_add: ClassVar[Symbol]
+    encrypted_add_circle: ClassVar[Symbol]
+    encrypted_minus_circle: ClassVar[Symbol]
+    encrypted_off: ClassVar[Symbol]
+    endocrinology: ClassVar[Symbol]
+    energy: ClassVar[Symbol]
+    energy_program_saving: ClassVar[Symbol]
+    energy_program_time_used: ClassVar[Symbol]
+    energy_savings_leaf: ClassVar[Symbol]
+    engineering: ClassVar[Symbol]
+    enhanced_encryption: ClassVar[Symbol]
+    ent: ClassVar[Symbol]
+    enterprise: ClassVar[Symbol]
+    enterprise_off: ClassVar[Symbol]
+    equal: ClassVar[Symbol]
+    equalizer: ClassVar[Symbol]
+    eraser_size_1: ClassVar[Symbol]
+    eraser_size_2: ClassVar[Symbol]
+    eraser_size_3: ClassVar[Symbol]
+    eraser_size_4: ClassVar[Symbol]
+    eraser_size_5: ClassVar[Symbol]
+    error: ClassVar[Symbol]
+    error_circle_rounded: ClassVar[Symbol]
+    error_med: ClassVar[Symbol]
+    error_outline: ClassVar[Symbol]
+    escalator: ClassVar[Symbol]
+    escalator_warning: ClassVar[Symbol]
+    euro: ClassVar[Symbol]
+    euro_symbol: ClassVar[Symbol]
+    ev_charger: ClassVar[Symbol]
+    ev_mobiledata_badge: ClassVar[Symbol]
+    ev_shadow: ClassVar[Symbol]
+    ev_shadow_add: ClassVar[Symbol]
+    ev_shadow_minus: ClassVar[Symbol]
+    ev_station: ClassVar[Symbol]
+    event: ClassVar[Symbol]
+    event_available: ClassVar[Symbol]
+    event_busy: ClassVar[Symbol]
+    event_list: ClassVar[Symbol]
+    event_note: ClassVar[Symbol]
+    event_repeat: ClassVar[Symbol]
+    event_seat: ClassVar[Symbol]
+    event_upcoming: ClassVar[Symbol]
+    exclamation: ClassVar[Symbol]
+    exercise: ClassVar[Symbol]
+    exit_to_app: ClassVar[Symbol]
+    expand: ClassVar[Symbol]
+    expand_all: ClassVar[Symbol]
+    expand_circle_down: ClassVar[Symbol]
+    expand_circle_right: ClassVar[Symbol]
+    expand_circle_up: ClassVar[Symbol]
+    expand_content: ClassVar[Symbol]
+    expand_less: ClassVar[Symbol]
+    expand_more: ClassVar[Symbol]
+    expansion_panels: ClassVar[Symbol]
+    expension_panels: ClassVar[Symbol]
+    experiment: ClassVar[Symbol]
+    explicit: ClassVar[Symbol]
+    explore: ClassVar[Symbol]
+    explore_nearby: ClassVar[Symbol]
+    explore_off: ClassVar[Symbol]
+    explosion: ClassVar[Symbol]
+    export_notes: ClassVar[Symbol]
+    exposure: ClassVar[Symbol]
+    exposure_neg_1: ClassVar[Symbol]
+    exposure_neg_2: ClassVar[Symbol]
+    exposure_plus_1: ClassVar[Symbol]
+    exposure_plus_2: ClassVar[Symbol]
+    exposure_zero: ClassVar[Symbol]
+    extension: ClassVar[Symbol]
+    extension_off: ClassVar[Symbol]
+    eye_tracking: ClassVar[Symbol]
+    eyeglasses: ClassVar[Symbol]
+    eyeglasses_2: ClassVar[Symbol]
+    eyeglasses_2_sound: ClassVar[Symbol]
+    face: ClassVar[Symbol]
+    face_2: ClassVar[Symbol]
+    face_3: ClassVar[Symbol]
+    face_4: ClassVar[Symbol]
+    face_5: ClassVar[Symbol]
+    face_6: ClassVar[Symbol]
+    face_down: ClassVar[Symbol]
+    face_left: ClassVar[Symbol]
+    face_nod: ClassVar[Symbol]
+    face_retouching_natural: ClassVar[Symbol]
+    face_retouching_off: ClassVar[Symbol]
+    face_right: ClassVar[Symbol]
+    face_shake: ClassVar[Symbol]
+    face_unlock: ClassVar[Symbol]
+    face_up: ClassVar[Symbol]
+    fact_check: ClassVar[Symbol]
+    factory: ClassVar[Symbol]
+    falling: ClassVar[Symbol]
+    familiar_face_and_zone: ClassVar[Symbol]
+    family_group: ClassVar[Symbol]
+    family_history: ClassVar[Symbol]
+    family_home: ClassVar[Symbol]
+    family_link: ClassVar[Symbol]
+    family_restroom: ClassVar[Symbol]
+    family_star: ClassVar[Symbol]
+    fan_focus: ClassVar[Symbol]
+    fan_indirect: ClassVar[Symbol]
+    farsight_digital: ClassVar[Symbol]
+    fast_forward: ClassVar[Symbol]
+    fast_rewind: ClassVar[Symbol]
+    fastfood: ClassVar[Symbol]
+    faucet: ClassVar[Symbol]
+    favorite: ClassVar[Symbol]
+    favorite_border: ClassVar[Symbol]
+    fax: ClassVar[Symbol]
+    feature_search: ClassVar[Symbol]
+    featured_play_list: ClassVar[Symbol]
+    featured_seasonal_and_gifts: ClassVar[Symbol]
+    featured_video: ClassVar[Symbol]
+    feed: ClassVar[Symbol]
+    feedback: ClassVar[Symbol]
+    female: ClassVar[Symbol]
+    femur: ClassVar[Symbol]
+    femur_alt: ClassVar[Symbol]
+    fence: ClassVar[Symbol]
+    fertile: ClassVar[Symbol]
+    festival: ClassVar[Symbol]
+    fiber_dvr: ClassVar[Symbol]
+    fiber_manual_record: ClassVar[Symbol]
+    fiber_new: ClassVar[Symbol]
+    fiber_pin: ClassVar[Symbol]
+    fiber_smart_record: ClassVar[Symbol]
+    file_copy: ClassVar[Symbol]
+    file_copy_off: ClassVar[Symbol]
+    file_download: ClassVar[Symbol]
+    file_download_done: ClassVar[Symbol]
+    file_download_off: ClassVar[Symbol]
+    file_export: ClassVar[Symbol]
+    file_json: ClassVar[Symbol]
+    file_map: ClassVar[Symbol]
+    file_map_stack: ClassVar[Symbol]
+    file_open: ClassVar[Symbol]
+    file_png: ClassVar[Symbol]
+    file_present: ClassVar[Symbol]
+    file_save: ClassVar[Symbol]
+    file_save_off: ClassVar[Symbol]
+    file_upload: ClassVar[Symbol]
+    file_upload_off: ClassVar[Symbol]
+    files: ClassVar[Symbol]
+    filter: ClassVar[Symbol]
+    filter_1: ClassVar[Symbol]
+    filter_2: ClassVar[Symbol]
+    filter_3: ClassVar[Symbol]
+    filter_4: ClassVar[Symbol]
+    filter_5: ClassVar[Symbol]
+    filter_6: ClassVar[Symbol]
+    filter_7: ClassVar[Symbol]
+    filter_8: ClassVar[Symbol]
+    filter_9: ClassVar[Symbol]
+    filter_9_plus: ClassVar[Symbol]
+    filter_alt: ClassVar[Symbol]
+    filter_alt_off: ClassVar[Symbol]
+    filter_arrow_right: ClassVar[Symbol]
+    filter_b_and_w: ClassVar[Symbol]
+    filter_center_focus: ClassVar[Symbol]
+    filter_drama: ClassVar[Symbol]
+    filter_frames: ClassVar[Symbol]
+    filter_hdr: ClassVar[Symbol]
+    filter_list: ClassVar[Symbol]
+    filter_list_alt: ClassVar[Symbol]
+    filter_list_off: ClassVar[Symbol]
+    filter_none: ClassVar[Symbol]
+    filter_retrolux: ClassVar[Symbol]
+    filter_tilt_shift: ClassVar[Symbol]
+    filter_vintage: ClassVar[Symbol]
+    finance: ClassVar[Symbol]
+    finance_chip: ClassVar[Symbol]
+    finance_mode: ClassVar[Symbol]
+    find_in_page: ClassVar[Symbol]
+    find_replace: ClassVar[Symbol]
+    fingerprint: ClassVar[Symbol]
+    fingerprint_off: ClassVar[Symbol]
+    fire_extinguisher: ClassVar[Symbol]
+    fire_hydrant: ClassVar[Symbol]
+    fire_truck: ClassVar[Symbol]
+    fireplace: ClassVar[Symbol]
+    first_page: ClassVar[Symbol]
+    fit_page: ClassVar[Symbol]
+    fit_page_height: ClassVar[Symbol]
+    fit_page_width: ClassVar[Symbol]
+    fit_screen: ClassVar[Symbol]
+    fit_width: ClassVar[Symbol]
+    fitness_center: ClassVar[Symbol]
+    fitness_tracker: ClassVar[Symbol]
+    fitness_trackers: ClassVar[Symbol]
+    flag: ClassVar[Symbol]
+    flag_2: ClassVar[Symbol]
+    flag_check: ClassVar[Symbol]
+    flag_circle: ClassVar[Symbol]
+    flag_filled: ClassVar[Symbol]
+    flaky: ClassVar[Symbol]
+    flare: ClassVar[Symbol]
+    flash_auto: ClassVar[Symbol]
+    flash_off: ClassVar[Symbol]
+    flash_on: ClassVar[Symbol]
+    flashlight_off: ClassVar[Symbol]
+    flashlight_on: ClassVar[Symbol]
+    flatware: ClassVar[Symbol]
+    flex_direction: ClassVar[Symbol]
+    flex_no_wrap: ClassVar[Symbol]
+    flex_wrap: ClassVar[Symbol]
+    flight: ClassVar[Symbol]
+    flight_class: ClassVar[Symbol]
+    flight_land: ClassVar[Symbol]
+    flight_takeoff: ClassVar[Symbol]
+    flights_and_hotels: ClassVar[Symbol]
+    flightsmode: ClassVar[Symbol]
+    flip: ClassVar[Symbol]
+    flip_camera_android: ClassVar[Symbol]
+    flip_camera_ios: ClassVar[Symbol]
+    flip_to_back: ClassVar[Symbol]
+    flip_to_front: ClassVar[Symbol]
+    float_landscape_2: ClassVar[Symbol]
+    float_portrait_2: ClassVar[Symbol]
+    flood: ClassVar[Symbol]
+    floor: ClassVar[Symbol]
+    floor_lamp: ClassVar[Symbol]
+    flourescent: ClassVar[Symbol]
+    flowchart: ClassVar[Symbol]
+    flowsheet: ClassVar[Symbol]
+    fluid: ClassVar[Symbol]
+    fluid_balance: ClassVar[Symbol]
+    fluid_med: ClassVar[Symbol]
+    fluorescent: ClassVar[Symbol]
+    flutter: ClassVar[Symbol]
+    flutter_dash: ClassVar[Symbol]
+    flyover: ClassVar[Symbol]
+    fmd_bad: ClassVar[Symbol]
+    fmd_good: ClassVar[Symbol]
+    foggy: ClassVar[Symbol]
+    folded_hands: ClassVar[Symbol]
+    folder: ClassVar[Symbol]
+    folder_check: ClassVar[Symbol]
+    folder_check_2: ClassVar[Symbol]
+    folder_code: ClassVar[Symbol]
+    folder_copy: ClassVar[Symbol]
+    folder_data: ClassVar[Symbol]
+    folder_delete: ClassVar[Symbol]
+    folder_eye: ClassVar[Symbol]
+    folder_info: ClassVar[Symbol]
+    folder_limited: ClassVar[Symbol]
+    folder_managed: ClassVar[Symbol]
+    folder_match: ClassVar[Symbol]
+    folder_off: ClassVar[Symbol]
+    folder_open: ClassVar[Symbol]
+    folder_shared: ClassVar[Symbol]
+    folder_special: ClassVar[Symbol]
+    folder_supervised: ClassVar[Symbol]
+    folder_zip: ClassVar[Symbol]
+    follow_the_signs: ClassVar[Symbol]
+    font_download: ClassVar[Symbol]
+    font_download_off: ClassVar[Symbol]
+    food_bank: ClassVar[Symbol]
+    foot_bones: ClassVar[Symbol]
+    footprint: ClassVar[Symbol]
+    for_you: ClassVar[Symbol]
+    forest: ClassVar[Symbol]
+    fork_left: ClassVar[Symbol]
+    fork_right: ClassVar[Symbol]
+    fork_spoon: ClassVar[Symbol]
+    forklift: ClassVar[Symbol]
+    format_align_center: ClassVar[Symbol]
+    format_align_justify: ClassVar[Symbol]
+    format_align_left: ClassVar[Symbol]
+    format_align_right: ClassVar[Symbol]
+    format_bold: ClassVar[Symbol]
+    format_clear: ClassVar[Symbol]
+    format_color_fill: ClassVar[Symbol]
+    format_color_reset: ClassVar[Symbol]
+    format_color_text: ClassVar[Symbol]
+    format_h1: ClassVar[Symbol]
+    format_h2: ClassVar[Symbol]
+    format_h3: ClassVar[Symbol]
+    format_h4: ClassVar[Symbol]
+    format_h5: ClassVar[Symbol]
+    format_h6: ClassVar[Symbol]
+    format_image_left: ClassVar[Symbol]
+    format_image_right: ClassVar[Symbol]
+    format_indent_decrease: ClassVar[Symbol]
+    format_indent_increase: ClassVar[Symbol]
+    format_ink_highlighter: ClassVar[Symbol]
+    format_italic: ClassVar[Symbol]
+    format_letter_spacing: ClassVar[Symbol]
+    format_letter_spacing_2: ClassVar[Symbol]
+    format_letter_spacing_standard: ClassVar[Symbol]
+    format_letter_spacing_wide: ClassVar[Symbol]
+    format_letter_spacing_wider: ClassVar[Symbol]
+    format_line_spacing: ClassVar[Symbol]
+    format_list_bulleted: ClassVar[Symbol]
+    format_list_bulleted_add: ClassVar[Symbol]
+    format_list_numbered: ClassVar[Symbol]
+    format_list_numbered_rtl: ClassVar[Symbol]
+    format_overline: ClassVar[Symbol]
+    format_paint: ClassVar[Symbol]
+    format_paragraph: ClassVar[Symbol]
+    format_quote: ClassVar[Symbol]
+    format_quote_off: ClassVar[Symbol]
+    format_shapes: ClassVar[Symbol]
+    format_size: ClassVar[Symbol]
+    format_strikethrough: ClassVar[Symbol]
+    format_text_clip: ClassVar[Symbol]
+    format_text_overflow: ClassVar[Symbol]
+    format_text_wrap: ClassVar[Symbol]
+    format_textdirection_l_to_r: ClassVar[Symbol]
+    format_textdirection_r_to_l: ClassVar[Symbol]
+    format_textdirection_vertical: ClassVar[Symbol]
+    format_underlined: ClassVar[Symbol]
+    format_underlined_squiggle: ClassVar[Symbol]
+    forms_add_on: ClassVar[Symbol]
+    forms_apps_script: ClassVar[Symbol]
+    fort: ClassVar[Symbol]
+    forum: ClassVar[Symbol]
+    forward: ClassVar[Symbol]
+    forward_10: ClassVar[Symbol]
+    forward_30: ClassVar[Symbol]
+    forward_5: ClassVar[Symbol]
+    forward_circle: ClassVar[Symbol]
+    forward_media: ClassVar[Symbol]
+    forward_to_inbox: ClassVar[Symbol]
+    foundation: ClassVar[Symbol]
+    fragrance: ClassVar[Symbol]
+    frame_bug: ClassVar[Symbol]
+    frame_exclamation: ClassVar[Symbol]
+    frame_inspect: ClassVar[Symbol]
+    frame_person: ClassVar[Symbol]
+    frame_person_mic: ClassVar[Symbol]
+    frame_person_off: ClassVar[Symbol]
+    frame_reload: ClassVar[Symbol]
+    frame_source: ClassVar[Symbol]
+    free_breakfast: ClassVar[Symbol]
+    free_cancellation: ClassVar[Symbol]
+    front_hand: ClassVar[Symbol]
+    front_loader: ClassVar[Symbol]
+    full_coverage: ClassVar[Symbol]
+    full_hd: ClassVar[Symbol]
+    full_stacked_bar_chart: ClassVar[Symbol]
+    fullscreen: ClassVar[Symbol]
+    fullscreen_exit: ClassVar[Symbol]
+    fullscreen_portrait: ClassVar[Symbol]
+    function: ClassVar[Symbol]
+    functions: ClassVar[Symbol]
+    funicular: ClassVar[Symbol]
+    g_mobiledata: ClassVar[Symbol]
+    g_mobiledata_badge: ClassVar[Symbol]
+    g_translate: ClassVar[Symbol]
+    gallery_thumbnail: ClassVar[Symbol]
+    gamepad: ClassVar[Symbol]
+    games: ClassVar[Symbol]
+    garage: ClassVar[Symbol]
+    garage_check: ClassVar[Symbol]
+    garage_door: ClassVar[Symbol]
+    garage_home: ClassVar[Symbol]
+    garage_money: ClassVar[Symbol]
+    garden_cart: ClassVar[Symbol]
+    gas_meter: ClassVar[Symbol]
+    gastroenterology: ClassVar[Symbol]
+    gate: ClassVar[Symbol]
+    gavel: ClassVar[Symbol]
+    general_device: ClassVar[Symbol]
+    generating_tokens: ClassVar[Symbol]
+    genetics: ClassVar[Symbol]
+    genres: ClassVar[Symbol]
+    gesture: ClassVar[Symbol]
+    gesture_select: ClassVar[Symbol]
+    get_app: ClassVar[Symbol]
+    gif: ClassVar[Symbol]
+    gif_2: ClassVar[Symbol]
+    gif_box: ClassVar[Symbol]
+    girl: ClassVar[Symbol]
+    gite: ClassVar[Symbol]
+    glass_cup: ClassVar[Symbol]
+    globe: ClassVar[Symbol]
+    globe_asia: ClassVar[Symbol]
+    globe_book: ClassVar[Symbol]
+    globe_location_pin: ClassVar[Symbol]
+    globe_uk: ClassVar[Symbol]
+    glucose: ClassVar[Symbol]
+    glyphs: ClassVar[Symbol]
+    go_to_line: ClassVar[Symbol]
+    golf_course: ClassVar[Symbol]
+    gondola_lift: ClassVar[Symbol]
+    google_home_devices: ClassVar[Symbol]
+    google_plus_reshare: ClassVar[Symbol]
+    google_tv_remote: ClassVar[Symbol]
+    google_wifi: ClassVar[Symbol]
+    gpp_bad: ClassVar[Symbol]
+    gpp_good: ClassVar[Symbol]
+    gpp_maybe: ClassVar[Symbol]
+    gps_fixed: ClassVar[Symbol]
+    gps_not_fixed: ClassVar[Symbol]
+    gps_off: ClassVar[Symbol]
+    grade: ClassVar[Symbol]
+    gradient: ClassVar[Symbol]
+    grading: ClassVar[Symbol]
+    grain: ClassVar[Symbol]
+    graph_1: ClassVar[Symbol]
+    graph_2: ClassVar[Symbol]
+    graph_3: ClassVar[Symbol]
+    graph_4: ClassVar[Symbol]
+    graph_5: ClassVar[Symbol]
+    graph_6: ClassVar[Symbol]
+    graph_7: ClassVar[Symbol]
+    graphic_eq: ClassVar[Symbol]
+    grass: ClassVar[Symbol]
+    grid_3x3: ClassVar[Symbol]
+    grid_3x3_off: ClassVar[Symbol]
+    grid_4x4: ClassVar[Symbol]
+    grid_goldenratio: ClassVar[Symbol]
+    grid_guides: ClassVar[Symbol]
+    grid_off: ClassVar[Symbol]
+    grid_on: ClassVar[Symbol]
+    grid_view: ClassVar[Symbol]
+    grocery: ClassVar[Symbol]
+    group: ClassVar[Symbol]
+    group_add: ClassVar[Symbol]
+    group_off: ClassVar[Symbol]
+    group_remove: ClassVar[Symbol]
+    group_search: ClassVar[Symbol]
+    group_work: ClassVar[Symbol]
+    grouped_bar_chart: ClassVar[Symbol]
+    groups: ClassVar[Symbol]
+    groups_2: ClassVar[Symbol]
+    groups_3: ClassVar[Symbol]
+    guardian: ClassVar[Symbol]
+    gynecology: ClassVar[Symbol]
+    h_mobiledata: ClassVar[Symbol]
+    h_mobiledata_badge: ClassVar[Symbol]
+    h_plus_mobiledata: ClassVar[Symbol]
+    h_plus_mobiledata_badge: ClassVar[Symbol]
+    hail: ClassVar[Symbol]
+    hallway: ClassVar[Symbol]
+    hanami_dango: ClassVar[Symbol]
+    hand_bones: ClassVar[Symbol]
+    hand_gesture: ClassVar[Symbol]
+    hand_gesture_off: ClassVar[Symbol]
+    hand_meal: ClassVar[Symbol]
+    hand_package: ClassVar[Symbol]
+    handheld_controller: ClassVar[Symbol]
+    handshake: ClassVar[Symbol]
+    handwriting_recognition: ClassVar[Symbol]
+    handyman: ClassVar[Symbol]
+    hangout_video: ClassVar[Symbol]
+    hangout_video_off: ClassVar[Symbol]
+    hard_disk: ClassVar[Symbol]
+    hard_drive: ClassVar[Symbol]
+    hard_drive_2: ClassVar[Symbol]
+    hardware: ClassVar[Symbol]
+    hd: ClassVar[Symbol]
+    hdr_auto: ClassVar[Symbol]
+    hdr_auto_select: ClassVar[Symbol]
+    hdr_enhanced_select: ClassVar[Symbol]
+    hdr_off: ClassVar[Symbol]
+    hdr_off_select: ClassVar[Symbol]
+    hdr_on: ClassVar[Symbol]
+    hdr_on_select: ClassVar[Symbol]
+    hdr_plus: ClassVar[Symbol]
+    hdr_plus_off: ClassVar[Symbol]
+    hdr_strong: ClassVar[Symbol]
+    hdr_weak: ClassVar[Symbol]
+    head_mounted_device: ClassVar[Symbol]
+    headphones: ClassVar[Symbol]
+    headphones_battery: ClassVar[Symbol]
+    headset: ClassVar[Symbol]
+    headset_mic: ClassVar[Symbol]
+    headset_off: ClassVar[Symbol]
+    healing: ClassVar[Symbol]
+    health_and_beauty: ClassVar[Symbol]
+    health_and_safety: ClassVar[Symbol]
+    health_cross: ClassVar[Symbol]
+    health_metrics: ClassVar[Symbol]
+    heap_snapshot_large: ClassVar[Symbol]
+    heap_snapshot_multiple: ClassVar[Symbol]
+    heap_snapshot_thumbnail: ClassVar[Symbol]
+    hearing: ClassVar[Symbol]
+    hearing_aid: ClassVar[Symbol]
+    hearing_aid_disabled: ClassVar[Symbol]
+    hearing_aid_disabled_left: ClassVar[Symbol]
+    hearing_aid_left: ClassVar[Symbol]
+    hearing_disabled: ClassVar[Symbol]
+    heart_broken: ClassVar[Symbol]
+    heart_check: ClassVar[Symbol]
+    heart_minus: ClassVar[Symbol]
+    heart_plus: ClassVar[Symbol]
+    heart_smile: ClassVar[Symbol]
+    heat: ClassVar[Symbol]
+    heat_pump: ClassVar[Symbol]
+    heat_pump_balance: ClassVar[Symbol]
+    height: ClassVar[Symbol]
+    helicopter: ClassVar[Symbol]
+    help: ClassVar[Symbol]
+    help_center: ClassVar[Symbol]
+    help_clinic: ClassVar[Symbol]
+    help_outline: ClassVar[Symbol]
+    hematology: ClassVar[Symbol]
+    hevc: ClassVar[Symbol]
+    hexagon: ClassVar[Symbol]
+    hide: ClassVar[Symbol]
+    hide_image: ClassVar[Symbol]
+    hide_source: ClassVar[Symbol]
+    high_chair: ClassVar[Symbol]
+    high_density: ClassVar[Symbol]
+    high_quality: ClassVar[Symbol]
+    high_res: ClassVar[Symbol]
+    highlight: ClassVar[Symbol]
+    highlight_alt: ClassVar[Symbol]
+    highlight_keyboard_focus: ClassVar[Symbol]
+    highlight_mouse_cursor: ClassVar[Symbol]
+    highlight_off: ClassVar[Symbol]
+    highlight_text_cursor: ClassVar[Symbol]
+    highlighter_size_1: ClassVar[Symbol]
+    highlighter_size_2: ClassVar[Symbol]
+    highlighter_size_3: ClassVar[Symbol]
+    highlighter_size_4: ClassVar[Symbol]
+    highlighter_size_5: ClassVar[Symbol]
+    hiking: ClassVar[Symbol]
+    history: ClassVar[Symbol]
+    history_2: ClassVar[Symbol]
+    history_edu: ClassVar[Symbol]
+    history_off: ClassVar[Symbol]
+    history_toggle_off: ClassVar[Symbol]
+    hive: ClassVar[Symbol]
+    hls: ClassVar[Symbol]
+    hls_off: ClassVar[Symbol]
+    holiday_village: ClassVar[Symbol]
+    home: ClassVar[Symbol]
+    home_and_garden: ClassVar[Symbol]
+    home_app_logo: ClassVar[Symbol]
+    home_filled: ClassVar[Symbol]
+    home_health: ClassVar[Symbol]
+    home_improvement_and_tools: ClassVar[Symbol]
+    home_iot_device: ClassVar[Symbol]
+    home_max: ClassVar[Symbol]
+    home_max_dots: ClassVar[Symbol]
+    home_mini: ClassVar[Symbol]
+    home_pin: ClassVar[Symbol]
+    home_repair_service: ClassVar[Symbol]
+    home_speaker: ClassVar[Symbol]
+    home_storage: ClassVar[Symbol]
+    home_work: ClassVar[Symbol]
+    horizontal_distribute: ClassVar[Symbol]
+    horizontal_rule: ClassVar[Symbol]
+    horizontal_split: ClassVar[Symbol]
+    host: ClassVar[Symbol]
+    hot_tub: ClassVar[Symbol]
+    hotel: ClassVar[Symbol]
+    hotel_class: ClassVar[Symbol]
+    hourglass: ClassVar[Symbol]
+    hourglass_arrow_down: ClassVar[Symbol]
+    hourglass_arrow_up: ClassVar[Symbol]
+    hourglass_bottom: ClassVar[Symbol]
+    hourglass_disabled: ClassVar[Symbol]
+    hourglass_empty: ClassVar[Symbol]
+    hourglass_full: ClassVar[Symbol]
+    hourglass_pause: ClassVar[Symbol]
+    hourglass_top: ClassVar[Symbol]
+    house: ClassVar[Symbol]
+    house_siding: ClassVar[Symbol]
+    house_with_shield: ClassVar[Symbol]
+    houseboat: ClassVar[Symbol]
+    household_supplies: ClassVar[Symbol]
+    hov: ClassVar[Symbol]
+    how_to_reg: ClassVar[Symbol]
+    how_to_vote: ClassVar[Symbol]
+    hr_resting: ClassVar[Symbol]
+    html: ClassVar[Symbol]
+    http: ClassVar[Symbol]
+    https: ClassVar[Symbol]
+    hub: ClassVar[Symbol]
+    humerus: ClassVar[Symbol]
+    humerus_alt: ClassVar[Symbol]
+    humidity_high: ClassVar[Symbol]
+    humidity_indoor: ClassVar[Symbol]
+    humidity_low: ClassVar[Symbol]
+    humidity_mid: ClassVar[Symbol]
+    humidity_percentage: ClassVar[Symbol]
+    hvac: ClassVar[Symbol]
+    hvac_max_defrost: ClassVar[Symbol]
+    ice_skating: ClassVar[Symbol]
+    icecream: ClassVar[Symbol]
+    id_card: ClassVar[Symbol]
+    identity_aware_proxy: ClassVar[Symbol]
+    identity_platform: ClassVar[Symbol]
+    ifl: ClassVar[Symbol]
+    iframe: ClassVar[Symbol]
+    iframe_off: ClassVar[Symbol]
+    image: ClassVar[Symbol]
+    image_arrow_up: ClassVar[Symbol]
+    image_aspect_ratio: ClassVar[Symbol]
+    image_inset: ClassVar[Symbol]
+    image_not_supported: ClassVar[Symbol]
+    image_search: ClassVar[Symbol]
+    imagesearch_roller: ClassVar[Symbol]
+    imagesmode: ClassVar[Symbol]
+    immunology: ClassVar[Symbol]
+    import_contacts: ClassVar[Symbol]
+    import_export: ClassVar[Symbol]
+    important_devices: ClassVar[Symbol]
+    in_home_mode: ClassVar[Symbol]
+    inactive_order: ClassVar[Symbol]
+    inbox: ClassVar[Symbol]
+    inbox_customize: ClassVar[Symbol]
+    inbox_text: ClassVar[Symbol]
+    inbox_text_asterisk: ClassVar[Symbol]
+    inbox_text_person: ClassVar[Symbol]
+    inbox_text_share: ClassVar[Symbol]
+    incomplete_circle: ClassVar[Symbol]
+    indeterminate_check_box: ClassVar[Symbol]
+    indeterminate_question_box: ClassVar[Symbol]
+    info: ClassVar[Symbol]
+    info_i: ClassVar[Symbol]
+    infrared: ClassVar[Symbol]
+    ink_eraser: ClassVar[Symbol]
+    ink_eraser_off: ClassVar[Symbol]
+    ink_highlighter: ClassVar[Symbol]
+    ink_highlighter_move: ClassVar[Symbol]
+    ink_marker: ClassVar[Symbol]
+    ink_pen: ClassVar[Symbol]
+    ink_selection: ClassVar[Symbol]
+    inpatient: ClassVar[Symbol]
+    input: ClassVar[Symbol]
+    input_circle: ClassVar[Symbol]
+    insert_chart: ClassVar[Symbol]
+    insert_chart_filled: ClassVar[Symbol]
+    insert_chart_outlined: ClassVar[Symbol]
+    insert_comment: ClassVar[Symbol]
+    insert_drive_file: ClassVar[Symbol]
+    insert_emoticon: ClassVar[Symbol]
+    insert_invitation: ClassVar[Symbol]
+    insert_link: ClassVar[Symbol]
+    insert_page_break: ClassVar[Symbol]
+    insert_photo: ClassVar[Symbol]
+    insert_text: ClassVar[Symbol]
+    insights: ClassVar[Symbol]
+    install_desktop: ClassVar[Symbol]
+    install_mobile: ClassVar[Symbol]
+    instant_mix: ClassVar[Symbol]
+    integration_instructions: ClassVar[Symbol]
+    interactive_space: ClassVar[Symbol]
+    interests: ClassVar[Symbol]
+    interpreter_mode: ClassVar[Symbol]
+    inventory: ClassVar[Symbol]
+    inventory_2: ClassVar[Symbol]
+    invert_colors: ClassVar[Symbol]
+    invert_colors_off: ClassVar[Symbol]
+    ios: ClassVar[Symbol]
+    ios_share: ClassVar[Symbol]
+    iron: ClassVar[Symbol]
+    iso: ClassVar[Symbol]
+    jamboard_kiosk: ClassVar[Symbol]
+    japanese_curry: ClassVar[Symbol]
+    japanese_flag: ClassVar[Symbol]
+    javascript: ClassVar[Symbol]
+    join: ClassVar[Symbol]
+    join_full: ClassVar[Symbol]
+    join_inner: ClassVar[Symbol]
+    join_left: ClassVar[Symbol]
+    join_right: ClassVar[Symbol]
+    joystick: ClassVar[Symbol]
+    jump_to_element: ClassVar[Symbol]
+    kanji_alcohol: ClassVar[Symbol]
+    kayaking: ClassVar[Symbol]
+    kebab_dining: ClassVar[Symbol]
+    keep: ClassVar[Symbol]
+    keep_off: ClassVar[Symbol]
+    keep_pin: ClassVar[Symbol]
+    keep_public: ClassVar[Symbol]
+    kettle: ClassVar[Symbol]
+    key: ClassVar[Symbol]
+    key_off: ClassVar[Symbol]
+    key_vertical: ClassVar[Symbol]
+    key_visualizer: ClassVar[Symbol]
+    keyboard: ClassVar[Symbol]
+    keyboard_alt: ClassVar[Symbol]
+    keyboard_arrow_down: ClassVar[Symbol]
+    keyboard_arrow_left: ClassVar[Symbol]
+    keyboard_arrow_right: ClassVar[Symbol]
+    keyboard_arrow_up: ClassVar[Symbol]
+    keyboard_backspace: ClassVar[Symbol]
+    keyboard_capslock: ClassVar[Symbol]
+    keyboard_capslock_badge: ClassVar[Symbol]
+    keyboard_command_key: ClassVar[Symbol]
+    keyboard_control_key: ClassVar[Symbol]
+    keyboard_double_arrow_down: ClassVar[Symbol]
+    keyboard_double_arrow_left: ClassVar[Symbol]
+    keyboard_double_arrow_right: ClassVar[Symbol]
+    keyboard_double_arrow_up: ClassVar[Symbol]
+    keyboard_external_input: ClassVar[Symbol]
+    keyboard_full: ClassVar[Symbol]
+    keyboard_hide: ClassVar[Symbol]
+    keyboard_keys: ClassVar[Symbol]
+    keyboard_lock: ClassVar[Symbol]
+    keyboard_lock_off: ClassVar[Symbol]
+    keyboard_off: ClassVar[Symbol]
+    keyboard_onscreen: ClassVar[Symbol]
+    keyboard_option_key: ClassVar[Symbol]
+    keyboard_previous_language: ClassVar[Symbol]
+    keyboard_return: ClassVar[Symbol]
+    keyboard_tab: ClassVar[Symbol]
+    keyboard_tab_rtl: ClassVar[Symbol]
+    keyboard_voice: ClassVar[Symbol]
+    kid_star: ClassVar[Symbol]
+    king_bed: ClassVar[Symbol]
+    kitchen: ClassVar[Symbol]
+    kitesurfing: ClassVar[Symbol]
+    lab_panel: ClassVar[Symbol]
+    lab_profile: ClassVar[Symbol]
+    lab_research: ClassVar[Symbol]
+    label: ClassVar[Symbol]
+    label_important: ClassVar[Symbol]
+    label_important_outline: ClassVar[Symbol]
+    label_off: ClassVar[Symbol]
+    label_outline: ClassVar[Symbol]
+    labs: ClassVar[Symbol]
+    lan: ClassVar[Symbol]
+    landscape: ClassVar[Symbol]
+    landscape_2: ClassVar[Symbol]
+    landscape_2_edit: ClassVar[Symbol]
+    landscape_2_off: ClassVar[Symbol]
+    landslide: ClassVar[Symbol]
+    language: ClassVar[Symbol]
+    language_chinese_array: ClassVar[Symbol]
+    language_chinese_cangjie: ClassVar[Symbol]
+    language_chinese_dayi: ClassVar[Symbol]
+    language_chinese_pinyin: ClassVar[Symbol]
+    language_chinese_quick: ClassVar[Symbol]
+    language_chinese_wubi: ClassVar[Symbol]
+    language_french: ClassVar[Symbol]
+    language_gb_english: ClassVar[Symbol]
+    language_international: ClassVar[Symbol]
+    language_japanese_kana: ClassVar[Symbol]
+    language_korean_latin: ClassVar[Symbol]
+    language_pinyin: ClassVar[Symbol]
+    language_spanish: ClassVar[Symbol]
+    language_us: ClassVar[Symbol]
+    language_us_colemak: ClassVar[Symbol]
+    language_us_dvorak: ClassVar[Symbol]
+    laps: ClassVar[Symbol]
+    laptop: ClassVar[Symbol]
+    laptop_car: ClassVar[Symbol]
+    laptop_chromebook: ClassVar[Symbol]
+    laptop_mac: ClassVar[Symbol]
+    laptop_windows: ClassVar[Symbol]
+    lasso_select: ClassVar[Symbol]
+    last_page: ClassVar[Symbol]
+    launch: ClassVar[Symbol]
+    laundry: ClassVar[Symbol]
+    layers: ClassVar[Symbol]
+    layers_clear: ClassVar[Symbol]
+    lda: ClassVar[Symbol]
+    leaderboard: ClassVar[Symbol]
+    leak_add: ClassVar[Symbol]
+    leak_remove: ClassVar[Symbol]
+    left_click: ClassVar[Symbol]
+    left_panel_close: ClassVar[Symbol]
+    left_panel_open: ClassVar[Symbol]
+    legend_toggle: ClassVar[Symbol]
+    lens: ClassVar[Symbol]
+    lens_blur: ClassVar[Symbol]
+    letter_switch: ClassVar[Symbol]
+    library_add: ClassVar[Symbol]
+    library_add_check: ClassVar[Symbol]
+    library_books: ClassVar[Symbol]
+    library_music: ClassVar[Symbol]
+    license: ClassVar[Symbol]
+    lift_to_talk: ClassVar[Symbol]
+    light: ClassVar[Symbol]
+    light_group: ClassVar[Symbol]
+    light_mode: ClassVar[Symbol]
+    light_off: ClassVar[Symbol]
+    lightbulb: ClassVar[Symbol]
+    lightbulb_2: ClassVar[Symbol]
+    lightbulb_circle: ClassVar[Symbol]
+    lightbulb_outline: ClassVar[Symbol]
+    lightning_stand: ClassVar[Symbol]
+    line_axis: ClassVar[Symbol]
+    line_curve: ClassVar[Symbol]
+    line_end: ClassVar[Symbol]
+    line_end_arrow: ClassVar[Symbol]
+    line_end_arrow_notch: ClassVar[Symbol]
+    line_end_circle: ClassVar[Symbol]
+    line_end_diamond: ClassVar[Symbol]
+    line_end_square: ClassVar[Symbol]
+    line_start: ClassVar[Symbol]
+    line_start_arrow: ClassVar[Symbol]
+    line_start_arrow_notch: ClassVar[Symbol]
+    line_start_circle: ClassVar[Symbol]
+    line_start_diamond: ClassVar[Symbol]
+    line_start_square: ClassVar[Symbol]
+    line_style: ClassVar[Symbol]
+    line_weight: ClassVar[Symbol]
+    linear_scale: ClassVar[Symbol]
+    link: ClassVar[Symbol]
+    link_off: ClassVar[Symbol]
+    linked_camera: ClassVar[Symbol]
+    linked_services: ClassVar[Symbol]
+    liquor: ClassVar[Symbol]
+    list: ClassVar[Symbol]
+    list_alt: ClassVar[Symbol]
+    list_alt_add: ClassVar[Symbol]
+    list_alt_check: ClassVar[Symbol]
+    lists: ClassVar[Symbol]
+    live_help: ClassVar[Symbol]
+    live_tv: ClassVar[Symbol]
+    living: ClassVar[Symbol]
+    local_activity: ClassVar[Symbol]
+    local_airport: ClassVar[Symbol]
+    local_atm: ClassVar[Symbol]
+    local_bar: ClassVar[Symbol]
+    local_cafe: ClassVar[Symbol]
+    local_car_wash: ClassVar[Symbol]
+    local_convenience_store: ClassVar[Symbol]
+    local_dining: ClassVar[Symbol]
+    local_drink: ClassVar[Symbol]
+    local_fire_department: ClassVar[Symbol]
+    local_florist: ClassVar[Symbol]
+    local_gas_station: ClassVar[Symbol]
+    local_grocery_store: ClassVar[Symbol]
+    local_hospital: ClassVar[Symbol]
+    local_hotel: ClassVar[Symbol]
+    local_laundry_service: ClassVar[Symbol]
+    local_library: ClassVar[Symbol]
+    local_mall: ClassVar[Symbol]
+    local_movies: ClassVar[Symbol]
+    local_offer: ClassVar[Symbol]
+    local_parking: ClassVar[Symbol]
+    local_pharmacy: ClassVar[Symbol]
+    local_phone: ClassVar[Symbol]
+    local_pizza: ClassVar[Symbol]
+    local_play: ClassVar[Symbol]
+    local_police: ClassVar[Symbol]
+    local_post_office: ClassVar[Symbol]
+    local_printshop: ClassVar[Symbol]
+    local_see: ClassVar[Symbol]
+    local_shipping: ClassVar[Symbol]
+    local_taxi: ClassVar[Symbol]
+    location_automation: ClassVar[Symbol]
+    location_away: ClassVar[Symbol]
+    location_chip: ClassVar[Symbol]
+    location_city: ClassVar[Symbol]
+    location_disabled: ClassVar[Symbol]
+    location_home: ClassVar[Symbol]
+    location_off: ClassVar[Symbol]
+    location_on: ClassVar[Symbol]
+    location_pin: ClassVar[Symbol]
+    location_searching: ClassVar[Symbol]
+    locator_tag: ClassVar[Symbol]
+    lock: ClassVar[Symbol]
+    lock_clock: ClassVar[Symbol]
+    lock_open: ClassVar[Symbol]
+    lock_open_circle: ClassVar[Symbol]
+    lock_open_right: ClassVar[Symbol]
+    lock_outline: ClassVar[Symbol]
+    lock_person: ClassVar[Symbol]
+    lock_reset: ClassVar[Symbol]
+    login: ClassVar[Symbol]
+    logo_dev: ClassVar[Symbol]
+    logout: ClassVar[Symbol]
+    looks: ClassVar[Symbol]
+    looks_3: ClassVar[Symbol]
+    looks_4: ClassVar[Symbol]
+    looks_5: ClassVar[Symbol]
+    looks_6: ClassVar[Symbol]
+    looks_one: ClassVar[Symbol]
+    looks_two: ClassVar[Symbol]
+    loop: ClassVar[Symbol]
+    loupe: ClassVar[Symbol]
+    low_density: ClassVar[Symbol]
+    low_priority: ClassVar[Symbol]
+    lowercase: ClassVar[Symbol]
+    loyalty: ClassVar[Symbol]
+    lte_mobiledata: ClassVar[Symbol]
+    lte_mobiledata_badge: ClassVar[Symbol]
+    lte_plus_mobiledata: ClassVar[Symbol]
+    lte_plus_mobiledata_badge: ClassVar[Symbol]
+    luggage: ClassVar[Symbol]
+    lunch_dining: ClassVar[Symbol]
+    lyrics: ClassVar[Symbol]
+    macro_auto: ClassVar[Symbol]
+    macro_off: ClassVar[Symbol]
+    magic_button: ClassVar[Symbol]
+    magic_exchange: ClassVar[Symbol]
+    magic_tether: ClassVar[Symbol]
+    magnification_large: ClassVar[Symbol]
+    magnification_small: ClassVar[Symbol]
+    magnify_docked: ClassVar[Symbol]
+    magnify_fullscreen: ClassVar[Symbol]
+    mail: ClassVar[Symbol]
+    mail_asterisk: ClassVar[Symbol]
+    mail_lock: ClassVar[Symbol]
+    mail_off: ClassVar[Symbol]
+    mail_outline: ClassVar[Symbol]
+    mail_shield: ClassVar[Symbol]
+    male: ClassVar[Symbol]
+    man: ClassVar[Symbol]
+    man_2: ClassVar[Symbol]
+    man_3: ClassVar[Symbol]
+    man_4: ClassVar[Symbol]
+    manage_accounts: ClassVar[Symbol]
+    manage_history: ClassVar[Symbol]
+    manage_search: ClassVar[Symbol]
+    manga: ClassVar[Symbol]
+    manufacturing: ClassVar[Symbol]
+    map: ClassVar[Symbol]
+    map_pin_heart: ClassVar[Symbol]
+    map_pin_review: ClassVar[Symbol]
+    map_search: ClassVar[Symbol]
+    maps_home_work: ClassVar[Symbol]
+    maps_ugc: ClassVar[Symbol]
+    margin: ClassVar[Symbol]
+    mark_as_unread: ClassVar[Symbol]
+    mark_chat_read: ClassVar[Symbol]
+    mark_chat_unread: ClassVar[Symbol]
+    mark_email_read: ClassVar[Symbol]
+    mark_email_unread: ClassVar[Symbol]
+    mark_unread_chat_alt: ClassVar[Symbol]
+    markdown: ClassVar[Symbol]
+    markdown_copy: ClassVar[Symbol]
+    markdown_paste: ClassVar[Symbol]
+    markunread: ClassVar[Symbol]
+    markunread_mailbox: ClassVar[Symbol]
+    masked_transitions: ClassVar[Symbol]
+    masked_transitions_add: ClassVar[Symbol]
+    masks: ClassVar[Symbol]
+    massage: ClassVar[Symbol]
+    match_case: ClassVar[Symbol]
+    match_case_off: ClassVar[Symbol]
+    match_word: ClassVar[Symbol]
+    matter: ClassVar[Symbol]
+    maximize: ClassVar[Symbol]
+    meal_dinner: ClassVar[Symbol]
+    meal_lunch: ClassVar[Symbol]
+    measuring_tape: ClassVar[Symbol]
+    media_bluetooth_off: ClassVar[Symbol]
+    media_bluetooth_on: ClassVar[Symbol]
+    media_link: ClassVar[Symbol]
+    media_output: ClassVar[Symbol]
+    media_output_off: ClassVar[Symbol]
+    mediation: ClassVar[Symbol]
+    medical_information: ClassVar[Symbol]
+    medical_mask: ClassVar[Symbol]
+    medical_services: ClassVar[Symbol]
+    medication: ClassVar[Symbol]
+    medication_liquid: ClassVar[Symbol]
+    meeting_room: ClassVar[Symbol]
+    memory: ClassVar[Symbol]
+    memory_alt: ClassVar[Symbol]
+    menstrual_health: ClassVar[Symbol]
+    menu: ClassVar[Symbol]
+    menu_book: ClassVar[Symbol]
+    menu_book_2: ClassVar[Symbol]
+    menu_open: ClassVar[Symbol]
+    merge: ClassVar[Symbol]
+    merge_type: ClassVar[Symbol]
+    message: ClassVar[Symbol]
+    metabolism: ClassVar[Symbol]
+    metro: ClassVar[Symbol]
+    mfg_nest_yale_lock: ClassVar[Symbol]
+    mic: ClassVar[Symbol]
+    mic_alert: ClassVar[Symbol]
+    mic_double: ClassVar[Symbol]
+    mic_external_off: ClassVar[Symbol]
+    mic_external_on: ClassVar[Symbol]
+    mic_none: ClassVar[Symbol]
+    mic_off: ClassVar[Symbol]
+    microbiology: ClassVar[Symbol]
+    microwave: ClassVar[Symbol]
+    microwave_gen: ClassVar[Symbol]
+    military_tech: ClassVar[Symbol]
+    mimo: ClassVar[Symbol]
+    mimo_disconnect: ClassVar[Symbol]
+    mindfulness: ClassVar[Symbol]
+    minimize: ClassVar[Symbol]
+    minor_crash: ClassVar[Symbol]
+    mintmark: ClassVar[Symbol]
+    missed_video_call: ClassVar[Symbol]
+    missed_video_call_filled: ClassVar[Symbol]
+    missing_controller: ClassVar[Symbol]
+    mist: ClassVar[Symbol]
+    mitre: ClassVar[Symbol]
+    mixture_med: ClassVar[Symbol]
+    mms: ClassVar[Symbol]
+    mobile: ClassVar[Symbol]
+    mobile_2: ClassVar[Symbol]
+    mobile_3: ClassVar[Symbol]
+    mobile_alert: ClassVar[Symbol]
+    mobile_arrow_down: ClassVar[Symbol]
+    mobile_arrow_right: ClassVar[Symbol]
+    mobile_arrow_up_right: ClassVar[Symbol]
+    mobile_block: ClassVar[Symbol]
+    mobile_camera: ClassVar[Symbol]
+    mobile_camera_front: ClassVar[Symbol]
+    mobile_camera_rear: ClassVar[Symbol]
+    mobile_cancel: ClassVar[Symbol]
+    mobile_cast: ClassVar[Symbol]
+    mobile_charge: ClassVar[Symbol]
+    mobile_chat: ClassVar[Symbol]
+    mobile_check: ClassVar[Symbol]
+    mobile_code: ClassVar[Symbol]
+    mobile_dots: ClassVar[Symbol]
+    mobile_friendly: ClassVar[Symbol]
+    mobile_gear: ClassVar[Symbol]
+    mobile_hand: ClassVar[Symbol]
+    mobile_hand_left: ClassVar[Symbol]
+    mobile_hand_left_off: ClassVar[Symbol]
+    mobile_hand_off: ClassVar[Symbol]
+    mobile_info: ClassVar[Symbol]
+    mobile_landscape: ClassVar[Symbol]
+    mobile_layout: ClassVar[Symbol]
+    mobile_lock_landscape: ClassVar[Symbol]
+    mobile_lock_portrait: ClassVar[Symbol]
+    mobile_loupe: ClassVar[Symbol]
+    mobile_menu: ClassVar[Symbol]
+    mobile_off: ClassVar[Symbol]
+    mobile_question: ClassVar[Symbol]
+    mobile_rotate: ClassVar[Symbol]
+    mobile_rotate_lock: ClassVar[Symbol]
+    mobile_screen_share: ClassVar[Symbol]
+    mobile_screensaver: ClassVar[Symbol]
+    mobile_sensor_hi: ClassVar[Symbol]
+    mobile_sensor_lo: ClassVar[Symbol]
+    mobile_share: ClassVar[Symbol]
+    mobile_share_stack: ClassVar[Symbol]
+    mobile_sound: ClassVar[Symbol]
+    mobile_sound_2: ClassVar[Symbol]
+    mobile_sound_off: ClassVar[Symbol]
+    mobile_speaker: ClassVar[Symbol]
+    mobile_text: ClassVar[Symbol]
+    mobile_text_2: ClassVar[Symbol]
+    mobile_theft: ClassVar[Symbol]
+    mobile_ticket: ClassVar[Symbol]
+    mobile_vibrate: ClassVar[Symbol]
+    mobile_wrench: ClassVar[Symbol]
+    mobiledata_off: ClassVar[Symbol]
+    mode: ClassVar[Symbol]
+    mode_comment: ClassVar[Symbol]
+    mode_cool: ClassVar[Symbol]
+    mode_cool_off: ClassVar[Symbol]
+    mode_dual: ClassVar[Symbol]
+    mode_edit: ClassVar[Symbol]
+    mode_edit_outline: ClassVar[Symbol]
+    mode_fan: ClassVar[Symbol]
+    mode_fan_off: ClassVar[Symbol]
+    mode_heat: ClassVar[Symbol]
+    mode_heat_cool: ClassVar[Symbol]
+    mode_heat_off: ClassVar[Symbol]
+    mode_night: ClassVar[Symbol]
+    mode_of_travel: ClassVar[Symbol]
+    mode_off_on: ClassVar[Symbol]
+    mode_standby: ClassVar[Symbol]
+    model_training: ClassVar[Symbol]
+    modeling: ClassVar[Symbol]
+    monetization_on: ClassVar[Symbol]
+    money: ClassVar[Symbol]
+    money_bag: ClassVar[Symbol]
+    money_off: ClassVar[Symbol]
+    money_off_csred: ClassVar[Symbol]
+    money_range: ClassVar[Symbol]
+    monitor: ClassVar[Symbol]
+    monitor_heart: ClassVar[Symbol]
+    monitor_weight: ClassVar[Symbol]
+    monitor_weight_gain: ClassVar[Symbol]
+    monitor_weight_loss: ClassVar[Symbol]
+    monitoring: ClassVar[Symbol]
+    monochrome_photos: ClassVar[Symbol]
+    monorail: ClassVar[Symbol]
+    mood: ClassVar[Symbol]
+    mood_bad: ClassVar[Symbol]
+    moon_stars: ClassVar[Symbol]
+    mop: ClassVar[Symbol]
+    moped: ClassVar[Symbol]
+    moped_package: ClassVar[Symbol]
+    more: ClassVar[Symbol]
+    more_down: ClassVar[Symbol]
+    more_horiz: ClassVar[Symbol]
+    more_time: ClassVar[Symbol]
+    more_up: ClassVar[Symbol]
+    more_vert: ClassVar[Symbol]
+    mosque: ClassVar[Symbol]
+    motion_blur: ClassVar[Symbol]
+    motion_mode: ClassVar[Symbol]
+    motion_photos_auto: ClassVar[Symbol]
+    motion_photos_off: ClassVar[Symbol]
+    motion_photos_on: ClassVar[Symbol]
+    motion_photos_pause: ClassVar[Symbol]
+    motion_photos_paused: ClassVar[Symbol]
+    motion_play: ClassVar[Symbol]
+    motion_sensor_active: ClassVar[Symbol]
+    motion_sensor_alert: ClassVar[Symbol]
+    motion_sensor_idle: ClassVar[Symbol]
+    motion_sensor_urgent: ClassVar[Symbol]
+    motorcycle: ClassVar[Symbol]
+    mountain_flag: ClassVar[Symbol]
+    mountain_steam: ClassVar[Symbol]
+    mouse: ClassVar[Symbol]
+    mouse_lock: ClassVar[Symbol]
+    mouse_lock_off: ClassVar[Symbol]
+    move: ClassVar[Symbol]
+    move_down: ClassVar[Symbol]
+    move_group: ClassVar[Symbol]
+    move_item: ClassVar[Symbol]
+    move_location: ClassVar[Symbol]
+    move_selection_down: ClassVar[Symbol]
+    move_selection_left: ClassVar[Symbol]
+    move_selection_right: ClassVar[Symbol]
+    move_selection_up: ClassVar[Symbol]
+    move_to_inbox: ClassVar[Symbol]
+    move_up: ClassVar[Symbol]
+    moved_location: ClassVar[Symbol]
+    movie: ClassVar[Symbol]
+    movie_creation: ClassVar[Symbol]
+    movie_edit: ClassVar[Symbol]
+    movie_filter: ClassVar[Symbol]
+    movie_info: ClassVar[Symbol]
+    movie_off: ClassVar[Symbol]
+    movie_speaker: ClassVar[Symbol]
+    moving: ClassVar[Symbol]
+    moving_beds: ClassVar[Symbol]
+    moving_ministry: ClassVar[Symbol]
+    mp: ClassVar[Symbol]
+    multicooker: ClassVar[Symbol]
+    multiline_chart: ClassVar[Symbol]
+    multimodal_hand_eye: ClassVar[Symbol]
+    multiple_airports: ClassVar[Symbol]
+    multiple_stop: ClassVar[Symbol]
+    museum: ClassVar[Symbol]
+    music_cast: ClassVar[Symbol]
+    music_history: ClassVar[Symbol]
+    music_note: ClassVar[Symbol]
+    music_note_add: ClassVar[Symbol]
+    music_off: ClassVar[Symbol]
+    music_video: ClassVar[Symbol]
+    my_location: ClassVar[Symbol]
+    mystery: ClassVar[Symbol]
+    nat: ClassVar[Symbol]
+    nature: ClassVar[Symbol]
+    nature_people: ClassVar[Symbol]
+    navigate_before: ClassVar[Symbol]
+    navigate_next: ClassVar[Symbol]
+    navigation: ClassVar[Symbol]
+    near_me: ClassVar[Symbol]
+    near_me_disabled: ClassVar[Symbol]
+    nearby: ClassVar[Symbol]
+    nearby_error: ClassVar[Symbol]
+    nearby_off: ClassVar[Symbol]
+    nephrology: ClassVar[Symbol]
+    nest_audio: ClassVar[Symbol]
+    nest_cam_floodlight: ClassVar[Symbol]
+    nest_cam_indoor: ClassVar[Symbol]
+    nest_cam_iq: ClassVar[Symbol]
+    nest_cam_iq_outdoor: ClassVar[Symbol]
+    nest_cam_magnet_mount: ClassVar[Symbol]
+    nest_cam_outdoor: ClassVar[Symbol]
+    nest_cam_stand: ClassVar[Symbol]
+    nest_cam_wall_mount: ClassVar[Symbol]
+    nest_cam_wired_stand: ClassVar[Symbol]
+    nest_clock_farsight_analog: ClassVar[Symbol]
+    nest_clock_farsight_digital: ClassVar[Symbol]
+    nest_connect: ClassVar[Symbol]
+    nest_detect: ClassVar[Symbol]
+    nest_display: ClassVar[Symbol]
+    nest_display_max: ClassVar[Symbol]
+    nest_doorbell_visitor: ClassVar[Symbol]
+    nest_eco_leaf: ClassVar[Symbol]
+    nest_farsight_cool: ClassVar[Symbol]
+    nest_farsight_dual: ClassVar[Symbol]
+    nest_farsight_eco: ClassVar[Symbol]
+    nest_farsight_heat: ClassVar[Symbol]
+    nest_farsight_seasonal: ClassVar[Symbol]
+    nest_farsight_weather: ClassVar[Symbol]
+    nest_found_savings: ClassVar[Symbol]
+    nest_gale_wifi: ClassVar[Symbol]
+    nest_heat_link_e: ClassVar[Symbol]
+    nest_heat_link_gen_3: ClassVar[Symbol]
+    nest_hello_doorbell: ClassVar[Symbol]
+    nest_locator_tag: ClassVar[Symbol]
+    nest_mini: ClassVar[Symbol]
+    nest_multi_room: ClassVar[Symbol]
+    nest_protect: ClassVar[Symbol]
+    nest_remote: ClassVar[Symbol]
+    nest_remote_comfort_sensor: ClassVar[Symbol]
+    nest_secure_alarm: ClassVar[Symbol]
+    nest_sunblock: ClassVar[Symbol]
+    nest_tag: ClassVar[Symbol]
+    nest_thermostat: ClassVar[Symbol]
+    nest_thermostat_e_eu: ClassVar[Symbol]
+    nest_thermostat_gen_3: ClassVar[Symbol]
+    nest_thermostat_sensor: ClassVar[Symbol]
+    nest_thermostat_sensor_eu: ClassVar[Symbol]
+    nest_thermostat_zirconium_eu: ClassVar[Symbol]
+    nest_true_radiant: ClassVar[Symbol]
+    nest_wake_on_approach: ClassVar[Symbol]
+    nest_wake_on_press: ClassVar[Symbol]
+    nest_wifi_gale: ClassVar[Symbol]
+    nest_wifi_mistral: ClassVar[Symbol]
+    nest_wifi_point: ClassVar[Symbol]
+    nest_wifi_point_vento: ClassVar[Symbol]
+    nest_wifi_pro: ClassVar[Symbol]
+    nest_wifi_pro_2: ClassVar[Symbol]
+    nest_wifi_router: ClassVar[Symbol]
+    network_cell: ClassVar[Symbol]
+    network_check: ClassVar[Symbol]
+    network_intel_node: ClassVar[Symbol]
+    network_intelligence: ClassVar[Symbol]
+    network_intelligence_history: ClassVar[Symbol]
+    network_intelligence_update: ClassVar[Symbol]
+    network_locked: ClassVar[Symbol]
+    network_manage: ClassVar[Symbol]
+    network_node: ClassVar[Symbol]
+    network_ping: ClassVar[Symbol]
+    network_wifi: ClassVar[Symbol]
+    network_wifi_1_bar: ClassVar[Symbol]
+    network_wifi_1_bar_locked: ClassVar[Symbol]
+    network_wifi_2_bar: ClassVar[Symbol]
+    network_wifi_2_bar_locked: ClassVar[Symbol]
+    network_wifi_3_bar: ClassVar[Symbol]
+    network_wifi_3_bar_locked: ClassVar[Symbol]
+    network_wifi_locked: ClassVar[Symbol]
+    neurology: ClassVar[Symbol]
+    new_label: ClassVar[Symbol]
+    new_releases: ClassVar[Symbol]
+    new_window: ClassVar[Symbol]
+    news: ClassVar[Symbol]
+    newsmode: ClassVar[Symbol]
+    newspaper: ClassVar[Symbol]
+    newsstand: ClassVar[Symbol]
+    next_plan: ClassVar[Symbol]
+    next_week: ClassVar[Symbol]
+    nfc: ClassVar[Symbol]
+    nfc_off: ClassVar[Symbol]
+    night_shelter: ClassVar[Symbol]
+    night_sight_auto: ClassVar[Symbol]
+    night_sight_auto_off: ClassVar[Symbol]
+    night_sight_max: ClassVar[Symbol]
+    nightlife: ClassVar[Symbol]
+    nightlight: ClassVar[Symbol]
+    nightlight_round: ClassVar[Symbol]
+    nights_stay: ClassVar[Symbol]
+    no_accounts: ClassVar[Symbol]
+    no_adult_content: ClassVar[Symbol]
+    no_backpack: ClassVar[Symbol]
+    no_crash: ClassVar[Symbol]
+    no_drinks: ClassVar[Symbol]
+    no_encryption: ClassVar[Symbol]
+    no_encryption_gmailerrorred: ClassVar[Symbol]
+    no_flash: ClassVar[Symbol]
+    no_food: ClassVar[Symbol]
+    no_luggage: ClassVar[Symbol]
+    no_meals: ClassVar[Symbol]
+    no_meeting_room: ClassVar[Symbol]
+    no_photography: ClassVar[Symbol]
+    no_sim: ClassVar[Symbol]
+    no_sound: ClassVar[Symbol]
+    no_stroller: ClassVar[Symbol]
+    no_transfer: ClassVar[Symbol]
+    noise_aware: ClassVar[Symbol]
+    noise_control_off: ClassVar[Symbol]
+    noise_control_on: ClassVar[Symbol]
+    nordic_walking: ClassVar[Symbol]
+    north: ClassVar[Symbol]
+    north_east: ClassVar[Symbol]
+    north_west: ClassVar[Symbol]
+    not_accessible: ClassVar[Symbol]
+    not_accessible_forward: ClassVar[Symbol]
+    not_interested: ClassVar[Symbol]
+    not_listed_location: ClassVar[Symbol]
+    not_started: ClassVar[Symbol]
+    note: ClassVar[Symbol]
+    note_add: ClassVar[Symbol]
+    note_alt: ClassVar[Symbol]
+    note_stack: ClassVar[Symbol]
+    note_stack_add: ClassVar[Symbol]
+    notes: ClassVar[Symbol]
+    notification_add: ClassVar[Symbol]
+    notification_important: ClassVar[Symbol]
+    notification_multiple: ClassVar[Symbol]
+    notification_settings: ClassVar[Symbol]
+    notification_sound: ClassVar[Symbol]
+    notifications: ClassVar[Symbol]
+    notifications_active: ClassVar[Symbol]
+    notifications_none: ClassVar[Symbol]
+    notifications_off: ClassVar[Symbol]
+    notifications_paused: ClassVar[Symbol]
+    notifications_unread: ClassVar[Symbol]
+    numbers: ClassVar[Symbol]
+    nutrition: ClassVar[Symbol]
+    ods: ClassVar[Symbol]
+    odt: ClassVar[Symbol]
+    offline_bolt: ClassVar[Symbol]
+    offline_pin: ClassVar[Symbol]
+    offline_pin_off: ClassVar[Symbol]
+    offline_share: ClassVar[Symbol]
+    oil_barrel: ClassVar[Symbol]
+    okonomiyaki: ClassVar[Symbol]
+    on_device_training: ClassVar[Symbol]
+    on_hub_device: ClassVar[Symbol]
+    oncology: ClassVar[Symbol]
+    ondemand_video: ClassVar[Symbol]
+    online_prediction: ClassVar[Symbol]
+    onsen: ClassVar[Symbol]
+    opacity: ClassVar[Symbol]
+    open_in_browser: ClassVar[Symbol]
+    open_in_full: ClassVar[Symbol]
+    open_in_new: ClassVar[Symbol]
+    open_in_new_down: ClassVar[Symbol]
+    open_in_new_off: ClassVar[Symbol]
+    open_in_phone: ClassVar[Symbol]
+    open_jam: ClassVar[Symbol]
+    open_run: ClassVar[Symbol]
+    open_with: ClassVar[Symbol]
+    ophthalmology: ClassVar[Symbol]
+    oral_disease: ClassVar[Symbol]
+    orbit: ClassVar[Symbol]
+    order_approve: ClassVar[Symbol]
+    order_play: ClassVar[Symbol]
+    orders: ClassVar[Symbol]
+    orthopedics: ClassVar[Symbol]
+    other_admission: ClassVar[Symbol]
+    other_houses: ClassVar[Symbol]
+    outbound: ClassVar[Symbol]
+    outbox: ClassVar[Symbol]
+    outbox_alt: ClassVar[Symbol]
+    outdoor_garden: ClassVar[Symbol]
+    outdoor_grill: ClassVar[Symbol]
+    outgoing_mail: ClassVar[Symbol]
+    outlet: ClassVar[Symbol]
+    outlined_flag: ClassVar[Symbol]
+    outpatient: ClassVar[Symbol]
+    outpatient_med: ClassVar[Symbol]
+    output: ClassVar[Symbol]
+    output_circle: ClassVar[Symbol]
+    oven: ClassVar[Symbol]
+    oven_gen: ClassVar[Symbol]
+    overview: ClassVar[Symbol]
+    overview_key: ClassVar[Symbol]
+    owl: ClassVar[Symbol]
+    oxygen_saturation: ClassVar[Symbol]
+    p2p: ClassVar[Symbol]
+    pace: ClassVar[Symbol]
+    pacemaker: ClassVar[Symbol]
+    package: ClassVar[Symbol]
+    package_2: ClassVar[Symbol]
+    padding: ClassVar[Symbol]
+    padel: ClassVar[Symbol]
+    page_control: ClassVar[Symbol]
+    page_footer: ClassVar[Symbol]
+    page_header: ClassVar[Symbol]
+    page_info: ClassVar[Symbol]
+    page_menu_ios: ClassVar[Symbol]
+    pageless: ClassVar[Symbol]
+    pages: ClassVar[Symbol]
+    pageview: ClassVar[Symbol]
+    paid: ClassVar[Symbol]
+    palette: ClassVar[Symbol]
+    pallet: ClassVar[Symbol]
+    pan_tool: ClassVar[Symbol]
+    pan_tool_alt: ClassVar[Symbol]
+    pan_zoom: ClassVar[Symbol]
+    panorama: ClassVar[Symbol]
+    panorama_fish_eye: ClassVar[Symbol]
+    panorama_horizontal: ClassVar[Symbol]
+    panorama_photosphere: ClassVar[Symbol]
+    panorama_vertical: ClassVar[Symbol]
+    panorama_wide_angle: ClassVar[Symbol]
+    paragliding: ClassVar[Symbol]
+    parent_child_dining: ClassVar[Symbol]
+    park: ClassVar[Symbol]
+    parking_meter: ClassVar[Symbol]
+    parking_sign: ClassVar[Symbol]
+    parking_valet: ClassVar[Symbol]
+    partly_cloudy_day: ClassVar[Symbol]
+    partly_cloudy_night: ClassVar[Symbol]
+    partner_exchange: ClassVar[Symbol]
+    partner_heart: ClassVar[Symbol]
+    partner_reports: ClassVar[Symbol]
+    party_mode: ClassVar[Symbol]
+    passkey: ClassVar[Symbol]
+    password: ClassVar[Symbol]
+    password_2: ClassVar[Symbol]
+    password_2_off: ClassVar[Symbol]
+    patient_list: ClassVar[Symbol]
+    pattern: ClassVar[Symbol]
+    pause: ClassVar[Symbol]
+    pause_circle: ClassVar[Symbol]
+    pause_circle_filled: ClassVar[Symbol]
+    pause_circle_outline: ClassVar[Symbol]
+    pause_presentation: ClassVar[Symbol]
+    payment: ClassVar[Symbol]
+    payment_arrow_down: ClassVar[Symbol]
+    payment_card: ClassVar[Symbol]
+    payments: ClassVar[Symbol]
+    pedal_bike: ClassVar[Symbol]
+    pediatrics: ClassVar[Symbol]
+    pen_size_1: ClassVar[Symbol]
+    pen_size_2: ClassVar[Symbol]
+    pen_size_3: ClassVar[Symbol]
+    pen_size_4: ClassVar[Symbol]
+    pen_size_5: ClassVar[Symbol]
+    pending: ClassVar[Symbol]
+    pending_actions: ClassVar[Symbol]
+    pentagon: ClassVar[Symbol]
+    people: ClassVar[Symbol]
+    people_alt: ClassVar[Symbol]
+    people_outline: ClassVar[Symbol]
+    percent: ClassVar[Symbol]
+    percent_discount: ClassVar[Symbol]
+    performance_max: ClassVar[Symbol]
+    pergola: ClassVar[Symbol]
+    perm_camera_mic: ClassVar[Symbol]
+    perm_contact_calendar: ClassVar[Symbol]
+    perm_data_setting: ClassVar[Symbol]
+    perm_device_information: ClassVar[Symbol]
+    perm_identity: ClassVar[Symbol]
+    perm_media: ClassVar[Symbol]
+    perm_phone_msg: ClassVar[Symbol]
+    perm_scan_wifi: ClassVar[Symbol]
+    person: ClassVar[Symbol]
+    person_2: ClassVar[Symbol]
+    person_3: ClassVar[Symbol]
+    person_4: ClassVar[Symbol]
+    person_add: ClassVar[Symbol]
+    person_add_alt: ClassVar[Symbol]
+    person_add_disabled: ClassVar[Symbol]
+    person_alert: ClassVar[Symbol]
+    person_apron: ClassVar[Symbol]
+    person_book: ClassVar[Symbol]
+    person_cancel: ClassVar[Symbol]
+    person_celebrate: ClassVar[Symbol]
+    person_check: ClassVar[Symbol]
+    person_edit: ClassVar[Symbol]
+    person_filled: ClassVar[Symbol]
+    person_heart: ClassVar[Symbol]
+    person_off: ClassVar[Symbol]
+    person_outline: ClassVar[Symbol]
+    person_pin: ClassVar[Symbol]
+    person_pin_circle: ClassVar[Symbol]
+    person_play: ClassVar[Symbol]
+    person_raised_hand: ClassVar[Symbol]
+    person_remove: ClassVar[Symbol]
+    person_search: ClassVar[Symbol]
+    person_shield: ClassVar[Symbol]
+    personal_bag: ClassVar[Symbol]
+    personal_bag_off: ClassVar[Symbol]
+    personal_bag_question: ClassVar[Symbol]
+    personal_injury: ClassVar[Symbol]
+    personal_places: ClassVar[Symbol]
+    personal_video: ClassVar[Symbol]
+    pest_control: ClassVar[Symbol]
+    pest_control_rodent: ClassVar[Symbol]
+    pet_supplies: ClassVar[Symbol]
+    pets: ClassVar[Symbol]
+    phishing: ClassVar[Symbol]
+    phone: ClassVar[Symbol]
+    phone_alt: ClassVar[Symbol]
+    phone_android: ClassVar[Symbol]
+    phone_bluetooth_speaker: ClassVar[Symbol]
+    phone_callback: ClassVar[Symbol]
+    phone_disabled: ClassVar[Symbol]
+    phone_enabled: ClassVar[Symbol]
+    phone_forwarded: ClassVar[Symbol]
+    phone_in_talk: ClassVar[Symbol]
+    phone_iphone: ClassVar[Symbol]
+    phone_locked: ClassVar[Symbol]
+    phone_missed: ClassVar[Symbol]
+    phone_paused: ClassVar[Symbol]
+    phonelink: ClassVar[Symbol]
+    phonelink_erase: ClassVar[Symbol]
+    phonelink_lock: ClassVar[Symbol]
+    phonelink_off: ClassVar[Symbol]
+    phonelink_ring: ClassVar[Symbol]
+    phonelink_ring_off: ClassVar[Symbol]
+    phonelink_setup: ClassVar[Symbol]
+    photo: ClassVar[Symbol]
+    photo_album: ClassVar[Symbol]
+    photo_auto_merge: ClassVar[Symbol]
+    photo_camera: ClassVar[Symbol]
+    photo_camera_back: ClassVar[Symbol]
+    photo_camera_front: ClassVar[Symbol]
+    photo_filter: ClassVar[Symbol]
+    photo_frame: ClassVar[Symbol]
+    photo_library: ClassVar[Symbol]
+    photo_prints: ClassVar[Symbol]
+    photo_size_select_actual: ClassVar[Symbol]
+    photo_size_select_large: ClassVar[Symbol]
+    photo_size_select_small: ClassVar[Symbol]
+    php: ClassVar[Symbol]
+    physical_therapy: ClassVar[Symbol]
+    piano: ClassVar[Symbol]
+    piano_off: ClassVar[Symbol]
+    pickleball: ClassVar[Symbol]
+    picture_as_pdf: ClassVar[Symbol]
+    picture_in_picture: ClassVar[Symbol]
+    picture_in_picture_alt: ClassVar[Symbol]
+    picture_in_picture_center: ClassVar[Symbol]
+    picture_in_picture_large: ClassVar[Symbol]
+    picture_in_picture_medium: ClassVar[Symbol]
+    picture_in_picture_mobile: ClassVar[Symbol]
+    picture_in_picture_off: ClassVar[Symbol]
+    picture_in_picture_small: ClassVar[Symbol]
+    pie_chart: ClassVar[Symbol]
+    pie_chart_filled: ClassVar[Symbol]
+    pie_chart_outline: ClassVar[Symbol]
+    pie_chart_outlined: ClassVar[Symbol]
+    pill: ClassVar[Symbol]
+    pill_off: ClassVar[Symbol]
+    pin: ClassVar[Symbol]
+    pin_drop: ClassVar[Symbol]
+    pin_end: ClassVar[Symbol]
+    pin_invoke: ClassVar[Symbol]
+    pinboard: ClassVar[Symbol]
+    pinboard_unread: ClassVar[Symbol]
+    pinch: ClassVar[Symbol]
+    pinch_zoom_in: ClassVar[Symbol]
+    pinch_zoom_out: ClassVar[Symbol]
+    pip: ClassVar[Symbol]
+    pip_exit: ClassVar[Symbol]
+    pivot_table_chart: ClassVar[Symbol]
+    place: ClassVar[Symbol]
+    place_item: ClassVar[Symbol]
+    plagiarism: ClassVar[Symbol]
+    plane_contrails: ClassVar[Symbol]
+    planet: ClassVar[Symbol]
+    planner_banner_ad_pt: ClassVar[Symbol]
+    planner_review: ClassVar[Symbol]
+    play_arrow: ClassVar[Symbol]
+    play_circle: ClassVar[Symbol]
+    play_disabled: ClassVar[Symbol]
+    play_for_work: ClassVar[Symbol]
+    play_lesson: ClassVar[Symbol]
+    play_music: ClassVar[Symbol]
+    play_pause: ClassVar[Symbol]
+    play_shapes: ClassVar[Symbol]
+    playground: ClassVar[Symbol]
+    playground_2: ClassVar[Symbol]
+    playing_cards: ClassVar[Symbol]
+    playlist_add: ClassVar[Symbol]
+    playlist_add_check: ClassVar[Symbol]
+    playlist_add_check_circle: ClassVar[Symbol]
+    playlist_add_circle: ClassVar[Symbol]
+    playlist_play: ClassVar[Symbol]
+    playlist_remove: ClassVar[Symbol]
+    plug_connect: ClassVar[Symbol]
+    plumbing: ClassVar[Symbol]
+    plus_one: ClassVar[Symbol]
+    podcasts: ClassVar[Symbol]
+    podiatry: ClassVar[Symbol]
+    podium: ClassVar[Symbol]
+    point_of_sale: ClassVar[Symbol]
+    point_scan: ClassVar[Symbol]
+    poker_chip: ClassVar[Symbol]
+    policy: ClassVar[Symbol]
+    policy_alert: ClassVar[Symbol]
+    poll: ClassVar[Symbol]
+    polyline: ClassVar[Symbol]
+    polymer: ClassVar[Symbol]
+    pool: ClassVar[Symbol]
+    portable_wifi_off: ClassVar[Symbol]
+    portrait: ClassVar[Symbol]
+    position_bottom_left: ClassVar[Symbol]
+    position_bottom_right: ClassVar[Symbol]
+    position_top_right: ClassVar[Symbol]
+    post: ClassVar[Symbol]
+    post_add: ClassVar[Symbol]
+    potted_plant: ClassVar[Symbol]
+    power: ClassVar[Symbol]
+    power_input: ClassVar[Symbol]
+    power_off: ClassVar[Symbol]
+    power_rounded: ClassVar[Symbol]
+    power_settings_circle: ClassVar[Symbol]
+    power_settings_new: ClassVar[Symbol]
+    prayer_times: ClassVar[Symbol]
+    precision_manufacturing: ClassVar[Symbol]
+    pregnancy: ClassVar[Symbol]
+    pregnant_woman: ClassVar[Symbol]
+    preliminary: ClassVar[Symbol]
+    prescriptions: ClassVar[Symbol]
+    present_to_all: ClassVar[Symbol]
+    preview: ClassVar[Symbol]
+    preview_off: ClassVar[Symbol]
+    price_change: ClassVar[Symbol]
+    price_check: ClassVar[Symbol]
+    print: ClassVar[Symbol]
+    print_add: ClassVar[Symbol]
+    print_connect: ClassVar[Symbol]
+    print_disabled: ClassVar[Symbol]
+    print_error: ClassVar[Symbol]
+    print_lock: ClassVar[Symbol]
+    priority: ClassVar[Symbol]
+    priority_high: ClassVar[Symbol]
+    privacy: ClassVar[Symbol]
+    privacy_tip: ClassVar[Symbol]
+    private_connectivity: ClassVar[Symbol]
+    problem: ClassVar[Symbol]
+    procedure: ClassVar[Symbol]
+    process_chart: ClassVar[Symbol]
+    production_quantity_limits: ClassVar[Symbol]
+    productivity: ClassVar[Symbol]
+    progress_activity: ClassVar[Symbol]
+    prompt_suggestion: ClassVar[Symbol]
+    propane: ClassVar[Symbol]
+    propane_tank: ClassVar[Symbol]
+    psychiatry: ClassVar[Symbol]
+    psychology: ClassVar[Symbol]
+    psychology_alt: ClassVar[Symbol]
+    public: ClassVar[Symbol]
+    public_off: ClassVar[Symbol]
+    publish: ClassVar[Symbol]
+    published_with_changes: ClassVar[Symbol]
+    pulmonology: ClassVar[Symbol]
+    pulse_alert: ClassVar[Symbol]
+    punch_clock: ClassVar[Symbol]
+    push_pin: ClassVar[Symbol]
+    qr_code: ClassVar[Symbol]
+    qr_code_2: ClassVar[Symbol]
+    qr_code_2_add: ClassVar[Symbol]
+    qr_code_scanner: ClassVar[Symbol]
+    query_builder: ClassVar[Symbol]
+    query_stats: ClassVar[Symbol]
+    question_answer: ClassVar[Symbol]
+    question_exchange: ClassVar[Symbol]
+    question_mark: ClassVar[Symbol]
+    queue: ClassVar[Symbol]
+    queue_music: ClassVar[Symbol]
+    queue_play_next: ClassVar[Symbol]
+    quick_phrases: ClassVar[Symbol]
+    quick_reference: ClassVar[Symbol]
+    quick_reference_all: ClassVar[Symbol]
+    quick_reorder: ClassVar[Symbol]
+    quickreply: ClassVar[Symbol]
+    quiet_time: ClassVar[Symbol]
+    quiet_time_active: ClassVar[Symbol]
+    quiz: ClassVar[Symbol]
+    r_mobiledata: ClassVar[Symbol]
+    radar: ClassVar[Symbol]
+    radio: ClassVar[Symbol]
+    radio_button_checked: ClassVar[Symbol]
+    radio_button_partial: ClassVar[Symbol]
+    radio_button_unchecked: ClassVar[Symbol]
+    radiology: ClassVar[Symbol]
+    railway_alert: ClassVar[Symbol]
+    railway_alert_2: ClassVar[Symbol]
+    rainy: ClassVar[Symbol]
+    rainy_heavy: ClassVar[Symbol]
+    rainy_light: ClassVar[Symbol]
+    rainy_snow: ClassVar[Symbol]
+    ramen_dining: ClassVar[Symbol]
+    ramp_left: ClassVar[Symbol]
+    ramp_right: ClassVar[Symbol]
+    range_hood: ClassVar[Symbol]
+    rate_review: ClassVar[Symbol]
+    rate_review_rtl: ClassVar[Symbol]
+    raven: ClassVar[Symbol]
+    raw_off: ClassVar[Symbol]
+    raw_on: ClassVar[Symbol]
+    read_more: ClassVar[Symbol]
+    readiness_score: ClassVar[Symbol]
+    real_estate_agent: ClassVar[Symbol]
+    rear_camera: ClassVar[Symbol]
+    rebase: ClassVar[Symbol]
+    rebase_edit: ClassVar[Symbol]
+    receipt: ClassVar[Symbol]
+    receipt_long: ClassVar[Symbol]
+    receipt_long_off: ClassVar[Symbol]
+    recent_actors: ClassVar[Symbol]
+    recent_patient: ClassVar[Symbol]
+    recenter: ClassVar[Symbol]
+    recommend: ClassVar[Symbol]
+    record_voice_over: ClassVar[Symbol]
+    rectangle: ClassVar[Symbol]
+    recycling: ClassVar[Symbol]
+    redeem: ClassVar[Symbol]
+    redo: ClassVar[Symbol]
+    reduce_capacity: ClassVar[Symbol]
+    refresh: ClassVar[Symbol]
+    regular_expression: ClassVar[Symbol]
+    relax: ClassVar[Symbol]
+    release_alert: ClassVar[Symbol]
+    remember_me: ClassVar[Symbol]
+    reminder: ClassVar[Symbol]
+    reminders_alt: ClassVar[Symbol]
+    remote_gen: ClassVar[Symbol]
+    remove: ClassVar[Symbol]
+    remove_circle: ClassVar[Symbol]
+    remove_circle_outline: ClassVar[Symbol]
+    remove_done: ClassVar[Symbol]
+    remove_from_queue: ClassVar[Symbol]
+    remove_moderator: ClassVar[Symbol]
+    remove_red_eye: ClassVar[Symbol]
+    remove_road: ClassVar[Symbol]
+    remove_selection: ClassVar[Symbol]
+    remove_shopping_cart: ClassVar[Symbol]
+    reopen_window: ClassVar[Symbol]
+    reorder: ClassVar[Symbol]
+    repartition: ClassVar[Symbol]
+    repeat: ClassVar[Symbol]
+    repeat_on: ClassVar[Symbol]
+    repeat_one: ClassVar[Symbol]
+    repeat_one_on: ClassVar[Symbol]
+    replace_audio: ClassVar[Symbol]
+    replace_image: ClassVar[Symbol]
+    replace_video: ClassVar[Symbol]
+    replay: ClassVar[Symbol]
+    replay_10: ClassVar[Symbol]
+    replay_30: ClassVar[Symbol]
+    replay_5: ClassVar[Symbol]
+    replay_circle_filled: ClassVar[Symbol]
+    reply: ClassVar[Symbol]
+    reply_all: ClassVar[Symbol]
+    report: ClassVar[Symbol]
+    report_gmailerrorred: ClassVar[Symbol]
+    report_off: ClassVar[Symbol]
+    report_problem: ClassVar[Symbol]
+    request_page: ClassVar[Symbol]
+    request_quote: ClassVar[Symbol]
+    reset_brightness: ClassVar[Symbol]
+    reset_exposure: ClassVar[Symbol]
+    reset_focus: ClassVar[Symbol]
+    reset_image: ClassVar[Symbol]
+    reset_iso: ClassVar[Symbol]
+    reset_settings: ClassVar[Symbol]
+    reset_shadow: ClassVar[Symbol]
+    reset_shutter_speed: ClassVar[Symbol]
+    reset_tv: ClassVar[Symbol]
+    reset_white_balance: ClassVar[Symbol]
+    reset_wrench: ClassVar[Symbol]
+    resize: ClassVar[Symbol]
+    respiratory_rate: ClassVar[Symbol]
+    responsive_layout: ClassVar[Symbol]
+    rest_area: ClassVar[Symbol]
+    restart_alt: ClassVar[Symbol]
+    restaurant: ClassVar[Symbol]
+    restaurant_menu: ClassVar[Symbol]
+    restore: ClassVar[Symbol]
+    restore_from_trash: ClassVar[Symbol]
+    restore_page: ClassVar[Symbol]
+    resume: ClassVar[Symbol]
+    reviews: ClassVar[Symbol]
+    rewarded_ads: ClassVar[Symbol]
+    rheumatology: ClassVar[Symbol]
+    rib_cage: ClassVar[Symbol]
+    rice_bowl: ClassVar[Symbol]
+    right_click: ClassVar[Symbol]
+    right_panel_close: ClassVar[Symbol]
+    right_panel_open: ClassVar[Symbol]
+    ring_volume: ClassVar[Symbol]
+    ring_volume_filled: ClassVar[Symbol]
+    ripples: ClassVar[Symbol]
+    road: ClassVar[Symbol]
+    robot: ClassVar[Symbol]
+    robot_2: ClassVar[Symbol]
+    rocket: ClassVar[Symbol]
+    rocket_launch: ClassVar[Symbol]
+    roller_shades: ClassVar[Symbol]
+    roller_shades_closed: ClassVar[Symbol]
+    roller_skating: ClassVar[Symbol]
+    roofing: ClassVar[Symbol]
+    room: ClassVar[Symbol]
+    room_preferences: ClassVar[Symbol]
+    room_service: ClassVar[Symbol]
+    rotate_90_degrees_ccw: ClassVar[Symbol]
+    rotate_90_degrees_cw: ClassVar[Symbol]
+    rotate_auto: ClassVar[Symbol]
+    rotate_left: ClassVar[Symbol]
+    rotate_right: ClassVar[Symbol]
+    roundabout_left: ClassVar[Symbol]
+    roundabout_right: ClassVar[Symbol]
+    rounded_corner: ClassVar[Symbol]
+    route: ClassVar[Symbol]
+    router: ClassVar[Symbol]
+    router_off: ClassVar[Symbol]
+    routine: ClassVar[Symbol]
+    rowing: ClassVar[Symbol]
+    rss_feed: ClassVar[Symbol]
+    rsvp: ClassVar[Symbol]
+    rtt: ClassVar[Symbol]
+    rubric: ClassVar[Symbol]
+    rule: ClassVar[Symbol]
+    rule_folder: ClassVar[Symbol]
+    rule_settings: ClassVar[Symbol]
+    run_circle: ClassVar[Symbol]
+    running_with_errors: ClassVar[Symbol]
+    rv_hookup: ClassVar[Symbol]
+    safety_check: ClassVar[Symbol]
+    safety_check_off: ClassVar[Symbol]
+    safety_divider: ClassVar[Symbol]
+    sailing: ClassVar[Symbol]
+    salinity: ClassVar[Symbol]
+    sanitizer: ClassVar[Symbol]
+    satellite: ClassVar[Symbol]
+    satellite_alt: ClassVar[Symbol]
+    sauna: ClassVar[Symbol]
+    save: ClassVar[Symbol]
+    save_alt: ClassVar[Symbol]
+    save_as: ClassVar[Symbol]
+    save_clock: ClassVar[Symbol]
+    saved_search: ClassVar[Symbol]
+    savings: ClassVar[Symbol]
+    scale: ClassVar[Symbol]
+    scan: ClassVar[Symbol]
+    scan_delete: ClassVar[Symbol]
+    scanner: ClassVar[Symbol]
+    scatter_plot: ClassVar[Symbol]
+    scene: ClassVar[Symbol]
+    schedule: ClassVar[Symbol]
+    schedule_send: ClassVar[Symbol]
+    schema: ClassVar[Symbol]
+    school: ClassVar[Symbol]
+    science: ClassVar[Symbol]
+    science_off: ClassVar[Symbol]
+    scooter: ClassVar[Symbol]
+    score: ClassVar[Symbol]
+    scoreboard: ClassVar[Symbol]
+    screen_lock_landscape: ClassVar[Symbol]
+    screen_lock_portrait: ClassVar[Symbol]
+    screen_lock_rotation: ClassVar[Symbol]
+    screen_record: ClassVar[Symbol]
+    screen_rotation: ClassVar[Symbol]
+    screen_rotation_alt: ClassVar[Symbol]
+    screen_rotation_up: ClassVar[Symbol]
+    screen_search_desktop: ClassVar[Symbol]
+    screen_share: ClassVar[Symbol]
+    screenshot: ClassVar[Symbol]
+    screenshot_frame: ClassVar[Symbol]
+    screenshot_frame_2: ClassVar[Symbol]
+    screenshot_keyboard: ClassVar[Symbol]
+    screenshot_monitor: ClassVar[Symbol]
+    screenshot_region: ClassVar[Symbol]
+    screenshot_tablet: ClassVar[Symbol]
+    script: ClassVar[Symbol]
+    scrollable_header: ClassVar[Symbol]
+    scuba_diving: ClassVar[Symbol]
+    sd: ClassVar[Symbol]
+    sd_card: ClassVar[Symbol]
+    sd_card_alert: ClassVar[Symbol]
+    sd_storage: ClassVar[Symbol]
+    sdk: ClassVar[Symbol]
+    search: ClassVar[Symbol]
+    search_activity: ClassVar[Symbol]
+    search_check: ClassVar[Symbol]
+    search_check_2: ClassVar[Symbol]
+    search_gear: ClassVar[Symbol]
+    search_hands_free: ClassVar[Symbol]
+    search_insights: ClassVar[Symbol]
+    search_off: ClassVar[Symbol]
+    seat_cool_left: ClassVar[Symbol]
+    seat_cool_right: ClassVar[Symbol]
+    seat_heat_left: ClassVar[Symbol]
+    seat_heat_right: ClassVar[Symbol]
+    seat_vent_left: ClassVar[Symbol]
+    seat_vent_right: ClassVar[Symbol]
+    security: ClassVar[Symbol]
+    security_key: ClassVar[Symbol]
+    security_update: ClassVar[Symbol]
+    security_update_good: ClassVar[Symbol]
+    security_update_warning: ClassVar[Symbol]
+    segment: ClassVar[Symbol]
+    select: ClassVar[Symbol]
+    select_all: ClassVar[Symbol]
+    select_check_box: ClassVar[Symbol]
+    select_to_speak: ClassVar[Symbol]
+    select_window: ClassVar[Symbol]
+    select_window_2: ClassVar[Symbol]
+    select_window_off: ClassVar[Symbol]
+    self_care: ClassVar[Symbol]
+    self_improvement: ClassVar[Symbol]
+    sell: ClassVar[Symbol]
+    send: ClassVar[Symbol]
+    send_and_archive: ClassVar[Symbol]
+    send_money: ClassVar[Symbol]
+    send_time_extension: ClassVar[Symbol]
+    send_to_mobile: ClassVar[Symbol]
+    sensor_door: ClassVar[Symbol]
+    sensor_occupied: ClassVar[Symbol]
+    sensor_window: ClassVar[Symbol]
+    sensors: ClassVar[Symbol]
+    sensors_krx: ClassVar[Symbol]
+    sensors_krx_off: ClassVar[Symbol]
+    sensors_off: ClassVar[Symbol]
+    sentiment_calm: ClassVar[Symbol]
+    sentiment_content: ClassVar[Symbol]
+    sentiment_dissatisfied: ClassVar[Symbol]
+    sentiment_excited: ClassVar[Symbol]
+    sentiment_extremely_dissatisfied: ClassVar[Symbol]
+    sentiment_frustrated: ClassVar[Symbol]
+    sentiment_neutral: ClassVar[Symbol]
+    sentiment_sad: ClassVar[Symbol]
+    sentiment_satisfied: ClassVar[Symbol]
+    sentiment_satisfied_alt: ClassVar[Symbol]
+    sentiment_stressed: ClassVar[Symbol]
+    sentiment_very_dissatisfied: ClassVar[Symbol]
+    sentiment_very_satisfied: ClassVar[Symbol]
+    sentiment_worried: ClassVar[Symbol]
+    serif: ClassVar[Symbol]
+    server_person: ClassVar[Symbol]
+    service_toolbox: ClassVar[Symbol]
+    set_meal: ClassVar[Symbol]
+    settings: ClassVar[Symbol]
+    settings_accessibility: ClassVar[Symbol]
+    settings_account_box: ClassVar[Symbol]
+    settings_alert: ClassVar[Symbol]
+    settings_applications: ClassVar[Symbol]
+    settings_b_roll: ClassVar[Symbol]
+    settings_backup_restore: ClassVar[Symbol]
+    settings_bluetooth: ClassVar[Symbol]
+    settings_brightness: ClassVar[Symbol]
+    settings_cell: ClassVar[Symbol]
+    settings_cinematic_blur: ClassVar[Symbol]
+    settings_ethernet: ClassVar[Symbol]
+    settings_heart: ClassVar[Symbol]
+    settings_input_antenna: ClassVar[Symbol]
+    settings_input_component: ClassVar[Symbol]
+    settings_input_composite: ClassVar[Symbol]
+    settings_input_hdmi: ClassVar[Symbol]
+    settings_input_svideo: ClassVar[Symbol]
+    settings_motion_mode: ClassVar[Symbol]
+    settings_night_sight: ClassVar[Symbol]
+    settings_overscan: ClassVar[Symbol]
+    settings_panorama: ClassVar[Symbol]
+    settings_phone: ClassVar[Symbol]
+    settings_photo_camera: ClassVar[Symbol]
+    settings_power: ClassVar[Symbol]
+    settings_remote: ClassVar[Symbol]
+    settings_seating: ClassVar[Symbol]
+    settings_slow_motion: ClassVar[Symbol]
+    settings_suggest: ClassVar[Symbol]
+    settings_system_daydream: ClassVar[Symbol]
+    settings_timelapse: ClassVar[Symbol]
+    settings_video_camera: ClassVar[Symbol]
+    settings_voice: ClassVar[Symbol]
+    settop_component: ClassVar[Symbol]
+    severe_cold: ClassVar[Symbol]
+    shadow: ClassVar[Symbol]
+    shadow_add: ClassVar[Symbol]
+    shadow_minus: ClassVar[Symbol]
+    shape_line: ClassVar[Symbol]
+    shape_recognition: ClassVar[Symbol]
+    shapes: ClassVar[Symbol]
+    share: ClassVar[Symbol]
+    share_eta: ClassVar[Symbol]
+    share_location: ClassVar[Symbol]
+    share_off: ClassVar[Symbol]
+    share_reviews: ClassVar[Symbol]
+    share_windows: ClassVar[Symbol]
+    shaved_ice: ClassVar[Symbol]
+    sheets_rtl: ClassVar[Symbol]
+    shelf_auto_hide: ClassVar[Symbol]
+    shelf_position: ClassVar[Symbol]
+    shelves: ClassVar[Symbol]
+    shield: ClassVar[Symbol]
+    shield_lock: ClassVar[Symbol]
+    shield_locked: ClassVar[Symbol]
+    shield_moon: ClassVar[Symbol]
+    shield_person: ClassVar[Symbol]
+    shield_question: ClassVar[Symbol]
+    shield_toggle: ClassVar[Symbol]
+    shield_watch: ClassVar[Symbol]
+    shield_with_heart: ClassVar[Symbol]
+    shield_with_house: ClassVar[Symbol]
+    shift: ClassVar[Symbol]
+    shift_lock: ClassVar[Symbol]
+    shift_lock_off: ClassVar[Symbol]
+    shop: ClassVar[Symbol]
+    shop_2: ClassVar[Symbol]
+    shop_two: ClassVar[Symbol]
+    shopping_bag: ClassVar[Symbol]
+    shopping_bag_speed: ClassVar[Symbol]
+    shopping_basket: ClassVar[Symbol]
+    shopping_cart: ClassVar[Symbol]
+    shopping_cart_checkout: ClassVar[Symbol]
+    shopping_cart_off: ClassVar[Symbol]
+    shoppingmode: ClassVar[Symbol]
+    short_stay: ClassVar[Symbol]
+    short_text: ClassVar[Symbol]
+    shortcut: ClassVar[Symbol]
+    show_chart: ClassVar[Symbol]
+    shower: ClassVar[Symbol]
+    shuffle: ClassVar[Symbol]
+    shuffle_on: ClassVar[Symbol]
+    shutter_speed: ClassVar[Symbol]
+    shutter_speed_add: ClassVar[Symbol]
+    shutter_speed_minus: ClassVar[Symbol]
+    sick: ClassVar[Symbol]
+    side_navigation: ClassVar[Symbol]
+    sign_language: ClassVar[Symbol]
+    sign_language_2: ClassVar[Symbol]
+    signal_cellular_0_bar: ClassVar[Symbol]
+    signal_cellular_1_bar: ClassVar[Symbol]
+    signal_cellular_2_bar: ClassVar[Symbol]
+    signal_cellular_3_bar: ClassVar[Symbol]
+    signal_cellular_4_bar: ClassVar[Symbol]
+    signal_cellular_add: ClassVar[Symbol]
+    signal_cellular_alt: ClassVar[Symbol]
+    signal_cellular_alt_1_bar: ClassVar[Symbol]
+    signal_cellular_alt_2_bar: ClassVar[Symbol]
+    signal_cellular_connected_no_internet_0_bar: ClassVar[Symbol]
+    signal_cellular_connected_no_internet_4_bar: ClassVar[Symbol]
+    signal_cellular_no_sim: ClassVar[Symbol]
+    signal_cellular_nodata: ClassVar[Symbol]
+    signal_cellular_null: ClassVar[Symbol]
+    signal_cellular_off: ClassVar[Symbol]
+    signal_cellular_pause: ClassVar[Symbol]
+    signal_disconnected: ClassVar[Symbol]
+    signal_wifi_0_bar: ClassVar[Symbol]
+    signal_wifi_4_bar: ClassVar[Symbol]
+    signal_wifi_4_bar_lock: ClassVar[Symbol]
+    signal_wifi_bad: ClassVar[Symbol]
+    signal_wifi_connected_no_internet_4: ClassVar[Symbol]
+    signal_wifi_off: ClassVar[Symbol]
+    signal_wifi_statusbar_4_bar: ClassVar[Symbol]
+    signal_wifi_statusbar_not_connected: ClassVar[Symbol]
+    signal_wifi_statusbar_null: ClassVar[Symbol]
+    signature: ClassVar[Symbol]
+    signpost: ClassVar[Symbol]
+    sim_card: ClassVar[Symbol]
+    sim_card_alert: ClassVar[Symbol]
+    sim_card_download: ClassVar[Symbol]
+    simulation: ClassVar[Symbol]
+    single_bed: ClassVar[Symbol]
+    sip: ClassVar[Symbol]
+    siren: ClassVar[Symbol]
+    siren_check: ClassVar[Symbol]
+    siren_open: ClassVar[Symbol]
+    siren_question: ClassVar[Symbol]
+    skateboarding: ClassVar[Symbol]
+    skeleton: ClassVar[Symbol]
+    skillet: ClassVar[Symbol]
+    skillet_cooktop: ClassVar[Symbol]
+    skip_next: ClassVar[Symbol]
+    skip_previous: ClassVar[Symbol]
+    skull: ClassVar[Symbol]
+    skull_list: ClassVar[Symbol]
+    slab_serif: ClassVar[Symbol]
+    sledding: ClassVar[Symbol]
+    sleep: ClassVar[Symbol]
+    sleep_score: ClassVar[Symbol]
+    slide_library: ClassVar[Symbol]
+    sliders: ClassVar[Symbol]
+    slideshow: ClassVar[Symbol]
+    slow_motion_video: ClassVar[Symbol]
+    smart_button: ClassVar[Symbol]
+    smart_card_reader: ClassVar[Symbol]
+    smart_card_reader_off: ClassVar[Symbol]
+    smart_display: ClassVar[Symbol]
+    smart_outlet: ClassVar[Symbol]
+    smart_screen: ClassVar[Symbol]
+    smart_toy: ClassVar[Symbol]
+    smartphone: ClassVar[Symbol]
+    smartphone_camera: ClassVar[Symbol]
+    smb_share: ClassVar[Symbol]
+    smoke_free: ClassVar[Symbol]
+    smoking_rooms: ClassVar[Symbol]
+    sms: ClassVar[Symbol]
+    sms_failed: ClassVar[Symbol]
+    snippet_folder: ClassVar[Symbol]
+    snooze: ClassVar[Symbol]
+    snowboarding: ClassVar[Symbol]
+    snowing: ClassVar[Symbol]
+    snowing_heavy: ClassVar[Symbol]
+    snowmobile: ClassVar[Symbol]
+    snowshoeing: ClassVar[Symbol]
+    soap: ClassVar[Symbol]
+    soba: ClassVar[Symbol]
+    social_distance: ClassVar[Symbol]
+    social_leaderboard: ClassVar[Symbol]
+    solar_power: ClassVar[Symbol]
+    solo_dining: ClassVar[Symbol]
+    sort: ClassVar[Symbol]
+    sort_by_alpha: ClassVar[Symbol]
+    sos: ClassVar[Symbol]
+    sound_detection_dog_barking: ClassVar[Symbol]
+    sound_detection_glass_break: ClassVar[Symbol]
+    sound_detection_loud_sound: ClassVar[Symbol]
+    sound_sampler: ClassVar[Symbol]
+    soup_kitchen: ClassVar[Symbol]
+    source: ClassVar[Symbol]
+    source_environment: ClassVar[Symbol]
+    source_notes: ClassVar[Symbol]
+    south: ClassVar[Symbol]
+    south_america: ClassVar[Symbol]
+    south_east: ClassVar[Symbol]
+    south_west: ClassVar[Symbol]
+    spa: ClassVar[Symbol]
+    space_bar: ClassVar[Symbol]
+    space_dashboard: ClassVar[Symbol]
+    spatial_audio: ClassVar[Symbol]
+    spatial_audio_off: ClassVar[Symbol]
+    spatial_speaker: ClassVar[Symbol]
+    spatial_tracking: ClassVar[Symbol]
+    speaker: ClassVar[Symbol]
+    speaker_group: ClassVar[Symbol]
+    speaker_notes: ClassVar[Symbol]
+    speaker_notes_off: ClassVar[Symbol]
+    speaker_phone: ClassVar[Symbol]
+    special_character: ClassVar[Symbol]
+    specific_gravity: ClassVar[Symbol]
+    speech_to_text: ClassVar[Symbol]
+    speed: ClassVar[Symbol]
+    speed_0_25: ClassVar[Symbol]
+    speed_0_2x: ClassVar[Symbol]
+    speed_0_5: ClassVar[Symbol]
+    speed_0_5x: ClassVar[Symbol]
+    speed_0_75: ClassVar[Symbol]
+    speed_0_7x: ClassVar[Symbol]
+    speed_1_2: ClassVar[Symbol]
+    speed_1_25: ClassVar[Symbol]
+    speed_1_2x: ClassVar[Symbol]
+    speed_1_5: ClassVar[Symbol]
+    speed_1_5x: ClassVar[Symbol]
+    speed_1_75: ClassVar[Symbol]
+    speed_1_7x: ClassVar[Symbol]
+    speed_2x: ClassVar[Symbol]
+    speed_camera: ClassVar[Symbol]
+    spellcheck: ClassVar[Symbol]
+    split_scene: ClassVar[Symbol]
+    split_scene_down: ClassVar[Symbol]
+    split_scene_left: ClassVar[Symbol]
+    split_scene_right: ClassVar[Symbol]
+    split_scene_up: ClassVar[Symbol]
+    splitscreen: ClassVar[Symbol]
+    splitscreen_add: ClassVar[Symbol]
+    splitscreen_bottom: ClassVar[Symbol]
+    splitscreen_landscape: ClassVar[Symbol]
+    splitscreen_left: ClassVar[Symbol]
+    splitscreen_portrait: ClassVar[Symbol]
+    splitscreen_right: ClassVar[Symbol]
+    splitscreen_top: ClassVar[Symbol]
+    splitscreen_vertical_add: ClassVar[Symbol]
+    spo2: ClassVar[Symbol]
+    spoke: ClassVar[Symbol]
+    sports: ClassVar[Symbol]
+    sports_and_outdoors: ClassVar[Symbol]
+    sports_bar: ClassVar[Symbol]
+    sports_baseball: ClassVar[Symbol]
+    sports_basketball: ClassVar[Symbol]
+    sports_cricket: ClassVar[Symbol]
+    sports_esports: ClassVar[Symbol]
+    sports_football: ClassVar[Symbol]
+    sports_golf: ClassVar[Symbol]
+    sports_gymnastics: ClassVar[Symbol]
+    sports_handball: ClassVar[Symbol]
+    sports_hockey: ClassVar[Symbol]
+    sports_kabaddi: ClassVar[Symbol]
+    sports_martial_arts: ClassVar[Symbol]
+    sports_mma: ClassVar[Symbol]
+    sports_motorsports: ClassVar[Symbol]
+    sports_rugby: ClassVar[Symbol]
+    sports_score: ClassVar[Symbol]
+    sports_soccer: ClassVar[Symbol]
+    sports_tennis: ClassVar[Symbol]
+    sports_volleyball: ClassVar[Symbol]
+    sprinkler: ClassVar[Symbol]
+    sprint: ClassVar[Symbol]
+    square: ClassVar[Symbol]
+    square_dot: ClassVar[Symbol]
+    square_foot: ClassVar[Symbol]
+    ssid_chart: ClassVar[Symbol]
+    stack: ClassVar[Symbol]
+    stack_group: ClassVar[Symbol]
+    stack_hexagon: ClassVar[Symbol]
+    stack_off: ClassVar[Symbol]
+    stack_star: ClassVar[Symbol]
+    stacked_bar_chart: ClassVar[Symbol]
+    stacked_email: ClassVar[Symbol]
+    stacked_inbox: ClassVar[Symbol]
+    stacked_line_chart: ClassVar[Symbol]
+    stacks: ClassVar[Symbol]
+    stadia_controller: ClassVar[Symbol]
+    stadium: ClassVar[Symbol]
+    stairs: ClassVar[Symbol]
+    stairs_2: ClassVar[Symbol]
+    star: ClassVar[Symbol]
+    star_border: ClassVar[Symbol]
+    star_border_purple500: ClassVar[Symbol]
+    star_half: ClassVar[Symbol]
+    star_outline: ClassVar[Symbol]
+    star_purple500: ClassVar[Symbol]
+    star_rate: ClassVar[Symbol]
+    star_rate_half: ClassVar[Symbol]
+    star_shine: ClassVar[Symbol]
+    stars: ClassVar[Symbol]
+    stars_2: ClassVar[Symbol]
+    start: ClassVar[Symbol]
+    stat_0: ClassVar[Symbol]
+    stat_1: ClassVar[Symbol]
+    stat_2: ClassVar[Symbol]
+    stat_3: ClassVar[Symbol]
+    stat_minus_1: ClassVar[Symbol]
+    stat_minus_2: ClassVar[Symbol]
+    stat_minus_3: ClassVar[Symbol]
+    stay_current_landscape: ClassVar[Symbol]
+    stay_current_portrait: ClassVar[Symbol]
+    stay_primary_landscape: ClassVar[Symbol]
+    stay_primary_portrait: ClassVar[Symbol]
+    steering_wheel_heat: ClassVar[Symbol]
+    step: ClassVar[Symbol]
+    step_into: ClassVar[Symbol]
+    step_out: ClassVar[Symbol]
+    step_over: ClassVar[Symbol]
+    steppers: ClassVar[Symbol]
+    steps: ClassVar[Symbol]
+    stethoscope: ClassVar[Symbol]
+    stethoscope_arrow: ClassVar[Symbol]
+    stethoscope_check: ClassVar[Symbol]
+    sticky_note: ClassVar[Symbol]
+    sticky_note_2: ClassVar[Symbol]
+    stock_media: ClassVar[Symbol]
+    stockpot: ClassVar[Symbol]
+    stop: ClassVar[Symbol]
+    stop_circle: ClassVar[Symbol]
+    stop_screen_share: ClassVar[Symbol]
+    storage: ClassVar[Symbol]
+    store: ClassVar[Symbol]
+    store_mall_directory: ClassVar[Symbol]
+    storefront: ClassVar[Symbol]
+    storm: ClassVar[Symbol]
+    straight: ClassVar[Symbol]
+    straighten: ClassVar[Symbol]
+    strategy: ClassVar[Symbol]
+    stream: ClassVar[Symbol]
+    stream_apps: ClassVar[Symbol]
+    streetview: ClassVar[Symbol]
+    stress_management: ClassVar[Symbol]
+    strikethrough_s: ClassVar[Symbol]
+    stroke_full: ClassVar[Symbol]
+    stroke_partial: ClassVar[Symbol]
+    stroller: ClassVar[Symbol]
+    style: ClassVar[Symbol]
+    styler: ClassVar[Symbol]
+    stylus: ClassVar[Symbol]
+    stylus_brush: ClassVar[Symbol]
+    stylus_fountain_pen: ClassVar[Symbol]
+    stylus_highlighter: ClassVar[Symbol]
+    stylus_laser_pointer: ClassVar[Symbol]
+    stylus_note: ClassVar[Symbol]
+    stylus_pen: ClassVar[Symbol]
+    stylus_pencil: ClassVar[Symbol]
+    subdirectory_arrow_left: ClassVar[Symbol]
+    subdirectory_arrow_right: ClassVar[Symbol]
+    subheader: ClassVar[Symbol]
+    subject: ClassVar[Symbol]
+    subscript: ClassVar[Symbol]
+    subscriptions: ClassVar[Symbol]
+    subtitles: ClassVar[Symbol]
+    subtitles_gear: ClassVar[Symbol]
+    subtitles_off: ClassVar[Symbol]
+    subway: ClassVar[Symbol]
+    subway_walk: ClassVar[Symbol]
+    summarize: ClassVar[Symbol]
+    sunny: ClassVar[Symbol]
+    sunny_snowing: ClassVar[Symbol]
+    superscript: ClassVar[Symbol]
+    supervised_user_circle: ClassVar[Symbol]
+    supervised_user_circle_off: ClassVar[Symbol]
+    supervisor_account: ClassVar[Symbol]
+    support: ClassVar[Symbol]
+    support_agent: ClassVar[Symbol]
+    surfing: ClassVar[Symbol]
+    surgical: ClassVar[Symbol]
+    surround_sound: ClassVar[Symbol]
+    swap_calls: ClassVar[Symbol]
+    swap_driving_apps: ClassVar[Symbol]
+    swap_driving_apps_wheel: ClassVar[Symbol]
+    swap_horiz: ClassVar[Symbol]
+    swap_horizontal_circle: ClassVar[Symbol]
+    swap_vert: ClassVar[Symbol]
+    swap_vertical_circle: ClassVar[Symbol]
+    sweep: ClassVar[Symbol]
+    swipe: ClassVar[Symbol]
+    swipe_down: ClassVar[Symbol]
+    swipe_down_alt: ClassVar[Symbol]
+    swipe_left: ClassVar[Symbol]
+    swipe_left_alt: ClassVar[Symbol]
+    swipe_right: ClassVar[Symbol]
+    swipe_right_alt: ClassVar[Symbol]
+    swipe_up: ClassVar[Symbol]
+    swipe_up_alt: ClassVar[Symbol]
+    swipe_vertical: ClassVar[Symbol]
+    switch: ClassVar[Symbol]
+    switch_access: ClassVar[Symbol]
+    switch_access_2: ClassVar[Symbol]
+    switch_access_3: ClassVar[Symbol]
+    switch_access_shortcut: ClassVar[Symbol]
+    switch_access_shortcut_add: ClassVar[Symbol]
+    switch_account: ClassVar[Symbol]
+    switch_camera: ClassVar[Symbol]
+    switch_left: ClassVar[Symbol]
+    switch_right: ClassVar[Symbol]
+    switch_video: ClassVar[Symbol]
+    switches: ClassVar[Symbol]
+    sword_rose: ClassVar[Symbol]
+    swords: ClassVar[Symbol]
+    symptoms: ClassVar[Symbol]
+    synagogue: ClassVar[Symbol]
+    sync: ClassVar[Symbol]
+    sync_alt: ClassVar[Symbol]
+    sync_arrow_down: ClassVar[Symbol]
+    sync_arrow_up: ClassVar[Symbol]
+    sync_desktop: ClassVar[Symbol]
+    sync_disabled: ClassVar[Symbol]
+    sync_lock: ClassVar[Symbol]
+    sync_problem: ClassVar[Symbol]
+    sync_saved_locally: ClassVar[Symbol]
+    sync_saved_locally_off: ClassVar[Symbol]
+    syringe: ClassVar[Symbol]
+    system_security_update: ClassVar[Symbol]
+    system_security_update_good: ClassVar[Symbol]
+    system_security_update_warning: ClassVar[Symbol]
+    system_update: ClassVar[Symbol]
+    system_update_alt: ClassVar[Symbol]
+    tab: ClassVar[Symbol]
+    tab_close: ClassVar[Symbol]
+    tab_close_inactive: ClassVar[Symbol]
+    tab_close_right: ClassVar[Symbol]
+    tab_duplicate: ClassVar[Symbol]
+    tab_group: ClassVar[Symbol]
+    tab_inactive: ClassVar[Symbol]
+    tab_move: ClassVar[Symbol]
+    tab_new_right: ClassVar[Symbol]
+    tab_recent: ClassVar[Symbol]
+    tab_search: ClassVar[Symbol]
+    tab_unselected: ClassVar[Symbol]
+    table: ClassVar[Symbol]
+    table_bar: ClassVar[Symbol]
+    table_chart: ClassVar[Symbol]
+    table_chart_view: ClassVar[Symbol]
+    table_convert: ClassVar[Symbol]
+    table_edit: ClassVar[Symbol]
+    table_eye: ClassVar[Symbol]
+    table_lamp: ClassVar[Symbol]
+    table_large: ClassVar[Symbol]
+    table_restaurant: ClassVar[Symbol]
+    table_rows: ClassVar[Symbol]
+    table_rows_narrow: ClassVar[Symbol]
+    table_sign: ClassVar[Symbol]
+    table_view: ClassVar[Symbol]
+    tablet: ClassVar[Symbol]
+    tablet_android: ClassVar[Symbol]
+    tablet_camera: ClassVar[Symbol]
+    tablet_mac: ClassVar[Symbol]
+    tabs: ClassVar[Symbol]
+    tactic: ClassVar[Symbol]
+    tag: ClassVar[Symbol]
+    tag_faces: ClassVar[Symbol]
+    takeout_dining: ClassVar[Symbol]
+    takeout_dining_2: ClassVar[Symbol]
+    tamper_detection_off: ClassVar[Symbol]
+    tamper_detection_on: ClassVar[Symbol]
+    tap_and_play: ClassVar[Symbol]
+    tapas: ClassVar[Symbol]
+    target: ClassVar[Symbol]
+    task: ClassVar[Symbol]
+    task_alt: ClassVar[Symbol]
+    tatami_seat: ClassVar[Symbol]
+    taunt: ClassVar[Symbol]
+    taxi_alert: ClassVar[Symbol]
+    team_dashboard: ClassVar[Symbol]
+    temp_preferences_custom: ClassVar[Symbol]
+    temp_preferences_eco: ClassVar[Symbol]
+    temple_buddhist: ClassVar[Symbol]
+    temple_hindu: ClassVar[Symbol]
+    tenancy: ClassVar[Symbol]
+    terminal: ClassVar[Symbol]
+    terrain: ClassVar[Symbol]
+    text_ad: ClassVar[Symbol]
+    text_compare: ClassVar[Symbol]
+    text_decrease: ClassVar[Symbol]
+    text_fields: ClassVar[Symbol]
+    text_fields_alt: ClassVar[Symbol]
+    text_format: ClassVar[Symbol]
+    text_increase: ClassVar[Symbol]
+    text_rotate_up: ClassVar[Symbol]
+    text_rotate_vertical: ClassVar[Symbol]
+    text_rotation_angledown: ClassVar[Symbol]
+    text_rotation_angleup: ClassVar[Symbol]
+    text_rotation_down: ClassVar[Symbol]
+    text_rotation_none: ClassVar[Symbol]
+    text_select_end: ClassVar[Symbol]
+    text_select_jump_to_beginning: ClassVar[Symbol]
+    text_select_jump_to_end: ClassVar[Symbol]
+    text_select_move_back_character: ClassVar[Symbol]
+    text_select_move_back_word: ClassVar[Symbol]
+    text_select_move_down: ClassVar[Symbol]
+    text_select_move_forward_character: ClassVar[Symbol]
+    text_select_move_forward_word: ClassVar[Symbol]
+    text_select_move_up: ClassVar[Symbol]
+    text_select_start: ClassVar[Symbol]
+    text_snippet: ClassVar[Symbol]
+    text_to_speech: ClassVar[Symbol]
+    text_up: ClassVar[Symbol]
+    textsms: ClassVar[Symbol]
+    texture: ClassVar[Symbol]
+    texture_add: ClassVar[Symbol]
+    texture_minus: ClassVar[Symbol]
+    theater_comedy: ClassVar[Symbol]
+    theaters: ClassVar[Symbol]
+    thermometer: ClassVar[Symbol]
+    thermometer_add: ClassVar[Symbol]
+    thermometer_gain: ClassVar[Symbol]
+    thermometer_loss: ClassVar[Symbol]
+    thermometer_minus: ClassVar[Symbol]
+    thermostat: ClassVar[Symbol]
+    thermostat_arrow_down: ClassVar[Symbol]
+    thermostat_arrow_up: ClassVar[Symbol]
+    thermostat_auto: ClassVar[Symbol]
+    thermostat_carbon: ClassVar[Symbol]
+    things_to_do: ClassVar[Symbol]
+    thread_unread: ClassVar[Symbol]
+    threat_intelligence: ClassVar[Symbol]
+    thumb_down: ClassVar[Symbol]
+    thumb_down_alt: ClassVar[Symbol]
+    thumb_down_filled: ClassVar[Symbol]
+    thumb_down_off: ClassVar[Symbol]
+    thumb_down_off_alt: ClassVar[Symbol]
+    thumb_up: ClassVar[Symbol]
+    thumb_up_alt: ClassVar[Symbol]
+    thumb_up_filled: ClassVar[Symbol]
+    thumb_up_off: ClassVar[Symbol]
+    thumb_up_off_alt: ClassVar[Symbol]
+    thumbnail_bar: ClassVar[Symbol]
+    thumbs_up_double: ClassVar[Symbol]
+    thumbs_up_down: ClassVar[Symbol]
+    thunderstorm: ClassVar[Symbol]
+    tibia: ClassVar[Symbol]
+    tibia_alt: ClassVar[Symbol]
+    tile_large: ClassVar[Symbol]
+    tile_medium: ClassVar[Symbol]
+    tile_small: ClassVar[Symbol]
+    time_auto: ClassVar[Symbol]
+    time_to_leave: ClassVar[Symbol]
+    timelapse: ClassVar[Symbol]
+    timeline: ClassVar[Symbol]
+    timer: ClassVar[Symbol]
+    timer_1: ClassVar[Symbol]
+    timer_10: ClassVar[Symbol]
+    timer_10_alt_1: ClassVar[Symbol]
+    timer_10_select: ClassVar[Symbol]
+    timer_2: ClassVar[Symbol]
+    timer_3: ClassVar[Symbol]
+    timer_3_alt_1: ClassVar[Symbol]
+    timer_3_select: ClassVar[Symbol]
+    timer_5: ClassVar[Symbol]
+    timer_5_shutter: ClassVar[Symbol]
+    timer_arrow_down: ClassVar[Symbol]
+    timer_arrow_up: ClassVar[Symbol]
+    timer_off: ClassVar[Symbol]
+    timer_pause: ClassVar[Symbol]
+    timer_play: ClassVar[Symbol]
+    tips_and_updates: ClassVar[Symbol]
+    tire_repair: ClassVar[Symbol]
+    title: ClassVar[Symbol]
+    titlecase: ClassVar[Symbol]
+    toast: ClassVar[Symbol]
+    toc: ClassVar[Symbol]
+    today: ClassVar[Symbol]
+    toggle_off: ClassVar[Symbol]
+    toggle_on: ClassVar[Symbol]
+    token: ClassVar[Symbol]
+    toll: ClassVar[Symbol]
+    tonality: ClassVar[Symbol]
+    tonality_2: ClassVar[Symbol]
+    toolbar: ClassVar[Symbol]
+    tools_flat_head: ClassVar[Symbol]
+    tools_installation_kit: ClassVar[Symbol]
+    tools_ladder: ClassVar[Symbol]
+    tools_level: ClassVar[Symbol]
+    tools_phillips: ClassVar[Symbol]
+    tools_pliers_wire_stripper: ClassVar[Symbol]
+    tools_power_drill: ClassVar[Symbol]
+    tools_wrench: ClassVar[Symbol]
+    tooltip: ClassVar[Symbol]
+    tooltip_2: ClassVar[Symbol]
+    top_panel_close: ClassVar[Symbol]
+    top_panel_open: ClassVar[Symbol]
+    topic: ClassVar[Symbol]
+    tornado: ClassVar[Symbol]
+    total_dissolved_solids: ClassVar[Symbol]
+    touch_app: ClassVar[Symbol]
+    touch_double: ClassVar[Symbol]
+    touch_long: ClassVar[Symbol]
+    touch_triple: ClassVar[Symbol]
+    touchpad_mouse: ClassVar[Symbol]
+    touchpad_mouse_off: ClassVar[Symbol]
+    tour: ClassVar[Symbol]
+    toys: ClassVar[Symbol]
+    toys_and_games: ClassVar[Symbol]
+    toys_fan: ClassVar[Symbol]
+    track_changes: ClassVar[Symbol]
+    trackpad_input: ClassVar[Symbol]
+    trackpad_input_2: ClassVar[Symbol]
+    trackpad_input_3: ClassVar[Symbol]
+    traffic: ClassVar[Symbol]
+    traffic_jam: ClassVar[Symbol]
+    trail_length: ClassVar[Symbol]
+    trail_length_medium: ClassVar[Symbol]
+    trail_length_short: ClassVar[Symbol]
+    train: ClassVar[Symbol]
+    tram: ClassVar[Symbol]
+    transcribe: ClassVar[Symbol]
+    transfer_within_a_station: ClassVar[Symbol]
+    transform: ClassVar[Symbol]
+    transgender: ClassVar[Symbol]
+    transit_enterexit: ClassVar[Symbol]
+    transit_ticket: ClassVar[Symbol]
+    transition_chop: ClassVar[Symbol]
+    transition_dissolve: ClassVar[Symbol]
+    transition_fade: ClassVar[Symbol]
+    transition_push: ClassVar[Symbol]
+    transition_slide: ClassVar[Symbol]
+    translate: ClassVar[Symbol]
+    translate_indic: ClassVar[Symbol]
+    transportation: ClassVar[Symbol]
+    travel: ClassVar[Symbol]
+    travel_explore: ClassVar[Symbol]
+    travel_luggage_and_bags: ClassVar[Symbol]
+    trending_down: ClassVar[Symbol]
+    trending_flat: ClassVar[Symbol]
+    trending_up: ClassVar[Symbol]
+    trip: ClassVar[Symbol]
+    trip_origin: ClassVar[Symbol]
+    trolley: ClassVar[Symbol]
+    trolley_cable_car: ClassVar[Symbol]
+    trophy: ClassVar[Symbol]
+    troubleshoot: ClassVar[Symbol]
+    try_: ClassVar[Symbol]
+    tsunami: ClassVar[Symbol]
+    tsv: ClassVar[Symbol]
+    tty: ClassVar[Symbol]
+    tune: ClassVar[Symbol]
+    tungsten: ClassVar[Symbol]
+    turn_left: ClassVar[Symbol]
+    turn_right: ClassVar[Symbol]
+    turn_sharp_left: ClassVar[Symbol]
+    turn_sharp_right: ClassVar[Symbol]
+    turn_slight_left: ClassVar[Symbol]
+    turn_slight_right: ClassVar[Symbol]
+    turned_in: ClassVar[Symbol]
+    turned_in_not: ClassVar[Symbol]
+    tv: ClassVar[Symbol]
+    tv_displays: ClassVar[Symbol]
+    tv_gen: ClassVar[Symbol]
+    tv_guide: ClassVar[Symbol]
+    tv_next: ClassVar[Symbol]
+    tv_off: ClassVar[Symbol]
+    tv_options_edit_channels: ClassVar[Symbol]
+    tv_options_input_settings: ClassVar[Symbol]
+    tv_remote: ClassVar[Symbol]
+    tv_signin: ClassVar[Symbol]
+    tv_with_assistant: ClassVar[Symbol]
+    two_pager: ClassVar[Symbol]
+    two_pager_store: ClassVar[Symbol]
+    two_wheeler: ClassVar[Symbol]
+    type_specimen: ClassVar[Symbol]
+    u_turn_left: ClassVar[Symbol]
+    u_turn_right: ClassVar[Symbol]
+    udon: ClassVar[Symbol]
+    ulna_radius: ClassVar[Symbol]
+    ulna_radius_alt: ClassVar[Symbol]
+    umbrella: ClassVar[Symbol]
+    unarchive: ClassVar[Symbol]
+    undo: ClassVar[Symbol]
+    unfold_less: ClassVar[Symbol]
+    unfold_less_double: ClassVar[Symbol]
+    unfold_more: ClassVar[Symbol]
+    unfold_more_double: ClassVar[Symbol]
+    ungroup: ClassVar[Symbol]
+    universal_currency: ClassVar[Symbol]
+    universal_currency_alt: ClassVar[Symbol]
+    universal_local: ClassVar[Symbol]
+    unknown_2: ClassVar[Symbol]
+    unknown_5: ClassVar[Symbol]
+    unknown_7: ClassVar[Symbol]
+    unknown_document: ClassVar[Symbol]
+    unknown_med: ClassVar[Symbol]
+    unlicense: ClassVar[Symbol]
+    unpaved_road: ClassVar[Symbol]
+    unpin: ClassVar[Symbol]
+    unpublished: ClassVar[Symbol]
+    unsubscribe: ClassVar[Symbol]
+    upcoming: ClassVar[Symbol]
+    update: ClassVar[Symbol]
+    update_disabled: ClassVar[Symbol]
+    upgrade: ClassVar[Symbol]
+    upi_pay: ClassVar[Symbol]
+    upload: ClassVar[Symbol]
+    upload_2: ClassVar[Symbol]
+    upload_file: ClassVar[Symbol]
+    uppercase: ClassVar[Symbol]
+    urology: ClassVar[Symbol]
+    usb: ClassVar[Symbol]
+    usb_off: ClassVar[Symbol]
+    user_attributes: ClassVar[Symbol]
+    vaccines: ClassVar[Symbol]
+    vacuum: ClassVar[Symbol]
+    valve: ClassVar[Symbol]
+    vape_free: ClassVar[Symbol]
+    vaping_rooms: ClassVar[Symbol]
+    variable_add: ClassVar[Symbol]
+    variable_insert: ClassVar[Symbol]
+    variable_remove: ClassVar[Symbol]
+    variables: ClassVar[Symbol]
+    ventilator: ClassVar[Symbol]
+    verified: ClassVar[Symbol]
+    verified_off: ClassVar[Symbol]
+    verified_user: ClassVar[Symbol]
+    vertical_align_bottom: ClassVar[Symbol]
+    vertical_align_center: ClassVar[Symbol]
+    vertical_align_top: ClassVar[Symbol]
+    vertical_distribute: ClassVar[Symbol]
+    vertical_shades: ClassVar[Symbol]
+    vertical_shades_closed: ClassVar[Symbol]
+    vertical_split: ClassVar[Symbol]
+    vibration: ClassVar[Symbol]
+    video_call: ClassVar[Symbol]
+    video_camera_back: ClassVar[Symbol]
+    video_camera_back_add: ClassVar[Symbol]
+    video_camera_front: ClassVar[Symbol]
+    video_camera_front_off: ClassVar[Symbol]
+    video_chat: ClassVar[Symbol]
+    video_file: ClassVar[Symbol]
+    video_label: ClassVar[Symbol]
+    video_library: ClassVar[Symbol]
+    video_search: ClassVar[Symbol]
+    video_settings: ClassVar[Symbol]
+    video_stable: ClassVar[Symbol]
+    videocam: ClassVar[Symbol]
+    videocam_alert: ClassVar[Symbol]
+    videocam_off: ClassVar[Symbol]
+    videogame_asset: ClassVar[Symbol]
+    videogame_asset_off: ClassVar[Symbol]
+    view_agenda: ClassVar[Symbol]
+    view_apps: ClassVar[Symbol]
+    view_array: ClassVar[Symbol]
+    view_carousel: ClassVar[Symbol]
+    view_column: ClassVar[Symbol]
+    view_column_2: ClassVar[Symbol]
+    view_comfy: ClassVar[Symbol]
+    view_comfy_alt: ClassVar[Symbol]
+    view_compact: ClassVar[Symbol]
+    view_compact_alt: ClassVar[Symbol]
+    view_cozy: ClassVar[Symbol]
+    view_day: ClassVar[Symbol]
+    view_headline: ClassVar[Symbol]
+    view_in_ar: ClassVar[Symbol]
+    view_in_ar_new: ClassVar[Symbol]
+    view_in_ar_off: ClassVar[Symbol]
+    view_kanban: ClassVar[Symbol]
+    view_list: ClassVar[Symbol]
+    view_module: ClassVar[Symbol]
+    view_object_track: ClassVar[Symbol]
+    view_quilt: ClassVar[Symbol]
+    view_real_size: ClassVar[Symbol]
+    view_sidebar: ClassVar[Symbol]
+    view_stream: ClassVar[Symbol]
+    view_timeline: ClassVar[Symbol]
+    view_week: ClassVar[Symbol]
+    vignette: ClassVar[Symbol]
+    vignette_2: ClassVar[Symbol]
+    villa: ClassVar[Symbol]
+    visibility: ClassVar[Symbol]
+    visibility_lock: ClassVar[Symbol]
+    visibility_off: ClassVar[Symbol]
+    vital_signs: ClassVar[Symbol]
+    vitals: ClassVar[Symbol]
+    vo2_max: ClassVar[Symbol]
+    voice_chat: ClassVar[Symbol]
+    voice_over_off: ClassVar[Symbol]
+    voice_selection: ClassVar[Symbol]
+    voice_selection_off: ClassVar[Symbol]
+    voicemail: ClassVar[Symbol]
+    voicemail_2: ClassVar[Symbol]
+    volcano: ClassVar[Symbol]
+    volume_down: ClassVar[Symbol]
+    volume_down_alt: ClassVar[Symbol]
+    volume_mute: ClassVar[Symbol]
+    volume_off: ClassVar[Symbol]
+    volume_up: ClassVar[Symbol]
+    volunteer_activism: ClassVar[Symbol]
+    voting_chip: ClassVar[Symbol]
+    vpn_key: ClassVar[Symbol]
+    vpn_key_alert: ClassVar[Symbol]
+    vpn_key_off: ClassVar[Symbol]
+    vpn_lock: ClassVar[Symbol]
+    vpn_lock_2: ClassVar[Symbol]
+    vr180_create2d: ClassVar[Symbol]
+    vr180_create2d_off: ClassVar[Symbol]
+    vrpano: ClassVar[Symbol]
+    wall_art: ClassVar[Symbol]
+    wall_lamp: ClassVar[Symbol]
+    wallet: ClassVar[Symbol]
+    wallpaper: ClassVar[Symbol]
+    wallpaper_slideshow: ClassVar[Symbol]
+    wand_shine: ClassVar[Symbol]
+    wand_stars: ClassVar[Symbol]
+    ward: ClassVar[Symbol]
+    warehouse: ClassVar[Symbol]
+    warning: ClassVar[Symbol]
+    warning_amber: ClassVar[Symbol]
+    warning_off: ClassVar[Symbol]
+    wash: ClassVar[Symbol]
+    washoku: ClassVar[Symbol]
+    watch: ClassVar[Symbol]
+    watch_arrow: ClassVar[Symbol]
+    watch_button_press: ClassVar[Symbol]
+    watch_check: ClassVar[Symbol]
+    watch_later: ClassVar[Symbol]
+    watch_off: ClassVar[Symbol]
+    watch_screentime: ClassVar[Symbol]
+    watch_vibration: ClassVar[Symbol]
+    watch_wake: ClassVar[Symbol]
+    water: ClassVar[Symbol]
+    water_bottle: ClassVar[Symbol]
+    water_bottle_large: ClassVar[Symbol]
+    water_damage: ClassVar[Symbol]
+    water_do: ClassVar[Symbol]
+    water_drop: ClassVar[Symbol]
+    water_ec: ClassVar[Symbol]
+    water_full: ClassVar[Symbol]
+    water_heater: ClassVar[Symbol]
+    water_lock: ClassVar[Symbol]
+    water_loss: ClassVar[Symbol]
+    water_lux: ClassVar[Symbol]
+    water_medium: ClassVar[Symbol]
+    water_orp: ClassVar[Symbol]
+    water_ph: ClassVar[Symbol]
+    water_pump: ClassVar[Symbol]
+    water_voc: ClassVar[Symbol]
+    waterfall_chart: ClassVar[Symbol]
+    waves: ClassVar[Symbol]
+    waving_hand: ClassVar[Symbol]
+    wb_auto: ClassVar[Symbol]
+    wb_cloudy: ClassVar[Symbol]
+    wb_incandescent: ClassVar[Symbol]
+    wb_iridescent: ClassVar[Symbol]
+    wb_shade: ClassVar[Symbol]
+    wb_sunny: ClassVar[Symbol]
+    wb_twilight: ClassVar[Symbol]
+    wc: ClassVar[Symbol]
+    weather_hail: ClassVar[Symbol]
+    weather_mix: ClassVar[Symbol]
+    weather_snowy: ClassVar[Symbol]
+    web: ClassVar[Symbol]
+    web_asset: ClassVar[Symbol]
+    web_asset_off: ClassVar[Symbol]
+    web_stories: ClassVar[Symbol]
+    web_traffic: ClassVar[Symbol]
+    webhook: ClassVar[Symbol]
+    weekend: ClassVar[Symbol]
+    weight: ClassVar[Symbol]
+    west: ClassVar[Symbol]
+    whatshot: ClassVar[Symbol]
+    wheelchair_pickup: ClassVar[Symbol]
+    where_to_vote: ClassVar[Symbol]
+    widget_medium: ClassVar[Symbol]
+    widget_small: ClassVar[Symbol]
+    widget_width: ClassVar[Symbol]
+    widgets: ClassVar[Symbol]
+    width: ClassVar[Symbol]
+    width_full: ClassVar[Symbol]
+    width_normal: ClassVar[Symbol]
+    width_wide: ClassVar[Symbol]
+    wifi: ClassVar[Symbol]
+    wifi_1_bar: ClassVar[Symbol]
+    wifi_2_bar: ClassVar[Symbol]
+    wifi_add: ClassVar[Symbol]
+    wifi_calling: ClassVar[Symbol]
+    wifi_calling_1: ClassVar[Symbol]
+    wifi_calling_2: ClassVar[Symbol]
+    wifi_calling_3: ClassVar[Symbol]
+    wifi_calling_bar_1: ClassVar[Symbol]
+    wifi_calling_bar_2: ClassVar[Symbol]
+    wifi_calling_bar_3: ClassVar[Symbol]
+    wifi_channel: ClassVar[Symbol]
+    wifi_find: ClassVar[Symbol]
+    wifi_home: ClassVar[Symbol]
+    wifi_lock: ClassVar[Symbol]
+    wifi_notification: ClassVar[Symbol]
+    wifi_off: ClassVar[Symbol]
+    wifi_password: ClassVar[Symbol]
+    wifi_protected_setup: ClassVar[Symbol]
+    wifi_proxy: ClassVar[Symbol]
+    wifi_tethering: ClassVar[Symbol]
+    wifi_tethering_error: ClassVar[Symbol]
+    wifi_tethering_off: ClassVar[Symbol]
+    wind_power: ClassVar[Symbol]
+    window: ClassVar[Symbol]
+    window_closed: ClassVar[Symbol]
+    window_open: ClassVar[Symbol]
+    window_sensor: ClassVar[Symbol]
+    windshield_defrost_auto: ClassVar[Symbol]
+    windshield_defrost_front: ClassVar[Symbol]
+    windshield_defrost_rear: ClassVar[Symbol]
+    windshield_heat_front: ClassVar[Symbol]
+    wine_bar: ClassVar[Symbol]
+    woman: ClassVar[Symbol]
+    woman_2: ClassVar[Symbol]
+    work: ClassVar[Symbol]
+    work_alert: ClassVar[Symbol]
+    work_history: ClassVar[Symbol]
+    work_off: ClassVar[Symbol]
+    work_outline: ClassVar[Symbol]
+    work_update: ClassVar[Symbol]
+    workflow: ClassVar[Symbol]
+    workspace_premium: ClassVar[Symbol]
+    workspaces: ClassVar[Symbol]
+    workspaces_outline: ClassVar[Symbol]
+    wounds_injuries: ClassVar[Symbol]
+    wrap_text: ClassVar[Symbol]
+    wrist: ClassVar[Symbol]
+    wrong_location: ClassVar[Symbol]
+    wysiwyg: ClassVar[Symbol]
+    yakitori: ClassVar[Symbol]
+    yard: ClassVar[Symbol]
+    yoshoku: ClassVar[Symbol]
+    your_trips: ClassVar[Symbol]
+    youtube_activity: ClassVar[Symbol]
+    youtube_searched_for: ClassVar[Symbol]
+    zone_person_alert: ClassVar[Symbol]
+    zone_person_idle: ClassVar[Symbol]
+    zone_person_urgent: ClassVar[Symbol]
+    zoom_in: ClassVar[Symbol]
+    zoom_in_map: ClassVar[Symbol]
+    zoom_out: ClassVar[Symbol]
+    zoom_out_map: ClassVar[Symbol]
+    @classmethod
+    def from_name(cls, name: str | None) -> Symbol | None: ...
+    @classmethod
+    def glyph_for(cls, name: str | None) -> str | None: ...
+
+__all__ = ("Symbol", "Symbols")
@@ -212,6 +212,9 @@ class TransformBox(Widget):
             or self._opacity != 1.0
         )
 
+    def paint_transforms_children(self) -> bool:
+        return self._has_transforms()
+
     def preferred_size(self, max_width: Optional[int] = None, max_height: Optional[int] = None) -> Tuple[int, int]:
         child = self._child()
         if child is None:
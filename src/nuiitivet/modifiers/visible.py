@@ -170,6 +170,10 @@ class _AnimatedVisibleBox(Widget):
             )
             return None
 
+    def paint_transforms_children(self) -> bool:
+        visuals = self._resolve_visuals()
+        return visuals is not None and _has_visual_effect(visuals)
+
     def preferred_size(
         self,
         max_width: Optional[int] = None,
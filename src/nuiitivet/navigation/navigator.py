@@ -460,6 +460,9 @@ class Navigator(ComposableWidget):
             except Exception:
                 exception_once(_logger, "navigator_layout_route_widget_exc", "Route widget layout failed")
 
+    def paint_transforms_children(self) -> bool:
+        return self._transition is not None
+
     def paint(self, canvas, x: int, y: int, width: int, height: int) -> None:
         self.set_last_rect(x, y, width, height)
 
@@ -1,6 +1,7 @@
 """Observable primitives for nuiitivet."""
 
 from .batching import BatchContext, batch, detach_batch
+from .collections import DictChange, ListChange, ObservableDict, ObservableList
 from .combine import CombineBuilder, combine
 from .computed import ComputedObservable
 from .protocols import CompareFunc, Disposable, ObservableProtocol, ReadOnlyObservableProtocol
@@ -17,8 +18,12 @@ __all__ = [
     "CompareFunc",
     "ComputedObservable",
     "DebouncedObservable",
+    "DictChange",
     "Disposable",
+    "ListChange",
     "Observable",
+    "ObservableDict",
+    "ObservableList",
     "ObservableProtocol",
     "ReadOnlyObservableProtocol",
     "ThrottledObservable",
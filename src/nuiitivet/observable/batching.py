@@ -4,6 +4,7 @@ import threading
 from typing import Any, Optional, Set
 
 from .contexts import _batch_context
+from .propagation import propagation
 from . import runtime
 
 
@@ -48,24 +49,18 @@ class BatchContext:
         queue = list(self._pending_computeds)
         self._pending_computeds.clear()
 
-        processed = set()
-
         needs_ui_dispatch = any(getattr(obs, "_dispatch_to_ui", False) for obs in self._pending_observables)
 
         def do_flush() -> None:
-            while queue:
-                computed = queue.pop(0)
-                if computed in processed:
-                    continue
-                processed.add(computed)
-
-                computed._recompute_and_notify()
-
-                if self._pending_computeds:
-                    for c in self._pending_computeds:
-                        if c not in processed:
-                            queue.append(c)
-                    self._pending_computeds.clear()
+            # Updates made while settling belong to the propagation, not to
+            # this (finished) batch.
+            token = _batch_context.set(None)
+            try:
+                with propagation():
+                    for computed in queue:
+                        computed._mark_stale()
+            finally:
+                _batch_context.reset(token)
 
         if needs_ui_dispatch and threading.current_thread() is not threading.main_thread():
             runtime.clock.schedule_once(lambda dt: do_flush(), 0)
@@ -0,0 +1,453 @@
+"""Observable list and dict that report structural changes.
+
+Replacing the value of an ``Observable([...])`` tells subscribers only that
+something changed, so consumers such as ``ForEach`` have to diff the whole
+collection. :class:`ObservableList` and :class:`ObservableDict` are mutated
+in place instead and describe every mutation as a small change record
+(:class:`ListChange` / :class:`DictChange`) delivered to
+``subscribe_changes`` subscribers.
+
+Both still behave like read-only observables: ``value`` returns an immutable
+snapshot (a tuple / read-only mapping), ``subscribe`` callbacks receive that
+snapshot after every change, and reads inside a computed register a
+dependency. Mutate them from the UI thread; unlike ``Observable`` they do
+not support ``dispatch_to_ui``.
+
+Mutations themselves cost what the matching ``list``/``dict`` operation
+costs, e.g. O(1) for ``append``, only while nothing needs the snapshot.
+Any plain ``subscribe`` listener, including the one a computed registers
+when it reads ``value``, makes every change build a fresh snapshot, which
+is O(n). Consumers that only need the changes should use
+``subscribe_changes``.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import MutableMapping, MutableSequence
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+    TYPE_CHECKING,
+)
+
+import logging
+
+from nuiitivet.common.logging_once import debug_once
+
+from .contexts import _batch_context, _tracking_context
+from .propagation import propagation
+from .protocols import Disposable, ReadOnlyObservableProtocol
+
+if TYPE_CHECKING:
+    from .computed import ComputedObservable
+
+T = TypeVar("T")
+K = TypeVar("K")
+V = TypeVar("V")
+
+logger = logging.getLogger(__name__)
+
+
+class ListChange(NamedTuple):
+    """One structural change of an :class:`ObservableList`.
+
+    Changes are delivered in order and each one is relative to the list as
+    left by the previous change:
+
+    - ``insert``: ``items`` were inserted starting at ``start``.
+    - ``remove``: ``old_items`` were removed starting at ``start``.
+    - ``replace``: ``old_items`` starting at ``start`` were replaced by the
+      same number of ``items``.
+    - ``move``: the single item in ``items`` moved from ``start`` to
+      ``new_index`` (its index after the move).
+    - ``reset``: the whole content changed (assignment, sort, reverse);
+      ``items`` is the new content and ``old_items`` the previous one.
+    """
+
+    kind: str
+    start: int
+    items: Tuple[Any, ...] = ()
+    old_items: Tuple[Any, ...] = ()
+    new_index: int = -1
+
+
+class DictChange(NamedTuple):
+    """One change of an :class:`ObservableDict`.
+
+    ``kind`` is ``insert`` (new ``key``), ``remove`` (``old_value`` was
+    removed), ``replace`` (``old_value`` replaced by ``value``) or ``reset``
+    (whole content replaced; ``key`` is None).
+    """
+
+    kind: str
+    key: Any
+    value: Any = None
+    old_value: Any = None
+
+
+class _ObservableCollection(ABC, Generic[T]):
+    """Subscription, tracking and notification shared by the collections."""
+
+    def __init__(self) -> None:
+        # Copy-on-write so notifying never copies the subscriber lists.
+        self._subs: Tuple[Callable[[Any], None], ...] = ()
+        self._change_subs: Tuple[Callable[[Any], None], ...] = ()
+        self._snapshot: Any = None
+
+    def _track(self) -> None:
+        tracker = _tracking_context.get()
+        if tracker is not None:
+            tracker._register_dependency(self)
+
+    @abstractmethod
+    def _make_snapshot(self) -> Any:
+        """Return an immutable copy of the current content."""
+        ...
+
+    def _current_snapshot(self) -> Any:
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._snapshot = self._make_snapshot()
+        return snapshot
+
+    def _emit(self, changes: Iterable[Any]) -> None:
+        changes = tuple(changes)
+        if not changes:
+            return
+        self._snapshot = None
+        with propagation():
+            for change in changes:
+                for cb in self._change_subs:
+                    cb(change)
+            if self._subs:
+                snapshot = self._current_snapshot()
+                for cb in self._subs:
+                    cb(snapshot)
+
+        batch_ctx = _batch_context.get()
+        if batch_ctx is not None:
+            batch_ctx.record_change(self)
+
+    @staticmethod
+    def _unsubscribe(owner: "_ObservableCollection[Any]", attr: str, cb: Callable[[Any], None]) -> Disposable:
+        def _dispose() -> None:
+            subs = getattr(owner, attr)
+            try:
+                index = subs.index(cb)
+            except ValueError:
+                debug_once(logger, "collection_dispose_remove_missing", "Subscriber callback was already removed")
+                return
+            setattr(owner, attr, subs[:index] + subs[index + 1 :])
+
+        return Disposable(_dispose)
+
+    def subscribe(self, cb: Callable[[Any], None]) -> Disposable:
+        """Call ``cb(snapshot)`` after every change."""
+        self._subs += (cb,)
+        return self._unsubscribe(self, "_subs", cb)
+
+    def subscribe_changes(self, cb: Callable[[Any], None]) -> Disposable:
+        """Call ``cb(change)`` for every structural change, in order."""
+        self._change_subs += (cb,)
+        return self._unsubscribe(self, "_change_subs", cb)
+
+    def changes(self) -> ReadOnlyObservableProtocol[Any]:
+        return self  # type: ignore[return-value]
+
+    def map(self, fn: Callable[[Any], Any]) -> "ComputedObservable[Any]":
+        from .computed import ComputedObservable
+
+        def compute_fn() -> Any:
+            return fn(self.value)  # type: ignore[attr-defined]
+
+        return ComputedObservable(compute_fn)
+
+
+def _normalize_index(index: int, length: int) -> int:
+    if index < 0:
+        index += length
+    if not 0 <= index < length:
+        raise IndexError("ObservableList index out of range")
+    return index
+
+
+class ObservableList(_ObservableCollection[T], MutableSequence):
+    """List that notifies subscribers with :class:`ListChange` records."""
+
+    def __init__(self, items: Optional[Iterable[T]] = None) -> None:
+        super().__init__()
+        self._items: List[T] = list(items) if items is not None else []
+
+    def _make_snapshot(self) -> Tuple[T, ...]:
+        return tuple(self._items)
+
+    @property
+    def value(self) -> Tuple[T, ...]:
+        """Tuple snapshot of the items, cached until the next change."""
+        self._track()
+        return self._current_snapshot()
+
+    @value.setter
+    def value(self, items: Iterable[T]) -> None:
+        self.set(items)
+
+    # --- reading ---------------------------------------------------------
+    def __len__(self) -> int:
+        self._track()
+        return len(self._items)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[T]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, List[T]]:
+        self._track()
+        return self._items[index]
+
+    def __iter__(self) -> Iterator[T]:
+        self._track()
+        return iter(self._current_snapshot())
+
+    def __contains__(self, item: object) -> bool:
+        self._track()
+        return item in self._items
+
+    def __repr__(self) -> str:
+        return f"ObservableList({self._items!r})"
+
+    # --- mutation --------------------------------------------------------
+    def insert(self, index: int, item: T) -> None:
+        length = len(self._items)
+        if index < 0:
+            index = max(0, index + length)
+        index = min(index, length)
+        self._items.insert(index, item)
+        self._emit((ListChange("insert", index, (item,)),))
+
+    def append(self, item: T) -> None:
+        index = len(self._items)
+        self._items.append(item)
+        self._emit((ListChange("insert", index, (item,)),))
+
+    def extend(self, items: Iterable[T]) -> None:
+        added = tuple(items)
+        if not added:
+            return
+        index = len(self._items)
+        self._items.extend(added)
+        self._emit((ListChange("insert", index, added),))
+
+    def __iadd__(self, items: Iterable[T]) -> "ObservableList[T]":  # type: ignore[override]
+        self.extend(items)
+        return self
+
+    def __setitem__(self, index: Union[int, slice], item: Any) -> None:
+        if isinstance(index, slice):
+            self._set_slice(index, item)
+            return
+        index = _normalize_index(index, len(self._items))
+        old = self._items[index]
+        if old is item:
+            return
+        self._items[index] = item
+        self._emit((ListChange("replace", index, (item,), (old,)),))
+
+    def _set_slice(self, index: slice, items: Iterable[T]) -> None:
+        new_items = tuple(items)
+        start, stop, step = index.indices(len(self._items))
+        if step != 1:
+            positions = range(start, stop, step)
+            old_items = tuple(self._items[i] for i in positions)
+            # Same length check and error as list.
+            self._items[index] = list(new_items)
+            self._emit(
+                ListChange("replace", i, (new,), (old,))
+                for i, new, old in zip(positions, new_items, old_items)
+                if new is not old
+            )
+            return
+        stop = max(start, stop)
+        old_items = tuple(self._items[start:stop])
+        self._items[start:stop] = new_items
+        changes: List[ListChange] = []
+        if len(old_items) == len(new_items):
+            if old_items:
+                changes.append(ListChange("replace", start, new_items, old_items))
+        else:
+            if old_items:
+                changes.append(ListChange("remove", start, (), old_items))
+            if new_items:
+                changes.append(ListChange("insert", start, new_items))
+        if changes:
+            self._emit(changes)
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._items))
+            if step == 1:
+                removed = tuple(self._items[start:stop])
+                if not removed:
+                    return
+                del self._items[start:stop]
+                self._emit((ListChange("remove", start, (), removed),))
+                return
+            # Remove from the back so each change's index stays valid.
+            positions = sorted(range(start, stop, step), reverse=True)
+            removed_items = [(i, self._items[i]) for i in positions]
+            del self._items[index]
+            self._emit(ListChange("remove", i, (), (old,)) for i, old in removed_items)
+            return
+        index = _normalize_index(index, len(self._items))
+        old = self._items.pop(index)
+        self._emit((ListChange("remove", index, (), (old,)),))
+
+    def clear(self) -> None:
+        if not self._items:
+            return
+        removed = tuple(self._items)
+        self._items.clear()
+        self._emit((ListChange("remove", 0, (), removed),))
+
+    def move(self, old_index: int, new_index: int) -> None:
+        """Move the item at ``old_index`` so that it ends up at ``new_index``."""
+        length = len(self._items)
+        old_index = _normalize_index(old_index, length)
+        new_index = _normalize_index(new_index, length)
+        if old_index == new_index:
+            return
+        item = self._items.pop(old_index)
+        self._items.insert(new_index, item)
+        self._emit((ListChange("move", old_index, (item,), (), new_index),))
+
+    def set(self, items: Iterable[T]) -> None:
+        """Replace the whole content (reported as one ``reset``)."""
+        old_items = tuple(self._items)
+        self._items = list(items)
+        self._emit((ListChange("reset", 0, tuple(self._items), old_items),))
+
+    def sort(self, *, key: Optional[Callable[[T], Any]] = None, reverse: bool = False) -> None:
+        old_items = tuple(self._items)
+        self._items.sort(key=key, reverse=reverse)  # type: ignore[arg-type]
+        self._emit((ListChange("reset", 0, tuple(self._items), old_items),))
+
+    def reverse(self) -> None:
+        old_items = tuple(self._items)
+        self._items.reverse()
+        self._emit((ListChange("reset", 0, tuple(self._items), old_items),))
+
+
+class ObservableDict(_ObservableCollection[Tuple[K, V]], MutableMapping, Generic[K, V]):
+    """Dict that notifies subscribers with :class:`DictChange` records.
+
+    Like every observable it compares and hashes by identity (``Mapping``
+    would compare contents), so it can be tracked as a computed dependency.
+    """
+
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+    def __init__(self, items: Optional[Union[Mapping[K, V], Iterable[Tuple[K, V]]]] = None) -> None:
+        super().__init__()
+        self._data: Dict[K, V] = dict(items) if items is not None else {}
+
+    def _make_snapshot(self) -> Mapping[K, V]:
+        return MappingProxyType(dict(self._data))
+
+    @property
+    def value(self) -> Mapping[K, V]:
+        """Read-only snapshot of the mapping, cached until the next change."""
+        self._track()
+        return self._current_snapshot()
+
+    @value.setter
+    def value(self, items: Union[Mapping[K, V], Iterable[Tuple[K, V]]]) -> None:
+        self.set(items)
+
+    # --- reading ---------------------------------------------------------
+    def __len__(self) -> int:
+        self._track()
+        return len(self._data)
+
+    def __getitem__(self, key: K) -> V:
+        self._track()
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[K]:
+        self._track()
+        return iter(self._current_snapshot())
+
+    def __contains__(self, key: object) -> bool:
+        self._track()
+        return key in self._data
+
+    def __repr__(self) -> str:
+        return f"ObservableDict({self._data!r})"
+
+    # --- mutation --------------------------------------------------------
+    def __setitem__(self, key: K, value: V) -> None:
+        data = self._data
+        if key in data:
+            old = data[key]
+            if old is value:
+                return
+            data[key] = value
+            self._emit((DictChange("replace", key, value, old),))
+            return
+        data[key] = value
+        self._emit((DictChange("insert", key, value),))
+
+    def __delitem__(self, key: K) -> None:
+        old = self._data.pop(key)
+        self._emit((DictChange("remove", key, None, old),))
+
+    def clear(self) -> None:
+        if not self._data:
+            return
+        removed = list(self._data.items())
+        self._data.clear()
+        self._emit(DictChange("remove", key, None, old) for key, old in removed)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # type: ignore[override]
+        incoming = dict(*args, **kwargs)
+        data = self._data
+        changes: List[DictChange] = []
+        for key, value in incoming.items():
+            if key in data:
+                old = data[key]
+                if old is value:
+                    continue
+                changes.append(DictChange("replace", key, value, old))
+            else:
+                changes.append(DictChange("insert", key, value))
+            data[key] = value
+        if changes:
+            self._emit(changes)
+
+    def set(self, items: Union[Mapping[K, V], Iterable[Tuple[K, V]]]) -> None:
+        """Replace the whole content (reported as one ``reset``)."""
+        self._data = dict(items)
+        self._emit((DictChange("reset", None),))
+
+
+__all__ = [
+    "DictChange",
+    "ListChange",
+    "ObservableDict",
+    "ObservableList",
+]
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import logging
 import threading
-from typing import Any, Callable, Generic, List, Optional, Set, TypeVar, TYPE_CHECKING
+import weakref
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar, TYPE_CHECKING
 
 from nuiitivet.common.logging_once import debug_once, exception_once
 
 from .contexts import _batch_context, _tracking_context
+from .propagation import propagation
 from .protocols import Disposable, ReadOnlyObservableProtocol
 from . import runtime
 
@@ -19,9 +21,39 @@ T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
 
+# Staleness states. CHECK means an upstream computed may have changed; the
+# node only recomputes if one of them actually produced a new value.
+_CLEAN = 0
+_CHECK = 1
+_DIRTY = 2
+
+
+class _DepLink:
+    """Subscriber a computed registers on one dependency.
+
+    Holds the computed weakly so dependencies never keep it alive.
+    """
+
+    __slots__ = ("_target", "_source")
+
+    def __init__(self, target: "weakref.ReferenceType[ComputedObservable[Any]]", source: Any) -> None:
+        self._target = target
+        self._source = source
+
+    def __call__(self, value: Any) -> None:
+        target = self._target()
+        if target is not None:
+            target._on_dep(value, self._source)
+
 
 class ComputedObservable(Generic[T]):
-    """Computed observable with automatic dependency tracking (Signals pattern)."""
+    """Computed observable with automatic dependency tracking (Signals pattern).
+
+    Updates propagate push-pull: a change marks downstream computeds stale
+    and queues them by height (distance from plain observables); they are
+    recomputed lowest first, at most once per change, and any read of a
+    stale computed recomputes it on the spot.
+    """
 
     def __init__(
         self,
@@ -30,64 +62,108 @@ class ComputedObservable(Generic[T]):
     ):
         self._compute = compute
         self._value: Optional[T] = None
-        self._subs: List[Callable[[T], None]] = []
-        self._deps: Set[Any] = set()
-        self._dep_disposables: List[Disposable] = []
+        # Copy-on-write so notifying never copies the subscriber list.
+        self._subs: Tuple[Callable[[T], None], ...] = ()
+        # Dependencies are diffed across evaluations: each read stamps the
+        # dependency with the current evaluation number instead of building
+        # a fresh set, so an unchanged dependency set allocates nothing.
+        self._dep_subscriptions: Dict[Any, Disposable] = {}
+        self._dep_marks: Dict[Any, int] = {}
+        self._new_deps: List[Any] = []
+        self._evaluation = 0
+        self._seen_deps = 0
+        self._weak_self = weakref.ref(self)
         self._dispatch_to_ui = dispatch_to_ui
         self._disposed = False
 
         self._lock = threading.Lock()
         self._is_scheduled = False
 
+        self._state = _CLEAN
+        self._height = 0
+        self._version = 0
+        self._dep_versions: Dict["ComputedObservable[Any]", int] = {}
+        self._dependents: "weakref.WeakSet[ComputedObservable[Any]]" = weakref.WeakSet()
+        self._notify_pending = False
+
         self._recompute()
 
     def _register_dependency(self, dep: Any) -> None:
         with self._lock:
-            self._deps.add(dep)
+            marks = self._dep_marks
+            last = marks.get(dep)
+            if last == self._evaluation:
+                return
+            if last is None:
+                self._new_deps.append(dep)
+            else:
+                self._seen_deps += 1
+            marks[dep] = self._evaluation
 
     def _recompute(self) -> None:
         if self._disposed:
             return
 
-        for disp in self._dep_disposables:
-            disp.dispose()
-        self._dep_disposables.clear()
-        self._deps = set()
-
+        self._evaluation += 1
+        self._seen_deps = 0
         token = _tracking_context.set(self)
         try:
             new_value = self._compute()
+        except BaseException:
+            # Dependencies first read by the failed evaluation were never
+            # subscribed; forget them so the next one does not wire up reads
+            # it no longer makes.
+            with self._lock:
+                for dep in self._new_deps:
+                    self._dep_marks.pop(dep, None)
+                self._new_deps = []
+            raise
         finally:
             _tracking_context.reset(token)
 
-        for dep in self._deps:
-            import weakref
-
-            def make_callback(weak_self):
-                def callback(v):
-                    self_obj = weak_self()
-                    if self_obj is not None:
-                        self_obj._on_dep(v)
-
-                return callback
-
-            weak_ref = weakref.ref(self)
-            cb = make_callback(weak_ref)
-
-            disp = dep.subscribe(cb)
-            self._dep_disposables.append(disp)
+        if self._new_deps or self._seen_deps != len(self._dep_subscriptions):
+            self._rewire()
 
+        versions = self._dep_versions
+        height = 0
+        for dep in versions:
+            versions[dep] = dep._version
+            if dep._height > height:
+                height = dep._height
+        self._height = height + 1
         self._value = new_value
 
+    def _rewire(self) -> None:
+        subscriptions = self._dep_subscriptions
+        marks = self._dep_marks
+        evaluation = self._evaluation
+        for dep in [dep for dep, mark in marks.items() if mark != evaluation]:
+            del marks[dep]
+            disp = subscriptions.pop(dep, None)
+            if disp is not None:
+                disp.dispose()
+            if isinstance(dep, ComputedObservable):
+                dep._dependents.discard(self)
+                self._dep_versions.pop(dep, None)
+        new_deps = self._new_deps
+        self._new_deps = []
+        for dep in new_deps:
+            subscriptions[dep] = dep.subscribe(_DepLink(self._weak_self, dep))
+            if isinstance(dep, ComputedObservable):
+                dep._dependents.add(self)
+                self._dep_versions[dep] = dep._version
+
     @property
     def value(self) -> T:
         tracker = _tracking_context.get()
         if tracker is not None and tracker is not self:
             tracker._register_dependency(self)
+        if self._state != _CLEAN:
+            self._update()
         with self._lock:
             return self._value  # type: ignore[return-value]
 
-    def _on_dep(self, _v: Any) -> None:
+    def _on_dep(self, _v: Any, source: Any = None) -> None:
         batch_ctx = _batch_context.get()
         if batch_ctx is not None:
             batch_ctx.record_computed(self)
@@ -102,14 +178,57 @@ class ComputedObservable(Generic[T]):
                     runtime.clock.schedule_once(self._process_pending_update, 0)
             return
 
-        self._recompute_and_notify()
+        # A read earlier in this propagation may already have pulled the
+        # new upstream value in.
+        if source is not None and self._dep_versions.get(source, -1) == getattr(source, "_version", None):
+            return
+
+        self._refresh()
 
     def _process_pending_update(self, dt: float) -> None:
         with self._lock:
             self._is_scheduled = False
-        self._recompute_and_notify()
+        self._refresh()
+
+    def _refresh(self) -> None:
+        """Recompute in height order and notify subscribers if the value changed."""
 
-    def _recompute_and_notify(self) -> None:
+        with propagation():
+            self._mark_stale()
+
+    def _mark_stale(self) -> None:
+        """Queue a recompute in the active propagation."""
+
+        self._invalidate(_DIRTY)
+
+    def _invalidate(self, state: int) -> None:
+        if self._disposed:
+            return
+        previous = self._state
+        if state > previous:
+            self._state = state
+        if previous != _CLEAN:
+            return
+        propagation().schedule(self)
+        for dependent in list(self._dependents):
+            dependent._invalidate(_CHECK)
+
+    def _update(self) -> None:
+        """Bring the value up to date without notifying subscribers."""
+
+        if self._state == _CHECK:
+            for dep, seen in list(self._dep_versions.items()):
+                dep._update()
+                if dep._version != seen:
+                    self._state = _DIRTY
+                    break
+            else:
+                self._state = _CLEAN
+                return
+        if self._state != _DIRTY:
+            return
+
+        self._state = _CLEAN
         old_value = self._value
         self._recompute()
         new_value = self._value
@@ -123,6 +242,22 @@ class ComputedObservable(Generic[T]):
             is_equal = False
 
         if not is_equal:
+            self._version += 1
+            self._notify_pending = True
+
+    def _settle(self) -> None:
+        try:
+            self._update()
+        except Exception:
+            # A dependency raised while this node was being checked. Retry
+            # with a full recompute; left stale, it would never be scheduled
+            # again.
+            if self._state != _CLEAN:
+                self._state = _DIRTY
+                propagation().schedule(self)
+            raise
+        if self._notify_pending:
+            self._notify_pending = False
             self._notify_subs()
 
     def _notify_subs(self) -> None:
@@ -131,13 +266,13 @@ class ComputedObservable(Generic[T]):
         if should_dispatch:
 
             def notify_on_ui(dt: float) -> None:
-                for cb in list(self._subs):
+                for cb in self._subs:
                     cb(self._value)  # type: ignore[arg-type]
 
             runtime.clock.schedule_once(notify_on_ui, 0)
             return
 
-        for cb in list(self._subs):
+        for cb in self._subs:
             cb(self._value)  # type: ignore[arg-type]
 
     def dispatch_to_ui(self) -> "ComputedObservable[T]":
@@ -145,13 +280,16 @@ class ComputedObservable(Generic[T]):
         return self
 
     def subscribe(self, cb: Callable[[T], None]) -> Disposable:
-        self._subs.append(cb)
+        self._subs += (cb,)
 
         def _dispose() -> None:
+            subs = self._subs
             try:
-                self._subs.remove(cb)
+                index = subs.index(cb)
             except ValueError:
                 debug_once(logger, "computed_dispose_remove_missing", "Subscriber callback was already removed")
+                return
+            self._subs = subs[:index] + subs[index + 1 :]
 
         return Disposable(_dispose)
 
@@ -183,11 +321,15 @@ class ComputedObservable(Generic[T]):
         if self._disposed:
             return
         self._disposed = True
-        for disp in self._dep_disposables:
+        for disp in self._dep_subscriptions.values():
             disp.dispose()
-        self._dep_disposables.clear()
-        self._deps.clear()
-        self._subs.clear()
+        self._dep_subscriptions.clear()
+        for dep in self._dep_versions:
+            dep._dependents.discard(self)
+        self._dep_versions.clear()
+        self._dep_marks.clear()
+        self._new_deps = []
+        self._subs = ()
 
     def __del__(self):
         self.dispose()
@@ -5,3 +5,4 @@ from typing import Any, Optional
 
 _batch_context: ContextVar[Optional[Any]] = ContextVar("batch", default=None)
 _tracking_context: ContextVar[Optional[Any]] = ContextVar("tracking", default=None)
+_propagation_context: ContextVar[Optional[Any]] = ContextVar("propagation", default=None)
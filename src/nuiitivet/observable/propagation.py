@@ -0,0 +1,88 @@
+"""Height-ordered propagation of computed updates.
+
+Sources open a propagation while notifying subscribers. Computeds that
+become stale inside it are queued instead of recomputing right away, and
+the queue is drained lowest height first when the outermost propagation
+ends. A computed therefore recomputes at most once per change even when it
+is reachable through several paths (diamond graphs). It never observes a
+mix of old and new upstream values either, because reading a stale computed
+brings it up to date first.
+
+A computed that raises does not stop the drain: every queued computed is
+still settled, since one left stale would never be scheduled again, and the
+first error is re-raised once the queue is empty.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+from typing import Any, List, Optional, Tuple
+
+from nuiitivet.common.logging_once import exception_once
+
+from .contexts import _propagation_context
+
+logger = logging.getLogger(__name__)
+
+
+class Propagation:
+    def __init__(self) -> None:
+        self._depth = 0
+        self._queue: List[Tuple[int, int, Any]] = []
+        self._seq = 0
+
+    def __enter__(self) -> "Propagation":
+        if self._depth == 0:
+            self._token = _propagation_context.set(self)
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._depth -= 1
+        if self._depth > 0:
+            return
+        try:
+            # Drain even while unwinding: queued computeds are already marked
+            # stale and only this propagation would settle them.
+            error = self._drain(unwinding=exc_type is not None)
+        finally:
+            self._queue.clear()
+            _propagation_context.reset(self._token)
+        if error is not None:
+            raise error
+
+    def schedule(self, computed: Any) -> None:
+        """Queue ``computed`` to be settled in height order."""
+
+        self._seq += 1
+        heapq.heappush(self._queue, (computed._height, self._seq, computed))
+
+    def _drain(self, unwinding: bool = False) -> Optional[BaseException]:
+        # Settling notifies subscribers, which may schedule more computeds
+        # (always taller ones) into this same queue.
+        error: Optional[BaseException] = None
+        self._depth += 1
+        try:
+            queue = self._queue
+            while queue:
+                _height, _seq, computed = heapq.heappop(queue)
+                try:
+                    computed._settle()
+                except Exception as exc:
+                    if error is None and not unwinding:
+                        error = exc
+                    else:
+                        exception_once(logger, "propagation_settle_exc", "Computed update failed during propagation")
+        finally:
+            self._depth -= 1
+        return error
+
+
+def propagation() -> Propagation:
+    """Return the active propagation, or a new one to enter."""
+
+    current = _propagation_context.get()
+    if current is not None:
+        return current
+    return Propagation()
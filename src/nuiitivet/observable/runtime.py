@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import heapq
 import logging
 import threading
-from typing import Callable, Dict, Protocol
+import time
+from typing import Callable, Dict, List, Optional, Protocol
 
 from nuiitivet.common.logging_once import exception_once
 
@@ -23,89 +25,143 @@ class Clock(Protocol):
         raise NotImplementedError
 
 
-class _ThreadClock:
-    """Fallback clock implementation using threading.Timer.
+# Floor for interval callbacks so a zero interval cannot spin the scheduler.
+_MIN_INTERVAL = 0.001
+
+
+class _TimerEntry:
+    __slots__ = ("deadline", "seq", "fn", "interval", "cancelled")
+
+    def __init__(self, deadline: float, seq: int, fn: Callable[[float], None], interval: Optional[float]) -> None:
+        self.deadline = deadline
+        self.seq = seq
+        self.fn = fn
+        self.interval = interval
+        self.cancelled = False
+
+    def __lt__(self, other: "_TimerEntry") -> bool:
+        # Ties keep scheduling order so same-deadline callbacks run FIFO.
+        return (self.deadline, self.seq) < (other.deadline, other.seq)
 
-    This is used when no backend installs a UI clock.
+
+class _ThreadClock:
+    """Fallback clock implementation backed by one scheduler thread.
+
+    This is used when no backend installs a UI clock. Pending callbacks live
+    in a min-heap ordered by deadline; a single daemon thread sleeps until
+    the earliest one and runs every callback that is due in one batch.
+    Scheduling is O(log n) and cancelling O(1): cancelled entries are only
+    flagged and dropped when they reach the top of the heap, or in a
+    compaction once they make up most of it. A one-shot callback stays
+    registered, and can still be cancelled, until it is invoked.
     """
 
     def __init__(self) -> None:
         self._lock = threading.Lock()
-        self._timers: Dict[int, threading.Timer] = {}
-        self._intervals: Dict[int, threading.Thread] = {}
+        self._cond = threading.Condition(self._lock)
+        self._heap: List[_TimerEntry] = []
+        # One live entry per callback, as with pyglet.clock.
+        self._entries: Dict[int, _TimerEntry] = {}
+        self._seq = 0
+        self._cancelled = 0
+        self._thread: Optional[threading.Thread] = None
 
     def schedule_once(self, fn: Callable[[float], None], delay: float) -> None:
-        def _run() -> None:
-            try:
-                fn(0.0)
-            finally:
-                with self._lock:
-                    self._timers.pop(id(fn), None)
-
-        timer = threading.Timer(float(delay), _run)
-        timer.daemon = True
-        with self._lock:
-            old = self._timers.get(id(fn))
-            if old is not None:
-                try:
-                    old.cancel()
-                except Exception:
-                    exception_once(_logger, "thread_clock_cancel_old_timer_exc", "Timer cancel failed")
-            self._timers[id(fn)] = timer
-        timer.start()
+        self._schedule(fn, max(0.0, float(delay)), None)
 
     def schedule_interval(self, fn: Callable[[float], None], interval: float) -> None:
-        # Avoid creating recursive threads. Use a persistent loop for interval tasks.
-        # But for simplicity in this fallback clock, we just launch ONE daemon thread per interval task
-        # that sleeps and calls the function repeatedly.
-
-        def _loop() -> None:
-            import time
+        interval = max(0.0, float(interval))
+        self._schedule(fn, interval, interval)
 
-            while True:
-                start_time = time.perf_counter()
-                try:
-                    # Check if still scheduled
-                    with self._lock:
-                        if id(fn) not in self._intervals:
-                            break
-                    fn(interval)
-                except Exception:
-                    exception_once(_logger, "thread_clock_interval_exc", "Interval callback failed")
-
-                # Sleep for the remainder
-                elapsed = time.perf_counter() - start_time
-                wait_time = max(0.0, interval - elapsed)
-                if wait_time > 0:
-                    time.sleep(wait_time)
-                else:
-                    # If lagging, invoke immediately but yield time slice
-                    time.sleep(0.001)
-
-        t = threading.Thread(target=_loop, daemon=True)
+    def unschedule(self, fn: Callable[[float], None]) -> None:
         with self._lock:
-            self._intervals[id(fn)] = t
-        t.start()
-
-    def _schedule_interval_internal(self, fn: Callable[[float], None], interval: float) -> None:
-        # Removed recursive logic.
-        pass
+            self._cancel_locked(id(fn))
 
-    def unschedule(self, fn: Callable[[float], None]) -> None:
+    def pending_count(self) -> int:
+        """Return the number of scheduled callbacks."""
         with self._lock:
-            timer = self._timers.pop(id(fn), None)
-            # Just pop from _intervals. The loop thread checks this dict.
-            # We don't have a direct handle to stop the thread other than removing from dict.
-            # (Threading.Thread doesn't have cancel())
-            self._intervals.pop(id(fn), None)
-
-        if timer is not None:
-            try:
-                timer.cancel()
-            except Exception:
-                exception_once(_logger, "thread_clock_cancel_timer_exc", "Timer cancel failed")
-
-        # Interval thread will exit on next loop check.
+            return len(self._entries)
+
+    def _schedule(self, fn: Callable[[float], None], delay: float, interval: Optional[float]) -> None:
+        with self._cond:
+            self._cancel_locked(id(fn))
+            self._seq += 1
+            entry = _TimerEntry(time.perf_counter() + delay, self._seq, fn, interval)
+            self._entries[id(fn)] = entry
+            heapq.heappush(self._heap, entry)
+            self._ensure_thread_locked()
+            if self._heap[0] is entry:
+                # The new entry is the earliest; shorten the worker's wait.
+                self._cond.notify()
+
+    def _cancel_locked(self, key: int) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        entry.cancelled = True
+        self._cancelled += 1
+        if self._cancelled > 64 and self._cancelled * 2 > len(self._heap):
+            self._heap = [e for e in self._heap if not e.cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+    def _ensure_thread_locked(self) -> None:
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            return
+        thread = threading.Thread(target=self._run, name="nuiitivet-clock", daemon=True)
+        self._thread = thread
+        thread.start()
+
+    def _pop_due_locked(self, now: float) -> List[_TimerEntry]:
+        heap = self._heap
+        due: List[_TimerEntry] = []
+        while heap and heap[0].deadline <= now:
+            entry = heapq.heappop(heap)
+            if entry.cancelled:
+                self._cancelled -= 1
+                continue
+            due.append(entry)
+        for entry in due:
+            if entry.interval is not None:
+                # Keep the cadence, but skip missed ticks instead of bursting.
+                step = max(entry.interval, _MIN_INTERVAL)
+                entry.deadline = max(entry.deadline + step, now)
+                heapq.heappush(heap, entry)
+        return due
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    heap = self._heap
+                    now = time.perf_counter()
+                    if heap and heap[0].deadline <= now:
+                        due = self._pop_due_locked(now)
+                        if due:
+                            break
+                        continue
+                    self._cond.wait(None if not heap else heap[0].deadline - now)
+
+            for entry in due:
+                if entry.interval is None:
+                    # An earlier callback in the batch may have cancelled or
+                    # replaced this one since it left the heap.
+                    with self._lock:
+                        if entry.cancelled:
+                            self._cancelled -= 1
+                            continue
+                        del self._entries[id(entry.fn)]
+                    self._invoke(entry.fn, 0.0, "thread_clock_once_exc", "Scheduled callback failed")
+                elif not entry.cancelled:
+                    self._invoke(entry.fn, entry.interval, "thread_clock_interval_exc", "Interval callback failed")
+
+    @staticmethod
+    def _invoke(fn: Callable[[float], None], dt: float, key: str, msg: str) -> None:
+        try:
+            fn(dt)
+        except Exception:
+            exception_once(_logger, key, msg)
 
 
 clock: Clock = _ThreadClock()
@@ -3,11 +3,12 @@ from __future__ import annotations
 import logging
 import threading
 import warnings
-from typing import Any, Callable, Generic, List, Optional, TypeVar, TYPE_CHECKING
+from typing import Any, Callable, Generic, Optional, Tuple, TypeVar, TYPE_CHECKING
 
 from nuiitivet.common.logging_once import debug_once
 
 from .contexts import _batch_context, _tracking_context
+from .propagation import propagation
 from .protocols import CompareFunc, Disposable, ReadOnlyObservableProtocol
 from . import runtime
 
@@ -33,7 +34,8 @@ class _ObservableValue(Generic[T]):
         compare: Optional[CompareFunc[T]] = None,
     ):
         self._value = initial
-        self._subs: List[Callable[[T], None]] = []
+        # Copy-on-write so notifying never copies the subscriber list.
+        self._subs: Tuple[Callable[[T], None], ...] = ()
         self._owner = owner
         self._name = name
         self._compare = compare
@@ -88,7 +90,8 @@ class _ObservableValue(Generic[T]):
             return
 
         self._value = v
-        self._notify_subs()
+        with propagation():
+            self._notify_subs()
 
         batch_ctx = _batch_context.get()
         if batch_ctx is not None:
@@ -106,7 +109,7 @@ class _ObservableValue(Generic[T]):
         self.value = v
 
     def _notify_subs(self) -> None:
-        for cb in list(self._subs):
+        for cb in self._subs:
             cb(self._value)
 
     def dispatch_to_ui(self) -> "_ObservableValue[T]":
@@ -138,13 +141,16 @@ class _ObservableValue(Generic[T]):
         return ThrottledObservable(self, seconds)
 
     def subscribe(self, cb: Callable[[T], None]) -> Disposable:
-        self._subs.append(cb)
+        self._subs += (cb,)
 
         def _dispose() -> None:
+            subs = self._subs
             try:
-                self._subs.remove(cb)
+                index = subs.index(cb)
             except ValueError:
                 debug_once(logger, "value_observable_dispose_remove_missing", "Subscriber callback was already removed")
+                return
+            self._subs = subs[:index] + subs[index + 1 :]
 
         return Disposable(_dispose)
 
@@ -8,6 +8,7 @@ from .skia import (
     resolve_rrect,
     set_paint_image_filter,
     set_paint_mask_filter,
+    shared_paint,
 )
 from .skia.geometry import draw_round_rect
 from nuiitivet.common.logging_once import exception_once
@@ -157,7 +158,7 @@ class BackgroundRenderer:
                 canvas.saveLayer(lb, layer_paint)
                 try:
                     # sc is an RGBA primitive resolved earlier
-                    sp = make_paint(color=sc, style="fill", aa=True)
+                    sp = shared_paint(color=sc, style="fill", aa=True)
                     if sp is None:
                         return
                     has_rad = (isinstance(eff_rad, (list, tuple)) and any(float(r or 0.0) > 0.0 for r in eff_rad)) or (
@@ -222,7 +223,7 @@ class BackgroundRenderer:
                     )
         else:
             try:
-                shadow_paint = make_paint(color=sc, style="fill", aa=True)
+                shadow_paint = shared_paint(color=sc, style="fill", aa=True)
                 if shadow_paint is None:
                     return
                 try:
@@ -262,7 +263,7 @@ class BackgroundRenderer:
 
         try:
             stroke_rgba = resolve_color_to_rgba(self.owner.border_color, theme=theme_manager.current)
-            stroke_paint = make_paint(color=stroke_rgba, style="stroke", stroke_width=bw, aa=True)
+            stroke_paint = shared_paint(color=stroke_rgba, style="stroke", stroke_width=bw, aa=True)
             if stroke_paint is None:
                 return
 
@@ -369,7 +370,7 @@ class BackgroundRenderer:
         if self.owner.bgcolor is not None:
             try:
                 bg_rgba = resolve_color_to_rgba(self.owner.bgcolor, theme=theme_manager.current)
-                paint = make_paint(color=bg_rgba, style="fill", aa=True)
+                paint = shared_paint(color=bg_rgba, style="fill", aa=True)
 
                 if paint is not None:
                     # log when background resolves to fully transparent
@@ -0,0 +1,125 @@
+"""Damage-region bookkeeping for partial repaints.
+
+Widgets report the root-space rectangle they last painted when they
+invalidate. The App accumulates those rectangles between frames and, when the
+previous frame is retained, repaints only the damaged area instead of the
+whole window.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+Rect = Tuple[int, int, int, int]
+
+
+def _union(a: Rect, b: Rect) -> Rect:
+    left = min(a[0], b[0])
+    top = min(a[1], b[1])
+    right = max(a[0] + a[2], b[0] + b[2])
+    bottom = max(a[1] + a[3], b[1] + b[3])
+    return (left, top, right - left, bottom - top)
+
+
+def _overlaps(a: Rect, b: Rect) -> bool:
+    """Return True when rects overlap or touch (so merging costs no extra area)."""
+
+    return a[0] <= b[0] + b[2] and b[0] <= a[0] + a[2] and a[1] <= b[1] + b[3] and b[1] <= a[1] + a[3]
+
+
+def rects_intersect(a: Rect, b: Rect) -> bool:
+    """Return True when two (x, y, w, h) rects share a non-empty area."""
+
+    return a[0] < b[0] + b[2] and b[0] < a[0] + a[2] and a[1] < b[1] + b[3] and b[1] < a[1] + a[3]
+
+
+class DamageRegion:
+    """Set of dirty rectangles accumulated between two frames.
+
+    The region starts out *full* (nothing has been painted yet). Rects are
+    inflated by ``margin`` to cover anti-aliased edges, merged when they touch,
+    and collapsed into their bounding box once more than ``max_rects`` are
+    pending so clipping stays cheap.
+    """
+
+    def __init__(self, *, max_rects: int = 8, margin: int = 1) -> None:
+        self._max_rects = max(1, int(max_rects))
+        self._margin = max(0, int(margin))
+        self._rects: List[Rect] = []
+        self._full = True
+
+    @property
+    def is_full(self) -> bool:
+        return self._full
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._full and not self._rects
+
+    def rects(self) -> Tuple[Rect, ...]:
+        return tuple(self._rects)
+
+    def bounds(self) -> Optional[Rect]:
+        if not self._rects:
+            return None
+        out = self._rects[0]
+        for rect in self._rects[1:]:
+            out = _union(out, rect)
+        return out
+
+    def mark_full(self) -> None:
+        self._full = True
+        self._rects.clear()
+
+    def clear(self) -> None:
+        self._full = False
+        self._rects.clear()
+
+    def add_rect(self, rect: Optional[Rect]) -> None:
+        """Add a root-space rect; ``None`` means the damage is unknown (full)."""
+
+        if self._full:
+            return
+        if rect is None:
+            self.mark_full()
+            return
+        x, y, w, h = (int(v) for v in rect)
+        if w <= 0 or h <= 0:
+            return
+        m = self._margin
+        pending: Rect = (x - m, y - m, w + 2 * m, h + 2 * m)
+
+        # Fold every rect that touches the new one into it.
+        merged = True
+        while merged:
+            merged = False
+            for idx, existing in enumerate(self._rects):
+                if _overlaps(existing, pending):
+                    pending = _union(existing, pending)
+                    del self._rects[idx]
+                    merged = True
+                    break
+        self._rects.append(pending)
+
+        if len(self._rects) > self._max_rects:
+            bounds = self.bounds()
+            self._rects = [bounds] if bounds is not None else []
+
+    def intersects(self, rect: Rect) -> bool:
+        if self._full:
+            return True
+        return any(rects_intersect(existing, rect) for existing in self._rects)
+
+    def covers(self, width: int, height: int) -> bool:
+        """Return True when the region spans the whole ``width`` x ``height`` frame."""
+
+        if self._full:
+            return True
+        bounds = self.bounds()
+        if bounds is None:
+            return False
+        bx, by, bw, bh = bounds
+        return len(self._rects) == 1 and bx <= 0 and by <= 0 and bx + bw >= width and by + bh >= height
+
+
+__all__ = ["DamageRegion", "Rect", "rects_intersect"]
@@ -6,10 +6,13 @@ from typing import Any
 
 from .skia_module import get_skia
 from .color import (
+    PaintPool,
+    get_paint_pool,
     make_paint,
     make_opacity_paint,
     skcolor,
     rgba_to_skia_color,
+    shared_paint,
 )
 from .font import (
     get_typeface,
@@ -28,6 +31,8 @@ from .geometry import (
     draw_round_rect,
     clip_round_rect,
     clip_rect,
+    clip_path,
+    local_clip_bounds,
     make_point,
     draw_oval,
     make_path,
@@ -37,7 +42,33 @@ from .geometry import (
     path_line_to,
 )
 
+from .glyph_atlas import (
+    GlyphAtlas,
+    get_glyph_atlas,
+)
+from .image_cache import (
+    ImageCache,
+    get_image_cache,
+)
+from .image_decode import (
+    ImageDecoder,
+    get_image_decoder,
+)
+
+from .paragraph import (
+    LineSpan,
+    Paragraph,
+    ParagraphCache,
+    get_paragraph_cache,
+)
+from .text_cache import (
+    ShapedText,
+    TextShapeCache,
+    get_text_shape_cache,
+)
+
 from .surface import (
+    RasterSurfacePool,
     make_raster_surface,
     save_png,
 )
@@ -59,6 +90,9 @@ __all__ = [
     "require_skia",
     "make_paint",
     "make_opacity_paint",
+    "PaintPool",
+    "get_paint_pool",
+    "shared_paint",
     "skcolor",
     "rgba_to_skia_color",
     "get_typeface",
@@ -75,6 +109,8 @@ __all__ = [
     "draw_round_rect",
     "clip_round_rect",
     "clip_rect",
+    "clip_path",
+    "local_clip_bounds",
     "make_point",
     "draw_oval",
     "make_path",
@@ -82,6 +118,20 @@ __all__ = [
     "path_add_rrect",
     "path_move_to",
     "path_line_to",
+    "GlyphAtlas",
+    "get_glyph_atlas",
+    "ImageCache",
+    "get_image_cache",
+    "ImageDecoder",
+    "get_image_decoder",
+    "LineSpan",
+    "Paragraph",
+    "ParagraphCache",
+    "get_paragraph_cache",
+    "ShapedText",
+    "TextShapeCache",
+    "get_text_shape_cache",
+    "RasterSurfacePool",
     "make_raster_surface",
     "save_png",
     "make_blur_image_filter",
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Tuple
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
 from nuiitivet.colors.utils import hex_to_rgba
 from nuiitivet.common.logging_once import exception_once
@@ -141,6 +143,122 @@ def make_paint(
         return None
 
 
+DEFAULT_PAINT_POOL_ENTRIES = 1024
+
+
+class PaintPool:
+    """Interned paints keyed by ``(color, style, stroke_width, aa, stroke_cap)``.
+
+    Paints returned by the pool are shared between callers and across
+    frames, so they must never be mutated (no shaders, filters or color
+    changes). Callers that customize a paint should use ``make_paint``.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_PAINT_POOL_ENTRIES) -> None:
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._max_entries = max(0, int(max_entries))
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        color=None,
+        style: str = "fill",
+        stroke_width: float = 1.0,
+        aa: bool = True,
+        stroke_cap: str | None = None,
+    ) -> Optional[Any]:
+        """Return the shared paint for these settings, creating it on a miss."""
+        key = _paint_key(color, style, stroke_width, aa, stroke_cap)
+        if key is None:
+            return make_paint(color=color, style=style, stroke_width=stroke_width, aa=aa, stroke_cap=stroke_cap)
+        with self._lock:
+            paint = self._entries.get(key)
+            if paint is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return paint
+            self._misses += 1
+
+        paint = make_paint(color=color, style=style, stroke_width=stroke_width, aa=aa, stroke_cap=stroke_cap)
+        if paint is None:
+            return None
+        with self._lock:
+            if self._max_entries > 0:
+                self._entries[key] = paint
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+        return paint
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return counters; ``hits`` is the number of paint allocations avoided."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+
+def _paint_key(color, style: str, stroke_width: float, aa: bool, stroke_cap: str | None) -> Optional[tuple]:
+    if isinstance(color, list):
+        color = tuple(color)
+    is_stroke = style == "stroke"
+    key = (
+        color,
+        "stroke" if is_stroke else "fill",
+        float(stroke_width),
+        bool(aa),
+        # make_paint only applies a cap to stroke paints.
+        str(stroke_cap).strip().lower() if is_stroke and stroke_cap else None,
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+_PAINT_POOL = PaintPool()
+
+
+def get_paint_pool() -> PaintPool:
+    """Return the process-wide paint pool."""
+    return _PAINT_POOL
+
+
+def shared_paint(
+    color=None,
+    style: str = "fill",
+    stroke_width: float = 1.0,
+    aa: bool = True,
+    stroke_cap: str | None = None,
+):
+    """Return an interned, read-only skia.Paint (or None if unavailable).
+
+    Same arguments as ``make_paint``. The result is shared; do not mutate it.
+    """
+    return _PAINT_POOL.get(color=color, style=style, stroke_width=stroke_width, aa=aa, stroke_cap=stroke_cap)
+
+
 def make_opacity_paint(opacity: float):
     """Create a paint that applies uniform opacity to a saveLayer.
 
@@ -181,6 +299,10 @@ def make_opacity_paint(opacity: float):
 
 
 __all__ = [
+    "DEFAULT_PAINT_POOL_ENTRIES",
+    "PaintPool",
+    "get_paint_pool",
+    "shared_paint",
     "skcolor",
     "make_paint",
     "rgba_to_skia_color",
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional, Sequence, Union
+from typing import Optional, Sequence, Tuple, Union
 
 import logging
 
@@ -266,6 +266,57 @@ def clip_rect(canvas, rect, anti_alias: bool = True) -> bool:
         return False
 
 
+def clip_path(canvas, path, anti_alias: bool = True) -> bool:
+    """Clip canvas to a path (intersect). Returns True when applied."""
+
+    if canvas is None or path is None:
+        return False
+
+    skia = get_skia(raise_if_missing=False)
+    try:
+        if skia is not None:
+            clip_op = getattr(skia, "ClipOp", None)
+            if clip_op is not None and hasattr(clip_op, "kIntersect"):
+                try:
+                    canvas.clipPath(path, clip_op.kIntersect, bool(anti_alias))
+                    return True
+                except Exception:
+                    exception_once(
+                        logger,
+                        "canvas_clippath_clipop_exc",
+                        "canvas.clipPath(path, ClipOp.kIntersect, aa) failed; falling back to simpler signature",
+                    )
+        canvas.clipPath(path, bool(anti_alias))
+        return True
+    except Exception:
+        exception_once(logger, "canvas_clippath_exc", "canvas.clipPath failed")
+        return False
+
+
+def local_clip_bounds(canvas) -> Optional[Tuple[float, float, float, float]]:
+    """Return the canvas clip as (left, top, right, bottom) in local coordinates.
+
+    Skia pads the bounds by a pixel for anti-aliasing, so they are safe for
+    culling. Returns None when the canvas is not a skia canvas or the bounds
+    cannot be queried; callers should then assume everything is visible.
+    """
+
+    if canvas is None:
+        return None
+    skia = get_skia(raise_if_missing=False)
+    if skia is None:
+        return None
+    canvas_cls = getattr(skia, "Canvas", None)
+    if canvas_cls is None or not isinstance(canvas, canvas_cls):
+        return None
+    try:
+        rect = canvas.getLocalClipBounds()
+        return (float(rect.fLeft), float(rect.fTop), float(rect.fRight), float(rect.fBottom))
+    except Exception:
+        debug_once(logger, "canvas_get_local_clip_bounds_exc", "canvas.getLocalClipBounds failed")
+        return None
+
+
 def make_point(x: Number, y: Number) -> Optional[object]:
     """Return a skia.Point or None if unavailable."""
 
@@ -392,6 +443,8 @@ __all__ = [
     "draw_round_rect",
     "clip_round_rect",
     "clip_rect",
+    "clip_path",
+    "local_clip_bounds",
     "make_point",
     "draw_oval",
     "make_path",
@@ -0,0 +1,353 @@
+"""Shared raster atlas for icon glyphs."""
+
+from __future__ import annotations
+
+import logging
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+from nuiitivet.common.logging_once import exception_once
+
+from .font import make_font, make_text_blob
+from .skia_module import get_skia
+
+
+_logger = logging.getLogger(__name__)
+
+# Transparent margin around each glyph so antialiased edges never bleed
+# into a neighbour when sampled.
+_PAD = 1
+
+# Skia adjusts glyph mask contrast by text luminance, quantized to a few
+# bits; glyphs are rasterized per bucket so tinted copies match direct text.
+_LUMINANCE_SHIFT = 5
+
+# Device scales are rasterized in steps of this size, so an animated scale
+# (a press or a page transition) reuses a handful of entries instead of
+# adding one per frame. Draws between steps are resampled linearly.
+_SCALE_STEP = 0.125
+
+# Tolerance for treating two scales as equal.
+_EPSILON = 1e-3
+
+GlyphKey = Tuple[int, str, float, float, int]
+
+
+class _Glyph:
+    __slots__ = ("page", "src", "origin", "bounds")
+
+    def __init__(
+        self,
+        page: int,
+        src: Tuple[int, int, int, int],
+        origin: Tuple[int, int],
+        bounds: Tuple[float, float, float, float],
+    ) -> None:
+        self.page = page
+        self.src = src
+        # Text origin inside the cell, in device pixels.
+        self.origin = origin
+        # Blob bounds (left, top, width, height) in logical pixels.
+        self.bounds = bounds
+
+
+class _Page:
+    __slots__ = ("surface", "shelves", "snapshot")
+
+    def __init__(self, surface: Any) -> None:
+        self.surface = surface
+        # Each shelf is [y, height, next_x].
+        self.shelves: List[List[int]] = []
+        self.snapshot: Any = None
+
+
+class GlyphAtlas:
+    """Rasterize text glyphs once into shared pages and draw them as images.
+
+    Entries are keyed by ``(typeface, text, pixel size, device scale)``,
+    with the scale quantized to ``_SCALE_STEP``. Canvases that rotate, skew
+    or scale unevenly are not served; text there is drawn directly. Glyphs
+    are stored as coverage rasterized in a gray of the same luminance
+    bucket as the requested color; drawing tints them with a cached src-in
+    color filter, so one entry serves every color of similar lightness. When
+    all pages are full the atlas starts over.
+    """
+
+    def __init__(self, skia: Any, *, page_size: int = 1024, max_pages: int = 4) -> None:
+        self._skia = skia
+        self._page_size = max(64, int(page_size))
+        self._max_pages = max(1, int(max_pages))
+        self._pages: List[_Page] = []
+        self._entries: Dict[GlyphKey, Optional[_Glyph]] = {}
+        # Keep typefaces alive so their ids in the keys stay unique.
+        self._typefaces: Dict[int, Any] = {}
+        self._paints: Dict[Tuple[int, int, int, int], Any] = {}
+        self._sampling: Any = None
+        self._linear_sampling: Any = None
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def skia(self) -> Any:
+        return self._skia
+
+    def draw(
+        self,
+        canvas: Any,
+        typeface: Any,
+        text: str,
+        size: float,
+        color: Tuple[int, int, int, int],
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+    ) -> bool:
+        """Draw ``text`` centered in the rect the way ``IconBase.draw_blob`` does.
+
+        Returns False when the glyph cannot be served from the atlas (e.g. it
+        is larger than a page); the caller should draw it directly instead.
+        """
+        if canvas is None or not text:
+            return False
+        transform = _canvas_transform(canvas)
+        if transform is None:
+            return False
+        scale, tx, ty = transform
+        raster_scale = _quantize_scale(scale)
+        glyph = self._lookup(typeface, text, float(size), raster_scale, _luminance_bucket(color))
+        if glyph is None:
+            return False
+
+        image = self._page_image(glyph.page)
+        paint = self._paint_for(color)
+        if image is None or paint is None:
+            return False
+
+        skia = self._skia
+        left, top, bw, bh = glyph.bounds
+        sx, sy, sw, sh = glyph.src
+        ox, oy = glyph.origin
+        # Snap the text origin to device pixels like unhinted text drawing
+        # does, so the copy stays 1:1 with a direct drawTextBlob.
+        origin_x = math.floor(tx + (x + (width - bw) / 2.0 - left) * scale + 0.5)
+        origin_y = math.floor(ty + (y + (height - bh) / 2.0 - top) * scale + 0.5)
+        ratio = scale / raster_scale
+        cell_x = (origin_x - ox * ratio - tx) / scale
+        cell_y = (origin_y - oy * ratio - ty) / scale
+        # The origin is snapped, so atlas pixels land on device pixels unless
+        # the scale was quantized; nearest sampling would then look blocky.
+        aligned = abs(ratio - 1.0) < _EPSILON
+        try:
+            canvas.drawImageRect(
+                image,
+                skia.Rect.MakeXYWH(sx, sy, sw, sh),
+                skia.Rect.MakeXYWH(cell_x, cell_y, sw / raster_scale, sh / raster_scale),
+                self._sampling_options(linear=not aligned),
+                paint,
+            )
+            return True
+        except Exception:
+            exception_once(_logger, "glyph_atlas_draw_exc", "Failed to draw glyph from atlas")
+            return False
+
+    def clear(self) -> None:
+        self._pages.clear()
+        self._entries.clear()
+        self._typefaces.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "entries": sum(1 for glyph in self._entries.values() if glyph is not None),
+            "pages": len(self._pages),
+        }
+
+    def _lookup(self, typeface: Any, text: str, size: float, scale: float, bucket: int) -> Optional[_Glyph]:
+        key = (id(typeface), text, size, scale, bucket)
+        try:
+            glyph = self._entries[key]
+        except KeyError:
+            pass
+        else:
+            self._hits += 1
+            return glyph
+        self._misses += 1
+        glyph = self._rasterize(typeface, text, size, scale, bucket)
+        if glyph is not None and glyph.page < 0:
+            # Every page was full: start over with this glyph on a fresh page.
+            self.clear()
+            glyph = self._rasterize(typeface, text, size, scale, bucket)
+        if glyph is not None and glyph.page < 0:
+            glyph = None
+        self._entries[key] = glyph
+        self._typefaces[id(typeface)] = typeface
+        return glyph
+
+    def _rasterize(self, typeface: Any, text: str, size: float, scale: float, bucket: int) -> Optional[_Glyph]:
+        font = make_font(typeface, size * scale)
+        blob: Any = make_text_blob(text, font) if font is not None else None
+        if blob is None:
+            return None
+        try:
+            bounds = blob.bounds()
+            left, top = float(bounds.left()), float(bounds.top())
+            bw, bh = float(bounds.width()), float(bounds.height())
+        except Exception:
+            exception_once(_logger, "glyph_atlas_bounds_exc", "Failed to read glyph bounds")
+            return None
+        if bw <= 0.0 or bh <= 0.0:
+            return None
+
+        # Integer origin inside the cell; the ink then starts within one
+        # pixel past the padding.
+        ox = _PAD + int(math.ceil(-left))
+        oy = _PAD + int(math.ceil(-top))
+        cell_w = int(math.ceil(bw)) + 2 * _PAD + 1
+        cell_h = int(math.ceil(bh)) + 2 * _PAD + 1
+        if cell_w > self._page_size or cell_h > self._page_size:
+            return None
+
+        placed = self._allocate(cell_w, cell_h)
+        logical = (left / scale, top / scale, bw / scale, bh / scale)
+        if placed is None:
+            return _Glyph(-1, (0, 0, cell_w, cell_h), (ox, oy), logical)
+        page_index, px, py = placed
+        page = self._pages[page_index]
+
+        # Release the snapshot before writing so Skia need not copy the page.
+        page.snapshot = None
+        skia = self._skia
+        try:
+            gray = (bucket << _LUMINANCE_SHIFT) | (1 << (_LUMINANCE_SHIFT - 1))
+            paint = skia.Paint(AntiAlias=True, Color=skia.ColorSetARGB(255, gray, gray, gray))
+            page.surface.getCanvas().drawTextBlob(blob, px + ox, py + oy, paint)
+        except Exception:
+            exception_once(_logger, "glyph_atlas_rasterize_exc", "Failed to rasterize glyph into atlas")
+            return None
+        return _Glyph(page_index, (px, py, cell_w, cell_h), (ox, oy), logical)
+
+    def _allocate(self, w: int, h: int) -> Optional[Tuple[int, int, int]]:
+        """Shelf-pack a ``w`` x ``h`` cell; returns (page, x, y) or None when full."""
+        size = self._page_size
+        for index, page in enumerate(self._pages):
+            spot = self._place_on_page(page, w, h, size)
+            if spot is not None:
+                return (index, spot[0], spot[1])
+        if len(self._pages) >= self._max_pages:
+            return None
+        new_page = self._new_page()
+        if new_page is None:
+            return None
+        self._pages.append(new_page)
+        spot = self._place_on_page(new_page, w, h, size)
+        if spot is None:
+            return None
+        return (len(self._pages) - 1, spot[0], spot[1])
+
+    @staticmethod
+    def _place_on_page(page: _Page, w: int, h: int, size: int) -> Optional[Tuple[int, int]]:
+        for shelf in page.shelves:
+            shelf_y, shelf_h, next_x = shelf
+            # Reuse shelves that fit without wasting more than a third.
+            if h <= shelf_h and h * 3 >= shelf_h * 2 and next_x + w <= size:
+                shelf[2] = next_x + w
+                return (next_x, shelf_y)
+        top = page.shelves[-1][0] + page.shelves[-1][1] if page.shelves else 0
+        if top + h > size:
+            return None
+        page.shelves.append([top, h, w])
+        return (0, top)
+
+    def _new_page(self) -> Optional[_Page]:
+        skia = self._skia
+        try:
+            surface = skia.Surface(self._page_size, self._page_size)
+            surface.getCanvas().clear(skia.ColorTRANSPARENT)
+        except Exception:
+            exception_once(_logger, "glyph_atlas_page_exc", "Failed to allocate glyph atlas page")
+            return None
+        return _Page(surface)
+
+    def _page_image(self, index: int) -> Any:
+        page = self._pages[index]
+        if page.snapshot is None:
+            try:
+                page.snapshot = page.surface.makeImageSnapshot()
+            except Exception:
+                exception_once(_logger, "glyph_atlas_snapshot_exc", "Failed to snapshot glyph atlas page")
+                return None
+        return page.snapshot
+
+    def _paint_for(self, color: Tuple[int, int, int, int]) -> Any:
+        paint = self._paints.get(color)
+        if paint is not None:
+            return paint
+        skia = self._skia
+        try:
+            r, g, b, a = color
+            tint = skia.ColorSetARGB(int(a), int(r), int(g), int(b))
+            paint = skia.Paint(ColorFilter=skia.ColorFilters.Blend(tint, skia.BlendMode.kSrcIn))
+        except Exception:
+            exception_once(_logger, "glyph_atlas_paint_exc", "Failed to build glyph tint paint")
+            return None
+        if len(self._paints) >= 256:
+            self._paints.clear()
+        self._paints[color] = paint
+        return paint
+
+    def _sampling_options(self, linear: bool = False) -> Any:
+        if linear:
+            if self._linear_sampling is None:
+                skia = self._skia
+                self._linear_sampling = skia.SamplingOptions(skia.FilterMode.kLinear)
+            return self._linear_sampling
+        if self._sampling is None:
+            self._sampling = self._skia.SamplingOptions()
+        return self._sampling
+
+
+def _luminance_bucket(color: Tuple[int, int, int, int]) -> int:
+    r, g, b = int(color[0]), int(color[1]), int(color[2])
+    return ((r * 54 + g * 183 + b * 19) >> 8) >> _LUMINANCE_SHIFT
+
+
+def _canvas_transform(canvas: Any) -> Optional[Tuple[float, float, float]]:
+    """Return ``(scale, tx, ty)`` of the canvas, or None unless it is a uniform scale and translate."""
+    try:
+        matrix = canvas.getTotalMatrix()
+        if not matrix.isScaleTranslate():
+            return None
+        sx, sy = float(matrix.getScaleX()), float(matrix.getScaleY())
+        tx, ty = float(matrix.getTranslateX()), float(matrix.getTranslateY())
+    except Exception:
+        return None
+    if not all(math.isfinite(v) for v in (sx, sy, tx, ty)):
+        return None
+    if sx <= 0.0 or abs(sx - sy) > _EPSILON * sx:
+        return None
+    return (sx, tx, ty)
+
+
+def _quantize_scale(scale: float) -> float:
+    return max(_SCALE_STEP, round(scale / _SCALE_STEP) * _SCALE_STEP)
+
+
+_ATLAS: Optional[GlyphAtlas] = None
+
+
+def get_glyph_atlas() -> Optional[GlyphAtlas]:
+    """Return the shared glyph atlas, or None when skia is unavailable."""
+    global _ATLAS
+    skia = get_skia(raise_if_missing=False)
+    if skia is None:
+        return None
+    atlas = _ATLAS
+    if atlas is None or atlas.skia is not skia:
+        atlas = GlyphAtlas(skia)
+        _ATLAS = atlas
+    return atlas
+
+
+__all__ = ["GlyphAtlas", "get_glyph_atlas"]
@@ -0,0 +1,166 @@
+"""Process-wide cache of decoded images keyed by content hash."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from nuiitivet.common.logging_once import exception_once
+
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_IMAGE_CACHE_BYTES = 128 * 1024 * 1024
+
+
+def image_content_key(data: bytes) -> bytes:
+    """Return the cache key for encoded image bytes."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def image_byte_size(image: Any) -> int:
+    """Estimate the decoded (RGBA) footprint of ``image`` in bytes."""
+    try:
+        width_attr = getattr(image, "width", None)
+        w = width_attr() if callable(width_attr) else width_attr
+        height_attr = getattr(image, "height", None)
+        h = height_attr() if callable(height_attr) else height_attr
+        return max(0, int(w or 0)) * max(0, int(h or 0)) * 4
+    except Exception:
+        exception_once(_logger, "image_cache_size_exc", "Failed to read decoded image size")
+        return 0
+
+
+class ImageCache:
+    """LRU cache of decoded images bounded by an estimated byte budget.
+
+    Identical encoded bytes map to one decoded image no matter how many
+    widgets display them or how often those widgets are rebuilt. Entries
+    are evicted least recently used first once the budget is exceeded; an
+    image larger than the whole budget is returned but never cached.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_IMAGE_CACHE_BYTES) -> None:
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Any, Tuple[Any, int]]" = OrderedDict()
+        self._max_bytes = max(0, int(max_bytes))
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        with self._lock:
+            self._max_bytes = max(0, int(value))
+            self._evict_locked()
+
+    @property
+    def current_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Return the cached image for ``key`` and mark it recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: Any, image: Any) -> None:
+        """Store ``image`` under ``key``, evicting older entries as needed."""
+        if image is None:
+            return
+        size = image_byte_size(image)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            if size > self._max_bytes:
+                return
+            self._entries[key] = (image, size)
+            self._bytes += size
+            self._evict_locked()
+
+    def get_or_decode(self, data: bytes, decode: Callable[[bytes], Any], *, key: Any = None) -> Optional[Any]:
+        """Return the decoded image for ``data``, decoding it on a miss.
+
+        Decoding happens outside the lock, so two threads missing on the same
+        bytes may both decode; the later result replaces the earlier one.
+        Failed decodes (``None``) are not cached.
+        """
+        if key is None:
+            key = image_content_key(data)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        image = decode(data)
+        if image is not None:
+            self.put(key, image)
+        return image
+
+    def discard(self, key: Any) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/eviction counters and current occupancy."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def _evict_locked(self) -> None:
+        entries = self._entries
+        while self._bytes > self._max_bytes and entries:
+            _key, (_image, size) = entries.popitem(last=False)
+            self._bytes -= size
+            self._evictions += 1
+
+
+_IMAGE_CACHE = ImageCache()
+
+
+def get_image_cache() -> ImageCache:
+    """Return the process-wide decoded image cache."""
+    return _IMAGE_CACHE
+
+
+__all__ = [
+    "DEFAULT_IMAGE_CACHE_BYTES",
+    "ImageCache",
+    "get_image_cache",
+    "image_byte_size",
+    "image_content_key",
+]
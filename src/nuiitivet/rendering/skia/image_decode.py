@@ -0,0 +1,213 @@
+"""Off-thread image decoding to the size an image is displayed at."""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+from nuiitivet.common.logging_once import exception_once
+from nuiitivet.observable.value import Observable
+
+from .image_cache import get_image_cache, image_content_key
+from .skia_module import get_skia
+
+
+_logger = logging.getLogger(__name__)
+
+Size = Tuple[int, int]
+
+# Published by ``ImageDecoder.request`` observables when the worker could not
+# decode the bytes, so callers can stop waiting and fall back.
+DECODE_FAILED: Any = object()
+
+
+def read_image_size(data: bytes) -> Optional[Size]:
+    """Return the intrinsic ``(width, height)`` of encoded bytes.
+
+    Only the header is parsed, so this is cheap enough for the UI thread.
+    """
+    skia = get_skia(raise_if_missing=False)
+    if skia is None:
+        return None
+    codec = _make_codec(skia, data)
+    if codec is None:
+        return None
+    try:
+        dims = codec.dimensions()
+        width, height = int(dims.width()), int(dims.height())
+        if _origin_swaps_axes(skia, codec):
+            width, height = height, width
+        return (width, height)
+    except Exception:
+        exception_once(_logger, "image_decode_read_size_exc", "Failed to read encoded image size")
+        return None
+
+
+def fit_decode_size(intrinsic: Size, box: Size) -> Optional[Size]:
+    """Return the smallest decode size that still covers ``box`` at 1:1.
+
+    The aspect ratio is preserved and images are never upscaled; ``None``
+    means the full-resolution decode is needed.
+    """
+    src_w, src_h = intrinsic
+    box_w, box_h = box
+    if src_w <= 0 or src_h <= 0 or box_w <= 0 or box_h <= 0:
+        return None
+    scale = max(float(box_w) / float(src_w), float(box_h) / float(src_h))
+    if scale >= 1.0:
+        return None
+    return (max(1, math.ceil(src_w * scale)), max(1, math.ceil(src_h * scale)))
+
+
+def decode_image(data: bytes, size: Optional[Size] = None) -> Optional[Any]:
+    """Decode ``data`` into a raster image, downsampled to ``size`` if given.
+
+    Formats that support it (e.g. JPEG) are decoded directly at a reduced
+    scale, so the full-resolution pixels are never materialized.
+    """
+    skia = get_skia(raise_if_missing=False)
+    if skia is None:
+        return None
+
+    image = None
+    if size is not None:
+        image = _decode_scaled(skia, data, size)
+    if image is None:
+        image = skia.Image.MakeFromEncoded(data)
+        if image is None:
+            return None
+    if size is not None and (image.width(), image.height()) != tuple(size):
+        image = image.resize(int(size[0]), int(size[1]), skia.SamplingOptions(skia.FilterMode.kLinear))
+    if image is not None and image.isLazyGenerated():
+        image = image.makeRasterImage()
+    return image
+
+
+def _make_codec(skia: Any, data: bytes) -> Optional[Any]:
+    try:
+        return skia.Codec.MakeFromData(skia.Data.MakeWithoutCopy(data))
+    except RuntimeError:
+        # Raised for bytes no codec recognizes; callers treat it as undecodable.
+        return None
+
+
+def _origin_swaps_axes(skia: Any, codec: Any) -> bool:
+    origin = codec.getOrigin()
+    return origin in (
+        skia.EncodedOrigin.kLeftTop_EncodedOrigin,
+        skia.EncodedOrigin.kRightTop_EncodedOrigin,
+        skia.EncodedOrigin.kRightBottom_EncodedOrigin,
+        skia.EncodedOrigin.kLeftBottom_EncodedOrigin,
+    )
+
+
+def _decode_scaled(skia: Any, data: bytes, size: Size) -> Optional[Any]:
+    codec = _make_codec(skia, data)
+    if codec is None:
+        return None
+    try:
+        if codec.getOrigin() != skia.EncodedOrigin.kTopLeft_EncodedOrigin:
+            return None
+        dims = codec.dimensions()
+        scale = max(size[0] / float(dims.width()), size[1] / float(dims.height()))
+        scaled = codec.getScaledDimensions(scale)
+        # Codecs only offer a few scales; fall back if the nearest is too small.
+        if scaled.width() < size[0] or scaled.height() < size[1]:
+            return None
+        if scaled.width() >= dims.width() and scaled.height() >= dims.height():
+            return None
+        info = skia.ImageInfo.MakeN32Premul(scaled.width(), scaled.height())
+        bitmap = skia.Bitmap()
+        bitmap.allocPixels(info)
+        if codec.getPixels(info, bitmap.getPixels(), bitmap.rowBytes()) != skia.Codec.Result.kSuccess:
+            return None
+        bitmap.setImmutable()
+        return skia.Image.MakeFromBitmap(bitmap)
+    except Exception:
+        exception_once(_logger, "image_decode_scaled_exc", "Scaled codec decode failed; using full decode")
+        return None
+
+
+class ImageDecoder:
+    """Decode images on worker threads and deliver them to the UI thread.
+
+    ``request`` returns an observable created with ``dispatch_to_ui`` that
+    holds ``None`` until the decode finishes, then the decoded image or
+    ``DECODE_FAILED``.
+    Results go through the shared image cache keyed by content and decode
+    size, and concurrent requests for the same key share one decode.
+    """
+
+    def __init__(self, executor: Optional[Executor] = None, *, max_workers: int = 2) -> None:
+        self._executor = executor
+        self._max_workers = max(1, int(max_workers))
+        self._lock = threading.Lock()
+        self._pending: Dict[Any, "Observable[Optional[Any]]"] = {}
+
+    def request(self, data: bytes, size: Optional[Size] = None) -> "Observable[Optional[Any]]":
+        key = (image_content_key(data), None if size is None else (int(size[0]), int(size[1])))
+        cached = get_image_cache().get(key)
+        if cached is not None:
+            return Observable(cached)
+
+        with self._lock:
+            result = self._pending.get(key)
+            if result is not None:
+                return result
+            result = Observable(None)
+            result.dispatch_to_ui()
+            self._pending[key] = result
+            executor = self._ensure_executor()
+        executor.submit(self._decode, key, data, size, result)
+        return result
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _ensure_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="nuiitivet-image")
+        return self._executor
+
+    def _decode(self, key: Any, data: bytes, size: Optional[Size], result: "Observable[Optional[Any]]") -> None:
+        try:
+            image = decode_image(data, size)
+        except Exception:
+            exception_once(_logger, "image_decode_worker_exc", "Failed to decode image bytes")
+            image = None
+        if image is not None:
+            get_image_cache().put(key, image)
+        with self._lock:
+            self._pending.pop(key, None)
+        # Failures are not cached; a later request tries again.
+        result.value = image if image is not None else DECODE_FAILED
+
+
+_DECODER: Optional[ImageDecoder] = None
+_DECODER_LOCK = threading.Lock()
+
+
+def get_image_decoder() -> ImageDecoder:
+    """Return the process-wide image decoder, creating it on first use."""
+    global _DECODER
+    with _DECODER_LOCK:
+        if _DECODER is None:
+            _DECODER = ImageDecoder()
+        return _DECODER
+
+
+__all__ = [
+    "DECODE_FAILED",
+    "ImageDecoder",
+    "decode_image",
+    "fit_decode_size",
+    "get_image_decoder",
+    "read_image_size",
+]
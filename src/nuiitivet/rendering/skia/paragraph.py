@@ -0,0 +1,324 @@
+"""Multi-line paragraph layout with cached shaping and line breaking.
+
+A :class:`Paragraph` measures per-character advances once. Line breaking
+then works on prefix sums only, so a width change reflows the paragraph
+without touching Skia again. Results are memoized per
+``(max_width, max_lines, ellipsis_width)``.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from nuiitivet.common.logging_once import exception_once
+
+from .font import make_font
+
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_PARAGRAPH_CACHE_ENTRIES = 1024
+
+# Line layouts memoized per paragraph (widths seen during a resize drag).
+_MAX_LAYOUTS_PER_PARAGRAPH = 8
+
+
+class LineSpan(NamedTuple):
+    """One laid-out line: ``text[start:end]`` plus an optional ellipsis.
+
+    ``end`` excludes trailing whitespace, and ``width`` includes the ellipsis.
+    """
+
+    start: int
+    end: int
+    width: float
+    ellipsis: bool = False
+
+
+def _is_space(ch: str) -> bool:
+    return ch == " " or ch == "\t" or ch == "　"
+
+
+def _is_cjk(ch: str) -> bool:
+    # Ideographs, kana and fullwidth forms may break between any two characters.
+    code = ord(ch)
+    return 0x2E80 <= code <= 0x9FFF or 0xF900 <= code <= 0xFAFF or 0xFF00 <= code <= 0xFFEF
+
+
+class Paragraph:
+    """Shaped paragraph that can be reflowed to any width.
+
+    ``advances`` holds one advance per character of ``text``. Hard line
+    breaks (``\\n``) always start a new line; soft breaks happen after
+    whitespace and around CJK characters, falling back to a character
+    break when a single word is wider than the line.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        advances: Sequence[float],
+        *,
+        ascent: float = 0.0,
+        descent: float = 0.0,
+        leading: float = 0.0,
+    ) -> None:
+        self.text = str(text)
+        if len(advances) != len(self.text):
+            raise ValueError("advances must have one entry per character")
+        prefix = [0.0]
+        total = 0.0
+        for adv in advances:
+            total += float(adv)
+            prefix.append(total)
+        self._prefix = prefix
+        self.ascent = float(ascent)
+        self.descent = float(descent)
+        self.leading = float(leading)
+        self._layouts: "OrderedDict[Tuple[Optional[float], Optional[int], float], Tuple[LineSpan, ...]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._natural_width: Optional[float] = None
+
+    @property
+    def line_height(self) -> float:
+        return max(0.0, self.descent - self.ascent + self.leading)
+
+    @property
+    def natural_width(self) -> float:
+        """Width of the widest hard line when nothing wraps."""
+        if self._natural_width is None:
+            self._natural_width = max((line.width for line in self.lines(None)), default=0.0)
+        return self._natural_width
+
+    def width_of(self, start: int, end: int) -> float:
+        return self._prefix[end] - self._prefix[start]
+
+    def height_for(self, line_count: int) -> float:
+        if line_count <= 0:
+            return 0.0
+        return line_count * self.line_height - self.leading
+
+    def lines(
+        self,
+        max_width: Optional[float],
+        max_lines: Optional[int] = None,
+        ellipsis_width: float = 0.0,
+    ) -> Tuple[LineSpan, ...]:
+        """Break the paragraph into lines no wider than ``max_width``.
+
+        ``max_width=None`` only honours hard breaks. When more than
+        ``max_lines`` lines result and ``ellipsis_width`` is positive, the
+        last kept line is shortened to leave room for the ellipsis.
+        """
+        width_key = None if max_width is None else round(max(0.0, float(max_width)), 2)
+        lines_key = None if max_lines is None or max_lines <= 0 else int(max_lines)
+        key = (width_key, lines_key, round(float(ellipsis_width), 2))
+        with self._lock:
+            cached = self._layouts.get(key)
+            if cached is not None:
+                self._layouts.move_to_end(key)
+                return cached
+
+        result = self._break_lines(width_key, lines_key, key[2])
+        with self._lock:
+            self._layouts[key] = result
+            while len(self._layouts) > _MAX_LAYOUTS_PER_PARAGRAPH:
+                self._layouts.popitem(last=False)
+        return result
+
+    def _break_lines(
+        self,
+        max_width: Optional[float],
+        max_lines: Optional[int],
+        ellipsis_width: float,
+    ) -> Tuple[LineSpan, ...]:
+        text = self.text
+        n = len(text)
+        out: List[LineSpan] = []
+
+        para_start = 0
+        while para_start <= n:
+            hard_end = text.find("\n", para_start)
+            if hard_end < 0:
+                hard_end = n
+            self._break_hard_line(para_start, hard_end, max_width, out)
+            if max_lines is not None and len(out) > max_lines:
+                break
+            para_start = hard_end + 1
+            if hard_end == n:
+                break
+
+        if max_lines is not None and len(out) > max_lines:
+            del out[max_lines:]
+            if ellipsis_width > 0.0:
+                out[-1] = self._fit_ellipsis(out[-1], max_width, ellipsis_width)
+        return tuple(out)
+
+    def _break_hard_line(self, start: int, end: int, max_width: Optional[float], out: List[LineSpan]) -> None:
+        text = self.text
+        if start == end or max_width is None:
+            out.append(self._span(start, end))
+            return
+
+        line_start = start
+        # Index where the next line may start if the current one overflows.
+        last_break = -1
+        i = start
+        while i < end:
+            ch = text[i]
+            space = _is_space(ch)
+            if _is_cjk(ch) and i > line_start:
+                last_break = i
+            # Trailing whitespace hangs past the edge instead of wrapping.
+            if not space and i > line_start and self.width_of(line_start, i + 1) > max_width:
+                cut = last_break if last_break > line_start else i
+                out.append(self._span(line_start, cut))
+                line_start = cut
+                while line_start < end and _is_space(text[line_start]):
+                    line_start += 1
+                last_break = -1
+                i = line_start
+                continue
+            if space or _is_cjk(ch):
+                last_break = i + 1
+            i += 1
+
+        out.append(self._span(line_start, end))
+
+    def _span(self, start: int, end: int) -> LineSpan:
+        # Trailing whitespace is neither drawn nor measured.
+        text = self.text
+        while end > start and _is_space(text[end - 1]):
+            end -= 1
+        return LineSpan(start, end, self.width_of(start, end))
+
+    def _fit_ellipsis(self, line: LineSpan, max_width: Optional[float], ellipsis_width: float) -> LineSpan:
+        end = line.end
+        if max_width is not None:
+            limit = max(0.0, max_width - ellipsis_width)
+            lo, hi = line.start, end
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                if self.width_of(line.start, mid) <= limit:
+                    lo = mid
+                else:
+                    hi = mid - 1
+            end = lo
+        return LineSpan(line.start, end, self.width_of(line.start, end) + ellipsis_width, True)
+
+
+def measure_paragraph(typeface: Optional[object], size: float, text: str) -> Optional[Paragraph]:
+    """Shape ``text`` into a :class:`Paragraph` (uncached).
+
+    Returns None when skia is unavailable.
+    """
+    if typeface is None:
+        return None
+    font: Any = make_font(typeface, size)
+    if font is None:
+        return None
+    text_value = str(text)
+    try:
+        # Measure with newlines mapped to spaces; they never contribute width.
+        glyphs = font.textToGlyphs(text_value.replace("\n", " "))
+        advances: List[float] = [float(w) for w in font.getWidths(glyphs)]
+        if len(advances) != len(text_value):
+            return None
+        for idx, ch in enumerate(text_value):
+            if ch == "\n":
+                advances[idx] = 0.0
+        metrics = font.getMetrics()
+        return Paragraph(
+            text_value,
+            advances,
+            ascent=float(metrics.fAscent),
+            descent=float(metrics.fDescent),
+            leading=float(metrics.fLeading),
+        )
+    except Exception:
+        exception_once(_logger, "paragraph_measure_exc", "Failed to measure paragraph")
+        return None
+
+
+class ParagraphCache:
+    """LRU cache of shaped paragraphs keyed by ``(typeface id, size, text)``."""
+
+    def __init__(self, max_entries: int = DEFAULT_PARAGRAPH_CACHE_ENTRIES) -> None:
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[int, float, str], Tuple[Paragraph, Any]]" = OrderedDict()
+        self._max_entries = max(0, int(max_entries))
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, typeface: Optional[object], size: float, text: str) -> Optional[Paragraph]:
+        """Return the paragraph for ``text``, shaping it on a miss."""
+        if typeface is None:
+            return None
+        key = (id(typeface), round(float(size), 3), str(text))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is typeface:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+
+        paragraph = measure_paragraph(typeface, key[1], key[2])
+        if paragraph is None:
+            return None
+        with self._lock:
+            if self._max_entries > 0:
+                self._entries[key] = (paragraph, typeface)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+        return paragraph
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/eviction counters and current occupancy."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+
+_PARAGRAPH_CACHE = ParagraphCache()
+
+
+def get_paragraph_cache() -> ParagraphCache:
+    """Return the process-wide paragraph cache."""
+    return _PARAGRAPH_CACHE
+
+
+__all__ = [
+    "DEFAULT_PARAGRAPH_CACHE_ENTRIES",
+    "LineSpan",
+    "Paragraph",
+    "ParagraphCache",
+    "get_paragraph_cache",
+    "measure_paragraph",
+]
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections import OrderedDict
+from typing import Any, Tuple
 
 from .skia_module import get_skia
 
@@ -19,6 +20,41 @@ def make_raster_surface(width: int, height: int) -> Any:
     return skia.Surface(int(width), int(height))
 
 
+class RasterSurfacePool:
+    """Keep raster surfaces alive across frames, keyed by physical size.
+
+    Allocating a full-window surface every frame dominates CPU rendering at
+    high resolutions. The pool hands back the same surface while the size is
+    unchanged and keeps a few recent sizes so toggling between window sizes
+    (maximize/restore, DPI moves) does not reallocate either.
+    """
+
+    def __init__(self, max_surfaces: int = 2) -> None:
+        self._max_surfaces = max(1, int(max_surfaces))
+        self._surfaces: "OrderedDict[Tuple[int, int], Any]" = OrderedDict()
+
+    def acquire(self, width: int, height: int) -> Tuple[Any, bool]:
+        """Return ``(surface, reused)`` for the given physical size.
+
+        ``reused`` is False when the surface was just allocated; its pixels
+        are then undefined and the caller must repaint everything.
+        """
+
+        key = (max(1, int(width)), max(1, int(height)))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface, True
+        surface = make_raster_surface(*key)
+        self._surfaces[key] = surface
+        while len(self._surfaces) > self._max_surfaces:
+            self._surfaces.popitem(last=False)
+        return surface, False
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+
+
 def save_png(image: Any, path: str) -> None:
     """Save a skia.Image to a PNG file path.
 
@@ -36,6 +72,7 @@ def save_png(image: Any, path: str) -> None:
 
 
 __all__ = [
+    "RasterSurfacePool",
     "make_raster_surface",
     "save_png",
 ]
@@ -0,0 +1,140 @@
+"""Process-wide cache of shaped text keyed by typeface, size and string."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from nuiitivet.common.logging_once import exception_once
+
+from .font import make_font, make_text_blob, measure_text_ink_bounds
+
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_TEXT_CACHE_ENTRIES = 4096
+
+
+class ShapedText(NamedTuple):
+    """A shaped run: its TextBlob, tight ink bounds and font."""
+
+    blob: Any
+    ink_bounds: Tuple[float, float, float, float]
+    font: Any
+
+
+class TextShapeCache:
+    """LRU cache of shaped text bounded by entry count.
+
+    Keys are ``(typeface id, size, text)``. Each entry keeps its typeface
+    alive, so an id cannot be reused by another typeface while an entry for
+    it is cached. Runs that fail to shape (``None`` blob) are not cached.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_TEXT_CACHE_ENTRIES) -> None:
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[int, float, str], Tuple[ShapedText, Any]]" = OrderedDict()
+        self._max_entries = max(0, int(max_entries))
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, value: int) -> None:
+        with self._lock:
+            self._max_entries = max(0, int(value))
+            self._evict_locked()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def shape(self, typeface: Optional[object], size: float, text: str) -> Optional[ShapedText]:
+        """Return the shaped run for ``text``, shaping it on a miss.
+
+        Returns None when skia is unavailable or the text cannot be shaped.
+        """
+        if typeface is None:
+            return None
+        text_value = str(text)
+        key = (id(typeface), round(float(size), 3), text_value)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is typeface:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+
+        shaped = self._shape_uncached(typeface, key[1], text_value)
+        if shaped is None:
+            return None
+        with self._lock:
+            if self._max_entries > 0:
+                self._entries[key] = (shaped, typeface)
+                self._entries.move_to_end(key)
+                self._evict_locked()
+        return shaped
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/eviction counters and current occupancy."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    @staticmethod
+    def _shape_uncached(typeface: object, size: float, text: str) -> Optional[ShapedText]:
+        try:
+            font = make_font(typeface, size)
+            if font is None:
+                return None
+            blob = make_text_blob(text, font)
+            if blob is None:
+                return None
+            bounds = measure_text_ink_bounds(typeface, size, text)
+        except Exception:
+            exception_once(_logger, "text_cache_shape_exc", "Failed to shape text run")
+            return None
+        return ShapedText(blob, tuple(float(v) for v in bounds), font)  # type: ignore[arg-type]
+
+    def _evict_locked(self) -> None:
+        entries = self._entries
+        while len(entries) > self._max_entries and entries:
+            entries.popitem(last=False)
+            self._evictions += 1
+
+
+_TEXT_SHAPE_CACHE = TextShapeCache()
+
+
+def get_text_shape_cache() -> TextShapeCache:
+    """Return the process-wide shaped text cache."""
+    return _TEXT_SHAPE_CACHE
+
+
+__all__ = [
+    "DEFAULT_TEXT_CACHE_ENTRIES",
+    "ShapedText",
+    "TextShapeCache",
+    "get_text_shape_cache",
+]
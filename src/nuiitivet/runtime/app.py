@@ -1,6 +1,7 @@
 """App runner that can render a widget tree to an image using Skia."""
 
 import logging
+import math
 import os
 import sys
 import time
@@ -11,11 +12,22 @@ from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from ..widgeting.widget import ComposableWidget, Widget
 from .pointer import PointerCaptureManager
+from .profiler import get_frame_profiler
 from nuiitivet.input.pointer import PointerEvent, PointerEventType, PointerType
 from ..widgeting.widget_binding import flush_binding_invalidations
 from ..widgeting.widget_builder import flush_scope_recompositions
 
-from ..rendering.skia import make_raster_surface, require_skia, rgba_to_skia_color, save_png
+from ..rendering.damage import DamageRegion
+from ..rendering.skia import (
+    clip_path,
+    RasterSurfacePool,
+    make_path,
+    make_rect,
+    path_add_rect,
+    require_skia,
+    rgba_to_skia_color,
+    save_png,
+)
 from ..theme import manager as theme_manager
 from nuiitivet.theme.plain_theme import PlainColorRole, PlainTheme
 from nuiitivet.theme.resolver import resolve_color_to_rgba
@@ -290,6 +302,13 @@ class App:
         self._update_background_color()
         self._subscribe_theme_updates()
         self._last_layout_size: Optional[tuple[int, int]] = None
+        self._damage = DamageRegion()
+        self._relayout_boundaries: list[Widget] = []
+        self._surface_pool = RasterSurfacePool()
+        self._frame_surface: Any = None
+        self._frame_surface_key: Optional[tuple[int, int, float]] = None
+        # Logical rects repainted by the last `_paint_damage`; None means everything.
+        self._painted_damage: Optional[tuple[tuple[int, int, int, int], ...]] = None
         self._saved_window_rect: Optional[tuple[int, int, int, int]] = None
 
         def _env_flag(name: str, default: bool = False) -> bool:
@@ -595,9 +614,13 @@ class App:
             exception_once(logger, "app_theme_unsubscribe_exc", "ThemeManager.unsubscribe raised")
         self._theme_subscription = None
 
-    def _mount_paint_unmount(self, canvas, x: int, y: int, w: int, h: int) -> None:
+    def _mount_paint_unmount(self, canvas, x: int, y: int, w: int, h: int, clear_color: Any = None) -> None:
         """Temporarily mount the root widget, paint it, then unmount.
 
+        When ``clear_color`` is given the canvas is assumed to hold the
+        previous frame: only the accumulated damage is cleared and repainted
+        (everything, after a relayout).
+
         All exceptions are converted to warnings to avoid crashing render
         paths while preserving debugging information.
         """
@@ -606,6 +629,7 @@ class App:
 
         # Check if already mounted (e.g. running in App.run)
         is_mounted = getattr(self.root, "_app", None) is not None
+        profiler = get_frame_profiler()
 
         if not is_mounted:
             try:
@@ -619,19 +643,30 @@ class App:
             current_size = (w, h)
 
             if needs_layout or last_size != current_size:
-                self.root.layout(w, h)
+                self._damage.mark_full()
+                self._relayout_boundaries.clear()
+                with profiler.span("layout"):
+                    self.root.layout(w, h)
                 self._last_layout_size = current_size
                 try:
                     self.root.clear_needs_layout()
                 except Exception as e:
                     warnings.warn(f"root.clear_needs_layout() failed: {e}", RuntimeWarning, stacklevel=2)
+            else:
+                with profiler.span("layout", relayout_boundaries=len(self._relayout_boundaries)):
+                    self._flush_relayout_boundaries()
         except Exception as e:
             warnings.warn(f"root.layout() failed: {e}", RuntimeWarning, stacklevel=2)
 
-        try:
-            self.root.paint(canvas, x, y, w, h)
-        except Exception as e:
-            warnings.warn(f"root.paint() failed: {e}", RuntimeWarning, stacklevel=2)
+        with profiler.span("paint"):
+            if clear_color is None:
+                self._painted_damage = None
+                try:
+                    self.root.paint(canvas, x, y, w, h)
+                except Exception as e:
+                    warnings.warn(f"root.paint() failed: {e}", RuntimeWarning, stacklevel=2)
+            else:
+                self._paint_damage(canvas, x, y, w, h, clear_color)
 
         if not is_mounted:
             try:
@@ -639,16 +674,100 @@ class App:
             except Exception as e:
                 warnings.warn(f"root.unmount() failed: {e}", RuntimeWarning, stacklevel=2)
 
+    def schedule_relayout(self, widget: Widget) -> None:
+        """Queue a relayout boundary to be laid out on its own next frame."""
+        if widget not in self._relayout_boundaries:
+            self._relayout_boundaries.append(widget)
+
+    def _flush_relayout_boundaries(self) -> None:
+        """Lay out queued relayout boundaries in place, outermost first."""
+        pending = self._relayout_boundaries
+        if not pending:
+            return
+        self._relayout_boundaries = []
+
+        def _depth(widget: Widget) -> int:
+            depth = 0
+            current = widget.parent
+            while current is not None:
+                depth += 1
+                current = getattr(current, "parent", None)
+            return depth
+
+        for widget in sorted(pending, key=_depth):
+            rect = widget.layout_rect
+            # Skip detached widgets and ones an outer boundary already laid out.
+            if rect is None or getattr(widget, "_app", None) is not self or not widget.needs_layout:
+                continue
+            try:
+                widget.layout(rect[2], rect[3])
+                widget.set_layout_rect(*rect)
+                widget.clear_needs_layout()
+            except Exception:
+                exception_once(
+                    logger,
+                    f"app_relayout_boundary_exc:{type(widget).__name__}",
+                    "Relayout of %s raised",
+                    type(widget).__name__,
+                )
+            self._damage.add_rect(widget.damage_rect())
+
+    def _paint_damage(self, canvas, x: int, y: int, w: int, h: int, clear_color: Any) -> None:
+        """Clear and repaint the damaged part of a retained canvas."""
+        damage = self._damage
+        if damage.is_empty:
+            self._painted_damage = ()
+            return
+        if damage.covers(w, h):
+            self._painted_damage = None
+            canvas.clear(clear_color)
+            try:
+                self.root.paint(canvas, x, y, w, h)
+            except Exception as e:
+                warnings.warn(f"root.paint() failed: {e}", RuntimeWarning, stacklevel=2)
+            damage.clear()
+            return
+
+        canvas.save()
+        try:
+            path = make_path()
+            # Without a clip path the clear below wipes the whole canvas.
+            self._painted_damage = damage.rects() if path is not None else None
+            if path is not None:
+                for dx, dy, dw, dh in damage.rects():
+                    path_add_rect(path, make_rect(dx, dy, dw, dh))
+                clip_path(canvas, path, anti_alias=False)
+            canvas.clear(clear_color)
+            self.root.paint(canvas, x, y, w, h)
+        except Exception as e:
+            warnings.warn(f"root.paint() failed: {e}", RuntimeWarning, stacklevel=2)
+        finally:
+            canvas.restore()
+        damage.clear()
+
     # --- Window / interactive runtime ---------------------------------
     def invalidate(self, immediate: bool = False):
         """Request that the next frame be redrawn.
 
         This sets an internal dirty flag which the render loop checks to
-        decide whether to re-render the UI.
+        decide whether to re-render the UI. The whole window is repainted;
+        use :meth:`invalidate_rect` when only a known area changed.
 
         Args:
             immediate: If True and running in pyglet, bypass FPS throttle for next draw
         """
+        self._damage.mark_full()
+        self._request_frame(immediate)
+
+    def invalidate_rect(self, rect: Optional[tuple[int, int, int, int]], immediate: bool = False) -> None:
+        """Request a redraw limited to ``rect`` (root coordinates, logical px).
+
+        Damage accumulates until the next frame. ``None`` repaints everything.
+        """
+        self._damage.add_rect(rect)
+        self._request_frame(immediate)
+
+    def _request_frame(self, immediate: bool) -> None:
         self._dirty = True
         self._debug_record_invalidate()
         loop = self._event_loop
@@ -670,18 +789,31 @@ class App:
             raise RuntimeError("encodeToData() returned None (failed to encode image)")
         return bytes(data)
 
-    def _render_snapshot(self, scale: float = 1.0):
-        """Create a Skia image snapshot for the current root at given scale.
+    def _render_raster_frame(self, scale: float = 1.0) -> tuple[Any, Optional[tuple[tuple[int, int, int, int], ...]]]:
+        """Paint the current root into a pooled raster surface.
 
-        Returns an image object. Raises RuntimeError if Skia is missing or
-        snapshot/encoding fails.
+        Returns ``(surface, damaged)`` where ``damaged`` lists the device-pixel
+        rects repainted this frame, or None when the whole surface changed.
+        Backends use it to upload only the changed pixels.
         """
+        profiler = get_frame_profiler()
+        profiler.begin_frame()
+        try:
+            return self._render_raster_frame_impl(scale, profiler)
+        finally:
+            profiler.end_frame()
+
+    def _render_raster_frame_impl(
+        self, scale: float, profiler: Any
+    ) -> tuple[Any, Optional[tuple[tuple[int, int, int, int], ...]]]:
         try:
-            flush_binding_invalidations()
+            with profiler.span("flush_binding_invalidations"):
+                flush_binding_invalidations()
         except Exception:
             exception_once(logger, "app_snapshot_flush_binding_invalidations_exc", "flush_binding_invalidations failed")
         try:
-            flush_scope_recompositions()
+            with profiler.span("flush_scope_recompositions"):
+                flush_scope_recompositions()
         except Exception:
             exception_once(logger, "app_snapshot_flush_scope_recompositions_exc", "flush_scope_recompositions failed")
         require_skia()
@@ -689,17 +821,28 @@ class App:
         phys_w = max(1, int(self.width * scale))
         phys_h = max(1, int(self.height * scale))
 
-        surface = make_raster_surface(phys_w, phys_h)
+        # Surfaces come from a size-keyed pool. The previous frame's pixels
+        # are kept while the root stays mounted, so only damaged areas need
+        # repainting. One-off renders of an unmounted root repaint everything
+        # and leave the pooled surface unsuitable for the next retained frame.
+        retain = self.root is not None and getattr(self.root, "_app", None) is not None
+        key = (phys_w, phys_h, float(scale))
+        surface, reused = self._surface_pool.acquire(phys_w, phys_h)
+        if not (retain and reused and surface is self._frame_surface and self._frame_surface_key == key):
+            self._damage.mark_full()
+        self._frame_surface = surface if retain else None
+        self._frame_surface_key = key if retain else None
         canvas = surface.getCanvas()
+        canvas.save()
 
         # Map logical coordinates to device pixels
         if scale != 1.0:
             canvas.scale(scale, scale)
 
-        # Clear with configured background (already normalized by
-        # `_update_background_color` to either a backend color or an
-        # (r,g,b,a) tuple).
-        canvas.clear(rgba_to_skia_color(self._background_clear_color()))
+        # Background (already normalized by `_update_background_color` to
+        # either a backend color or an (r,g,b,a) tuple) is cleared per damaged
+        # area by `_mount_paint_unmount`.
+        clear_color = rgba_to_skia_color(self._background_clear_color())
 
         # Normalize root and paint using shared helpers.
         if isinstance(self.root, ComposableWidget):
@@ -711,10 +854,38 @@ class App:
                 exception_once(logger, "app_snapshot_evaluate_build_exc", "root.evaluate_build raised")
 
         try:
-            self._mount_paint_unmount(canvas, 0, 0, self.width, self.height)
+            self._mount_paint_unmount(canvas, 0, 0, self.width, self.height, clear_color=clear_color)
         except Exception:
             exception_once(logger, "app_snapshot_mount_paint_unmount_exc", "_mount_paint_unmount raised")
+        finally:
+            canvas.restore()
+
+        return surface, self._device_damage(scale, phys_w, phys_h)
+
+    def _device_damage(
+        self, scale: float, phys_w: int, phys_h: int
+    ) -> Optional[tuple[tuple[int, int, int, int], ...]]:
+        """Return the last frame's repainted rects in device pixels (None: all)."""
+        painted = self._painted_damage
+        if painted is None:
+            return None
+        out = []
+        for x, y, w, h in painted:
+            left = max(0, int(math.floor(x * scale)))
+            top = max(0, int(math.floor(y * scale)))
+            right = min(phys_w, int(math.ceil((x + w) * scale)))
+            bottom = min(phys_h, int(math.ceil((y + h) * scale)))
+            if right > left and bottom > top:
+                out.append((left, top, right - left, bottom - top))
+        return tuple(out)
+
+    def _render_snapshot(self, scale: float = 1.0):
+        """Create a Skia image snapshot for the current root at given scale.
 
+        Returns an image object. Raises RuntimeError if Skia is missing or
+        snapshot/encoding fails.
+        """
+        surface, _damaged = self._render_raster_frame(scale=scale)
         img = surface.makeImageSnapshot()
         if img is None:
             raise RuntimeError("makeImageSnapshot() returned None")
@@ -926,26 +1097,40 @@ class App:
         window = self._window
         if window is None or getattr(window, "has_exit", False):
             return
+        profiler = get_frame_profiler()
+        profiler.begin_frame()
+        try:
+            self._render_window_frame(window, profiler)
+        finally:
+            profiler.end_frame()
+
+    def _render_window_frame(self, window: Any, profiler: Any) -> None:
         try:
-            flush_binding_invalidations()
+            with profiler.span("flush_binding_invalidations"):
+                flush_binding_invalidations()
         except Exception:
             exception_once(logger, "app_flush_binding_invalidations_pre_exc", "flush_binding_invalidations failed")
         try:
-            flush_scope_recompositions()
+            with profiler.span("flush_scope_recompositions"):
+                flush_scope_recompositions()
         except Exception:
             exception_once(logger, "app_flush_scope_recompositions_pre_exc", "flush_scope_recompositions failed")
         try:
-            flush_binding_invalidations()
+            with profiler.span("flush_binding_invalidations"):
+                flush_binding_invalidations()
         except Exception:
             exception_once(logger, "app_flush_binding_invalidations_post_exc", "flush_binding_invalidations failed")
         try:
-            flush_scope_recompositions()
+            with profiler.span("flush_scope_recompositions"):
+                flush_scope_recompositions()
         except Exception:
             exception_once(logger, "app_flush_scope_recompositions_post_exc", "flush_scope_recompositions failed")
         try:
             window.switch_to()
-            window.dispatch_event("on_draw")
-            window.flip()
+            with profiler.span("draw"):
+                window.dispatch_event("on_draw")
+            with profiler.span("present"):
+                window.flip()
         except Exception:
             exception_once(logger, "app_window_draw_flip_exc", "Window draw/flip raised")
 
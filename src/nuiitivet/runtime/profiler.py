@@ -0,0 +1,320 @@
+"""Opt-in frame profiler with Chrome ``trace_event`` export.
+
+The profiler records timed spans for the frame pipeline (binding and scope
+flushes, layout, paint, texture upload, present) and attributes layout and
+paint time to widget classes. Results can be inspected in-process or
+exported as Chrome trace JSON for ``chrome://tracing`` / Perfetto.
+
+It is disabled by default. While disabled, :meth:`FrameProfiler.span`
+returns a shared no-op context manager and widget methods are left
+untouched, so the frame path only pays for one method call per span.
+Enabling it wraps ``layout``/``paint`` on every widget class; disabling it
+restores the original methods.
+
+Set ``NUIITIVET_PROFILE_TRACE=/path/trace.json`` to profile an interactive
+run and write the trace when the window closes.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Tuple
+
+from nuiitivet.common.logging_once import exception_once
+
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_EVENTS = 200_000
+DEFAULT_MAX_FRAMES = 1000
+
+PROFILE_TRACE_ENV = "NUIITIVET_PROFILE_TRACE"
+
+# Widget methods wrapped while profiling, and the phase they are reported as.
+_WIDGET_PHASES = ("layout", "paint")
+
+_PROFILED_ATTR = "__nuiitivet_profiled__"
+
+
+class FrameRecord(NamedTuple):
+    """Timing of one frame; times are seconds, ``start`` is profiler-relative."""
+
+    number: int
+    start: float
+    duration: float
+    phases: Dict[str, float]
+
+
+class WidgetCost(NamedTuple):
+    """Aggregated layout or paint cost of one widget class."""
+
+    widget: str
+    phase: str
+    calls: int
+    total: float
+    self_time: float
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("_profiler", "_name", "_cat", "_args", "_start")
+
+    def __init__(self, profiler: "FrameProfiler", name: str, cat: str, args: Optional[Dict[str, Any]]) -> None:
+        self._profiler = profiler
+        self._name = name
+        self._cat = cat
+        self._args = args
+        self._start = 0.0
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        end = time.perf_counter()
+        self._profiler._record(self._name, self._cat, self._start, end - self._start, self._args)
+
+
+class FrameProfiler:
+    """Collects frame spans and per-widget-class layout/paint costs."""
+
+    def __init__(self, max_events: int = DEFAULT_MAX_EVENTS, max_frames: int = DEFAULT_MAX_FRAMES) -> None:
+        self._enabled = False
+        self._max_events = max(0, int(max_events))
+        self._origin = time.perf_counter()
+        # (name, cat, start, duration, thread id, args)
+        self._events: List[Tuple[str, str, float, float, int, Optional[Dict[str, Any]]]] = []
+        self._dropped = 0
+        self._frames: Deque[FrameRecord] = deque(maxlen=max(1, int(max_frames)))
+        self._frame_index = 0
+        self._frame_depth = 0
+        self._frame_start = 0.0
+        self._frame_phases: Dict[str, float] = {}
+        # (widget class name, phase) -> [calls, total, self]
+        self._widget_costs: Dict[Tuple[str, str], List[float]] = {}
+        # Open widget calls: [widget, phase, child time].
+        self._stack: List[List[Any]] = []
+        self._patched: Dict[Tuple[type, str], Callable[..., Any]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def enable(self) -> None:
+        """Start recording and instrument widget ``layout``/``paint``."""
+        if self._enabled:
+            return
+        self._enabled = True
+        self._instrument_widgets()
+
+    def disable(self) -> None:
+        """Stop recording and restore the original widget methods."""
+        if not self._enabled:
+            return
+        self._enabled = False
+        for (cls, attr), func in self._patched.items():
+            setattr(cls, attr, func)
+        self._patched.clear()
+        self._stack.clear()
+        self._frame_depth = 0
+
+    def reset(self) -> None:
+        """Drop recorded events, frames and widget costs."""
+        self._origin = time.perf_counter()
+        self._events = []
+        self._dropped = 0
+        self._frames.clear()
+        self._frame_index = 0
+        self._frame_phases = {}
+        self._widget_costs = {}
+
+    def span(self, name: str, cat: str = "frame", **args: Any) -> Any:
+        """Return a context manager timing ``name``; a no-op while disabled."""
+        if not self._enabled:
+            return _NULL_SPAN
+        return _Span(self, name, cat, args or None)
+
+    def begin_frame(self) -> None:
+        """Mark the start of a frame. Nested calls join the outer frame."""
+        if not self._enabled:
+            return
+        self._frame_depth += 1
+        if self._frame_depth > 1:
+            return
+        # Pick up widget classes imported since the last frame.
+        self._instrument_widgets()
+        self._frame_phases = {}
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self) -> None:
+        if not self._enabled or self._frame_depth <= 0:
+            return
+        self._frame_depth -= 1
+        if self._frame_depth > 0:
+            return
+        end = time.perf_counter()
+        duration = end - self._frame_start
+        index = self._frame_index
+        self._frame_index += 1
+        self._record("frame", "frame_boundary", self._frame_start, duration, {"index": index})
+        self._frames.append(FrameRecord(index, self._frame_start - self._origin, duration, self._frame_phases))
+
+    def frames(self) -> List[FrameRecord]:
+        """Return the most recent frames, oldest first."""
+        return list(self._frames)
+
+    def widget_costs(self, phase: Optional[str] = None) -> List[WidgetCost]:
+        """Return per-widget-class costs, most expensive self time first."""
+        costs = [
+            WidgetCost(widget, kind, int(calls), total, self_time)
+            for (widget, kind), (calls, total, self_time) in self._widget_costs.items()
+            if phase is None or kind == phase
+        ]
+        costs.sort(key=lambda cost: cost.self_time, reverse=True)
+        return costs
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "frames": self._frame_index,
+            "events": len(self._events),
+            "dropped_events": self._dropped,
+            "instrumented_methods": len(self._patched),
+        }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Return recorded spans in Chrome ``trace_event`` format."""
+        pid = os.getpid()
+        trace: List[Dict[str, Any]] = []
+        for name, cat, start, duration, tid, args in self._events:
+            event: Dict[str, Any] = {
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": round((start - self._origin) * 1e6, 3),
+                "dur": round(duration * 1e6, 3),
+                "pid": pid,
+                "tid": tid,
+            }
+            if args:
+                event["args"] = args
+            trace.append(event)
+        return {
+            "traceEvents": trace,
+            "displayTimeUnit": "ms",
+            "otherData": {"frames": self._frame_index, "dropped_events": self._dropped},
+        }
+
+    def write_chrome_trace(self, path: str) -> None:
+        """Write :meth:`to_chrome_trace` as JSON to ``path``."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+    # --- recording -----------------------------------------------------
+    def _record(self, name: str, cat: str, start: float, duration: float, args: Optional[Dict[str, Any]]) -> None:
+        if cat == "frame" and self._frame_depth > 0:
+            self._frame_phases[name] = self._frame_phases.get(name, 0.0) + duration
+        if len(self._events) >= self._max_events:
+            self._dropped += 1
+            return
+        self._events.append((name, cat, start, duration, threading.get_ident(), args))
+
+    def _record_widget(self, widget: str, phase: str, start: float, total: float, self_time: float) -> None:
+        cost = self._widget_costs.get((widget, phase))
+        if cost is None:
+            self._widget_costs[(widget, phase)] = [1, total, self_time]
+        else:
+            cost[0] += 1
+            cost[1] += total
+            cost[2] += self_time
+        self._record(widget, phase, start, total, None)
+
+    # --- widget instrumentation ----------------------------------------
+    def _instrument_widgets(self) -> None:
+        try:
+            from nuiitivet.widgeting.widget import Widget
+        except Exception:
+            exception_once(_logger, "profiler_import_widget_exc", "Failed to import Widget for profiling")
+            return
+
+        seen: set = set()
+        pending: List[type] = [Widget]
+        while pending:
+            cls = pending.pop()
+            if cls in seen:
+                continue
+            seen.add(cls)
+            pending.extend(cls.__subclasses__())
+            # Mixins such as WidgetKernel provide the base implementations.
+            pending.extend(base for base in cls.__mro__[1:] if base is not object)
+
+        for cls in seen:
+            for phase in _WIDGET_PHASES:
+                func = cls.__dict__.get(phase)
+                if not callable(func) or getattr(func, _PROFILED_ATTR, False):
+                    continue
+                setattr(cls, phase, self._wrap_widget_method(func, phase))
+                self._patched[(cls, phase)] = func
+
+    def _wrap_widget_method(self, func: Callable[..., Any], phase: str) -> Callable[..., Any]:
+        profiler = self
+        main_thread = threading.main_thread()
+
+        @functools.wraps(func)
+        def wrapper(widget: Any, *args: Any, **kwargs: Any) -> Any:
+            stack = profiler._stack
+            # super() chains and other threads run unrecorded.
+            if (stack and stack[-1][0] is widget and stack[-1][1] == phase) or (
+                threading.current_thread() is not main_thread
+            ):
+                return func(widget, *args, **kwargs)
+            entry = [widget, phase, 0.0]
+            stack.append(entry)
+            start = time.perf_counter()
+            try:
+                return func(widget, *args, **kwargs)
+            finally:
+                total = time.perf_counter() - start
+                stack.pop()
+                if stack:
+                    stack[-1][2] += total
+                profiler._record_widget(type(widget).__name__, phase, start, total, total - entry[2])
+
+        setattr(wrapper, _PROFILED_ATTR, True)
+        return wrapper
+
+
+_PROFILER = FrameProfiler()
+
+
+def get_frame_profiler() -> FrameProfiler:
+    """Return the process-wide frame profiler."""
+    return _PROFILER
+
+
+__all__ = [
+    "DEFAULT_MAX_EVENTS",
+    "DEFAULT_MAX_FRAMES",
+    "FrameProfiler",
+    "FrameRecord",
+    "PROFILE_TRACE_ENV",
+    "WidgetCost",
+    "get_frame_profiler",
+]
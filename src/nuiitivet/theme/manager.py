@@ -30,17 +30,25 @@ class ThemeManager:
         self._subscribers: Set[Callable[[Theme], None]] = set()
         self._lock = threading.RLock()
         self._current = initial
+        self._generation = 0
 
     @property
     def current(self) -> Theme:
         with self._lock:
             if self._current is None:
                 self._current = Theme(mode="light", extensions=[])
+                self._generation += 1
             return self._current
 
+    @property
+    def generation(self) -> int:
+        """Counter bumped whenever ``current`` changes; keys theme-derived caches."""
+        return self._generation
+
     def set_theme(self, theme: Theme) -> None:
         with self._lock:
             self._current = theme
+            self._generation += 1
             subscribers = list(self._subscribers)
         for subscriber in subscribers:
             try:
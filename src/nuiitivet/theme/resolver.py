@@ -10,7 +10,8 @@ so that rendering modules don't create import cycles.
 from __future__ import annotations
 
 import logging
-from typing import Any, Callable, Optional, Tuple, Union
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 from nuiitivet.common.logging_once import exception_once
 
@@ -19,6 +20,7 @@ from nuiitivet.colors.utils import (
     hex_to_rgba,
     apply_alpha_to_rgba,
 )
+from nuiitivet.theme.manager import manager
 from nuiitivet.theme.types import ColorSpec, ColorToken
 from nuiitivet.theme.theme import Theme
 
@@ -26,13 +28,6 @@ from nuiitivet.theme.theme import Theme
 logger = logging.getLogger(__name__)
 
 
-def _default_role_resolver() -> Callable[[Any], Optional[str]]:
-    def resolver(_: Any) -> Optional[str]:
-        return None
-
-    return resolver
-
-
 def _to_rgba_from_normalized(lit: object, alpha: float = 1.0) -> Optional[Tuple[int, int, int, int]]:
     """Convert a normalized literal (hex string or tuple) to RGBA.
 
@@ -90,6 +85,36 @@ def _apply_alpha_multiplier(rgba: Tuple[int, int, int, int], alpha: float) -> Tu
     return (int(r), int(g), int(b), int(max(0, min(255, a_out))))
 
 
+def _no_role(_: Any) -> Optional[str]:
+    return None
+
+
+# Resolved colors for the current theme generation, keyed by
+# (value, default, explicit theme). Only calls without a custom
+# role_resolver are memoized; the table is dropped on every theme change.
+# Colors are also resolved off the UI thread, so the table, its generation
+# and the counters are only touched under _memo_lock.
+_MEMO_MAX_ENTRIES = 4096
+_memo_lock = threading.Lock()
+_memo: Dict[Tuple[Any, Any, bool], Tuple[int, int, int, int]] = {}
+_memo_generation = -1
+_memo_stats = {"hits": 0, "misses": 0}
+
+
+def color_memo_stats() -> Dict[str, int]:
+    """Return hit/miss counters and the size of the color resolution memo."""
+    with _memo_lock:
+        return {"hits": _memo_stats["hits"], "misses": _memo_stats["misses"], "entries": len(_memo)}
+
+
+def clear_color_memo() -> None:
+    """Drop memoized colors and reset the counters."""
+    with _memo_lock:
+        _memo.clear()
+        _memo_stats["hits"] = 0
+        _memo_stats["misses"] = 0
+
+
 def resolve_color_to_rgba(
     val: Union[ColorSpec, Any],
     default: Optional[Union[ColorSpec, Any]] = None,
@@ -98,6 +123,9 @@ def resolve_color_to_rgba(
 ) -> Tuple[int, int, int, int]:
     """Resolve a ColorLike into an (r,g,b,a) tuple of ints (0-255).
 
+    Results for the current theme (``theme`` omitted or equal to
+    ``manager.current``) are memoized by ``(val, default, theme generation)``.
+
     Rules:
     - If `val` is a literal (hex string or RGBA tuple) it's normalized.
         - If `val` is a pair (base, alpha) the base is resolved and alpha is applied
@@ -107,7 +135,51 @@ def resolve_color_to_rgba(
     - If `val` is None, `default` is attempted.
     - If resolution fails, returns transparent (0,0,0,0).
     """
-    resolver = role_resolver if role_resolver is not None else _default_role_resolver()
+    global _memo_generation
+
+    if role_resolver is not None:
+        return _resolve_uncached(val, default, role_resolver, theme)
+
+    current = manager.current
+    if theme is not None and theme is not current:
+        return _resolve_uncached(val, default, _no_role, theme)
+
+    key = (val, default, theme is None)
+    try:
+        hash(key)
+    except TypeError:
+        # Unhashable spec (e.g. a list); resolve without memoizing.
+        return _resolve_uncached(val, default, _no_role, theme)
+
+    generation = manager.generation
+    with _memo_lock:
+        # A caller that read the generation before a theme switch must not
+        # roll the table back to it.
+        if generation > _memo_generation:
+            _memo.clear()
+            _memo_generation = generation
+        cached = _memo.get(key) if generation == _memo_generation else None
+        if cached is not None:
+            _memo_stats["hits"] += 1
+            return cached
+        _memo_stats["misses"] += 1
+
+    res = _resolve_uncached(val, default, _no_role, theme)
+    with _memo_lock:
+        # Only keep the result if no theme switch happened while resolving.
+        if manager.generation == generation == _memo_generation:
+            if len(_memo) >= _MEMO_MAX_ENTRIES:
+                _memo.clear()
+            _memo[key] = res
+    return res
+
+
+def _resolve_uncached(
+    val: Union[ColorSpec, Any],
+    default: Optional[Union[ColorSpec, Any]],
+    resolver: Callable[[Any], Optional[str]],
+    theme: Theme | None,
+) -> Tuple[int, int, int, int]:
 
     def _resolve_one(x: ColorSpec) -> Optional[Tuple[int, int, int, int]]:
         if x is None:
@@ -202,4 +274,4 @@ def resolve_color_to_rgba(
     return (0, 0, 0, 0)
 
 
-__all__ = ["resolve_color_to_rgba"]
+__all__ = ["clear_color_memo", "color_memo_stats", "resolve_color_to_rgba"]
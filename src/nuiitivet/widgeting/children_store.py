@@ -32,6 +32,8 @@ class ChildrenStore:
         self._configure(max_children=max_children, overflow_policy=overflow_policy)
         self._dirty_snapshot = True
         self._snapshot_cache: Optional[List] = None
+        # Bumped on every mutation; lets owners validate derived caches.
+        self.version = 0
 
     # NOTE: use module-level safe_call imported above to keep lifecycle calls
     # concise and consistent. Avoid assigning to instance attributes at module
@@ -67,6 +69,7 @@ class ChildrenStore:
     # --- mutation -----------------------------------------
     def _mark_dirty(self) -> None:
         self._dirty_snapshot = True
+        self.version += 1
         mark_layout = getattr(self.owner, "mark_needs_layout", None)
         if callable(mark_layout):
             try:
@@ -192,7 +195,37 @@ class ChildrenStore:
             except Exception:
                 self._items = deque([w])
 
-        # lifecycle: parent pointer and mount
+        self._attach(w)
+        self._mark_dirty()
+
+    def insert(self, index: int, w) -> None:
+        """Insert a child before ``index`` (clamped like ``list.insert``)."""
+        if self.max_children is not None and len(self._items) >= self.max_children:
+            # Eviction policies are defined for appends only.
+            raise RuntimeError("capacity exceeded")
+        self._items.insert(index, w)
+        self._attach(w)
+        self._mark_dirty()
+
+    def move(self, w, index: int) -> None:
+        """Reposition an existing child without unmounting it."""
+        try:
+            self._items.remove(w)
+        except ValueError:
+            debug_once(
+                _logger,
+                f"children_store_move_missing:{type(self.owner).__name__}",
+                "Child not found while moving (owner=%s child=%s)",
+                type(self.owner).__name__,
+                type(w).__name__,
+            )
+            return
+        self._items.insert(index, w)
+        self._mark_dirty()
+
+    def _attach(self, w) -> None:
+        """Set the parent pointer and mount ``w`` if the owner is mounted."""
+        owner = self.owner
         try:
             w._parent = owner
         except Exception:
@@ -221,8 +254,6 @@ class ChildrenStore:
                 type(w).__name__,
             )
 
-        self._mark_dirty()
-
     def remove(self, w_or_idx: Union[object, int]) -> None:
         """Remove a child by object or index; unmount and clear parent."""
         try:
@@ -0,0 +1,118 @@
+"""Spatial index used to hit test containers with many children.
+
+``WidgetKernel.hit_test`` checks children top-most first. For containers with
+hundreds of laid-out children (galleries, long columns) that linear scan runs
+on every pointer move. ``HitTestGrid`` buckets child layout rects into a
+uniform grid so a point query only visits the children overlapping its cell.
+"""
+
+from __future__ import annotations
+
+import math
+from statistics import median
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from .widget import Widget
+
+Rect = Tuple[int, int, int, int]
+
+# Containers with fewer children are scanned linearly; building the grid
+# costs more than it saves.
+HIT_INDEX_MIN_CHILDREN = 16
+
+# Upper bound on grid cells per indexed child, and on the cells a single
+# child may occupy before it is kept in the always-checked list instead.
+_MAX_CELLS_PER_CHILD = 4
+_MAX_SPAN_CELLS = 64
+
+
+class HitTestGrid:
+    """Uniform-grid index over child layout rects (parent coordinates).
+
+    The cell size follows the median child size, so rows of a Column or tiles
+    of a Grid land in roughly one cell each. Children spanning too many cells
+    are kept in a separate list that every query checks.
+    """
+
+    __slots__ = ("_children", "_rects", "_origin", "_cell", "_cols", "_rows", "_cells", "_wide")
+
+    def __init__(self, children: Sequence["Widget"], rects: Sequence[Rect]) -> None:
+        self._children = list(children)
+        self._rects = list(rects)
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        self._wide: List[int] = []
+
+        boxes = [(i, r) for i, r in enumerate(self._rects) if r[2] > 0 and r[3] > 0]
+        if not boxes:
+            self._origin = (0, 0)
+            self._cell = (1, 1)
+            self._cols = self._rows = 0
+            return
+
+        left = min(r[0] for _, r in boxes)
+        top = min(r[1] for _, r in boxes)
+        right = max(r[0] + r[2] for _, r in boxes)
+        bottom = max(r[1] + r[3] for _, r in boxes)
+        cell_w = max(1, int(median(r[2] for _, r in boxes)))
+        cell_h = max(1, int(median(r[3] for _, r in boxes)))
+
+        budget = _MAX_CELLS_PER_CHILD * len(boxes)
+        cells = math.ceil((right - left) / cell_w) * math.ceil((bottom - top) / cell_h)
+        if cells > budget:
+            scale = math.sqrt(cells / budget)
+            cell_w = max(1, int(math.ceil(cell_w * scale)))
+            cell_h = max(1, int(math.ceil(cell_h * scale)))
+
+        self._origin = (left, top)
+        self._cell = (cell_w, cell_h)
+        self._cols = max(1, math.ceil((right - left) / cell_w))
+        self._rows = max(1, math.ceil((bottom - top) / cell_h))
+
+        for index, (x, y, w, h) in boxes:
+            c0 = (x - left) // cell_w
+            c1 = (x + w - 1 - left) // cell_w
+            r0 = (y - top) // cell_h
+            r1 = (y + h - 1 - top) // cell_h
+            if (c1 - c0 + 1) * (r1 - r0 + 1) > _MAX_SPAN_CELLS:
+                self._wide.append(index)
+                continue
+            for row in range(r0, r1 + 1):
+                for col in range(c0, c1 + 1):
+                    self._cells.setdefault((col, row), []).append(index)
+
+    def query(self, x: int, y: int) -> List[Tuple["Widget", Rect]]:
+        """Return (child, rect) pairs containing the point, top-most first."""
+
+        if not self._cols:
+            return []
+        left, top = self._origin
+        cell_w, cell_h = self._cell
+        candidates = self._cells.get(((x - left) // cell_w, (y - top) // cell_h), ())
+        if self._wide:
+            candidates = sorted(set(candidates).union(self._wide))
+        hits: List[Tuple["Widget", Rect]] = []
+        for index in reversed(candidates):
+            rx, ry, rw, rh = self._rects[index]
+            if rx <= x < rx + rw and ry <= y < ry + rh:
+                hits.append((self._children[index], self._rects[index]))
+        return hits
+
+
+def build_hit_index(children: Sequence["Widget"]) -> Optional[HitTestGrid]:
+    """Return a grid for ``children`` or None when they cannot be indexed.
+
+    Children without a layout rect hit test in their own coordinate space, so
+    their containers keep the linear scan.
+    """
+
+    rects: List[Rect] = []
+    for child in children:
+        rect = getattr(child, "layout_rect", None)
+        if not rect:
+            return None
+        rects.append(rect)
+    return HitTestGrid(children, rects)
+
+
+__all__ = ["HIT_INDEX_MIN_CHILDREN", "HitTestGrid", "build_hit_index"]
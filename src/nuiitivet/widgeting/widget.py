@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Iterable, Optional, Tuple, Type, TypeVar, Union
+from typing import Dict, Iterable, Optional, Tuple, Type, TypeVar, Union
 
 from ..rendering.sizing import SizingLike
 from nuiitivet.common.logging_once import exception_once
@@ -52,6 +52,8 @@ class Widget(
     ) -> None:
         self._layout_cache_token = 0
         self._needs_layout = True
+        # Memoized preferred sizes, see layout.measure.preferred_size.
+        self._intrinsic_size_cache: Dict[Tuple[Optional[int], Optional[int], int, int], Tuple[int, int]] = {}
         super().__init__(
             width=width,
             height=height,
@@ -64,21 +66,38 @@ class Widget(
     def layout_cache_token(self) -> int:
         return int(self._layout_cache_token)
 
+    def is_relayout_boundary(self) -> bool:
+        """Return True when this widget's size cannot depend on its subtree.
+
+        A widget with fixed width and height sizing reports the same preferred
+        size whatever its children do, so layout changes inside it never need
+        to reach its parent. Subclasses with other guarantees may override.
+        """
+        width = getattr(self, "_width_sizing", None)
+        height = getattr(self, "_height_sizing", None)
+        return getattr(width, "kind", None) == "fixed" and getattr(height, "kind", None) == "fixed"
+
     def mark_needs_layout(self) -> None:
-        """Mark this widget as needing layout recalculation."""
+        """Mark this widget as needing layout recalculation.
+
+        Dirtiness stops at the nearest laid-out relayout boundary, which the
+        app then lays out on its own on the next frame.
+        """
         already_dirty = self._needs_layout
         self._needs_layout = True
+        self._intrinsic_size_cache.clear()
         parent = getattr(self, "_parent", None)
-        if isinstance(parent, Widget):
+        if isinstance(parent, Widget) and not self._absorb_layout_change():
             # Always propagate to root.  An early-return guard ("if already
             # dirty, skip") would be valid only if the invariant "every dirty
             # node's ancestors are also dirty" were globally maintained.
             # However, clear_needs_layout() is called only on AppScope (the
-            # root), leaving intermediate nodes dirty.  When the next animation
-            # tick fires, a selective guard would stop propagation at the first
-            # already-dirty intermediate, never reaching the cleared root.
-            # Walking all the way to the root on every call is O(tree-depth)
-            # – the same cost as the original code when no ancestor was dirty.
+            # root) and relayout boundaries, leaving intermediate nodes dirty.
+            # When the next animation tick fires, a selective guard would stop
+            # propagation at the first already-dirty intermediate, never
+            # reaching the cleared root.  Walking all the way up on every call
+            # is O(tree-depth) – the same cost as the original code when no
+            # ancestor was dirty.
             try:
                 parent.mark_needs_layout()
             except Exception:
@@ -91,10 +110,46 @@ class Widget(
         if not already_dirty:
             self.invalidate()
 
+    def _absorb_layout_change(self) -> bool:
+        """Queue this widget for a standalone relayout if it is a boundary."""
+        if self._layout_rect is None or not self.is_relayout_boundary():
+            return False
+        schedule = getattr(getattr(self, "_app", None), "schedule_relayout", None)
+        if not callable(schedule):
+            return False
+        try:
+            schedule(self)
+        except Exception:
+            exception_once(logger, "widget_schedule_relayout_exc", "App.schedule_relayout() raised")
+            return False
+        return True
+
+    def _notify_layout_param_changed(self) -> None:
+        super()._notify_layout_param_changed()
+        # Sizing/padding/alignment changes alter how the parent places this
+        # widget, so they must pass through a relayout boundary.
+        parent = getattr(self, "_parent", None)
+        if isinstance(parent, Widget) and self.is_relayout_boundary():
+            parent.mark_needs_layout()
+
     def invalidate(self, immediate: bool = False) -> None:
         app = getattr(self, "_app", None)
         if app is None:
             return
+        invalidate_rect = getattr(app, "invalidate_rect", None)
+        if callable(invalidate_rect):
+            rect = self.damage_rect()
+            if rect is not None:
+                try:
+                    invalidate_rect(rect, immediate=immediate)
+                    return
+                except Exception:
+                    exception_once(
+                        logger,
+                        f"widget_invalidate_rect_exc:{type(app).__name__}",
+                        "App.invalidate_rect() raised for app=%s",
+                        type(app).__name__,
+                    )
         try:
             app.invalidate(immediate=immediate)
         except TypeError:
@@ -232,6 +287,45 @@ class Widget(
     def paint_outsets(self) -> Tuple[int, int, int, int]:
         return (0, 0, 0, 0)
 
+    def paint_transforms_children(self) -> bool:
+        """Return True while descendants are painted under a canvas transform.
+
+        Descendants then cannot describe their on-screen area with
+        ``last_rect``, so their invalidations fall back to a full repaint.
+        """
+
+        return False
+
+    def damage_rect(self) -> Optional[Tuple[int, int, int, int]]:
+        """Return the root-space area this widget last painted, or None if unknown.
+
+        The rect is ``last_rect`` grown by ``paint_outsets()``. None is returned
+        before the first paint and while an ancestor paints its children under
+        a transform.
+        """
+
+        rect = self._last_rect
+        if rect is None:
+            return None
+        current = self._parent
+        while current is not None:
+            transforms = getattr(current, "paint_transforms_children", None)
+            if callable(transforms) and transforms():
+                return None
+            current = getattr(current, "_parent", None)
+        try:
+            left, top, right, bottom = (max(0, int(v)) for v in self.paint_outsets())
+        except Exception:
+            exception_once(
+                logger,
+                f"widget_damage_rect_outsets_exc:{type(self).__name__}",
+                "paint_outsets() failed for widget=%s",
+                type(self).__name__,
+            )
+            return None
+        x, y, w, h = rect
+        return (x - left, y - top, w + left + right, h + top + bottom)
+
 
 class ComposableWidget(BuilderHostMixin, Widget):
     """Widget base that participates in build/recomposition.
@@ -624,16 +624,22 @@ class BuilderHostMixin:
         active: Set[str] = getattr(self, "_active_scope_ids", set())
         stale = [scope_id for scope_id in self._scope_nodes.keys() if scope_id not in active]
         for scope_id in stale:
-            fragment = self._scope_nodes.pop(scope_id)
-            try:
-                fragment.unmount()
-            except Exception:
-                exception_once(
-                    _logger,
-                    "widget_builder_prune_scope_fragment_unmount_exc",
-                    "Scoped fragment unmount raised during pruning",
-                )
-            self._remove_scope_metadata(scope_id)
+            self._discard_scope(scope_id)
+
+    def _discard_scope(self, scope_id: str) -> None:
+        """Unmount and forget the fragment rendered for ``scope_id``."""
+        fragment = self._scope_nodes.pop(scope_id, None)
+        if fragment is None:
+            return
+        try:
+            fragment.unmount()
+        except Exception:
+            exception_once(
+                _logger,
+                "widget_builder_prune_scope_fragment_unmount_exc",
+                "Scoped fragment unmount raised during pruning",
+            )
+        self._remove_scope_metadata(scope_id)
 
     def _invalidate_scope(self, scope: RecomposeScope) -> None:
         self._register_scope(scope)
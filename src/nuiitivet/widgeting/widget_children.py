@@ -84,6 +84,19 @@ class ChildContainerMixin:
             except Exception:
                 exception_once(logger, "children_store_mount_child_exc", "widget.mount failed in fallback add_child")
 
+    def insert_child(self, index: int, widget) -> None:
+        try:
+            self._children_store.insert(index, widget)
+        except Exception:
+            exception_once(logger, "children_store_insert_exc", "ChildrenStore.insert failed")
+            self.add_child(widget)
+
+    def move_child(self, widget, index: int) -> None:
+        try:
+            self._children_store.move(widget, index)
+        except Exception:
+            exception_once(logger, "children_store_move_exc", "ChildrenStore.move failed")
+
     def remove_child(self, widget_or_index) -> None:
         try:
             self._children_store.remove(widget_or_index)
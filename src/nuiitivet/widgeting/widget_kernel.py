@@ -9,6 +9,7 @@ from ..common.logging_once import exception_once
 from ..rendering.padding import parse_padding
 from ..rendering.sizing import Sizing, SizingLike, parse_sizing
 from ..runtime.threading import assert_ui_thread
+from .hit_index import HIT_INDEX_MIN_CHILDREN, HitTestGrid, build_hit_index
 from nuiitivet.observable.protocols import ReadOnlyObservableProtocol
 
 
@@ -37,6 +38,8 @@ class WidgetKernel:
         self._parent = None
         self._last_rect = None
         self._layout_rect = None
+        # (children store version, grid or None) built lazily by hit_test.
+        self._hit_index: Optional[Tuple[int, Optional[HitTestGrid]]] = None
 
         # Initialize with None/default first, as properties will handle observables later
         # But properties rely on binding mixin capabilities already being initialized?
@@ -113,10 +116,20 @@ class WidgetKernel:
         return (int(x), int(y), int(w), int(h))
 
     def set_layout_rect(self, x: int, y: int, width: int, height: int) -> None:
-        self._layout_rect = (int(x), int(y), int(width), int(height))
+        rect = (int(x), int(y), int(width), int(height))
+        if rect != self._layout_rect:
+            self._layout_rect = rect
+            self._drop_parent_hit_index()
 
     def clear_layout_rect(self) -> None:
-        self._layout_rect = None
+        if self._layout_rect is not None:
+            self._layout_rect = None
+            self._drop_parent_hit_index()
+
+    def _drop_parent_hit_index(self) -> None:
+        parent = self._parent
+        if parent is not None and getattr(parent, "_hit_index", None) is not None:
+            parent._hit_index = None
 
     @property
     def last_rect(self) -> Optional[Rect]:
@@ -228,9 +241,30 @@ class WidgetKernel:
         y = int(current[1]) if current is not None else 0
         self.set_layout_rect(x, y, width, height)
 
+    def _children_hit_index(self) -> Optional[HitTestGrid]:
+        """Return the spatial index over laid-out children, or None to scan linearly."""
+
+        store = getattr(self, "_children_store", None)
+        if store is None or len(store) < HIT_INDEX_MIN_CHILDREN:
+            return None
+        cached = self._hit_index
+        if cached is not None and cached[0] == store.version:
+            return cached[1]
+        grid = build_hit_index(store.snapshot())
+        self._hit_index = (store.version, grid)
+        return grid
+
     def hit_test(self, x: int, y: int):
         """Return the widget located at the coordinate if any."""
 
+        grid = self._children_hit_index()
+        if grid is not None:
+            for child, (rx, ry, _rw, _rh) in grid.query(x, y):
+                hit = child.hit_test(x - rx, y - ry)
+                if hit:
+                    return hit
+            return self._hit_test_self(x, y)
+
         children: Tuple = getattr(self, "children", tuple())
         # Iterate in reverse order (top-most first) for correct Z-order hit testing
         for child in reversed(children):
@@ -253,6 +287,9 @@ class WidgetKernel:
                 if hit:
                     return hit
 
+        return self._hit_test_self(x, y)
+
+    def _hit_test_self(self, x: int, y: int):
         # Check if we hit self (in local coordinates)
         # We need to know our own size.
         # If we are a Widget, we have _layout_rect, but that's our rect in PARENT.
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Callable, Optional, Tuple, Union, cast
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union, cast
 
 from nuiitivet.input.pointer import PointerEvent
 from nuiitivet.widgeting.widget import Widget
@@ -19,7 +21,7 @@ from nuiitivet.observable import Disposable, Observable, ObservableProtocol
 from nuiitivet.platform import IMEManager, get_system_clipboard
 from nuiitivet.rendering.sizing import SizingLike
 from nuiitivet.widgets.interaction import InteractionHostMixin, FocusNode, DraggableNode
-from nuiitivet.widgets.text_editing import TextEditingValue, TextRange
+from nuiitivet.widgets.text_editing import TextBuffer, TextEditingValue, TextRange
 from nuiitivet.rendering.skia import (
     make_font,
     make_paint,
@@ -82,6 +84,13 @@ class EditableText(InteractionHostMixin, Widget):
         # by the host (e.g. TextField) to suppress the keyboard-only focus
         # ring per MD3 spec.
         self._focus_from_pointer: bool = False
+        # Caret x offsets (one per character boundary) of the display text
+        # and the advances they are summed from, for the buffer and font
+        # settings they were measured with. Edits patch them in place.
+        self._caret_cache_buffer: Optional[TextBuffer] = None
+        self._caret_cache_key: Optional[tuple] = None
+        self._caret_advances: List[float] = []
+        self._caret_cache_offsets: List[float] = [0.0]
 
         # Initialize state
         initial_text = ""
@@ -236,7 +245,7 @@ class EditableText(InteractionHostMixin, Widget):
         self._state_internal.value = new_value
         self.invalidate()
 
-        if current.text != new_value.text and self._on_change:
+        if current.buffer != new_value.buffer and self._on_change:
             self._on_change(new_value.text)
 
     def preferred_size(self, max_width: Optional[int] = None, max_height: Optional[int] = None) -> Tuple[int, int]:
@@ -244,12 +253,8 @@ class EditableText(InteractionHostMixin, Widget):
         if not font:
             return (0, 0)
 
-        text = self._state_internal.value.text
-        display_text = self._get_display_text(text)
-        # If empty, measure a dummy character to get height
-        measure_text = display_text if display_text else "M"
-
-        width = int(font.measureText(measure_text)) if display_text else 0
+        length = len(self._state_internal.value.buffer)
+        width = int(self._caret_offsets(font)[-1]) if length else 0
         metrics = font.getMetrics()
         height = int(-metrics.fAscent + metrics.fDescent)
 
@@ -341,28 +346,94 @@ class EditableText(InteractionHostMixin, Widget):
         if font is None:
             return 0
 
-        text = self._state_internal.value.text
-        if not text:
+        length = len(self._state_internal.value.buffer)
+        if not length:
             return 0
 
-        display_text = self._get_display_text(text)
-
         # Translate viewport-local x into text-coordinate space.
         text_x = x + self._scroll_x
 
         if text_x < 0:
             return 0
 
-        for i in range(len(text) + 1):
-            sub = display_text[:i]
-            w = font.measureText(sub)
-            if w > text_x:
-                prev_w = font.measureText(display_text[: i - 1]) if i > 0 else 0
-                if text_x - prev_w < w - text_x:
-                    return i - 1
-                return i
-
-        return len(text)
+        offsets = self._caret_offsets(font)
+        # First boundary strictly right of x, then snap to the nearer side.
+        i = bisect_right(offsets, text_x)
+        if i >= len(offsets):
+            return length
+        if text_x - offsets[i - 1] < offsets[i] - text_x:
+            return i - 1
+        return i
+
+    def _caret_offsets(self, font: Any) -> Sequence[float]:
+        """Return the x offset of every caret position in the display text.
+
+        The result has ``len(text) + 1`` entries. It is measured once per
+        buffer and font settings; edits made through ``_replace_range``
+        patch it from the edited range instead.
+        """
+        buffer = self._state_internal.value.buffer
+        key = self._caret_key()
+        if self._caret_cache_buffer is not buffer or self._caret_cache_key != key:
+            advances = self._display_advances(font, buffer.slice(0, len(buffer)))
+            self._caret_advances = advances
+            self._caret_cache_offsets = list(accumulate(advances, initial=0.0))
+            self._caret_cache_buffer = buffer
+            self._caret_cache_key = key
+        return self._caret_cache_offsets
+
+    def _caret_key(self) -> tuple:
+        return (self._font_family, self._font_size, self._obscure_text)
+
+    def _display_advances(self, font: Any, text: str) -> List[float]:
+        if self._obscure_text:
+            return _char_advances(font, "•") * len(text) if text else []
+        return _char_advances(font, text)
+
+    def _display_slice(self, buffer: TextBuffer, start: int, end: int) -> str:
+        if self._obscure_text:
+            return "•" * (end - start)
+        return buffer.slice(start, end)
+
+    def _replace_range(
+        self,
+        value: TextEditingValue,
+        start: int,
+        end: int,
+        replacement: str,
+        selection: TextRange,
+        composing: TextRange = TextRange(-1, -1),
+    ) -> TextEditingValue:
+        """``value.replace_range`` that carries the caret offsets over to the result."""
+        new_value = value.replace_range(start, end, replacement, selection=selection, composing=composing)
+        if (
+            new_value.buffer is not value.buffer
+            and self._caret_cache_buffer is value.buffer
+            and self._caret_cache_key == self._caret_key()
+        ):
+            self._patch_caret_offsets(new_value.buffer, start, end, replacement)
+        return new_value
+
+    def _patch_caret_offsets(self, buffer: TextBuffer, start: int, end: int, replacement: str) -> None:
+        font = self._get_font()
+        advances = self._caret_advances
+        # Same clamping as TextBuffer.replace.
+        length = len(advances)
+        start = max(0, min(int(start), length))
+        end = max(0, min(int(end), length))
+        if start > end:
+            start, end = end, start
+        if font is None:
+            self._caret_cache_buffer = None
+            return
+        advances[start:end] = self._display_advances(font, replacement)
+        if len(advances) != len(buffer):
+            self._caret_cache_buffer = None
+            return
+        # Offsets before the edit are unchanged; re-sum the tail only.
+        offsets = self._caret_cache_offsets
+        offsets[start:] = accumulate(advances[start:], initial=offsets[start])
+        self._caret_cache_buffer = buffer
 
     def _handle_focus_change(self, focused: bool):
         if not focused:
@@ -375,19 +446,18 @@ class EditableText(InteractionHostMixin, Widget):
 
     def _handle_text(self, text: str) -> bool:
         current_value = self._state_internal.value
-        selection = current_value.selection
-        full_text = current_value.text
-
         if current_value.is_composing:
             range_to_replace = current_value.composing
-            new_text = range_to_replace.text_before(full_text) + text + range_to_replace.text_after(full_text)
-            new_cursor_pos = range_to_replace.start + len(text)
         else:
-            new_text = selection.text_before(full_text) + text + selection.text_after(full_text)
-            new_cursor_pos = selection.min + len(text)
-
-        new_value = current_value.copy_with(
-            text=new_text, selection=TextRange(new_cursor_pos, new_cursor_pos), composing=TextRange(-1, -1)
+            range_to_replace = current_value.selection
+
+        new_cursor_pos = range_to_replace.min + len(text)
+        new_value = self._replace_range(
+            current_value,
+            range_to_replace.min,
+            range_to_replace.max,
+            text,
+            selection=TextRange(new_cursor_pos, new_cursor_pos),
         )
 
         if new_value != current_value:
@@ -397,21 +467,12 @@ class EditableText(InteractionHostMixin, Widget):
 
     def _handle_ime_composition(self, text: str, start: int, length: int) -> bool:
         current_value = self._state_internal.value
-        full_text = current_value.text
-
         if current_value.is_composing:
             range_to_replace = current_value.composing
-            prefix = range_to_replace.text_before(full_text)
-            suffix = range_to_replace.text_after(full_text)
         else:
-            selection = current_value.selection
-            prefix = selection.text_before(full_text)
-            suffix = selection.text_after(full_text)
-            range_to_replace = selection
-
-        new_full_text = prefix + text + suffix
+            range_to_replace = current_value.selection
 
-        new_composing_start = len(prefix)
+        new_composing_start = range_to_replace.min
         new_composing_end = new_composing_start + len(text)
         new_composing_range = TextRange(new_composing_start, new_composing_end)
 
@@ -419,14 +480,21 @@ class EditableText(InteractionHostMixin, Widget):
         sel_end = sel_start + length
         new_selection = TextRange(sel_start, sel_end)
 
-        new_value = current_value.copy_with(text=new_full_text, selection=new_selection, composing=new_composing_range)
+        new_value = self._replace_range(
+            current_value,
+            range_to_replace.min,
+            range_to_replace.max,
+            text,
+            selection=new_selection,
+            composing=new_composing_range,
+        )
 
         self._update_value(new_value)
         return True
 
     def _handle_text_motion(self, motion: int, select: bool = False) -> bool:
         current_value = self._state_internal.value
-        text = current_value.text
+        text_length = len(current_value.buffer)
         selection = current_value.selection
 
         anchor = selection.start
@@ -436,33 +504,21 @@ class EditableText(InteractionHostMixin, Widget):
 
         if motion == TEXT_MOTION_BACKSPACE:
             if not selection.is_collapsed:
-                new_text = selection.text_before(text) + selection.text_after(text)
-                new_cursor_pos = selection.min
-                new_value = current_value.copy_with(text=new_text, selection=TextRange(new_cursor_pos, new_cursor_pos))
-                self._update_value(new_value)
+                self._update_value(self._delete_range(current_value, selection.min, selection.max))
                 return True
             if selection.min > 0:
                 pos = selection.min
-                new_text = text[: pos - 1] + text[pos:]
-                new_cursor_pos = pos - 1
-                new_value = current_value.copy_with(text=new_text, selection=TextRange(new_cursor_pos, new_cursor_pos))
-                self._update_value(new_value)
+                self._update_value(self._delete_range(current_value, pos - 1, pos))
                 return True
             return False
 
         if motion == TEXT_MOTION_DELETE:
             if not selection.is_collapsed:
-                new_text = selection.text_before(text) + selection.text_after(text)
-                new_cursor_pos = selection.min
-                new_value = current_value.copy_with(text=new_text, selection=TextRange(new_cursor_pos, new_cursor_pos))
-                self._update_value(new_value)
+                self._update_value(self._delete_range(current_value, selection.min, selection.max))
                 return True
-            if selection.max < len(text):
+            if selection.max < text_length:
                 pos = selection.max
-                new_text = text[:pos] + text[pos + 1 :]
-                new_cursor_pos = selection.min
-                new_value = current_value.copy_with(text=new_text, selection=TextRange(new_cursor_pos, new_cursor_pos))
-                self._update_value(new_value)
+                self._update_value(self._delete_range(current_value, pos, pos + 1))
                 return True
             return False
 
@@ -477,14 +533,14 @@ class EditableText(InteractionHostMixin, Widget):
             if not select and not selection.is_collapsed:
                 new_focus = selection.max
                 handled = True
-            elif focus < len(text):
+            elif focus < text_length:
                 new_focus = focus + 1
                 handled = True
         elif motion == TEXT_MOTION_HOME:
             new_focus = 0
             handled = True
         elif motion == TEXT_MOTION_END:
-            new_focus = len(text)
+            new_focus = text_length
             handled = True
 
         if handled:
@@ -506,41 +562,44 @@ class EditableText(InteractionHostMixin, Widget):
             return False
 
         current_value = self._state_internal.value
-        text = current_value.text
+        buffer = current_value.buffer
         selection = current_value.selection
 
         if key == "a":
-            new_value = current_value.copy_with(selection=TextRange(0, len(text)))
+            new_value = current_value.copy_with(selection=TextRange(0, len(buffer)))
             self._update_value(new_value)
             return True
 
         if key == "c":
             if not selection.is_collapsed:
-                selected_text = selection.text_inside(text)
-                self._copy_to_clipboard(selected_text)
+                self._copy_to_clipboard(buffer.slice(selection.min, selection.max))
             return True
 
         if key == "v":
             clipboard_text = self._get_from_clipboard()
             if clipboard_text:
-                new_text = selection.text_before(text) + clipboard_text + selection.text_after(text)
                 new_cursor_pos = selection.min + len(clipboard_text)
-                new_value = current_value.copy_with(text=new_text, selection=TextRange(new_cursor_pos, new_cursor_pos))
+                new_value = self._replace_range(
+                    current_value,
+                    selection.min,
+                    selection.max,
+                    clipboard_text,
+                    selection=TextRange(new_cursor_pos, new_cursor_pos),
+                )
                 self._update_value(new_value)
             return True
 
         if key == "x":
             if not selection.is_collapsed:
-                selected_text = selection.text_inside(text)
-                self._copy_to_clipboard(selected_text)
-                new_text = selection.text_before(text) + selection.text_after(text)
-                new_cursor_pos = selection.min
-                new_value = current_value.copy_with(text=new_text, selection=TextRange(new_cursor_pos, new_cursor_pos))
-                self._update_value(new_value)
+                self._copy_to_clipboard(buffer.slice(selection.min, selection.max))
+                self._update_value(self._delete_range(current_value, selection.min, selection.max))
             return True
 
         return False
 
+    def _delete_range(self, value: TextEditingValue, start: int, end: int) -> TextEditingValue:
+        return self._replace_range(value, start, end, "", selection=TextRange(start, start), composing=value.composing)
+
     def _copy_to_clipboard(self, text: str) -> None:
         get_system_clipboard().set_text(text)
 
@@ -553,8 +612,8 @@ class EditableText(InteractionHostMixin, Widget):
 
         is_focused = self.state.focused
         current_value = self._state_internal.value
-        text = current_value.text
-        display_text = self._get_display_text(text)
+        buffer = current_value.buffer
+        length = len(buffer)
         selection = current_value.selection
 
         font = self._get_font()
@@ -570,8 +629,9 @@ class EditableText(InteractionHostMixin, Widget):
         # viewport, mirroring the behavior of single-line text inputs in the
         # platform: long values are not truncated mid-glyph but are scrolled
         # horizontally as the cursor moves.
-        cursor_x_in_text = font.measureText(display_text[: selection.end])
-        total_text_width = font.measureText(display_text) if display_text else 0.0
+        offsets = self._caret_offsets(font)
+        cursor_x_in_text = offsets[max(0, min(selection.end, length))]
+        total_text_width = offsets[-1]
         margin = 2.0  # Padding so the caret is not flush against the edge.
         scroll = self._scroll_x
         if total_text_width <= max(0.0, width - margin):
@@ -608,12 +668,12 @@ class EditableText(InteractionHostMixin, Widget):
             from nuiitivet.theme.manager import manager as theme_manager
 
             # Draw selection highlight (behind the text).
-            if display_text and not selection.is_collapsed:
-                sel_start = max(0, min(selection.min, len(display_text)))
-                sel_end = max(0, min(selection.max, len(display_text)))
+            if length and not selection.is_collapsed:
+                sel_start = max(0, min(selection.min, length))
+                sel_end = max(0, min(selection.max, length))
                 if sel_end > sel_start:
-                    sx0 = font.measureText(display_text[:sel_start]) - scroll
-                    sx1 = font.measureText(display_text[:sel_end]) - scroll
+                    sx0 = offsets[sel_start] - scroll
+                    sx1 = offsets[sel_end] - scroll
                     sel_top = ty + font_metrics.fAscent
                     sel_bottom = ty + font_metrics.fDescent
                     sel_color = resolve_color_to_rgba(self.selection_color, theme=theme_manager.current)
@@ -629,13 +689,18 @@ class EditableText(InteractionHostMixin, Widget):
                                 "EditableText selection draw raised",
                             )
 
-            # Draw Text
-            if display_text:
+            # Draw Text. Only the visible characters (plus one on each side
+            # for overhanging glyphs) are turned into a blob; MakeFromString
+            # places glyphs by their advances, so the slice lines up with
+            # the caret offsets.
+            if length:
+                first = max(0, bisect_right(offsets, scroll) - 2)
+                last = min(length, bisect_left(offsets, scroll + width) + 1)
                 text_color = resolve_color_to_rgba(self.text_color, theme=theme_manager.current)
                 paint_text = make_paint(color=text_color)
-                blob = make_text_blob(display_text, font)
+                blob = make_text_blob(self._display_slice(buffer, first, last), font)
                 if blob:
-                    canvas.drawTextBlob(blob, x - scroll, ty, paint_text)
+                    canvas.drawTextBlob(blob, x - scroll + offsets[first], ty, paint_text)
 
             # Draw Cursor
             if is_focused and selection.is_collapsed:
@@ -675,7 +740,22 @@ class EditableText(InteractionHostMixin, Widget):
                             "EditableText canvas restore raised",
                         )
 
-    def _get_display_text(self, text: str) -> str:
-        if not self._obscure_text:
-            return text
-        return "•" * len(text)
+
+def _char_advances(font: Any, text: str) -> List[float]:
+    """Return one advance per character of ``text``.
+
+    Uses a single ``getWidths`` call on the glyphs of the whole string and
+    falls back to measuring characters one at a time.
+    """
+    if not text:
+        return []
+    to_glyphs = getattr(font, "textToGlyphs", None)
+    get_widths = getattr(font, "getWidths", None)
+    if callable(to_glyphs) and callable(get_widths):
+        try:
+            advances = [float(w) for w in get_widths(to_glyphs(text))]
+            if len(advances) == len(text):
+                return advances
+        except Exception:
+            exception_once(_logger, "editable_text_get_widths_exc", "skia.Font.getWidths failed")
+    return [float(font.measureText(ch)) for ch in text]
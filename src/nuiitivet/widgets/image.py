@@ -1,23 +1,39 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+import math
+from typing import Any, Literal
 
 from nuiitivet.common.logging_once import exception_once
 from nuiitivet.layout.alignment import AlignmentLike, normalize_alignment
-from nuiitivet.observable.protocols import ReadOnlyObservableProtocol
+from nuiitivet.observable.protocols import Disposable, ReadOnlyObservableProtocol
 from nuiitivet.rendering.fit import Fit
 from nuiitivet.rendering.sizing import SizingLike
-from nuiitivet.rendering.skia import make_rect
+from nuiitivet.rendering.skia import make_paint, make_rect
+from nuiitivet.rendering.skia.image_cache import get_image_cache
+from nuiitivet.rendering.skia.image_decode import DECODE_FAILED, fit_decode_size, get_image_decoder, read_image_size
 from nuiitivet.rendering.skia.skia_module import get_skia
+from nuiitivet.theme.resolver import resolve_color_to_rgba
+from nuiitivet.theme.types import ColorSpec
 from nuiitivet.widgeting.widget import Widget
 
 logger = logging.getLogger(__name__)
 
+ImageDecodeMode = Literal["auto", "sync", "async"]
+
+# In "auto" mode, sources at least this large decode off the UI thread.
+ASYNC_DECODE_MIN_BYTES = 64 * 1024
+
 
 class Image(Widget):
     """Display a raster image from in-memory bytes.
 
+    Decoded images are shared through the process-wide image cache, so
+    widgets showing the same bytes hold a single decoded copy.
+
+    Large sources are decoded on a worker thread at the size they are laid
+    out at; until the decode lands the widget paints ``placeholder``.
+
     Args:
         source: Encoded image bytes, ``None``, or an Observable that provides them.
         fit: Content fit mode. One of ``"contain"``, ``"cover"``, ``"fill"``, ``"none"``.
@@ -25,6 +41,10 @@ class Image(Widget):
         width: Width sizing.
         height: Height sizing.
         padding: Space around content.
+        decode: ``"sync"`` decodes on the UI thread at full resolution,
+            ``"async"`` decodes off-thread to the laid-out size, and
+            ``"auto"`` picks async for sources of 64 KiB or more.
+        placeholder: Color painted while an async decode is pending.
     """
 
     def __init__(
@@ -36,6 +56,8 @@ class Image(Widget):
         height: SizingLike = None,
         padding: int | tuple[int, int] | tuple[int, int, int, int] = 0,
         alignment: AlignmentLike = "center",
+        decode: ImageDecodeMode = "auto",
+        placeholder: ColorSpec | None = None,
     ) -> None:
         """Initialize an Image widget.
 
@@ -46,6 +68,8 @@ class Image(Widget):
             height: Height sizing.
             padding: Space around content.
             alignment: Content alignment in the allocated content rect.
+            decode: Decode mode. One of ``"auto"``, ``"sync"``, ``"async"``.
+            placeholder: Color painted while an async decode is pending.
         """
         super().__init__(width=width, height=height, padding=padding)
         self._fit: Fit = self._normalize_fit(fit)
@@ -56,6 +80,14 @@ class Image(Widget):
         self._resolved_source: bytes | None = None
         self._decoded_image: Any | None = None
         self._decoded_token: tuple[int, int] | None = None
+        self._intrinsic_size: tuple[int, int] | None = None
+
+        self._decode_mode: ImageDecodeMode = decode if decode in ("auto", "sync", "async") else "auto"
+        self._placeholder: ColorSpec | None = placeholder
+        self._decode_async = False
+        self._async_pending = False
+        self._decode_request_size: tuple[int, int] | None = None
+        self._decode_subscription: Disposable | None = None
 
         if isinstance(source, ReadOnlyObservableProtocol):
             self.observe(source, self._on_source_change)
@@ -93,8 +125,7 @@ class Image(Widget):
             l, t, r, b = self.padding
             return (int(w_dim.value) + l + r, int(h_dim.value) + t + b)
 
-        image = self._decoded_image
-        intrinsic_w, intrinsic_h = self._image_size(image)
+        intrinsic_w, intrinsic_h = self._intrinsic_size or (0, 0)
 
         width = int(w_dim.value) if w_dim.kind == "fixed" else intrinsic_w
         height = int(h_dim.value) if h_dim.kind == "fixed" else intrinsic_h
@@ -117,16 +148,21 @@ class Image(Widget):
         if canvas is None:
             return
 
+        cx, cy, cw, ch = self.content_rect(x, y, width, height)
+        if cw <= 0 or ch <= 0:
+            return
+
         image = self._decoded_image
         if image is None:
+            if self._async_pending:
+                self._paint_placeholder(canvas, cx, cy, cw, ch)
             return
 
+        # Source rects are in decoded pixels, which may be downsampled;
+        # destination geometry always follows the intrinsic size.
         img_w, img_h = self._image_size(image)
-        if img_w <= 0 or img_h <= 0:
-            return
-
-        cx, cy, cw, ch = self.content_rect(x, y, width, height)
-        if cw <= 0 or ch <= 0:
+        nat_w, nat_h = self._intrinsic_size or (img_w, img_h)
+        if img_w <= 0 or img_h <= 0 or nat_w <= 0 or nat_h <= 0:
             return
 
         fit = self._fit
@@ -149,12 +185,12 @@ class Image(Widget):
             return
 
         if fit == "contain":
-            scale = min(float(cw) / float(img_w), float(ch) / float(img_h))
-            draw_w = max(0.0, float(img_w) * scale)
-            draw_h = max(0.0, float(img_h) * scale)
+            scale = min(float(cw) / float(nat_w), float(ch) / float(nat_h))
+            draw_w = max(0.0, float(nat_w) * scale)
+            draw_h = max(0.0, float(nat_h) * scale)
         else:  # "none"
-            draw_w = float(img_w)
-            draw_h = float(img_h)
+            draw_w = float(nat_w)
+            draw_h = float(nat_h)
 
         dx = float(cx) + max(0.0, float(cw) - draw_w) * fx
         dy = float(cy) + max(0.0, float(ch) - draw_h) * fy
@@ -186,9 +222,111 @@ class Image(Widget):
 
         self._decoded_image = None
         self._decoded_token = None
-        self._decode_image_if_needed()
+        self._intrinsic_size = None
+        self._decode_request_size = None
+        self._cancel_async_decode()
+        source = self._resolved_source
+        if source is not None and self._should_decode_async(source):
+            # Only the header is read here; pixels are decoded after layout.
+            self._intrinsic_size = read_image_size(source)
+        self._decode_async = self._intrinsic_size is not None
+        if self._decode_async:
+            self._async_pending = True
+        else:
+            self._intrinsic_size = self._image_size(self._decode_image_if_needed())
         self.mark_needs_layout()
 
+    def layout(self, width: int, height: int) -> None:
+        super().layout(width, height)
+        if self._decode_async:
+            self._request_async_decode(width, height)
+
+    def on_unmount(self) -> None:
+        self._cancel_async_decode()
+        super().on_unmount()
+
+    def _should_decode_async(self, source: bytes) -> bool:
+        mode = self._decode_mode
+        if mode == "auto":
+            return len(source) >= ASYNC_DECODE_MIN_BYTES
+        return mode == "async"
+
+    def _request_async_decode(self, width: int, height: int) -> None:
+        source = self._resolved_source
+        intrinsic = self._intrinsic_size
+        if source is None or intrinsic is None:
+            return
+
+        size: tuple[int, int] | None = None
+        if self._fit != "none":
+            _cx, _cy, cw, ch = self.content_rect(0, 0, width, height)
+            if cw <= 0 or ch <= 0:
+                return
+            app = getattr(self, "_app", None)
+            scale = max(1.0, float(getattr(app, "_scale", 1.0) or 1.0))
+            size = fit_decode_size(intrinsic, (math.ceil(cw * scale), math.ceil(ch * scale)))
+        needed = size or intrinsic
+
+        # Keep the current pixels unless the layout grew beyond them, so
+        # resizes and animations do not trigger a decode per frame.
+        image = self._decoded_image
+        if image is not None:
+            img_w, img_h = self._image_size(image)
+            if img_w >= needed[0] and img_h >= needed[1]:
+                return
+        elif self._decode_subscription is not None and self._decode_request_size == needed:
+            return
+
+        self._cancel_async_decode()
+        self._async_pending = image is None
+        self._decode_request_size = needed
+        request = get_image_decoder().request(source, size)
+        if request.value is not None:
+            self._on_async_decoded(request.value)
+            return
+        self._decode_subscription = request.subscribe(self._on_async_decoded)
+
+    def _on_async_decoded(self, image: Any | None) -> None:
+        if image is None:
+            return
+        if image is DECODE_FAILED:
+            # Stop showing the placeholder and decode on the UI thread, which
+            # logs why the bytes are unusable if that fails as well.
+            self._cancel_async_decode()
+            self._decode_async = False
+            self._decoded_image = None
+            self._decode_image_if_needed()
+            self.invalidate()
+            return
+        self._decoded_image = image
+        self._async_pending = False
+        if self._decode_subscription is not None:
+            self._decode_subscription.dispose()
+            self._decode_subscription = None
+        self.invalidate()
+
+    def _cancel_async_decode(self) -> None:
+        subscription = self._decode_subscription
+        self._decode_subscription = None
+        self._async_pending = False
+        if subscription is not None:
+            subscription.dispose()
+
+    def _paint_placeholder(self, canvas, x: int, y: int, width: int, height: int) -> None:
+        color = self._placeholder
+        if color is None or not hasattr(canvas, "drawRect"):
+            return
+        try:
+            from nuiitivet.theme.manager import manager as theme_manager
+
+            rgba = resolve_color_to_rgba(color, theme=theme_manager.current)
+            paint = make_paint(color=rgba, style="fill", aa=False)
+            rect = make_rect(x, y, width, height)
+            if paint is not None and rect is not None:
+                canvas.drawRect(rect, paint)
+        except Exception:
+            exception_once(logger, "image_placeholder_paint_exc", "Failed to paint image placeholder")
+
     def _decode_image_if_needed(self) -> Any | None:
         source = self._resolved_source
         if source is None:
@@ -214,7 +352,8 @@ class Image(Widget):
             return None
 
         try:
-            decoded = make_from_encoded(source)
+            # Shared across widgets: identical bytes decode once per process.
+            decoded = get_image_cache().get_or_decode(source, make_from_encoded)
         except Exception:
             exception_once(logger, "image_decode_exc", "Failed to decode image bytes")
             decoded = None
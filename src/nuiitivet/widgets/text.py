@@ -4,6 +4,7 @@ Displays a string or State-like value and invalidates when the value changes.
 """
 
 import logging
+import math
 from typing import Any, Optional, Tuple, Union, TYPE_CHECKING
 
 from nuiitivet.common.logging_once import exception_once
@@ -12,12 +13,12 @@ from nuiitivet.observable import Disposable, ReadOnlyObservableProtocol
 from nuiitivet.rendering.skia import (
     get_typeface,
     get_default_font_fallbacks,
-    make_font,
-    make_paint,
-    make_text_blob,
+    get_paragraph_cache,
+    get_text_shape_cache,
     measure_text_ink_bounds,
     measure_text_width,
     rgba_to_skia_color,
+    shared_paint,
 )
 from nuiitivet.theme.resolver import resolve_color_to_rgba
 from nuiitivet.rendering.sizing import SizingLike
@@ -48,6 +49,8 @@ class TextBase(Widget):
     _paint_cache_key: Optional[tuple] = None
     _paint_cache_text: Optional[str] = None
     _paint_cache_advance_w: Optional[float] = None
+    _paint_color_key: Optional[tuple] = None
+    _paint_color_paint: Any = None
 
     def __init__(
         self,
@@ -69,6 +72,8 @@ class TextBase(Widget):
         self._paint_cache_key = None
         self._paint_cache_text = None
         self._paint_cache_advance_w = None
+        self._paint_color_key = None
+        self._paint_color_paint = None
 
     @property
     def style(self) -> TextStyleProtocol:
@@ -110,9 +115,18 @@ class TextBase(Widget):
                 pkg_font_dir=None,
                 fallback_to_default=True,
             )
-            left, top, right, bottom = measure_text_ink_bounds(tf, font_size, txt)
-            measured_width = int(max(0.0, right - left))
-            measured_height = int(max(0.0, bottom - top))
+            if self._is_multiline():
+                wrap_width: Optional[float] = None
+                if w_dim.kind == "fixed":
+                    wrap_width = float(w_dim.value)
+                elif max_width is not None:
+                    l, _t, r, _b = self.padding
+                    wrap_width = float(max(0, int(max_width) - l - r))
+                measured_width, measured_height = self._measure_paragraph(tf, txt, wrap_width)
+            else:
+                left, top, right, bottom = measure_text_ink_bounds(tf, font_size, txt)
+                measured_width = int(max(0.0, right - left))
+                measured_height = int(max(0.0, bottom - top))
 
             if measured_width <= 0:
                 measured_width = max(0, int(font_size * max(1, len(txt) * 0.6)))
@@ -153,6 +167,8 @@ class TextBase(Widget):
         # Apply padding to get content area (M3: space between UI elements)
         cx, cy, cw, ch = self.content_rect(x, y, width, height)
 
+        style = self.style
+        font_size = style.font_size
         txt = self._resolve_label()
         tf = get_typeface(
             candidate_files=None,
@@ -160,11 +176,13 @@ class TextBase(Widget):
             pkg_font_dir=None,
             fallback_to_default=True,
         )
-        # Use font size from style
-        font = make_font(tf, self.style.font_size)
+
+        if self._is_multiline():
+            self._paint_paragraph(canvas, tf, txt, cx, cy, cw, ch)
+            return
 
         def measure_text_w(text_value: str) -> float:
-            return float(measure_text_width(tf, self.style.font_size, str(text_value)))
+            return float(measure_text_width(tf, font_size, str(text_value)))
 
         # Cache overflow processing and alignment width.
         # Key must change when any factor affecting truncation/advance width changes.
@@ -172,9 +190,9 @@ class TextBase(Widget):
             txt,
             int(cw),
             int(ch),
-            float(self.style.font_size),
-            str(self.style.overflow),
-            str(self.style.text_alignment),
+            float(font_size),
+            str(style.overflow),
+            str(style.text_alignment),
             tuple(self.padding),
         )
         if self._paint_cache_key == cache_key and self._paint_cache_text is not None:
@@ -184,7 +202,7 @@ class TextBase(Widget):
             cached_advance = None
 
         # Overflow handling: ellipsis requires measurement. Clip can be done via canvas clipping.
-        if self.style.overflow == "ellipsis" and cw > 0 and self._paint_cache_key != cache_key:
+        if style.overflow == "ellipsis" and cw > 0 and self._paint_cache_key != cache_key:
             text_width = measure_text_w(txt)
             if text_width > cw:
                 ellipsis = "…"
@@ -202,19 +220,19 @@ class TextBase(Widget):
 
                 txt = (txt[:left] + ellipsis) if left > 0 else ellipsis
 
-        tp = make_text_blob(txt, font)
-        # skia may return None for an empty or unrenderable blob (or missing backend); guard
-        # against that to avoid calling .bounds() on None.
-        if tp is None:
+        # The blob and its ink bounds are shared process-wide per (typeface, size, text).
+        shaped = get_text_shape_cache().shape(tf, font_size, txt)
+        if shaped is None:
             # Nothing to draw for empty/unrenderable text or missing backend
             return
+        tp = shaped.blob
 
-        ink_left, ink_top, ink_right, ink_bottom = measure_text_ink_bounds(tf, self.style.font_size, txt)
+        ink_left, ink_top, ink_right, ink_bottom = shaped.ink_bounds
         ink_w = max(0.0, float(ink_right) - float(ink_left))
         ink_h = max(0.0, float(ink_bottom) - float(ink_top))
 
         # Use advance width for center/end alignment.
-        alignment = str(self.style.text_alignment)
+        alignment = str(style.text_alignment)
         if cached_advance is not None:
             advance_width = float(cached_advance)
         elif alignment in ("center", "end"):
@@ -241,17 +259,10 @@ class TextBase(Widget):
         # Vertical centering
         ty: float = float(cy) + (ch - ink_h) / 2 - float(ink_top)
 
-        # Resolve text color from the theme to an RGBA tuple and convert
-        # to a skia color when skia is available.
-        from nuiitivet.theme.manager import manager as theme_manager
-
-        rgba = resolve_color_to_rgba(self.style.color, default="#000000", theme=theme_manager.current)
-        paint_color = rgba_to_skia_color(rgba)
-
-        paint = make_paint(color=paint_color, style="fill", aa=True)
+        paint = self._resolve_text_paint(style.color)
         if paint is not None and canvas is not None:
             # Apply clipping if overflow is "clip"
-            if self.style.overflow == "clip":
+            if style.overflow == "clip":
                 canvas.save()
                 canvas.clipRect((cx, cy, cx + cw, cy + ch))
                 canvas.drawTextBlob(tp, tx, ty, paint)
@@ -267,6 +278,94 @@ class TextBase(Widget):
         else:
             self._paint_cache_advance_w = None
 
+    def _max_lines(self) -> Optional[int]:
+        # Styles written before max_lines existed stay single-line.
+        return getattr(self.style, "max_lines", 1)
+
+    def _is_multiline(self) -> bool:
+        max_lines = self._max_lines()
+        return max_lines is None or int(max_lines) != 1
+
+    def _paragraph_lines(self, tf: Any, txt: str, wrap_width: Optional[float]):
+        """Return the shaped paragraph for ``txt`` and its lines at ``wrap_width``.
+
+        Shaping is cached per (typeface, size, text) and line breaking per
+        width, so a width change only reflows.
+        """
+        style = self.style
+        paragraph = get_paragraph_cache().get(tf, style.font_size, txt)
+        if paragraph is None:
+            return None, ()
+        ellipsis_width = 0.0
+        if style.overflow == "ellipsis":
+            ellipsis_width = float(measure_text_width(tf, style.font_size, "…"))
+        return paragraph, paragraph.lines(wrap_width, self._max_lines(), ellipsis_width)
+
+    def _measure_paragraph(self, tf: Any, txt: str, wrap_width: Optional[float]) -> Tuple[int, int]:
+        paragraph, lines = self._paragraph_lines(tf, txt, wrap_width)
+        if paragraph is None:
+            raise RuntimeError("paragraph shaping unavailable")
+        width = max((line.width for line in lines), default=0.0)
+        height = paragraph.height_for(len(lines))
+        return (int(math.ceil(width)), int(math.ceil(height)))
+
+    def _paint_paragraph(self, canvas, tf: Any, txt: str, cx: int, cy: int, cw: int, ch: int) -> None:
+        """Paint ``txt`` wrapped to the content width, one text blob per line."""
+        paragraph, lines = self._paragraph_lines(tf, txt, float(cw) if cw > 0 else None)
+        if paragraph is None or not lines or canvas is None:
+            return
+        style = self.style
+        paint = self._resolve_text_paint(style.color)
+        if paint is None:
+            return
+
+        alignment = str(style.text_alignment)
+        line_height = paragraph.line_height
+        # Center the block like single-line text, but never push it above the box.
+        top = float(cy) + max(0.0, (ch - paragraph.height_for(len(lines))) / 2)
+        shape_cache = get_text_shape_cache()
+
+        clip = style.overflow == "clip"
+        if clip:
+            canvas.save()
+            canvas.clipRect((cx, cy, cx + cw, cy + ch))
+        try:
+            for index, line in enumerate(lines):
+                line_text = txt[line.start : line.end] + ("…" if line.ellipsis else "")
+                if not line_text:
+                    continue
+                shaped = shape_cache.shape(tf, style.font_size, line_text)
+                if shaped is None:
+                    continue
+                if alignment == "center":
+                    tx = float(cx) + (cw - line.width) / 2
+                elif alignment == "end":
+                    tx = float(cx) + cw - line.width
+                else:
+                    tx = float(cx)
+                baseline = top + index * line_height - paragraph.ascent
+                canvas.drawTextBlob(shaped.blob, tx, baseline, paint)
+        finally:
+            if clip:
+                canvas.restore()
+
+    def _resolve_text_paint(self, color: Any) -> Any:
+        """Return the fill paint for ``color``, reusing it while the color and theme are unchanged."""
+        from nuiitivet.theme.manager import manager as theme_manager
+
+        theme = theme_manager.current
+        key = self._paint_color_key
+        if key is not None and key[0] == color and key[1] is theme:
+            return self._paint_color_paint
+
+        # Resolve text color from the theme to an RGBA tuple and convert
+        # to a skia color when skia is available.
+        rgba = resolve_color_to_rgba(color, default="#000000", theme=theme)
+        paint = shared_paint(color=rgba_to_skia_color(rgba), style="fill", aa=True)
+        self._paint_color_key = (color, theme)
+        self._paint_color_paint = paint
+        return paint
+
     def _resolve_label(self) -> str:
         lbl = self.label
         if hasattr(lbl, "value"):
@@ -289,12 +388,13 @@ class TextBase(Widget):
                     self._paint_cache_key = None
                     self._paint_cache_text = None
                     self._paint_cache_advance_w = None
-                    # Label changes affect measured width/height, so request
-                    # layout when possible and always schedule a redraw.
-                    if self.needs_layout:
+                    # Label changes affect measured width/height, so always
+                    # request layout (dropping memoized sizes up the tree) and
+                    # schedule a redraw even when already dirty.
+                    was_dirty = self.needs_layout
+                    self.mark_needs_layout()
+                    if was_dirty:
                         self.invalidate()
-                    else:
-                        self.mark_needs_layout()
                 except Exception:
                     exception_once(_logger, "text_label_change_cb_exc", "Text label change callback failed")
 
@@ -326,3 +426,5 @@ class TextBase(Widget):
         self._paint_cache_key = None
         self._paint_cache_text = None
         self._paint_cache_advance_w = None
+        self._paint_color_key = None
+        self._paint_color_paint = None
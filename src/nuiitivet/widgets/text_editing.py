@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import FrozenInstanceError, dataclass
+from typing import Optional, Tuple, Union
 
 
 @dataclass(frozen=True)
@@ -49,19 +49,179 @@ class TextRange:
         return text[self.min : self.max]
 
 
-@dataclass(frozen=True)
+# Inserted runs shorter than this are merged with a neighbouring short piece,
+# so typing a word leaves one piece rather than one per keystroke.
+_MERGE_LIMIT = 512
+# Past this many pieces the buffer is flattened back into a single string.
+_MAX_PIECES = 256
+
+
+class TextBuffer:
+    """Immutable piece table holding the text of a TextEditingValue.
+
+    ``replace`` returns a new buffer that shares the unchanged parts of the
+    old one, so an edit costs O(pieces) instead of copying the whole
+    document. ``str(buffer)`` joins the pieces once and caches the result.
+    """
+
+    __slots__ = ("_pieces", "_length", "_text")
+
+    def __init__(self, text: str = "") -> None:
+        text = str(text)
+        self._pieces: Tuple[Tuple[str, int, int], ...] = ((text, 0, len(text)),) if text else ()
+        self._length = len(text)
+        self._text: Optional[str] = text
+
+    @classmethod
+    def _from_pieces(cls, pieces: Tuple[Tuple[str, int, int], ...], length: int) -> TextBuffer:
+        buf = cls.__new__(cls)
+        buf._pieces = pieces
+        buf._length = length
+        buf._text = None
+        return buf
+
+    @property
+    def piece_count(self) -> int:
+        return len(self._pieces)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __str__(self) -> str:
+        text = self._text
+        if text is None:
+            text = "".join(src[start:end] for src, start, end in self._pieces)
+            self._text = text
+        return text
+
+    def __repr__(self) -> str:
+        return f"TextBuffer({str(self)!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, TextBuffer):
+            return self._length == other._length and str(self) == str(other)
+        if isinstance(other, str):
+            return self._length == len(other) and str(self) == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def slice(self, start: int, end: int) -> str:
+        """Return ``text[start:end]`` without materializing the whole buffer."""
+        if self._text is not None:
+            return self._text[start:end]
+        return "".join(src[s:e] for src, s, e in self._pieces_between(start, end))
+
+    def replace(self, start: int, end: int, replacement: str) -> TextBuffer:
+        """Return a buffer with ``text[start:end]`` replaced by ``replacement``."""
+        length = self._length
+        start = max(0, min(int(start), length))
+        end = max(0, min(int(end), length))
+        if start > end:
+            start, end = end, start
+        if start == end and not replacement:
+            return self
+
+        before = self._pieces_between(0, start)
+        after = self._pieces_between(end, length)
+        if replacement:
+            inserted = (str(replacement), 0, len(replacement))
+            if before and _is_short(before[-1]) and len(replacement) < _MERGE_LIMIT:
+                src, s, e = before[-1]
+                merged = src[s:e] + inserted[0]
+                before = before[:-1]
+                inserted = (merged, 0, len(merged))
+            pieces = before + (inserted,) + after
+        else:
+            pieces = before + after
+        new_length = length - (end - start) + len(replacement)
+
+        if len(pieces) > _MAX_PIECES:
+            text = "".join(src[s:e] for src, s, e in pieces)
+            return TextBuffer(text)
+        return TextBuffer._from_pieces(pieces, new_length)
+
+    def _pieces_between(self, start: int, end: int) -> Tuple[Tuple[str, int, int], ...]:
+        if start >= end:
+            return ()
+        out = []
+        pos = 0
+        for src, s, e in self._pieces:
+            size = e - s
+            piece_end = pos + size
+            if piece_end > start and pos < end:
+                lo = s + max(0, start - pos)
+                hi = s + min(size, end - pos)
+                out.append((src, lo, hi))
+            if piece_end >= end:
+                break
+            pos = piece_end
+        return tuple(out)
+
+
+def _is_short(piece: Tuple[str, int, int]) -> bool:
+    return piece[2] - piece[1] < _MERGE_LIMIT
+
+
 class TextEditingValue:
     """The current state of a TextField.
 
+    Immutable. The text lives in a :class:`TextBuffer`, so ``replace_range``
+    does not copy the document; ``text`` joins it on first access.
+
     Attributes:
         text: The current text string.
         selection: The currently selected range of text.
         composing: The range of text currently being composed (IME).
     """
 
-    text: str = ""
-    selection: TextRange = TextRange(0, 0)
-    composing: TextRange = TextRange(-1, -1)
+    __slots__ = ("_buffer", "selection", "composing")
+
+    _buffer: TextBuffer
+    selection: TextRange
+    composing: TextRange
+
+    def __init__(
+        self,
+        text: Union[str, TextBuffer] = "",
+        selection: TextRange = TextRange(0, 0),
+        composing: TextRange = TextRange(-1, -1),
+    ) -> None:
+        buffer = text if isinstance(text, TextBuffer) else TextBuffer(text)
+        object.__setattr__(self, "_buffer", buffer)
+        object.__setattr__(self, "selection", selection)
+        object.__setattr__(self, "composing", composing)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TextEditingValue):
+            return NotImplemented
+        return (
+            self.selection == other.selection and self.composing == other.composing and self._buffer == other._buffer
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._buffer, self.selection, self.composing))
+
+    def __repr__(self) -> str:
+        return f"TextEditingValue(text={self.text!r}, selection={self.selection!r}, composing={self.composing!r})"
+
+    @property
+    def text(self) -> str:
+        return str(self._buffer)
+
+    @property
+    def buffer(self) -> TextBuffer:
+        """The piece table backing ``text``."""
+        return self._buffer
 
     @property
     def is_composing(self) -> bool:
@@ -69,11 +229,29 @@ class TextEditingValue:
         return self.composing.start != -1 and self.composing.end != -1
 
     def copy_with(
-        self, text: Optional[str] = None, selection: Optional[TextRange] = None, composing: Optional[TextRange] = None
+        self,
+        text: Union[str, TextBuffer, None] = None,
+        selection: Optional[TextRange] = None,
+        composing: Optional[TextRange] = None,
     ) -> TextEditingValue:
         """Creates a copy of this value but with the given fields replaced with the new values."""
         return TextEditingValue(
-            text=text if text is not None else self.text,
+            text=text if text is not None else self._buffer,
             selection=selection if selection is not None else self.selection,
             composing=composing if composing is not None else self.composing,
         )
+
+    def replace_range(
+        self,
+        start: int,
+        end: int,
+        replacement: str,
+        selection: TextRange,
+        composing: TextRange = TextRange(-1, -1),
+    ) -> TextEditingValue:
+        """Return a copy with ``text[start:end]`` replaced by ``replacement``."""
+        return TextEditingValue(
+            text=self._buffer.replace(start, end, replacement),
+            selection=selection,
+            composing=composing,
+        )
@@ -29,6 +29,9 @@ class TextStyleProtocol(Protocol):
     @property
     def overflow(self) -> Literal["visible", "clip", "ellipsis"]: ...
 
+    @property
+    def max_lines(self) -> int | None: ...
+
 
 @dataclass(frozen=True)
 class TextStyle:
@@ -39,6 +42,7 @@ class TextStyle:
     font_family: str | None = None
     text_alignment: Literal["start", "center", "end"] = "start"
     overflow: Literal["visible", "clip", "ellipsis"] = "visible"
+    max_lines: int | None = 1
 
     def copy_with(self, **changes: Any) -> "TextStyle":
         return replace(self, **changes)
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import pytest
+
+from nuiitivet.animation import Animatable, AnimationScheduler, LinearMotion, get_animation_scheduler
+from nuiitivet.observable import runtime as observable_runtime
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self._interval_callbacks: list[Callable[[float], None]] = []
+
+    def schedule_once(self, fn: Callable[[float], None], delay: float) -> None:
+        del fn, delay
+
+    def schedule_interval(self, fn: Callable[[float], None], interval: float) -> None:
+        del interval
+        if fn not in self._interval_callbacks:
+            self._interval_callbacks.append(fn)
+
+    def unschedule(self, fn: Callable[[float], None]) -> None:
+        self._interval_callbacks = [callback for callback in self._interval_callbacks if callback is not fn]
+
+    def advance(self, dt: float) -> None:
+        for callback in list(self._interval_callbacks):
+            callback(dt)
+
+
+def test_many_animations_share_one_clock_interval(monkeypatch) -> None:
+    fake_clock = _FakeClock()
+    monkeypatch.setattr(observable_runtime, "clock", fake_clock)
+
+    anims = [Animatable(0.0, motion=LinearMotion(0.1)) for _ in range(50)]
+    for anim in anims:
+        anim.target = 1.0
+
+    assert len(fake_clock._interval_callbacks) == 1
+
+    fake_clock.advance(0.05)
+    assert all(anim.value == 0.5 for anim in anims)
+
+    fake_clock.advance(0.05)
+    assert all(anim.value == 1.0 for anim in anims)
+    assert fake_clock._interval_callbacks == []
+    assert not get_animation_scheduler().is_active
+
+
+def test_animation_restarted_by_another_animation_in_the_same_tick_keeps_running(monkeypatch) -> None:
+    fake_clock = _FakeClock()
+    monkeypatch.setattr(observable_runtime, "clock", fake_clock)
+
+    first = Animatable(0.0, motion=LinearMotion(0.1))
+    second = Animatable(0.0, motion=LinearMotion(0.1))
+
+    def bounce(value: float) -> None:
+        if value == 1.0:
+            first.target = 0.0
+
+    second.subscribe(bounce)
+    first.target = 1.0
+    second.target = 1.0
+
+    # Both finish in this tick; the first restarts after its own step ran.
+    fake_clock.advance(0.1)
+    assert first.value == 1.0 and second.value == 1.0
+    assert get_animation_scheduler().is_active
+
+    fake_clock.advance(0.05)
+    assert first.value == 0.5
+    fake_clock.advance(0.05)
+    assert first.value == 0.0
+    assert not get_animation_scheduler().is_active
+
+
+def test_frame_source_requests_frames_only_while_active(monkeypatch) -> None:
+    fake_clock = _FakeClock()
+    monkeypatch.setattr(observable_runtime, "clock", fake_clock)
+    scheduler = AnimationScheduler(interval=0.1)
+    requests: list[int] = []
+    scheduler.attach_frame_source(lambda: requests.append(1))
+
+    remaining = [3]
+
+    def step(dt: float) -> bool:
+        remaining[0] -= 1
+        return remaining[0] == 0
+
+    frames: list[float] = []
+    scheduler.add_frame_callback(frames.append)
+    scheduler.add(step)
+
+    assert requests == [1]
+    assert fake_clock._interval_callbacks == []
+
+    # The first frame after waking uses the nominal interval.
+    assert scheduler.frame(now=10.0) is True
+    assert scheduler.frame(now=10.25) is True
+    assert scheduler.frame(now=10.5) is False
+    assert frames == [0.1, 0.25, 0.25]
+    assert not scheduler.is_active
+
+    # Passive callbacks still run on frames drawn for other reasons.
+    scheduler.frame(now=20.0)
+    assert frames[-1] == 0.1
+    assert requests == [1]
+
+
+def test_detaching_frame_source_falls_back_to_clock(monkeypatch) -> None:
+    fake_clock = _FakeClock()
+    monkeypatch.setattr(observable_runtime, "clock", fake_clock)
+    scheduler = AnimationScheduler()
+    scheduler.attach_frame_source(lambda: None)
+
+    ticks: list[float] = []
+
+    def step(dt: float) -> bool:
+        ticks.append(dt)
+        return len(ticks) >= 2
+
+    scheduler.add(step)
+    assert fake_clock._interval_callbacks == []
+
+    scheduler.detach_frame_source()
+    assert len(fake_clock._interval_callbacks) == 1
+    fake_clock.advance(0.02)
+    fake_clock.advance(0.02)
+    assert ticks == [0.02, 0.02]
+    assert fake_clock._interval_callbacks == []
+
+
+def test_interval_moves_to_replaced_clock(monkeypatch) -> None:
+    first = _FakeClock()
+    monkeypatch.setattr(observable_runtime, "clock", first)
+    scheduler = AnimationScheduler()
+    scheduler.add(lambda dt: False)
+
+    second = _FakeClock()
+    monkeypatch.setattr(observable_runtime, "clock", second)
+    scheduler.add(lambda dt: False)
+
+    assert first._interval_callbacks == []
+    assert len(second._interval_callbacks) == 1
+
+
+def test_event_loop_steps_scheduler_before_drawing() -> None:
+    from nuiitivet.backends.pyglet.event_loop import ResponsiveEventLoop
+
+    draws: list[bool] = []
+    scheduler = AnimationScheduler(interval=0.01)
+    loop = ResponsiveEventLoop(None, lambda dt: draws.append(scheduler.is_active), draw_fps=None)
+    loop.set_animation_scheduler(scheduler)
+    loop._draw_pending = False
+
+    remaining = [2]
+
+    def step(dt: float) -> bool:
+        remaining[0] -= 1
+        # Animations invalidate the UI; that must not force an extra frame.
+        loop.request_draw()
+        return remaining[0] == 0
+
+    scheduler.add(step)
+    start = loop._last_draw_ts
+    assert not loop._should_draw(start)
+    assert loop._compute_sleep_timeout(start) == pytest.approx(0.01)
+
+    loop._perform_draw(0.0, start + 0.01)
+    assert loop._animation_pending and not loop._draw_pending
+    loop._perform_draw(0.0, start + 0.02)
+    assert draws == [True, False]
+    assert not loop._animation_pending and not loop._draw_pending
+    assert not loop._should_draw(start + 1.0)
+
+    loop.set_animation_scheduler(None)
+
+
+def test_event_loop_runs_frame_callbacks_on_every_draw() -> None:
+    from nuiitivet.backends.pyglet.event_loop import ResponsiveEventLoop
+
+    scheduler = AnimationScheduler(interval=0.01)
+    loop = ResponsiveEventLoop(None, lambda dt: None, draw_fps=None)
+    loop.set_animation_scheduler(scheduler)
+
+    frames: list[float] = []
+    scheduler.add_frame_callback(frames.append)
+    assert not loop._animation_pending
+
+    # A draw requested for another reason (input, invalidation) still steps them.
+    loop._perform_draw(0.0, loop._last_draw_ts + 0.5)
+    assert frames == [0.01]
+    assert not loop._animation_pending
+
+    scheduler.remove_frame_callback(frames.append)
+    loop.set_animation_scheduler(None)
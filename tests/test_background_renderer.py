@@ -70,9 +70,9 @@ def test_paint_background_calls_draw_methods(monkeypatch):
     monkeypatch.setattr(br, "_draw_background", fake_draw_background)
     monkeypatch.setattr(br, "_draw_shadow", fake_draw_shadow)
 
-    # ensure resolve_color_to_rgba and make_paint don't raise/return None
+    # ensure resolve_color_to_rgba and shared_paint don't raise/return None
     monkeypatch.setattr("nuiitivet.theme.resolver.resolve_color_to_rgba", lambda c, **_: (1, 1, 1, 1))
-    monkeypatch.setattr("nuiitivet.rendering.background_renderer.make_paint", lambda **kw: object())
+    monkeypatch.setattr("nuiitivet.rendering.background_renderer.shared_paint", lambda **kw: object())
 
     # No shadow configured -> only background should be called
     owner.shadow_color = None
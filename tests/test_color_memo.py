@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from nuiitivet.animation import get_animation_scheduler
+from nuiitivet.material.theme.color_role import ColorRole
+from nuiitivet.material.theme.material_theme import MaterialTheme
+from nuiitivet.observable import runtime as observable_runtime
+from nuiitivet.theme import manager, resolver
+from nuiitivet.theme.resolver import clear_color_memo, color_memo_stats, resolve_color_to_rgba
+
+
+@pytest.fixture(autouse=True)
+def _quiet_clock(monkeypatch: pytest.MonkeyPatch):
+    # The memo counters are process-wide. Apps left subscribed to the theme by
+    # earlier tests resolve their background on every switch, and animations
+    # left running tick on the clock thread and resolve colors. Detach the
+    # subscribers, stop the animations and wait for a no-op timer to be sure
+    # no tick is still in flight.
+    monkeypatch.setattr(manager, "_subscribers", set())
+    get_animation_scheduler().clear()
+    drained = threading.Event()
+
+    def _drained(_dt: float) -> None:
+        drained.set()
+
+    clock = observable_runtime.clock
+    clock.schedule_once(_drained, 0)
+    # Clocks without a thread of their own never run it; nothing is in flight then.
+    drained.wait(1.0)
+    clock.unschedule(_drained)
+    yield
+
+
+def test_repeated_resolution_hits_memo_until_theme_changes() -> None:
+    old = manager.current
+    light, dark = MaterialTheme.from_seed_pair("#6750A4")
+    try:
+        manager.set_theme(light)
+        clear_color_memo()
+
+        first = resolve_color_to_rgba(ColorRole.PRIMARY, theme=manager.current)
+        for _ in range(10):
+            assert resolve_color_to_rgba(ColorRole.PRIMARY, theme=manager.current) == first
+        assert color_memo_stats()["misses"] == 1
+        assert color_memo_stats()["hits"] == 10
+
+        generation = manager.generation
+        manager.set_theme(dark)
+        assert manager.generation == generation + 1
+        assert resolve_color_to_rgba(ColorRole.PRIMARY, theme=manager.current) != first
+        assert color_memo_stats()["misses"] == 2
+    finally:
+        manager.set_theme(old)
+
+
+def test_other_themes_and_custom_resolvers_bypass_memo() -> None:
+    old = manager.current
+    light, dark = MaterialTheme.from_seed_pair("#6750A4")
+    try:
+        manager.set_theme(light)
+        clear_color_memo()
+
+        on_dark = resolve_color_to_rgba(ColorRole.PRIMARY, theme=dark)
+        assert on_dark != resolve_color_to_rgba(ColorRole.PRIMARY)
+        brand = object()
+        assert resolve_color_to_rgba(brand, role_resolver=lambda _: "#112233") == (0x11, 0x22, 0x33, 255)
+        assert resolve_color_to_rgba([1, 2, 3, 4]) == (1, 2, 3, 4)
+        assert color_memo_stats()["entries"] == 1
+    finally:
+        manager.set_theme(old)
+
+
+def test_result_resolved_across_a_theme_switch_is_not_memoized(monkeypatch) -> None:
+    old = manager.current
+    light, dark = MaterialTheme.from_seed_pair("#6750A4")
+    uncached = resolver._resolve_uncached
+    switched: list[bool] = []
+
+    def _switch_mid_resolve(val, *args):
+        # Another thread switches the theme after this resolution started and
+        # resolves a color against the new generation first.
+        res = uncached(val, *args)
+        if not switched:
+            switched.append(True)
+            manager.set_theme(dark)
+            resolve_color_to_rgba(ColorRole.SECONDARY)
+        return res
+
+    try:
+        manager.set_theme(light)
+        clear_color_memo()
+        on_light = resolve_color_to_rgba(ColorRole.PRIMARY)
+
+        manager.set_theme(light)
+        clear_color_memo()
+        monkeypatch.setattr(resolver, "_resolve_uncached", _switch_mid_resolve)
+        assert resolve_color_to_rgba(ColorRole.PRIMARY) == on_light
+        monkeypatch.setattr(resolver, "_resolve_uncached", uncached)
+
+        assert resolve_color_to_rgba(ColorRole.PRIMARY) != on_light
+    finally:
+        manager.set_theme(old)
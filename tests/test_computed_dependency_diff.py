@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import tracemalloc
+
+import pytest
+
+from nuiitivet.observable import Observable
+
+
+def _make_computed(sources):
+    def compute():
+        last = 0
+        for source in sources:
+            last = source.value
+        return last
+
+    return Observable.compute(compute)
+
+
+def _peak_recompute_bytes(computed, rounds: int = 50) -> int:
+    # tracemalloc also sees allocations from other threads (e.g. timers left
+    # by earlier tests), so keep the quietest round.
+    tracemalloc.start()
+    try:
+        best = None
+        for _ in range(rounds):
+            current, _peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            computed._recompute()
+            _current, peak = tracemalloc.get_traced_memory()
+            best = peak - current if best is None else min(best, peak - current)
+        return best or 0
+    finally:
+        tracemalloc.stop()
+
+
+def test_unchanged_dependencies_keep_subscriptions():
+    sources = [Observable(0) for _ in range(3)]
+    computed = _make_computed(sources)
+    before = dict(computed._dep_subscriptions)
+
+    sources[0].value = 1
+    computed._recompute()
+
+    assert computed._dep_subscriptions == before
+    assert all(len(source._subs) == 1 for source in sources)
+
+
+def test_dependency_changes_are_diffed():
+    flag = Observable(True)
+    left = Observable("left")
+    right = Observable("right")
+    computed = Observable.compute(lambda: left.value if flag.value else right.value)
+    flag_sub = computed._dep_subscriptions[flag]
+
+    flag.value = False
+    assert computed.value == "right"
+    assert set(computed._dep_subscriptions) == {flag, right}
+    assert computed._dep_subscriptions[flag] is flag_sub
+    assert left._subs == ()
+
+    left.value = "ignored"
+    right.value = "updated"
+    assert computed.value == "updated"
+
+
+def test_failed_evaluation_does_not_leak_dependencies():
+    mode = Observable("ok")
+    steady = Observable(1)
+    stray = Observable(2)
+    runs: list[int] = []
+
+    def compute():
+        runs.append(1)
+        if mode.value == "fail":
+            stray.value
+            raise ValueError("boom")
+        return steady.value
+
+    computed = Observable.compute(compute)
+
+    with pytest.raises(ValueError):
+        mode.value = "fail"
+    mode.value = "ok"
+
+    assert computed.value == 1
+    assert set(computed._dep_subscriptions) == {mode, steady}
+    assert set(computed._dep_marks) == {mode, steady}
+    assert stray._subs == ()
+
+    before = len(runs)
+    stray.value = 99
+    assert len(runs) == before
+
+
+def test_recompute_allocation_does_not_scale_with_dependency_count():
+    narrow = _make_computed([Observable(0)])
+    wide = _make_computed([Observable(0) for _ in range(50)])
+
+    # Re-subscribing allocated a callback, weakref and Disposable per
+    # dependency (tens of KB here); diffing allocates none of those.
+    assert _peak_recompute_bytes(wide) - _peak_recompute_bytes(narrow) < 50 * 32
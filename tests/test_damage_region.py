@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import skia
+
+from nuiitivet.modifiers.transform import TransformBox
+from nuiitivet.rendering.damage import DamageRegion, rects_intersect
+from nuiitivet.rendering.skia import make_paint
+from nuiitivet.runtime.app import App
+from nuiitivet.widgeting.widget import Widget
+
+
+class _Swatch(Widget):
+    def __init__(self, color: int) -> None:
+        super().__init__()
+        self.color = color
+        self.paint_count = 0
+
+    def build(self) -> "Widget":
+        return self
+
+    def paint(self, canvas, x: int, y: int, width: int, height: int) -> None:
+        self.set_last_rect(x, y, width, height)
+        self.paint_count += 1
+        canvas.drawRect(skia.Rect.MakeXYWH(x, y, width, height), make_paint(color=self.color))
+
+
+class _TwoSwatches(Widget):
+    def __init__(self, left: _Swatch, right: _Swatch) -> None:
+        super().__init__()
+        self.add_child(left)
+        self.add_child(right)
+        self.left = left
+        self.right = right
+
+    def build(self) -> "Widget":
+        return self
+
+    def paint(self, canvas, x: int, y: int, width: int, height: int) -> None:
+        self.set_last_rect(x, y, width, height)
+        self.left.paint(canvas, x + 10, y + 10, 20, 20)
+        self.right.paint(canvas, x + 60, y + 10, 20, 20)
+
+
+def _green_at(img, x: int, y: int) -> int:
+    # Green sits at byte 1 for both RGBA and BGRA pixel layouts.
+    return img.tobytes()[(y * img.width() + x) * 4 + 1]
+
+
+def test_damage_region_merges_touching_rects():
+    region = DamageRegion(margin=0)
+    assert region.is_full
+    region.clear()
+    assert region.is_empty
+
+    region.add_rect((0, 0, 10, 10))
+    region.add_rect((10, 0, 10, 10))
+    region.add_rect((50, 50, 5, 5))
+    assert sorted(region.rects()) == [(0, 0, 20, 10), (50, 50, 5, 5)]
+    assert region.intersects((52, 52, 1, 1))
+    assert not region.intersects((30, 30, 5, 5))
+
+
+def test_damage_region_collapses_and_marks_full():
+    region = DamageRegion(max_rects=2, margin=0)
+    region.clear()
+    for i in range(3):
+        region.add_rect((i * 20, 0, 5, 5))
+    assert region.rects() == ((0, 0, 45, 5),)
+
+    region.add_rect((0, 0, 0, 5))
+    assert region.rects() == ((0, 0, 45, 5),)
+    region.add_rect(None)
+    assert region.is_full and region.covers(100, 100)
+
+
+def test_rects_intersect_excludes_touching_edges():
+    assert rects_intersect((0, 0, 10, 10), (5, 5, 10, 10))
+    assert not rects_intersect((0, 0, 10, 10), (10, 0, 10, 10))
+
+
+def test_widget_damage_rect_uses_outsets_and_transformed_ancestors():
+    swatch = _Swatch(skia.ColorRED)
+    assert swatch.damage_rect() is None
+
+    swatch.set_last_rect(10, 20, 30, 40)
+    swatch.paint_outsets = lambda: (1, 2, 3, 4)  # type: ignore[method-assign]
+    assert swatch.damage_rect() == (9, 18, 34, 46)
+
+    box = TransformBox(swatch, scale=1.5)
+    assert swatch.parent is box
+    assert swatch.damage_rect() is None
+
+
+def test_app_repaints_only_damaged_widgets():
+    left = _Swatch(skia.ColorRED)
+    right = _Swatch(skia.ColorRED)
+    root = _TwoSwatches(left, right)
+    app = App(content=root, width=100, height=40)
+    app.root.mount(app)
+    try:
+        img = app._render_snapshot()
+        assert _green_at(img, 15, 15) == 0
+        assert _green_at(img, 65, 15) == 0
+
+        left.color = skia.ColorGREEN
+        right.color = skia.ColorGREEN
+        left.invalidate()
+        img = app._render_snapshot()
+        assert _green_at(img, 15, 15) == 255
+        # The right swatch lies outside the damage and keeps its old pixels.
+        assert _green_at(img, 65, 15) == 0
+
+        painted = right.paint_count
+        app._render_snapshot()
+        assert right.paint_count == painted
+
+        app.invalidate()
+        img = app._render_snapshot()
+        assert _green_at(img, 65, 15) == 255
+    finally:
+        app.root.unmount()
@@ -1,4 +1,12 @@
+import asyncio
+import os
+import select
+import threading
 import time
+import types
+
+import pyglet
+import pytest
 
 from nuiitivet.backends.pyglet.event_loop import ResponsiveEventLoop
 
@@ -12,6 +20,9 @@ class _DummyWindow:
     def dispatch_pending_events(self):
         return None
 
+    def dispatch_events(self):
+        return None
+
 
 def test_request_draw_inside_callback_is_preserved():
     recorded = []
@@ -30,3 +41,124 @@ def test_request_draw_inside_callback_is_preserved():
 
     assert recorded, "Draw callback should be invoked"
     assert loop._draw_pending is True, "request_draw() inside callback must schedule another frame"
+
+
+class _PipeDevice:
+    """Stands in for an X display connection: a readable descriptor."""
+
+    def __init__(self):
+        self.read_fd, self.write_fd = os.pipe()
+        self.selected_at = []
+
+    def fileno(self):
+        return self.read_fd
+
+    def poll(self):
+        return False
+
+    def select(self):
+        os.read(self.read_fd, 1)
+        self.selected_at.append(time.perf_counter())
+
+    def close(self):
+        os.close(self.read_fd)
+        os.close(self.write_fd)
+
+
+class _FakePlatformLoop:
+    def __init__(self, device):
+        self.device = device
+        self.select_devices = {device}
+        self.steps = 0
+
+    def start(self):
+        return None
+
+    def stop(self):
+        return None
+
+    def notify(self):
+        return None
+
+    def dispatch_posted_events(self):
+        return None
+
+    def step(self, timeout=None):
+        self.steps += 1
+        ready, _, _ = select.select(list(self.select_devices), [], [], timeout)
+        for device in ready:
+            device.select()
+        return bool(ready)
+
+
+@pytest.fixture
+def fake_platform(monkeypatch):
+    device = _PipeDevice()
+    platform_loop = _FakePlatformLoop(device)
+    monkeypatch.setattr(pyglet.app, "platform_event_loop", platform_loop)
+    monkeypatch.setattr(pyglet.app, "windows", {_DummyWindow()})
+    monkeypatch.setattr(pyglet.app, "event_loop", pyglet.app.event_loop)
+    # Importing the real pyglet.window needs a display.
+    monkeypatch.setitem(
+        __import__("sys").modules,
+        "pyglet.window",
+        types.SimpleNamespace(Window=type("Window", (), {"_enable_event_queue": True})),
+    )
+    yield platform_loop
+    device.close()
+
+
+@pytest.mark.asyncio
+async def test_run_async_sleeps_while_idle(fake_platform):
+    draws = []
+    loop = ResponsiveEventLoop(_DummyWindow(), draws.append, draw_fps=None)
+    task = asyncio.create_task(loop.run_async())
+
+    await asyncio.sleep(0.3)
+    loop.exit()
+    await asyncio.wait_for(task, 1.0)
+
+    assert len(draws) == 1
+    # Polling every millisecond would step the platform loop hundreds of times.
+    assert fake_platform.steps < 10
+
+
+@pytest.mark.asyncio
+async def test_run_async_wakes_on_window_connection_input(fake_platform):
+    loop = ResponsiveEventLoop(_DummyWindow(), lambda dt: None, draw_fps=None)
+    task = asyncio.create_task(loop.run_async())
+    await asyncio.sleep(0.05)
+
+    written_at = time.perf_counter()
+    os.write(fake_platform.device.write_fd, b"1")
+    await asyncio.sleep(0.05)
+    loop.exit()
+    await asyncio.wait_for(task, 1.0)
+
+    selected_at = fake_platform.device.selected_at
+    assert selected_at
+    assert selected_at[0] - written_at < 0.02
+
+
+@pytest.mark.asyncio
+async def test_run_async_wakes_for_draw_requests_and_scheduled_callbacks(fake_platform):
+    draws = []
+    ran = []
+    loop = ResponsiveEventLoop(_DummyWindow(), lambda dt: draws.append(time.perf_counter()), draw_fps=None)
+    task = asyncio.create_task(loop.run_async())
+    await asyncio.sleep(0.05)
+
+    requested_at = time.perf_counter()
+    loop.request_draw()
+    await asyncio.sleep(0.05)
+
+    worker = threading.Thread(target=lambda: loop.runtime_clock.schedule_once(lambda dt: ran.append(dt), 0))
+    worker.start()
+    worker.join()
+    await asyncio.sleep(0.05)
+    loop.exit()
+    await asyncio.wait_for(task, 1.0)
+
+    assert len(draws) == 2
+    assert draws[1] - requested_at < 0.02
+    assert len(ran) == 1
@@ -0,0 +1,149 @@
+from nuiitivet.layout.for_each import ForEach
+from nuiitivet.observable import ObservableList
+from nuiitivet.widgeting.widget import Widget
+
+
+class DummyWidget(Widget):
+
+    def __init__(self, tag: object = None):
+        super().__init__()
+        self.tag = tag
+
+    def preferred_size(self):
+        return (10, 5)
+
+
+def _resolve_payload(widget: Widget) -> Widget:
+    current = widget
+    while getattr(current, "built_child", None) is not None:
+        current = getattr(current, "built_child")
+    return current
+
+
+def _child_tags(fe: ForEach):
+    return [getattr(_resolve_payload(child), "tag", None) for child in fe.children_snapshot()]
+
+
+def _mounted(items, key=None):
+    calls = []
+
+    def builder(item, idx):
+        calls.append((idx, item))
+        return DummyWidget(tag=item)
+
+    fe = ForEach(items, builder, key=key)
+    fe.on_mount()
+    fe.evaluate_build()
+    calls.clear()
+    return fe, calls
+
+
+def test_append_builds_only_new_items():
+    items = ObservableList([1, 2, 3])
+    fe, calls = _mounted(items)
+
+    items.append(4)
+    items.extend([5, 6])
+
+    assert calls == [(3, 4), (4, 5), (5, 6)]
+    assert _child_tags(fe) == [1, 2, 3, 4, 5, 6]
+
+
+def test_positional_insert_rebuilds_shifted_positions():
+    items = ObservableList(["a", "b", "c"])
+    fe, calls = _mounted(items)
+    first = fe.children_snapshot()[0]
+
+    items.insert(1, "x")
+
+    assert sorted(calls) == [(1, "x"), (2, "b"), (3, "c")]
+    assert _child_tags(fe) == ["a", "x", "b", "c"]
+    assert fe.children_snapshot()[0] is first
+
+
+def test_positional_remove_drops_tail_entry():
+    items = ObservableList(["a", "b", "c"])
+    fe, calls = _mounted(items)
+
+    items.remove("c")
+    assert calls == []
+    assert _child_tags(fe) == ["a", "b"]
+    assert len(fe._scope_root.children) == 2
+
+    del items[0]
+    assert calls == [(0, "b")]
+    assert _child_tags(fe) == ["b"]
+
+
+def test_keyed_changes_recycle_existing_entries():
+    items = ObservableList(["a", "b", "c"])
+    fe, calls = _mounted(items, key=lambda item, _idx: item)
+    before = {_resolve_payload(child).tag: child for child in fe.children_snapshot()}
+
+    items.move(0, 2)
+    items.insert(1, "x")
+    items.remove("b")
+
+    assert calls == [(1, "x")]
+    assert _child_tags(fe) == ["x", "c", "a"]
+    snapshot = fe.children_snapshot()
+    assert snapshot[1] is before["c"] and snapshot[2] is before["a"]
+    assert [entry.index for entry in fe._ordered_entries] == [0, 1, 2]
+
+
+def test_keyed_replace_with_new_key_swaps_entry():
+    items = ObservableList(["a", "b"])
+    fe, calls = _mounted(items, key=lambda item, _idx: item)
+
+    items[1] = "z"
+
+    assert calls == [(1, "z")]
+    assert _child_tags(fe) == ["a", "z"]
+    assert set(fe._entries_by_token) == {"a", "z"}
+
+
+def test_reset_and_duplicate_keys_fall_back_to_full_resync():
+    items = ObservableList(["b", "a", "a"])
+    fe, _calls = _mounted(items, key=lambda item, _idx: item)
+
+    items.sort()
+    assert _child_tags(fe) == ["a", "a", "b"]
+
+    items.append("a")
+    assert _child_tags(fe) == ["a", "a", "b", "a"]
+
+
+def _fresh_tokens(items, key):
+    fe, _calls = _mounted(list(items), key=key)
+    return [entry.token for entry in fe._ordered_entries]
+
+
+def test_index_dependent_keys_stay_consistent_with_a_fresh_build():
+    def key(item, idx):
+        return f"{item}@{idx}"
+
+    items = ObservableList(["a", "b", "c"])
+    fe, _calls = _mounted(items, key=key)
+
+    items.insert(0, "x")
+    assert [entry.token for entry in fe._ordered_entries] == _fresh_tokens(items, key)
+
+    del items[1]
+    assert [entry.token for entry in fe._ordered_entries] == _fresh_tokens(items, key)
+
+    items.move(0, 2)
+    assert [entry.token for entry in fe._ordered_entries] == _fresh_tokens(items, key)
+    assert _child_tags(fe) == ["b", "c", "x"]
+
+
+def test_moving_a_duplicate_key_matches_a_fresh_build():
+    def key(item, _idx):
+        return item
+
+    items = ObservableList(["a", "b", "a"])
+    fe, _calls = _mounted(items, key=key)
+
+    items.move(2, 0)
+
+    assert [entry.token for entry in fe._ordered_entries] == _fresh_tokens(items, key)
+    assert _child_tags(fe) == ["a", "a", "b"]
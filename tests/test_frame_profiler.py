@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from nuiitivet.layout.column import Column
+from nuiitivet.runtime.app import App
+from nuiitivet.runtime.profiler import FrameProfiler, get_frame_profiler
+from nuiitivet.widgeting.widget import Widget
+
+
+class _Leaf(Widget):
+    def preferred_size(self, max_width=None, max_height=None):
+        return (20, 20)
+
+    def paint(self, canvas, x: int, y: int, width: int, height: int) -> None:
+        self.set_last_rect(x, y, width, height)
+
+
+@pytest.fixture
+def profiler():
+    prof = get_frame_profiler()
+    prof.reset()
+    prof.enable()
+    try:
+        yield prof
+    finally:
+        prof.disable()
+        prof.reset()
+
+
+def _render(frames: int = 1) -> App:
+    app = App(content=Column([_Leaf(), _Leaf()]), width=100, height=100)
+    app.root.mount(app)
+    for _ in range(frames):
+        app.root.invalidate()
+        app._render_snapshot()
+    return app
+
+
+def test_disabled_profiler_returns_null_span_and_leaves_widgets_untouched():
+    prof = FrameProfiler()
+    assert prof.span("layout") is prof.span("paint")
+    original = _Leaf.paint
+    prof.begin_frame()
+    prof.end_frame()
+    assert prof.frames() == []
+    assert _Leaf.paint is original
+    assert prof.stats()["events"] == 0
+
+
+def test_render_records_frame_phases(profiler):
+    _render(frames=2)
+
+    frames = profiler.frames()
+    assert [frame.number for frame in frames] == [0, 1]
+    phases = frames[0].phases
+    for name in ("flush_binding_invalidations", "flush_scope_recompositions", "layout", "paint"):
+        assert name in phases
+    assert sum(phases.values()) <= frames[0].duration
+
+
+def test_widget_costs_are_attributed_per_class(profiler):
+    _render()
+
+    paint = {cost.widget: cost for cost in profiler.widget_costs("paint")}
+    assert paint["_Leaf"].calls == 2
+    assert "Column" in paint
+    column = paint["Column"]
+    # The column's self time excludes the time spent painting its children.
+    assert column.self_time <= column.total
+    assert column.total >= paint["_Leaf"].total
+    assert {cost.widget for cost in profiler.widget_costs("layout")} >= {"Column"}
+
+
+def test_chrome_trace_export(profiler, tmp_path):
+    _render()
+
+    path = tmp_path / "trace.json"
+    profiler.write_chrome_trace(str(path))
+    trace = json.loads(path.read_text(encoding="utf-8"))
+
+    events = trace["traceEvents"]
+    assert trace["displayTimeUnit"] == "ms"
+    assert all(event["ph"] == "X" for event in events)
+    assert all(event["dur"] >= 0 and event["ts"] >= 0 for event in events)
+    names = {event["name"] for event in events}
+    assert {"frame", "layout", "paint", "_Leaf", "Column"} <= names
+    frame = next(event for event in events if event["name"] == "frame")
+    paint = next(event for event in events if event["name"] == "paint")
+    assert frame["ts"] <= paint["ts"] <= paint["ts"] + paint["dur"] <= frame["ts"] + frame["dur"] + 1
+
+
+def test_disable_restores_widget_methods():
+    original_paint = _Leaf.paint
+    original_layout = Widget.layout
+    prof = get_frame_profiler()
+    prof.enable()
+    try:
+        assert _Leaf.paint is not original_paint
+        assert _Leaf.paint.__wrapped__ is original_paint
+    finally:
+        prof.disable()
+        prof.reset()
+    assert _Leaf.paint is original_paint
+    assert Widget.layout is original_layout
+
+
+def test_event_buffer_is_bounded():
+    prof = FrameProfiler(max_events=3)
+    prof.enable()
+    try:
+        for _ in range(5):
+            with prof.span("tick"):
+                pass
+    finally:
+        prof.disable()
+    assert prof.stats()["events"] == 3
+    assert prof.stats()["dropped_events"] == 2
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from typing import Any
+
+import skia
+
+from nuiitivet.material import icon as icon_module
+from nuiitivet.material.icon import Icon
+from nuiitivet.material.theme.material_theme import MaterialTheme
+from nuiitivet.rendering.skia import font as font_module
+from nuiitivet.rendering.skia import (
+    GlyphAtlas,
+    get_glyph_atlas,
+    get_typeface,
+    make_font,
+    make_paint,
+    make_raster_surface,
+    make_text_blob,
+)
+from nuiitivet.theme import manager
+
+
+def _surface(size: int = 64) -> Any:
+    surface = make_raster_surface(size, size)
+    surface.getCanvas().clear(skia.ColorTRANSPARENT)
+    return surface
+
+
+def _alpha_sum(surface: Any) -> int:
+    pixels = surface.makeImageSnapshot().toarray()
+    return int(pixels[:, :, 3].sum())
+
+
+def _direct_w(surface: Any) -> None:
+    blob: Any = make_text_blob("W", make_font(get_typeface(), 24))
+    bounds = blob.bounds()
+    x = 8 + (48 - bounds.width()) / 2.0 - bounds.left()
+    y = 8 + (48 - bounds.height()) / 2.0 - bounds.top()
+    surface.getCanvas().drawTextBlob(blob, x, y, make_paint(color=(0, 0, 0, 255)))
+
+
+def test_glyph_is_rasterized_once_and_reused_for_any_color() -> None:
+    atlas = GlyphAtlas(skia, page_size=256)
+    typeface = get_typeface()
+    surface = _surface()
+    canvas = surface.getCanvas()
+
+    assert atlas.draw(canvas, typeface, "W", 24, (255, 0, 0, 255), 0, 0, 32, 32)
+    assert atlas.draw(canvas, typeface, "W", 24, (0, 60, 255, 255), 32, 32, 32, 32)
+
+    stats = atlas.stats()
+    assert stats == {"hits": 1, "misses": 1, "entries": 1, "pages": 1}
+    pixels = surface.makeImageSnapshot().toarray()
+    # Colors of similar lightness share an entry, tinted per draw.
+    # toarray() returns BGRA in native N32 order.
+    first, second = pixels[:32, :32], pixels[32:, 32:]
+    assert first[:, :, 2].sum() > 0 and first[:, :, 0].sum() == 0
+    assert second[:, :, 0].sum() > 0 and second[:, :, 2].sum() == 0
+
+
+def test_atlas_matches_direct_text_blob() -> None:
+    atlas = GlyphAtlas(skia, page_size=256)
+    typeface = get_typeface()
+
+    direct = _surface()
+    _direct_w(direct)
+
+    cached = _surface()
+    assert atlas.draw(cached.getCanvas(), typeface, "W", 24, (0, 0, 0, 255), 8, 8, 48, 48)
+
+    assert _alpha_sum(direct) > 0
+    assert (cached.makeImageSnapshot().toarray() == direct.makeImageSnapshot().toarray()).all()
+
+
+def test_scale_is_part_of_the_key() -> None:
+    atlas = GlyphAtlas(skia, page_size=256)
+    typeface = get_typeface()
+    surface = _surface(128)
+    canvas = surface.getCanvas()
+
+    assert atlas.draw(canvas, typeface, "A", 16, (0, 0, 0, 255), 0, 0, 32, 32)
+    canvas.save()
+    canvas.scale(2.0, 2.0)
+    assert atlas.draw(canvas, typeface, "A", 16, (0, 0, 0, 255), 0, 0, 32, 32)
+    canvas.restore()
+
+    assert atlas.stats()["misses"] == 2
+
+
+def test_rotated_canvas_is_left_to_direct_drawing() -> None:
+    atlas = GlyphAtlas(skia, page_size=256)
+    canvas = _surface().getCanvas()
+    canvas.rotate(90)
+
+    assert not atlas.draw(canvas, get_typeface(), "W", 24, (0, 0, 0, 255), 8, 8, 48, 48)
+    assert atlas.stats()["misses"] == 0
+
+
+def test_nearby_scales_share_an_entry_and_resample_smoothly() -> None:
+    atlas = GlyphAtlas(skia, page_size=256)
+    typeface = get_typeface()
+
+    for scale in (1.0, 1.02, 1.05):
+        canvas = _surface(128).getCanvas()
+        canvas.scale(scale, scale)
+        assert atlas.draw(canvas, typeface, "W", 24, (0, 0, 0, 255), 8, 8, 48, 48)
+    assert atlas.stats()["misses"] == 1
+
+    direct = _surface(128)
+    direct.getCanvas().scale(1.05, 1.05)
+    _direct_w(direct)
+    cached = _surface(128)
+    cached.getCanvas().scale(1.05, 1.05)
+    assert atlas.draw(cached.getCanvas(), typeface, "W", 24, (0, 0, 0, 255), 8, 8, 48, 48)
+
+    expected = direct.makeImageSnapshot().toarray()[:, :, 3].astype(int)
+    actual = cached.makeImageSnapshot().toarray()[:, :, 3].astype(int)
+    assert int((abs(expected - actual) > 64).sum()) * 5 < int((expected > 0).sum())
+
+
+def test_full_atlas_starts_over() -> None:
+    atlas = GlyphAtlas(skia, page_size=128, max_pages=1)
+    typeface = get_typeface()
+    canvas = _surface().getCanvas()
+
+    for size in range(16, 48, 4):
+        assert atlas.draw(canvas, typeface, "M", size, (0, 0, 0, 255), 0, 0, 64, 64)
+
+    stats = atlas.stats()
+    assert stats["pages"] == 1
+    assert stats["entries"] < stats["misses"]
+
+
+def test_oversized_glyph_falls_back() -> None:
+    atlas = GlyphAtlas(skia, page_size=64)
+    canvas = _surface().getCanvas()
+    assert not atlas.draw(canvas, get_typeface(), "M", 200, (0, 0, 0, 255), 0, 0, 64, 64)
+
+
+def test_icons_share_atlas_entry_and_glyph_choice(monkeypatch) -> None:
+    atlas = get_glyph_atlas()
+    assert atlas is not None
+    atlas.clear()
+    before = atlas.stats()
+
+    choices = []
+    original = Icon._choose_glyph
+
+    def counting_choose(self, tf, draw_size):
+        choices.append(self.name)
+        return original(self, tf, draw_size)
+
+    monkeypatch.setattr(Icon, "_choose_glyph", counting_choose)
+    monkeypatch.setattr(icon_module, "_GLYPH_CHOICES", {})
+    # Other tests may leave typefaces from a mocked skia in these caches.
+    monkeypatch.setattr(font_module, "_TYPEFACE_CACHE", {})
+    monkeypatch.setattr(font_module, "_TYPEFACE_DIRECT_CACHE", {})
+
+    old_theme = manager.current
+    manager.set_theme(MaterialTheme.light("#6750A4"))
+    try:
+        surface = _surface(128)
+        canvas = surface.getCanvas()
+        icons = [Icon("menu", size=24) for _ in range(5)]
+        for _frame in range(3):
+            for index, ic in enumerate(icons):
+                ic.paint(canvas, index * 24, 0, 24, 24)
+    finally:
+        manager.set_theme(old_theme)
+
+    stats = atlas.stats()
+    assert choices == ["menu"]
+    assert stats["misses"] - before["misses"] == 1
+    assert stats["hits"] - before["hits"] == 14
+    assert _alpha_sum(surface) > 0
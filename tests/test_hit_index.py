@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from nuiitivet.layout.column import Column
+from nuiitivet.layout.stack import Stack
+from nuiitivet.widgeting.hit_index import HitTestGrid
+from nuiitivet.widgeting.widget import Widget
+
+
+class _Tile(Widget):
+    def __init__(self, size: int = 10) -> None:
+        super().__init__()
+        self.size = size
+        self.hit_calls = 0
+
+    def preferred_size(self, max_width=None, max_height=None):
+        return (self.size, self.size)
+
+    def hit_test(self, x: int, y: int):
+        self.hit_calls += 1
+        return super().hit_test(x, y)
+
+
+def test_grid_query_returns_topmost_first_and_handles_wide_children():
+    children = ["a", "b", "c", "d"]
+    rects = [(0, 0, 1000, 1000), (0, 0, 10, 10), (10, 0, 10, 10), (5, 5, 10, 10)]
+    grid = HitTestGrid(children, rects)
+    assert [child for child, _ in grid.query(7, 7)] == ["d", "b", "a"]
+    assert [child for child, _ in grid.query(500, 500)] == ["a"]
+    assert grid.query(-1, 0) == []
+
+
+def test_column_hit_test_visits_only_nearby_children():
+    tiles = [_Tile() for _ in range(500)]
+    column = Column(tiles)
+    column.layout(10, 5000)
+
+    assert column.hit_test(5, 2345) is tiles[234]
+    assert sum(tile.hit_calls for tile in tiles) == 1
+    assert column.hit_test(5, 6000) is None
+
+
+def test_index_follows_layout_and_children_changes():
+    tiles = [_Tile() for _ in range(20)]
+    column = Column(tiles)
+    column.layout(10, 200)
+    assert column.hit_test(5, 15) is tiles[1]
+
+    tiles[0].size = 30
+    tiles[0].mark_needs_layout()
+    column.layout(10, 300)
+    assert column.hit_test(5, 15) is tiles[0]
+    assert column.hit_test(5, 35) is tiles[1]
+
+    extra = _Tile()
+    column.add_child(extra)
+    column.layout(10, 300)
+    assert column.hit_test(5, 225) is extra
+
+
+def test_stack_overlap_keeps_z_order():
+    tiles = [_Tile(size=50) for _ in range(20)]
+    stack = Stack(tiles)
+    stack.layout(50, 50)
+    assert stack.hit_test(10, 10) is tiles[-1]
@@ -2,10 +2,21 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock
 
+import pytest
+
 from nuiitivet.observable import Observable
+from nuiitivet.rendering.skia.image_cache import get_image_cache
 from nuiitivet.widgets.image import Image
 
 
+@pytest.fixture(autouse=True)
+def _clear_image_cache():
+    # Tests swap in dummy decoders; keep their results out of other tests.
+    get_image_cache().clear()
+    yield
+    get_image_cache().clear()
+
+
 class _DummyDecodedImage:
     def __init__(self, width: int, height: int) -> None:
         self._width = width
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import pytest
+
+from nuiitivet.rendering.skia.image_cache import ImageCache, get_image_cache, image_content_key
+from nuiitivet.widgets.image import Image
+
+
+class _Decoded:
+    def __init__(self, width: int, height: int) -> None:
+        self._width = width
+        self._height = height
+
+    def width(self) -> int:
+        return self._width
+
+    def height(self) -> int:
+        return self._height
+
+
+class _CountingSkiaImage:
+    calls = 0
+
+    @classmethod
+    def MakeFromEncoded(cls, data: bytes):
+        cls.calls += 1
+        if data.startswith(b"img"):
+            return _Decoded(10, 10)
+        return None
+
+
+class _CountingSkia:
+    Image = _CountingSkiaImage
+
+
+@pytest.fixture(autouse=True)
+def _clear_image_cache():
+    get_image_cache().clear()
+    get_image_cache().reset_stats()
+    yield
+    get_image_cache().clear()
+
+
+def test_widgets_with_equal_bytes_share_one_decode(monkeypatch) -> None:
+    import nuiitivet.widgets.image as image_mod
+
+    _CountingSkiaImage.calls = 0
+    monkeypatch.setattr(image_mod, "get_skia", lambda raise_if_missing=False: _CountingSkia)
+
+    # Distinct bytes objects with equal content, as after a rebuild.
+    widgets = [Image(bytes(bytearray(b"img-avatar"))) for _ in range(10)]
+
+    assert _CountingSkiaImage.calls == 1
+    assert len({id(w._decoded_image) for w in widgets}) == 1
+    stats = get_image_cache().stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (9, 1, 1)
+
+
+def test_failed_decodes_are_not_cached(monkeypatch) -> None:
+    import nuiitivet.widgets.image as image_mod
+
+    _CountingSkiaImage.calls = 0
+    monkeypatch.setattr(image_mod, "get_skia", lambda raise_if_missing=False: _CountingSkia)
+
+    Image(b"broken")
+    Image(b"broken")
+
+    assert _CountingSkiaImage.calls == 2
+    assert len(get_image_cache()) == 0
+
+
+def test_lru_eviction_respects_byte_budget() -> None:
+    cache = ImageCache(max_bytes=3 * 400)
+    for name in (b"a", b"b", b"c"):
+        cache.put(name, _Decoded(10, 10))
+    assert cache.current_bytes == 1200
+
+    cache.get(b"a")
+    cache.put(b"d", _Decoded(10, 10))
+
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") is not None
+    assert cache.stats()["evictions"] == 1
+
+    cache.max_bytes = 400
+    assert len(cache) == 1
+    assert cache.stats()["evictions"] == 3
+
+
+def test_oversized_image_is_returned_but_not_cached() -> None:
+    cache = ImageCache(max_bytes=100)
+    decoded = cache.get_or_decode(b"img-big", lambda data: _Decoded(10, 10))
+    assert decoded is not None
+    assert len(cache) == 0
+    assert cache.current_bytes == 0
+
+
+def test_content_key_depends_on_bytes_only() -> None:
+    assert image_content_key(b"abc") == image_content_key(bytes(bytearray(b"abc")))
+    assert image_content_key(b"abc") != image_content_key(b"abd")
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Executor, Future
+from typing import Any, Callable
+from unittest.mock import MagicMock
+
+import pytest
+import skia
+
+from nuiitivet.observable import runtime as observable_runtime
+from nuiitivet.rendering.skia import make_raster_surface
+from nuiitivet.rendering.skia.image_cache import get_image_cache
+from nuiitivet.rendering.skia.image_decode import (
+    DECODE_FAILED,
+    ImageDecoder,
+    decode_image,
+    fit_decode_size,
+    read_image_size,
+)
+from nuiitivet.widgets.image import Image
+
+
+class _UiClock:
+    """Collects dispatch_to_ui callbacks so the test can run them on the main thread."""
+
+    def __init__(self) -> None:
+        self.pending: list[Callable[[float], None]] = []
+
+    def schedule_once(self, fn: Callable[[float], None], delay: float) -> None:
+        self.pending.append(fn)
+
+    def schedule_interval(self, fn: Callable[[float], None], interval: float) -> None:
+        pass
+
+    def unschedule(self, fn: Callable[[float], None]) -> None:
+        pass
+
+    def run_pending(self) -> None:
+        pending, self.pending = self.pending, []
+        for fn in pending:
+            fn(0.0)
+
+
+class _WorkerExecutor(Executor):
+    """Holds submitted decodes until ``run`` executes them on a worker thread."""
+
+    def __init__(self) -> None:
+        self.submitted: list[tuple[Callable[..., Any], tuple[Any, ...]]] = []
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> "Future[Any]":
+        self.submitted.append((fn, args))
+        return Future()
+
+    def run(self) -> None:
+        jobs, self.submitted = self.submitted, []
+        worker = threading.Thread(target=lambda: [fn(*args) for fn, args in jobs])
+        worker.start()
+        worker.join()
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        pass
+
+
+def _encoded(width: int, height: int, fmt=skia.EncodedImageFormat.kJPEG) -> bytes:
+    surface = make_raster_surface(width, height)
+    surface.getCanvas().clear(skia.ColorRED)
+    return surface.makeImageSnapshot().encodeToData(fmt, 90).bytes()
+
+
+@pytest.fixture(autouse=True)
+def _clear_image_cache():
+    get_image_cache().clear()
+    yield
+    get_image_cache().clear()
+
+
+def test_fit_decode_size_covers_box_without_upscaling() -> None:
+    assert fit_decode_size((400, 300), (64, 64)) == (86, 64)
+    assert fit_decode_size((400, 300), (800, 10)) is None
+    assert fit_decode_size((400, 300), (0, 64)) is None
+
+
+@pytest.mark.parametrize("fmt", [skia.EncodedImageFormat.kJPEG, skia.EncodedImageFormat.kPNG])
+def test_decode_image_downsamples_to_requested_size(fmt) -> None:
+    data = _encoded(400, 300, fmt)
+    assert read_image_size(data) == (400, 300)
+
+    image = decode_image(data, (86, 64))
+    assert image is not None
+    assert (image.width(), image.height()) == (86, 64)
+    assert not image.isLazyGenerated()
+    assert decode_image(b"not an image", (10, 10)) is None
+
+
+def test_async_image_paints_placeholder_then_downsampled_image(monkeypatch) -> None:
+    import nuiitivet.widgets.image as image_mod
+
+    clock = _UiClock()
+    monkeypatch.setattr(observable_runtime, "clock", clock)
+    executor = _WorkerExecutor()
+    decoder = ImageDecoder(executor)
+    monkeypatch.setattr(image_mod, "get_image_decoder", lambda: decoder)
+
+    widget = Image(_encoded(400, 300), decode="async", placeholder=(0, 0, 255, 255), fit="contain")
+    # Intrinsic size comes from the header before any pixels are decoded.
+    assert widget.preferred_size() == (400, 300)
+    widget.layout(64, 64)
+
+    canvas = MagicMock()
+    widget.paint(canvas, 0, 0, 64, 64)
+    assert canvas.drawRect.call_count == 1
+    canvas.drawImageRect.assert_not_called()
+
+    assert len(executor.submitted) == 1
+    executor.run()
+    clock.run_pending()
+
+    canvas = MagicMock()
+    widget.paint(canvas, 0, 0, 64, 64)
+    canvas.drawRect.assert_not_called()
+    image, src_rect, dst_rect = canvas.drawImageRect.call_args[0]
+    assert (image.width(), image.height()) == (86, 64)
+    assert tuple(src_rect) == (0.0, 0.0, 86.0, 64.0)
+    assert tuple(dst_rect) == (0.0, 8.0, 64.0, 56.0)
+
+    # Shrinking keeps the decoded pixels; growing past them decodes again.
+    widget.layout(32, 32)
+    assert executor.submitted == []
+    widget.layout(200, 200)
+    assert len(executor.submitted) == 1
+
+
+def test_identical_async_requests_share_one_decode(monkeypatch) -> None:
+    clock = _UiClock()
+    monkeypatch.setattr(observable_runtime, "clock", clock)
+    executor = _WorkerExecutor()
+    decoder = ImageDecoder(executor)
+    data = _encoded(400, 300)
+
+    first = decoder.request(data, (86, 64))
+    assert decoder.request(bytes(bytearray(data)), (86, 64)) is first
+    assert len(executor.submitted) == 1
+    executor.run()
+    # Worker results reach subscribers only through the UI dispatch.
+    assert first.value is None
+    clock.run_pending()
+    assert first.value is not None
+
+    # Completed decodes are served from the shared cache.
+    assert decoder.request(data, (86, 64)).value is first.value
+
+
+def test_failed_worker_decode_falls_back_to_sync_decode(monkeypatch) -> None:
+    import nuiitivet.widgets.image as image_mod
+
+    clock = _UiClock()
+    monkeypatch.setattr(observable_runtime, "clock", clock)
+    executor = _WorkerExecutor()
+    decoder = ImageDecoder(executor)
+    monkeypatch.setattr(image_mod, "get_image_decoder", lambda: decoder)
+
+    def broken_decode(data: bytes, size: Any = None) -> Any:
+        raise RuntimeError("decoder crashed")
+
+    monkeypatch.setattr("nuiitivet.rendering.skia.image_decode.decode_image", broken_decode)
+
+    widget = Image(_encoded(400, 300), decode="async", placeholder=(0, 0, 255, 255), fit="contain")
+    widget.layout(64, 64)
+    request = decoder.request(_encoded(400, 300), (86, 64))
+    executor.run()
+    clock.run_pending()
+    assert request.value is DECODE_FAILED
+
+    canvas = MagicMock()
+    widget.paint(canvas, 0, 0, 64, 64)
+    canvas.drawRect.assert_not_called()
+    image = canvas.drawImageRect.call_args[0][0]
+    assert (image.width(), image.height()) == (400, 300)
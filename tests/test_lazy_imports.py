@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import nuiitivet
+from nuiitivet import material
+
+
+def _loaded_after(statement: str) -> set[str]:
+    code = f"import sys\n{statement}\nprint('\\n'.join(sorted(sys.modules)))\n"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    out = subprocess.run([sys.executable, "-c", code], check=True, env=env, capture_output=True, text=True).stdout
+    return set(out.split())
+
+
+def test_importing_packages_does_not_import_components() -> None:
+    loaded = _loaded_after("import nuiitivet.material")
+
+    assert "nuiitivet.material" in loaded
+    heavy = {"skia", "pyglet", "nuiitivet.layout", "nuiitivet.navigation", "nuiitivet.material.buttons"}
+    assert not heavy & loaded
+
+
+def test_accessing_an_export_imports_only_its_module() -> None:
+    loaded = _loaded_after("from nuiitivet import Observable")
+
+    assert "nuiitivet.observable" in loaded
+    assert "nuiitivet.layout.column" not in loaded
+
+
+@pytest.mark.parametrize("package", [nuiitivet, material], ids=lambda m: m.__name__)
+def test_every_export_resolves_and_is_listed(package) -> None:
+    for name in package.__all__:
+        assert getattr(package, name) is not None
+        assert name in dir(package)
+
+
+def test_unknown_attribute_raises_attribute_error() -> None:
+    with pytest.raises(AttributeError):
+        nuiitivet.NotAnExport
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from nuiitivet.layout.lazy_list import LazyColumn, LazyRow, _ExtentIndex
+from nuiitivet.observable import Observable, ObservableList
+from nuiitivet.runtime.app import App
+from nuiitivet.widgeting.widget import Widget
+
+
+class _Item(Widget):
+    def __init__(self, value, extent: int = 20) -> None:
+        super().__init__()
+        self.value = value
+        self.extent = extent
+
+    def preferred_size(self, max_width=None, max_height=None):
+        return (self.extent, self.extent)
+
+    def paint(self, canvas, x: int, y: int, width: int, height: int) -> None:
+        self.set_last_rect(x, y, width, height)
+
+
+def _mount(widget, width=100, height=200):
+    app = App(content=widget, width=width, height=height)
+    app.root.mount(app)
+    app._render_snapshot()
+    return app
+
+
+def _window_indices(lazy) -> list[int]:
+    return [entry.index for entry in lazy._body._window]
+
+
+def test_extent_index_mixes_measured_and_estimated_extents():
+    index = _ExtentIndex()
+    index.resize(100)
+    index.set(0, 10)
+    index.set(1, 30)
+    assert index.offset_of(2, 20.0, 0) == 40
+    assert index.offset_of(5, 20.0, 2) == 10 + 30 + 3 * 20 + 5 * 2
+    assert index.total(20.0, 0) == 40 + 98 * 20
+    assert index.index_at(39, 20.0, 0) == 1
+    assert index.index_at(40, 20.0, 0) == 2
+    assert index.average() == 20.0
+
+    index.resize(1)
+    assert index.total(20.0, 0) == 10
+
+
+def test_lazy_column_builds_only_visible_window():
+    built = []
+
+    def builder(item, idx):
+        built.append(idx)
+        return _Item(item)
+
+    lazy = LazyColumn(list(range(100_000)), builder, overscan=2, height=200)
+    app = _mount(lazy)
+    try:
+        # Ten visible rows plus two overscan rows below.
+        assert _window_indices(lazy) == list(range(0, 12))
+        assert len(set(built)) == 12
+        controller = lazy._controller
+        assert controller.content_size == 100_000 * 20
+        assert controller.viewport_size == 200
+
+        lazy.scroll_to(50_000)
+        app._render_snapshot()
+        window = _window_indices(lazy)
+        assert window[0] == 2498 and window[-1] == 2511
+        assert len(lazy._body.children) == len(window)
+        first = lazy._body._window[2].fragment
+        assert first.layout_rect == (0, 50_000, 100, 20)
+    finally:
+        app.root.unmount()
+
+
+def test_small_scroll_recycles_fragments_by_key():
+    built = []
+
+    def builder(item, idx):
+        built.append(idx)
+        return _Item(item)
+
+    lazy = LazyColumn(list(range(1000)), builder, key=lambda item, _idx: item, height=200)
+    app = _mount(lazy)
+    try:
+        built.clear()
+        lazy._controller.scroll_by(10)
+        app._render_snapshot()
+        assert built == []
+
+        lazy.scroll_to(100)
+        app._render_snapshot()
+        assert set(built) == {12, 13, 14, 15, 16}
+        assert _window_indices(lazy)[0] == 3
+    finally:
+        app.root.unmount()
+
+
+def test_unmeasured_items_use_running_average_estimate():
+    lazy = LazyRow(list(range(1000)), lambda item, idx: _Item(item, extent=40), overscan=0, width=200)
+    app = _mount(lazy, width=200, height=100)
+    try:
+        assert _window_indices(lazy) == list(range(0, 5))
+        assert lazy._controller.content_size == 1000 * 40
+    finally:
+        app.root.unmount()
+
+
+def test_observable_items_append_updates_count():
+    class _Owner:
+        rows = Observable([0, 1, 2])
+
+    owner = _Owner()
+    lazy = LazyColumn(owner.rows, lambda item, idx: _Item(item), height=200)
+    app = _mount(lazy)
+    try:
+        assert lazy.item_count == 3
+        owner.rows.value = list(range(50))
+        assert lazy.item_count == 50
+        app._render_snapshot()
+        assert lazy._controller.content_size == 50 * 20
+        assert _window_indices(lazy) == list(range(0, 12))
+    finally:
+        app.root.unmount()
+
+
+def test_observable_list_changes_keep_measurements_for_appends():
+    rows = ObservableList(range(20))
+    lazy = LazyColumn(rows, lambda item, idx: _Item(item), height=200)
+    app = _mount(lazy)
+    try:
+        measured = dict(lazy._body._extents._extents)
+        assert measured
+        rows.append(20)
+        assert lazy.item_count == 21
+        assert lazy._body._extents._extents == measured
+        rows.insert(0, -1)
+        assert lazy._body._extents._extents == {}
+        app._render_snapshot()
+        assert [entry.value for entry in lazy._body._window][:3] == [-1, 0, 1]
+    finally:
+        app.root.unmount()
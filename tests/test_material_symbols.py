@@ -1,3 +1,9 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
 from nuiitivet.material.symbols import Symbols
 
 
@@ -12,3 +18,37 @@ def test_symbols_glyph_for_handles_unknowns() -> None:
     assert Symbols.glyph_for("home") == "\ue9b2"
     assert Symbols.glyph_for("_not_a_symbol_") is None
     assert Symbols.from_name(None) is None
+
+
+def test_attribute_access_materializes_and_caches_symbols() -> None:
+    home = Symbols.home
+
+    assert home is Symbols.from_name("home")
+    assert "home" in vars(Symbols)
+    assert Symbols._10k.name == "10k"
+    assert Symbols.class_.name == "class"
+
+
+def test_unknown_attributes_raise_attribute_error() -> None:
+    with pytest.raises(AttributeError):
+        getattr(Symbols, "not_a_symbol")
+    assert not hasattr(Symbols, "_index")
+    assert not hasattr(Symbols, "10k")
+
+
+def test_dir_lists_every_symbol_identifier() -> None:
+    names = dir(Symbols)
+
+    assert {"home", "_10k", "try_", "from_name"} <= set(names)
+    assert "10k" not in names
+
+
+def test_importing_symbols_does_not_load_the_table() -> None:
+    code = (
+        "from nuiitivet.material.symbols import material_symbols as m\n"
+        "assert m._table is None and not m._symbols\n"
+        "assert m.Symbols.home.glyph() == '\\ue9b2'\n"
+        "assert m._table is not None and list(m._symbols) == ['home']\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
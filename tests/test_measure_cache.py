@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import pytest
+
+from nuiitivet.layout import measure
+from nuiitivet.layout.column import Column
+from nuiitivet.widgeting.widget import Widget
+
+
+class _Counting(Widget):
+    def __init__(self, size: int = 10) -> None:
+        super().__init__()
+        self.size = size
+        self.calls = 0
+
+    def preferred_size(self, max_width=None, max_height=None):
+        self.calls += 1
+        return (self.size, self.size)
+
+
+@pytest.fixture(autouse=True)
+def _profiling():
+    measure.enable_measure_cache_profiling(True)
+    measure.reset_measure_cache_stats()
+    yield
+    measure.enable_measure_cache_profiling(False)
+    measure.reset_measure_cache_stats()
+
+
+def test_preferred_size_is_memoized_per_constraints():
+    leaf = _Counting()
+    assert measure.preferred_size(leaf, max_width=100) == (10, 10)
+    assert measure.preferred_size(leaf, max_width=100) == (10, 10)
+    assert leaf.calls == 1
+    measure.preferred_size(leaf, max_width=50)
+    assert leaf.calls == 2
+    assert measure.get_measure_cache_stats() == {"intrinsic_hits": 1, "intrinsic_misses": 2}
+
+
+def test_descendant_layout_change_drops_ancestor_cache():
+    leaf = _Counting()
+    column = Column([leaf])
+    assert measure.preferred_size(column, max_width=100) == (10, 10)
+    calls = leaf.calls
+
+    leaf.size = 30
+    leaf.mark_needs_layout()
+    assert measure.preferred_size(column, max_width=100) == (30, 30)
+    assert leaf.calls == calls + 1
+
+
+def test_layout_cache_token_and_global_clear_invalidate():
+    leaf = _Counting()
+    measure.preferred_size(leaf)
+    leaf._invalidate_layout_cache()
+    measure.preferred_size(leaf)
+    assert leaf.calls == 2
+
+    measure.clear_measure_caches()
+    measure.preferred_size(leaf)
+    assert leaf.calls == 3
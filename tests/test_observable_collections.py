@@ -0,0 +1,87 @@
+from nuiitivet.observable import DictChange, ListChange, Observable, ObservableDict, ObservableList, batch
+
+
+def test_list_mutations_emit_structural_changes():
+    items = ObservableList([1, 2, 3])
+    changes = []
+    items.subscribe_changes(changes.append)
+
+    items.append(4)
+    items.insert(0, 0)
+    del items[1]
+    items[0] = 10
+    items.move(0, 2)
+    items.sort()
+
+    assert changes == [
+        ListChange("insert", 3, (4,)),
+        ListChange("insert", 0, (0,)),
+        ListChange("remove", 1, old_items=(1,)),
+        ListChange("replace", 0, (10,), (0,)),
+        ListChange("move", 0, (10,), new_index=2),
+        ListChange("reset", 0, (2, 3, 4, 10), (2, 3, 10, 4)),
+    ]
+    assert items.value == (2, 3, 4, 10)
+
+
+def test_list_slice_assignment_and_extend():
+    items = ObservableList([1, 2, 3, 4])
+    changes = []
+    items.subscribe_changes(changes.append)
+
+    items[1:3] = ["a", "b"]
+    items[1:3] = ["x"]
+    items.extend([5, 6])
+
+    assert changes == [
+        ListChange("replace", 1, ("a", "b"), (2, 3)),
+        ListChange("remove", 1, old_items=("a", "b")),
+        ListChange("insert", 1, ("x",)),
+        ListChange("insert", 3, (5, 6)),
+    ]
+    assert list(items) == [1, "x", 4, 5, 6]
+
+
+def test_list_subscribers_receive_snapshots():
+    items = ObservableList([1])
+    seen = []
+    items.subscribe(seen.append)
+
+    items.append(2)
+    items.extend([])
+
+    assert seen == [(1, 2)]
+
+
+def test_list_tracked_by_computed():
+    items = ObservableList([1, 2])
+    total = Observable.compute(lambda: sum(items))
+    seen = []
+    total.subscribe(seen.append)
+
+    items.append(3)
+    with batch():
+        items.append(4)
+        items.append(5)
+
+    assert total.value == 15
+    assert seen == [6, 15]
+
+
+def test_dict_changes_and_identity_hash():
+    data = ObservableDict({"a": 1})
+    changes = []
+    data.subscribe_changes(changes.append)
+
+    data["b"] = 2
+    data["a"] = 3
+    del data["b"]
+
+    assert changes == [
+        DictChange("insert", "b", 2),
+        DictChange("replace", "a", 3, 1),
+        DictChange("remove", "b", old_value=2),
+    ]
+    assert dict(data.value) == {"a": 3}
+    assert data != ObservableDict({"a": 3})
+    assert len({data, ObservableDict({"a": 3})}) == 2
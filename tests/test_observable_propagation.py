@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import pytest
+
+from nuiitivet.observable import Observable, batch
+
+
+class _Counter:
+    def __init__(self) -> None:
+        self.counts: dict[str, int] = {}
+
+    def wrap(self, name, fn):
+        def compute():
+            self.counts[name] = self.counts.get(name, 0) + 1
+            return fn()
+
+        return Observable.compute(compute)
+
+
+def test_diamond_recomputes_each_node_once_without_glitches():
+    source = Observable(1)
+    counter = _Counter()
+    left = counter.wrap("left", lambda: source.value + 1)
+    right = counter.wrap("right", lambda: source.value * 10)
+    bottom = counter.wrap("bottom", lambda: (left.value, right.value))
+    seen = []
+    bottom.subscribe(seen.append)
+    # An effect on one branch must already see the settled bottom value.
+    observed_from_left = []
+    left.subscribe(lambda _v: observed_from_left.append(bottom.value))
+    counter.counts.clear()
+
+    source.value = 2
+
+    assert counter.counts == {"left": 1, "right": 1, "bottom": 1}
+    assert seen == [(3, 20)]
+    assert observed_from_left == [(3, 20)]
+
+
+def test_unchanged_branch_does_not_recompute_downstream():
+    source = Observable(1)
+    counter = _Counter()
+    parity = counter.wrap("parity", lambda: source.value % 2)
+    label = counter.wrap("label", lambda: "odd" if parity.value else "even")
+    counter.counts.clear()
+
+    source.value = 3
+
+    assert counter.counts == {"parity": 1}
+    assert label.value == "odd"
+
+
+def test_layered_diamonds_scale_linearly():
+    source = Observable(0)
+    counter = _Counter()
+    layers = 30
+    nodes = [source]
+    for depth in range(layers):
+        prev = nodes[-1]
+        a = counter.wrap(f"a{depth}", lambda prev=prev: prev.value + 1)
+        b = counter.wrap(f"b{depth}", lambda prev=prev: prev.value + 2)
+        nodes.append(counter.wrap(f"join{depth}", lambda a=a, b=b: a.value + b.value))
+    counter.counts.clear()
+
+    source.value = 1
+
+    # One evaluation per node; eager FIFO propagation is exponential here.
+    assert sum(counter.counts.values()) == 3 * layers
+    assert set(counter.counts.values()) == {1}
+
+
+def test_batch_flush_uses_height_order():
+    source = Observable(1)
+    other = Observable(1)
+    counter = _Counter()
+    first = counter.wrap("first", lambda: source.value + other.value)
+    second = counter.wrap("second", lambda: first.value + source.value)
+    counter.counts.clear()
+
+    with batch():
+        source.value = 5
+        other.value = 6
+        assert second.value == 3
+
+    assert counter.counts == {"first": 1, "second": 1}
+    assert second.value == 16
+
+
+def test_failing_computed_does_not_freeze_other_subscribers():
+    source = Observable(1)
+
+    def fragile(value):
+        if value == 2:
+            raise ValueError("boom")
+        return value
+
+    failing = source.map(fragile)
+    after_failing = failing.map(lambda v: v + 1)
+    scaled = source.map(lambda v: v * 10)
+    shifted = scaled.map(lambda v: v + 1)
+    joined = Observable.compute(lambda: after_failing.value + scaled.value)
+    seen: list[int] = []
+    joined_seen: list[int] = []
+    shifted.subscribe(seen.append)
+    joined.subscribe(joined_seen.append)
+
+    with pytest.raises(ValueError):
+        source.value = 2
+    source.value = 3
+    source.value = 4
+
+    assert seen == [21, 31, 41]
+    assert joined_seen == [22, 34, 45]
+    assert failing.value == 4
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import skia
+
+from nuiitivet.layout.column import Column
+from nuiitivet.layout.layout_utils import is_clipped_out
+from nuiitivet.layout.scroller import Scroller
+from nuiitivet.layout.stack import Stack
+from nuiitivet.rendering.skia import local_clip_bounds
+from nuiitivet.widgeting.widget import Widget
+
+
+class _Row(Widget):
+    def __init__(self, outsets=(0, 0, 0, 0)) -> None:
+        super().__init__()
+        self.outsets = outsets
+        self.paints = 0
+
+    def preferred_size(self, max_width=None, max_height=None):
+        return (100, 20)
+
+    def paint_outsets(self):
+        return self.outsets
+
+    def paint(self, canvas, x: int, y: int, width: int, height: int) -> None:
+        self.paints += 1
+
+
+def test_local_clip_bounds_requires_skia_canvas():
+    assert local_clip_bounds(None) is None
+    assert local_clip_bounds(object()) is None
+
+    canvas = skia.Surface(100, 100).getCanvas()
+    canvas.clipRect(skia.Rect.MakeXYWH(10, 20, 30, 40))
+    canvas.translate(5, 5)
+    # Skia pads local clip bounds by one pixel for anti-aliasing.
+    assert local_clip_bounds(canvas) == (4.0, 14.0, 36.0, 56.0)
+
+
+def test_is_clipped_out_respects_paint_outsets():
+    clip = (0.0, 0.0, 100.0, 100.0)
+    plain = _Row()
+    shadowed = _Row(outsets=(0, 0, 0, 8))
+    assert not is_clipped_out(plain, None, 0, 500, 10, 10)
+    assert not is_clipped_out(plain, clip, 0, 90, 10, 20)
+    assert is_clipped_out(plain, clip, 0, -20, 10, 20)
+    assert is_clipped_out(plain, clip, 0, -25, 10, 20)
+    assert not is_clipped_out(shadowed, clip, 0, -25, 10, 20)
+
+
+def test_scrolled_column_paints_only_visible_children():
+    rows = [_Row() for _ in range(100)]
+    scroller = Scroller(Column(rows), height=100, width=100)
+    scroller.layout(100, 100)
+
+    canvas = skia.Surface(100, 100).getCanvas()
+    scroller.paint(canvas, 0, 0, 100, 100)
+    assert [i for i, row in enumerate(rows) if row.paints] == [0, 1, 2, 3, 4, 5]
+
+    scroller.scroll_to(1000)
+    for row in rows:
+        row.paints = 0
+    scroller.paint(canvas, 0, 0, 100, 100)
+    assert [i for i, row in enumerate(rows) if row.paints] == list(range(49, 56))
+    # Culled children still record where they would be painted.
+    assert rows[99].last_rect == (0, 980, 100, 20)
+
+
+def test_culled_stack_children_record_last_rect():
+    child = _Row()
+    stack = Stack([child], width=100, height=20)
+    stack.layout(100, 20)
+
+    canvas = skia.Surface(100, 100).getCanvas()
+    stack.paint(canvas, 0, 500, 100, 20)
+    assert child.paints == 0
+    assert child.last_rect == (0, 500, 100, 20)
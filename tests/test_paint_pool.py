@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from nuiitivet.material.progress_indicators import LinearProgressIndicator
+from nuiitivet.rendering.skia import (
+    PaintPool,
+    get_paint_pool,
+    get_skia,
+    make_paint,
+    make_raster_surface,
+    shared_paint,
+)
+
+
+def test_equal_settings_share_one_paint() -> None:
+    pool = PaintPool()
+
+    a = pool.get(color=(10, 20, 30, 255), style="fill")
+    b = pool.get(color=[10, 20, 30, 255], style="fill", stroke_cap="round")
+
+    assert a is b
+    assert pool.stats() == {"hits": 1, "misses": 1, "evictions": 0, "entries": 1, "max_entries": 1024}
+
+
+def test_pooled_paint_matches_make_paint() -> None:
+    pool = PaintPool()
+
+    pooled = pool.get(color=(1, 2, 3, 200), style="stroke", stroke_width=3.0, aa=False, stroke_cap="round")
+    direct = make_paint(color=(1, 2, 3, 200), style="stroke", stroke_width=3.0, aa=False, stroke_cap="round")
+    skia = get_skia(raise_if_missing=True)
+
+    assert pooled is not None and direct is not None
+    assert pooled.getColor() == direct.getColor()
+    assert pooled.getStyle() == direct.getStyle() == skia.Paint.kStroke_Style
+    assert pooled.getStrokeWidth() == 3.0
+    assert pooled.getStrokeCap() == skia.Paint.kRound_Cap
+    assert pooled.isAntiAlias() is False
+
+
+def test_least_recently_used_paint_is_evicted() -> None:
+    pool = PaintPool(max_entries=2)
+
+    red = pool.get(color="#FF0000")
+    pool.get(color="#00FF00")
+    assert pool.get(color="#FF0000") is red
+    pool.get(color="#0000FF")
+
+    assert len(pool) == 2
+    assert pool.stats()["evictions"] == 1
+    assert pool.get(color="#FF0000") is red
+
+
+def test_repainting_a_progress_indicator_allocates_no_paints() -> None:
+    surface = make_raster_surface(120, 8)
+    widget = LinearProgressIndicator(value=0.4, width=120)
+    widget.paint(surface.getCanvas(), 0, 0, 120, 4)
+    pool = get_paint_pool()
+    pool.reset_stats()
+
+    for _ in range(5):
+        widget.paint(surface.getCanvas(), 0, 0, 120, 4)
+
+    stats = pool.stats()
+    assert stats["misses"] == 0 and stats["hits"] > 0
+    assert shared_paint(color=(0, 0, 0, 255)) is shared_paint(color=(0, 0, 0, 255))
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import pytest
+import skia
+
+from nuiitivet.layout.column import Column
+from nuiitivet.rendering.skia import Paragraph, get_paragraph_cache, make_raster_surface
+from nuiitivet.widgets.text import TextBase
+from nuiitivet.widgets.text_style import TextStyle
+
+
+@pytest.fixture(autouse=True)
+def _clear_paragraph_cache():
+    get_paragraph_cache().clear()
+    get_paragraph_cache().reset_stats()
+    yield
+    get_paragraph_cache().clear()
+
+
+def _para(text: str) -> Paragraph:
+    # One unit of advance per character keeps widths easy to reason about.
+    return Paragraph(text, [1.0] * len(text), ascent=-8.0, descent=2.0, leading=1.0)
+
+
+def _texts(p: Paragraph, *args) -> list[str]:
+    return [p.text[line.start : line.end] for line in p.lines(*args)]
+
+
+def test_lines_break_at_spaces_and_hard_breaks() -> None:
+    p = _para("hello world foo\n\nbar")
+
+    assert _texts(p, None) == ["hello world foo", "", "bar"]
+    assert _texts(p, 11) == ["hello world", "foo", "", "bar"]
+    assert p.natural_width == 15.0
+
+
+def test_overlong_word_and_cjk_break_between_characters() -> None:
+    p = _para("abcdefgh 日本語テキスト")
+
+    assert _texts(p, 3) == ["abc", "def", "gh", "日本語", "テキス", "ト"]
+
+
+def test_max_lines_truncates_with_room_for_ellipsis() -> None:
+    p = _para("one two three four")
+
+    lines = p.lines(9, 1, 2.0)
+
+    assert len(lines) == 1
+    assert lines[0].ellipsis is True
+    assert p.text[lines[0].start : lines[0].end] == "one two"
+    assert lines[0].width <= 9.0
+
+
+def test_line_layouts_are_memoized_per_width() -> None:
+    p = _para("a b c d e f")
+
+    assert p.lines(3) is p.lines(3)
+    assert p.lines(3) is not p.lines(5)
+
+
+def test_wrapping_text_grows_with_narrower_columns_without_reshaping() -> None:
+    text = TextBase("The quick brown fox jumps over the lazy dog", style=TextStyle(max_lines=None))
+
+    _, one_line_h = text.preferred_size()
+    wide_w, wide_h = text.preferred_size(max_width=180)
+    narrow_w, narrow_h = text.preferred_size(max_width=80)
+
+    assert wide_w <= 180 and narrow_w <= 80
+    assert one_line_h < wide_h < narrow_h
+    stats = get_paragraph_cache().stats()
+    assert stats["misses"] == 1
+
+
+def test_default_text_stays_single_line() -> None:
+    label = "The quick brown fox jumps over the lazy dog"
+
+    _, single_h = TextBase(label).preferred_size(max_width=80)
+    _, wrapped_h = TextBase(label, style=TextStyle(max_lines=None)).preferred_size(max_width=80)
+
+    assert single_h < wrapped_h
+
+
+def test_wrapped_text_paints_inside_its_column() -> None:
+    text = TextBase("alpha beta gamma delta epsilon", style=TextStyle(max_lines=2, overflow="ellipsis"))
+    root = Column([text])
+    w, h = root.preferred_size(max_width=90)
+    root.layout(90, h)
+
+    surface = make_raster_surface(120, 120)
+    canvas = surface.getCanvas()
+    canvas.clear(skia.ColorWHITE)
+    root.paint(canvas, 0, 0, 90, h)
+
+    pixels = surface.makeImageSnapshot().toarray()
+    ink = (pixels[:, :, :3] < 128).any(axis=2)
+    rows = ink.any(axis=1).nonzero()[0]
+    cols = ink.any(axis=0).nonzero()[0]
+    assert rows.size and cols.size
+    assert cols.max() < 90
+    # Two lines of ink, separated by at least one blank row.
+    assert not ink[rows.min() : rows.max() + 1].any(axis=1).all()
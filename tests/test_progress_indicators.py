@@ -138,7 +138,7 @@ def test_linear_determinate_track_active_space_keeps_100_percent_full_width(monk
 
     draws: list[tuple[float, float, float, float]] = []
 
-    monkeypatch.setattr(mod, "make_paint", lambda **_kwargs: object())
+    monkeypatch.setattr(mod, "shared_paint", lambda **_kwargs: object())
     monkeypatch.setattr(mod, "make_rect", lambda x, y, w, h: (x, y, w, h))
     monkeypatch.setattr(mod, "draw_round_rect", lambda _c, rect, _r, _p: draws.append(rect))
 
@@ -154,7 +154,7 @@ def test_linear_determinate_track_active_space_keeps_100_percent_full_width(monk
 def test_circular_determinate_track_active_space_keeps_100_percent_full_sweep(monkeypatch):
     from nuiitivet.material import progress_indicators as mod
 
-    monkeypatch.setattr(mod, "make_paint", lambda **_kwargs: object())
+    monkeypatch.setattr(mod, "shared_paint", lambda **_kwargs: object())
     monkeypatch.setattr(mod, "make_rect", lambda x, y, w, h: (x, y, w, h))
 
     canvas = _CanvasCapture()
@@ -172,7 +172,7 @@ def test_linear_determinate_track_active_space_creates_boundary_gap(monkeypatch)
 
     draws: list[tuple[float, float, float, float]] = []
 
-    monkeypatch.setattr(mod, "make_paint", lambda **_kwargs: object())
+    monkeypatch.setattr(mod, "shared_paint", lambda **_kwargs: object())
     monkeypatch.setattr(mod, "make_rect", lambda x, y, w, h: (x, y, w, h))
     monkeypatch.setattr(mod, "draw_round_rect", lambda _c, rect, _r, _p: draws.append(rect))
 
@@ -192,7 +192,7 @@ def test_linear_determinate_track_active_space_creates_boundary_gap(monkeypatch)
 def test_circular_determinate_track_active_space_creates_boundary_gap(monkeypatch):
     from nuiitivet.material import progress_indicators as mod
 
-    monkeypatch.setattr(mod, "make_paint", lambda **_kwargs: object())
+    monkeypatch.setattr(mod, "shared_paint", lambda **_kwargs: object())
     monkeypatch.setattr(mod, "make_rect", lambda x, y, w, h: (x, y, w, h))
 
     canvas = _CanvasCapture()
@@ -211,7 +211,7 @@ def test_circular_determinate_track_active_space_creates_boundary_gap(monkeypatc
 def test_circular_determinate_gap_compensates_round_stroke_caps(monkeypatch):
     from nuiitivet.material import progress_indicators as mod
 
-    monkeypatch.setattr(mod, "make_paint", lambda **_kwargs: object())
+    monkeypatch.setattr(mod, "shared_paint", lambda **_kwargs: object())
     monkeypatch.setattr(mod, "make_rect", lambda x, y, w, h: (x, y, w, h))
 
     canvas = _CanvasCapture()
@@ -235,7 +235,7 @@ def test_circular_determinate_gap_compensates_round_stroke_caps(monkeypatch):
 def test_circular_determinate_keeps_gap_at_start_point(monkeypatch):
     from nuiitivet.material import progress_indicators as mod
 
-    monkeypatch.setattr(mod, "make_paint", lambda **_kwargs: object())
+    monkeypatch.setattr(mod, "shared_paint", lambda **_kwargs: object())
     monkeypatch.setattr(mod, "make_rect", lambda x, y, w, h: (x, y, w, h))
 
     canvas = _CanvasCapture()
@@ -267,11 +267,11 @@ def test_circular_determinate_uses_round_stroke_caps(monkeypatch):
 
     paint_calls: list[dict[str, Any]] = []
 
-    def _capture_make_paint(**kwargs: Any) -> object:
+    def _capture_shared_paint(**kwargs: Any) -> object:
         paint_calls.append(kwargs)
         return object()
 
-    monkeypatch.setattr(mod, "make_paint", _capture_make_paint)
+    monkeypatch.setattr(mod, "shared_paint", _capture_shared_paint)
     monkeypatch.setattr(mod, "make_rect", lambda x, y, w, h: (x, y, w, h))
 
     canvas = _CanvasCapture()
@@ -288,11 +288,11 @@ def test_indeterminate_circular_uses_round_stroke_caps(monkeypatch):
 
     paint_calls: list[dict[str, Any]] = []
 
-    def _capture_make_paint(**kwargs: Any) -> object:
+    def _capture_shared_paint(**kwargs: Any) -> object:
         paint_calls.append(kwargs)
         return object()
 
-    monkeypatch.setattr(mod, "make_paint", _capture_make_paint)
+    monkeypatch.setattr(mod, "shared_paint", _capture_shared_paint)
     monkeypatch.setattr(mod, "make_rect", lambda x, y, w, h: (x, y, w, h))
 
     canvas = _CanvasCapture()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import types
+
+import skia
+
+from nuiitivet.rendering.skia import RasterSurfacePool
+from nuiitivet.runtime.app import App
+from nuiitivet.widgeting.widget import Widget
+
+
+class _Leaf(Widget):
+    def preferred_size(self, max_width=None, max_height=None):
+        return (20, 20)
+
+    def paint(self, canvas, x: int, y: int, width: int, height: int) -> None:
+        self.set_last_rect(x, y, width, height)
+
+
+class _FakeTexture:
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.uploads: list[tuple[int, int, int, int, bytes]] = []
+
+    def blit_into(self, data, x, y, z):
+        self.uploads.append((x, y, data.width, data.height, bytes(data.data)))
+
+
+def _fake_pyglet(created: list):
+    def create(width, height):
+        texture = _FakeTexture(width, height)
+        created.append(texture)
+        return texture
+
+    class _ImageData:
+        def __init__(self, width, height, fmt, data, pitch):
+            self.width = width
+            self.height = height
+            self.data = data
+
+    image = types.SimpleNamespace(Texture=types.SimpleNamespace(create=create), ImageData=_ImageData)
+    return types.SimpleNamespace(image=image)
+
+
+def test_surface_pool_reuses_by_size():
+    pool = RasterSurfacePool(max_surfaces=2)
+    first, reused = pool.acquire(10, 10)
+    assert not reused
+    assert pool.acquire(10, 10) == (first, True)
+    pool.acquire(20, 20)
+    assert pool.acquire(10, 10)[0] is first
+    pool.acquire(30, 30)
+    assert pool.acquire(20, 20)[1] is False
+
+
+def test_raster_frame_uploads_only_damaged_rects(monkeypatch):
+    from nuiitivet.backends.pyglet import runner as pyglet_runner
+
+    created: list = []
+    monkeypatch.setattr(pyglet_runner, "pyglet", _fake_pyglet(created))
+
+    leaf = _Leaf()
+    app = App(content=leaf, width=100, height=80)
+    app.root.mount(app)
+    try:
+        assert pyglet_runner._draw_raster_frame(app, skia) is True
+        assert len(created) == 1
+        texture = created[0]
+        assert app._last_image is texture
+        assert [upload[:4] for upload in texture.uploads] == [(0, 0, 100, 80)]
+        # Rows are read as RGBA regardless of the surface's native order.
+        assert len(texture.uploads[0][4]) == 100 * 80 * 4
+
+        surface = app._frame_surface
+        texture.uploads.clear()
+        app.invalidate_rect((10, 5, 20, 10))
+        assert pyglet_runner._draw_raster_frame(app, skia) is True
+        assert created == [texture]
+        assert app._frame_surface is surface
+        # Damage is inflated by one pixel and flipped to texture coordinates.
+        assert [upload[:4] for upload in texture.uploads] == [(9, 80 - 4 - 12, 22, 12)]
+
+        texture.uploads.clear()
+        assert pyglet_runner._draw_raster_frame(app, skia) is True
+        assert texture.uploads == []
+    finally:
+        app.root.unmount()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from nuiitivet.layout.column import Column
+from nuiitivet.layout.container import Container
+from nuiitivet.runtime.app import App
+from nuiitivet.widgeting.widget import Widget
+
+
+class _Leaf(Widget):
+    def __init__(self, size: int = 10) -> None:
+        super().__init__()
+        self.size = size
+        self.layout_calls = 0
+
+    def preferred_size(self, max_width=None, max_height=None):
+        return (self.size, self.size)
+
+    def layout(self, width: int, height: int) -> None:
+        self.layout_calls += 1
+        super().layout(width, height)
+
+    def paint(self, canvas, x: int, y: int, width: int, height: int) -> None:
+        self.set_last_rect(x, y, width, height)
+
+
+def _make_app():
+    inner = _Leaf()
+    sibling = _Leaf()
+    boundary = Container(inner, width=100, height=50)
+    app = App(content=Column([boundary, sibling]), width=200, height=200)
+    app.root.mount(app)
+    app._render_snapshot()
+    return app, boundary, inner, sibling
+
+
+def test_fixed_size_widget_is_relayout_boundary():
+    assert Container(width=10, height=10).is_relayout_boundary()
+    assert not Container(width=10).is_relayout_boundary()
+    assert not _Leaf().is_relayout_boundary()
+
+
+def test_boundary_absorbs_child_layout_changes():
+    app, boundary, inner, sibling = _make_app()
+    try:
+        assert not app.root.needs_layout
+        rect = boundary.layout_rect
+        inner_calls = inner.layout_calls
+        sibling_calls = sibling.layout_calls
+
+        inner.size = 20
+        inner.mark_needs_layout()
+        assert not app.root.needs_layout
+        assert app._relayout_boundaries == [boundary]
+
+        app._render_snapshot()
+        assert inner.layout_calls == inner_calls + 1
+        assert sibling.layout_calls == sibling_calls
+        assert boundary.layout_rect == rect
+        assert not boundary.needs_layout
+        assert app._relayout_boundaries == []
+    finally:
+        app.root.unmount()
+
+
+def test_boundary_sizing_change_relayouts_parent():
+    app, boundary, _inner, sibling = _make_app()
+    try:
+        sibling_calls = sibling.layout_calls
+        boundary.height_sizing = 80
+        assert app.root.needs_layout
+
+        app._render_snapshot()
+        assert sibling.layout_calls == sibling_calls + 1
+        assert boundary.layout_rect is not None and boundary.layout_rect[3] == 80
+    finally:
+        app.root.unmount()
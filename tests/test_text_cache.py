@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import pytest
+
+from nuiitivet.rendering.skia import TextShapeCache, get_text_shape_cache, get_typeface, make_raster_surface
+from nuiitivet.widgets.text import TextBase
+
+
+@pytest.fixture(autouse=True)
+def _clear_text_cache():
+    get_text_shape_cache().clear()
+    get_text_shape_cache().reset_stats()
+    yield
+    get_text_shape_cache().clear()
+
+
+def test_equal_runs_share_one_blob() -> None:
+    cache = TextShapeCache(max_entries=8)
+    typeface = get_typeface()
+
+    first = cache.shape(typeface, 14, "cell")
+    second = cache.shape(typeface, 14.0, "cell")
+
+    assert first is not None and first is second
+    left, top, right, bottom = first.ink_bounds
+    assert right > left and bottom > top
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "entries": 1, "max_entries": 8}
+
+
+def test_least_recently_used_run_is_evicted() -> None:
+    cache = TextShapeCache(max_entries=2)
+    typeface = get_typeface()
+
+    a = cache.shape(typeface, 14, "a")
+    cache.shape(typeface, 14, "b")
+    assert cache.shape(typeface, 14, "a") is a
+    cache.shape(typeface, 14, "c")
+
+    assert len(cache) == 2
+    assert cache.stats()["evictions"] == 1
+    assert cache.shape(typeface, 14, "a") is a
+    assert cache.stats()["misses"] == 3  # "b" was dropped, "a" survived.
+
+
+def test_unshapeable_text_is_not_cached() -> None:
+    cache = TextShapeCache()
+
+    assert cache.shape(None, 14, "x") is None
+    assert cache.shape(get_typeface(), 14, "") is None
+    assert len(cache) == 0
+
+
+def test_repainting_text_reuses_shaped_run_and_paint() -> None:
+    surface = make_raster_surface(200, 40)
+    canvas = surface.getCanvas()
+    text = TextBase("Row 1")
+
+    text.paint(canvas, 0, 0, 200, 40)
+    paint = text._paint_color_paint
+    text.paint(canvas, 0, 0, 200, 40)
+
+    stats = get_text_shape_cache().stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+    assert paint is not None and text._paint_color_paint is paint
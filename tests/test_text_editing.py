@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from dataclasses import FrozenInstanceError
+from unittest.mock import MagicMock
+
+import pytest
+
+from nuiitivet.input.codes import TEXT_MOTION_BACKSPACE, TEXT_MOTION_HOME
+from nuiitivet.rendering.skia import make_raster_surface
+from nuiitivet.widgets import editable_text as editable_text_module
+from nuiitivet.widgets.editable_text import EditableText
+from nuiitivet.widgets.text_editing import TextBuffer, TextEditingValue, TextRange
+
+
+def test_buffer_replace_matches_string_edits() -> None:
+    text = "hello world"
+    buf = TextBuffer(text)
+
+    for start, end, insert in [(5, 5, ","), (0, 1, "H"), (7, 12, "there"), (3, 3, ""), (0, 0, ">> ")]:
+        buf = buf.replace(start, end, insert)
+        text = text[:start] + insert + text[end:]
+        assert str(buf) == text
+        assert len(buf) == len(text)
+
+    assert buf.slice(3, 8) == text[3:8]
+
+
+def test_typing_into_large_document_keeps_few_pieces() -> None:
+    doc = "x" * 100_000
+    value = TextEditingValue(doc, selection=TextRange(50_000, 50_000))
+
+    for ch in "typing a sentence":
+        pos = value.selection.end
+        value = value.replace_range(pos, pos, ch, selection=TextRange(pos + 1, pos + 1))
+
+    # Original halves around one merged run of typed characters.
+    assert value.buffer.piece_count == 3
+    assert value.buffer.slice(50_000, 50_017) == "typing a sentence"
+    assert len(value.text) == 100_017
+
+
+def test_editing_value_is_immutable_and_compares_by_content() -> None:
+    a = TextEditingValue("abc", selection=TextRange(1, 1))
+    b = TextEditingValue("ab", selection=TextRange(1, 1)).replace_range(2, 2, "c", selection=TextRange(1, 1))
+
+    assert a == b and hash(a) == hash(b)
+    assert a.copy_with(selection=TextRange(0, 0)).buffer is a.buffer
+    with pytest.raises(FrozenInstanceError):
+        a.selection = TextRange(0, 0)  # type: ignore[misc]
+
+
+def test_index_hit_testing_measures_text_once() -> None:
+    editable = EditableText(value="abcdefgh")
+    font = MagicMock()
+    font.textToGlyphs = MagicMock(side_effect=lambda s: list(range(len(s))))
+    font.getWidths = MagicMock(side_effect=lambda glyphs: [10.0] * len(glyphs))
+    editable._get_font = MagicMock(return_value=font)  # type: ignore[method-assign]
+
+    assert [editable._get_index_at(x) for x in (0, 4, 6, 25, 79, 500)] == [0, 0, 1, 3, 8, 8]
+    assert font.getWidths.call_count == 1
+    font.measureText.assert_not_called()
+
+
+def _fixed_width_font() -> MagicMock:
+    font = MagicMock()
+    font.textToGlyphs = MagicMock(side_effect=lambda s: list(range(len(s))))
+    font.getWidths = MagicMock(side_effect=lambda glyphs: [10.0] * len(glyphs))
+    return font
+
+
+def test_edits_patch_caret_offsets_instead_of_measuring_the_document() -> None:
+    editable = EditableText(value="x" * 10_000)
+    font = _fixed_width_font()
+    editable._get_font = MagicMock(return_value=font)  # type: ignore[method-assign]
+    editable._caret_offsets(font)
+    font.getWidths.reset_mock()
+
+    editable._handle_text_motion(TEXT_MOTION_HOME)
+    editable._handle_text("ab")
+    editable._handle_text_motion(TEXT_MOTION_BACKSPACE)
+
+    assert [len(call.args[0]) for call in font.getWidths.call_args_list] == [2]
+    assert list(editable._caret_offsets(font)) == [10.0 * i for i in range(10_002)]
+    assert font.getWidths.call_count == 1
+    assert editable.preferred_size()[0] == 100_010
+
+
+def test_paint_shapes_only_the_visible_text(monkeypatch: pytest.MonkeyPatch) -> None:
+    editable = EditableText(value="word " * 2_000, width=200)
+    shaped: list[str] = []
+    original = editable_text_module.make_text_blob
+
+    def recording_blob(text: str, font: object) -> object:
+        shaped.append(text)
+        return original(text, font)
+
+    monkeypatch.setattr(editable_text_module, "make_text_blob", recording_blob)
+    surface = make_raster_surface(200, 40)
+    editable.paint(surface.getCanvas(), 0, 0, 200, 40)
+
+    assert len(shaped) == 1
+    # The caret sits at the end, so the tail of the value is what shows.
+    assert 0 < len(shaped[0]) < 100
+    assert ("word " * 2_000).endswith(shaped[0])
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from nuiitivet.observable.runtime import _ThreadClock
+
+
+def _wait_until(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.002)
+    return predicate()
+
+
+@pytest.fixture
+def clock():
+    return _ThreadClock()
+
+
+def test_thousands_of_timers_share_one_thread(clock) -> None:
+    baseline = threading.active_count()
+    fired = []
+    lock = threading.Lock()
+    peak = baseline
+
+    for i in range(2000):
+
+        def _cb(dt: float, i: int = i) -> None:
+            with lock:
+                fired.append(i)
+
+        clock.schedule_once(_cb, 0.001 * (i % 20))
+        peak = max(peak, threading.active_count())
+
+    assert _wait_until(lambda: len(fired) == 2000)
+    assert peak <= baseline + 1
+    assert threading.active_count() <= baseline + 1
+    assert clock.pending_count() == 0
+
+
+def test_callbacks_run_in_deadline_order_and_fifo_on_ties(clock) -> None:
+    order = []
+    done = threading.Event()
+    callbacks = [lambda dt, n=n: order.append(n) for n in range(5)]
+
+    clock.schedule_once(lambda dt: done.set(), 0.06)
+    clock.schedule_once(callbacks[0], 0.04)
+    clock.schedule_once(callbacks[1], 0.02)
+    clock.schedule_once(callbacks[2], 0.02)
+    clock.schedule_once(callbacks[3], 0.02)
+    clock.schedule_once(callbacks[4], 0.0)
+
+    assert done.wait(2.0)
+    assert order == [4, 1, 2, 3, 0]
+
+
+def test_rescheduling_the_same_callback_debounces(clock) -> None:
+    calls = []
+
+    def _search(dt: float) -> None:
+        calls.append(dt)
+
+    for _ in range(100):
+        clock.schedule_once(_search, 0.02)
+
+    assert _wait_until(lambda: calls)
+    time.sleep(0.05)
+    assert calls == [0.0]
+
+
+def test_unschedule_cancels_once_and_interval_callbacks(clock) -> None:
+    calls: list[object] = []
+
+    def _once(dt: float) -> None:
+        calls.append("once")
+
+    def _tick(dt: float) -> None:
+        calls.append(dt)
+
+    clock.schedule_once(_once, 0.02)
+    clock.schedule_interval(_tick, 0.01)
+    clock.unschedule(_once)
+
+    assert _wait_until(lambda: len(calls) >= 3)
+    clock.unschedule(_tick)
+    time.sleep(0.03)
+    settled = len(calls)
+    time.sleep(0.05)
+
+    assert len(calls) == settled
+    assert "once" not in calls
+    assert set(calls) == {0.01}
+    assert clock.pending_count() == 0
+
+
+def test_unschedule_from_an_earlier_callback_in_the_same_batch(clock) -> None:
+    calls: list[str] = []
+    slow_started = threading.Event()
+    release = threading.Event()
+
+    def _slow(dt: float) -> None:
+        slow_started.set()
+        release.wait(2.0)
+        calls.append("slow")
+
+    def _later(dt: float) -> None:
+        calls.append("later")
+
+    def _gate(dt: float) -> None:
+        time.sleep(0.05)
+
+    # Both come due while the gate runs, so they are popped as one batch.
+    clock.schedule_once(_gate, 0.0)
+    clock.schedule_once(_slow, 0.0)
+    clock.schedule_once(_later, 0.0)
+    assert slow_started.wait(2.0)
+    # _later is already in the due batch but has not run yet.
+    assert clock.pending_count() == 1
+    clock.unschedule(_later)
+    release.set()
+
+    assert _wait_until(lambda: calls)
+    time.sleep(0.05)
+    assert calls == ["slow"]
+    assert clock.pending_count() == 0
+    assert clock._cancelled == 0
+
+
+def test_cancelled_entries_are_compacted(clock) -> None:
+    callbacks = [lambda dt: None for _ in range(1000)]
+    for cb in callbacks:
+        clock.schedule_once(cb, 60.0)
+    for cb in callbacks:
+        clock.unschedule(cb)
+
+    assert clock.pending_count() == 0
+    assert len(clock._heap) < 200
+
+
+def test_failing_callback_does_not_stop_the_scheduler(clock) -> None:
+    ran = threading.Event()
+
+    def _boom(dt: float) -> None:
+        raise RuntimeError("boom")
+
+    clock.schedule_once(_boom, 0.0)
+    clock.schedule_once(lambda dt: ran.set(), 0.01)
+
+    assert ran.wait(2.0)